@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import copy
+import operator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, Union
 
@@ -180,6 +181,56 @@ class ModelResponse:
         return [it.model_dump(exclude_unset=True) for it in self.output]  # type: ignore
 
 
+class ConversationHistory(list[TResponseInputItem]):
+    """The input items for one model call, as produced by a `ConversationBuffer`.
+
+    A plain list to anything that does not know about it. Models can keep state derived from it in
+    `cache` (converted messages, tool schemas) and reuse it on the next turn: the same cache is
+    handed out for as long as the history is only appended to.
+    """
+
+    def __init__(self, items: list[TResponseInputItem], cache: dict[str, Any]):
+        super().__init__(items)
+        self.cache = cache
+
+
+class ConversationBuffer:
+    """The model input for a run: the original input followed by every generated item.
+
+    The runner calls `update` before each turn, which converts only the items generated since the
+    previous turn. If the history was rewritten instead (e.g. by a handoff input filter), the
+    buffer is rebuilt and its cache replaced. Input items are shared rather than copied, so models
+    must treat them as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._items: list[TResponseInputItem] = []
+        self._original_input: str | list[TResponseInputItem] | None = None
+        self._run_items: list[RunItem] = []
+        self._cache: dict[str, Any] = {}
+
+    def update(
+        self, original_input: str | list[TResponseInputItem], generated_items: list[RunItem]
+    ) -> ConversationHistory:
+        """Brings the buffer up to date and returns the input for the next model call."""
+        seen = self._run_items
+        # An identity check per item is far cheaper than converting them again
+        if (
+            original_input is not self._original_input
+            or len(generated_items) < len(seen)
+            or not all(map(operator.is_, seen, generated_items))
+        ):
+            self._original_input = original_input
+            self._items = ItemHelpers.input_to_new_input_list(original_input)
+            self._cache = {}
+            seen = self._run_items = []
+
+        new_items = generated_items[len(seen) :]
+        self._items.extend(item.to_input_item() for item in new_items)
+        seen.extend(new_items)
+        return ConversationHistory(self._items, self._cache)
+
+
 class ItemHelpers:
     @classmethod
     def extract_last_content(cls, message: TResponseOutputItem) -> str:
@@ -55,20 +55,13 @@ class SemanticRetriever(MemoryRetriever):
             query_embedding = await self._get_embedding(query)
 
             if query_embedding:
-                # Calculate similarities
-                scores = []
-                for memory in memories:
-                    if memory.embedding:
-                        similarity = self._cosine_similarity(
-                            query_embedding,
-                            memory.embedding,
-                        )
-                        scores.append((memory, similarity))
+                from hanzo_memory.similarity import cosine_scores, top_k
 
-                # Sort by similarity
-                scores.sort(key=lambda x: x[1], reverse=True)
-
-                return [memory for memory, _ in scores[:limit]]
+                embedded = [m for m in memories if m.embedding]
+                scores = cosine_scores(
+                    query_embedding, [m.embedding for m in embedded]
+                )
+                return [embedded[i] for i in top_k(scores, limit)]
 
         # Fallback to keyword matching
         return self._keyword_search(query, memories, limit)
@@ -78,15 +71,6 @@ class SemanticRetriever(MemoryRetriever):
         # This is a placeholder - implement based on your embedding service
         return None
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        import numpy as np
-
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
-
-        return float(np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2)))
-
     def _keyword_search(
         self,
         query: str,
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import bisect
+import itertools
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-
-import numpy as np
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .types import MemoryEntry, MemoryType
 from ..logger import logger
@@ -74,11 +74,86 @@ class MemoryStore(ABC):
         pass
 
 
+# (timestamp, -insertion number, memory id): ascending order is oldest first,
+# and memories with equal timestamps list in insertion order newest-first
+_RecencyKey = Tuple[float, int, str]
+# (type, agent_name) a memory is listed under; None matches any
+_Filter = Tuple[Optional[MemoryType], Optional[str]]
+
+
+class _RecencyIndex:
+    """Memory ids sorted by timestamp, for newest-first scans."""
+
+    __slots__ = ("_keys",)
+
+    def __init__(self) -> None:
+        self._keys: List[_RecencyKey] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: _RecencyKey) -> None:
+        # Memories mostly arrive in timestamp order
+        if not self._keys or key > self._keys[-1]:
+            self._keys.append(key)
+        else:
+            bisect.insort(self._keys, key)
+
+    def remove(self, key: _RecencyKey) -> None:
+        i = bisect.bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def newest(self) -> Iterator[str]:
+        for key in reversed(self._keys):
+            yield key[2]
+
+
 class InMemoryMemoryStore(MemoryStore):
-    """In-memory memory store for development."""
+    """In-memory memory store for development.
+
+    Memories are indexed by timestamp under every (type, agent_name) filter
+    `list` accepts, so listing the newest ``limit`` matches reads only those
+    and `count` is a length lookup. Embeddings are kept in one matrix for
+    search. Changes must go through `update` to be reindexed.
+    """
 
     def __init__(self):
+        # Imported here: only this store needs hanzo_memory.
+        from hanzo_memory.similarity import VectorMatrix
+
         self.memories: Dict[str, MemoryEntry] = {}
+        self._vectors = VectorMatrix()
+        self._indexes: Dict[_Filter, _RecencyIndex] = {}
+        self._indexed: Dict[str, Tuple[_RecencyKey, Tuple[_Filter, ...]]] = {}
+        self._insertions = itertools.count()
+
+    @staticmethod
+    def _filters(memory: MemoryEntry) -> Tuple[_Filter, ...]:
+        filters: Tuple[_Filter, ...] = ((None, None), (memory.type, None))
+        if memory.agent_name:
+            filters += ((None, memory.agent_name), (memory.type, memory.agent_name))
+        return filters
+
+    def _index(self, memory: MemoryEntry, number: int) -> None:
+        key = (memory.timestamp, -number, memory.id)
+        filters = self._filters(memory)
+        for f in filters:
+            index = self._indexes.get(f)
+            if index is None:
+                index = self._indexes[f] = _RecencyIndex()
+            index.add(key)
+        self._indexed[memory.id] = (key, filters)
+
+    def _unindex(self, memory_id: str) -> int:
+        """Drop a memory from the indexes; returns its insertion number."""
+        key, filters = self._indexed.pop(memory_id)
+        for f in filters:
+            index = self._indexes[f]
+            index.remove(key)
+            if not index:
+                del self._indexes[f]
+        return -key[1]
 
     async def add(
         self,
@@ -101,6 +176,9 @@ class InMemoryMemoryStore(MemoryStore):
         )
 
         self.memories[memory.id] = memory
+        self._index(memory, next(self._insertions))
+        if embedding:
+            self._vectors.add(memory.id, embedding)
         return memory
 
     async def get(self, memory_id: str) -> MemoryEntry | None:
@@ -111,10 +189,19 @@ class InMemoryMemoryStore(MemoryStore):
         """Update an existing memory."""
         if memory.id in self.memories:
             self.memories[memory.id] = memory
+            key, filters = self._indexed[memory.id]
+            if key[0] != memory.timestamp or filters != self._filters(memory):
+                self._index(memory, self._unindex(memory.id))
+            if memory.embedding:
+                self._vectors.add(memory.id, memory.embedding)
+            else:
+                self._vectors.remove(memory.id)
 
     async def delete(self, memory_id: str) -> None:
         """Delete a memory."""
-        self.memories.pop(memory_id, None)
+        if self.memories.pop(memory_id, None) is not None:
+            self._unindex(memory_id)
+        self._vectors.remove(memory_id)
 
     async def list(
         self,
@@ -123,24 +210,19 @@ class InMemoryMemoryStore(MemoryStore):
         min_importance: float = 0.0,
         limit: int | None = None,
     ) -> List[MemoryEntry]:
-        """List memories with filters."""
-        memories = list(self.memories.values())
-
-        # Apply filters
-        if type:
-            memories = [m for m in memories if m.type == type]
-        if agent_name:
-            memories = [m for m in memories if m.agent_name == agent_name]
-        if min_importance > 0:
-            memories = [m for m in memories if m.importance >= min_importance]
-
-        # Sort by timestamp (newest first)
-        memories.sort(key=lambda m: m.timestamp, reverse=True)
-
-        # Apply limit
-        if limit:
-            memories = memories[:limit]
+        """List memories with filters, newest first."""
+        index = self._indexes.get((type or None, agent_name or None))
+        if index is None:
+            return []
 
+        memories = []
+        for memory_id in index.newest():
+            memory = self.memories[memory_id]
+            if min_importance > 0 and memory.importance < min_importance:
+                continue
+            memories.append(memory)
+            if limit and len(memories) >= limit:
+                break
         return memories
 
     async def count(
@@ -149,8 +231,8 @@ class InMemoryMemoryStore(MemoryStore):
         agent_name: str | None = None,
     ) -> int:
         """Count memories."""
-        memories = await self.list(type=type, agent_name=agent_name)
-        return len(memories)
+        index = self._indexes.get((type or None, agent_name or None))
+        return len(index) if index is not None else 0
 
     async def search_by_embedding(
         self,
@@ -162,26 +244,8 @@ class InMemoryMemoryStore(MemoryStore):
         if not embedding:
             return []
 
-        results = []
-        query_vec = np.array(embedding)
-
-        for memory in self.memories.values():
-            if not memory.embedding:
-                continue
-
-            # Calculate cosine similarity
-            memory_vec = np.array(memory.embedding)
-            similarity = np.dot(query_vec, memory_vec) / (
-                np.linalg.norm(query_vec) * np.linalg.norm(memory_vec)
-            )
-
-            if similarity >= threshold:
-                results.append((memory, float(similarity)))
-
-        # Sort by similarity
-        results.sort(key=lambda x: x[1], reverse=True)
-
-        return results[:limit]
+        hits = self._vectors.search(embedding, limit, threshold=threshold)
+        return [(self.memories[memory_id], score) for memory_id, score in hits]
 
 
 class VectorMemoryStore(MemoryStore):
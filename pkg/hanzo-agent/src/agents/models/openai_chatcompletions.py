@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 import json
+import logging
 import time
 from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass, field
@@ -65,6 +66,7 @@ from ..agent_output import AgentOutputSchema
 from ..exceptions import AgentsException, UserError
 from ..handoffs import Handoff
 from ..items import (
+    ConversationHistory,
     ModelResponse,
     TResponseInputItem,
     TResponseOutputItem,
@@ -138,7 +140,7 @@ class OpenAIChatCompletionsModel(Model):
 
             if _debug.DONT_LOG_MODEL_DATA:
                 logger.debug("Received model response")
-            else:
+            elif logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     f"LLM resp:\n{json.dumps(response.choices[0].message.model_dump(), indent=2)}\n"
                 )
@@ -534,7 +536,7 @@ class OpenAIChatCompletionsModel(Model):
         tracing: ModelTracing,
         stream: bool = False,
     ) -> ChatCompletion | tuple[Response, AsyncStream[ChatCompletionChunk]]:
-        converted_messages = _Converter.items_to_messages(input)
+        converted_messages = _Converter.history_to_messages(input)
 
         if system_instructions:
             converted_messages.insert(
@@ -555,16 +557,17 @@ class OpenAIChatCompletionsModel(Model):
         tool_choice = _Converter.convert_tool_choice(model_settings.tool_choice)
         response_format = _Converter.convert_response_format(output_schema)
 
-        converted_tools = (
-            [ToolConverter.to_openai(tool) for tool in tools] if tools else []
+        converted_tools = ToolConverter.convert_tools(
+            tools,
+            handoffs,
+            input.cache.setdefault("chat_tools", {})
+            if isinstance(input, ConversationHistory)
+            else None,
         )
 
-        for handoff in handoffs:
-            converted_tools.append(ToolConverter.convert_handoff_tool(handoff))
-
         if _debug.DONT_LOG_MODEL_DATA:
             logger.debug("Calling LLM")
-        else:
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"{json.dumps(converted_messages, indent=2)}\n"
                 f"Tools:\n{json.dumps(converted_tools, indent=2)}\n"
@@ -862,175 +865,210 @@ class _Converter:
                 )
             ]
 
-        result: list[ChatCompletionMessageParam] = []
-        current_assistant_msg: ChatCompletionAssistantMessageParam | None = None
-
-        def flush_assistant_message() -> None:
-            nonlocal current_assistant_msg
-            if current_assistant_msg is not None:
-                # The API doesn't support empty arrays for tool_calls
-                if not current_assistant_msg.get("tool_calls"):
-                    del current_assistant_msg["tool_calls"]
-                result.append(current_assistant_msg)
-                current_assistant_msg = None
-
-        def ensure_assistant_message() -> ChatCompletionAssistantMessageParam:
-            nonlocal current_assistant_msg
-            if current_assistant_msg is None:
-                current_assistant_msg = ChatCompletionAssistantMessageParam(
-                    role="assistant"
-                )
-                current_assistant_msg["tool_calls"] = []
-            return current_assistant_msg
-
+        builder = _MessageBuilder()
         for item in items:
-            # 1) Check easy input message
-            if easy_msg := cls.maybe_easy_input_message(item):
-                role = easy_msg["role"]
-                content = easy_msg["content"]
-
-                if role == "user":
-                    flush_assistant_message()
-                    msg_user: ChatCompletionUserMessageParam = {
-                        "role": "user",
-                        "content": cls.extract_all_content(content),
-                    }
-                    result.append(msg_user)
-                elif role == "system":
-                    flush_assistant_message()
-                    msg_system: ChatCompletionSystemMessageParam = {
-                        "role": "system",
-                        "content": cls.extract_text_content(content),
-                    }
-                    result.append(msg_system)
-                elif role == "developer":
-                    flush_assistant_message()
-                    msg_developer: ChatCompletionDeveloperMessageParam = {
-                        "role": "developer",
-                        "content": cls.extract_text_content(content),
-                    }
-                    result.append(msg_developer)
-                elif role == "assistant":
-                    flush_assistant_message()
-                    msg_assistant: ChatCompletionAssistantMessageParam = {
-                        "role": "assistant",
-                        "content": cls.extract_text_content(content),
-                    }
-                    result.append(msg_assistant)
-                else:
-                    raise UserError(f"Unexpected role in easy_input_message: {role}")
-
-            # 2) Check input message
-            elif in_msg := cls.maybe_input_message(item):
-                role = in_msg["role"]
-                content = in_msg["content"]
-                flush_assistant_message()
-
-                if role == "user":
-                    msg_user = {
-                        "role": "user",
-                        "content": cls.extract_all_content(content),
-                    }
-                    result.append(msg_user)
-                elif role == "system":
-                    msg_system = {
-                        "role": "system",
-                        "content": cls.extract_text_content(content),
-                    }
-                    result.append(msg_system)
-                elif role == "developer":
-                    msg_developer = {
-                        "role": "developer",
-                        "content": cls.extract_text_content(content),
-                    }
-                    result.append(msg_developer)
-                else:
-                    raise UserError(f"Unexpected role in input_message: {role}")
-
-            # 3) response output message => assistant
-            elif resp_msg := cls.maybe_response_output_message(item):
-                flush_assistant_message()
-                new_asst = ChatCompletionAssistantMessageParam(role="assistant")
-                contents = resp_msg["content"]
-
-                text_segments = []
-                for c in contents:
-                    if c["type"] == "output_text":
-                        text_segments.append(c["text"])
-                    elif c["type"] == "refusal":
-                        new_asst["refusal"] = c["refusal"]
-                    elif c["type"] == "output_audio":
-                        # Can't handle this, b/c chat completions expects an ID which we dont have
-                        raise UserError(
-                            f"Only audio IDs are supported for chat completions, but got: {c}"
-                        )
-                    else:
-                        raise UserError(
-                            f"Unknown content type in ResponseOutputMessage: {c}"
-                        )
+            builder.add(item)
+        return builder.messages()
 
-                if text_segments:
-                    combined = "\n".join(text_segments)
-                    new_asst["content"] = combined
-
-                new_asst["tool_calls"] = []
-                current_assistant_msg = new_asst
-
-            # 4) function/file-search calls => attach to assistant
-            elif file_search := cls.maybe_file_search_call(item):
-                asst = ensure_assistant_message()
-                tool_calls = list(asst.get("tool_calls", []))
-                new_tool_call = ChatCompletionMessageToolCallParam(
-                    id=file_search["id"],
-                    type="function",
-                    function={
-                        "name": "file_search_call",
-                        "arguments": json.dumps(
-                            {
-                                "queries": file_search.get("queries", []),
-                                "status": file_search.get("status"),
-                            }
-                        ),
-                    },
-                )
-                tool_calls.append(new_tool_call)
-                asst["tool_calls"] = tool_calls
-
-            elif func_call := cls.maybe_function_tool_call(item):
-                asst = ensure_assistant_message()
-                tool_calls = list(asst.get("tool_calls", []))
-                new_tool_call = ChatCompletionMessageToolCallParam(
-                    id=func_call["call_id"],
-                    type="function",
-                    function={
-                        "name": func_call["name"],
-                        "arguments": func_call["arguments"],
-                    },
-                )
-                tool_calls.append(new_tool_call)
-                asst["tool_calls"] = tool_calls
-            # 5) function call output => tool message
-            elif func_output := cls.maybe_function_tool_call_output(item):
-                flush_assistant_message()
-                msg: ChatCompletionToolMessageParam = {
-                    "role": "tool",
-                    "tool_call_id": func_output["call_id"],
-                    "content": func_output["output"],
+    @classmethod
+    def history_to_messages(
+        cls,
+        items: str | Iterable[TResponseInputItem],
+    ) -> list[ChatCompletionMessageParam]:
+        """Like `items_to_messages`, but when `items` is a `ConversationHistory` only the items
+        added since the previous turn are converted; earlier messages come from its cache."""
+        if not isinstance(items, ConversationHistory):
+            return cls.items_to_messages(items)
+
+        builder = items.cache.get("chat_messages")
+        if builder is None or builder.count > len(items):
+            builder = items.cache["chat_messages"] = _MessageBuilder()
+        for item in items[builder.count :]:
+            builder.add(item)
+        return builder.messages()
+
+
+class _MessageBuilder:
+    """The state of `_Converter.items_to_messages`, so that items can be added one at a time."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        """The number of items added so far."""
+        self.result: list[ChatCompletionMessageParam] = []
+        self.current_assistant_msg: ChatCompletionAssistantMessageParam | None = None
+
+    def flush_assistant_message(self) -> None:
+        if self.current_assistant_msg is not None:
+            # The API doesn't support empty arrays for tool_calls
+            if not self.current_assistant_msg.get("tool_calls"):
+                del self.current_assistant_msg["tool_calls"]
+            self.result.append(self.current_assistant_msg)
+            self.current_assistant_msg = None
+
+    def ensure_assistant_message(self) -> ChatCompletionAssistantMessageParam:
+        if self.current_assistant_msg is None:
+            self.current_assistant_msg = ChatCompletionAssistantMessageParam(role="assistant")
+            self.current_assistant_msg["tool_calls"] = []
+        return self.current_assistant_msg
+
+    def messages(self) -> list[ChatCompletionMessageParam]:
+        """The messages for the items added so far. The open assistant message, which later tool
+        calls may still extend, is copied rather than flushed."""
+        messages = list(self.result)
+        if self.current_assistant_msg is not None:
+            pending = ChatCompletionAssistantMessageParam(**self.current_assistant_msg)
+            if not pending.get("tool_calls"):
+                del pending["tool_calls"]
+            messages.append(pending)
+        return messages
+
+    def add(self, item: TResponseInputItem) -> None:
+        # 1) Check easy input message
+        if easy_msg := _Converter.maybe_easy_input_message(item):
+            role = easy_msg["role"]
+            content = easy_msg["content"]
+
+            if role == "user":
+                self.flush_assistant_message()
+                msg_user: ChatCompletionUserMessageParam = {
+                    "role": "user",
+                    "content": _Converter.extract_all_content(content),
+                }
+                self.result.append(msg_user)
+            elif role == "system":
+                self.flush_assistant_message()
+                msg_system: ChatCompletionSystemMessageParam = {
+                    "role": "system",
+                    "content": _Converter.extract_text_content(content),
+                }
+                self.result.append(msg_system)
+            elif role == "developer":
+                self.flush_assistant_message()
+                msg_developer: ChatCompletionDeveloperMessageParam = {
+                    "role": "developer",
+                    "content": _Converter.extract_text_content(content),
+                }
+                self.result.append(msg_developer)
+            elif role == "assistant":
+                self.flush_assistant_message()
+                msg_assistant: ChatCompletionAssistantMessageParam = {
+                    "role": "assistant",
+                    "content": _Converter.extract_text_content(content),
+                }
+                self.result.append(msg_assistant)
+            else:
+                raise UserError(f"Unexpected role in easy_input_message: {role}")
+
+        # 2) Check input message
+        elif in_msg := _Converter.maybe_input_message(item):
+            role = in_msg["role"]
+            content = in_msg["content"]
+            self.flush_assistant_message()
+
+            if role == "user":
+                msg_user = {
+                    "role": "user",
+                    "content": _Converter.extract_all_content(content),
+                }
+                self.result.append(msg_user)
+            elif role == "system":
+                msg_system = {
+                    "role": "system",
+                    "content": _Converter.extract_text_content(content),
+                }
+                self.result.append(msg_system)
+            elif role == "developer":
+                msg_developer = {
+                    "role": "developer",
+                    "content": _Converter.extract_text_content(content),
                 }
-                result.append(msg)
+                self.result.append(msg_developer)
+            else:
+                raise UserError(f"Unexpected role in input_message: {role}")
+
+        # 3) response output message => assistant
+        elif resp_msg := _Converter.maybe_response_output_message(item):
+            self.flush_assistant_message()
+            new_asst = ChatCompletionAssistantMessageParam(role="assistant")
+            contents = resp_msg["content"]
+
+            text_segments = []
+            for c in contents:
+                if c["type"] == "output_text":
+                    text_segments.append(c["text"])
+                elif c["type"] == "refusal":
+                    new_asst["refusal"] = c["refusal"]
+                elif c["type"] == "output_audio":
+                    # Can't handle this, b/c chat completions expects an ID which we dont have
+                    raise UserError(
+                        f"Only audio IDs are supported for chat completions, but got: {c}"
+                    )
+                else:
+                    raise UserError(
+                        f"Unknown content type in ResponseOutputMessage: {c}"
+                    )
 
-            # 6) item reference => handle or raise
-            elif item_ref := cls.maybe_item_reference(item):
-                raise UserError(
-                    f"Encountered an item_reference, which is not supported: {item_ref}"
-                )
+            if text_segments:
+                combined = "\n".join(text_segments)
+                new_asst["content"] = combined
+
+            new_asst["tool_calls"] = []
+            self.current_assistant_msg = new_asst
+
+        # 4) function/file-search calls => attach to assistant
+        elif file_search := _Converter.maybe_file_search_call(item):
+            asst = self.ensure_assistant_message()
+            tool_calls = list(asst.get("tool_calls", []))
+            new_tool_call = ChatCompletionMessageToolCallParam(
+                id=file_search["id"],
+                type="function",
+                function={
+                    "name": "file_search_call",
+                    "arguments": json.dumps(
+                        {
+                            "queries": file_search.get("queries", []),
+                            "status": file_search.get("status"),
+                        }
+                    ),
+                },
+            )
+            tool_calls.append(new_tool_call)
+            asst["tool_calls"] = tool_calls
+
+        elif func_call := _Converter.maybe_function_tool_call(item):
+            asst = self.ensure_assistant_message()
+            tool_calls = list(asst.get("tool_calls", []))
+            new_tool_call = ChatCompletionMessageToolCallParam(
+                id=func_call["call_id"],
+                type="function",
+                function={
+                    "name": func_call["name"],
+                    "arguments": func_call["arguments"],
+                },
+            )
+            tool_calls.append(new_tool_call)
+            asst["tool_calls"] = tool_calls
+        # 5) function call output => tool message
+        elif func_output := _Converter.maybe_function_tool_call_output(item):
+            self.flush_assistant_message()
+            msg: ChatCompletionToolMessageParam = {
+                "role": "tool",
+                "tool_call_id": func_output["call_id"],
+                "content": func_output["output"],
+            }
+            self.result.append(msg)
 
-            # 7) If we haven't recognized it => fail or ignore
-            else:
-                raise UserError(f"Unhandled item type or structure: {item}")
+        # 6) item reference => handle or raise
+        elif item_ref := _Converter.maybe_item_reference(item):
+            raise UserError(
+                f"Encountered an item_reference, which is not supported: {item_ref}"
+            )
+
+        # 7) If we haven't recognized it => fail or ignore
+        else:
+            raise UserError(f"Unhandled item type or structure: {item}")
 
-        flush_assistant_message()
-        return result
+        self.count += 1
 
 
 class ToolConverter:
@@ -1051,6 +1089,30 @@ class ToolConverter:
             f"{type(tool)}, tool: {tool}"
         )
 
+    @classmethod
+    def convert_tools(
+        cls,
+        tools: list[Tool],
+        handoffs: list[Handoff],
+        cache: dict[int, tuple[Any, ChatCompletionToolParam]] | None = None,
+    ) -> list[ChatCompletionToolParam]:
+        """Converts the tools followed by the handoffs. Conversions in `cache`, keyed by the id of
+        the tool or handoff, are reused and new ones added."""
+        converted: list[ChatCompletionToolParam] = []
+        for obj in [*(tools or []), *handoffs]:
+            entry = cache.get(id(obj)) if cache is not None else None
+            if entry is None or entry[0] is not obj:
+                param = (
+                    cls.convert_handoff_tool(obj)
+                    if isinstance(obj, Handoff)
+                    else cls.to_openai(obj)
+                )
+                entry = (obj, param)
+                if cache is not None:
+                    cache[id(obj)] = entry
+            converted.append(entry[1])
+        return converted
+
     @classmethod
     def convert_handoff_tool(cls, handoff: Handoff[Any]) -> ChatCompletionToolParam:
         return {
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, overload
@@ -21,7 +22,7 @@ from .. import _debug
 from ..agent_output import AgentOutputSchema
 from ..exceptions import UserError
 from ..handoffs import Handoff
-from ..items import ItemHelpers, ModelResponse, TResponseInputItem
+from ..items import ConversationHistory, ItemHelpers, ModelResponse, TResponseInputItem
 from ..logger import logger
 from ..tool import ComputerTool, FileSearchTool, FunctionTool, Tool, WebSearchTool
 from ..tracing import SpanError, response_span
@@ -84,7 +85,7 @@ class OpenAIResponsesModel(Model):
 
                 if _debug.DONT_LOG_MODEL_DATA:
                     logger.debug("LLM responsed")
-                else:
+                elif logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         "LLM resp:\n"
                         f"{json.dumps([x.model_dump() for x in response.output], indent=2)}\n"
@@ -224,7 +225,12 @@ class OpenAIResponsesModel(Model):
         handoffs: list[Handoff],
         stream: Literal[True] | Literal[False] = False,
     ) -> Response | AsyncStream[ResponseStreamEvent]:
-        list_input = ItemHelpers.input_to_new_input_list(input)
+        # The runner's history is already a fresh list for this call
+        list_input = (
+            input
+            if isinstance(input, ConversationHistory)
+            else ItemHelpers.input_to_new_input_list(input)
+        )
 
         parallel_tool_calls = (
             True
@@ -238,7 +244,7 @@ class OpenAIResponsesModel(Model):
 
         if _debug.DONT_LOG_MODEL_DATA:
             logger.debug("Calling LLM")
-        else:
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"Calling LLM {self.model} with input:\n"
                 f"{json.dumps(list_input, indent=2)}\n"
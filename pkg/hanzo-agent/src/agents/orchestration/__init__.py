@@ -6,7 +6,8 @@ workflow management, execution tracking, and UI streaming support.
 
 from .orchestrator import Orchestrator, OrchestrationConfig
 from .workflow import Workflow, WorkflowStep, StepType, Step
-from .executor import WorkflowExecutor, ExecutionResult
+from .executor import WorkflowExecutor, ExecutionResult, StepResult
+from .scheduler import StepScheduler
 from .ui_stream import UIStreamer, StreamUpdate, UpdateType
 
 __all__ = [
@@ -18,6 +19,8 @@ __all__ = [
     "Step",
     "WorkflowExecutor",
     "ExecutionResult",
+    "StepResult",
+    "StepScheduler",
     "UIStreamer",
     "StreamUpdate",
     "UpdateType",
@@ -5,8 +5,9 @@ from __future__ import annotations
 import asyncio
 import time
 import uuid
+from contextlib import aclosing
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from ..exceptions import AgentsException
 from ..logger import logger
@@ -15,6 +16,7 @@ from ..result import RunResult
 from ..run_context import RunContextWrapper, TContext
 from ..state.store import StateStore
 from ..tracing import custom_span
+from .scheduler import StepScheduler
 from .ui_stream import UIStreamer, StreamUpdate, UpdateType
 from .workflow import Workflow, WorkflowStep, StepType
 
@@ -73,6 +75,9 @@ class WorkflowExecutor:
         state_store: StateStore | None = None,
         retry_failed: bool = True,
         max_retries: int = 3,
+        max_concurrency: int | None = None,
+        agent_concurrency: Dict[str, int] | None = None,
+        critical_path_first: bool = True,
     ):
         """Initialize executor.
 
@@ -82,14 +87,21 @@ class WorkflowExecutor:
             state_store: State store for persistence
             retry_failed: Whether to retry failed steps
             max_retries: Maximum retries per step
+            max_concurrency: Maximum number of steps running at once
+            agent_concurrency: Maximum number of steps running at once per agent name
+            critical_path_first: Whether to start steps on the longest remaining path first
         """
         self.workflow = workflow
         self.network = network
         self.state_store = state_store
         self.retry_failed = retry_failed
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.agent_concurrency = agent_concurrency
+        self.critical_path_first = critical_path_first
         self.execution_id = str(uuid.uuid4())
         self.ui_streamer: UIStreamer | None = None
+        self.result: ExecutionResult | None = None
         self._step_outputs: Dict[str, Any] = {}
         self._completed_steps: set[str] = set()
 
@@ -111,19 +123,44 @@ class WorkflowExecutor:
         Returns:
             Execution result
         """
+        async with aclosing(self.stream(input, context)) as results:
+            async for _ in results:
+                pass
+
+        assert self.result is not None
+        return self.result
+
+    async def stream(
+        self,
+        input: Any,
+        context: TContext | None = None,
+    ) -> AsyncIterator[StepResult]:
+        """Execute the workflow, yielding each step's result as the step finishes.
+
+        Each step starts as soon as the steps it depends on are done, within the executor's
+        concurrency limits. Once the iteration ends, `result` holds the execution result.
+
+        Args:
+            input: Initial input data
+            context: Execution context
+
+        Yields:
+            Step results in completion order
+        """
         # Validate workflow
         errors = self.workflow.validate()
         if errors:
-            return ExecutionResult(
+            self.result = ExecutionResult(
                 workflow_id=self.workflow.id,
                 execution_id=self.execution_id,
                 success=False,
                 error=f"Workflow validation failed: {'; '.join(errors)}",
                 total_steps=len(self.workflow.steps),
             )
+            return
 
         # Initialize result
-        result = ExecutionResult(
+        result = self.result = ExecutionResult(
             workflow_id=self.workflow.id,
             execution_id=self.execution_id,
             success=True,
@@ -147,26 +184,25 @@ class WorkflowExecutor:
             },
         )
 
-        try:
-            # Get execution order
-            execution_batches = self.workflow.get_execution_order()
-
-            # Execute batches
-            for batch in execution_batches:
-                # Execute steps in parallel within batch
-                batch_tasks = []
-
-                for step_id in batch:
-                    if step_id in self._completed_steps:
-                        continue
-
-                    step = self.workflow.steps[step_id]
-                    task = self._execute_step(step, exec_context, result)
-                    batch_tasks.append(task)
+        async def run_step(step: WorkflowStep) -> StepResult | None:
+            # Already run by a parallel, conditional or loop step
+            if step.id in self._completed_steps:
+                return None
+            return await self._execute_step(step, exec_context, result)
+
+        scheduler = StepScheduler(
+            self.workflow,
+            run_step,
+            max_concurrency=self.max_concurrency,
+            agent_concurrency=self.agent_concurrency,
+            critical_path_first=self.critical_path_first,
+        )
 
-                # Wait for batch to complete
-                if batch_tasks:
-                    await asyncio.gather(*batch_tasks, return_exceptions=True)
+        try:
+            async with aclosing(scheduler.run()) as completions:
+                async for _step, step_result in completions:
+                    if step_result is not None:
+                        yield step_result
 
             # Set final output
             if self.workflow.entry_point:
@@ -192,16 +228,14 @@ class WorkflowExecutor:
                 },
             )
 
-        return result
-
     async def _execute_step(
         self,
         step: WorkflowStep,
         context: ExecutionContext,
-        result: ExecutionResult,
-    ) -> None:
-        """Execute a single step."""
-        step_result = StepResult(step_id=step.id)
+        result: ExecutionResult | None,
+    ) -> StepResult:
+        """Execute a single step, retrying it if configured."""
+        step_result = StepResult(step_id=step.id, success=False)
 
         # Send step start update
         await self._send_update(
@@ -214,52 +248,39 @@ class WorkflowExecutor:
         )
 
         try:
-            # Execute based on step type
-            if step.type == StepType.AGENT:
-                output = await self._execute_agent_step(step, context)
-            elif step.type == StepType.PARALLEL:
-                output = await self._execute_parallel_step(step, context)
-            elif step.type == StepType.CONDITIONAL:
-                output = await self._execute_conditional_step(step, context)
-            elif step.type == StepType.LOOP:
-                output = await self._execute_loop_step(step, context)
-            elif step.type == StepType.TRANSFORM:
-                output = await self._execute_transform_step(step, context)
-            elif step.type == StepType.WAIT:
-                output = await self._execute_wait_step(step, context)
-            else:
-                raise AgentsException(f"Unknown step type: {step.type}")
-
-            # Store output
-            self._step_outputs[step.id] = output
-            self._completed_steps.add(step.id)
-
-            step_result.success = True
-            step_result.output = output
-
-        except Exception as e:
-            logger.error(f"Step {step.id} failed: {e}")
-            step_result.success = False
-            step_result.error = str(e)
+            while True:
+                try:
+                    output = await self._run_step(step, context)
+                except Exception as e:
+                    logger.error(f"Step {step.id} failed: {e}")
+                    step_result.error = str(e)
+
+                    # Retry if configured
+                    if self.retry_failed and step_result.retries < self.max_retries:
+                        step_result.retries += 1
+                        logger.info(f"Retrying step {step.id} (attempt {step_result.retries})")
+                        await asyncio.sleep(2**step_result.retries)  # Exponential backoff
+                        continue
+                    break
 
-            # Retry if configured
-            if self.retry_failed and step_result.retries < self.max_retries:
-                step_result.retries += 1
-                logger.info(f"Retrying step {step.id} (attempt {step_result.retries})")
+                # Store output
+                self._step_outputs[step.id] = output
+                self._completed_steps.add(step.id)
 
-                # Recursive retry
-                await asyncio.sleep(2**step_result.retries)  # Exponential backoff
-                await self._execute_step(step, context, result)
-                return
+                step_result.success = True
+                step_result.output = output
+                step_result.error = None
+                break
 
             # Handle error step
-            if step.on_error and step.on_error in self.workflow.steps:
+            if not step_result.success and step.on_error and step.on_error in self.workflow.steps:
                 error_step = self.workflow.steps[step.on_error]
                 await self._execute_step(error_step, context, result)
 
         finally:
             step_result.end_time = time.time()
-            result.step_results[step.id] = step_result
+            if result is not None:
+                result.step_results[step.id] = step_result
 
             # Send step complete update
             await self._send_update(
@@ -272,6 +293,25 @@ class WorkflowExecutor:
                 },
             )
 
+        return step_result
+
+    async def _run_step(self, step: WorkflowStep, context: ExecutionContext) -> Any:
+        """Run a step once based on its type."""
+        if step.type == StepType.AGENT:
+            return await self._execute_agent_step(step, context)
+        elif step.type == StepType.PARALLEL:
+            return await self._execute_parallel_step(step, context)
+        elif step.type == StepType.CONDITIONAL:
+            return await self._execute_conditional_step(step, context)
+        elif step.type == StepType.LOOP:
+            return await self._execute_loop_step(step, context)
+        elif step.type == StepType.TRANSFORM:
+            return await self._execute_transform_step(step, context)
+        elif step.type == StepType.WAIT:
+            return await self._execute_wait_step(step, context)
+        else:
+            raise AgentsException(f"Unknown step type: {step.type}")
+
     async def _execute_agent_step(
         self,
         step: WorkflowStep,
@@ -44,6 +44,15 @@ class OrchestrationConfig:
     max_retries: int = 3
     """Maximum retries for failed steps."""
 
+    max_concurrent_steps: int | None = None
+    """Maximum number of steps running at once in a workflow. None means no limit."""
+
+    agent_concurrency: Dict[str, int] = field(default_factory=dict)
+    """Maximum number of steps running at once per agent name."""
+
+    critical_path_first: bool = True
+    """Whether to start ready steps on the longest remaining path first."""
+
 
 class Orchestrator:
     """High-level orchestrator for complex agent systems.
@@ -137,6 +146,9 @@ class Orchestrator:
                 state_store=self.state_store,
                 retry_failed=self.config.retry_failed_steps,
                 max_retries=self.config.max_retries,
+                max_concurrency=self.config.max_concurrent_steps,
+                agent_concurrency=self.config.agent_concurrency,
+                critical_path_first=self.config.critical_path_first,
             )
 
             # Store executor
@@ -0,0 +1,124 @@
+"""Ready-queue scheduling for workflow steps."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections import defaultdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
+
+from .workflow import StepType, Workflow, WorkflowStep
+
+
+class StepScheduler:
+    """Runs workflow steps as soon as their dependencies finish.
+
+    Unlike running the workflow level by level, a slow step only holds back the steps that
+    depend on it. Ready steps wait in a queue ordered by `priority`, then (when
+    `critical_path_first`) by the length of the longest path still ahead of them, then by the
+    order they were added to the workflow. A step starts when it reaches the front of the queue
+    and both the global `max_concurrency` and its agent's limit in `agent_concurrency` allow it;
+    steps held back by their agent's limit don't block steps for other agents.
+
+    A step counts as finished, and releases its dependents, when `run_step` returns.
+    """
+
+    def __init__(
+        self,
+        workflow: Workflow,
+        run_step: Callable[[WorkflowStep], Awaitable[Any]],
+        max_concurrency: int | None = None,
+        agent_concurrency: Dict[str, int] | None = None,
+        critical_path_first: bool = True,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            workflow: Workflow to schedule
+            run_step: Coroutine function that runs one step
+            max_concurrency: Maximum number of steps running at once
+            agent_concurrency: Maximum number of steps running at once per agent name
+            critical_path_first: Whether to start steps on the longest remaining path first
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        self.workflow = workflow
+        self.run_step = run_step
+        self.max_concurrency = max_concurrency
+        self.agent_concurrency = dict(agent_concurrency or {})
+        self.critical_path_first = critical_path_first
+
+    @staticmethod
+    def _agent_of(step: WorkflowStep) -> str | None:
+        if step.type == StepType.AGENT:
+            return step.config.get("agent_name")
+        return None
+
+    async def run(self) -> AsyncIterator[Tuple[WorkflowStep, Any]]:
+        """Run every step, yielding each step with the value `run_step` returned for it as it
+        finishes.
+
+        Dependents are started before the completion is yielded, so a slow consumer doesn't hold
+        up the workflow. If `run_step` raises, the running steps are cancelled and the exception
+        propagates. Raises `AgentsException` if the workflow has a dependency cycle.
+        """
+        steps = self.workflow.steps
+        dependents = self.workflow.dependents()
+        # Also checks for cycles, which would otherwise leave steps waiting forever
+        lengths = self.workflow.critical_path_lengths()
+        index = {step_id: i for i, step_id in enumerate(steps)}
+        remaining = {step_id: len(step.depends_on) for step_id, step in steps.items()}
+
+        ready: List[Tuple[int, float, int, str]] = []
+        # Ready steps held back by their agent's limit, per agent
+        blocked: Dict[str, List[Tuple[int, float, int, str]]] = defaultdict(list)
+        running_per_agent: Dict[str, int] = defaultdict(int)
+        running: Dict[asyncio.Task[Any], str] = {}
+
+        def push(step_id: str) -> None:
+            rank = lengths[step_id] if self.critical_path_first else 0.0
+            entry = (-steps[step_id].priority, -rank, index[step_id], step_id)
+            heapq.heappush(ready, entry)
+
+        def start_ready() -> None:
+            while ready and (self.max_concurrency is None or len(running) < self.max_concurrency):
+                entry = heapq.heappop(ready)
+                step = steps[entry[-1]]
+                agent = self._agent_of(step)
+                if agent is not None:
+                    limit = self.agent_concurrency.get(agent)
+                    if limit is not None and running_per_agent[agent] >= limit:
+                        heapq.heappush(blocked[agent], entry)
+                        continue
+                    running_per_agent[agent] += 1
+                running[asyncio.create_task(self.run_step(step))] = step.id
+
+        for step_id, count in remaining.items():
+            if count == 0:
+                push(step_id)
+        start_ready()
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                finished = sorted(done, key=lambda task: index[running[task]])
+                finished_ids = [running.pop(task) for task in finished]
+                for step_id in finished_ids:
+                    agent = self._agent_of(steps[step_id])
+                    if agent is not None:
+                        running_per_agent[agent] -= 1
+                        if blocked.get(agent):
+                            heapq.heappush(ready, heapq.heappop(blocked[agent]))
+                    for other_id in dependents[step_id]:
+                        remaining[other_id] -= 1
+                        if remaining[other_id] == 0:
+                            push(other_id)
+                start_ready()
+
+                for task, step_id in zip(finished, finished_ids):
+                    yield steps[step_id], task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
@@ -60,6 +60,12 @@ class WorkflowStep:
     on_error: str | None = None
     """Step to run on error."""
 
+    priority: int = 0
+    """Steps with a higher priority start first when more steps are ready than can run."""
+
+    estimated_duration: float = 1.0
+    """Expected run time in seconds, used to find the workflow's critical path."""
+
     metadata: Dict[str, Any] = field(default_factory=dict)
     """Additional metadata."""
 
@@ -268,37 +274,67 @@ class Workflow:
         if not self.steps:
             return []
 
-        # Topological sort with batching
-        visited = set()
+        # Topological sort with batching, visiting each dependency edge once
+        index = {step_id: i for i, step_id in enumerate(self.steps)}
         in_degree = {
             step_id: len(step.depends_on) for step_id, step in self.steps.items()
         }
+        dependents = self.dependents()
 
         batches = []
+        batch = [step_id for step_id, degree in in_degree.items() if degree == 0]
+        ordered = 0
 
-        while len(visited) < len(self.steps):
-            # Find all steps with no remaining dependencies
-            batch = []
-            for step_id, degree in in_degree.items():
-                if step_id not in visited and degree == 0:
-                    batch.append(step_id)
-                    visited.add(step_id)
-
-            if not batch:
-                # Circular dependency
-                raise AgentsException("Circular dependency detected in workflow")
-
+        while batch:
             batches.append(batch)
+            ordered += len(batch)
 
-            # Update in-degrees
+            # Release steps whose last dependency is in this batch
+            next_batch = []
             for step_id in batch:
-                # Find steps that depend on this one
-                for other_id, other_step in self.steps.items():
-                    if step_id in other_step.depends_on:
-                        in_degree[other_id] -= 1
+                for other_id in dependents[step_id]:
+                    in_degree[other_id] -= 1
+                    if in_degree[other_id] == 0:
+                        next_batch.append(other_id)
+            batch = sorted(next_batch, key=index.__getitem__)
+
+        if ordered < len(self.steps):
+            # Circular dependency
+            raise AgentsException("Circular dependency detected in workflow")
 
         return batches
 
+    def dependents(self) -> Dict[str, List[str]]:
+        """Get the steps that depend on each step.
+
+        Returns:
+            Mapping of step ID to the IDs of the steps that depend on it
+        """
+        dependents: Dict[str, List[str]] = {step_id: [] for step_id in self.steps}
+        for step_id, step in self.steps.items():
+            for dep_id in step.depends_on:
+                if dep_id in dependents:
+                    dependents[dep_id].append(step_id)
+        return dependents
+
+    def critical_path_lengths(self) -> Dict[str, float]:
+        """Get the longest estimated time from the start of each step to the end of the workflow.
+
+        Uses each step's `estimated_duration`. The steps with the largest values are on the
+        critical path: delaying them delays the whole workflow.
+
+        Returns:
+            Mapping of step ID to remaining critical path length in seconds
+        """
+        dependents = self.dependents()
+        lengths: Dict[str, float] = {}
+        for batch in reversed(self.get_execution_order()):
+            for step_id in batch:
+                lengths[step_id] = self.steps[step_id].estimated_duration + max(
+                    (lengths[other_id] for other_id in dependents[step_id]), default=0.0
+                )
+        return lengths
+
     def validate(self) -> List[str]:
         """Validate the workflow.
 
@@ -358,6 +394,8 @@ class Workflow:
                     "retry_config": step.retry_config,
                     "timeout": step.timeout,
                     "on_error": step.on_error,
+                    "priority": step.priority,
+                    "estimated_duration": step.estimated_duration,
                     "metadata": step.metadata,
                 }
                 for step_id, step in self.steps.items()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import weakref
 from dataclasses import dataclass, field
 from typing import Any, cast
 
@@ -34,7 +35,13 @@ from .guardrail import (
     OutputGuardrailResult,
 )
 from .handoffs import Handoff, HandoffInputFilter, handoff
-from .items import ItemHelpers, ModelResponse, RunItem, TResponseInputItem
+from .items import (
+    ConversationBuffer,
+    ItemHelpers,
+    ModelResponse,
+    RunItem,
+    TResponseInputItem,
+)
 from .lifecycle import RunHooks
 from .logger import logger
 from .model_settings import ModelSettings
@@ -109,6 +116,43 @@ class RunConfig:
     """
 
 
+@dataclass
+class _AgentCache:
+    """Output schema and handoffs built for an agent, reused until its `output_type`, its
+    `handoffs` or what their handoffs are built from change."""
+
+    output_type: Any = None
+    output_schema: AgentOutputSchema | None = None
+    handoff_keys: list[tuple[Any, ...]] = field(default_factory=list)
+    handoffs: list[Handoff] | None = None
+
+
+# Keyed by id() because agents are unhashable dataclasses; entries go with their agent
+_agent_caches: dict[int, _AgentCache] = {}
+
+
+def _agent_cache(agent: Agent[Any]) -> _AgentCache:
+    key = id(agent)
+    cache = _agent_caches.get(key)
+    if cache is None:
+        cache = _agent_caches[key] = _AgentCache()
+        weakref.finalize(agent, _agent_caches.pop, key, None)
+    return cache
+
+
+def _handoff_key(item: Any) -> tuple[Any, ...]:
+    """The handoff item, and for an agent what `handoff()` builds its Handoff from."""
+    if isinstance(item, Agent):
+        return (item, item.name, item.handoff_description)
+    return (item,)
+
+
+def _same_keys(a: list[tuple[Any, ...]], b: list[tuple[Any, ...]]) -> bool:
+    return len(a) == len(b) and all(
+        x[0] is y[0] and x[1:] == y[1:] for x, y in zip(a, b)
+    )
+
+
 class Runner:
     @classmethod
     async def run(
@@ -164,6 +208,7 @@ class Runner:
             current_turn = 0
             original_input: str | list[TResponseInputItem] = copy.deepcopy(input)
             generated_items: list[RunItem] = []
+            conversation = ConversationBuffer()
             model_responses: list[ModelResponse] = []
 
             context_wrapper: RunContextWrapper[TContext] = RunContextWrapper(
@@ -230,6 +275,7 @@ class Runner:
                                 context_wrapper=context_wrapper,
                                 run_config=run_config,
                                 should_run_agent_start_hooks=should_run_agent_start_hooks,
+                                conversation=conversation,
                             ),
                         )
                     else:
@@ -241,6 +287,7 @@ class Runner:
                             context_wrapper=context_wrapper,
                             run_config=run_config,
                             should_run_agent_start_hooks=should_run_agent_start_hooks,
+                            conversation=conversation,
                         )
                     should_run_agent_start_hooks = False
 
@@ -491,6 +538,7 @@ class Runner:
         current_agent = starting_agent
         current_turn = 0
         should_run_agent_start_hooks = True
+        conversation = ConversationBuffer()
 
         streamed_result._event_queue.put_nowait(
             AgentUpdatedStreamEvent(new_agent=current_agent)
@@ -542,9 +590,7 @@ class Runner:
                             starting_agent,
                             starting_agent.input_guardrails
                             + (run_config.input_guardrails or []),
-                            copy.deepcopy(
-                                ItemHelpers.input_to_new_input_list(starting_input)
-                            ),
+                            ItemHelpers.input_to_new_input_list(starting_input),
                             context_wrapper,
                             streamed_result,
                             current_span,
@@ -558,6 +604,7 @@ class Runner:
                         context_wrapper,
                         run_config,
                         should_run_agent_start_hooks,
+                        conversation,
                     )
                     should_run_agent_start_hooks = False
 
@@ -629,6 +676,7 @@ class Runner:
         context_wrapper: RunContextWrapper[TContext],
         run_config: RunConfig,
         should_run_agent_start_hooks: bool,
+        conversation: ConversationBuffer | None = None,
     ) -> SingleStepResult:
         if should_run_agent_start_hooks:
             await asyncio.gather(
@@ -653,8 +701,9 @@ class Runner:
         model_settings = agent.model_settings.resolve(run_config.model_settings)
         final_response: ModelResponse | None = None
 
-        input = ItemHelpers.input_to_new_input_list(streamed_result.input)
-        input.extend([item.to_input_item() for item in streamed_result.new_items])
+        input = (conversation or ConversationBuffer()).update(
+            streamed_result.input, streamed_result.new_items
+        )
 
         # 1. Stream the output events
         async for event in model.stream_response(
@@ -720,6 +769,7 @@ class Runner:
         context_wrapper: RunContextWrapper[TContext],
         run_config: RunConfig,
         should_run_agent_start_hooks: bool,
+        conversation: ConversationBuffer | None = None,
     ) -> SingleStepResult:
         # Ensure we run the hooks before anything else
         if should_run_agent_start_hooks:
@@ -736,10 +786,7 @@ class Runner:
 
         output_schema = cls._get_output_schema(agent)
         handoffs = cls._get_handoffs(agent)
-        input = ItemHelpers.input_to_new_input_list(original_input)
-        input.extend(
-            [generated_item.to_input_item() for generated_item in generated_items]
-        )
+        input = (conversation or ConversationBuffer()).update(original_input, generated_items)
 
         new_response = await cls._get_new_response(
             agent,
@@ -907,17 +954,26 @@ class Runner:
         if agent.output_type is None or agent.output_type is str:
             return None
 
-        return AgentOutputSchema(agent.output_type)
+        cache = _agent_cache(agent)
+        if cache.output_schema is None or cache.output_type is not agent.output_type:
+            cache.output_type = agent.output_type
+            cache.output_schema = AgentOutputSchema(agent.output_type)
+        return cache.output_schema
 
     @classmethod
     def _get_handoffs(cls, agent: Agent[Any]) -> list[Handoff]:
-        handoffs = []
-        for handoff_item in agent.handoffs:
-            if isinstance(handoff_item, Handoff):
-                handoffs.append(handoff_item)
-            elif isinstance(handoff_item, Agent):
-                handoffs.append(handoff(handoff_item))
-        return handoffs
+        cache = _agent_cache(agent)
+        keys = [_handoff_key(handoff_item) for handoff_item in agent.handoffs]
+        if cache.handoffs is None or not _same_keys(cache.handoff_keys, keys):
+            handoffs = []
+            for handoff_item in agent.handoffs:
+                if isinstance(handoff_item, Handoff):
+                    handoffs.append(handoff_item)
+                elif isinstance(handoff_item, Agent):
+                    handoffs.append(handoff(handoff_item))
+            cache.handoff_keys = keys
+            cache.handoffs = handoffs
+        return list(cache.handoffs)
 
     @classmethod
     def _get_model(cls, agent: Agent[Any], run_config: RunConfig) -> Model:
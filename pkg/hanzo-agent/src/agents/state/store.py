@@ -7,8 +7,9 @@ import json
 import os
 import pickle
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar
 
 from ..logger import logger
 from .namespace import StateNamespace
@@ -16,19 +17,40 @@ from .serializer import StateSerializer, JSONSerializer
 
 T = TypeVar("T")
 
+_MISSING = object()
+
+
+class _KeyLock:
+    """A key's lock and the number of tasks holding or awaiting it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
 
 class StateStore(ABC):
     """Abstract base class for state stores."""
 
     def __init__(self, serializer: StateSerializer | None = None):
         self.serializer = serializer or JSONSerializer()
-        self._locks: Dict[str, asyncio.Lock] = {}
-
-    def _get_lock(self, key: str) -> asyncio.Lock:
-        """Get or create a lock for a key."""
-        if key not in self._locks:
-            self._locks[key] = asyncio.Lock()
-        return self._locks[key]
+        self._locks: Dict[str, _KeyLock] = {}
+
+    @asynccontextmanager
+    async def _locked(self, key: str) -> AsyncIterator[None]:
+        """Hold the lock for a key; it is dropped once no task uses it."""
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = _KeyLock()
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if not entry.users:
+                del self._locks[key]
 
     def _make_key(self, key: str, namespace: str | None = None) -> str:
         """Create a namespaced key."""
@@ -80,7 +102,7 @@ class StateStore(ABC):
             The updated value
         """
         full_key = self._make_key(key, namespace)
-        async with self._get_lock(full_key):
+        async with self._locked(full_key):
             current = await self.get(key, namespace)
             updated = updater(current)
             await self.set(key, updated, namespace)
@@ -117,11 +139,22 @@ class StateStore(ABC):
 
 
 class InMemoryStateStore(StateStore):
-    """In-memory state store for development and testing."""
+    """In-memory state store for development and testing.
+
+    Each key is indexed under every namespace it belongs to (``a:b:key`` under
+    ``a`` and ``a:b``), so listing a namespace reads only its keys.
+    """
 
     def __init__(self, serializer: StateSerializer | None = None):
         super().__init__(serializer)
         self._data: Dict[str, Any] = {}
+        # namespace -> its keys (as a dict, to keep insertion order)
+        self._namespaces: Dict[str, Dict[str, None]] = {}
+
+    @staticmethod
+    def _prefixes(full_key: str) -> List[str]:
+        """Namespaces ``full_key`` belongs to."""
+        return [full_key[:i] for i, c in enumerate(full_key) if c == ":"]
 
     async def get(self, key: str, namespace: str | None = None) -> Any:
         """Get a value from memory."""
@@ -131,13 +164,22 @@ class InMemoryStateStore(StateStore):
     async def set(self, key: str, value: Any, namespace: str | None = None) -> None:
         """Set a value in memory."""
         full_key = self._make_key(key, namespace)
+        if full_key not in self._data:
+            for prefix in self._prefixes(full_key):
+                self._namespaces.setdefault(prefix, {})[full_key] = None
         self._data[full_key] = value
         logger.debug(f"Set state: {full_key} = {type(value).__name__}")
 
     async def delete(self, key: str, namespace: str | None = None) -> None:
         """Delete a value from memory."""
         full_key = self._make_key(key, namespace)
-        self._data.pop(full_key, None)
+        if self._data.pop(full_key, _MISSING) is _MISSING:
+            return
+        for prefix in self._prefixes(full_key):
+            keys = self._namespaces[prefix]
+            del keys[full_key]
+            if not keys:
+                del self._namespaces[prefix]
 
     async def exists(self, key: str, namespace: str | None = None) -> bool:
         """Check if a key exists in memory."""
@@ -148,24 +190,20 @@ class InMemoryStateStore(StateStore):
         self, pattern: str | None = None, namespace: str | None = None
     ) -> List[str]:
         """List keys in memory."""
-        prefix = f"{namespace}:" if namespace else ""
-        keys = []
-
-        for key in self._data:
-            if namespace and not key.startswith(prefix):
-                continue
-
-            # Remove namespace prefix from result
-            clean_key = key[len(prefix) :] if namespace else key
-
-            if pattern is None or pattern in clean_key:
-                keys.append(clean_key)
+        if namespace:
+            start = len(namespace) + 1
+            keys = [key[start:] for key in self._namespaces.get(namespace, ())]
+        else:
+            keys = list(self._data)
 
+        if pattern is not None:
+            keys = [key for key in keys if pattern in key]
         return keys
 
     def clear(self) -> None:
         """Clear all data (for testing)."""
         self._data.clear()
+        self._namespaces.clear()
 
 
 class RedisStateStore(StateStore):
@@ -12,6 +12,7 @@ from .create import (
     response_span,
     trace,
 )
+from .pipeline import JsonlFileSink, OtlpBufferSink, TraceBatch, TracePipeline, TraceSink
 from .processor_interface import TracingProcessor
 from .processors import default_exporter, default_processor
 from .setup import GLOBAL_TRACE_PROVIDER
@@ -55,6 +56,11 @@ __all__ = [
     "HandoffSpanData",
     "ResponseSpanData",
     "TracingProcessor",
+    "TracePipeline",
+    "TraceSink",
+    "TraceBatch",
+    "JsonlFileSink",
+    "OtlpBufferSink",
     "gen_trace_id",
     "gen_span_id",
 ]
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import abc
+import gzip
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict, deque
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Literal
+
+from ..logger import logger
+from .processor_interface import TracingProcessor
+from .spans import Span
+from .traces import Trace
+
+_encoder = json.JSONEncoder(default=str, separators=(",", ":"))
+
+
+class TraceBatch:
+    """A batch of exported traces and spans.
+
+    Each item is exported and serialized once; sinks share the JSON lines and the gzip payload.
+    """
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self.records = records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @cached_property
+    def lines(self) -> bytes:
+        """The records as newline-delimited JSON."""
+        return "".join(_encoder.encode(r) + "\n" for r in self.records).encode()
+
+    @cached_property
+    def gzipped(self) -> bytes:
+        """`lines` as a single gzip member."""
+        # Higher levels cost several times the CPU for a few percent on span JSON
+        return gzip.compress(self.lines, compresslevel=3, mtime=0)
+
+
+class TraceSink(abc.ABC):
+    """Receives batches from a `TracePipeline`, on its worker thread."""
+
+    @abc.abstractmethod
+    def write(self, batch: TraceBatch) -> None:
+        """Writes a batch. Exceptions are logged and the batch is dropped for this sink."""
+        pass
+
+    def close(self) -> None:
+        """Called once when the pipeline shuts down."""
+        pass
+
+
+class JsonlFileSink(TraceSink):
+    """Appends batches to a JSONL file, gzip-compressed by default, and rotates it by size.
+
+    Each batch is written as one gzip member, so the file stays readable with `gzip.open` (or
+    `zcat`) while it grows. When a write would take the file past `max_bytes`, it is renamed to
+    `<path>.1`, older files shift up and the oldest beyond `backups` is deleted.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_bytes: int = 64 * 1024 * 1024,
+        backups: int = 5,
+        compress: bool = True,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.compress = compress
+        self._lock = threading.Lock()
+
+    def write(self, batch: TraceBatch) -> None:
+        data = batch.gzipped if self.compress else batch.lines
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size and size + len(data) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "ab") as f:
+                f.write(data)
+
+    def _rotate(self) -> None:
+        if self.backups <= 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for i in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{i}")
+            if older.exists():
+                os.replace(older, self.path.with_name(f"{self.path.name}.{i + 1}"))
+        os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+
+
+class OtlpBufferSink(TraceSink):
+    """Keeps the most recent spans in memory in OTLP/JSON form.
+
+    `drain()` returns and clears them as an `ExportTraceServiceRequest` body, ready to post to an
+    OTLP/HTTP collector or hand to a test. When more than `max_spans` are buffered the oldest go,
+    and workflow names are remembered for the `max_spans` most recent traces.
+    """
+
+    def __init__(self, max_spans: int = 10_000, service_name: str = "agents"):
+        self.service_name = service_name
+        self._spans: deque[dict[str, Any]] = deque(maxlen=max_spans)
+        self._workflows: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def write(self, batch: TraceBatch) -> None:
+        with self._lock:
+            for record in batch.records:
+                if record.get("object") == "trace":
+                    self._workflows[record["id"]] = record.get("workflow_name") or ""
+                    if len(self._workflows) > self._spans.maxlen:
+                        self._workflows.popitem(last=False)
+                elif record.get("object") == "trace.span":
+                    self._spans.append(self._convert(record))
+
+    def drain(self) -> dict[str, Any]:
+        """Returns the buffered spans as OTLP/JSON and empties the buffer."""
+        with self._lock:
+            spans = list(self._spans)
+            self._spans.clear()
+            self._workflows.clear()
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_attribute("service.name", self.service_name)]},
+                    "scopeSpans": [{"scope": {"name": "agents.tracing"}, "spans": spans}],
+                }
+            ]
+        }
+
+    def _convert(self, record: dict[str, Any]) -> dict[str, Any]:
+        data = record.get("span_data") or {}
+        attributes = [
+            _attribute(f"agents.{key}", value)
+            for key, value in data.items()
+            if value is not None and key != "type"
+        ]
+        workflow = self._workflows.get(record["trace_id"])
+        if workflow:
+            attributes.append(_attribute("agents.workflow_name", workflow))
+        span: dict[str, Any] = {
+            "traceId": _otlp_id(record["trace_id"], 32),
+            "spanId": _otlp_id(record["id"], 16),
+            "name": data.get("name") or data.get("type") or "span",
+            "kind": 1,
+            "startTimeUnixNano": _unix_nano(record.get("started_at")),
+            "endTimeUnixNano": _unix_nano(record.get("ended_at")),
+            "attributes": [_attribute("agents.span_type", data.get("type", "")), *attributes],
+            "status": {"code": 0},
+        }
+        if record.get("parent_id"):
+            span["parentSpanId"] = _otlp_id(record["parent_id"], 16)
+        error = record.get("error")
+        if error:
+            span["status"] = {"code": 2, "message": error.get("message", "")}
+        return span
+
+
+class TracePipeline(TracingProcessor):
+    """A sampling, batching processor that writes to local sinks.
+
+    The hot path only makes the sampling decision and appends the span to a buffer. A worker
+    thread, started with the first item, wakes when a batch is full, after `flush_interval` or on
+    flush/shutdown, then exports each item once and hands the batch to every sink.
+
+    Sampling is decided per trace, so a trace is kept or dropped whole:
+
+    - `"head"`: a hash of the trace id is compared with `sample_rate` when the trace or span
+      arrives. Nothing is buffered for dropped traces.
+    - `"tail"`: spans are held until the trace ends. Traces with an errored span (when
+      `keep_errors`) or a span slower than `slow_span_threshold` seconds are always kept; the
+      rest are sampled like `"head"`. At most `max_trace_spans` spans are held per trace and
+      `max_pending_spans` in all; spans past either limit are dropped and counted in `dropped`,
+      and traces starting while `max_pending_spans` are held are sampled like `"head"`.
+
+    When more than `max_queue_size` items are waiting, new ones are dropped and counted in
+    `dropped`.
+    """
+
+    def __init__(
+        self,
+        sinks: list[TraceSink],
+        sample_rate: float = 1.0,
+        sampling: Literal["head", "tail"] = "head",
+        keep_errors: bool = True,
+        slow_span_threshold: float | None = None,
+        max_queue_size: int = 8192,
+        max_batch_size: int = 512,
+        flush_interval: float = 5.0,
+        max_trace_spans: int = 1000,
+        max_pending_spans: int = 8192,
+    ):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        if sampling not in ("head", "tail"):
+            raise ValueError(f"sampling must be 'head' or 'tail', got {sampling!r}")
+        self.sinks = list(sinks)
+        self.sample_rate = sample_rate
+        self.sampling = sampling
+        self.keep_errors = keep_errors
+        self.slow_span_threshold = slow_span_threshold
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_trace_spans = max_trace_spans
+        self.max_pending_spans = max_pending_spans
+
+        self._threshold = int(sample_rate * 2**32)
+        self._buffer: list[Trace | Span[Any]] = []
+        self._pending: dict[str, list[Trace | Span[Any]]] = {}
+        self._pending_size = 0
+        # Pending traces that must be kept for a span dropped over the limits
+        self._forced: set[str] = set()
+        self._pending_lock = threading.Lock()
+        self._cond = threading.Condition()
+        # Held while writing, so sinks see batches one at a time and in order
+        self._export_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._shutdown = False
+        self._flush_requested = False
+        self.dropped = 0
+
+    def _sampled(self, trace_id: str) -> bool:
+        if self._threshold >= 2**32:
+            return True
+        return zlib.crc32(trace_id.encode()) < self._threshold
+
+    def on_trace_start(self, trace: Trace) -> None:
+        if self.sampling == "tail":
+            with self._pending_lock:
+                if self._pending_size < self.max_pending_spans:
+                    self._pending[trace.trace_id] = [trace]
+                    self._pending_size += 1
+                    return
+        if self._sampled(trace.trace_id):
+            self._enqueue([trace])
+
+    def on_trace_end(self, trace: Trace) -> None:
+        if self.sampling != "tail":
+            return
+        with self._pending_lock:
+            items = self._pending.pop(trace.trace_id, None)
+            if items is None:
+                return
+            self._pending_size -= len(items)
+            forced = trace.trace_id in self._forced
+            self._forced.discard(trace.trace_id)
+        if forced or self._keep(trace.trace_id, items):
+            self._enqueue(items)
+
+    def on_span_start(self, span: Span[Any]) -> None:
+        pass
+
+    def on_span_end(self, span: Span[Any]) -> None:
+        if self.sampling == "tail":
+            with self._pending_lock:
+                pending = self._pending.get(span.trace_id)
+                if pending is not None:
+                    if (
+                        len(pending) <= self.max_trace_spans
+                        and self._pending_size < self.max_pending_spans
+                    ):
+                        pending.append(span)
+                        self._pending_size += 1
+                        return
+                    if self._notable(span):
+                        self._forced.add(span.trace_id)
+            if pending is not None:
+                with self._cond:
+                    self.dropped += 1
+                return
+        if self._sampled(span.trace_id):
+            self._enqueue([span])
+
+    def _keep(self, trace_id: str, items: list[Trace | Span[Any]]) -> bool:
+        if self._sampled(trace_id):
+            return True
+        return any(isinstance(item, Span) and self._notable(item) for item in items)
+
+    def _notable(self, span: Span[Any]) -> bool:
+        """Whether the span alone keeps its trace: it errored or was slow."""
+        if self.keep_errors and span.error:
+            return True
+        if self.slow_span_threshold is not None and span.started_at and span.ended_at:
+            duration = datetime.fromisoformat(span.ended_at) - datetime.fromisoformat(
+                span.started_at
+            )
+            if duration.total_seconds() >= self.slow_span_threshold:
+                return True
+        return False
+
+    def _enqueue(self, items: list[Trace | Span[Any]]) -> None:
+        with self._cond:
+            if self._shutdown:
+                return
+            room = self.max_queue_size - len(self._buffer)
+            if room < len(items):
+                self.dropped += len(items) - max(room, 0)
+                items = items[: max(room, 0)]
+            self._buffer.extend(items)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+            if len(self._buffer) >= self.max_batch_size:
+                self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._shutdown
+                    or self._flush_requested
+                    or len(self._buffer) >= self.max_batch_size,
+                    timeout=self.flush_interval,
+                )
+                self._flush_requested = False
+                done = self._shutdown
+            self._export_pending()
+            if done:
+                return
+
+    def _export_pending(self) -> None:
+        with self._export_lock:
+            with self._cond:
+                items, self._buffer = self._buffer, []
+            if not items:
+                return
+            records = [r for r in (item.export() for item in items) if r]
+            for start in range(0, len(records), self.max_batch_size):
+                batch = TraceBatch(records[start : start + self.max_batch_size])
+                for sink in self.sinks:
+                    try:
+                        sink.write(batch)
+                    except Exception as e:
+                        logger.error(f"Trace sink {sink} failed to write {len(batch)} items: {e}")
+
+    def force_flush(self) -> None:
+        """Writes everything buffered so far before returning."""
+        self._export_pending()
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Flushes the buffer, stops the worker and closes the sinks. Unfinished tail-sampled
+        traces are dropped."""
+        with self._cond:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            worker = self._worker
+            self._cond.notify()
+        if worker is not None:
+            worker.join(timeout=timeout)
+        self._export_pending()
+        with self._pending_lock:
+            self._pending.clear()
+            self._forced.clear()
+            self._pending_size = 0
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                logger.error(f"Error closing trace sink {sink}: {e}")
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    if not isinstance(value, str):
+        value = json.dumps(value, default=str)
+    return {"key": key, "value": {"stringValue": value}}
+
+
+def _otlp_id(value: str, width: int) -> str:
+    """Maps a `trace_...`/`span_...` id to the hex width OTLP expects."""
+    hex_part = value.partition("_")[2] or value
+    if len(hex_part) >= width:
+        try:
+            int(hex_part[:width], 16)
+            return hex_part[:width].lower()
+        except ValueError:
+            pass
+    return hashlib.sha256(value.encode()).hexdigest()[:width]
+
+
+def _unix_nano(timestamp: str | None) -> str:
+    if not timestamp:
+        return "0"
+    moment = datetime.fromisoformat(timestamp)
+    return str(int(moment.timestamp()) * 1_000_000_000 + moment.microsecond * 1000)
@@ -57,6 +57,8 @@ class BackendSpanExporter(TracingExporter):
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
+        # Set by close() to cut short a retry backoff
+        self._closed = threading.Event()
 
         # Keep a client open for connection pooling across multiple export calls
         self._client = httpx.Client(timeout=httpx.Timeout(timeout=60, connect=5.0))
@@ -78,7 +80,7 @@ class BackendSpanExporter(TracingExporter):
             logger.warning("OPENAI_API_KEY is not set, skipping trace export")
             return
 
-        data = [item.export() for item in items if item.export()]
+        data = [d for d in (item.export() for item in items) if d]
         payload = {"data": data}
 
         headers = {
@@ -120,20 +122,25 @@ class BackendSpanExporter(TracingExporter):
                 logger.error("Max retries reached, giving up on this batch.")
                 return
 
-            # Exponential backoff + jitter
+            # Exponential backoff + jitter, cut short by close()
             sleep_time = delay + random.uniform(0, 0.1 * delay)  # 10% jitter
-            time.sleep(sleep_time)
+            if self._closed.wait(sleep_time):
+                logger.warning("Exporter closed, giving up on this batch.")
+                return
             delay = min(delay * 2, self.max_delay)
 
     def close(self):
         """Close the underlying HTTP client."""
+        self._closed.set()
         self._client.close()
 
 
 class BatchTraceProcessor(TracingProcessor):
     """Some implementation notes:
     1. Using Queue, which is thread-safe.
-    2. Using a background thread to export spans, to minimize any performance issues.
+    2. Using a background thread to export spans, to minimize any performance issues. The
+       thread starts with the first queued item and sleeps until the queue reaches the export
+       trigger size, the schedule delay passes or shutdown is called.
     3. Spans are stored in memory until they are exported.
     """
 
@@ -169,14 +176,30 @@ class BatchTraceProcessor(TracingProcessor):
         # Track when we next *must* perform a scheduled export
         self._next_export_time = time.time() + self._schedule_delay
 
-        self._shutdown_event = threading.Event()
-        self._worker_thread = threading.Thread(target=self._run, daemon=True)
-        self._worker_thread.start()
+        # Set to wake the worker early: the queue is at the trigger size, or shutdown
+        self._wakeup = threading.Event()
+        self._worker_lock = threading.Lock()
+        self._worker_thread: threading.Thread | None = None
 
-    def on_trace_start(self, trace: Trace) -> None:
+    def _enqueue(self, item: Trace | Span[Any]) -> bool:
         try:
-            self._queue.put_nowait(trace)
+            self._queue.put_nowait(item)
         except queue.Full:
+            return False
+        if self._worker_thread is None:
+            self._start_worker()
+        if self._queue.qsize() >= self._export_trigger_size:
+            self._wakeup.set()
+        return True
+
+    def _start_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker_thread is None and not self._shutdown_event.is_set():
+                self._worker_thread = threading.Thread(target=self._run, daemon=True)
+                self._worker_thread.start()
+
+    def on_trace_start(self, trace: Trace) -> None:
+        if not self._enqueue(trace):
             logger.warning("Queue is full, dropping trace.")
 
     def on_trace_end(self, trace: Trace) -> None:
@@ -188,17 +211,21 @@ class BatchTraceProcessor(TracingProcessor):
         pass
 
     def on_span_end(self, span: Span[Any]) -> None:
-        try:
-            self._queue.put_nowait(span)
-        except queue.Full:
+        if not self._enqueue(span):
             logger.warning("Queue is full, dropping span.")
 
     def shutdown(self, timeout: float | None = None):
         """
         Called when the application stops. We signal our thread to stop, then join it.
         """
-        self._shutdown_event.set()
-        self._worker_thread.join(timeout=timeout)
+        with self._worker_lock:
+            self._shutdown_event.set()
+            worker = self._worker_thread
+        self._wakeup.set()
+        if worker is not None:
+            worker.join(timeout=timeout)
+        else:
+            self._export_batches(force=True)
 
     def force_flush(self):
         """
@@ -208,20 +235,17 @@ class BatchTraceProcessor(TracingProcessor):
 
     def _run(self):
         while not self._shutdown_event.is_set():
-            current_time = time.time()
-            queue_size = self._queue.qsize()
+            wait_time = self._next_export_time - time.time()
 
-            # If it's time for a scheduled flush or queue is above the trigger threshold
-            if (
-                current_time >= self._next_export_time
-                or queue_size >= self._export_trigger_size
-            ):
-                self._export_batches(force=False)
-                # Reset the next scheduled flush time
-                self._next_export_time = time.time() + self._schedule_delay
-            else:
-                # Sleep a short interval so we don't busy-wait.
-                time.sleep(0.2)
+            # Sleep until the scheduled flush unless the queue is above the trigger threshold
+            if wait_time > 0 and self._queue.qsize() < self._export_trigger_size:
+                self._wakeup.wait(wait_time)
+                self._wakeup.clear()
+                continue
+
+            self._export_batches(force=False)
+            # Reset the next scheduled flush time
+            self._next_export_time = time.time() + self._schedule_delay
 
         # Final drain after shutdown
         self._export_batches(force=True)
@@ -132,12 +132,12 @@ class TraceProvider:
         Create a new trace.
         """
         if self._disabled or disabled:
-            logger.debug(f"Tracing is disabled. Not creating trace {name}")
+            logger.debug("Tracing is disabled. Not creating trace %s", name)
             return NoOpTrace()
 
         trace_id = trace_id or util.gen_trace_id()
 
-        logger.debug(f"Creating trace {name} with id {trace_id}")
+        logger.debug("Creating trace %s with id %s", name, trace_id)
 
         return TraceImpl(
             name=name,
@@ -158,7 +158,7 @@ class TraceProvider:
         Create a new span.
         """
         if self._disabled or disabled:
-            logger.debug(f"Tracing is disabled. Not creating span {span_data}")
+            logger.debug("Tracing is disabled. Not creating span %s", span_data)
             return NoOpSpan(span_data)
 
         if not parent:
@@ -174,7 +174,7 @@ class TraceProvider:
                 current_span, NoOpSpan
             ):
                 logger.debug(
-                    f"Parent {current_span} or {current_trace} is no-op, returning NoOpSpan"
+                    "Parent %s or %s is no-op, returning NoOpSpan", current_span, current_trace
                 )
                 return NoOpSpan(span_data)
 
@@ -183,18 +183,18 @@ class TraceProvider:
 
         elif isinstance(parent, Trace):
             if isinstance(parent, NoOpTrace):
-                logger.debug(f"Parent {parent} is no-op, returning NoOpSpan")
+                logger.debug("Parent %s is no-op, returning NoOpSpan", parent)
                 return NoOpSpan(span_data)
             trace_id = parent.trace_id
             parent_id = None
         elif isinstance(parent, Span):
             if isinstance(parent, NoOpSpan):
-                logger.debug(f"Parent {parent} is no-op, returning NoOpSpan")
+                logger.debug("Parent %s is no-op, returning NoOpSpan", parent)
                 return NoOpSpan(span_data)
             parent_id = parent.span_id
             trace_id = parent.trace_id
 
-        logger.debug(f"Creating span {span_data} with id {span_id}")
+        logger.debug("Creating span %s with id %s", span_data, span_id)
 
         return SpanImpl(
             trace_id=trace_id,
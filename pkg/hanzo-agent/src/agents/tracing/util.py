@@ -1,4 +1,4 @@
-import uuid
+import os
 from datetime import datetime, timezone
 
 
@@ -9,9 +9,9 @@ def time_iso() -> str:
 
 def gen_trace_id() -> str:
     """Generates a new trace ID."""
-    return f"trace_{uuid.uuid4().hex}"
+    return f"trace_{os.urandom(16).hex()}"
 
 
 def gen_span_id() -> str:
     """Generates a new span ID."""
-    return f"span_{uuid.uuid4().hex[:24]}"
+    return f"span_{os.urandom(12).hex()}"
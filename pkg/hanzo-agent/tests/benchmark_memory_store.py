@@ -0,0 +1,107 @@
+"""In-memory agent stores at ``--entries`` entries: indexed vs scanning.
+
+* memory — `InMemoryMemoryStore` filled with memories spread over the
+  memory types and ``--agents`` agent names; times `list` (newest 10,
+  unfiltered and filtered) and `count`, against the previous copy, filter
+  and sort over every memory, kept below as ``scan_list``;
+* state  — `InMemoryStateStore` with the same number of keys in
+  ``--namespaces`` namespaces; times ``keys(namespace=...)`` against a
+  prefix scan of every key, and reports how many per-key locks remain
+  after an `update` of each key.
+
+    python tests/benchmark_memory_store.py [--entries 1000000] [--agents 100] [--namespaces 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agents.memory.store import InMemoryMemoryStore  # noqa: E402
+from agents.memory.types import MemoryType  # noqa: E402
+from agents.state.store import InMemoryStateStore  # noqa: E402
+
+TYPES = list(MemoryType)
+LOOP = asyncio.new_event_loop()
+
+
+def scan_list(store, type=None, agent_name=None, limit=None):
+    memories = list(store.memories.values())
+    if type:
+        memories = [m for m in memories if m.type == type]
+    if agent_name:
+        memories = [m for m in memories if m.agent_name == agent_name]
+    memories.sort(key=lambda m: m.timestamp, reverse=True)
+    return memories[:limit] if limit else memories
+
+
+def scan_keys(store, namespace):
+    prefix = f"{namespace}:"
+    return [k[len(prefix) :] for k in store._data if k.startswith(prefix)]
+
+
+def timed(fn, *args, repeat=5, **kwargs):
+    out = None
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        out = fn(*args, **kwargs)
+        if asyncio.iscoroutine(out):
+            out = LOOP.run_until_complete(out)
+    return out, (time.perf_counter() - t0) / repeat
+
+
+def row(name, indexed, scanned, same):
+    print(f"{name:>28}{indexed * 1e3:>11.3f} ms{scanned * 1e3:>11.1f} ms  {'same' if same else 'DIFFERENT'}")
+
+
+async def fill(store, entries, agents):
+    for i in range(entries):
+        await store.add(f"memory {i}", TYPES[i % len(TYPES)], agent_name=f"agent{i % agents}")
+
+
+async def fill_state(store, entries, namespaces):
+    for i in range(entries):
+        await store.set(f"key{i}", i, namespace=f"ns{i % namespaces}")
+    for i in range(0, entries, 100):
+        await store.increment(f"key{i}", namespace=f"ns{i % namespaces}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--namespaces", type=int, default=1000)
+    args = parser.parse_args()
+
+    store = InMemoryMemoryStore()
+    _, t = timed(fill, store, args.entries, args.agents, repeat=1)
+    print(f"added {args.entries} memories in {t:.1f} s")
+    print(f"{'':>28}{'indexed':>14}{'scan':>14}")
+    for name, kwargs in (
+        ("list(limit=10)", {"limit": 10}),
+        ("list(type, limit=10)", {"type": MemoryType.FACT, "limit": 10}),
+        ("list(type, agent, limit=10)", {"type": MemoryType.FACT, "agent_name": "agent7", "limit": 10}),
+    ):
+        out, t = timed(store.list, **kwargs)
+        ref, t_ref = timed(scan_list, store, repeat=1, **kwargs)
+        row(name, t, t_ref, [m.id for m in out] == [m.id for m in ref])
+    out, t = timed(store.count, agent_name="agent7")
+    ref, t_ref = timed(lambda: len(scan_list(store, agent_name="agent7")), repeat=1)
+    row("count(agent)", t, t_ref, out == ref)
+    del store
+
+    state = InMemoryStateStore()
+    _, t = timed(fill_state, state, args.entries, args.namespaces, repeat=1)
+    print(f"set {args.entries} keys in {t:.1f} s, {len(state._locks)} locks left")
+    out, t = timed(state.keys, namespace="ns7")
+    ref, t_ref = timed(scan_keys, state, "ns7", repeat=1)
+    row("keys(namespace)", t, t_ref, out == ref)
+
+
+if __name__ == "__main__":
+    main()
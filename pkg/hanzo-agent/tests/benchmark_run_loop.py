@@ -0,0 +1,206 @@
+"""Agent run loop cost over long, tool-heavy runs against a local fake model.
+
+Runs `Runner.run` with `OpenAIChatCompletionsModel` on a fake client that
+answers ``--turns - 1`` times with ``--calls`` parallel tool calls and then
+with a final message, so the history grows by ``2 * --calls + 1`` items a
+turn. Compares the incremental conversation buffer with the previous per-turn
+rebuild, patched in below: every turn copied the input, converted every item
+and tool again, rebuilt the output schema and handoffs, and formatted the
+messages for a debug log that was usually disabled. Checks that both send the
+same messages on the last turn.
+
+    python tests/benchmark_run_loop.py [--turns 200] [--calls 3] [--tools 20] [--runs 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from openai.types.chat.chat_completion import ChatCompletion, Choice
+from openai.types.chat.chat_completion_message import ChatCompletionMessage
+from openai.types.chat.chat_completion_message_tool_call import (
+    ChatCompletionMessageToolCall,
+    Function,
+)
+from openai.types.completion_usage import CompletionUsage
+from pydantic import BaseModel
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agents import (  # noqa: E402
+    Agent,
+    OpenAIChatCompletionsModel,
+    RunConfig,
+    Runner,
+    function_tool,
+)
+from agents.agent_output import AgentOutputSchema  # noqa: E402
+from agents.handoffs import Handoff, handoff  # noqa: E402
+from agents.items import ConversationBuffer, ConversationHistory, ItemHelpers  # noqa: E402
+from agents.models.openai_chatcompletions import ToolConverter, _Converter  # noqa: E402
+
+
+class Report(BaseModel):
+    summary: str
+    sources: list[str]
+
+
+class FakeCompletions:
+    def __init__(self, turns: int, calls: int, tools: int) -> None:
+        self.turns, self.calls, self.tools = turns, calls, tools
+        self.turn = 0
+        self.last_messages: list[Any] = []
+
+    async def create(self, **kwargs: Any) -> ChatCompletion:
+        self.turn += 1
+        self.last_messages = kwargs["messages"]
+        if self.turn < self.turns:
+            message = ChatCompletionMessage(
+                role="assistant",
+                content=None,
+                tool_calls=[
+                    ChatCompletionMessageToolCall(
+                        id=f"call_{self.turn}_{i}",
+                        type="function",
+                        function=Function(
+                            name=f"tool_{(self.turn + i) % self.tools}",
+                            arguments=json.dumps({"query": f"q{self.turn}", "limit": i}),
+                        ),
+                    )
+                    for i in range(self.calls)
+                ],
+            )
+        else:
+            report = {"summary": "done", "sources": ["a", "b"]}
+            message = ChatCompletionMessage(role="assistant", content=json.dumps(report))
+        return ChatCompletion(
+            id="fake",
+            created=0,
+            model="fake",
+            object="chat.completion",
+            choices=[Choice(index=0, finish_reason="stop", message=message)],
+            usage=CompletionUsage(completion_tokens=10, prompt_tokens=100, total_tokens=110),
+        )
+
+
+class FakeClient:
+    def __init__(self, completions: FakeCompletions) -> None:
+        self.chat = type("_Chat", (), {"completions": completions})()
+        self.base_url = httpx.URL("http://fake")
+
+
+def make_tool(index: int):
+    def lookup(query: str, limit: int = 5) -> str:
+        return f"{index}:{query}:" + "result " * 30
+
+    return function_tool(lookup, name_override=f"tool_{index}")
+
+
+def reference_update(self, original_input, generated_items) -> ConversationHistory:
+    items = ItemHelpers.input_to_new_input_list(original_input)
+    items.extend(item.to_input_item() for item in generated_items)
+    return ConversationHistory(items, {})
+
+
+def reference_messages(cls, items):
+    messages = cls.items_to_messages(items)
+    json.dumps(messages, indent=2)
+    return messages
+
+
+def reference_tools(cls, tools, handoffs, cache=None):
+    converted = [cls.to_openai(tool) for tool in tools] + [
+        cls.convert_handoff_tool(h) for h in handoffs
+    ]
+    json.dumps(converted, indent=2)
+    return converted
+
+
+def reference_output_schema(cls, agent):
+    if agent.output_type is None or agent.output_type is str:
+        return None
+    return AgentOutputSchema(agent.output_type)
+
+
+def reference_handoffs(cls, agent) -> list[Handoff]:
+    return [h if isinstance(h, Handoff) else handoff(h) for h in agent.handoffs]
+
+
+@contextlib.contextmanager
+def before():
+    patches = [
+        (ConversationBuffer, "update", reference_update),
+        (_Converter, "history_to_messages", classmethod(reference_messages)),
+        (ToolConverter, "convert_tools", classmethod(reference_tools)),
+        (Runner, "_get_output_schema", classmethod(reference_output_schema)),
+        (Runner, "_get_handoffs", classmethod(reference_handoffs)),
+    ]
+    saved = [(owner, name, owner.__dict__[name]) for owner, name, _ in patches]
+    for owner, name, value in patches:
+        setattr(owner, name, value)
+    try:
+        yield
+    finally:
+        for owner, name, value in saved:
+            setattr(owner, name, value)
+
+
+async def run_once(args: argparse.Namespace) -> tuple[float, list[Any]]:
+    completions = FakeCompletions(args.turns, args.calls, args.tools)
+    model = OpenAIChatCompletionsModel("fake", FakeClient(completions))  # type: ignore[arg-type]
+    agent = Agent(
+        name="researcher",
+        instructions="Research the question with the tools.",
+        model=model,
+        tools=[make_tool(i) for i in range(args.tools)],
+        handoffs=[Agent(name="writer"), Agent(name="reviewer")],
+        output_type=Report,
+    )
+    start = time.perf_counter()
+    result = await Runner.run(
+        agent,
+        "Compare the options.",
+        max_turns=args.turns + 1,
+        run_config=RunConfig(tracing_disabled=True),
+    )
+    elapsed = time.perf_counter() - start
+    assert result.final_output == Report(summary="done", sources=["a", "b"])
+    return elapsed, completions.last_messages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=3)
+    parser.add_argument("--tools", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    timings: dict[str, float] = {}
+    last: dict[str, list[Any]] = {}
+    for name in ("before", "after"):
+        with before() if name == "before" else contextlib.nullcontext():
+            runs = [loop.run_until_complete(run_once(args)) for _ in range(args.runs)]
+        timings[name] = min(t for t, _ in runs)
+        last[name] = runs[-1][1]
+
+    items = len(last["after"])
+    print(f"{args.turns} turns, {args.calls} tool calls a turn, {items} messages on the last turn")
+    for name, elapsed in timings.items():
+        print(f"{name:>8}{elapsed:>8.2f} s/run{elapsed / args.turns * 1e3:>8.2f} ms/turn")
+    same = last["before"] == last["after"]
+    print(f"speedup {timings['before'] / timings['after']:.1f}x, last-turn messages "
+          f"{'identical' if same else 'DIFFERENT'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Per-span tracing overhead: disabled, `BatchTraceProcessor` and `TracePipeline`.
+
+Runs ``--traces`` traces of ``--spans`` function spans each through the
+global trace provider and reports, per span, the time spent in the traced
+code (``hot path``) and the time until everything has been handed to the
+exporter or sinks (``total``, including `force_flush`). Configurations:
+
+* disabled     — `set_tracing_disabled(True)`;
+* batch        — `BatchTraceProcessor` with an exporter that only calls
+                 ``export()`` on each item, as `BackendSpanExporter` does;
+* pipeline     — `TracePipeline` into a sink that discards batches, into a
+                 gzip `JsonlFileSink` and into an `OtlpBufferSink`, then with
+                 head and tail sampling at 10%.
+
+    python tests/benchmark_tracing.py [--traces 2000] [--spans 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agents.tracing import (  # noqa: E402
+    custom_span,
+    set_trace_processors,
+    set_tracing_disabled,
+    trace,
+)
+from agents.tracing.pipeline import (  # noqa: E402
+    JsonlFileSink,
+    OtlpBufferSink,
+    TraceBatch,
+    TracePipeline,
+    TraceSink,
+)
+from agents.tracing.processor_interface import TracingExporter  # noqa: E402
+from agents.tracing.processors import BatchTraceProcessor  # noqa: E402
+
+
+class ExportOnly(TracingExporter):
+    def export(self, items: list[Any]) -> None:
+        [d for d in (item.export() for item in items) if d]
+
+
+class Discard(TraceSink):
+    def write(self, batch: TraceBatch) -> None:
+        pass
+
+
+def run(traces: int, spans: int) -> None:
+    for i in range(traces):
+        with trace("benchmark", metadata={"run": str(i)}):
+            for j in range(spans):
+                with custom_span("step", {"index": j, "payload": "x" * 64}):
+                    pass
+
+
+def measure(processor, traces: int, spans: int) -> tuple[float, float]:
+    set_tracing_disabled(processor is None)
+    set_trace_processors([processor] if processor else [])
+    start = time.perf_counter()
+    run(traces, spans)
+    hot = time.perf_counter() - start
+    if processor:
+        processor.force_flush()
+    total = time.perf_counter() - start
+    if processor:
+        processor.shutdown()
+    per_span = 1e6 / (traces * spans)
+    return hot * per_span, total * per_span
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--traces", type=int, default=2000)
+    parser.add_argument("--spans", type=int, default=10)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    configs = [
+        ("disabled", lambda: None),
+        ("batch", lambda: BatchTraceProcessor(ExportOnly())),
+        ("pipeline", lambda: TracePipeline([Discard()])),
+        ("pipeline jsonl.gz", lambda: TracePipeline([JsonlFileSink(tmp / "traces.jsonl.gz")])),
+        ("pipeline otlp", lambda: TracePipeline([OtlpBufferSink(max_spans=1000)])),
+        ("head 10%", lambda: TracePipeline([JsonlFileSink(tmp / "head.jsonl.gz")], 0.1)),
+        (
+            "tail 10%",
+            lambda: TracePipeline([JsonlFileSink(tmp / "tail.jsonl.gz")], 0.1, sampling="tail"),
+        ),
+    ]
+    run(10, args.spans)  # warm up
+    print(f"{'config':>18}{'hot path':>14}{'total':>14}")
+    for name, make in configs:
+        hot, total = measure(make(), args.traces, args.spans)
+        print(f"{name:>18}{hot:>9.2f} us/span{total:>9.2f} us/span")
+    set_trace_processors([])
+    size = sum(p.stat().st_size for p in tmp.iterdir() if p.name.startswith("traces"))
+    print(f"jsonl.gz: {size / (args.traces * (args.spans + 1)):.0f} bytes per item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Workflow makespan on synthetic DAGs: level-by-level barriers vs the ready-queue scheduler.
+
+Builds a random layered DAG of ``--layers`` x ``--width`` agent steps, each
+depending on up to ``--fan-in`` steps of the layer above, with lognormal step
+durations (``--unit`` seconds on median) served by a fake network that just
+sleeps. Runs it:
+
+* levels       — the previous executor, reproduced below: `get_execution_order`
+                 batches behind an `asyncio.gather` barrier, so each level
+                 takes as long as its slowest step;
+* ready queue  — `WorkflowExecutor`, which starts each step when its
+                 dependencies finish;
+* capped       — both scheduler orderings under ``--cap`` concurrent steps,
+                 critical-path-first and plain insertion order (FIFO).
+
+and compares each makespan with the critical path. Also times the previous
+quadratic `get_execution_order` against the current one on ``--order-steps``
+steps.
+
+    python tests/benchmark_workflow.py [--layers 8] [--width 12] [--fan-in 3] [--unit 0.02] [--cap 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agents.exceptions import AgentsException  # noqa: E402
+from agents.orchestration import Workflow, WorkflowExecutor, WorkflowStep  # noqa: E402
+from agents.orchestration.executor import ExecutionContext  # noqa: E402
+from agents.tracing import set_tracing_disabled  # noqa: E402
+
+
+class FakeResult:
+    def __init__(self, final_output: Any):
+        self.final_output = final_output
+
+
+class SleepNetwork:
+    def __init__(self, durations: dict[str, float]):
+        self.durations = durations
+
+    async def run(self, input: Any, starting_agent: str, context: Any = None) -> FakeResult:
+        await asyncio.sleep(self.durations[starting_agent])
+        return FakeResult(starting_agent)
+
+
+def build(layers: int, width: int, fan_in: int, unit: float, seed: int) -> Workflow:
+    rng = random.Random(seed)
+    workflow = Workflow("benchmark")
+    previous: list[str] = []
+    for layer in range(layers):
+        current = []
+        for i in range(width):
+            step_id = f"s{layer}_{i}"
+            deps = rng.sample(previous, min(len(previous), rng.randint(1, fan_in)))
+            duration = unit * rng.lognormvariate(0, 0.8)
+            workflow.add_step(
+                WorkflowStep(
+                    id=step_id,
+                    config={"agent_name": step_id},
+                    depends_on=deps,
+                    estimated_duration=duration,
+                )
+            )
+            current.append(step_id)
+        previous = current
+    return workflow
+
+
+def reference_execution_order(workflow: Workflow) -> list[list[str]]:
+    visited = set()
+    in_degree = {step_id: len(step.depends_on) for step_id, step in workflow.steps.items()}
+    batches = []
+    while len(visited) < len(workflow.steps):
+        batch = []
+        for step_id, degree in in_degree.items():
+            if step_id not in visited and degree == 0:
+                batch.append(step_id)
+                visited.add(step_id)
+        if not batch:
+            raise AgentsException("Circular dependency detected in workflow")
+        batches.append(batch)
+        for step_id in batch:
+            for other_id, other_step in workflow.steps.items():
+                if step_id in other_step.depends_on:
+                    in_degree[other_id] -= 1
+    return batches
+
+
+async def run_levels(executor: WorkflowExecutor) -> None:
+    context = ExecutionContext(input="go", context=None, executor=executor)
+    for batch in reference_execution_order(executor.workflow):
+        await asyncio.gather(
+            *(executor._execute_step(executor.workflow.steps[s], context, None) for s in batch),
+            return_exceptions=True,
+        )
+
+
+async def makespan(workflow: Workflow, network: SleepNetwork, mode: str, cap: int | None) -> float:
+    executor = WorkflowExecutor(
+        workflow,
+        network,  # type: ignore[arg-type]
+        max_concurrency=cap,
+        critical_path_first=mode != "fifo",
+    )
+    start = time.perf_counter()
+    if mode == "levels":
+        await run_levels(executor)
+    else:
+        result = await executor.execute("go")
+        assert result.success and result.steps_completed == len(workflow.steps)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layers", type=int, default=8)
+    parser.add_argument("--width", type=int, default=12)
+    parser.add_argument("--fan-in", type=int, default=3)
+    parser.add_argument("--unit", type=float, default=0.02)
+    parser.add_argument("--cap", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--order-steps", type=int, default=2000)
+    args = parser.parse_args()
+
+    set_tracing_disabled(True)
+    workflow = build(args.layers, args.width, args.fan_in, args.unit, args.seed)
+    durations = {step_id: step.estimated_duration for step_id, step in workflow.steps.items()}
+    network = SleepNetwork(durations)
+    critical = max(workflow.critical_path_lengths().values())
+    total = sum(durations.values())
+    print(f"{len(workflow.steps)} steps, critical path {critical:.2f} s, total work {total:.2f} s")
+
+    loop = asyncio.new_event_loop()
+    runs = [
+        ("levels", "levels", None),
+        ("ready queue", "critical", None),
+        (f"cap {args.cap} critical", "critical", args.cap),
+        (f"cap {args.cap} fifo", "fifo", args.cap),
+    ]
+    print(f"{'schedule':>18}{'makespan':>12}{'/ critical':>12}")
+    for name, mode, cap in runs:
+        elapsed = loop.run_until_complete(makespan(workflow, network, mode, cap))
+        print(f"{name:>18}{elapsed:>10.2f} s{elapsed / critical:>11.2f}x")
+
+    large = build(args.order_steps // args.width, args.width, args.fan_in, 1.0, args.seed)
+    assert reference_execution_order(large) == large.get_execution_order()
+    for name, order in (("before", reference_execution_order), ("after", Workflow.get_execution_order)):
+        start = time.perf_counter()
+        order(large)
+        print(f"get_execution_order {name:>6} {(time.perf_counter() - start) * 1e3:>9.1f} ms "
+              f"({len(large.steps)} steps)")
+
+
+if __name__ == "__main__":
+    main()
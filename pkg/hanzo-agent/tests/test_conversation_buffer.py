@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from agents import Agent, Handoff, MessageOutputItem, Runner, TResponseInputItem
+from agents.items import ConversationBuffer, ConversationHistory
+from agents.models.openai_chatcompletions import ToolConverter, _Converter
+
+from .fake_model import FakeModel
+from .test_responses import get_function_tool, get_text_input_item, get_text_message
+
+
+def _message_items(agent: Agent[Any], *texts: str) -> list[MessageOutputItem]:
+    return [MessageOutputItem(agent=agent, raw_item=get_text_message(t)) for t in texts]
+
+
+def test_buffer_converts_each_item_once(monkeypatch) -> None:
+    calls = 0
+    original = MessageOutputItem.to_input_item
+
+    def counting(self: MessageOutputItem) -> TResponseInputItem:
+        nonlocal calls
+        calls += 1
+        return original(self)
+
+    monkeypatch.setattr(MessageOutputItem, "to_input_item", counting)
+    agent = Agent(name="test")
+    items = _message_items(agent, "one", "two", "three")
+    buffer = ConversationBuffer()
+
+    first = buffer.update("hello", items[:1])
+    second = buffer.update("hello", items[:2])
+    third = buffer.update("hello", items)
+
+    assert calls == 3
+    assert first == [{"content": "hello", "role": "user"}, items[0].to_input_item()]
+    assert len(second) == 3 and len(third) == 4
+    # Each turn gets its own list, sharing one cache
+    assert first is not second and len(first) == 2
+    assert first.cache is second.cache is third.cache
+
+
+def test_buffer_rebuilds_when_history_is_rewritten() -> None:
+    agent = Agent(name="test")
+    items = _message_items(agent, "one", "two")
+    original_input: list[TResponseInputItem] = [{"content": "hello", "role": "user"}]
+    buffer = ConversationBuffer()
+    before = buffer.update(original_input, items)
+
+    # A handoff input filter dropped the first item
+    after = buffer.update(original_input, items[1:])
+    assert after == [original_input[0], items[1].to_input_item()]
+    assert after.cache is not before.cache
+
+    replaced = buffer.update([{"content": "bye", "role": "user"}], items[1:])
+    assert replaced[0]["content"] == "bye"  # type: ignore[typeddict-item]
+    assert replaced.cache is not after.cache
+
+
+def test_history_to_messages_matches_full_conversion() -> None:
+    items: list[TResponseInputItem] = [
+        {"role": "user", "content": "plan a trip"},
+        {"type": "function_call", "call_id": "c1", "name": "weather", "arguments": "{}"},
+        {"type": "function_call", "call_id": "c2", "name": "flights", "arguments": "{}"},
+        {"type": "function_call_output", "call_id": "c1", "output": "sunny"},
+        {"type": "function_call_output", "call_id": "c2", "output": "3 flights"},
+        {
+            "id": "m1",
+            "type": "message",
+            "role": "assistant",
+            "status": "completed",
+            "content": [{"type": "output_text", "text": "booking", "annotations": []}],
+        },
+        {"type": "function_call", "call_id": "c3", "name": "book", "arguments": "{}"},
+        {"type": "function_call_output", "call_id": "c3", "output": "done"},
+        {"role": "user", "content": "thanks"},
+    ]
+    cache: dict[str, Any] = {}
+    for end in range(1, len(items) + 1):
+        history = ConversationHistory(items[:end], cache)
+        assert _Converter.history_to_messages(history) == _Converter.items_to_messages(
+            items[:end]
+        )
+    assert cache["chat_messages"].count == len(items)
+
+    # A shorter history than the cache has seen starts over
+    assert _Converter.history_to_messages(
+        ConversationHistory(items[:2], cache)
+    ) == _Converter.items_to_messages(items[:2])
+
+
+def test_convert_tools_reuses_cached_schemas() -> None:
+    tool = get_function_tool("lookup")
+    target = Agent(name="target")
+    handoffs = Runner._get_handoffs(Agent(name="source", handoffs=[target]))
+    cache: dict[int, tuple[Any, Any]] = {}
+
+    first = ToolConverter.convert_tools([tool], handoffs, cache)
+    second = ToolConverter.convert_tools([tool], handoffs, cache)
+    assert [t["function"]["name"] for t in first] == ["lookup", handoffs[0].tool_name]
+    assert all(a is b for a, b in zip(first, second))
+    assert ToolConverter.convert_tools([tool], handoffs) == first
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class OtherAnswer(BaseModel):
+    text: str
+
+
+def test_runner_memoizes_schemas_per_agent() -> None:
+    agent_2 = Agent(name="agent_2")
+    agent_3 = Agent(name="agent_3")
+    agent = Agent(name="agent_1", handoffs=[agent_2], output_type=Answer)
+
+    schema = Runner._get_output_schema(agent)
+    assert Runner._get_output_schema(agent) is schema
+    handoffs = Runner._get_handoffs(agent)
+    assert all(a is b for a, b in zip(Runner._get_handoffs(agent), handoffs))
+
+    agent.handoffs.append(agent_3)
+    assert [h.agent_name for h in Runner._get_handoffs(agent)] == ["agent_2", "agent_3"]
+    agent.output_type = OtherAnswer
+    new_schema = Runner._get_output_schema(agent)
+    assert new_schema is not schema and new_schema.output_type is OtherAnswer
+    assert isinstance(Runner._get_handoffs(agent)[0], Handoff)
+
+
+def test_handoffs_are_rebuilt_when_the_target_agent_changes() -> None:
+    target = Agent(name="billing", handoff_description="Pays bills")
+    agent = Agent(name="triage", handoffs=[target])
+    assert Runner._get_handoffs(agent)[0].tool_name == "transfer_to_billing"
+
+    target.name = "refunds"
+    target.handoff_description = "Refunds bills"
+    handoff = Runner._get_handoffs(agent)[0]
+    assert handoff.tool_name == "transfer_to_refunds" and handoff.agent_name == "refunds"
+    assert "Refunds bills" in handoff.tool_description
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_share_items_with_the_caller() -> None:
+    model = FakeModel()
+    agent = Agent(name="test", model=model)
+    model.set_next_output([get_text_message("done")])
+    items = [get_text_input_item("hello")]
+
+    result = await Runner.run(agent, input=items)
+    items[0]["content"] = "changed afterwards"
+    assert result.input == [get_text_input_item("hello")]
+    assert result.to_input_list()[0] == get_text_input_item("hello")
@@ -0,0 +1,56 @@
+import pytest
+
+from agents.memory.store import InMemoryMemoryStore
+from agents.memory.types import MemoryType
+
+
+async def _add(store, content, type=MemoryType.FACT, agent=None, ts=0.0, **kwargs):
+    memory = await store.add(content, type, agent_name=agent, **kwargs)
+    memory.timestamp = ts
+    await store.update(memory)
+    return memory
+
+
+@pytest.mark.asyncio
+async def test_list_filters_newest_first():
+    store = InMemoryMemoryStore()
+    await _add(store, "a", agent="x", ts=1.0)
+    await _add(store, "b", MemoryType.EPISODE, agent="y", ts=3.0)
+    await _add(store, "c", agent="y", ts=2.0, importance=0.2)
+    await _add(store, "d", ts=2.0)
+
+    def contents(memories):
+        return [m.content for m in memories]
+
+    # Equal timestamps keep insertion order
+    assert contents(await store.list()) == ["b", "c", "d", "a"]
+    assert contents(await store.list(limit=2)) == ["b", "c"]
+    assert contents(await store.list(type=MemoryType.FACT)) == ["c", "d", "a"]
+    assert contents(await store.list(agent_name="y")) == ["b", "c"]
+    assert contents(await store.list(type=MemoryType.FACT, agent_name="y")) == ["c"]
+    assert contents(await store.list(min_importance=0.5)) == ["b", "d", "a"]
+    assert await store.list(type=MemoryType.WORKING) == []
+    assert await store.count() == 4
+    assert await store.count(type=MemoryType.FACT, agent_name="y") == 1
+    assert await store.count(agent_name="nobody") == 0
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_reindex():
+    store = InMemoryMemoryStore()
+    first = await _add(store, "first", agent="x", ts=1.0, embedding=[1.0, 0.0])
+    second = await _add(store, "second", agent="x", ts=2.0)
+
+    first.timestamp = 5.0
+    first.agent_name = "z"
+    first.embedding = None
+    await store.update(first)
+    assert [m.content for m in await store.list()] == ["first", "second"]
+    assert await store.count(agent_name="x") == 1
+    assert await store.count(agent_name="z") == 1
+    assert await store.search_by_embedding([1.0, 0.0]) == []
+
+    await store.delete(second.id)
+    await store.delete(second.id)
+    assert await store.count(agent_name="x") == 0
+    assert [m.content for m in await store.list()] == ["first"]
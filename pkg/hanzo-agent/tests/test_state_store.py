@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from agents.state.store import InMemoryStateStore
+
+
+@pytest.mark.asyncio
+async def test_keys_by_namespace():
+    store = InMemoryStateStore()
+    await store.set("k1", 1, namespace="a")
+    await store.set("k2", 2, namespace="a:b")
+    await store.set("k3", 3, namespace="ab")
+    await store.set("plain", 4)
+    await store.set("k1", 5, namespace="a")
+
+    assert await store.keys(namespace="a") == ["k1", "b:k2"]
+    assert await store.keys(namespace="a:b") == ["k2"]
+    assert await store.keys("k", namespace="a") == ["k1", "b:k2"]
+    assert await store.keys("2") == ["a:b:k2"]
+    assert await store.keys(namespace="missing") == []
+
+    await store.namespace("a").clear()
+    assert await store.keys(namespace="a") == []
+    assert await store.keys() == ["ab:k3", "plain"]
+
+
+@pytest.mark.asyncio
+async def test_update_locks_are_released():
+    store = InMemoryStateStore()
+
+    async def slow_increment():
+        async def inc():
+            value = await store.get("n")
+            await asyncio.sleep(0)
+            await store.set("n", (value or 0) + 1)
+
+        async with store._locked("n"):
+            await inc()
+
+    await asyncio.gather(*(slow_increment() for _ in range(20)))
+    assert await store.get("n") == 20
+    await asyncio.gather(*(store.increment(f"c{i}") for i in range(100)))
+    assert store._locks == {}
@@ -0,0 +1,274 @@
+import gzip
+import json
+import threading
+
+import pytest
+
+from agents.tracing.pipeline import (
+    JsonlFileSink,
+    OtlpBufferSink,
+    TraceBatch,
+    TracePipeline,
+    TraceSink,
+)
+from agents.tracing.span_data import AgentSpanData, FunctionSpanData
+from agents.tracing.spans import SpanImpl
+from agents.tracing.traces import TraceImpl
+
+
+class ListSink(TraceSink):
+    def __init__(self):
+        self.batches: list[TraceBatch] = []
+        self.closed = False
+
+    def write(self, batch: TraceBatch) -> None:
+        self.batches.append(batch)
+
+    def close(self) -> None:
+        self.closed = True
+
+    @property
+    def records(self) -> list[dict]:
+        return [r for b in self.batches for r in b.records]
+
+
+def start_trace(pipeline: TracePipeline, trace_id: str) -> TraceImpl:
+    trace = TraceImpl(
+        name="workflow", trace_id=trace_id, group_id=None, metadata=None, processor=pipeline
+    )
+    trace.start()
+    return trace
+
+
+def run_span(pipeline: TracePipeline, trace_id: str, i: int, error: bool = False):
+    span = SpanImpl(
+        trace_id=trace_id,
+        span_id=f"span_{i:024x}",
+        parent_id=None,
+        processor=pipeline,
+        span_data=FunctionSpanData(name=f"tool{i}", input="{}", output="ok"),
+    )
+    span.start()
+    if error:
+        span.set_error({"message": "boom", "data": None})
+    span.finish()
+
+
+def run_trace(pipeline: TracePipeline, trace_id: str, spans: int = 2, error: bool = False):
+    trace = start_trace(pipeline, trace_id)
+    for i in range(spans):
+        run_span(pipeline, trace_id, i, error=error and i == 0)
+    trace.finish()
+
+
+def trace_ids(n: int) -> list[str]:
+    return [f"trace_{i:032x}" for i in range(n)]
+
+
+def test_worker_starts_lazily_and_flushes_on_shutdown():
+    sink = ListSink()
+    pipeline = TracePipeline([sink], flush_interval=60)
+    assert pipeline._worker is None
+
+    run_trace(pipeline, trace_ids(1)[0])
+    assert pipeline._worker is not None
+    pipeline.shutdown()
+
+    assert [r["object"] for r in sink.records] == ["trace", "trace.span", "trace.span"]
+    assert sink.closed
+    assert not pipeline._worker.is_alive()
+
+
+def test_full_batch_wakes_worker():
+    written = threading.Event()
+
+    class Sink(ListSink):
+        def write(self, batch):
+            super().write(batch)
+            written.set()
+
+    sink = Sink()
+    pipeline = TracePipeline([sink], max_batch_size=3, flush_interval=60)
+    run_trace(pipeline, trace_ids(1)[0], spans=2)
+    assert written.wait(5)
+    assert len(sink.batches[0]) == 3
+    pipeline.shutdown()
+
+
+def test_force_flush_writes_buffered_items():
+    sink = ListSink()
+    pipeline = TracePipeline([sink], flush_interval=60)
+    run_trace(pipeline, trace_ids(1)[0], spans=1)
+    pipeline.force_flush()
+    assert len(sink.records) == 2
+    pipeline.shutdown()
+
+
+def test_head_sampling_keeps_whole_traces():
+    sink = ListSink()
+    pipeline = TracePipeline([sink], sample_rate=0.25, flush_interval=60)
+    ids = trace_ids(400)
+    for trace_id in ids:
+        run_trace(pipeline, trace_id)
+    pipeline.shutdown()
+
+    kept: dict[str, int] = {}
+    for record in sink.records:
+        trace_id = record["id"] if record["object"] == "trace" else record["trace_id"]
+        kept[trace_id] = kept.get(trace_id, 0) + 1
+    assert set(kept.values()) == {3}
+    assert 60 < len(kept) < 140
+
+
+def test_tail_sampling_keeps_errored_traces():
+    sink = ListSink()
+    pipeline = TracePipeline([sink], sample_rate=0.0, sampling="tail", flush_interval=60)
+    ok, failed = trace_ids(2)
+    run_trace(pipeline, ok)
+    run_trace(pipeline, failed, error=True)
+    pipeline.shutdown()
+
+    assert {r["trace_id"] for r in sink.records if r["object"] == "trace.span"} == {failed}
+    assert len(sink.records) == 3
+    assert not pipeline._pending
+
+
+def test_tail_sampling_bounds_pending_spans():
+    sink = ListSink()
+    pipeline = TracePipeline(
+        [sink], sample_rate=0.0, sampling="tail", flush_interval=60, max_trace_spans=2
+    )
+    # The errored span comes after the limit, yet the trace is still kept.
+    trace_id = trace_ids(1)[0]
+    trace = start_trace(pipeline, trace_id)
+    for i in range(4):
+        run_span(pipeline, trace_id, i, error=i == 3)
+    trace.finish()
+    pipeline.shutdown()
+    assert len(sink.records) == 3
+    assert pipeline.dropped == 2
+
+    # Past max_pending_spans, spans are dropped and new traces are head sampled.
+    sink = ListSink()
+    pipeline = TracePipeline([sink], sampling="tail", flush_interval=60, max_pending_spans=4)
+    held, overflow = trace_ids(2)
+    trace = start_trace(pipeline, held)
+    for i in range(5):
+        run_span(pipeline, held, i)
+    assert pipeline.dropped == 2
+    run_trace(pipeline, overflow, spans=5)
+    assert pipeline.dropped == 2
+    assert len(pipeline._pending) == 1 and pipeline._pending_size == 4
+    trace.finish()
+    assert pipeline._pending_size == 0
+    pipeline.shutdown()
+    assert len(sink.records) == 6 + 4
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        TracePipeline([], sample_rate=1.5)
+    with pytest.raises(ValueError):
+        TracePipeline([], sampling="random")  # type: ignore[arg-type]
+
+
+def test_full_queue_drops_items():
+    sink = ListSink()
+    pipeline = TracePipeline([sink], max_queue_size=4, max_batch_size=100, flush_interval=60)
+    run_trace(pipeline, trace_ids(1)[0], spans=5)
+    assert pipeline.dropped == 2
+    pipeline.shutdown()
+    assert len(sink.records) == 4
+
+
+def test_failing_sink_does_not_stop_others():
+    class Broken(TraceSink):
+        def write(self, batch):
+            raise OSError("disk full")
+
+    sink = ListSink()
+    pipeline = TracePipeline([Broken(), sink], flush_interval=60)
+    run_trace(pipeline, trace_ids(1)[0])
+    pipeline.shutdown()
+    assert len(sink.records) == 3
+
+
+def test_items_are_exported_once():
+    calls = 0
+
+    class CountingSpanData(AgentSpanData):
+        def export(self):
+            nonlocal calls
+            calls += 1
+            return super().export()
+
+    pipeline = TracePipeline([ListSink(), ListSink()], flush_interval=60)
+    span = SpanImpl(
+        trace_id="trace_1",
+        span_id=None,
+        parent_id=None,
+        processor=pipeline,
+        span_data=CountingSpanData(name="agent"),
+    )
+    span.start()
+    span.finish()
+    pipeline.shutdown()
+    assert calls == 1
+
+
+def test_jsonl_sink_compresses_and_rotates(tmp_path):
+    path = tmp_path / "traces.jsonl.gz"
+    sink = JsonlFileSink(path, max_bytes=1, backups=2)
+    pipeline = TracePipeline([sink], max_batch_size=3, flush_interval=60)
+    for trace_id in trace_ids(3):
+        run_trace(pipeline, trace_id)
+        pipeline.force_flush()
+    pipeline.shutdown()
+
+    files = [path, tmp_path / "traces.jsonl.gz.1", tmp_path / "traces.jsonl.gz.2"]
+    assert sorted(tmp_path.iterdir()) == sorted(files)
+    newest = [json.loads(line) for line in gzip.open(path, "rt")]
+    assert [r["object"] for r in newest] == ["trace", "trace.span", "trace.span"]
+    assert newest[0]["id"] == trace_ids(3)[2]
+
+
+def test_jsonl_sink_appends_uncompressed(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    pipeline = TracePipeline([JsonlFileSink(path, compress=False)], flush_interval=60)
+    run_trace(pipeline, trace_ids(1)[0])
+    pipeline.force_flush()
+    run_trace(pipeline, trace_ids(2)[1])
+    pipeline.shutdown()
+    assert len(path.read_text().splitlines()) == 6
+
+
+def test_otlp_buffer_sink():
+    sink = OtlpBufferSink(max_spans=10)
+    pipeline = TracePipeline([sink], flush_interval=60)
+    trace_id = trace_ids(1)[0]
+    run_trace(pipeline, trace_id, error=True)
+    pipeline.force_flush()
+
+    body = sink.drain()
+    spans = body["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(spans) == 2 and len(sink) == 0
+    first = spans[0]
+    assert first["traceId"] == trace_id.removeprefix("trace_")
+    assert len(first["spanId"]) == 16
+    assert first["name"] == "tool0"
+    assert first["status"] == {"code": 2, "message": "boom"}
+    assert int(first["endTimeUnixNano"]) >= int(first["startTimeUnixNano"]) > 0
+    attributes = {a["key"]: a["value"] for a in first["attributes"]}
+    assert attributes["agents.span_type"] == {"stringValue": "function"}
+    assert attributes["agents.workflow_name"] == {"stringValue": "workflow"}
+    pipeline.shutdown()
+
+
+def test_otlp_buffer_sink_forgets_old_workflows():
+    sink = OtlpBufferSink(max_spans=2)
+    pipeline = TracePipeline([sink], flush_interval=60)
+    for trace_id in trace_ids(5):
+        run_trace(pipeline, trace_id, spans=1)
+    pipeline.shutdown()
+    assert len(sink) == 2
+    assert list(sink._workflows) == trace_ids(5)[3:]
@@ -67,19 +67,23 @@ def test_batch_trace_processor_queue_full(mocked_exporter):
     processor = BatchTraceProcessor(
         exporter=mocked_exporter, max_queue_size=2, schedule_delay=0.1
     )
-    # Fill the queue
-    processor.on_trace_start(get_trace(processor))
-    processor.on_trace_start(get_trace(processor))
-    assert processor._queue.full() is True
+    # Keep the worker from draining the queue while we fill it
+    with patch.object(processor, "_start_worker"):
+        processor.on_trace_start(get_trace(processor))
+        processor.on_trace_start(get_trace(processor))
+        assert processor._queue.full() is True
 
-    # Next item should not be queued
-    processor.on_trace_start(get_trace(processor))
-    assert processor._queue.qsize() == 2, "Queue should not exceed max_queue_size"
+        # Next item should not be queued
+        processor.on_trace_start(get_trace(processor))
+        assert processor._queue.qsize() == 2, "Queue should not exceed max_queue_size"
 
-    processor.on_span_end(get_span(processor))
-    assert processor._queue.qsize() == 2, "Queue should not exceed max_queue_size"
+        processor.on_span_end(get_span(processor))
+        assert processor._queue.qsize() == 2, "Queue should not exceed max_queue_size"
 
+    # Without a worker, shutdown exports what is left
     processor.shutdown()
+    mocked_exporter.export.assert_called_once()
+    assert processor._queue.empty()
 
 
 def test_batch_processor_doesnt_enqueue_on_trace_end_or_span_start(mocked_exporter):
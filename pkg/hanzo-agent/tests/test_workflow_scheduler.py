@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from agents.exceptions import AgentsException
+from agents.orchestration import Workflow, WorkflowExecutor, WorkflowStep
+
+
+class FakeResult:
+    def __init__(self, final_output: Any):
+        self.final_output = final_output
+
+
+class FakeNetwork:
+    def __init__(self, delays: dict[str, float] | None = None, failing: set[str] = frozenset()):
+        self.delays = delays or {}
+        self.failing = failing
+        self.started: list[str] = []
+        self.running: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    async def run(self, input: Any, starting_agent: str, context: Any = None) -> FakeResult:
+        self.started.append(starting_agent)
+        self.running[starting_agent] = self.running.get(starting_agent, 0) + 1
+        total = sum(self.running.values())
+        self.peak[starting_agent] = max(self.peak.get(starting_agent, 0), self.running[starting_agent])
+        self.peak["*"] = max(self.peak.get("*", 0), total)
+        try:
+            await asyncio.sleep(self.delays.get(starting_agent, 0.01))
+            if starting_agent in self.failing:
+                raise RuntimeError(f"{starting_agent} failed")
+            return FakeResult(f"{starting_agent}({input})")
+        finally:
+            self.running[starting_agent] -= 1
+
+
+def _workflow(*steps: tuple[str, str, list[str]], **options: Any) -> Workflow:
+    workflow = Workflow("test")
+    for step_id, agent, depends_on in steps:
+        workflow.add_step(
+            WorkflowStep(
+                id=step_id,
+                name=step_id,
+                config={"agent_name": agent},
+                depends_on=depends_on,
+                **options.get(step_id, {}),
+            )
+        )
+    return workflow
+
+
+def test_execution_order_and_critical_path() -> None:
+    workflow = _workflow(
+        ("a", "x", []),
+        ("c", "x", ["a", "b"]),
+        ("b", "x", []),
+        ("d", "x", ["a"]),
+        ("e", "x", ["c", "d"]),
+        c={"estimated_duration": 5.0},
+    )
+    assert workflow.get_execution_order() == [["a", "b"], ["c", "d"], ["e"]]
+    assert workflow.dependents() == {"a": ["c", "d"], "c": ["e"], "b": ["c"], "d": ["e"], "e": []}
+    assert workflow.critical_path_lengths() == {"e": 1.0, "c": 6.0, "d": 2.0, "a": 7.0, "b": 7.0}
+
+    workflow.steps["a"].depends_on.append("e")
+    with pytest.raises(AgentsException, match="Circular dependency"):
+        workflow.get_execution_order()
+    assert "Circular dependency detected in workflow" in workflow.validate()
+
+
+@pytest.mark.asyncio
+async def test_slow_branch_does_not_stall_independent_steps() -> None:
+    network = FakeNetwork({"slow": 0.3})
+    workflow = _workflow(
+        ("slow", "slow", []),
+        ("fast_1", "fast", []),
+        ("fast_2", "fast", ["fast_1"]),
+        ("fast_3", "fast", ["fast_2"]),
+        ("join", "join", ["slow", "fast_3"]),
+    )
+    executor = WorkflowExecutor(workflow, network, retry_failed=False)  # type: ignore[arg-type]
+
+    completed = [step_result.step_id async for step_result in executor.stream("go")]
+
+    assert completed == ["fast_1", "fast_2", "fast_3", "slow", "join"]
+    result = executor.result
+    assert result is not None and result.success
+    assert result.steps_completed == 5
+    assert result.output == "slow(go)"
+    assert result.duration < 0.3 + 0.15
+    assert executor._step_outputs["join"] == "join(['slow(go)', 'fast(fast(fast(go)))'])"
+
+
+@pytest.mark.asyncio
+async def test_global_and_per_agent_concurrency_limits() -> None:
+    network = FakeNetwork({"search": 0.05, "write": 0.05})
+    steps = [(f"search_{i}", "search", []) for i in range(6)]
+    steps += [(f"write_{i}", "write", []) for i in range(6)]
+    executor = WorkflowExecutor(
+        _workflow(*steps),
+        network,  # type: ignore[arg-type]
+        max_concurrency=3,
+        agent_concurrency={"search": 1},
+    )
+
+    result = await executor.execute("go")
+
+    assert result.success and result.steps_completed == 12
+    assert network.peak["*"] == 3
+    assert network.peak["search"] == 1
+    # Search steps waiting on their limit don't hold back the write steps
+    assert network.started[:3] == ["search", "write", "write"]
+
+
+@pytest.mark.asyncio
+async def test_priority_then_critical_path_orders_ready_steps() -> None:
+    network = FakeNetwork()
+    workflow = _workflow(
+        ("short", "short", []),
+        ("long", "long", []),
+        ("long_next", "long_next", ["long"]),
+        ("urgent", "urgent", []),
+        urgent={"priority": 1},
+    )
+    await WorkflowExecutor(workflow, network, max_concurrency=1).execute("go")  # type: ignore[arg-type]
+    assert network.started == ["urgent", "long", "short", "long_next"]
+
+    network = FakeNetwork()
+    executor = WorkflowExecutor(
+        workflow,
+        network,  # type: ignore[arg-type]
+        max_concurrency=1,
+        critical_path_first=False,
+    )
+    await executor.execute("go")
+    assert network.started == ["urgent", "short", "long", "long_next"]
+
+
+@pytest.mark.asyncio
+async def test_failed_step_is_reported_and_releases_dependents() -> None:
+    network = FakeNetwork(failing={"flaky"})
+    workflow = _workflow(("flaky", "flaky", []), ("after", "after", ["flaky"]))
+    executor = WorkflowExecutor(workflow, network, retry_failed=False)  # type: ignore[arg-type]
+
+    results = {step_result.step_id: step_result async for step_result in executor.stream("go")}
+
+    assert not results["flaky"].success
+    assert results["flaky"].error == "flaky failed"
+    assert results["flaky"].retries == 0
+    assert results["after"].success
+    assert executor.result is not None and executor.result.steps_completed == 1
+
@@ -40,6 +40,8 @@ class SQLiteBackendPlugin:
         self._client = None
         self._conn: Optional[sqlite3.Connection] = None
         self._initialized = False
+        self._fts = False
+        self._cjk_search_text = None
 
     @property
     def name(self) -> str:
@@ -122,6 +124,16 @@ class SQLiteBackendPlugin:
         )
         conn.commit()
 
+        # Full-text index (BM25 ranking) when hanzo_memory is available
+        self._add_column_if_missing("memories", "search_text", "TEXT")
+        try:
+            from hanzo_memory.db.fts import cjk_search_text, ensure_fts
+
+            self._fts = ensure_fts(conn)
+            self._cjk_search_text = cjk_search_text
+        except Exception:
+            self._fts = False
+
     def _add_column_if_missing(self, table: str, column: str, col_type: str):
         """Add a column to a table if it doesn't already exist."""
         conn = self._conn
@@ -180,8 +192,13 @@ class SQLiteBackendPlugin:
             if existing:
                 new_content = existing["content"] + content
                 self._conn.execute(
-                    "UPDATE memories SET content = ?, metadata = ?, updated_at = CURRENT_TIMESTAMP WHERE memory_id = ?",
-                    (new_content, json.dumps(metadata), existing["memory_id"]),
+                    "UPDATE memories SET content = ?, search_text = ?, metadata = ?, updated_at = CURRENT_TIMESTAMP WHERE memory_id = ?",
+                    (
+                        new_content,
+                        self._search_text(new_content),
+                        json.dumps(metadata),
+                        existing["memory_id"],
+                    ),
                 )
                 self._conn.commit()
                 return existing["memory_id"]
@@ -194,8 +211,8 @@ class SQLiteBackendPlugin:
             """
             INSERT INTO memories
             (id, memory_id, user_id, project_id, content, importance, context,
-             metadata, source, embedding, namespace, key, tags, ttl)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+             metadata, source, embedding, namespace, key, tags, ttl, search_text)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 str(uuid.uuid4()),
@@ -212,6 +229,7 @@ class SQLiteBackendPlugin:
                 key,
                 tags_json,
                 ttl,
+                self._search_text(content),
             ),
         )
         self._conn.commit()
@@ -251,15 +269,25 @@ class SQLiteBackendPlugin:
                 where_parts.append("json_extract(metadata, '$.type') = ?")
                 params.append(mtype)
 
-        # Content search via LIKE if query provided
-        if query:
-            where_parts.append("content LIKE ?")
-            params.append(f"%{query}%")
-
         # Filter out expired TTL entries
         where_parts.append("(ttl IS NULL OR ttl = '' OR ttl > ?)")
         params.append(datetime.now(timezone.utc).isoformat())
 
+        # Content search ranked by BM25 if the full-text index is available
+        if query and self._fts:
+            from hanzo_memory.db.fts import fts_search
+
+            rows = fts_search(
+                self._conn, query, " AND ".join(where_parts), params, limit
+            )
+            if rows:
+                return [self._row_to_dict(row) for row in rows]
+
+        # Otherwise (or if it matched nothing) substring search via LIKE
+        if query:
+            where_parts.append("content LIKE ?")
+            params.append(f"%{query}%")
+
         where_clause = " AND ".join(where_parts)
         params.append(limit)
 
@@ -521,8 +549,8 @@ class SQLiteBackendPlugin:
                 """
                 INSERT INTO memories
                 (id, memory_id, user_id, project_id, content, importance, context,
-                 metadata, source, embedding, namespace, key, tags, ttl)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 metadata, source, embedding, namespace, key, tags, ttl, search_text)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     str(uuid.uuid4()),
@@ -539,6 +567,7 @@ class SQLiteBackendPlugin:
                     key,
                     json.dumps(tags if isinstance(tags, list) else []),
                     ttl,
+                    self._search_text(entry.get("content", "")),
                 ),
             )
             count += 1
@@ -574,6 +603,12 @@ class SQLiteBackendPlugin:
         except (ValueError, TypeError):
             return False
 
+    def _search_text(self, content: str) -> Optional[str]:
+        """CJK-bigram text to index for content, if the full-text index needs one."""
+        if not self._fts:
+            return None
+        return self._cjk_search_text(content)
+
     def _row_to_dict(self, row) -> Dict[str, Any]:
         """Convert a sqlite3.Row to a dict with parsed JSON fields."""
         if row is None:
@@ -584,6 +619,7 @@ class SQLiteBackendPlugin:
         if not d:
             # Fallback for tuple rows
             return {}
+        d.pop("search_text", None)
 
         # Parse JSON fields
         for field in ("metadata", "context"):
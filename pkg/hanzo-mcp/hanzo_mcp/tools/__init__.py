@@ -71,6 +71,9 @@ def register_all_tools(
     """Register all Hanzo tools with the MCP server.
 
     Tools are discovered from installed hanzo-tools-* packages via entry points.
+    Unified tools recorded in the tool manifest are registered without importing
+    their package, which is loaded on first call (HANZO_MCP_TOOL_MANIFEST=0
+    disables this).
 
     Args:
         mcp_server: The FastMCP server instance
@@ -219,7 +222,7 @@ def register_all_tools(
     resolved_enabled_tools["ui"] = is_tool_enabled("ui", True)
 
     # Create loader and discover packages
-    loader = EntryPointToolLoader(permission_manager=permission_manager)
+    loader = EntryPointToolLoader(permission_manager=permission_manager, use_manifest=True)
     discovered = loader.discover_packages()
 
     if discovered:
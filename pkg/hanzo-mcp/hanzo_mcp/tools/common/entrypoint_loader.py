@@ -8,6 +8,10 @@ The entry point group is "hanzo.tools" and each package exports:
     package_name = "hanzo_tools.package:TOOLS"
 
 Where TOOLS is a list of BaseTool subclasses.
+
+With ``use_manifest=True`` the loader consults the persisted tool manifest (see
+tool_manifest.py): recorded packages are not imported at startup, and their
+unified tools are registered from the manifest and loaded on first call.
 """
 
 from __future__ import annotations
@@ -15,8 +19,18 @@ from __future__ import annotations
 import logging
 import sys
 from importlib.metadata import entry_points
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from hanzo_mcp.tools.common.tool_manifest import (
+    LazyTool,
+    ToolManifest,
+    describe_tool,
+    import_tool_class,
+    is_editable,
+    default_manifest_path,
+)
+
 if TYPE_CHECKING:
     from hanzo_tools.core import BaseTool, PermissionManager
     from mcp.server import FastMCP
@@ -77,15 +91,30 @@ class EntryPointToolLoader:
     and registers their tools with the MCP server.
     """
 
-    def __init__(self, permission_manager: "PermissionManager" | None = None):
+    def __init__(
+        self,
+        permission_manager: "PermissionManager" | None = None,
+        use_manifest: bool = False,
+        manifest_path: Path | None = None,
+    ):
         """Initialize the loader.
 
         Args:
             permission_manager: Optional permission manager for file tools
+            use_manifest: Register tools from the persisted tool manifest when
+                it is up to date, importing packages on first call
+            manifest_path: Manifest location (default: ~/.hanzo/mcp/tool-manifest.json,
+                or HANZO_MCP_TOOL_MANIFEST)
         """
         self.permission_manager = permission_manager
+        # Package name -> TOOLS list, or None for packages known from the manifest
         self._discovered_packages: dict[str, Any] = {}
         self._loaded_tools: dict[str, "BaseTool"] = {}
+        self._manifest: ToolManifest | None = None
+        if use_manifest:
+            path = manifest_path or default_manifest_path()
+            if path is not None:
+                self._manifest = ToolManifest.load(path)
 
     def _get_tool_name(self, tool_class: type) -> str:
         """Extract tool name from class, handling @property decorators.
@@ -135,6 +164,17 @@ class EntryPointToolLoader:
                 eps = entry_points().get(TOOLS_ENTRY_POINT_GROUP, [])
 
             for ep in eps:
+                cacheable = self._manifest is not None and not is_editable(ep)
+                entries = self._manifest.get(ep.name) if cacheable else None
+                if entries is not None:
+                    # Known from the manifest: don't import the package yet
+                    discovered[ep.name] = [entry["name"] for entry in entries]
+                    self._discovered_packages[ep.name] = None
+                    logger.debug(
+                        f"Discovered package '{ep.name}' from manifest: {discovered[ep.name]}"
+                    )
+                    continue
+
                 try:
                     # Load the TOOLS list from the entry point
                     tools_list = ep.load()
@@ -151,6 +191,20 @@ class EntryPointToolLoader:
                             f"Discovered package '{ep.name}' with tools: {tool_names}"
                         )
 
+                        # Only packages that export plain classes can be recorded
+                        if cacheable and all(isinstance(t, type) for t in tools_list):
+                            self._manifest.set(
+                                ep.name,
+                                [
+                                    {
+                                        "name": name,
+                                        "module": tool_class.__module__,
+                                        "qualname": tool_class.__qualname__,
+                                    }
+                                    for name, tool_class in zip(tool_names, tools_list)
+                                ],
+                            )
+
                 except Exception as e:
                     logger.warning(f"Failed to load entry point '{ep.name}': {e}")
 
@@ -182,10 +236,42 @@ class EntryPointToolLoader:
             return []
 
         tools_list = self._discovered_packages[package_name]
+        entries = self._manifest.get(package_name) if self._manifest else None
         registered = []
         enabled_tools = enabled_tools or {}
 
-        for tool_class in tools_list:
+        if tools_list is None:
+            # Known from the manifest; the package hasn't been imported
+            for entry in entries or []:
+                tool_name = entry["name"]
+                if not enabled_tools.get(tool_name, True):
+                    logger.debug(f"Skipping disabled tool: {tool_name}")
+                    continue
+
+                if entry.get("lazy"):
+                    tool = LazyTool(entry, self._instantiate)
+                    try:
+                        tool.register(mcp_server)
+                    except Exception as e:
+                        logger.warning(f"Failed to register tool '{tool_name}': {e}")
+                        continue
+                    self._loaded_tools[tool_name] = tool
+                    registered.append(tool)
+                    logger.debug(f"Registered lazy tool: {tool_name}")
+                    continue
+
+                # Not describable without an instance (yet), so load it now
+                try:
+                    tool_class = import_tool_class(entry)
+                except Exception as e:
+                    logger.warning(f"Failed to import tool '{tool_name}': {e}")
+                    continue
+                tool = self._register_tool(tool_class, tool_name, mcp_server, entry)
+                if tool is not None:
+                    registered.append(tool)
+            return registered
+
+        for index, tool_class in enumerate(tools_list):
             tool_name = self._get_tool_name(tool_class)
 
             # Check if tool is enabled
@@ -193,34 +279,52 @@ class EntryPointToolLoader:
                 logger.debug(f"Skipping disabled tool: {tool_name}")
                 continue
 
-            try:
-                # Try different instantiation patterns
-                if self.permission_manager and hasattr(tool_class, "__init__"):
-                    # Check if tool accepts permission_manager
-                    import inspect
+            entry = entries[index] if entries and index < len(entries) else None
+            tool = self._register_tool(tool_class, tool_name, mcp_server, entry)
+            if tool is not None:
+                registered.append(tool)
 
-                    sig = inspect.signature(tool_class.__init__)
-                    params = list(sig.parameters.keys())
+        return registered
 
-                    if "permission_manager" in params:
-                        tool = tool_class(permission_manager=self.permission_manager)
-                    else:
-                        tool = tool_class()
-                else:
-                    tool = tool_class()
+    def _instantiate(self, tool_class: Any) -> "BaseTool":
+        """Create a tool, passing the permission manager if it takes one."""
+        # Try different instantiation patterns
+        if self.permission_manager and hasattr(tool_class, "__init__"):
+            # Check if tool accepts permission_manager
+            import inspect
 
-                # Register with MCP server
-                if hasattr(tool, "register"):
-                    tool.register(mcp_server)
+            sig = inspect.signature(tool_class.__init__)
+            params = list(sig.parameters.keys())
 
-                self._loaded_tools[tool_name] = tool
-                registered.append(tool)
-                logger.debug(f"Registered tool: {tool_name}")
+            if "permission_manager" in params:
+                return tool_class(permission_manager=self.permission_manager)
+        return tool_class()
 
-            except Exception as e:
-                logger.warning(f"Failed to register tool '{tool_name}': {e}")
+    def _register_tool(
+        self,
+        tool_class: Any,
+        tool_name: str,
+        mcp_server: "FastMCP",
+        entry: dict[str, Any] | None = None,
+    ) -> "BaseTool | None":
+        """Instantiate and register a tool, recording it in the manifest entry if given."""
+        try:
+            tool = self._instantiate(tool_class)
 
-        return registered
+            # Register with MCP server
+            if hasattr(tool, "register"):
+                tool.register(mcp_server)
+
+            self._loaded_tools[tool_name] = tool
+            logger.debug(f"Registered tool: {tool_name}")
+
+        except Exception as e:
+            logger.warning(f"Failed to register tool '{tool_name}': {e}")
+            return None
+
+        if entry is not None and self._manifest is not None:
+            self._manifest.update_entry(entry, describe_tool(tool))
+        return tool
 
     def load_all(
         self,
@@ -261,6 +365,9 @@ class EntryPointToolLoader:
                 **kwargs,
             )
 
+        if self._manifest is not None:
+            self._manifest.save()
+
         return self._loaded_tools
 
     def get_tool(self, name: str) -> "BaseTool | None":
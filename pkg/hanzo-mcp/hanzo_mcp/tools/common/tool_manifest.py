@@ -0,0 +1,257 @@
+"""Persisted tool manifest for lazy registration of entry-point tools.
+
+Importing a hanzo-tools-* package and instantiating its tools pulls in their
+dependencies (tree-sitter, playwright, tiktoken, ...) on every server boot.
+The manifest records, per entry point, the tool classes it exports and, for
+unified HIP-0300 tools, the name, description and parameter schema they
+register with MCP. While the installed distributions are unchanged, the server
+registers those tools from the manifest and imports a package only when one of
+its tools is first called.
+
+The manifest lives at ~/.hanzo/mcp/tool-manifest.json. Set
+HANZO_MCP_TOOL_MANIFEST=0 to disable it, or to a path to move it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from hanzo_tools.core import BaseTool
+    from mcp.server import FastMCP
+
+logger = logging.getLogger(__name__)
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+MANIFEST_ENV = "HANZO_MCP_TOOL_MANIFEST"
+
+
+def default_manifest_path() -> Path | None:
+    """Where the manifest is kept, or None if it is disabled."""
+    value = os.environ.get(MANIFEST_ENV, "").strip()
+    if value.lower() in ("0", "false", "no", "off"):
+        return None
+    if value and value.lower() not in ("1", "true", "yes", "on"):
+        return Path(value).expanduser()
+    return Path.home() / ".hanzo" / "mcp" / "tool-manifest.json"
+
+
+def environment_key() -> str:
+    """Digest of everything that decides which tools packages export.
+
+    Covers the interpreter, every distribution installed on sys.path (the
+    ``*.dist-info`` directory names carry name and version, so listing them is
+    enough and imports nothing) and the HANZO_* and SHELL environment variables
+    some packages read to choose their tools.
+    """
+    h = hashlib.sha256()
+    h.update(f"{MANIFEST_VERSION}\0{sys.version}\0{sys.executable}\n".encode())
+    for entry in sys.path:
+        try:
+            names = sorted(
+                name
+                for name in os.listdir(entry or ".")
+                if name.endswith((".dist-info", ".egg-info"))
+            )
+        except OSError:
+            continue
+        h.update(entry.encode())
+        for name in names:
+            h.update(b"\0" + name.encode())
+        h.update(b"\n")
+    for key in sorted(os.environ):
+        if (key.startswith("HANZO_") and key != MANIFEST_ENV) or key == "SHELL":
+            h.update(f"{key}={os.environ[key]}\n".encode())
+    return h.hexdigest()
+
+
+def is_editable(entry_point: Any) -> bool:
+    """Whether an entry point comes from an editable install.
+
+    Its code can change without its version changing, so the manifest never
+    covers it.
+    """
+    dist = getattr(entry_point, "dist", None)
+    if dist is None:
+        return True
+    try:
+        direct_url = dist.read_text("direct_url.json")
+    except Exception:
+        return True
+    if not direct_url:
+        return False
+    try:
+        return bool(json.loads(direct_url).get("dir_info", {}).get("editable"))
+    except ValueError:
+        return True
+
+
+def describe_tool(tool: Any) -> dict[str, Any]:
+    """Registration info to record for a live tool instance.
+
+    Only unified tools that keep the standard ``BaseTool.register`` can be
+    registered without their instance; anything else is marked eager.
+    """
+    try:
+        from hanzo_tools.core.unified import BaseTool as UnifiedBaseTool
+    except ImportError:
+        return {"lazy": False}
+
+    if (
+        isinstance(tool, UnifiedBaseTool)
+        and type(tool).register is UnifiedBaseTool.register
+        and hasattr(tool, "mcp_parameters")
+    ):
+        try:
+            return {
+                "lazy": True,
+                "description": tool.description,
+                "mcp_description": tool.mcp_description(),
+                "parameters": tool.mcp_parameters(),
+            }
+        except Exception as e:
+            logger.debug(f"Cannot describe tool '{tool.name}': {e}")
+    return {"lazy": False}
+
+
+def import_tool_class(entry: dict[str, Any]) -> type:
+    """Import the tool class a manifest entry points at."""
+    target: Any = importlib.import_module(entry["module"])
+    for part in entry["qualname"].split("."):
+        target = getattr(target, part)
+    return target
+
+
+class ToolManifest:
+    """Tool classes and registration info per entry point, valid for one environment key."""
+
+    def __init__(self, path: Path | None, key: str):
+        self.path = path
+        self.key = key
+        self.packages: dict[str, list[dict[str, Any]]] = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path | None = None, key: str | None = None) -> "ToolManifest":
+        """Load the manifest, starting empty if it is missing or was built for another environment."""
+        manifest = cls(path, key or environment_key())
+        if path is None:
+            return manifest
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return manifest
+        if (
+            isinstance(data, dict)
+            and data.get("version") == MANIFEST_VERSION
+            and data.get("key") == manifest.key
+            and isinstance(data.get("packages"), dict)
+        ):
+            manifest.packages = data["packages"]
+        else:
+            logger.debug("Tool manifest is stale, rebuilding")
+        return manifest
+
+    def get(self, package_name: str) -> list[dict[str, Any]] | None:
+        """Recorded tool entries of a package, or None if it isn't recorded."""
+        return self.packages.get(package_name)
+
+    def set(self, package_name: str, entries: list[dict[str, Any]]) -> None:
+        """Record the tool entries of a package."""
+        self.packages[package_name] = entries
+        self.dirty = True
+
+    def update_entry(self, entry: dict[str, Any], info: dict[str, Any]) -> None:
+        """Add registration info to an entry returned by `get`."""
+        if any(entry.get(k) != v for k, v in info.items()):
+            entry.update(info)
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the manifest if anything changed, atomically."""
+        if self.path is None or not self.dirty:
+            return
+        data = {"version": MANIFEST_VERSION, "key": self.key, "packages": self.packages}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".tool-manifest.")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError as e:
+            logger.debug(f"Could not write tool manifest {self.path}: {e}")
+
+
+class LazyTool:
+    """Stands in for a unified tool registered from the manifest.
+
+    The tool's package is imported and the tool instantiated on its first
+    call (or first access to any other attribute).
+    """
+
+    def __init__(self, entry: dict[str, Any], factory: Callable[[type], "BaseTool"]):
+        self.name: str = entry["name"]
+        self._entry = entry
+        self._factory = factory
+        self._tool: "BaseTool | None" = None
+
+    @property
+    def description(self) -> str:
+        return self._entry["description"]
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the real tool has been instantiated."""
+        return self._tool is not None
+
+    def load(self) -> "BaseTool":
+        """Import and instantiate the real tool, once."""
+        if self._tool is None:
+            self._tool = self._factory(import_tool_class(self._entry))
+            logger.debug(f"Loaded lazy tool: {self.name}")
+        return self._tool
+
+    async def call(self, ctx: Any, action: str = "help", **kwargs: Any) -> dict[str, Any]:
+        """Load the tool if needed and run the action."""
+        try:
+            tool = self.load()
+        except Exception as e:
+            logger.warning(f"Failed to load tool '{self.name}': {e}")
+            return {
+                "ok": False,
+                "data": None,
+                "error": {
+                    "code": "INTERNAL_ERROR",
+                    "message": f"Failed to load tool '{self.name}': {e}",
+                },
+                "meta": {"tool": self.name},
+            }
+        return await tool.call(ctx, action=action, **kwargs)
+
+    def register(self, mcp_server: "FastMCP") -> None:
+        """Register the recorded name, description and schema with the MCP server."""
+        from hanzo_tools.core.unified import register_mcp_tool
+
+        register_mcp_tool(
+            mcp_server,
+            name=self.name,
+            description=self._entry["mcp_description"],
+            parameters=self._entry["parameters"],
+            call=self.call,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
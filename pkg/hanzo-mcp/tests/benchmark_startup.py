@@ -0,0 +1,173 @@
+"""Server startup: eager entry-point tool loading vs lazy registration from the tool manifest.
+
+Each run is a fresh interpreter that creates a FastMCP server and calls
+`register_all_tools`, as `hanzo-mcp` does on boot:
+
+* eager — HANZO_MCP_TOOL_MANIFEST=0, so every hanzo-tools-* package is imported
+          and every tool instantiated, as before;
+* cold  — first boot with the manifest enabled (eager, plus writing it);
+* warm  — later boots, which register unified tools from the manifest and
+          import their packages on first call.
+
+Reports wall time, the time spent in `register_all_tools`, the number of
+registered tools, modules imported and peak RSS of each child (medians). Only
+packages installed as regular (non-editable) distributions are covered by the
+manifest, so run it against a normal install.
+
+With ``--fake-packages N`` the children see only N generated tool packages,
+installed as regular distributions in a temporary directory, instead of the
+installed hanzo-tools-* ones. Each exports one unified tool and stands in for
+its dependencies with ``--modules`` generated submodules and a
+``--import-ms`` pause, so the comparison can be run without the real packages.
+
+    python tests/benchmark_startup.py [--runs 5] [--fake-packages 20 [--modules 50] [--import-ms 20]]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+from mcp.server import FastMCP
+from hanzo_mcp.tools import register_all_tools
+from hanzo_mcp.tools.common.permissions import PermissionManager
+# FAKE ENTRY POINTS
+server = FastMCP("benchmark")
+registered = time.perf_counter()
+tools = register_all_tools(server, PermissionManager(), use_mode=False)
+end = time.perf_counter()
+print(json.dumps({
+    "register": end - registered,
+    "total": end - start,
+    "tools": len(tools),
+    "modules": len(sys.modules),
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+# Leaves only the generated packages visible to the loader
+FAKE_ENTRY_POINTS = """
+from hanzo_mcp.tools.common import entrypoint_loader
+_entry_points = entrypoint_loader.entry_points
+entrypoint_loader.entry_points = lambda group: [
+    ep for ep in _entry_points(group=group) if ep.name.startswith("bench_")
+]
+"""
+
+FAKE_PACKAGE = '''
+import time
+
+from hanzo_tools.core import BaseTool
+
+from . import {imports}
+
+time.sleep({import_ms} / 1000)
+
+
+class BenchTool(BaseTool):
+    name = "bench_{index}"
+
+    def __init__(self):
+        super().__init__()
+
+        @self.action("run", "Do nothing")
+        async def run(ctx) -> dict:
+            return {{}}
+
+    @property
+    def description(self) -> str:
+        return "Benchmark stand-in tool {index}"
+
+
+TOOLS = [BenchTool]
+'''
+
+FAKE_MODULE = "".join(f"\n\ndef f{i}(x, y=1):\n    return [x * y + {i} for _ in range(3)]\n" for i in range(50))
+
+
+def write_fake_packages(site: Path, count: int, modules: int, import_ms: float) -> None:
+    """Install ``count`` tool packages as regular distributions under ``site``."""
+    for index in range(count):
+        name = f"bench_tools_{index}"
+        package = site / name
+        package.mkdir()
+        submodules = [f"dep{m}" for m in range(modules)]
+        for module in submodules:
+            (package / f"{module}.py").write_text(FAKE_MODULE)
+        (package / "__init__.py").write_text(
+            FAKE_PACKAGE.format(imports=", ".join(submodules), import_ms=import_ms, index=index)
+        )
+        dist = site / f"{name}-1.0.dist-info"
+        dist.mkdir()
+        (dist / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n")
+        (dist / "entry_points.txt").write_text(f"[hanzo.tools]\nbench_{index} = {name}:TOOLS\n")
+
+
+def boot(manifest: str, site: Path | None) -> dict:
+    env = dict(os.environ, HANZO_MCP_TOOL_MANIFEST=manifest)
+    paths = [str(Path(__file__).resolve().parent.parent), env.get("PYTHONPATH")]
+    child = CHILD
+    if site is not None:
+        paths.insert(0, str(site))
+        child = CHILD.replace("# FAKE ENTRY POINTS", FAKE_ENTRY_POINTS)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, paths))
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", child], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    wall = time.perf_counter() - start
+    result = json.loads(out.strip().splitlines()[-1])
+    result["wall"] = wall
+    return result
+
+
+def report(name: str, runs: list[dict]) -> None:
+    wall = statistics.median(r["wall"] for r in runs)
+    register = statistics.median(r["register"] for r in runs)
+    rss = statistics.median(r["rss_mb"] for r in runs)
+    last = runs[-1]
+    print(
+        f"{name:>6}{wall * 1e3:>10.0f} ms{register * 1e3:>12.0f} ms"
+        f"{last['tools']:>7}{last['modules']:>9}{rss:>10.0f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--fake-packages", type=int, default=0)
+    parser.add_argument("--modules", type=int, default=50, help="per fake package")
+    parser.add_argument("--import-ms", type=float, default=20, help="per fake package")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        site = None
+        if args.fake_packages:
+            site = Path(tmp) / "site"
+            site.mkdir()
+            write_fake_packages(site, args.fake_packages, args.modules, args.import_ms)
+        manifest = str(Path(tmp) / "tool-manifest.json")
+        print(f"{'mode':>6}{'wall':>13}{'register':>15}{'tools':>7}{'modules':>9}{'peak RSS':>13}")
+        cold = boot(manifest, site)
+        warm = [boot(manifest, site) for _ in range(args.runs)]
+        eager = [boot("0", site) for _ in range(args.runs)]
+        report("warm", warm)
+        report("cold", [cold])
+        report("eager", eager)
+
+        packages = json.loads(Path(manifest).read_text()).get("packages", {})
+        entries = [e for tools in packages.values() for e in tools]
+        lazy = sum(1 for e in entries if e.get("lazy"))
+        print(f"manifest: {len(packages)} packages, {lazy}/{len(entries)} tools registered lazily")
+
+
+if __name__ == "__main__":
+    main()
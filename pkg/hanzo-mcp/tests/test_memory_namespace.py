@@ -318,6 +318,17 @@ class TestBackwardCompatibility:
         )
         assert isinstance(results, list)
 
+    @pytest.mark.asyncio
+    async def test_retrieve_memory_ranks_words(self, memory_service):
+        for content in ["async event loops", "python asyncio loops", "python"]:
+            await memory_service.store_memory(content=content, metadata={})
+        results = await memory_service.retrieve_memory(query="python loop")
+        assert len(results) == 3
+        assert results[0]["content"] == "python asyncio loops"
+        # Substrings still match
+        results = await memory_service.retrieve_memory(query="ncio")
+        assert [r["content"] for r in results] == ["python asyncio loops"]
+
     @pytest.mark.asyncio
     async def test_delete_memory_original_signature(self, memory_service):
         mid = await memory_service.store_memory(
@@ -0,0 +1,147 @@
+"""Memoization of PURE actions in the unified ``BaseTool``.
+
+Actions whose docstring declares ``Effect: PURE`` are answered from a per-tool
+result cache when the arguments and every file argument are unchanged. Anything
+else (non-PURE actions, errors, directories) always runs the handler.
+"""
+
+import os
+import asyncio
+
+from hanzo_tools.core import BaseTool, ResultCache, ToolError
+
+
+class CountingTool(BaseTool):
+    name = "counting"
+
+    def __init__(self, cwd: str):
+        super().__init__()
+        self.cwd = cwd
+        self.calls: dict[str, int] = {}
+
+        @self.action("read", "Read a file")
+        async def read(ctx, path: str) -> dict:
+            """Read a file.
+
+            Effect: PURE
+            """
+            self.calls["read"] = self.calls.get("read", 0) + 1
+            full = os.path.join(self.cwd, path)
+            if not os.path.exists(full):
+                raise ToolError(code="NOT_FOUND", message=f"File not found: {path}")
+            with open(full) as f:
+                return {"text": f.read(), "lines": [1, 2]}
+
+        @self.action("roll", "Random number")
+        async def roll(ctx, sides: int = 6) -> dict:
+            """Roll a die.
+
+            Effect: NONDETERMINISTIC_EFFECT
+            """
+            self.calls["roll"] = self.calls.get("roll", 0) + 1
+            return {"value": self.calls["roll"]}
+
+    @property
+    def description(self) -> str:
+        return "Counting tool"
+
+
+def _age(path: str, seconds: float = 10.0) -> None:
+    """Backdate a file past the racy window, as for a file edited a while ago."""
+    past = os.stat(path).st_mtime - seconds
+    os.utime(path, (past, past))
+
+
+def test_pure_action_is_served_from_cache(tmp_path):
+    (tmp_path / "a.txt").write_text("hello")
+    _age(str(tmp_path / "a.txt"))
+    tool = CountingTool(str(tmp_path))
+
+    first = asyncio.run(tool.call(None, action="read", path="a.txt"))
+    second = asyncio.run(tool.call(None, action="read", path="a.txt"))
+
+    assert tool.calls["read"] == 1
+    assert first["data"] == second["data"] == {"text": "hello", "lines": [1, 2]}
+    assert first["meta"]["cache"] == {"hit": False, "hits": 0, "misses": 1}
+    assert second["meta"]["cache"] == {"hit": True, "hits": 1, "misses": 1}
+
+    # Callers get their own copy
+    second["data"]["lines"].append(3)
+    third = asyncio.run(tool.call(None, action="read", path="a.txt"))
+    assert third["data"]["lines"] == [1, 2]
+
+
+def test_file_change_invalidates_entry(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("hello")
+    tool = CountingTool(str(tmp_path))
+
+    asyncio.run(tool.call(None, action="read", path="a.txt"))
+    # Same size, and possibly the same mtime: the content hash catches it
+    path.write_text("HELLO")
+    result = asyncio.run(tool.call(None, action="read", path="a.txt"))
+
+    assert result["data"]["text"] == "HELLO"
+    assert result["meta"]["cache"]["hit"] is False
+    assert tool.calls["read"] == 2
+
+
+def test_non_pure_actions_and_errors_are_not_cached(tmp_path):
+    tool = CountingTool(str(tmp_path))
+
+    rolls = [asyncio.run(tool.call(None, action="roll"))["data"]["value"] for _ in range(2)]
+    assert rolls == [1, 2]
+    assert "cache" not in asyncio.run(tool.call(None, action="roll"))["meta"]
+
+    for _ in range(2):
+        missing = asyncio.run(tool.call(None, action="read", path="missing.txt"))
+        assert missing["ok"] is False
+    assert tool.calls["read"] == 2
+
+    # Directories can't be fingerprinted cheaply, so they bypass the cache
+    (tmp_path / "sub").mkdir()
+    asyncio.run(tool.call(None, action="read", path="sub"))
+    asyncio.run(tool.call(None, action="read", path="sub"))
+    assert tool.calls["read"] == 4
+
+
+def test_explicit_invalidation_and_status(tmp_path):
+    for name in ("a.txt", "b.txt"):
+        (tmp_path / name).write_text(name)
+        _age(str(tmp_path / name))
+    tool = CountingTool(str(tmp_path))
+    for name in ("a.txt", "b.txt"):
+        asyncio.run(tool.call(None, action="read", path=name))
+
+    assert tool.invalidate_cache(path="a.txt") == 1
+    asyncio.run(tool.call(None, action="read", path="a.txt"))
+    asyncio.run(tool.call(None, action="read", path="b.txt"))
+    assert tool.calls["read"] == 3
+
+    status = asyncio.run(tool.call(None, action="status"))["data"]
+    assert status["cache"]["entries"] == 2
+    assert tool.invalidate_cache(action="read") == 2
+    assert tool.invalidate_cache(path=str(tmp_path)) == 0
+
+
+def test_cache_bounds_and_ttl(monkeypatch):
+    cache = ResultCache(max_entries=2, max_bytes=10_000, ttl=60.0)
+    keys = [cache.make_key({"n": i}) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put("act", key, {"n": i})
+
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.get("act", keys[0]) == (False, None)
+    assert cache.get("act", keys[2]) == (True, {"n": 2})
+
+    cache.put("act", keys[0], "x" * 20_000)
+    assert cache.get("act", keys[0])[0] is False
+
+    now = cache._entries[("act", keys[2].args)].expires
+    monkeypatch.setattr("hanzo_tools.core.result_cache.time.monotonic", lambda: now + 1)
+    assert cache.get("act", keys[2])[0] is False
+    assert len(cache) == 1
+
+    # Arguments that don't serialize canonically are never cached
+    assert cache.make_key({"obj": object()}) is None
+    assert ResultCache(max_entries=0).make_key({"n": 1}) is None
@@ -0,0 +1,165 @@
+"""Lazy registration of entry-point tools from the persisted tool manifest.
+
+The first boot imports every tools package and records its unified tools in the
+manifest; later boots in the same environment register those tools from the
+manifest without importing the package, and import it on first call.
+"""
+
+import sys
+import json
+import asyncio
+import textwrap
+
+import pytest
+
+from hanzo_mcp.tools.common import entrypoint_loader, tool_manifest
+from hanzo_mcp.tools.common.tool_manifest import ToolManifest, default_manifest_path
+from hanzo_mcp.tools.common.entrypoint_loader import EntryPointToolLoader
+
+PACKAGE = textwrap.dedent(
+    '''
+    from hanzo_tools.core import BaseTool
+
+
+    class EchoTool(BaseTool):
+        name = "echo"
+
+        def __init__(self):
+            super().__init__()
+
+            @self.action("say", "Echo text back")
+            async def say(ctx, text: str = "") -> dict:
+                return {"text": text}
+
+        @property
+        def description(self) -> str:
+            return "Echo tool"
+
+
+    class LegacyTool:
+        name = "legacy"
+        description = "Registers itself"
+
+        def register(self, mcp_server):
+            mcp_server.registered["legacy"] = self
+
+
+    TOOLS = [EchoTool, LegacyTool]
+    '''
+)
+
+
+class FakeDist:
+    def read_text(self, filename):
+        return None
+
+
+class FakeEntryPoint:
+    def __init__(self, name, module):
+        self.name = name
+        self.module = module
+        self.dist = FakeDist()
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        __import__(self.module)
+        return sys.modules[self.module].TOOLS
+
+
+class FakeServer:
+    def __init__(self):
+        self.registered = {}
+
+
+@pytest.fixture
+def environment(tmp_path, monkeypatch):
+    (tmp_path / "fake_echo_tools.py").write_text(PACKAGE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "fake_echo_tools", raising=False)
+
+    ep = FakeEntryPoint("echo", "fake_echo_tools")
+    monkeypatch.setattr(entrypoint_loader, "entry_points", lambda group: [ep])
+
+    # Stand-in for FastMCP's tool table
+    def register_mcp_tool(mcp_server, name, description, parameters, call):
+        mcp_server.registered[name] = (description, parameters, call)
+
+    monkeypatch.setattr("hanzo_tools.core.unified.register_mcp_tool", register_mcp_tool)
+    monkeypatch.setattr(tool_manifest, "environment_key", lambda: "key-1")
+    return tmp_path / "manifest.json", ep
+
+
+def _boot(path):
+    server = FakeServer()
+    loader = EntryPointToolLoader(use_manifest=True, manifest_path=path)
+    loader.discover_packages()
+    tools = loader.load_all(server)
+    return server, tools
+
+
+def test_warm_boot_registers_without_importing(environment):
+    path, ep = environment
+
+    cold_server, cold_tools = _boot(path)
+    assert ep.loads == 1
+    entries = json.loads(path.read_text())["packages"]["echo"]
+    assert [(e["name"], e["lazy"]) for e in entries] == [("echo", True), ("legacy", False)]
+
+    del sys.modules["fake_echo_tools"]
+    server, tools = _boot(path)
+
+    # Only the legacy tool needed its module; the entry point itself wasn't loaded
+    assert ep.loads == 1
+    assert not tools["echo"].loaded
+    assert tools["echo"].description == "Echo tool"
+    assert server.registered["echo"][:2] == cold_server.registered["echo"][:2]
+    assert isinstance(server.registered["legacy"], sys.modules["fake_echo_tools"].LegacyTool)
+
+    call = server.registered["echo"][2]
+    result = asyncio.run(call(None, action="say", text="hi"))
+    assert result["ok"] and result["data"] == {"text": "hi"}
+    assert tools["echo"].loaded
+
+
+def test_lazy_tool_that_fails_to_load_returns_error(environment):
+    path, _ = environment
+    _boot(path)
+
+    data = json.loads(path.read_text())
+    data["packages"]["echo"][0]["qualname"] = "Missing"
+    path.write_text(json.dumps(data))
+
+    server, _ = _boot(path)
+    result = asyncio.run(server.registered["echo"][2](None, action="say"))
+    assert result["ok"] is False
+    assert result["error"]["code"] == "INTERNAL_ERROR"
+
+
+def test_stale_or_disabled_manifest_is_not_used(environment, monkeypatch):
+    path, ep = environment
+    _boot(path)
+
+    # A different environment (e.g. a package upgrade) rebuilds the manifest
+    monkeypatch.setattr(tool_manifest, "environment_key", lambda: "key-2")
+    assert ToolManifest.load(path).packages == {}
+    _boot(path)
+    assert ep.loads == 2
+    assert json.loads(path.read_text())["key"] == "key-2"
+
+    # Editable installs always load eagerly
+    ep.dist.read_text = lambda filename: json.dumps({"dir_info": {"editable": True}})
+    _boot(path)
+    assert ep.loads == 3
+
+    monkeypatch.setenv("HANZO_MCP_TOOL_MANIFEST", "0")
+    assert default_manifest_path() is None
+    monkeypatch.setenv("HANZO_MCP_TOOL_MANIFEST", str(path))
+    assert default_manifest_path() == path
+
+
+def test_environment_key_tracks_installed_distributions(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    before = tool_manifest.environment_key()
+    (tmp_path / "hanzo_tools_extra-1.0.dist-info").mkdir()
+    assert tool_manifest.environment_key() != before
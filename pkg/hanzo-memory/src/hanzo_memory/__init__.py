@@ -1,16 +1,11 @@
 """Hanzo Memory Service - AI memory and knowledge management."""
 
-__version__ = "1.0.1"
+__version__ = "1.1.0"
 __author__ = "Hanzo Industries Inc."
 __email__ = "dev@hanzo.ai"
 
-# Import models - these are always needed
-from .models.knowledge import Fact, FactCreate, KnowledgeBase
-from .models.memory import Memory, MemoryCreate, MemoryResponse
-from .models.project import Project, ProjectCreate
-
-# Import database factory for getting the configured client
-from .db.factory import get_db_client
+import importlib
+from typing import TYPE_CHECKING
 
 __all__ = [
     "get_db_client",
@@ -23,3 +18,37 @@ __all__ = [
     "Project",
     "ProjectCreate",
 ]
+
+# Resolved on first access, so importing a light submodule such as
+# hanzo_memory.similarity does not load the models and database backends.
+_LAZY_IMPORTS = {
+    "get_db_client": "hanzo_memory.db.factory",
+    "Memory": "hanzo_memory.models.memory",
+    "MemoryCreate": "hanzo_memory.models.memory",
+    "MemoryResponse": "hanzo_memory.models.memory",
+    "KnowledgeBase": "hanzo_memory.models.knowledge",
+    "Fact": "hanzo_memory.models.knowledge",
+    "FactCreate": "hanzo_memory.models.knowledge",
+    "Project": "hanzo_memory.models.project",
+    "ProjectCreate": "hanzo_memory.models.project",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    # Bind it so the next read is a plain module-dict hit.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    from .db.factory import get_db_client
+    from .models.knowledge import Fact, FactCreate, KnowledgeBase
+    from .models.memory import Memory, MemoryCreate, MemoryResponse
+    from .models.project import Project, ProjectCreate
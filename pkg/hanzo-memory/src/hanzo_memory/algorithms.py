@@ -31,6 +31,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Callable, Iterable
 
+import numpy as np
+
+from .similarity import cosine
+
 # ── Fusion ────────────────────────────────────────────────────────────
 
 RRF_K_DEFAULT = 20
@@ -127,43 +131,63 @@ def select_weights(q: QueryCharacteristics) -> dict[str, float]:
 # ── Rerank (MMR) ──────────────────────────────────────────────────────
 
 
-def cosine(a: list[float], b: list[float]) -> float:
-    if len(a) != len(b):
-        return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    na = math.sqrt(sum(x * x for x in a))
-    nb = math.sqrt(sum(y * y for y in b))
-    return dot / (na * nb) if na * nb > 0 else 0.0
-
-
 @dataclass
 class MmrInput(SearchHit):
     embedding: list[float] | None = None
 
 
-def mmr_rerank(hits: list[MmrInput], lambda_: float = 0.5, limit: int | None = None) -> list[MmrInput]:
+def mmr_rerank(
+    hits: list[MmrInput],
+    lambda_: float = 0.5,
+    limit: int | None = None,
+    embeddings: np.ndarray | None = None,
+) -> list[MmrInput]:
+    """Maximal marginal relevance: pick hits by relevance minus similarity to those picked.
+
+    Each pick scores one similarity column against the remaining candidates
+    and folds it into their running maximum, so a step costs O(candidates).
+    Hits without an embedding follow the reranked ones in input order.
+
+    Args:
+        hits: Candidates with relevance ``score`` and ``embedding``
+        lambda_: Weight of relevance; ``1 - lambda_`` weighs redundancy
+        limit: Maximum hits returned (all by default)
+        embeddings: L2-normalized rows aligned with ``hits``, used instead
+            of their ``embedding`` (every hit then takes part)
+    """
     limit = limit if limit is not None else len(hits)
-    embedded = [h for h in hits if h.embedding]
-    orphans = [h for h in hits if not h.embedding]
+    norms = dims = None
+    if embeddings is not None:
+        embedded, orphans = list(hits), []
+        matrix = np.asarray(embeddings, dtype=np.float64)
+    else:
+        embedded = [h for h in hits if h.embedding]
+        orphans = [h for h in hits if not h.embedding]
+        matrix, dims = _padded_rows([h.embedding for h in embedded])
+        norms = np.linalg.norm(matrix, axis=1)
     selected: list[MmrInput] = []
-    cands = list(embedded)
-    while len(selected) < limit and cands:
-        best_idx = -1
-        best_score = -math.inf
-        for i, c in enumerate(cands):
-            rel = c.score
-            max_sim = 0.0
-            for s in selected:
-                sim = cosine(c.embedding or [], s.embedding or [])
-                if sim > max_sim:
-                    max_sim = sim
-            mmr = lambda_ * rel - (1 - lambda_) * max_sim
-            if mmr > best_score:
-                best_score = mmr
-                best_idx = i
-        if best_idx < 0:
-            break
-        selected.append(cands.pop(best_idx))
+    if embedded and limit > 0:
+        relevance = lambda_ * np.array([h.score for h in embedded], dtype=np.float64)
+        # Similarity to the closest pick so far, floored at 0
+        max_sim = np.zeros(len(embedded))
+        taken = np.zeros(len(embedded), dtype=bool)
+        for _ in range(min(limit, len(embedded))):
+            mmr = relevance - (1 - lambda_) * max_sim
+            mmr[taken] = -math.inf
+            best = int(np.argmax(mmr))
+            if not mmr[best] > -math.inf:
+                break
+            selected.append(embedded[best])
+            taken[best] = True
+            sims = matrix @ matrix[best]
+            if norms is not None:
+                # As `cosine` does, so near-ties break the same way
+                denom = norms * norms[best]
+                np.divide(sims, denom, out=sims, where=denom > 0)
+                sims[denom == 0] = 0.0
+            if dims is not None:
+                sims[dims != dims[best]] = 0.0
+            np.maximum(max_sim, sims, out=max_sim)
     for o in orphans:
         if len(selected) >= limit:
             break
@@ -171,6 +195,21 @@ def mmr_rerank(hits: list[MmrInput], lambda_: float = 0.5, limit: int | None = N
     return selected
 
 
+def _padded_rows(vectors: list[list[float]]) -> tuple[np.ndarray, np.ndarray | None]:
+    """Rows zero-padded to one width, and each row's length if they differ."""
+    lengths = np.array([len(v) for v in vectors], dtype=np.int64)
+    width = int(lengths.max()) if len(vectors) else 0
+    if len(vectors) and (lengths == width).all():
+        matrix = np.array(vectors, dtype=np.float64)
+        dims = None
+    else:
+        matrix = np.zeros((len(vectors), width))
+        for row, v in zip(matrix, vectors):
+            row[: len(v)] = v
+        dims = lengths
+    return matrix, dims
+
+
 # ── Dedup ─────────────────────────────────────────────────────────────
 
 
@@ -772,6 +811,90 @@ class WeightedEdge:
     weight: float
 
 
+@dataclass
+class CsrGraph:
+    """Weighted graph as compressed sparse rows.
+
+    The neighbours of ``nodes[i]`` are ``indices[indptr[i]:indptr[i + 1]]``,
+    with ``weights`` alongside. Entries of a row keep the order of the edges
+    they came from; duplicate edges are kept, not merged.
+    """
+
+    nodes: list[str]
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def from_edges(cls, edges: list[WeightedEdge], directed: bool = False) -> CsrGraph:
+        """Build from edges; undirected graphs get an entry each way per edge."""
+        nodes, src, dst, w = _edge_arrays(edges)
+        if directed:
+            return cls.from_arrays(nodes, src, dst, w)
+        return cls.undirected(nodes, src, dst, w)
+
+    @classmethod
+    def undirected(cls, nodes: list[str], src: np.ndarray, dst: np.ndarray, weights: np.ndarray) -> CsrGraph:
+        """Build from edge arrays with an entry each way per edge."""
+        # Interleaved, so each row lists its entries in edge order
+        rows = np.stack([src, dst], axis=1).ravel()
+        cols = np.stack([dst, src], axis=1).ravel()
+        return cls.from_arrays(nodes, rows, cols, np.repeat(weights, 2))
+
+    @classmethod
+    def from_arrays(cls, nodes: list[str], rows: np.ndarray, cols: np.ndarray, weights: np.ndarray) -> CsrGraph:
+        """Build from parallel entry arrays, keeping their order within each row."""
+        order = np.argsort(rows, kind="stable")
+        counts = np.bincount(rows, minlength=len(nodes))
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(nodes, indptr, cols[order].astype(np.int64), weights[order].astype(np.float64))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def row_ids(self) -> np.ndarray:
+        """Row of each entry."""
+        return np.repeat(np.arange(len(self.nodes)), np.diff(self.indptr))
+
+    def degrees(self) -> np.ndarray:
+        """Weighted degree of each node (a self-loop counts twice when undirected)."""
+        return np.bincount(self.row_ids(), weights=self.weights, minlength=len(self.nodes))
+
+
+def _edge_arrays(edges: list[WeightedEdge]) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+    """Node names in order of first appearance, and source/target/weight arrays."""
+    names = [name for e in edges for name in (e.source, e.target)]
+    index = {name: i for i, name in enumerate(dict.fromkeys(names))}
+    ends = np.fromiter(map(index.__getitem__, names), np.int64, len(names))
+    w = np.fromiter((e.weight for e in edges), np.float64, len(edges))
+    return list(index), ends[0::2], ends[1::2], w
+
+
+def _gather(indptr: np.ndarray, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Entries of ``rows`` in a CSR structure, as (position in ``rows``, entry index)."""
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    owner = np.repeat(np.arange(len(rows)), counts)
+    entry = np.arange(counts.sum()) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return owner, entry
+
+
+def _chunks(cost: np.ndarray, budget: int) -> Iterable[slice]:
+    """Consecutive slices of ``cost`` summing to at most ``budget`` (or one item) each."""
+    ends = np.cumsum(cost)
+    lo = 0
+    while lo < len(cost):
+        base = ends[lo - 1] if lo else 0
+        hi = max(int(np.searchsorted(ends, base + budget, side="right")), lo + 1)
+        yield slice(lo, hi)
+        lo = hi
+
+
+#: Candidate pairs held in memory at once by the vectorized graph passes.
+_GRAPH_CHUNK = 1 << 22
+
+
 def normalize_edges(edges: list[WeightedEdge]) -> list[WeightedEdge]:
     if not edges:
         return []
@@ -782,92 +905,152 @@ def normalize_edges(edges: list[WeightedEdge]) -> list[WeightedEdge]:
 
 
 def snn_score(edges: list[WeightedEdge], k: int = 10) -> list[WeightedEdge]:
-    adj: dict[str, list[WeightedEdge]] = {}
-    for e in edges:
-        adj.setdefault(e.source, []).append(e)
-        adj.setdefault(e.target, []).append(WeightedEdge(e.target, e.source, e.weight))
-    nbrs: dict[str, set[str]] = {}
-    for node, lst in adj.items():
-        lst.sort(key=lambda x: x.weight, reverse=True)
-        nbrs[node] = {x.target for x in lst[:k]}
-    out: list[WeightedEdge] = []
-    for e in edges:
-        a = nbrs.get(e.source, set())
-        b = nbrs.get(e.target, set())
-        inter = len(a & b)
-        union = len(a | b)
-        out.append(WeightedEdge(e.source, e.target, inter / union if union > 0 else 0.0))
-    return out
+    """Reweight each edge by the Jaccard overlap of its endpoints' top-``k`` neighbours."""
+    if not edges:
+        return []
+    k = max(k, 0)
+    nodes, src, dst, w = _edge_arrays(edges)
+    graph = CsrGraph.undirected(nodes, src, dst, w)
+    n = len(graph)
+    rows = graph.row_ids()
+    # Heaviest first within each row; ties keep edge order
+    order = np.lexsort((np.arange(len(rows)), -graph.weights, rows))
+    rank = np.arange(len(rows)) - graph.indptr[rows[order]]
+    top = order[rank < k]
+    # Neighbour sets: distinct (node, neighbour) pairs, padded to k columns
+    pairs = np.sort(rows[top] * n + graph.indices[top])
+    pairs = pairs[np.diff(pairs, prepend=-1) != 0]
+    owner, nbr = pairs // n, pairs % n
+    sizes = np.bincount(owner, minlength=n)
+    start = np.zeros(n, dtype=np.int64)
+    np.cumsum(sizes[:-1], out=start[1:])
+    padded = np.full((n, max(k, 1)), -1, dtype=np.int64)
+    padded[owner, np.arange(len(pairs)) - start[owner]] = nbr
+
+    inter = np.empty(len(edges), dtype=np.int64)
+    for part in _chunks(np.full(len(edges), k * k + 1), _GRAPH_CHUNK):
+        a, b = padded[src[part]], padded[dst[part]]
+        inter[part] = ((a[:, :, None] == b[:, None, :]) & (a[:, :, None] >= 0)).sum(axis=(1, 2))
+    union = sizes[src] + sizes[dst] - inter
+    score = np.divide(inter, union, out=np.zeros(len(edges)), where=union > 0)
+    return [WeightedEdge(e.source, e.target, float(s)) for e, s in zip(edges, score)]
 
 
 def pfnet_infinity(edges: list[WeightedEdge]) -> list[WeightedEdge]:
-    adj: dict[str, dict[str, float]] = {}
-    for e in edges:
-        adj.setdefault(e.source, {})[e.target] = max(adj.get(e.source, {}).get(e.target, 0), e.weight)
-    keep: list[WeightedEdge] = []
-    for e in edges:
-        dominated = False
-        for x, w_ux in adj.get(e.source, {}).items():
-            if x == e.target:
-                continue
-            w_xv = adj.get(x, {}).get(e.target)
-            if w_xv is None:
-                continue
-            if min(w_ux, w_xv) > e.weight:
-                dominated = True
-                break
-        if not dominated:
-            keep.append(e)
-    return keep
+    """Drop each edge ``u -> v`` beaten by a two-hop path ``u -> x -> v``.
+
+    A path beats the edge when both its hops outweigh it. Hops are the
+    heaviest of the parallel edges (at least 0).
+    """
+    if not edges:
+        return []
+    nodes, src, dst, w = _edge_arrays(edges)
+    n = len(nodes)
+    # Distinct directed edges, sorted by (source, target), with their heaviest weight
+    keys, inverse = np.unique(src * n + dst, return_inverse=True)
+    best = np.zeros(len(keys))
+    np.maximum.at(best, inverse, w)
+    out = CsrGraph.from_arrays(nodes, keys // n, keys % n, best)
+    into = CsrGraph.from_arrays(nodes, keys % n, keys // n, best)
+
+    def lookup(query: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        pos = np.minimum(np.searchsorted(keys, query), len(keys) - 1)
+        return keys[pos] == query, best[pos]
+
+    # Walk whichever is shorter: u's out-list or v's in-list
+    out_deg, in_deg = np.diff(out.indptr), np.diff(into.indptr)
+    from_u = out_deg[src] <= in_deg[dst]
+    dominated = np.zeros(len(edges), dtype=bool)
+    for side, graph in ((from_u, out), (~from_u, into)):
+        ids = np.flatnonzero(side)
+        anchor = src[ids] if graph is out else dst[ids]
+        for part in _chunks(np.diff(graph.indptr)[anchor], _GRAPH_CHUNK):
+            e = ids[part]
+            owner, entry = _gather(graph.indptr, anchor[part])
+            e = e[owner]
+            x, hop = graph.indices[entry], graph.weights[entry]
+            if graph is out:
+                found, other = lookup(x * n + dst[e])
+            else:
+                found, other = lookup(src[e] * n + x)
+            beats = found & (x != dst[e]) & (np.minimum(hop, other) > w[e])
+            dominated[e[beats]] = True
+    return [e for e, drop in zip(edges, dominated) if not drop]
 
 
 def louvain(edges: list[WeightedEdge], passes: int = 10) -> dict[str, int]:
-    nodes: set[str] = set()
-    for e in edges:
-        nodes.add(e.source)
-        nodes.add(e.target)
-    community = {n: i for i, n in enumerate(nodes)}
-    adj: dict[str, list[tuple[str, float]]] = {}
-    total = 0.0
-    for e in edges:
-        adj.setdefault(e.source, []).append((e.target, e.weight))
-        adj.setdefault(e.target, []).append((e.source, e.weight))
-        total += e.weight
-    deg = {n: sum(w for _, w in adj.get(n, [])) for n in nodes}
-    m = total
+    """Multi-level Louvain community detection.
+
+    Each level moves nodes, in order of first appearance, to the neighbouring
+    community with the best modularity gain (for at most ``passes`` sweeps),
+    then merges each community into one node of the next level's graph.
+    Levels stop when nothing moves.
 
+    Returns:
+        Community of each node, numbered from 0 in order of first appearance
+    """
+    if not edges:
+        return {}
+    graph = CsrGraph.from_edges(edges)
+    nodes = graph.nodes
+    membership = np.arange(len(nodes))
+    two_m = max(float(graph.weights.sum()), 1e-9)
+
+    while True:
+        community = _louvain_level(graph, two_m, passes)
+        labels, community = np.unique(community, return_inverse=True)
+        if len(labels) == len(graph):
+            break
+        membership = community[membership]
+        # Aggregate: one node per community, summing the entries between them
+        keys, inverse = np.unique(
+            community[graph.row_ids()] * len(labels) + community[graph.indices], return_inverse=True
+        )
+        weights = np.bincount(inverse, weights=graph.weights)
+        graph = CsrGraph.from_arrays(
+            [str(c) for c in range(len(labels))], keys // len(labels), keys % len(labels), weights
+        )
+
+    _, first = np.unique(membership, return_index=True)
+    renumber = np.empty(len(first), dtype=np.int64)
+    renumber[np.argsort(first)] = np.arange(len(first))
+    return dict(zip(nodes, renumber[membership].tolist()))
+
+
+def _louvain_level(graph: CsrGraph, two_m: float, passes: int) -> list[int]:
+    """Local moving phase; community totals are updated as nodes move."""
+    indptr = graph.indptr.tolist()
+    indices = graph.indices.tolist()
+    weights = graph.weights.tolist()
+    degree = graph.degrees().tolist()
+    community = list(range(len(graph)))
+    totals = list(degree)
     for _ in range(passes):
-        improved = False
-        for n in nodes:
-            cur = community[n]
-            w_to: dict[int, float] = {}
-            for nb, w in adj.get(n, []):
-                c = community[nb]
-                w_to[c] = w_to.get(c, 0) + w
-            best = cur
-            best_gain = 0.0
-            kn = deg.get(n, 0)
-            for c, wnc in w_to.items():
-                if c == cur:
-                    continue
-                sigma_tot = sum(deg[o] for o, comm in community.items() if comm == c and o != n)
-                gain = wnc - (kn * sigma_tot) / max(2 * m, 1e-9)
+        moved = False
+        for i in range(len(graph)):
+            current = community[i]
+            k_i = degree[i]
+            links: dict[int, float] = {}
+            for p in range(indptr[i], indptr[i + 1]):
+                j = indices[p]
+                if j != i:
+                    c = community[j]
+                    links[c] = links.get(c, 0.0) + weights[p]
+            totals[current] -= k_i
+            best = current
+            best_gain = links.get(current, 0.0) - totals[current] * k_i / two_m
+            for c, w_ic in links.items():
+                gain = w_ic - totals[c] * k_i / two_m
                 if gain > best_gain:
                     best_gain = gain
                     best = c
-            if best != cur:
-                community[n] = best
-                improved = True
-        if not improved:
+            totals[best] += k_i
+            if best != current:
+                community[i] = best
+                moved = True
+        if not moved:
             break
-
-    id_map: dict[int, int] = {}
-    nxt = 0
-    for c in community.values():
-        if c not in id_map:
-            id_map[c] = nxt
-            nxt += 1
-    return {n: id_map[c] for n, c in community.items()}
+    return community
 
 
 # ── Document type registry ────────────────────────────────────────────
@@ -32,6 +32,12 @@ class Settings(BaseSettings):
         description="Database backend to use (sqlite, local, lancedb, infinity)",
     )
 
+    # Storage Settings
+    data_dir: Path = Field(
+        Path.home() / ".hanzo" / "memory",
+        description="Directory for local data files such as the embedding cache",
+    )
+
     # InfinityDB Settings
     infinity_db_path: Path = Field(
         Path("data/infinity_db"), description="Path to InfinityDB data directory"
@@ -60,12 +66,40 @@ class Settings(BaseSettings):
         "BAAI/bge-small-en-v1.5", description="FastEmbed model to use"
     )
     embedding_dimensions: int = Field(384, description="Embedding vector dimensions")
+    embedding_cache: bool = Field(True, description="Cache embeddings by text")
+    embedding_cache_path: Path | None = Field(
+        None,
+        description="SQLite file for cached embeddings, shared between processes "
+        "(default: embedding_cache.sqlite in data_dir)",
+    )
+    embedding_cache_max_bytes: int = Field(
+        64 << 20, description="In-process embedding cache size in bytes"
+    )
+    embedding_batch_size: int = Field(
+        64, description="Largest batch of texts embedded at once by the server"
+    )
+    embedding_batch_wait_ms: float = Field(
+        5.0, description="Milliseconds the server waits for an embedding batch to fill"
+    )
+    embedding_queue_size: int = Field(
+        4096, description="Texts queued for embedding before requests must wait"
+    )
+    embedding_queue_timeout: float = Field(
+        1.0, description="Seconds a request waits for embedding queue room before a 503"
+    )
 
     # Memory Settings
     max_memories_per_user: int = Field(10000, description="Maximum memories per user")
     memory_retrieval_limit: int = Field(
         50, description="Default memory retrieval limit"
     )
+    search_dedup: bool = Field(
+        False, description="Return only the best chunk of each document in searches"
+    )
+    search_mmr_lambda: float | None = Field(
+        None,
+        description="Rerank searches for diversity with MMR at this relevance weight (0-1)",
+    )
 
     # Knowledge Base Settings
     max_knowledge_bases_per_user: int = Field(
@@ -92,6 +126,11 @@ class Settings(BaseSettings):
         """Get InfinityDB path as string."""
         return str(self.infinity_db_path.absolute())
 
+    @property
+    def embedding_cache_file(self) -> Path:
+        """SQLite file of the embedding cache."""
+        return self.embedding_cache_path or self.data_dir / "embedding_cache.sqlite"
+
     def ensure_paths(self) -> None:
         """Ensure required paths exist."""
         self.infinity_db_path.mkdir(parents=True, exist_ok=True)
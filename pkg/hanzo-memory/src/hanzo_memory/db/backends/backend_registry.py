@@ -70,7 +70,7 @@ class BackendRegistry:
     BACKENDS: Dict[str, Dict] = {
         "local": {
             "class": LocalMemoryClient,
-            "description": "Local file storage using JSON files",
+            "description": "Local file storage in an append-only log",
             "capabilities": [
                 BackendCapability.PERSISTENCE,
                 BackendCapability.MARKDOWN_IMPORT,
@@ -7,6 +7,9 @@ from typing import Any
 class BaseVectorDB(ABC):
     """Abstract base class for vector database backends."""
 
+    #: Whether ``search_memories`` accepts ``query``, ``dedup`` and ``mmr_lambda``
+    supports_text_query = False
+
     @abstractmethod
     def create_project(
         self,
@@ -173,3 +176,15 @@ class BaseVectorDB(ABC):
         """Create knowledge bases table if not exists (optional for implementations)."""
         # Default implementation does nothing
         return None
+
+    def add_memories(self, memories: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Add many memories at once (optional for implementations).
+
+        Args:
+            memories: Keyword arguments for `add_memory`, one dict per memory
+
+        Returns:
+            The added memories, in order
+        """
+        # Default implementation adds them one at a time
+        return [self.add_memory(**memory) for memory in memories]
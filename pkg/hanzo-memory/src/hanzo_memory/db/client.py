@@ -156,6 +156,31 @@ class InfinityClient(BaseVectorDB):
         table.insert([memory_data])
         return memory_data
 
+    def add_memories(self, memories: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Add many memories with one insert per user table."""
+        db = self._get_db("memories")
+        now = datetime.now(timezone.utc).isoformat()
+        by_user: dict[str, list[dict[str, Any]]] = {}
+        added = []
+        for memory in memories:
+            memory_data = {
+                "memory_id": memory["memory_id"],
+                "user_id": memory["user_id"],
+                "project_id": memory["project_id"],
+                "content": memory["content"],
+                "embedding": memory["embedding"],
+                "metadata": json.dumps(memory.get("metadata") or {}),
+                "importance": memory.get("importance", 1.0),
+                "created_at": now,
+                "updated_at": now,
+            }
+            by_user.setdefault(memory["user_id"], []).append(memory_data)
+            added.append(memory_data)
+
+        for user_id, rows in by_user.items():
+            db.get_table(f"memories_{user_id}").insert(rows)
+        return added
+
     def search_memories(
         self,
         user_id: str,
@@ -0,0 +1,189 @@
+"""SQLite FTS5 index over ``memories.content``.
+
+``memories_fts`` stores each row's ``memory_id`` (``memories`` has a TEXT
+primary key, so its rowids may change on VACUUM) and is kept in sync by
+triggers written in plain SQL, so rows inserted by any connection (the
+hanzo-mcp plugin, the sqlite3 shell) are indexed. Words are Porter-stemmed.
+FTS5's ``unicode61`` tokenizer treats a run of CJK characters as one token,
+so writers that know about CJK also fill ``memories.search_text`` with the
+text split into bigrams (`cjk_search_text`); the triggers index
+``search_text`` when it is set and current, and ``content`` otherwise.
+"""
+
+import re
+import sqlite3
+
+from structlog import get_logger
+
+from ..algorithms import (
+    characterize,
+    cjk_bigrams,
+    has_cjk,
+    parse_websearch,
+    to_fts5_match,
+)
+
+logger = get_logger()
+
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    body, memory_id UNINDEXED,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts (memory_id, body)
+    VALUES (new.memory_id, coalesce(new.search_text, new.content));
+END;
+CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
+    DELETE FROM memories_fts WHERE memory_id = old.memory_id;
+END;
+CREATE TRIGGER IF NOT EXISTS memories_fts_update
+AFTER UPDATE OF memory_id, content, search_text ON memories BEGIN
+    DELETE FROM memories_fts WHERE memory_id = old.memory_id;
+    INSERT INTO memories_fts (memory_id, body) VALUES (
+        new.memory_id,
+        CASE
+            -- content changed by a writer that left search_text alone
+            WHEN new.search_text IS old.search_text AND new.content IS NOT old.content
+            THEN new.content
+            ELSE coalesce(new.search_text, new.content)
+        END
+    );
+END;
+"""
+
+# Index created before memories_fts was keyed on memory_id
+_DROP_ROWID_SCHEMA = """
+DROP TABLE memories_fts;
+DROP TRIGGER IF EXISTS memories_fts_insert;
+DROP TRIGGER IF EXISTS memories_fts_delete;
+DROP TRIGGER IF EXISTS memories_fts_update;
+"""
+
+# Words parse_websearch keeps as terms but FTS5 would read as operators
+_OPERATORS = {"AND", "OR", "NOT", "NEAR"}
+
+
+def cjk_search_text(content: str) -> str | None:
+    """Text to index for ``content``, or None to index ``content`` itself."""
+    if not has_cjk(content):
+        return None
+    return " ".join(cjk_bigrams(content))
+
+
+def ensure_fts(conn: sqlite3.Connection) -> bool:
+    """Create the FTS index and its triggers on ``conn``'s ``memories`` table.
+
+    Existing rows are indexed the first time, and an index keyed on rowids
+    is replaced. Safe to call on every start.
+
+    Args:
+        conn: Connection whose database has a ``memories`` table
+
+    Returns:
+        False if this SQLite build lacks FTS5
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(memories)")}
+    if "search_text" not in columns:
+        conn.execute("ALTER TABLE memories ADD COLUMN search_text TEXT")
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'memories_fts'"
+    ).fetchone()
+    try:
+        if exists and "memory_id" not in {
+            row[1] for row in conn.execute("PRAGMA table_info(memories_fts)")
+        }:
+            conn.executescript(_DROP_ROWID_SCHEMA)
+            exists = None
+        conn.executescript(_SCHEMA)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"SQLite full-text search unavailable: {e}")
+        return False
+    if not exists:
+        rebuild_fts(conn)
+    conn.commit()
+    return True
+
+
+def rebuild_fts(conn: sqlite3.Connection) -> None:
+    """Re-index every memory."""
+    conn.execute("DELETE FROM memories_fts")
+    conn.execute(
+        "INSERT INTO memories_fts (memory_id, body) "
+        "SELECT memory_id, coalesce(search_text, content) FROM memories"
+    )
+    conn.commit()
+
+
+def fts_query(query: str) -> str:
+    """FTS5 MATCH expression for a search-box query.
+
+    Quoted phrases and queries using ``OR``/``-term``/``AND``/``NOT`` keep
+    their websearch meaning. Other queries match any of their words, leaving
+    BM25 to rank rows that contain more of them first. CJK terms become
+    phrases of bigrams, as they are indexed.
+
+    Returns:
+        The expression, or "" if the query has no searchable terms
+    """
+
+    def term(text: str) -> str | None:
+        if not re.search(r"\w", text) or text in _OPERATORS:
+            return None
+        return " ".join(cjk_bigrams(text)) if has_cjk(text) else text
+
+    def terms(texts: list[str]) -> list[str]:
+        return [t for t in map(term, texts) if t]
+
+    parsed = parse_websearch(query)
+    traits = characterize(query)
+    excluded = terms(parsed["excluded"])
+    if traits.is_phrase or traits.is_boolean:
+        required = terms(parsed["required"])
+        optional = [g for g in map(terms, parsed["optional"]) if g]
+    else:
+        words = parsed["required"] + [w for g in parsed["optional"] for w in g]
+        required, optional = [], [g for g in [terms(words)] if g]
+    if not required and not optional:
+        return ""
+    return to_fts5_match(
+        {"required": required, "optional": optional, "excluded": excluded}
+    )
+
+
+def fts_search(
+    conn: sqlite3.Connection,
+    query: str,
+    where: str = "1",
+    params: list | tuple = (),
+    limit: int = 10,
+) -> list[sqlite3.Row | tuple]:
+    """Best ``memories`` rows for ``query`` by BM25.
+
+    Args:
+        conn: Connection with `ensure_fts` applied
+        query: Search-box query (see `fts_query`)
+        where: Extra condition on the ``memories`` row, aliased ``m``
+        params: Parameters of ``where``
+        limit: Maximum rows
+
+    Returns:
+        Rows of ``memories`` (all columns), best first
+    """
+    match = fts_query(query)
+    if not match:
+        return []
+    try:
+        return conn.execute(
+            f"""
+            SELECT m.*
+            FROM memories_fts JOIN memories AS m ON m.memory_id = memories_fts.memory_id
+            WHERE memories_fts MATCH ? AND {where}
+            ORDER BY memories_fts.rank
+            LIMIT ?
+            """,
+            [match, *params, limit],
+        ).fetchall()
+    except sqlite3.OperationalError as e:
+        logger.debug(f"Full-text query {match!r} failed: {e}")
+        return []
@@ -1,12 +1,12 @@
 """KuzuDB client for graph-based memory storage."""
 
 import json
+import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import numpy as np
 from structlog import get_logger
 
 from ..config import settings
@@ -14,6 +14,8 @@ from ..models.memory import Memory, MemoryCreate, MemoryResponse
 from ..models.project import Project, ProjectCreate
 from ..models.fact import Fact, FactCreate
 from .base import BaseVectorDB
+from .markdown_reader import MarkdownChanges, MarkdownMemoryReader, MarkdownWatcher
+from .vector_index import IVFFlatIndex, VectorIndex
 
 logger = get_logger()
 
@@ -29,12 +31,22 @@ except ImportError:
 class KuzuDBClient(BaseVectorDB):
     """KuzuDB implementation for graph-based memory storage."""
 
-    def __init__(self, db_path: Optional[str] = None, enable_markdown: bool = True):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        enable_markdown: bool = True,
+        vector_index: Optional[VectorIndex] = None,
+        markdown_watch_interval: Optional[float] = None,
+    ):
         """Initialize KuzuDB client.
 
         Args:
             db_path: Path to KuzuDB database directory
             enable_markdown: Whether to import markdown files
+            vector_index: Index used to search memory embeddings (default: an
+                IVFFlatIndex persisted next to the database in kuzudb_index)
+            markdown_watch_interval: Seconds between scans of the markdown
+                files for changes; None to import them once
         """
         if not KUZU_AVAILABLE:
             raise ImportError("KuzuDB not installed. Install with: pip install kuzu")
@@ -45,17 +57,32 @@ class KuzuDBClient(BaseVectorDB):
         # Initialize KuzuDB database
         self.db = kuzu.Database(str(self.db_path))
         self.conn = kuzu.Connection(self.db)
+        # Held around each use of the connection and the index (see `_query`):
+        # markdown changes are applied on the watcher's thread, and neither is
+        # safe to share between threads.
+        self._lock = threading.RLock()
 
         # Initialize schema
         self._init_schema()
 
-        # Import markdown if enabled
+        self.memory_index = vector_index or IVFFlatIndex(
+            self.db_path.parent / "kuzudb_index"
+        )
+        self._sync_memory_index()
+
+        # Import markdown in the background if enabled
         self.enable_markdown = enable_markdown
+        self.markdown_reader: Optional[MarkdownMemoryReader] = None
+        self.markdown_watcher: Optional[MarkdownWatcher] = None
         if enable_markdown:
-            from ..markdown_memory import MarkdownMemoryReader
-
-            self.markdown_reader = MarkdownMemoryReader()
-            self._import_markdown_memories()
+            self.markdown_reader = MarkdownMemoryReader(
+                manifest_path=self.db_path.parent / "kuzudb_markdown.json"
+            )
+            self.markdown_watcher = MarkdownWatcher(
+                self.markdown_reader,
+                self._apply_markdown_changes,
+                interval=markdown_watch_interval,
+            ).start()
 
         logger.info(f"Initialized KuzuDB storage at {self.db_path}")
 
@@ -143,12 +170,21 @@ class KuzuDBClient(BaseVectorDB):
                 # Table might already exist
                 logger.debug(f"Schema creation note: {e}")
 
+    def _query(self, query: str, params: Optional[Dict[str, Any]] = None) -> list:
+        """Run ``query`` and read all of its rows while holding the lock."""
+        with self._lock:
+            return list(self.conn.execute(query, params or {}))
+
     async def initialize(self) -> None:
         """Initialize the database."""
         logger.info("KuzuDB initialized")
 
     async def close(self) -> None:
         """Close database connection."""
+        if self.markdown_watcher:
+            self.markdown_watcher.stop()
+        with self._lock:
+            self.memory_index.flush()
         if hasattr(self, "conn"):
             # KuzuDB doesn't have explicit close, but we can clean up
             self.conn = None
@@ -160,7 +196,7 @@ class KuzuDBClient(BaseVectorDB):
         now = datetime.now(timezone.utc).isoformat()
 
         # Create project node
-        self.conn.execute(
+        self._query(
             """MERGE (p:Project {project_id: $pid})
             SET p.name = $name,
                 p.description = $desc,
@@ -179,7 +215,7 @@ class KuzuDBClient(BaseVectorDB):
         )
 
         # Create or connect user
-        self.conn.execute(
+        self._query(
             """MERGE (u:User {user_id: $uid})
             ON CREATE SET u.created_at = $created
             """,
@@ -187,7 +223,7 @@ class KuzuDBClient(BaseVectorDB):
         )
 
         # Create ownership relationship
-        self.conn.execute(
+        self._query(
             """MATCH (u:User {user_id: $uid}), (p:Project {project_id: $pid})
             MERGE (u)-[:OWNS]->(p)
             """,
@@ -223,7 +259,7 @@ class KuzuDBClient(BaseVectorDB):
         now = datetime.now(timezone.utc).isoformat()
 
         # Create memory node
-        self.conn.execute(
+        self._query(
             """MERGE (m:Memory {memory_id: $mid})
             SET m.content = $content,
                 m.memory_type = $mtype,
@@ -252,13 +288,21 @@ class KuzuDBClient(BaseVectorDB):
         )
 
         # Connect to project
-        self.conn.execute(
+        self._query(
             """MATCH (p:Project {project_id: $pid}), (m:Memory {memory_id: $mid})
             MERGE (p)-[:HAS_MEMORY {user_id: $uid}]->(m)
             """,
             {"pid": project_id, "mid": memory_id, "uid": user_id},
         )
 
+        with self._lock:
+            self.memory_index.add(
+                memory_id,
+                embedding or [0.0] * (self.memory_index.dim or settings.embedding_dimensions),
+                user_id,
+                project_id,
+            )
+
         # Find and create relationships to related memories
         if embedding:
             self._create_memory_relationships(memory_id, embedding, project_id)
@@ -278,40 +322,46 @@ class KuzuDBClient(BaseVectorDB):
         self, memory_id: str, embedding: list[float], project_id: str
     ):
         """Create relationships between related memories based on similarity."""
-        # Find similar memories in the same project
-        results = self.conn.execute(
-            """MATCH (p:Project {project_id: $pid})-[:HAS_MEMORY]->(m:Memory)
-            WHERE m.memory_id <> $mid AND m.embedding IS NOT NULL
-            RETURN m.memory_id, m.embedding
-            LIMIT 10
-            """,
-            {"pid": project_id, "mid": memory_id},
+        # Find the most similar memories in the same project
+        with self._lock:
+            hits = self.memory_index.search(
+                embedding,
+                10,
+                project_ids=[project_id],
+                predicate=lambda key: key != memory_id,
+            )
+        for other_id, similarity in hits:
+            if similarity <= 0.7:  # Only create strong relationships
+                break
+            self._query(
+                """MATCH (m1:Memory {memory_id: $mid1}), (m2:Memory {memory_id: $mid2})
+                MERGE (m1)-[:RELATES_TO {relationship_type: 'similar', strength: $strength}]->(m2)
+                """,
+                {"mid1": memory_id, "mid2": other_id, "strength": similarity},
+            )
+
+    def _sync_memory_index(self) -> None:
+        """Rebuild the memory index if it does not match the stored memories."""
+        rows = self._query(
+            "MATCH (:Project)-[:HAS_MEMORY]->(m:Memory) RETURN count(m)"
         )
+        total = next(iter(rows))[0]
+        if total == len(self.memory_index):
+            return
 
-        query_vec = np.array(embedding)
-        for row in results:
-            other_id = row[0]
-            other_embedding = row[1]
-            if other_embedding:
-                similarity = self._compute_similarity(
-                    query_vec, np.array(other_embedding)
-                )
-                if similarity > 0.7:  # Only create strong relationships
-                    self.conn.execute(
-                        """MATCH (m1:Memory {memory_id: $mid1}), (m2:Memory {memory_id: $mid2})
-                        MERGE (m1)-[:RELATES_TO {relationship_type: 'similar', strength: $strength}]->(m2)
-                        """,
-                        {"mid1": memory_id, "mid2": other_id, "strength": similarity},
-                    )
-
-    def _compute_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Compute cosine similarity between two vectors."""
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        return float(dot_product / (norm1 * norm2))
+        logger.info(f"Rebuilding memory vector index over {total} memories")
+        results = self._query(
+            """MATCH (p:Project)-[r:HAS_MEMORY]->(m:Memory)
+            RETURN m.memory_id, r.user_id, p.project_id, m.embedding
+            """
+        )
+        with self._lock:
+            self.memory_index.clear()
+            dim = self.memory_index.dim or settings.embedding_dimensions
+            self.memory_index.add_many(
+                (memory_id, embedding or [0.0] * dim, user_id, project_id)
+                for memory_id, user_id, project_id, embedding in results
+            )
 
     def search_memories(
         self,
@@ -321,66 +371,111 @@ class KuzuDBClient(BaseVectorDB):
         limit: int = 10,
         memory_type: Optional[str] = None,
     ) -> Any:
-        """Search memories using graph traversal and vector similarity."""
+        """Search memories using graph traversal and vector similarity.
+
+        With a query embedding, the vector index ranks every memory in the
+        user's projects and the top hits are then read from the graph; without
+        one, memories are returned unranked.
+        """
         import pandas as pd
 
-        # Build the query
+        if not query_embedding:
+            return pd.DataFrame(
+                self._fetch_memories(user_id, project_id, memory_type, limit=limit)
+            )
+
+        owned = [
+            row[0]
+            for row in self._query(
+                """MATCH (u:User {user_id: $uid})-[:OWNS]->(p:Project)
+                RETURN p.project_id
+                """,
+                {"uid": user_id},
+            )
+        ]
+        if project_id:
+            owned = [pid for pid in owned if pid == project_id]
+        if not owned:
+            return pd.DataFrame([])
+
+        # The index does not know memory types, so widen the search until
+        # enough hits of the requested type come back.
+        k = limit if not memory_type else limit * 4
+        while True:
+            with self._lock:
+                hits = self.memory_index.search(query_embedding, k, project_ids=owned)
+            scores = dict(hits)
+            rows = self._fetch_memories(
+                user_id, None, memory_type, ids=list(scores), project_ids=owned
+            )
+            if len(rows) >= limit or len(hits) < k:
+                break
+            k *= 4
+
+        for row in rows:
+            row["similarity_score"] = scores[row["memory_id"]]
+        rows.sort(key=lambda x: x["similarity_score"], reverse=True)
+        return pd.DataFrame(rows[:limit])
+
+    def _fetch_memories(
+        self,
+        user_id: str,
+        project_id: Optional[str],
+        memory_type: Optional[str],
+        *,
+        limit: Optional[int] = None,
+        ids: Optional[List[str]] = None,
+        project_ids: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read memories in the user's projects as search result rows."""
         where_clause = []
-        params = {"uid": user_id, "limit": limit}
+        params: Dict[str, Any] = {"uid": user_id}
 
         if project_id:
             where_clause.append("p.project_id = $pid")
             params["pid"] = project_id
 
+        if project_ids is not None:
+            where_clause.append("p.project_id IN $pids")
+            params["pids"] = project_ids
+
+        if ids is not None:
+            where_clause.append("m.memory_id IN $ids")
+            params["ids"] = ids
+
         if memory_type:
             where_clause.append("m.memory_type = $mtype")
             params["mtype"] = memory_type
 
         where = " AND ".join(where_clause) if where_clause else "1=1"
-
-        # Query memories
         query = f"""
             MATCH (u:User {{user_id: $uid}})-[:OWNS]->(p:Project)-[:HAS_MEMORY]->(m:Memory)
             WHERE {where}
             RETURN m.memory_id, m.content, m.memory_type, m.importance,
-                   m.context, m.metadata, m.source, m.embedding,
+                   m.context, m.metadata, m.source,
                    m.created_at, m.updated_at, p.project_id, $uid as user_id
-            LIMIT $limit
         """
+        if limit is not None:
+            query += "LIMIT $limit"
+            params["limit"] = limit
 
-        results = self.conn.execute(query, params)
-
-        # Calculate similarities and build dataframe
-        data = []
-        query_vec = np.array(query_embedding) if query_embedding else None
-
-        for row in results:
-            similarity = 0.0
-            if query_vec is not None and row[7]:  # embedding
-                similarity = self._compute_similarity(query_vec, np.array(row[7]))
-
-            data.append(
-                {
-                    "memory_id": row[0],
-                    "content": row[1],
-                    "memory_type": row[2],
-                    "importance": row[3],
-                    "context": row[4],
-                    "metadata": row[5],
-                    "source": row[6],
-                    "created_at": row[8],
-                    "updated_at": row[9],
-                    "project_id": row[10],
-                    "user_id": row[11],
-                    "similarity_score": similarity,
-                }
-            )
-
-        # Sort by similarity if we have embeddings
-        if query_embedding:
-            data.sort(key=lambda x: x["similarity_score"], reverse=True)
-
-        return pd.DataFrame(data[:limit])
+        return [
+            {
+                "memory_id": row[0],
+                "content": row[1],
+                "memory_type": row[2],
+                "importance": row[3],
+                "context": row[4],
+                "metadata": row[5],
+                "source": row[6],
+                "created_at": row[7],
+                "updated_at": row[8],
+                "project_id": row[9],
+                "user_id": row[10],
+                "similarity_score": 0.0,
+            }
+            for row in self._query(query, params)
+        ]
 
     async def search_memories_async(
         self,
@@ -475,7 +570,7 @@ class KuzuDBClient(BaseVectorDB):
             LIMIT $limit
         """
 
-        results = self.conn.execute(query, params)
+        results = self._query(query, params)
 
         memories = []
         for row in results:
@@ -501,7 +596,7 @@ class KuzuDBClient(BaseVectorDB):
         """List all projects for a user."""
         user_id = user_id or "default"
 
-        results = self.conn.execute(
+        results = self._query(
             """MATCH (u:User {user_id: $uid})-[:OWNS]->(p:Project)
             RETURN p.project_id, p.name, p.description, p.metadata,
                    p.created_at, p.updated_at
@@ -529,17 +624,21 @@ class KuzuDBClient(BaseVectorDB):
         """Create memories table (no-op for KuzuDB as schema is predefined)."""
         pass
 
-    def _import_markdown_memories(self):
-        """Import memories from markdown files."""
-        if not self.markdown_reader:
+    def _import_markdown_memories(self) -> None:
+        """Import changed markdown files now, on the calling thread."""
+        if not self.markdown_watcher:
             return
 
-        memories = self.markdown_reader.read_all_memories()
-        imported_count = 0
+        try:
+            self.markdown_watcher.scan_once()
+        except Exception as e:
+            logger.error(f"Error importing markdown memories: {e}")
 
+    def _apply_markdown_changes(self, changes: MarkdownChanges) -> None:
+        """Store the sections a markdown scan added and drop those it removed."""
         # Create a special project for markdown imports
         project_id = "markdown_import"
-        self.conn.execute(
+        self._query(
             """MERGE (p:Project {project_id: $pid})
             SET p.name = $name,
                 p.description = $desc,
@@ -555,8 +654,16 @@ class KuzuDBClient(BaseVectorDB):
             },
         )
 
-        for memory_create in memories:
-            memory_id = str(uuid.uuid4())
+        for memory_id in changes.removed:
+            self._query(
+                "MATCH (m:Memory {memory_id: $mid}) DETACH DELETE m",
+                {"mid": memory_id},
+            )
+            with self._lock:
+                self.memory_index.remove(memory_id)
+
+        # Section ids are stable, so re-adding a known section merges into it
+        for memory_id, memory_create in changes.added.items():
             self.add_memory(
                 memory_id=memory_id,
                 user_id="system",
@@ -571,12 +678,11 @@ class KuzuDBClient(BaseVectorDB):
                 },
                 importance=memory_create.importance,
             )
-            imported_count += 1
 
-        if imported_count > 0:
-            logger.info(
-                f"Imported {imported_count} memories from markdown files to KuzuDB"
-            )
+        logger.info(
+            f"Imported {len(changes.added)} and removed {len(changes.removed)} "
+            "markdown memories to KuzuDB"
+        )
 
     # Additional methods for graph-specific operations
     def get_related_memories(
@@ -596,7 +702,7 @@ class KuzuDBClient(BaseVectorDB):
             ORDER BY r.strength DESC
         """
 
-        results = self.conn.execute(query, params)
+        results = self._query(query, params)
 
         related = []
         for row in results:
@@ -620,7 +726,7 @@ class KuzuDBClient(BaseVectorDB):
             LIMIT 100
         """
 
-        nodes_results = self.conn.execute(nodes_query, {"pid": project_id})
+        nodes_results = self._query(nodes_query, {"pid": project_id})
 
         nodes = []
         node_ids = set()
@@ -642,7 +748,7 @@ class KuzuDBClient(BaseVectorDB):
             RETURN m1.memory_id, m2.memory_id, r.relationship_type, r.strength
         """
 
-        edges_results = self.conn.execute(edges_query, {"ids": list(node_ids)})
+        edges_results = self._query(edges_query, {"ids": list(node_ids)})
 
         edges = []
         for row in edges_results:
@@ -1,10 +1,12 @@
 """Local file-based memory storage implementation."""
 
+import functools
 import json
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from structlog import get_logger
@@ -12,48 +14,104 @@ from structlog import get_logger
 from ..models.knowledge import Fact, FactCreate, KnowledgeBase
 from ..models.memory import Memory, MemoryCreate, MemoryResponse
 from ..models.project import Project, ProjectCreate
+from ..similarity import VectorMatrix
 from .base import BaseVectorDB
-from .markdown_reader import MarkdownMemoryReader
+from .log_store import VECTORS, LogStore
+from .markdown_reader import MarkdownChanges, MarkdownMemoryReader, MarkdownWatcher
+from .vector_index import IVFFlatIndex, VectorIndex
 
 logger = get_logger()
 
 
+def _locked(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Run a synchronous client method holding the client's lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: "LocalMemoryClient", *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class LocalMemoryClient(BaseVectorDB):
-    """Local file-based implementation of the vector database."""
+    """Local file-based implementation of the vector database.
+
+    Memories, facts, projects and embeddings are kept in an append-only
+    `LogStore` under ``storage_dir/log``; each change appends one record.
+    """
 
     def __init__(
-        self, storage_dir: Optional[Path] = None, enable_markdown: bool = True
+        self,
+        storage_dir: Optional[Path] = None,
+        enable_markdown: bool = True,
+        vector_index: Optional[VectorIndex] = None,
+        fsync: bool = True,
+        markdown_watch_interval: Optional[float] = None,
     ):
         """Initialize local memory storage.
 
+        Markdown files are imported on a background thread; see
+        ``markdown_watcher``.
+
         Args:
             storage_dir: Directory to store memory files
             enable_markdown: Whether to enable markdown file integration
+            vector_index: Index used to search memory embeddings (default: an
+                IVFFlatIndex persisted under storage_dir/memory_index)
+            fsync: Whether each change is flushed to disk before returning
+            markdown_watch_interval: Seconds between scans of the markdown
+                files for changes; None to import them once
         """
         self.storage_dir = storage_dir or Path.home() / ".hanzo" / "memory"
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-        # File paths for different collections
+        # Files written by earlier versions, imported once into the log
         self.memories_file = self.storage_dir / "memories.json"
         self.facts_file = self.storage_dir / "facts.json"
         self.projects_file = self.storage_dir / "projects.json"
         self.embeddings_file = self.storage_dir / "embeddings.npz"
         self.markdown_index_file = self.storage_dir / "markdown_index.json"
+        # How far into the log the saved memory index reflects
+        self.memory_index_mark_file = self.storage_dir / "memory_index_mark.json"
+
+        # Held by the `_locked` methods, which do the store and index work:
+        # markdown changes are applied on the watcher's thread, and neither the
+        # index nor a store batch may interleave with the caller's work.
+        # Coroutines only call those methods, so never hold it themselves.
+        self._lock = threading.RLock()
+
+        # Open the log; records are read lazily
+        self.store = LogStore(self.storage_dir / "log", fsync=fsync)
+        self.memories = self.store.collection("memories")
+        self.facts = self.store.collection("facts")
+        self.projects = self.store.collection("projects")
+        self.embeddings = self.store.vectors
+        self._migrate_json_files()
+
+        # Only an index persisted here can be trusted to match a saved mark
+        self._owns_memory_index = vector_index is None
+        self.memory_index = vector_index or IVFFlatIndex(
+            self.storage_dir / "memory_index"
+        )
+        self._sync_memory_index()
+        self._fact_vectors: Optional[VectorMatrix] = None
 
-        # Load existing data
-        self.memories = self._load_json(self.memories_file)
-        self.facts = self._load_json(self.facts_file)
-        self.projects = self._load_json(self.projects_file)
-        self.embeddings = self._load_embeddings()
-        self.markdown_index = self._load_json(self.markdown_index_file)
-
-        # Initialize markdown reader if enabled
+        # Import markdown memories in the background if enabled
         self.enable_markdown = enable_markdown
-        self.markdown_reader = MarkdownMemoryReader() if enable_markdown else None
-
-        # Import markdown memories on initialization
+        self.markdown_reader: Optional[MarkdownMemoryReader] = None
+        self.markdown_watcher: Optional[MarkdownWatcher] = None
+        # Markdown memories of earlier versions have random ids; replaced once
+        self._markdown_legacy = not self.markdown_index_file.exists()
         if self.enable_markdown:
-            self._import_markdown_memories()
+            self.markdown_reader = MarkdownMemoryReader(
+                manifest_path=self.markdown_index_file
+            )
+            self.markdown_watcher = MarkdownWatcher(
+                self.markdown_reader,
+                self._apply_markdown_changes,
+                interval=markdown_watch_interval,
+            ).start()
 
         logger.info(f"Initialized local memory storage at {self.storage_dir}")
 
@@ -67,52 +125,147 @@ class LocalMemoryClient(BaseVectorDB):
                 logger.error(f"Error loading {file_path}: {e}")
         return {}
 
-    def _save_json(self, data: Dict[str, Any], file_path: Path):
-        """Save JSON data to file."""
-        try:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Error saving {file_path}: {e}")
+    def _migrate_json_files(self) -> None:
+        """Import the whole-file JSON/npz storage of earlier versions into the log.
 
-    def _load_embeddings(self) -> Dict[str, np.ndarray]:
-        """Load embeddings from file."""
-        if self.embeddings_file.exists():
-            try:
-                data = np.load(self.embeddings_file, allow_pickle=True)
-                return {k: v for k, v in data.items()}
-            except Exception as e:
-                logger.error(f"Error loading embeddings: {e}")
-        return {}
+        Imported files are renamed with a ``.migrated`` suffix.
+        """
+        legacy = [
+            (self.memories, self.memories_file),
+            (self.facts, self.facts_file),
+            (self.projects, self.projects_file),
+        ]
+        if not any(path.exists() for _, path in legacy) and not self.embeddings_file.exists():
+            return
 
-    def _save_embeddings(self):
-        """Save embeddings to file."""
+        with self.store.batch():
+            for collection, path in legacy:
+                for key, value in self._load_json(path).items():
+                    collection[key] = value
+            if self.embeddings_file.exists():
+                try:
+                    with np.load(self.embeddings_file, allow_pickle=False) as data:
+                        for key in data.files:
+                            self.embeddings[key] = data[key]
+                except Exception as e:
+                    logger.error(f"Error loading embeddings: {e}")
+        self.store.checkpoint()
+
+        for path in [p for _, p in legacy] + [self.embeddings_file]:
+            if path.exists():
+                path.rename(path.with_name(path.name + ".migrated"))
+        logger.info(f"Migrated local memory storage in {self.storage_dir} to the log format")
+
+    @property
+    def fact_vectors(self) -> VectorMatrix:
+        """Fact embeddings for search, built on first use."""
+        if self._fact_vectors is None:
+            self._fact_vectors = VectorMatrix()
+            fact_ids = [fid for fid in self.facts if f"fact_{fid}" in self.embeddings]
+            if fact_ids:
+                self._fact_vectors.add_many(
+                    fact_ids, [self.embeddings[f"fact_{fid}"] for fid in fact_ids]
+                )
+        return self._fact_vectors
+
+    def _sync_memory_index(self) -> None:
+        """Bring the memory index up to date with the stored embeddings.
+
+        The index is saved with a mark of how far into the log it reflects,
+        and only the memories changed after that are re-indexed. Without a
+        usable mark (a caller-supplied index, a log compacted since, or an
+        index that is not the one saved) every memory is checked, and the
+        index rebuilt if it does not match.
+        """
+        changed = self._memories_changed_since_index()
+        if changed is not None:
+            for mem_id in changed:
+                if mem_id in self.memories and f"memory_{mem_id}" in self.embeddings:
+                    self._index_memory(mem_id)
+                else:
+                    self.memory_index.remove(mem_id)
+            if changed:
+                logger.info(f"Re-indexed {len(changed)} memories changed since the index was saved")
+                self._save_memory_index()
+            return
+
+        expected = {
+            mem_id
+            for mem_id in self.memories
+            if f"memory_{mem_id}" in self.embeddings
+        }
+        if len(self.memory_index) != len(expected) or not all(
+            mem_id in self.memory_index for mem_id in expected
+        ):
+            logger.info(f"Rebuilding memory vector index over {len(expected)} memories")
+            self.memory_index.clear()
+            self.memory_index.add_many(self._index_entry(mem_id) for mem_id in expected)
+        self._save_memory_index()
+
+    def _memories_changed_since_index(self) -> Optional[set[str]]:
+        """Ids of memories written after the saved index, None if unknown."""
+        if not self._owns_memory_index:
+            return None
         try:
-            np.savez_compressed(self.embeddings_file, **self.embeddings)
-        except Exception as e:
-            logger.error(f"Error saving embeddings: {e}")
-
-    def _compute_similarity(
-        self, embedding1: np.ndarray, embedding2: np.ndarray
-    ) -> float:
-        """Compute cosine similarity between two embeddings."""
-        dot_product = np.dot(embedding1, embedding2)
-        norm1 = np.linalg.norm(embedding1)
-        norm2 = np.linalg.norm(embedding2)
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        return float(dot_product / (norm1 * norm2))
+            saved = json.loads(self.memory_index_mark_file.read_text())
+            # The index saves itself too, so it may be ahead of the mark, but
+            # an empty one where entries were saved has been lost or replaced
+            if saved["count"] and not len(self.memory_index):
+                return None
+            changes = self.store.changed_since(saved["mark"])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable {self.memory_index_mark_file}: {e}")
+            return None
+        if changes is None:
+            return None
+        return {
+            key.removeprefix("memory_") if collection == VECTORS else key
+            for collection, key in changes
+            if collection == "memories"
+            or (collection == VECTORS and key.startswith("memory_"))
+        }
+
+    def _save_memory_index(self) -> None:
+        """Persist the memory index, and mark how far into the log it reflects.
+
+        The mark is taken first and written last, so a crash in between only
+        leaves it behind the index: replaying from it is harmless.
+        """
+        if not self._owns_memory_index:
+            self.memory_index.flush()
+            return
+        with self._lock:
+            mark = self.store.mark()
+            self.memory_index.flush()
+            saved = {"mark": list(mark), "count": len(self.memory_index)}
+        tmp = self.memory_index_mark_file.with_name(self.memory_index_mark_file.name + ".tmp")
+        tmp.write_text(json.dumps(saved))
+        tmp.replace(self.memory_index_mark_file)
+
+    def _index_entry(self, memory_id: str) -> Tuple[str, Any, str, str]:
+        memory = self.memories[memory_id]
+        return (
+            memory_id,
+            self.embeddings[f"memory_{memory_id}"],
+            memory.get("user_id", "default"),
+            memory.get("project_id", ""),
+        )
+
+    def _index_memory(self, memory_id: str) -> None:
+        self.memory_index.add(*self._index_entry(memory_id))
 
     async def initialize(self) -> None:
         """Initialize the database (no-op for local storage)."""
         logger.info("Local memory storage initialized")
 
     async def close(self) -> None:
-        """Close the database connection (save all data)."""
-        self._save_json(self.memories, self.memories_file)
-        self._save_json(self.facts, self.facts_file)
-        self._save_json(self.projects, self.projects_file)
-        self._save_embeddings()
+        """Close the database connection (checkpoint the log)."""
+        if self.markdown_watcher:
+            self.markdown_watcher.stop()
+        self._save_memory_index()
+        self.store.close()
         logger.info("Local memory storage closed")
 
     # Memory operations
@@ -125,6 +278,7 @@ class LocalMemoryClient(BaseVectorDB):
         # Create memory object
         memory_data = {
             "id": memory_id,
+            "memory_id": memory_id,
             "project_id": project_id,
             "user_id": user_id or "default",
             "content": memory.content,
@@ -138,21 +292,34 @@ class LocalMemoryClient(BaseVectorDB):
             "updated_at": datetime.utcnow().isoformat(),
         }
 
-        # Store memory
-        self.memories[memory_id] = memory_data
+        self._store_memory(memory_id, memory_data, memory.embedding)
 
-        # Store embedding if provided
-        if memory.embedding:
-            self.embeddings[f"memory_{memory_id}"] = np.array(memory.embedding)
+        return Memory(**memory_data)
 
-        # Save to disk
-        self._save_json(self.memories, self.memories_file)
-        if memory.embedding:
-            self._save_embeddings()
+    @_locked
+    def _store_memory(
+        self, memory_id: str, memory_data: Dict[str, Any], embedding: Optional[List[float]]
+    ) -> None:
+        """Store a memory and its embedding, and index it."""
+        with self.store.batch():
+            self.memories[memory_id] = memory_data
+            if embedding:
+                self.embeddings[f"memory_{memory_id}"] = embedding
+        if embedding:
+            self._index_memory(memory_id)
 
-        # Return with proper memory_id field
-        memory_data["memory_id"] = memory_id  # Ensure memory_id is set
-        return Memory(**memory_data)
+    @_locked
+    def _search_index(
+        self, query_embedding: List[float], limit: int, **filters: Any
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """Search the memory index; (memory, similarity) pairs, best first."""
+        hits = self.memory_index.search(query_embedding, limit, **filters)
+        return [(self.memories[mem_id], similarity) for mem_id, similarity in hits]
+
+    @_locked
+    def _records(self, collection: Any) -> List[Dict[str, Any]]:
+        """All records of a store collection."""
+        return list(collection.values())
 
     def search_memories(
         self,
@@ -163,29 +330,21 @@ class LocalMemoryClient(BaseVectorDB):
         memory_type: Optional[str] = None,
     ) -> Any:
         """Search for similar memories synchronously."""
-        query_vec = np.array(query_embedding)
-        results = []
 
-        for mem_id, memory in self.memories.items():
-            # Filter by project and user
-            if project_id and memory.get("project_id") != project_id:
-                continue
-            if user_id and memory.get("user_id") != user_id:
-                continue
-            if memory_type and memory.get("memory_type") != memory_type:
-                continue
-
-            # Calculate similarity if embedding exists
-            embedding_key = f"memory_{mem_id}"
-            if embedding_key in self.embeddings:
-                similarity = self._compute_similarity(
-                    query_vec, self.embeddings[embedding_key]
-                )
-                results.append({"memory": memory, "similarity": similarity})
+        def wanted(mem_id: str) -> bool:
+            return self.memories[mem_id].get("memory_type") == memory_type
 
-        # Sort by similarity and limit
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        results = results[:limit]
+        hits = self._search_index(
+            query_embedding,
+            limit,
+            user_id=user_id or None,
+            project_ids=[project_id] if project_id else None,
+            predicate=wanted if memory_type else None,
+        )
+        results = [
+            {"memory": memory, "similarity": similarity}
+            for memory, similarity in hits
+        ]
 
         # Convert to dataframe-like structure for compatibility
         import pandas as pd
@@ -226,31 +385,24 @@ class LocalMemoryClient(BaseVectorDB):
         min_importance: float = 0.0,
     ) -> List[MemoryResponse]:
         """Search for similar memories."""
-        query_vec = np.array(query_embedding)
-        results = []
 
-        for mem_id, memory in self.memories.items():
-            # Filter by project and user
-            if memory["project_id"] != project_id:
-                continue
-            if user_id and memory.get("user_id") != user_id:
-                continue
+        def wanted(mem_id: str) -> bool:
+            memory = self.memories[mem_id]
             if memory_type and memory.get("memory_type") != memory_type:
-                continue
-            if memory.get("importance", 0) < min_importance:
-                continue
-
-            # Calculate similarity if embedding exists
-            embedding_key = f"memory_{mem_id}"
-            if embedding_key in self.embeddings:
-                similarity = self._compute_similarity(
-                    query_vec, self.embeddings[embedding_key]
-                )
-                results.append({"memory": Memory(**memory), "similarity": similarity})
-
-        # Sort by similarity and limit
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        results = results[:limit]
+                return False
+            return memory.get("importance", 0) >= min_importance
+
+        hits = self._search_index(
+            query_embedding,
+            limit,
+            user_id=user_id or None,
+            project_ids=[project_id],
+            predicate=wanted,
+        )
+        results = [
+            {"memory": Memory(**memory), "similarity": similarity}
+            for memory, similarity in hits
+        ]
 
         return [
             MemoryResponse(
@@ -271,7 +423,7 @@ class LocalMemoryClient(BaseVectorDB):
         """Get recent memories."""
         results = []
 
-        for memory in self.memories.values():
+        for memory in self._records(self.memories):
             # Filter
             if memory["project_id"] != project_id:
                 continue
@@ -290,18 +442,20 @@ class LocalMemoryClient(BaseVectorDB):
 
     async def delete_memory(self, memory_id: str, project_id: str) -> bool:
         """Delete a memory."""
+        return self._delete_memory(memory_id, project_id)
+
+    @_locked
+    def _delete_memory(self, memory_id: str, project_id: str) -> bool:
         if memory_id in self.memories:
             if self.memories[memory_id]["project_id"] == project_id:
-                del self.memories[memory_id]
+                with self.store.batch():
+                    del self.memories[memory_id]
 
-                # Remove embedding
-                embedding_key = f"memory_{memory_id}"
-                if embedding_key in self.embeddings:
-                    del self.embeddings[embedding_key]
-
-                # Save changes
-                self._save_json(self.memories, self.memories_file)
-                self._save_embeddings()
+                    # Remove embedding
+                    embedding_key = f"memory_{memory_id}"
+                    if embedding_key in self.embeddings:
+                        del self.embeddings[embedding_key]
+                self.memory_index.remove(memory_id)
                 return True
         return False
 
@@ -326,19 +480,22 @@ class LocalMemoryClient(BaseVectorDB):
             "updated_at": datetime.utcnow().isoformat(),
         }
 
-        self.facts[fact_id] = fact_data
-
-        # Store embedding if provided
-        if fact.embedding:
-            self.embeddings[f"fact_{fact_id}"] = np.array(fact.embedding)
-
-        # Save to disk
-        self._save_json(self.facts, self.facts_file)
-        if fact.embedding:
-            self._save_embeddings()
+        self._store_fact(fact_id, fact_data, fact.embedding)
 
         return Fact(**fact_data)
 
+    @_locked
+    def _store_fact(
+        self, fact_id: str, fact_data: Dict[str, Any], embedding: Optional[List[float]]
+    ) -> None:
+        """Store a fact and its embedding, and add it to the fact vectors."""
+        with self.store.batch():
+            self.facts[fact_id] = fact_data
+            if embedding:
+                self.embeddings[f"fact_{fact_id}"] = embedding
+        if embedding:
+            self.fact_vectors.add(fact_id, embedding)
+
     async def search_facts(
         self,
         query_embedding: List[float],
@@ -348,29 +505,17 @@ class LocalMemoryClient(BaseVectorDB):
         min_confidence: float = 0.0,
     ) -> List[Fact]:
         """Search for similar facts."""
-        query_vec = np.array(query_embedding)
-        results = []
 
-        for fact_id, fact in self.facts.items():
-            # Filter
+        def wanted(fact_id: str) -> bool:
+            fact = self.facts[fact_id]
             if fact["project_id"] != project_id:
-                continue
+                return False
             if user_id and fact.get("user_id") != user_id:
-                continue
-            if fact.get("confidence", 0) < min_confidence:
-                continue
+                return False
+            return fact.get("confidence", 0) >= min_confidence
 
-            # Calculate similarity
-            embedding_key = f"fact_{fact_id}"
-            if embedding_key in self.embeddings:
-                similarity = self._compute_similarity(
-                    query_vec, self.embeddings[embedding_key]
-                )
-                results.append({"fact": fact, "similarity": similarity})
-
-        # Sort and limit
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        results = results[:limit]
+        hits = self.fact_vectors.search(query_embedding, limit, predicate=wanted)
+        results = [{"fact": self.facts[fact_id], "similarity": s} for fact_id, s in hits]
 
         return [Fact(**r["fact"]) for r in results]
 
@@ -425,11 +570,14 @@ class LocalMemoryClient(BaseVectorDB):
             "updated_at": datetime.utcnow().isoformat(),
         }
 
-        self.projects[project_id] = project_data
-        self._save_json(self.projects, self.projects_file)
+        self._store_project(project_id, project_data)
 
         return Project(**project_data)
 
+    @_locked
+    def _store_project(self, project_id: str, project_data: Dict[str, Any]) -> None:
+        self.projects[project_id] = project_data
+
     async def get_project(
         self, project_id: str, user_id: Optional[str] = None
     ) -> Optional[Project]:
@@ -444,7 +592,7 @@ class LocalMemoryClient(BaseVectorDB):
         """List all projects."""
         results = []
 
-        for project in self.projects.values():
+        for project in self._records(self.projects):
             if not user_id or project.get("user_id") == user_id:
                 # Ensure project_id exists for backward compatibility
                 if "project_id" not in project:
@@ -457,41 +605,42 @@ class LocalMemoryClient(BaseVectorDB):
         self, project_id: str, user_id: Optional[str] = None
     ) -> bool:
         """Delete a project and all associated data."""
+        return self._delete_project(project_id, user_id)
+
+    @_locked
+    def _delete_project(self, project_id: str, user_id: Optional[str]) -> bool:
         if project_id in self.projects:
             project = self.projects[project_id]
             if not user_id or project.get("user_id") == user_id:
-                # Delete project
-                del self.projects[project_id]
-
-                # Delete associated memories
-                memory_ids_to_delete = [
-                    mid
-                    for mid, m in self.memories.items()
-                    if m["project_id"] == project_id
-                ]
-                for mid in memory_ids_to_delete:
-                    del self.memories[mid]
-                    embedding_key = f"memory_{mid}"
-                    if embedding_key in self.embeddings:
-                        del self.embeddings[embedding_key]
-
-                # Delete associated facts
-                fact_ids_to_delete = [
-                    fid
-                    for fid, f in self.facts.items()
-                    if f["project_id"] == project_id
-                ]
-                for fid in fact_ids_to_delete:
-                    del self.facts[fid]
-                    embedding_key = f"fact_{fid}"
-                    if embedding_key in self.embeddings:
-                        del self.embeddings[embedding_key]
-
-                # Save all changes
-                self._save_json(self.projects, self.projects_file)
-                self._save_json(self.memories, self.memories_file)
-                self._save_json(self.facts, self.facts_file)
-                self._save_embeddings()
+                # Delete project, its memories and facts with one flush
+                with self.store.batch():
+                    del self.projects[project_id]
+
+                    # Delete associated memories
+                    memory_ids_to_delete = [
+                        mid
+                        for mid, m in self.memories.items()
+                        if m["project_id"] == project_id
+                    ]
+                    for mid in memory_ids_to_delete:
+                        del self.memories[mid]
+                        embedding_key = f"memory_{mid}"
+                        if embedding_key in self.embeddings:
+                            del self.embeddings[embedding_key]
+                        self.memory_index.remove(mid)
+
+                    # Delete associated facts
+                    fact_ids_to_delete = [
+                        fid
+                        for fid, f in self.facts.items()
+                        if f["project_id"] == project_id
+                    ]
+                    for fid in fact_ids_to_delete:
+                        del self.facts[fid]
+                        embedding_key = f"fact_{fid}"
+                        if embedding_key in self.embeddings:
+                            del self.embeddings[embedding_key]
+                        self.fact_vectors.remove(fid)
 
                 return True
         return False
@@ -534,20 +683,16 @@ class LocalMemoryClient(BaseVectorDB):
             "updated_at": datetime.utcnow().isoformat(),
         }
 
-        # Store memory
-        self.memories[memory_id] = memory_data
-
-        # Store embedding
-        if embedding:
-            self.embeddings[f"memory_{memory_id}"] = np.array(embedding)
-
-        # Save to disk
-        self._save_json(self.memories, self.memories_file)
-        if embedding:
-            self._save_embeddings()
+        self._store_memory(memory_id, memory_data, embedding)
 
         return memory_data
 
+    @_locked
+    def add_memories(self, memories: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Add many memories with a single flush of the log."""
+        with self.store.batch():
+            return [self.add_memory(**memory) for memory in memories]
+
     async def add_memory_async(self, memory: MemoryCreate, project_id: str) -> Memory:
         """Add a memory (alias for create_memory)."""
         return await self.create_memory(memory, project_id)
@@ -558,13 +703,17 @@ class LocalMemoryClient(BaseVectorDB):
 
     async def delete_fact(self, fact_id: str) -> bool:
         """Delete a fact by ID."""
+        return self._delete_fact(fact_id)
+
+    @_locked
+    def _delete_fact(self, fact_id: str) -> bool:
         if fact_id in self.facts:
-            del self.facts[fact_id]
-            embedding_key = f"fact_{fact_id}"
-            if embedding_key in self.embeddings:
-                del self.embeddings[embedding_key]
-            self._save_json(self.facts, self.facts_file)
-            self._save_embeddings()
+            with self.store.batch():
+                del self.facts[fact_id]
+                embedding_key = f"fact_{fact_id}"
+                if embedding_key in self.embeddings:
+                    del self.embeddings[embedding_key]
+            self.fact_vectors.remove(fact_id)
             return True
         return False
 
@@ -634,6 +783,7 @@ class LocalMemoryClient(BaseVectorDB):
         """Get all projects for a user."""
         return await self.list_projects(user_id)
 
+    @_locked
     def update_memory(
         self,
         memory_id: str,
@@ -665,68 +815,75 @@ class LocalMemoryClient(BaseVectorDB):
         memory["updated_at"] = datetime.utcnow().isoformat()
 
         # Save changes
-        self._save_json(self.memories, self.memories_file)
+        self.memories[memory_id] = memory
 
         return memory
 
-    def _import_markdown_memories(self):
-        """Import memories from markdown files."""
-        if not self.markdown_reader:
+    def _import_markdown_memories(self) -> None:
+        """Import changed markdown files now, on the calling thread."""
+        if not self.markdown_watcher:
             return
 
         try:
-            # Read markdown memories
-            markdown_memories = self.markdown_reader.read_markdown_memories()
-
-            # Create a default project for markdown memories
-            project_id = "markdown_import"
-            if project_id not in self.projects:
-                project_data = {
-                    "id": project_id,
+            self.markdown_watcher.scan_once()
+        except Exception as e:
+            logger.error(f"Error importing markdown memories: {e}")
+
+    @_locked
+    def _apply_markdown_changes(self, changes: MarkdownChanges) -> None:
+        """Store the sections a markdown scan added and drop those it removed."""
+        # Create a default project for markdown memories
+        project_id = "markdown_import"
+        if project_id not in self.projects:
+            project_data = {
+                "id": project_id,
+                "project_id": project_id,
+                "name": "Markdown Import",
+                "description": "Automatically imported memories from markdown files",
+                "user_id": "system",
+                "metadata": {"auto_created": True},
+                "created_at": datetime.utcnow().isoformat(),
+                "updated_at": datetime.utcnow().isoformat(),
+            }
+            self.projects[project_id] = project_data
+
+        removed = [m for m in changes.removed if m in self.memories]
+        if self._markdown_legacy:
+            removed += [
+                mem_id
+                for mem_id, memory in self.memories.items()
+                if memory.get("project_id") == project_id
+                and (memory.get("metadata") or {}).get("markdown_file")
+                and "section_key" not in memory["metadata"]
+            ]
+            self._markdown_legacy = False
+        added = {m: c for m, c in changes.added.items() if m not in self.memories}
+
+        with self.store.batch():
+            for memory_id in removed:
+                del self.memories[memory_id]
+                embedding_key = f"memory_{memory_id}"
+                if embedding_key in self.embeddings:
+                    del self.embeddings[embedding_key]
+                    self.memory_index.remove(memory_id)
+            for memory_id, memory_create in added.items():
+                now = datetime.utcnow().isoformat()
+                self.memories[memory_id] = {
+                    "id": memory_id,
                     "project_id": project_id,
-                    "name": "Markdown Import",
-                    "description": "Automatically imported memories from markdown files",
                     "user_id": "system",
-                    "metadata": {"auto_created": True},
-                    "created_at": datetime.utcnow().isoformat(),
-                    "updated_at": datetime.utcnow().isoformat(),
+                    "content": memory_create.content,
+                    "memory_type": memory_create.memory_type,
+                    "importance": memory_create.importance,
+                    "context": memory_create.context,
+                    "metadata": memory_create.metadata or {},
+                    "source": memory_create.source,
+                    "timestamp": now,
+                    "created_at": now,
+                    "updated_at": now,
                 }
-                self.projects[project_id] = project_data
-                self._save_json(self.projects, self.projects_file)
-
-            # Import each memory
-            imported_count = 0
-            for memory_create in markdown_memories:
-                # Check if this memory already exists (by source)
-                source = memory_create.source
-                existing = any(
-                    m.get("source") == source for m in self.memories.values()
-                )
-
-                if not existing:
-                    memory_id = str(uuid.uuid4())
-                    memory_data = {
-                        "id": memory_id,
-                        "project_id": project_id,
-                        "user_id": "system",
-                        "content": memory_create.content,
-                        "memory_type": memory_create.memory_type,
-                        "importance": memory_create.importance,
-                        "context": memory_create.context,
-                        "metadata": memory_create.metadata or {},
-                        "source": source,
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "created_at": datetime.utcnow().isoformat(),
-                        "updated_at": datetime.utcnow().isoformat(),
-                    }
-                    self.memories[memory_id] = memory_data
-                    imported_count += 1
-
-            if imported_count > 0:
-                self._save_json(self.memories, self.memories_file)
-                logger.info(
-                    f"Imported {imported_count} new memories from markdown files"
-                )
 
-        except Exception as e:
-            logger.error(f"Error importing markdown memories: {e}")
+        if added or removed:
+            logger.info(
+                f"Imported {len(added)} and removed {len(removed)} markdown memories"
+            )
@@ -0,0 +1,573 @@
+"""Append-only storage for `LocalMemoryClient`.
+
+Every change is one JSON line appended to ``records.<gen>.jsonl``; embeddings
+are appended as raw float32 to ``vectors.<gen>.f32`` and referenced from their
+record by offset. Nothing is rewritten in place, so a write costs the size of
+the change, and a crash can at worst leave a torn last line, which is cut off
+the next time the log is opened.
+
+``index.json`` is a checkpoint: where the latest record of each key and each
+vector lives, and how much of the log it covers. Opening the store reads the
+checkpoint and replays only the records written after it. Records are decoded
+when first read, and only the most recently read are kept; vectors are read
+through a memory map. Neither content nor vectors are loaded up front, and
+memory does not grow with the size of the store.
+
+When superseded records outweigh live ones, a background thread copies the
+live ones into the next generation of files; the new checkpoint is the commit
+point, after which the old generation is deleted.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from structlog import get_logger
+
+logger = get_logger()
+
+#: Reserved collection name for vector records.
+VECTORS = "__vectors__"
+#: Superseded bytes tolerated before compaction, whatever the live size.
+DEFAULT_COMPACT_MIN_BYTES = 1 << 20
+#: Log bytes written after the checkpoint that trigger a new one.
+DEFAULT_CHECKPOINT_BYTES = 8 << 20
+#: Decoded records kept in memory, least recently read dropped first.
+DEFAULT_CACHE_SIZE = 4096
+
+_FORMAT_VERSION = 1
+_CHECKPOINT = "index.json"
+_COPY_CHUNK = 1 << 20
+_MISSING = object()
+
+
+class _Segment:
+    """One generation of the log and vector files, with its key index."""
+
+    def __init__(self, path: Path, gen: int, *, truncate: bool = False) -> None:
+        self.gen = gen
+        self.log_path = path / f"records.{gen}.jsonl"
+        self.vec_path = path / f"vectors.{gen}.f32"
+        flags = os.O_RDWR | os.O_CREAT | os.O_APPEND | (os.O_TRUNC if truncate else 0)
+        self.fd = os.open(self.log_path, flags, 0o644)
+        self.vfd = os.open(self.vec_path, flags, 0o644)
+        self.size = os.fstat(self.fd).st_size
+        self.vec_size = os.fstat(self.vfd).st_size // 4
+        # collection -> key -> (offset, length) of its latest record
+        self.records: dict[str, dict[str, tuple[int, int]]] = {}
+        # key -> (offset, length) of the vector in floats, and its record length
+        self.vectors: dict[str, tuple[int, int, int]] = {}
+        self.live = 0
+        self._map: np.ndarray | None = None
+
+    @property
+    def garbage(self) -> int:
+        return self.size + 4 * self.vec_size - self.live
+
+    def write(self, rec: dict[str, Any]) -> None:
+        line = (json.dumps(rec, separators=(",", ":"), default=str) + "\n").encode()
+        offset = self.size
+        os.write(self.fd, line)
+        self.size += len(line)
+        self.apply(rec, offset, len(line))
+
+    def write_vector(self, data: bytes) -> int:
+        offset = self.vec_size
+        os.write(self.vfd, data)
+        self.vec_size += len(data) // 4
+        return offset
+
+    def apply(self, rec: dict[str, Any], offset: int, length: int) -> None:
+        collection, key = rec["c"], rec["k"]
+        if collection == VECTORS:
+            old = self.vectors.pop(key, None)
+            if old is not None:
+                self.live -= old[2] + 4 * old[1]
+            if "d" not in rec and rec["o"] + rec["n"] <= self.vec_size:
+                self.vectors[key] = (rec["o"], rec["n"], length)
+                self.live += length + 4 * rec["n"]
+            return
+        index = self.records.setdefault(collection, {})
+        old = index.get(key)
+        if old is not None:
+            self.live -= old[1]
+        if "d" in rec:
+            index.pop(key, None)
+        else:
+            index[key] = (offset, length)
+            self.live += length
+
+    def replay(self, start: int) -> None:
+        """Apply records from ``start`` on, cutting off a torn tail."""
+        data = os.pread(self.fd, self.size - start, start)
+        pos = 0
+        while pos < len(data):
+            end = data.find(b"\n", pos)
+            if end < 0:
+                break
+            try:
+                rec = json.loads(data[pos:end])
+                self.apply(rec, start + pos, end + 1 - pos)
+            except (ValueError, KeyError, TypeError):
+                break
+            pos = end + 1
+        if start + pos < self.size:
+            logger.warning(
+                f"Discarding {self.size - start - pos} bytes of incomplete records from {self.log_path}"
+            )
+            os.ftruncate(self.fd, start + pos)
+            self.size = start + pos
+
+    def read(self, collection: str, key: str) -> Any:
+        offset, length = self.records[collection][key]
+        return json.loads(os.pread(self.fd, length, offset))["v"]
+
+    def read_line(self, offset: int, length: int) -> bytes:
+        return os.pread(self.fd, length, offset)
+
+    def read_vector(self, key: str) -> np.ndarray:
+        offset, n, _ = self.vectors[key]
+        if self._map is None or offset + n > len(self._map):
+            self._map = np.memmap(self.vec_path, dtype=np.float32, mode="r")
+        return self._map[offset : offset + n]
+
+    def sync(self) -> None:
+        os.fsync(self.vfd)
+        os.fsync(self.fd)
+
+    def state(self) -> dict[str, Any]:
+        return {
+            "version": _FORMAT_VERSION,
+            "gen": self.gen,
+            "log_size": self.size,
+            "vec_size": self.vec_size,
+            "live": self.live,
+            "records": self.records,
+            "vectors": self.vectors,
+        }
+
+    def restore(self, state: dict[str, Any]) -> bool:
+        if (
+            state.get("version") != _FORMAT_VERSION
+            or state["log_size"] > self.size
+            or state["vec_size"] > self.vec_size
+        ):
+            return False
+        self.records = {
+            c: {k: (v[0], v[1]) for k, v in index.items()}
+            for c, index in state["records"].items()
+        }
+        self.vectors = {k: (v[0], v[1], v[2]) for k, v in state["vectors"].items()}
+        self.live = state["live"]
+        return True
+
+    def close(self) -> None:
+        self._map = None
+        os.close(self.fd)
+        os.close(self.vfd)
+
+    def unlink(self) -> None:
+        self.log_path.unlink(missing_ok=True)
+        self.vec_path.unlink(missing_ok=True)
+
+
+class LogStore:
+    """Keyed JSON records and float32 vectors in an append-only log.
+
+    Args:
+        path: Directory holding the log files.
+        fsync: Flush each change to disk before returning; `batch` groups
+            many changes under one flush.
+        compact_min_bytes: Superseded bytes needed before compaction; it
+            also waits until they outweigh live data.
+        checkpoint_bytes: Log growth after which a new checkpoint is written.
+        cache_size: Decoded records kept in memory; older reads go back to
+            the log.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        fsync: bool = True,
+        compact_min_bytes: int = DEFAULT_COMPACT_MIN_BYTES,
+        checkpoint_bytes: int = DEFAULT_CHECKPOINT_BYTES,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.compact_min_bytes = compact_min_bytes
+        self.checkpoint_bytes = checkpoint_bytes
+        self.cache_size = cache_size
+
+        self._lock = threading.RLock()
+        self._cache: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._batch_depth = 0
+        self._unsynced = False
+        self._compactor: threading.Thread | None = None
+        self._seg: _Segment | None = None
+        self._checkpointed = 0
+        self._open()
+
+    # -- mappings ---------------------------------------------------------
+
+    def collection(self, name: str) -> LogCollection:
+        """A dict-like view of the records in ``name``."""
+        if name == VECTORS:
+            raise ValueError(f"{VECTORS!r} is reserved for vectors")
+        return LogCollection(self, name)
+
+    @property
+    def vectors(self) -> LogVectors:
+        """A dict-like view of the stored vectors."""
+        return LogVectors(self)
+
+    # -- records ----------------------------------------------------------
+
+    def keys(self, collection: str) -> list[str]:
+        return list(self._segment().records.get(collection, ()))
+
+    def count(self, collection: str) -> int:
+        return len(self._segment().records.get(collection, ()))
+
+    def contains(self, collection: str, key: str) -> bool:
+        return key in self._segment().records.get(collection, ())
+
+    def get(self, collection: str, key: str) -> Any:
+        """The value stored under ``key``; raises KeyError if there is none."""
+        with self._lock:
+            value = self._cache.get((collection, key), _MISSING)
+            if value is not _MISSING:
+                self._cache.move_to_end((collection, key))
+                return value
+            value = self._segment().read(collection, key)
+            if self.cache_size > 0:
+                self._cache[(collection, key)] = value
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            return value
+
+    def put(self, collection: str, key: str, value: Any) -> None:
+        with self._lock:
+            self._segment().write({"c": collection, "k": key, "v": value})
+            # Re-read on next access rather than alias the caller's object
+            self._cache.pop((collection, key), None)
+            self._written()
+
+    def delete(self, collection: str, key: str) -> bool:
+        with self._lock:
+            if not self.contains(collection, key):
+                return False
+            self._segment().write({"c": collection, "k": key, "d": 1})
+            self._cache.pop((collection, key), None)
+            self._written()
+            return True
+
+    # -- vectors ------------------------------------------------------------
+
+    def vector_keys(self) -> list[str]:
+        return list(self._segment().vectors)
+
+    def vector_count(self) -> int:
+        return len(self._segment().vectors)
+
+    def contains_vector(self, key: str) -> bool:
+        return key in self._segment().vectors
+
+    def get_vector(self, key: str) -> np.ndarray:
+        """The vector stored under ``key`` as a read-only float32 view."""
+        with self._lock:
+            return self._segment().read_vector(key)
+
+    def put_vector(self, key: str, vector: Sequence[float] | np.ndarray) -> None:
+        data = np.ascontiguousarray(vector, dtype=np.float32).reshape(-1)
+        with self._lock:
+            seg = self._segment()
+            offset = seg.write_vector(data.tobytes())
+            seg.write({"c": VECTORS, "k": key, "o": offset, "n": len(data)})
+            self._written()
+
+    def delete_vector(self, key: str) -> bool:
+        with self._lock:
+            seg = self._segment()
+            if key not in seg.vectors:
+                return False
+            seg.write({"c": VECTORS, "k": key, "d": 1})
+            self._written()
+            return True
+
+    # -- change tracking ----------------------------------------------------
+
+    def mark(self) -> tuple[int, int]:
+        """How far the log has been written; pass it to `changed_since` later."""
+        with self._lock:
+            seg = self._segment()
+            return seg.gen, seg.size
+
+    def changed_since(self, mark: Sequence[int]) -> list[tuple[str, str]] | None:
+        """``(collection, key)`` of every change written after ``mark``.
+
+        Returns None when the records in between are gone: the log has been
+        compacted since, or ``mark`` is not from this log.
+        """
+        gen, size = mark
+        with self._lock:
+            seg = self._segment()
+            if gen != seg.gen or not 0 <= size <= seg.size:
+                return None
+            tail = seg.read_line(size, seg.size - size)
+        changes = []
+        for line in tail.splitlines():
+            rec = json.loads(line)
+            changes.append((rec["c"], rec["k"]))
+        return changes
+
+    # -- durability and maintenance -----------------------------------------
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group changes so they are flushed to disk once, at the end."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._unsynced:
+                    self._sync()
+
+    def checkpoint(self) -> None:
+        """Record the current index so the next open need not replay the log."""
+        with self._lock:
+            seg = self._segment()
+            self._sync()
+            tmp = self.path / f"{_CHECKPOINT}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(seg.state(), f, separators=(",", ":"))
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp, self.path / _CHECKPOINT)
+            self._checkpointed = seg.size
+
+    def compact(self, wait: bool = True) -> None:
+        """Rewrite live records into a new generation of files.
+
+        Args:
+            wait: Block until compaction has finished; otherwise it runs on a
+                background thread.
+        """
+        with self._lock:
+            thread = self._compactor
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(
+                    target=self._compact, name="memory-log-compact", daemon=True
+                )
+                self._compactor = thread
+                thread.start()
+        if wait:
+            thread.join()
+
+    def close(self) -> None:
+        """Wait for compaction, checkpoint and close the files.
+
+        The store reopens itself if it is used again.
+        """
+        thread = self._compactor
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            if self._seg is None:
+                return
+            self.checkpoint()
+            self._seg.close()
+            self._seg = None
+
+    @property
+    def garbage_bytes(self) -> int:
+        """Bytes in the files that belong to superseded or deleted entries."""
+        return self._segment().garbage
+
+    # -- internals --------------------------------------------------------
+
+    def _segment(self) -> _Segment:
+        if self._seg is None:
+            with self._lock:
+                if self._seg is None:
+                    self._open()
+        assert self._seg is not None
+        return self._seg
+
+    def _open(self) -> None:
+        state = None
+        try:
+            state = json.loads((self.path / _CHECKPOINT).read_text())
+            gen = int(state["gen"])
+        except FileNotFoundError:
+            gen = 0
+        except (ValueError, KeyError, TypeError) as e:
+            # Only a compaction that never committed leaves a second
+            # generation behind, so the oldest one is authoritative.
+            logger.warning(f"Ignoring unreadable checkpoint in {self.path}: {e}")
+            state, gen = None, min(self._generations(), default=0)
+
+        for stale in self._generations() - {gen}:
+            (self.path / f"records.{stale}.jsonl").unlink(missing_ok=True)
+            (self.path / f"vectors.{stale}.f32").unlink(missing_ok=True)
+
+        seg = _Segment(self.path, gen)
+        start = 0
+        if state is not None and seg.restore(state):
+            start = state["log_size"]
+        seg.replay(start)
+        self._seg = seg
+        self._checkpointed = start
+
+    def _generations(self) -> set[int]:
+        gens = set()
+        for p in self.path.glob("records.*.jsonl"):
+            try:
+                gens.add(int(p.name.split(".")[1]))
+            except ValueError:
+                continue
+        return gens
+
+    def _written(self) -> None:
+        """Flush, checkpoint or compact as needed after a change."""
+        if self._batch_depth:
+            self._unsynced = True
+        else:
+            self._sync()
+        seg = self._segment()
+        if seg.size - self._checkpointed > self.checkpoint_bytes:
+            self.checkpoint()
+        if seg.garbage > max(self.compact_min_bytes, seg.live):
+            self.compact(wait=False)
+
+    def _sync(self) -> None:
+        self._unsynced = False
+        if self.fsync and self._seg is not None:
+            self._seg.sync()
+
+    def _compact(self) -> None:
+        try:
+            self._compact_once()
+        except Exception as e:
+            logger.error(f"Compaction of {self.path} failed: {e}")
+
+    def _compact_once(self) -> None:
+        with self._lock:
+            old = self._segment()
+            records = {c: list(index.items()) for c, index in old.records.items()}
+            vectors = list(old.vectors.items())
+            copied_to = old.size
+        new = _Segment(self.path, old.gen + 1, truncate=True)
+
+        # Copy the live entries as of now, without holding the lock...
+        pending = bytearray()
+        for collection, entries in records.items():
+            index = new.records.setdefault(collection, {})
+            for key, (offset, length) in entries:
+                index[key] = (new.size + len(pending), length)
+                pending += old.read_line(offset, length)
+                new.live += length
+                if len(pending) >= _COPY_CHUNK:
+                    os.write(new.fd, pending)
+                    new.size += len(pending)
+                    pending.clear()
+        os.write(new.fd, pending)
+        new.size += len(pending)
+        for key, (offset, n, _) in vectors:
+            data = os.pread(old.vfd, 4 * n, 4 * offset)
+            new.write({"c": VECTORS, "k": key, "o": new.write_vector(data), "n": n})
+
+        # ...then replay what was written meanwhile and switch over.
+        with self._lock:
+            old = self._segment()
+            tail = old.read_line(copied_to, old.size - copied_to)
+            for line in tail.splitlines():
+                rec = json.loads(line)
+                if rec["c"] == VECTORS and "d" not in rec:
+                    data = os.pread(old.vfd, 4 * rec["n"], 4 * rec["o"])
+                    rec["o"] = new.write_vector(data)
+                new.write(rec)
+            new.sync()
+            self._seg = new
+            self.checkpoint()
+            old.close()
+            old.unlink()
+            logger.debug(
+                f"Compacted {self.path} to generation {new.gen}: "
+                f"{old.size + 4 * old.vec_size} -> {new.size + 4 * new.vec_size} bytes"
+            )
+
+
+class LogCollection(MutableMapping):
+    """Dict-like view of one collection in a `LogStore`.
+
+    Assigning or deleting a key appends to the log. Values are decoded on
+    first access and then cached; a value changed in place must be assigned
+    back to be persisted.
+    """
+
+    def __init__(self, store: LogStore, name: str) -> None:
+        self._store = store
+        self.name = name
+
+    def __getitem__(self, key: str) -> Any:
+        return self._store.get(self.name, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._store.put(self.name, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not self._store.delete(self.name, key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._store.contains(self.name, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.keys(self.name))
+
+    def __len__(self) -> int:
+        return self._store.count(self.name)
+
+
+class LogVectors(MutableMapping):
+    """Dict-like view of the vectors in a `LogStore`.
+
+    Values are read-only float32 views into the memory-mapped vector file.
+    """
+
+    def __init__(self, store: LogStore) -> None:
+        self._store = store
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self._store.get_vector(key)
+
+    def __setitem__(self, key: str, vector: Sequence[float] | np.ndarray) -> None:
+        self._store.put_vector(key, vector)
+
+    def __delitem__(self, key: str) -> None:
+        if not self._store.delete_vector(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._store.contains_vector(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.vector_keys())
+
+    def __len__(self) -> int:
+        return self._store.vector_count()
@@ -1,10 +1,27 @@
-"""Markdown file reader for integrating LLM.md and similar files into memory."""
+"""Markdown file reader for integrating LLM.md and similar files into memory.
 
+`MarkdownMemoryReader.scan` compares the files with a manifest of their
+mtime, size, hash and section keys, persisted as JSON if the reader has a
+``manifest_path``. Files whose mtime and size match are not read; files
+that are read are diffed section by section, so an edit reports only the
+sections it added and removed. A section's memory id is derived from its
+file, title and content, which makes imports idempotent.
+
+`MarkdownWatcher` runs scans on a daemon thread, once or by polling.
+"""
+
+import fnmatch
 import hashlib
+import json
 import os
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from structlog import get_logger
 
@@ -37,20 +54,83 @@ MEMORY_MD_PATTERNS = [
     "*.qwen.md",
 ]
 
+MANIFEST_VERSION = 1
+
+# Files modified this recently may change again within the same mtime tick
+# without changing size, so their mtime is not trusted on the next scan
+_RACY_NS = 2_000_000_000
+
+
+def section_key(section: Dict) -> str:
+    """Key of a parsed section: a hash of its title and stripped content."""
+    text = f"{section['title']}\0{section['content'].strip()}"
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def markdown_memory_id(source_file: str, key: str) -> str:
+    """Stable memory id of the section with ``key`` in ``source_file``."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"markdown://{source_file}#{key}"))
+
+
+@dataclass
+class MarkdownChanges:
+    """Sections added and removed since the previous scan."""
+
+    added: Dict[str, MemoryCreate] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
 
 class MarkdownMemoryReader:
     """Reads and processes markdown files for memory integration."""
 
-    def __init__(self, watch_dirs: Optional[List[Path]] = None):
+    def __init__(
+        self,
+        watch_dirs: Optional[List[Path]] = None,
+        manifest_path: Optional[Path] = None,
+    ):
         """Initialize the markdown reader.
 
         Args:
             watch_dirs: List of directories to watch for markdown files.
                        Defaults to current directory and parent directories.
+            manifest_path: JSON file recording what earlier scans saw; without
+                one, a new reader reports every section again.
         """
         self.watch_dirs = watch_dirs or self._get_default_watch_dirs()
+        self.manifest_path = manifest_path
         self.processed_files: Set[str] = set()
-        self.file_hashes: Dict[str, str] = {}
+        self.manifest: Dict[str, Dict[str, Any]] = self._load_manifest()
+        self._scan_lock = threading.Lock()
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the manifest's file entries, or none if it is missing or stale."""
+        if not self.manifest_path or not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading markdown manifest {self.manifest_path}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def save_manifest(self) -> None:
+        """Write the manifest, if the reader has a path for it."""
+        if not self.manifest_path:
+            return
+        tmp = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "files": self.manifest}, f)
+        os.replace(tmp, self.manifest_path)
+
+    def reset_manifest(self) -> None:
+        """Forget changes scanned since the manifest was last saved."""
+        self.manifest = self._load_manifest()
 
     def _get_default_watch_dirs(self) -> List[Path]:
         """Get default directories to watch."""
@@ -76,15 +156,6 @@ class MarkdownMemoryReader:
 
         return dirs
 
-    def _compute_file_hash(self, filepath: Path) -> str:
-        """Compute hash of file contents."""
-        try:
-            content = filepath.read_text(encoding="utf-8")
-            return hashlib.sha256(content.encode()).hexdigest()
-        except Exception as e:
-            logger.error(f"Error hashing file {filepath}: {e}")
-            return ""
-
     def _parse_markdown_sections(self, content: str, filepath: Path) -> List[Dict]:
         """Parse markdown content into sections."""
         sections = []
@@ -144,23 +215,25 @@ class MarkdownMemoryReader:
         seen_files = set()
 
         for watch_dir in self.watch_dirs:
-            if not watch_dir.exists():
+            # List each directory once rather than probing every name
+            try:
+                with os.scandir(watch_dir) as entries:
+                    names = [e.name for e in entries if e.is_file()]
+            except OSError:
                 continue
+            present = set(names)
+            visible = [n for n in names if not n.startswith(".")]
 
-            # Look for specific named files
-            for md_file in MEMORY_MD_FILES:
-                filepath = watch_dir / md_file
-                if filepath.exists() and filepath not in seen_files:
+            # Look for specific named files, then pattern-matched files
+            matches = [n for n in MEMORY_MD_FILES if n in present]
+            for pattern in MEMORY_MD_PATTERNS:
+                matches.extend(fnmatch.filter(visible, pattern))
+            for name in matches:
+                filepath = watch_dir / name
+                if filepath not in seen_files:
                     md_files.append(filepath)
                     seen_files.add(filepath)
 
-            # Look for pattern-matched files
-            for pattern in MEMORY_MD_PATTERNS:
-                for filepath in watch_dir.glob(pattern):
-                    if filepath not in seen_files:
-                        md_files.append(filepath)
-                        seen_files.add(filepath)
-
         # Sort by priority (LLM.md first, then others)
         def priority(f: Path) -> int:
             name = f.name.upper()
@@ -180,74 +253,115 @@ class MarkdownMemoryReader:
         md_files.sort(key=priority)
         return md_files
 
-    def read_markdown_memories(self) -> List[MemoryCreate]:
-        """Read all markdown files and convert to memories."""
-        memories = []
-        md_files = self.find_markdown_files()
-
-        for filepath in md_files:
-            try:
-                # Check if file has been processed and unchanged
-                file_id = str(filepath.absolute())
-                current_hash = self._compute_file_hash(filepath)
-
-                if (
-                    file_id in self.file_hashes
-                    and self.file_hashes[file_id] == current_hash
-                ):
-                    logger.debug(f"Skipping unchanged file: {filepath}")
-                    continue
+    def scan(self) -> MarkdownChanges:
+        """Find the sections added and removed since the previous scan.
 
-                # Read and parse the file
-                content = filepath.read_text(encoding="utf-8")
-                if not content.strip():
-                    continue
-
-                # Store hash for future comparison
-                self.file_hashes[file_id] = current_hash
-
-                # Parse into sections
-                sections = self._parse_markdown_sections(content, filepath)
-
-                # Create memories from sections
-                for section in sections:
-                    # Determine importance based on file and section
-                    importance = self._calculate_importance(filepath, section)
-
-                    # Determine memory type
-                    memory_type = self._determine_memory_type(filepath, section)
-
-                    # Create memory
-                    memory = MemoryCreate(
-                        content=section["content"],
-                        memory_type=memory_type,
-                        importance=importance,
-                        context={
-                            "source_file": str(filepath.absolute()),
-                            "file_name": filepath.name,
-                            "section_title": section["title"],
-                            "section_level": section["level"],
-                            "line_start": section["line_start"],
-                            "directory": str(filepath.parent.absolute()),
-                            "file_modified": datetime.fromtimestamp(
-                                filepath.stat().st_mtime
-                            ).isoformat(),
-                        },
-                        metadata={
-                            "auto_imported": True,
-                            "markdown_file": True,
-                        },
-                        source=f"markdown://{filepath.absolute()}#{section['line_start']}",
-                    )
-                    memories.append(memory)
-
-                logger.info(f"Read {len(sections)} sections from {filepath.name}")
+        The in-memory manifest is updated; call `save_manifest` once the
+        changes are stored, or `reset_manifest` if storing them failed.
+        """
+        with self._scan_lock:
+            changes = MarkdownChanges()
+            now_ns = time.time_ns()
+            seen = set()
 
-            except Exception as e:
-                logger.error(f"Error reading markdown file {filepath}: {e}")
-                continue
+            for filepath in self.find_markdown_files():
+                file_id = str(filepath.absolute())
+                seen.add(file_id)
+                try:
+                    self._scan_file(filepath, file_id, now_ns, changes)
+                except Exception as e:
+                    logger.error(f"Error reading markdown file {filepath}: {e}")
+
+            for file_id in [f for f in self.manifest if f not in seen]:
+                entry = self.manifest.pop(file_id)
+                changes.removed.extend(
+                    markdown_memory_id(file_id, key) for key in entry["sections"]
+                )
+                logger.info(f"Markdown file removed: {file_id}")
+
+            return changes
+
+    def _scan_file(
+        self, filepath: Path, file_id: str, now_ns: int, changes: MarkdownChanges
+    ) -> None:
+        """Add the changes to one file to ``changes``."""
+        stat = filepath.stat()
+        entry = self.manifest.get(file_id)
+        if (
+            entry
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            return
+
+        data = filepath.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        mtime_ns = stat.st_mtime_ns if now_ns - stat.st_mtime_ns > _RACY_NS else None
+        if entry and entry["hash"] == digest:
+            entry.update(mtime_ns=mtime_ns, size=stat.st_size)
+            logger.debug(f"Skipping unchanged file: {filepath}")
+            return
+
+        content = data.decode("utf-8")
+        sections = self._parse_markdown_sections(content, filepath) if content.strip() else []
+
+        # Identical sections in one file are told apart by occurrence
+        keys = []
+        occurrences: Counter = Counter()
+        for section in sections:
+            base = section_key(section)
+            keys.append(f"{base}-{occurrences[base]}" if occurrences[base] else base)
+            occurrences[base] += 1
+
+        old_keys = set(entry["sections"]) if entry else set()
+        modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
+        for section, key in zip(sections, keys):
+            if key not in old_keys:
+                memory_id = markdown_memory_id(file_id, key)
+                changes.added[memory_id] = self._section_memory(
+                    filepath, file_id, section, key, modified
+                )
+        new_keys = set(keys)
+        changes.removed.extend(
+            markdown_memory_id(file_id, key) for key in old_keys if key not in new_keys
+        )
+
+        self.manifest[file_id] = {
+            "mtime_ns": mtime_ns,
+            "size": stat.st_size,
+            "hash": digest,
+            "sections": keys,
+        }
+        logger.info(f"Read {len(sections)} sections from {filepath.name}")
+
+    def _section_memory(
+        self, filepath: Path, file_id: str, section: Dict, key: str, modified: str
+    ) -> MemoryCreate:
+        """Memory for one section of a markdown file."""
+        return MemoryCreate(
+            content=section["content"],
+            memory_type=self._determine_memory_type(filepath, section),
+            importance=self._calculate_importance(filepath, section),
+            context={
+                "source_file": file_id,
+                "file_name": filepath.name,
+                "section_title": section["title"],
+                "section_level": section["level"],
+                "line_start": section["line_start"],
+                "directory": os.path.dirname(file_id),
+                "file_modified": modified,
+            },
+            metadata={
+                "auto_imported": True,
+                "markdown_file": True,
+                "section_key": key,
+            },
+            source=f"markdown://{file_id}#{section['line_start']}",
+        )
 
-        return memories
+    def read_markdown_memories(self) -> List[MemoryCreate]:
+        """Memories for the sections added since the previous scan."""
+        return list(self.scan().added.values())
 
     def _calculate_importance(self, filepath: Path, section: Dict) -> float:
         """Calculate importance score for a memory section."""
@@ -285,8 +399,9 @@ class MarkdownMemoryReader:
             "interface",
         ]
 
+        preview = section["content"].lower()[:200]
         for keyword in high_importance_keywords:
-            if keyword in title_lower or keyword in section["content"].lower()[:200]:
+            if keyword in title_lower or keyword in preview:
                 importance += 0.1
                 break
 
@@ -422,3 +537,75 @@ class MarkdownMemoryReader:
                 logger.error(f"Error processing {filepath}: {e}")
 
         return context
+
+
+class MarkdownWatcher:
+    """Runs a reader's scans on a daemon thread and hands changes to a callback.
+
+    The manifest is saved after the callback returns, and rolled back if it
+    raises, so the changes are reported again on the next scan.
+    """
+
+    def __init__(
+        self,
+        reader: MarkdownMemoryReader,
+        on_changes: Callable[[MarkdownChanges], None],
+        interval: Optional[float] = None,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            reader: Reader whose files are scanned
+            on_changes: Called with each non-empty set of changes
+            interval: Seconds between scans; None to scan once
+        """
+        self.reader = reader
+        self.on_changes = on_changes
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._scanned = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MarkdownWatcher":
+        """Start scanning in the background."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="markdown-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for a scan in progress to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the first scan to be applied; False on timeout."""
+        return self._scanned.wait(timeout)
+
+    def scan_once(self) -> MarkdownChanges:
+        """Scan now, on the calling thread, and apply the changes."""
+        with self._lock:
+            changes = self.reader.scan()
+            try:
+                if changes:
+                    self.on_changes(changes)
+                self.reader.save_manifest()
+            except Exception:
+                self.reader.reset_manifest()
+                raise
+            return changes
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.scan_once()
+            except Exception as e:
+                logger.error(f"Error importing markdown memories: {e}")
+            self._scanned.set()
+            if self.interval is None or self._stop.wait(self.interval):
+                break
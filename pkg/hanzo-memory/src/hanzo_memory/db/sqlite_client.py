@@ -1,22 +1,45 @@
-"""SQLite-based memory storage implementation with vector search using sqlite-vec."""
+"""SQLite-based memory storage implementation with hybrid full-text and vector search.
+
+Memories are searched two ways: BM25 over an FTS5 index (see `.fts`) and
+vector similarity, using sqlite-vec when it is loaded and otherwise an exact
+scan of each user's embeddings, kept in memory until that user's memories
+change. When the query text is known, the two rankings are fused with
+reciprocal rank fusion.
+"""
 
 import json
 import sqlite3
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from structlog import get_logger
 
+from ..algorithms import (
+    MmrInput,
+    SearchHit,
+    characterize,
+    dedup_hits,
+    mmr_rerank,
+    rrf_fuse,
+    select_rrf_k,
+)
+from ..similarity import VectorMatrix
 from .base import BaseVectorDB
+from .fts import cjk_search_text, ensure_fts, fts_search
 
 logger = get_logger()
 
+#: Candidates each ranking contributes to fusion, per requested result.
+_CANDIDATES_PER_RESULT = 4
+
 
 class SQLiteMemoryClient(BaseVectorDB):
-    """SQLite-based implementation of the vector database with sqlite-vec for vector search."""
+    """SQLite-based implementation of the vector database with hybrid search."""
+
+    supports_text_query = True
 
     def __init__(self, db_path: Optional[Path] = None):
         """Initialize SQLite memory storage.
@@ -36,6 +59,12 @@ class SQLiteMemoryClient(BaseVectorDB):
         # Enable extension loading for sqlite-vec
         self.conn.enable_load_extension(True)
 
+        # Without sqlite-vec: (user_id, dim) -> that user's embeddings and the
+        # project of each, dropped when the user's memories change
+        self._user_vectors: Dict[Tuple[str, int], Tuple[VectorMatrix, Dict[str, str]]] = {}
+        # Changes when another connection commits to the database
+        self._data_version: int | None = None
+
         # Initialize tables
         self._init_tables()
 
@@ -165,6 +194,9 @@ class SQLiteMemoryClient(BaseVectorDB):
             "CREATE INDEX IF NOT EXISTS idx_chat_sessions_user_project ON chat_sessions(user_id, project_id);"
         )
 
+        # Full-text index over memory content
+        self.fts = ensure_fts(self.conn)
+
         # Create vector index for embeddings if sqlite-vec is available
         try:
             # Create vector index for memories
@@ -265,48 +297,78 @@ class SQLiteMemoryClient(BaseVectorDB):
         importance: float = 0.5,
     ) -> dict[str, Any]:
         """Add a memory to the database."""
-        memory_id = memory_id or str(uuid.uuid4())
-        metadata_json = json.dumps(metadata or {})
-        context_json = json.dumps({})
-        embedding_blob = (
-            np.array(embedding, dtype=np.float32).tobytes() if embedding else None
-        )
+        return self.add_memories(
+            [
+                {
+                    "memory_id": memory_id,
+                    "user_id": user_id,
+                    "project_id": project_id,
+                    "content": content,
+                    "embedding": embedding,
+                    "metadata": metadata,
+                    "importance": importance,
+                }
+            ]
+        )[0]
+
+    def add_memories(self, memories: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Add many memories in one transaction."""
+        rows = []
+        added = []
+        for memory in memories:
+            memory_id = memory.get("memory_id") or str(uuid.uuid4())
+            metadata = memory.get("metadata") or {}
+            importance = memory.get("importance", 0.5)
+            embedding = memory.get("embedding")
+            embedding_blob = (
+                np.array(embedding, dtype=np.float32).tobytes() if embedding else None
+            )
+            rows.append(
+                (
+                    str(uuid.uuid4()),
+                    memory_id,
+                    memory["user_id"],
+                    memory["project_id"],
+                    memory["content"],
+                    importance,
+                    json.dumps({}),
+                    json.dumps(metadata),
+                    "",  # source
+                    embedding_blob,
+                    cjk_search_text(memory["content"]),
+                )
+            )
+            now = datetime.now(timezone.utc).isoformat()
+            added.append(
+                {
+                    "id": memory_id,
+                    "memory_id": memory_id,
+                    "user_id": memory["user_id"],
+                    "project_id": memory["project_id"],
+                    "content": memory["content"],
+                    "importance": importance,
+                    "context": {},
+                    "metadata": metadata,
+                    "source": "",
+                    "timestamp": now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
 
-        self.conn.execute(
+        self.conn.executemany(
             """
             INSERT INTO memories 
-            (id, memory_id, user_id, project_id, content, importance, context, metadata, source, embedding)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            (id, memory_id, user_id, project_id, content, importance, context, metadata, source, embedding,
+             search_text)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                str(uuid.uuid4()),
-                memory_id,
-                user_id,
-                project_id,
-                content,
-                importance,
-                context_json,
-                metadata_json,
-                "",  # source
-                embedding_blob,
-            ),
+            rows,
         )
         self.conn.commit()
+        self._forget_vectors(*{memory["user_id"] for memory in memories})
 
-        return {
-            "id": memory_id,
-            "memory_id": memory_id,
-            "user_id": user_id,
-            "project_id": project_id,
-            "content": content,
-            "importance": importance,
-            "context": {},
-            "metadata": metadata or {},
-            "source": "",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        }
+        return added
 
     def search_memories(
         self,
@@ -315,102 +377,184 @@ class SQLiteMemoryClient(BaseVectorDB):
         project_id: str | None = None,
         limit: int = 10,
         min_similarity: float = 0.0,
+        query: str | None = None,
+        dedup: bool = False,
+        mmr_lambda: float | None = None,
     ) -> list[dict[str, Any]]:
-        """Search memories by similarity."""
-        query_array = np.array(query_embedding, dtype=np.float32)
-        query_blob = query_array.tobytes()
+        """Search memories by similarity, and by text when the query is given.
 
-        # Build query
-        where_conditions = ["user_id = ?"]
-        params = [user_id]
+        Args:
+            user_id: User ID
+            query_embedding: Embedding of the query
+            project_id: Optional project filter
+            limit: Maximum results
+            min_similarity: Drop vector matches scoring below this
+            query: Query text; its BM25 ranking is fused with the vector one
+            dedup: Keep only the best chunk of each document (memory ids
+                ending in ``#chunk-N`` or ``::N``)
+            mmr_lambda: Rerank for diversity with MMR, weighting relevance
+                by this much against similarity to results already chosen
+
+        Returns:
+            Memories, best first. ``similarity_score`` is the vector
+            similarity, or the fused score (0-1) when ``query`` is given.
+        """
+        where_conditions = ["m.user_id = ?"]
+        params: list[Any] = [user_id]
 
         if project_id:
-            where_conditions.append("project_id = ?")
+            where_conditions.append("m.project_id = ?")
             params.append(project_id)
 
         where_clause = " AND ".join(where_conditions)
 
-        # If sqlite-vec is available, use vector similarity search
-        try:
-            # Use sqlite-vec for similarity search
-            cursor = self.conn.execute(
-                f"""
-                SELECT *, vec_distance_L2(embedding, ?) as distance
-                FROM memories
-                WHERE {where_clause} AND embedding IS NOT NULL
-                ORDER BY distance ASC
-                LIMIT ?
-            """,
-                [query_blob] + params + [limit],
+        reranked = query or dedup or mmr_lambda is not None
+        pool = limit * _CANDIDATES_PER_RESULT if reranked else limit
+        rows: dict[str, sqlite3.Row] = {}
+
+        vector_hits = []
+        for row, similarity in self._vector_search(
+            where_clause, params, query_embedding, pool, user_id, project_id
+        ):
+            if similarity >= min_similarity:
+                rows[row["memory_id"]] = row
+                vector_hits.append(
+                    SearchHit(slug=row["memory_id"], score=similarity, source="semantic")
+                )
+        hits = vector_hits
+
+        if query and self.fts:
+            text_hits = []
+            for rank, row in enumerate(
+                fts_search(self.conn, query, where_clause, params, pool)
+            ):
+                rows.setdefault(row["memory_id"], row)
+                text_hits.append(
+                    SearchHit(slug=row["memory_id"], score=1 / (rank + 1), source="keyword")
+                )
+            k = select_rrf_k(characterize(query))
+            hits = rrf_fuse([vector_hits, text_hits], pool, k=k)
+
+        if dedup:
+            hits = dedup_hits(hits)
+
+        if mmr_lambda is not None:
+            hits = mmr_rerank(
+                [
+                    MmrInput(
+                        slug=hit.slug,
+                        score=hit.score,
+                        source=hit.source,
+                        embedding=self._stored_embedding(rows[hit.slug]),
+                    )
+                    for hit in hits
+                ],
+                lambda_=mmr_lambda,
+                limit=limit,
             )
 
-            rows = cursor.fetchall()
+        return [self._memory_result(rows[hit.slug], hit.score) for hit in hits[:limit]]
 
-            results = []
-            for row in rows:
-                # Calculate similarity from distance (convert L2 distance to similarity)
-                distance = row["distance"]
-                similarity = 1 / (1 + distance)  # Convert distance to similarity score
-
-                if similarity >= min_similarity:
-                    results.append(
-                        {
-                            "memory_id": row["memory_id"],
-                            "user_id": row["user_id"],
-                            "project_id": row["project_id"],
-                            "content": row["content"],
-                            "importance": row["importance"],
-                            "context": (
-                                json.loads(row["context"]) if row["context"] else {}
-                            ),
-                            "metadata": (
-                                json.loads(row["metadata"]) if row["metadata"] else {}
-                            ),
-                            "source": row["source"],
-                            "created_at": row["created_at"],
-                            "updated_at": row["updated_at"],
-                            "similarity_score": similarity,
-                        }
-                    )
-
-            return results
+    def _vector_search(
+        self,
+        where_clause: str,
+        params: list[Any],
+        query_embedding: list[float],
+        limit: int,
+        user_id: str,
+        project_id: str | None = None,
+    ) -> list[tuple[sqlite3.Row, float]]:
+        """Memory rows nearest the query embedding, with their similarity."""
+        query_array = np.array(query_embedding, dtype=np.float32)
+        if not query_array.size:
+            return []
 
-        except sqlite3.Error:
-            # Fallback to basic search without vector similarity
+        # If sqlite-vec is available, use vector similarity search
+        try:
             cursor = self.conn.execute(
                 f"""
-                SELECT *
-                FROM memories
-                WHERE {where_clause}
-                ORDER BY timestamp DESC
+                SELECT m.*, vec_distance_L2(m.embedding, ?) as distance
+                FROM memories AS m
+                WHERE {where_clause} AND m.embedding IS NOT NULL
+                ORDER BY distance ASC
                 LIMIT ?
             """,
-                params + [limit],
+                [query_array.tobytes()] + params + [limit],
             )
+            # Convert L2 distance to a similarity score
+            return [(row, 1 / (1 + row["distance"])) for row in cursor.fetchall()]
+        except sqlite3.Error:
+            pass
 
-            rows = cursor.fetchall()
-
-            results = []
-            for row in rows:
-                results.append(
-                    {
-                        "memory_id": row["memory_id"],
-                        "user_id": row["user_id"],
-                        "project_id": row["project_id"],
-                        "content": row["content"],
-                        "importance": row["importance"],
-                        "context": json.loads(row["context"]) if row["context"] else {},
-                        "metadata": (
-                            json.loads(row["metadata"]) if row["metadata"] else {}
-                        ),
-                        "source": row["source"],
-                        "created_at": row["created_at"],
-                        "updated_at": row["updated_at"],
-                        "similarity_score": 0.0,  # No similarity calculation without sqlite-vec
-                    }
+        # Otherwise score the user's cached embeddings
+        matrix, projects = self._vectors_for(user_id, query_array.size)
+        hits = matrix.search(
+            query_array,
+            limit,
+            predicate=(lambda key: projects[key] == project_id) if project_id else None,
+        )
+        if not hits:
+            return []
+        cursor = self.conn.execute(
+            f"SELECT * FROM memories WHERE memory_id IN ({','.join('?' * len(hits))})",
+            [memory_id for memory_id, _ in hits],
+        )
+        by_id = {row["memory_id"]: row for row in cursor.fetchall()}
+        return [(by_id[memory_id], score) for memory_id, score in hits if memory_id in by_id]
+
+    def _vectors_for(self, user_id: str, dim: int) -> Tuple[VectorMatrix, Dict[str, str]]:
+        """The user's stored embeddings of dimension ``dim``, and their projects."""
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._user_vectors.clear()
+            self._data_version = version
+
+        cached = self._user_vectors.get((user_id, dim))
+        if cached is None:
+            projects: Dict[str, str] = {}
+            blobs = []
+            for memory_id, project_id, blob in self.conn.execute(
+                "SELECT memory_id, project_id, embedding FROM memories "
+                "WHERE user_id = ? AND embedding IS NOT NULL",
+                (user_id,),
+            ):
+                if len(blob) == 4 * dim:
+                    projects[memory_id] = project_id
+                    blobs.append(blob)
+            matrix = VectorMatrix(dim)
+            if blobs:
+                matrix.add_many(
+                    list(projects),
+                    np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(blobs), dim),
                 )
+            cached = self._user_vectors[(user_id, dim)] = (matrix, projects)
+        return cached
 
-            return results
+    def _forget_vectors(self, *user_ids: str) -> None:
+        """Drop the cached embeddings of users whose memories are changing."""
+        for key in [key for key in self._user_vectors if key[0] in user_ids]:
+            self._user_vectors.pop(key, None)
+
+    @staticmethod
+    def _stored_embedding(row: sqlite3.Row) -> list[float] | None:
+        blob = row["embedding"]
+        return np.frombuffer(blob, dtype=np.float32).tolist() if blob else None
+
+    @staticmethod
+    def _memory_result(row: sqlite3.Row, score: float) -> dict[str, Any]:
+        return {
+            "memory_id": row["memory_id"],
+            "user_id": row["user_id"],
+            "project_id": row["project_id"],
+            "content": row["content"],
+            "importance": row["importance"],
+            "context": json.loads(row["context"]) if row["context"] else {},
+            "metadata": json.loads(row["metadata"]) if row["metadata"] else {},
+            "source": row["source"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "similarity_score": score,
+        }
 
     def create_knowledge_base(
         self,
@@ -632,8 +776,8 @@ class SQLiteMemoryClient(BaseVectorDB):
         params = []
 
         if content is not None:
-            updates.append("content = ?")
-            params.append(content)
+            updates.append("content = ?, search_text = ?")
+            params.extend([content, cjk_search_text(content)])
 
         if metadata is not None:
             updates.append("metadata = ?")
@@ -687,6 +831,7 @@ class SQLiteMemoryClient(BaseVectorDB):
             (memory_id, user_id, project_id),
         )
         self.conn.commit()
+        self._forget_vectors(user_id)
         return cursor.rowcount > 0
 
     def create_chat_session(
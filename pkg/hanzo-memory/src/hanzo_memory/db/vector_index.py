@@ -0,0 +1,513 @@
+"""On-disk approximate nearest-neighbour index for memory embeddings.
+
+`IVFFlatIndex` keeps every vector L2-normalized in one float32 matrix, memory
+mapped from ``vectors.f32`` so a large index does not have to fit in the heap.
+Once it holds enough vectors it clusters them (spherical k-means) and a query
+scores only the rows in the ``nprobe`` clusters nearest to it; every candidate
+is then scored exactly against its full vector, so the approximation is only
+in which rows are considered. Rows carry the user and project they belong to,
+and a filter that leaves few rows skips the clusters and scores them all.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+from structlog import get_logger
+
+from ..similarity import normalize, top_k
+
+logger = get_logger()
+
+#: Vectors needed before the index clusters them; below this it is exact.
+DEFAULT_TRAIN_MIN = 4096
+#: Clusters scored per query.
+DEFAULT_NPROBE = 8
+#: Filters matching at most this many rows are answered exactly.
+DEFAULT_EXACT_MAX = 8192
+
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLE_PER_LIST = 64
+_CHUNK_ROWS = 16384
+_FORMAT_VERSION = 1
+
+
+class VectorIndex(ABC):
+    """Nearest-neighbour index over embeddings keyed by id.
+
+    Scores are cosine similarities. ``search`` can be restricted to one user
+    and to a set of projects, and ``predicate`` can reject further keys; the
+    index keeps looking until it has ``k`` accepted hits or runs out.
+    """
+
+    @abstractmethod
+    def add(
+        self, key: str, vector: Sequence[float], user_id: str, project_id: str
+    ) -> None:
+        """Add or replace the vector stored under ``key``."""
+
+    @abstractmethod
+    def remove(self, key: str) -> bool:
+        """Remove ``key``; returns False if it was not indexed."""
+
+    @abstractmethod
+    def search(
+        self,
+        query: Sequence[float],
+        k: int,
+        *,
+        user_id: str | None = None,
+        project_ids: Iterable[str] | None = None,
+        predicate: Callable[[str], bool] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Return up to ``k`` ``(key, similarity)`` pairs, best first."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every vector."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Persist pending changes."""
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def __contains__(self, key: object) -> bool: ...
+
+    def add_many(
+        self, items: Iterable[tuple[str, Sequence[float], str, str]]
+    ) -> None:
+        """Add ``(key, vector, user_id, project_id)`` tuples."""
+        for key, vector, user_id, project_id in items:
+            self.add(key, vector, user_id, project_id)
+
+
+class IVFFlatIndex(VectorIndex):
+    """IVF-flat index over a memory-mapped matrix of normalized float32 rows.
+
+    With a ``path``, the index is written out by ``flush``, at the end of every
+    ``add_many`` batch and after every training run.
+
+    Args:
+        path: Directory holding the index files; None keeps it in memory.
+        dim: Vector dimension; taken from the first vector when None.
+        nprobe: Clusters scored per query.
+        train_min: Live vectors needed before clustering; until then, and for
+            filters matching at most ``exact_max`` rows, search is exact.
+        exact_max: Largest filtered row count answered by scoring every row.
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        dim: int | None = None,
+        *,
+        nprobe: int = DEFAULT_NPROBE,
+        train_min: int = DEFAULT_TRAIN_MIN,
+        exact_max: int = DEFAULT_EXACT_MAX,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.nprobe = nprobe
+        self.train_min = train_min
+        self.exact_max = exact_max
+
+        self._dim = dim
+        self._count = 0
+        self._capacity = 0
+        self._vectors = np.empty((0, dim or 0), dtype=np.float32)
+        self._keys: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._user_names: list[str] = []
+        self._user_codes: dict[str, int] = {}
+        self._project_names: list[str] = []
+        self._project_codes: dict[str, int] = {}
+        self._users = np.empty(0, dtype=np.int32)
+        self._projects = np.empty(0, dtype=np.int32)
+        self._alive = np.empty(0, dtype=bool)
+        self._assign = np.empty(0, dtype=np.int32)
+        self._dead = 0
+
+        # Clustering: centroids, and rows [0, _indexed) grouped by cluster as
+        # _order[_offsets[c]:_offsets[c + 1]]. Rows from _indexed on are scanned
+        # with every query until the lists are rebuilt.
+        self._centroids: np.ndarray | None = None
+        self._trained_on = 0
+        self._indexed = 0
+        self._order = np.empty(0, dtype=np.int64)
+        self._offsets = np.zeros(1, dtype=np.int64)
+
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    # -- public API -----------------------------------------------------
+
+    @property
+    def dim(self) -> int | None:
+        return self._dim
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def add(
+        self, key: str, vector: Sequence[float], user_id: str, project_id: str
+    ) -> None:
+        vec = normalize(vector).reshape(-1)
+        if self._dim is None:
+            self._dim = vec.shape[0]
+            self._vectors = np.empty((0, self._dim), dtype=np.float32)
+        if vec.shape[0] != self._dim:
+            raise ValueError(
+                f"vector has dimension {vec.shape[0]}, index expects {self._dim}"
+            )
+        if key in self._rows:
+            self.remove(key)
+
+        row = self._count
+        if row == self._capacity:
+            self._grow(max(1024, 2 * self._capacity))
+        self._vectors[row] = vec
+        self._users[row] = self._code(user_id, self._user_names, self._user_codes)
+        self._projects[row] = self._code(
+            project_id, self._project_names, self._project_codes
+        )
+        self._alive[row] = True
+        self._assign[row] = -1
+        self._keys.append(key)
+        self._rows[key] = row
+        self._count += 1
+
+    def add_many(
+        self, items: Iterable[tuple[str, Sequence[float], str, str]]
+    ) -> None:
+        """Add ``(key, vector, user_id, project_id)`` tuples, then persist them."""
+        super().add_many(items)
+        self.flush()
+
+    def remove(self, key: str) -> bool:
+        row = self._rows.pop(key, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        self._keys[row] = None
+        self._dead += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop every vector, keeping the dimension."""
+        for key in list(self._rows):
+            self.remove(key)
+        self._compact()
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int,
+        *,
+        user_id: str | None = None,
+        project_ids: Iterable[str] | None = None,
+        predicate: Callable[[str], bool] | None = None,
+    ) -> list[tuple[str, float]]:
+        if k <= 0 or not self._rows:
+            return []
+        q = normalize(query).reshape(-1)
+        if q.shape[0] != self._dim:
+            raise ValueError(
+                f"query has dimension {q.shape[0]}, index expects {self._dim}"
+            )
+
+        mask = self._filter_mask(user_id, project_ids)
+        if mask is None:
+            return []
+        matching = int(np.count_nonzero(mask))
+        if matching == 0:
+            return []
+
+        self._maybe_train()
+        if self._centroids is None or matching <= self.exact_max:
+            if matching * 2 >= self._count:
+                # Dense filter: one contiguous matmul beats gathering rows.
+                scores = self._vectors[: self._count] @ q
+                rows = np.flatnonzero(mask)
+                return self._top(rows, scores[rows], k, predicate)
+            rows = np.flatnonzero(mask)
+            return self._top(rows, self._vectors[rows] @ q, k, predicate)
+
+        self._index_tail()
+        centroid_scores = self._centroids @ q
+        nlist = len(centroid_scores)
+        nprobe = min(self.nprobe, nlist)
+        while True:
+            probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+            rows = np.concatenate(
+                [self._order[self._offsets[c] : self._offsets[c + 1]] for c in probe]
+                + [np.arange(self._indexed, self._count)]
+            )
+            rows = np.sort(rows[mask[rows]])
+            hits = self._top(rows, self._vectors[rows] @ q, k, predicate)
+            if len(hits) >= k or nprobe >= nlist:
+                return hits
+            nprobe = min(2 * nprobe, nlist)
+
+    def flush(self) -> None:
+        if self._dead > max(1024, self._count // 4):
+            self._compact()
+        self._save()
+
+    # -- filtering and ranking -----------------------------------------
+
+    def _filter_mask(
+        self, user_id: str | None, project_ids: Iterable[str] | None
+    ) -> np.ndarray | None:
+        n = self._count
+        mask = self._alive[:n].copy()
+        if user_id is not None:
+            code = self._user_codes.get(user_id)
+            if code is None:
+                return None
+            mask &= self._users[:n] == code
+        if project_ids is not None:
+            codes = [
+                self._project_codes[p] for p in project_ids if p in self._project_codes
+            ]
+            if not codes:
+                return None
+            projects = self._projects[:n]
+            mask &= (
+                projects == codes[0] if len(codes) == 1 else np.isin(projects, codes)
+            )
+        return mask
+
+    def _top(
+        self,
+        rows: np.ndarray,
+        scores: np.ndarray,
+        k: int,
+        predicate: Callable[[str], bool] | None,
+    ) -> list[tuple[str, float]]:
+        """Best ``k`` rows by score; ``rows`` is ascending, so ties keep insertion order."""
+        order = top_k(scores, len(scores) if predicate is not None else k)
+        hits: list[tuple[str, float]] = []
+        for i in order:
+            key = self._keys[rows[i]]
+            if key is None or (predicate is not None and not predicate(key)):
+                continue
+            hits.append((key, float(scores[i])))
+            if len(hits) == k:
+                break
+        return hits
+
+    # -- clustering ------------------------------------------------------
+
+    def _maybe_train(self) -> None:
+        live = len(self._rows)
+        if live < self.train_min:
+            return
+        if self._centroids is None or live >= 2 * self._trained_on:
+            self._train()
+
+    def _train(self) -> None:
+        live_rows = np.flatnonzero(self._alive[: self._count])
+        n = len(live_rows)
+        # Never more lists than vectors to seed them from: a small train_min
+        # would otherwise ask for 16 distinct centroids out of fewer rows.
+        nlist = min(int(np.clip(np.sqrt(n), 16, 4096)), n)
+        rng = np.random.default_rng(0)
+        sample_rows = np.sort(
+            rng.choice(live_rows, min(n, nlist * _KMEANS_SAMPLE_PER_LIST), replace=False)
+        )
+        sample = np.asarray(self._vectors[sample_rows])
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+        for _ in range(_KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(labels, kind="stable")
+            counts = np.bincount(labels, minlength=nlist)
+            starts = np.cumsum(counts) - counts
+            empty = counts == 0
+            sums = np.zeros_like(centroids)
+            sums[~empty] = np.add.reduceat(sample[order], starts[~empty], axis=0)
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+
+        self._centroids = centroids
+        self._trained_on = n
+        self._indexed = 0
+        self._index_tail(force=True)
+        self._save()
+        logger.debug(f"Trained vector index: {nlist} lists over {n} vectors")
+
+    def _index_tail(self, force: bool = False) -> None:
+        """Assign rows added since the lists were built, then rebuild them."""
+        assert self._centroids is not None
+        tail = self._count - self._indexed
+        if not force and tail <= max(1024, self._indexed // 16):
+            return
+        for start in range(self._indexed, self._count, _CHUNK_ROWS):
+            stop = min(start + _CHUNK_ROWS, self._count)
+            self._assign[start:stop] = np.argmax(
+                self._vectors[start:stop] @ self._centroids.T, axis=1
+            )
+        self._indexed = self._count
+        assign = self._assign[: self._count]
+        self._order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=len(self._centroids))
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    # -- storage ---------------------------------------------------------
+
+    @staticmethod
+    def _code(name: str, names: list[str], codes: dict[str, int]) -> int:
+        code = codes.get(name)
+        if code is None:
+            code = codes[name] = len(names)
+            names.append(name)
+        return code
+
+    def _grow(self, capacity: int) -> None:
+        assert self._dim is not None
+        if self.path is not None:
+            vectors_file = self.path / "vectors.f32"
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            self._vectors = np.empty((0, self._dim), dtype=np.float32)
+            with open(vectors_file, "ab") as f:
+                f.truncate(capacity * self._dim * 4)
+            self._vectors = np.memmap(
+                vectors_file, dtype=np.float32, mode="r+", shape=(capacity, self._dim)
+            )
+        else:
+            vectors = np.empty((capacity, self._dim), dtype=np.float32)
+            vectors[: self._count] = self._vectors[: self._count]
+            self._vectors = vectors
+        for name in ("_users", "_projects", "_assign"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._count] = old[: self._count]
+            setattr(self, name, new)
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self._count] = self._alive[: self._count]
+        self._alive = alive
+        self._capacity = capacity
+
+    def _compact(self) -> None:
+        """Drop removed rows, keeping the survivors in their order."""
+        if self._dead == 0:
+            return
+        keep = np.flatnonzero(self._alive[: self._count])
+        n = len(keep)
+        self._vectors[:n] = self._vectors[keep]
+        for name in ("_users", "_projects", "_assign"):
+            arr = getattr(self, name)
+            arr[:n] = arr[keep]
+        self._alive[:n] = True
+        self._alive[n:] = False
+        self._keys = [self._keys[i] for i in keep]
+        self._rows = {key: row for row, key in enumerate(self._keys)}  # type: ignore[misc]
+        self._count = n
+        self._dead = 0
+        if self._centroids is not None:
+            self._indexed = 0
+            self._index_tail(force=True)
+
+    def _save(self) -> None:
+        """Write the metadata and flush the vectors, without compacting.
+
+        Row numbers stay valid, so it is safe in the middle of a search.
+        """
+        if self.path is None or self._dim is None:
+            return
+        if isinstance(self._vectors, np.memmap):
+            self._vectors.flush()
+        n = self._count
+        arrays = {
+            "users": self._users[:n],
+            "projects": self._projects[:n],
+            "alive": self._alive[:n],
+            "assign": self._assign[:n],
+            "centroids": (
+                self._centroids
+                if self._centroids is not None
+                else np.empty((0, self._dim), dtype=np.float32)
+            ),
+            "trained": np.array([self._trained_on, self._indexed], dtype=np.int64),
+        }
+        tmp = self.path / "index.npz.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, self.path / "index.npz")
+        meta = {
+            "version": _FORMAT_VERSION,
+            "dim": self._dim,
+            "count": n,
+            "keys": self._keys,
+            "users": self._user_names,
+            "projects": self._project_names,
+        }
+        tmp = self.path / "index.json.tmp"
+        tmp.write_text(json.dumps(meta, separators=(",", ":")))
+        os.replace(tmp, self.path / "index.json")
+
+    def _load(self) -> None:
+        assert self.path is not None
+        meta_file = self.path / "index.json"
+        if not meta_file.exists():
+            return
+        try:
+            meta = json.loads(meta_file.read_text())
+            if meta.get("version") != _FORMAT_VERSION:
+                raise ValueError(f"unsupported index version {meta.get('version')}")
+            dim, count = int(meta["dim"]), int(meta["count"])
+            if self._dim is not None and dim != self._dim:
+                raise ValueError(f"index has dimension {dim}, expected {self._dim}")
+            with np.load(self.path / "index.npz", allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            vectors_file = self.path / "vectors.f32"
+            capacity = vectors_file.stat().st_size // (dim * 4)
+            if capacity < count or len(meta["keys"]) != count:
+                raise ValueError("index files are inconsistent")
+        except Exception as e:
+            logger.warning(f"Discarding unreadable vector index at {self.path}: {e}")
+            return
+
+        self._dim = dim
+        self._vectors = np.memmap(
+            vectors_file, dtype=np.float32, mode="r+", shape=(capacity, dim)
+        )
+        self._capacity = capacity
+        self._count = count
+        self._keys = meta["keys"]
+        self._rows = {key: row for row, key in enumerate(self._keys) if key is not None}
+        self._dead = count - len(self._rows)
+        self._user_names = meta["users"]
+        self._user_codes = {name: i for i, name in enumerate(self._user_names)}
+        self._project_names = meta["projects"]
+        self._project_codes = {name: i for i, name in enumerate(self._project_names)}
+        for name in ("users", "projects", "assign"):
+            arr = np.empty(capacity, dtype=np.int32)
+            arr[:count] = arrays[name]
+            setattr(self, f"_{name}", arr)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._alive[:count] = arrays["alive"]
+        if len(arrays["centroids"]):
+            self._centroids = arrays["centroids"].astype(np.float32)
+            self._trained_on, indexed = (int(x) for x in arrays["trained"])
+            # Rebuild the lists over what was assigned; later rows are the tail.
+            self._indexed = indexed
+            assign = self._assign[:indexed]
+            self._order = np.argsort(assign, kind="stable")
+            counts = np.bincount(assign, minlength=len(self._centroids))
+            self._offsets = np.concatenate(([0], np.cumsum(counts)))
@@ -8,6 +8,7 @@ from contextlib import asynccontextmanager
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
 from structlog import get_logger
 
 from .api.auth import get_or_verify_user_id, require_auth, security
@@ -29,7 +30,12 @@ from .models import (
     RememberRequest,
     UpdateMemoryRequest,
 )
-from .services import get_embedding_service, get_memory_service
+from .services import (
+    EmbeddingQueueFull,
+    get_embedding_batcher,
+    get_embedding_service,
+    get_memory_service,
+)
 
 logger = get_logger()
 
@@ -58,6 +64,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Shutting down Hanzo Memory Service")
+    await get_embedding_batcher().aclose()
     if db_client:
         db_client.close()
 
@@ -179,16 +186,26 @@ async def add_memories(
         else request.memoriestoadd
     )
 
+    # Embed off the event loop, batched with other requests
+    try:
+        embeddings = await get_embedding_batcher().embed(memories_to_add)
+    except EmbeddingQueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        ) from e
+
     # Add memories
-    memory_ids = []
-    for content in memories_to_add:
-        memory = memory_service.create_memory(
-            user_id=request.userid,
-            project_id=project_id,
-            content=content,
-            importance=5.0,  # Default importance for explicit adds
-        )
-        memory_ids.append(memory.memory_id)
+    memories = await run_in_threadpool(
+        memory_service.create_memories,
+        user_id=request.userid,
+        project_id=project_id,
+        contents=memories_to_add,
+        importance=5.0,  # Default importance for explicit adds
+        embeddings=embeddings,
+    )
+    memory_ids = [memory.memory_id for memory in memories]
 
     return {
         "userid": request.userid,
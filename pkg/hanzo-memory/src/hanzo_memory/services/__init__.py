@@ -1,12 +1,30 @@
 """Services package."""
 
-from .embeddings import EmbeddingService, get_embedding_service
+from .embedding_batcher import (
+    EmbeddingBatcher,
+    EmbeddingQueueFull,
+    get_embedding_batcher,
+    reset_embedding_batcher,
+)
+from .embedding_cache import CachedEmbeddingService, EmbeddingCache
+from .embeddings import (
+    EmbeddingService,
+    get_embedding_service,
+    reset_embedding_service,
+)
 from .llm import LLMService, get_llm_service
 from .memory import MemoryService, get_memory_service, reset_memory_service
 
 __all__ = [
+    "EmbeddingBatcher",
+    "EmbeddingQueueFull",
+    "get_embedding_batcher",
+    "reset_embedding_batcher",
+    "CachedEmbeddingService",
+    "EmbeddingCache",
     "EmbeddingService",
     "get_embedding_service",
+    "reset_embedding_service",
     "LLMService",
     "get_llm_service",
     "MemoryService",
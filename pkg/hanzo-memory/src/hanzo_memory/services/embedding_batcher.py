@@ -0,0 +1,201 @@
+"""Coalesce embedding requests into model-sized batches off the event loop."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from structlog import get_logger
+
+from ..config import settings
+from .embeddings import get_embedding_service
+
+logger = get_logger()
+
+
+class EmbeddingQueueFull(RuntimeError):
+    """Raised when texts cannot be queued for embedding in time."""
+
+
+class EmbeddingBatcher:
+    """Batch embedding requests from concurrent callers.
+
+    Each text is queued with a future. A collector task takes texts off the
+    queue until it has ``max_batch`` of them or ``max_wait`` seconds have
+    passed since the first, then hands the batch to ``embed_batch`` on a
+    worker thread and resolves the futures. While every worker is busy,
+    waiting texts keep accumulating, so batches grow with load.
+
+    The queue holds at most ``max_pending`` texts; callers wait up to
+    ``queue_timeout`` seconds for room and then get `EmbeddingQueueFull`.
+    """
+
+    def __init__(
+        self,
+        service: Any | None = None,
+        max_batch: int | None = None,
+        max_wait: float | None = None,
+        max_pending: int | None = None,
+        queue_timeout: float | None = None,
+        workers: int = 1,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            service: Embedding service with ``embed_batch`` (default: the
+                global embedding service)
+            max_batch: Largest batch handed to the model
+            max_wait: Seconds to wait for a batch to fill
+            max_pending: Texts that may be queued before callers must wait
+            queue_timeout: Seconds a caller waits for queue room
+            workers: Batches embedded at the same time
+        """
+        self.service = service or get_embedding_service()
+        self.max_batch = max_batch or settings.embedding_batch_size
+        self.max_wait = (
+            settings.embedding_batch_wait_ms / 1000 if max_wait is None else max_wait
+        )
+        self.max_pending = max_pending or settings.embedding_queue_size
+        self.queue_timeout = (
+            settings.embedding_queue_timeout if queue_timeout is None else queue_timeout
+        )
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="embedding-batcher"
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._collector: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """Texts queued and not yet handed to the model."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed ``texts``, sharing model batches with other callers.
+
+        Raises:
+            EmbeddingQueueFull: If the queue stayed full for ``queue_timeout``
+        """
+        if not texts:
+            return []
+        queue = self._ensure_started()
+        loop = asyncio.get_running_loop()
+        futures = []
+        try:
+            for text in texts:
+                future = loop.create_future()
+                await asyncio.wait_for(queue.put((text, future)), self.queue_timeout)
+                futures.append(future)
+        except asyncio.TimeoutError:
+            for future in futures:
+                future.cancel()
+            raise EmbeddingQueueFull(
+                f"Embedding queue full ({self.pending}/{self.max_pending} texts pending)"
+            ) from None
+        return list(await asyncio.gather(*futures))
+
+    async def embed_single(self, text: str) -> list[float]:
+        """Embed one text."""
+        return (await self.embed([text]))[0]
+
+    async def aclose(self) -> None:
+        """Stop collecting, wait for running batches and shut down the workers."""
+        if self._loop is asyncio.get_running_loop():
+            assert self._collector is not None and self._queue is not None
+            self._collector.cancel()
+            await asyncio.gather(self._collector, return_exceptions=True)
+            if self._running:
+                await asyncio.gather(*self._running, return_exceptions=True)
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+        self._loop = None
+        self._collector = None
+        self._queue = None
+        self._executor.shutdown(wait=True)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="embedding-batcher"
+        )
+
+    def _ensure_started(self) -> asyncio.Queue:
+        """Start the collector on the running loop, restarting it if the loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._collector is None or self._collector.done():
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._slots = asyncio.Semaphore(self.workers)
+            self._running = set()
+            self._collector = loop.create_task(self._collect())
+        assert self._queue is not None
+        return self._queue
+
+    async def _collect(self) -> None:
+        queue, slots = self._queue, self._slots
+        assert queue is not None and slots is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Texts that arrive while all workers are busy join this batch.
+            await slots.acquire()
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            task = loop.create_task(self._run(batch, slots))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(
+        self, batch: list[tuple[str, asyncio.Future]], slots: asyncio.Semaphore
+    ) -> None:
+        try:
+            live = [(text, future) for text, future in batch if not future.done()]
+            if not live:
+                return
+            texts = [text for text, _ in live]
+            try:
+                embed = partial(self.service.embed_batch, texts, batch_size=len(texts))
+                embeddings = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, embed
+                )
+            except Exception as e:
+                logger.error(f"Embedding batch of {len(texts)} texts failed: {e}")
+                for _, future in live:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for (_, future), embedding in zip(live, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+        finally:
+            slots.release()
+
+
+# Global embedding batcher instance
+_embedding_batcher: EmbeddingBatcher | None = None
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """Get or create the global embedding batcher."""
+    global _embedding_batcher
+    if _embedding_batcher is None:
+        _embedding_batcher = EmbeddingBatcher()
+    return _embedding_batcher
+
+
+def reset_embedding_batcher() -> None:
+    """Reset the global embedding batcher (useful for testing)."""
+    global _embedding_batcher
+    _embedding_batcher = None
@@ -0,0 +1,308 @@
+"""Content-addressed cache in front of the embedding services.
+
+Vectors are keyed by model slug, task prefix and the SHA-256 of the text, so
+identical text is embedded once per model. Lookups go to an in-process LRU
+bounded by bytes, then to a SQLite file that other processes can share (WAL
+mode). The file remembers a fingerprint of each model; when a slug starts
+producing vectors from a different backend or of a different size, its old
+entries are dropped.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from structlog import get_logger
+
+logger = get_logger()
+
+#: Rough per-entry overhead of the LRU (key, dict slot, array header).
+_ENTRY_OVERHEAD = 200
+#: Digests per SQLite ``IN (...)`` lookup.
+_LOOKUP_CHUNK = 500
+
+
+def text_digest(text: str) -> bytes:
+    """SHA-256 of ``text`` as UTF-8."""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache: a byte-bounded LRU over a SQLite store."""
+
+    def __init__(self, path: Path | str | None = None, max_bytes: int = 64 << 20):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file for the persistent tier (memory-only if None)
+            max_bytes: Budget of the in-process LRU
+        """
+        self.path = Path(path) if path is not None else None
+        self.max_bytes = max_bytes
+        self._lru: OrderedDict[tuple[str, str, bytes], np.ndarray] = OrderedDict()
+        self._lru_bytes = 0
+        self._lock = threading.Lock()
+        self._fingerprints: dict[str, str] = {}
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._conn: sqlite3.Connection | None = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS models (
+                    model TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    prefix TEXT NOT NULL,
+                    digest BLOB NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (model, prefix, digest)
+                ) WITHOUT ROWID;
+                """
+            )
+            self._conn.commit()
+
+    def get_many(
+        self, model: str, prefix: str, texts: list[str]
+    ) -> list[np.ndarray | None]:
+        """Cached vectors for ``texts``, with None for each miss."""
+        keys = [(model, prefix, text_digest(text)) for text in texts]
+        found: list[np.ndarray | None] = [None] * len(keys)
+        missing: dict[bytes, list[int]] = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._lru.get(key)
+                if vector is not None:
+                    self._lru.move_to_end(key)
+                    found[i] = vector
+                    self.memory_hits += 1
+                else:
+                    missing.setdefault(key[2], []).append(i)
+
+            if missing and self._conn is not None:
+                for digest, vector in self._load(model, prefix, list(missing)):
+                    for i in missing.pop(digest):
+                        found[i] = vector
+                        self.disk_hits += 1
+                    self._remember((model, prefix, digest), vector)
+            self.misses += sum(len(idx) for idx in missing.values())
+        return found
+
+    def put_many(
+        self,
+        model: str,
+        prefix: str,
+        texts: Iterable[str],
+        vectors: Iterable[Any],
+    ) -> None:
+        """Store vectors for ``texts``.
+
+        Args:
+            model: Model slug
+            prefix: Task prefix the texts were embedded with
+            texts: Texts that were embedded
+            vectors: Their embeddings
+        """
+        rows = []
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                array = np.asarray(vector, dtype=np.float32)
+                digest = text_digest(text)
+                self._remember((model, prefix, digest), array)
+                rows.append((model, prefix, digest, array.tobytes()))
+            if rows and self._conn is not None:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows
+                )
+                self._conn.commit()
+
+    def invalidate(self, model: str | None = None) -> None:
+        """Drop the entries of ``model``, or of every model."""
+        with self._lock:
+            for key in [k for k in self._lru if model is None or k[0] == model]:
+                self._lru_bytes -= self._lru.pop(key).nbytes + _ENTRY_OVERHEAD
+            if model is None:
+                self._fingerprints.clear()
+            else:
+                self._fingerprints.pop(model, None)
+            if self._conn is not None:
+                where, args = ("WHERE model = ?", (model,)) if model else ("", ())
+                self._conn.execute(f"DELETE FROM embeddings {where}", args)
+                self._conn.execute(f"DELETE FROM models {where}", args)
+                self._conn.commit()
+
+    def check_model(self, model: str, fingerprint: str) -> None:
+        """Record what produces ``model``'s vectors, dropping them if that changed.
+
+        Args:
+            model: Model slug
+            fingerprint: Identifies the backend and model version
+        """
+        with self._lock:
+            if self._fingerprints.get(model) != fingerprint:
+                self._check_model(model, fingerprint)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counters and sizes."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self._lru),
+            "memory_bytes": self._lru_bytes,
+        }
+
+    def close(self) -> None:
+        """Close the SQLite store."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _load(
+        self, model: str, prefix: str, digests: list[bytes]
+    ) -> list[tuple[bytes, np.ndarray]]:
+        assert self._conn is not None
+        rows = []
+        for lo in range(0, len(digests), _LOOKUP_CHUNK):
+            chunk = digests[lo : lo + _LOOKUP_CHUNK]
+            rows.extend(
+                self._conn.execute(
+                    "SELECT digest, vector FROM embeddings "
+                    f"WHERE model = ? AND prefix = ? AND digest IN ({','.join('?' * len(chunk))})",
+                    (model, prefix, *chunk),
+                )
+            )
+        return [(digest, np.frombuffer(blob, dtype=np.float32)) for digest, blob in rows]
+
+    def _remember(self, key: tuple[str, str, bytes], vector: np.ndarray) -> None:
+        old = self._lru.pop(key, None)
+        if old is not None:
+            self._lru_bytes -= old.nbytes + _ENTRY_OVERHEAD
+        size = vector.nbytes + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        self._lru[key] = vector
+        self._lru_bytes += size
+        while self._lru_bytes > self.max_bytes:
+            _, evicted = self._lru.popitem(last=False)
+            self._lru_bytes -= evicted.nbytes + _ENTRY_OVERHEAD
+
+    def _check_model(self, model: str, fingerprint: str) -> None:
+        if self._conn is not None:
+            row = self._conn.execute(
+                "SELECT fingerprint FROM models WHERE model = ?", (model,)
+            ).fetchone()
+            stored = row[0] if row else None
+        else:
+            stored = self._fingerprints.get(model)
+        if stored is not None and stored != fingerprint:
+            logger.info(
+                f"Embedding model {model} changed ({stored} -> {fingerprint}), "
+                "dropping its cached embeddings"
+            )
+            for key in [k for k in self._lru if k[0] == model]:
+                self._lru_bytes -= self._lru.pop(key).nbytes + _ENTRY_OVERHEAD
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM embeddings WHERE model = ?", (model,))
+        if self._conn is not None and stored != fingerprint:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO models VALUES (?, ?)", (model, fingerprint)
+            )
+            self._conn.commit()
+        self._fingerprints[model] = fingerprint
+
+
+class CachedEmbeddingService:
+    """Embedding service wrapper that serves repeated texts from an `EmbeddingCache`.
+
+    Only the distinct texts that miss the cache reach the wrapped service.
+    Other attributes are passed through.
+    """
+
+    def __init__(self, service: Any, cache: EmbeddingCache, prefix: str = ""):
+        """Initialize the wrapper.
+
+        Args:
+            service: `EmbeddingService`, `MinimalEmbeddingService` or
+                `LanceDBEmbeddingService`
+            cache: Cache to consult
+            prefix: Task prefix the texts are embedded with (see
+                `hanzo_memory.algorithms.prefix_for`)
+        """
+        self.service = service
+        self.cache = cache
+        self.prefix = prefix
+        self._checked: str | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.service, name)
+
+    @property
+    def fingerprint(self) -> str:
+        """Backend, model and dimensions that produce the vectors."""
+        # get_embedding_service grafts LanceDB methods onto an EmbeddingService,
+        # so name the class that actually implements embed_text.
+        backend = getattr(self.service.embed_text, "__self__", self.service)
+        dimensions = self.service.get_model_info().get("dimensions")
+        return f"{type(backend).__name__}:{self.service.model_name}:{dimensions}"
+
+    def embed_text(self, text: str | list[str]) -> list[list[float]]:
+        """Generate embeddings for text, embedding only uncached texts."""
+        texts = [text] if isinstance(text, str) else list(text)
+        return self._embed(texts, self.service.embed_text)
+
+    def embed_single(self, text: str) -> list[float]:
+        """Generate embedding for a single text."""
+        return self.embed_text(text)[0]
+
+    def embed_batch(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        show_progress: bool = False,
+    ) -> list[list[float]]:
+        """Generate embeddings for a batch of texts, embedding only uncached texts."""
+        return self._embed(
+            texts,
+            lambda misses: self.service.embed_batch(
+                misses, batch_size=batch_size, show_progress=show_progress
+            ),
+        )
+
+    def get_model_info(self) -> dict:
+        """Get information about the current embedding model and the cache."""
+        return {**self.service.get_model_info(), "cache": self.cache.stats()}
+
+    def _embed(
+        self, texts: list[str], compute: Callable[[list[str]], list[list[float]]]
+    ) -> list[list[float]]:
+        if not texts:
+            return []
+        model = self.service.model_name
+        if self._checked != model:
+            self.cache.check_model(model, self.fingerprint)
+            self._checked = model
+        cached = self.cache.get_many(model, self.prefix, texts)
+        misses = list(dict.fromkeys(t for t, v in zip(texts, cached) if v is None))
+        computed: dict[str, list[float]] = {}
+        if misses:
+            vectors = compute(misses)
+            self.cache.put_many(model, self.prefix, misses, vectors)
+            computed = dict(zip(misses, vectors))
+        return [computed[t] if v is None else v.tolist() for t, v in zip(texts, cached)]
@@ -1,9 +1,13 @@
 """Embedding service using FastEmbed or LanceDB."""
 
+from __future__ import annotations
+
 import numpy as np
 from structlog import get_logger
 
 from ..config import settings
+from ..similarity import cosine_scores
+from .embedding_cache import CachedEmbeddingService, EmbeddingCache
 
 logger = get_logger()
 
@@ -138,10 +142,7 @@ class EmbeddingService:
         vectors = np.array(embeddings)
 
         if metric == "cosine":
-            # Normalize vectors for cosine similarity
-            query_norm = query / np.linalg.norm(query)
-            vectors_norm = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
-            similarities = np.dot(vectors_norm, query_norm)
+            similarities = cosine_scores(query, vectors)
         elif metric == "dot":
             similarities = np.dot(vectors, query)
         elif metric == "euclidean":
@@ -162,11 +163,19 @@ class EmbeddingService:
 
 
 # Global embedding service instance
-_embedding_service: EmbeddingService | None = None
+_embedding_service: (
+    EmbeddingService | MinimalEmbeddingService | CachedEmbeddingService | None
+) = None
+
 
+def get_embedding_service() -> (
+    EmbeddingService | MinimalEmbeddingService | CachedEmbeddingService
+):
+    """Get or create the global embedding service.
 
-def get_embedding_service() -> EmbeddingService:
-    """Get or create the global embedding service."""
+    With ``settings.embedding_cache`` on, the service is wrapped in a
+    `CachedEmbeddingService`, which has the same embedding methods.
+    """
     global _embedding_service
     if _embedding_service is None:
         # Use LanceDB embeddings if configured
@@ -191,9 +200,23 @@ def get_embedding_service() -> EmbeddingService:
             # This allows the system to work without heavy embedding dependencies
             logger.warning("Using minimal embedding service (dummy embeddings)")
             _embedding_service = MinimalEmbeddingService()
+
+        if settings.embedding_cache:
+            cache = EmbeddingCache(
+                settings.embedding_cache_file, settings.embedding_cache_max_bytes
+            )
+            _embedding_service = CachedEmbeddingService(_embedding_service, cache)
     return _embedding_service
 
 
+def reset_embedding_service() -> None:
+    """Reset the global embedding service (useful for testing)."""
+    global _embedding_service
+    if isinstance(_embedding_service, CachedEmbeddingService):
+        _embedding_service.cache.close()
+    _embedding_service = None
+
+
 class MinimalEmbeddingService:
     """Minimal embedding service that generates dummy embeddings for basic functionality."""
 
@@ -5,6 +5,7 @@ from lancedb.embeddings import get_registry
 from structlog import get_logger
 
 from ..config import settings
+from ..similarity import cosine_scores
 
 logger = get_logger()
 
@@ -167,10 +168,7 @@ class LanceDBEmbeddingService:
         vectors = np.array(embeddings)
 
         if metric == "cosine":
-            # Normalize vectors for cosine similarity
-            query_norm = query / np.linalg.norm(query)
-            vectors_norm = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
-            similarities = np.dot(vectors_norm, query_norm)
+            similarities = cosine_scores(query, vectors)
         elif metric == "dot":
             similarities = np.dot(vectors, query)
         elif metric == "euclidean":
@@ -1,11 +1,13 @@
 """Memory service for managing memories."""
 
 import json
+import threading
 import uuid
 from datetime import datetime
 
 from structlog import get_logger
 
+from ..config import settings
 from ..db import get_db_client
 from ..models.memory import Memory, MemoryWithScore
 from .embeddings import get_embedding_service
@@ -22,6 +24,8 @@ class MemoryService:
         self.db = get_db_client()
         self.embeddings = get_embedding_service()
         self.llm = get_llm_service()
+        # Serializes writes from server worker threads
+        self._write_lock = threading.Lock()
 
     def create_memory(
         self,
@@ -58,15 +62,16 @@ class MemoryService:
 
         # Create memory
         memory_id = f"mem_{uuid.uuid4().hex[:12]}"
-        memory_data = self.db.add_memory(
-            memory_id=memory_id,
-            user_id=user_id,
-            project_id=project_id,
-            content=content,
-            embedding=embedding,
-            metadata=metadata,
-            importance=importance,
-        )
+        with self._write_lock:
+            memory_data = self.db.add_memory(
+                memory_id=memory_id,
+                user_id=user_id,
+                project_id=project_id,
+                content=content,
+                embedding=embedding,
+                metadata=metadata,
+                importance=importance,
+            )
 
         # Parse JSON fields if needed
         if isinstance(memory_data.get("metadata"), str):
@@ -74,6 +79,60 @@ class MemoryService:
 
         return Memory(**memory_data)
 
+    def create_memories(
+        self,
+        user_id: str,
+        project_id: str,
+        contents: list[str],
+        metadata: dict | None = None,
+        importance: float = 1.0,
+        embeddings: list[list[float]] | None = None,
+    ) -> list[Memory]:
+        """
+        Create many memories with one bulk insert.
+
+        Args:
+            user_id: User ID
+            project_id: Project ID
+            contents: Memory contents
+            metadata: Additional metadata, shared by all the memories
+            importance: Importance score
+            embeddings: Embeddings of ``contents``, if already computed
+
+        Returns:
+            Created memories, in the order of ``contents``
+        """
+        # Ensure user's memory table exists
+        self.db.create_memories_table(user_id)
+
+        # Generate embeddings
+        if embeddings is None:
+            embeddings = self.embeddings.embed_batch(contents)
+
+        # Create memories
+        rows = [
+            {
+                "memory_id": f"mem_{uuid.uuid4().hex[:12]}",
+                "user_id": user_id,
+                "project_id": project_id,
+                "content": content,
+                "embedding": embedding,
+                "metadata": metadata,
+                "importance": importance,
+            }
+            for content, embedding in zip(contents, embeddings, strict=True)
+        ]
+        with self._write_lock:
+            added = self.db.add_memories(rows)
+
+        memories = []
+        for memory_data in added:
+            # Parse JSON fields if needed
+            if isinstance(memory_data.get("metadata"), str):
+                memory_data["metadata"] = json.loads(memory_data["metadata"])
+            memories.append(Memory(**memory_data))
+        return memories
+
     def search_memories(
         self,
         user_id: str,
@@ -100,12 +159,20 @@ class MemoryService:
         # Generate query embedding
         query_embedding = self.embeddings.embed_single(query)
 
-        # Search memories
+        # Search memories, by text as well where the backend can
+        hybrid = {}
+        if self.db.supports_text_query:
+            hybrid = {
+                "query": query,
+                "dedup": settings.search_dedup,
+                "mmr_lambda": settings.search_mmr_lambda,
+            }
         results_df = self.db.search_memories(
             user_id=user_id,
             query_embedding=query_embedding,
             project_id=project_id,
             limit=limit * 2 if filter_with_llm else limit,  # Get more if filtering
+            **hybrid,
         )
 
         # Handle both list and DataFrame results
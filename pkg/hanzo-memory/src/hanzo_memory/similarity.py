@@ -0,0 +1,306 @@
+"""Vectorized cosine similarity and top-k selection.
+
+The memory stores all rank embeddings by cosine similarity. This module is
+the one place that does it: vectors are L2-normalized once, when they are
+stored, so scoring a query is a single ``matrix @ query`` product (or
+``matrix @ queries.T`` for a batch), and the best ``k`` rows are picked by
+partitioning the scores rather than sorting them all.
+
+`VectorMatrix` holds a keyed collection of such rows. It can keep them as
+float32, float16 (half the memory) or int8 with a per-row scale (a quarter);
+the compact forms are widened to float32 a block at a time while scoring.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Literal
+
+import numpy as np
+
+StorageDtype = Literal["float32", "float16", "int8"]
+
+_STORAGE_DTYPES = {"float32": np.float32, "float16": np.float16, "int8": np.int8}
+#: Rows widened to float32 per block when scoring compact storage.
+_BLOCK_ROWS = 2048
+_INT8_MAX = 127.0
+
+
+def normalize(vectors: Sequence[float] | Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    """L2-normalize a vector or the rows of a matrix as float32.
+
+    Zero vectors are returned as zeros, so they score 0 against everything.
+    """
+    arr = np.array(vectors, dtype=np.float32)
+    norms = np.linalg.norm(arr, axis=-1, keepdims=True)
+    np.divide(arr, norms, out=arr, where=norms > 0)
+    return arr
+
+
+def cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity of two vectors; 0.0 if either is zero or they differ in length."""
+    if len(a) != len(b) or len(a) == 0:
+        return 0.0
+    va = np.asarray(a, dtype=np.float64)
+    vb = np.asarray(b, dtype=np.float64)
+    denom = float(np.linalg.norm(va) * np.linalg.norm(vb))
+    return float(va @ vb) / denom if denom > 0 else 0.0
+
+
+def cosine_scores(
+    queries: Sequence[float] | Sequence[Sequence[float]] | np.ndarray,
+    vectors: Sequence[Sequence[float]] | np.ndarray,
+) -> np.ndarray:
+    """Cosine similarity of each query against each row of ``vectors``.
+
+    Args:
+        queries: One vector (giving an ``N`` array of scores) or a ``Q x D``
+            batch (giving ``Q x N``).
+        vectors: ``N x D`` matrix.
+
+    Returns:
+        float32 scores.
+    """
+    q = normalize(queries)
+    m = normalize(vectors)
+    if m.ndim != 2:
+        m = m.reshape(-1, q.shape[-1])
+    return q @ m.T
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest scores, best first.
+
+    Equal scores keep index order, so results are the same as a stable
+    descending sort truncated to ``k``, but selection is an O(N) partition
+    and only the selected entries are sorted.
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < n:
+        # Everything scoring at least the k-th best, ties included.
+        kth = np.partition(scores, n - k)[n - k]
+        idx = np.flatnonzero(scores >= kth)
+    else:
+        idx = np.arange(n)
+    return idx[np.lexsort((idx, -scores[idx]))][:k]
+
+
+class VectorMatrix:
+    """Keyed rows of normalized vectors, searched exactly by cosine similarity.
+
+    Rows live in one contiguous array that grows by doubling. Removing a key
+    leaves a hole that is skipped while scoring and reclaimed once holes
+    outnumber live rows.
+
+    Args:
+        dim: Vector dimension; taken from the first vector when None.
+        dtype: Row storage: "float32", "float16" or "int8" (scaled per row).
+    """
+
+    def __init__(self, dim: int | None = None, *, dtype: StorageDtype = "float32") -> None:
+        if dtype not in _STORAGE_DTYPES:
+            raise ValueError(f"Unknown storage dtype: {dtype}")
+        self.dtype: StorageDtype = dtype
+        self._dim = dim
+        self._count = 0
+        self._data = np.empty((0, dim or 0), dtype=_STORAGE_DTYPES[dtype])
+        self._scale = np.empty(0, dtype=np.float32)
+        self._alive = np.empty(0, dtype=bool)
+        self._keys: list[Hashable | None] = []
+        self._rows: dict[Hashable, int] = {}
+
+    @property
+    def dim(self) -> int | None:
+        return self._dim
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by row storage, including unused capacity."""
+        return self._data.nbytes + self._scale.nbytes
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def keys(self) -> list[Hashable]:
+        """Live keys in insertion order."""
+        return [key for key in self._keys if key is not None]
+
+    def add(self, key: Hashable, vector: Sequence[float] | np.ndarray) -> None:
+        """Store ``vector`` under ``key``, replacing any previous vector."""
+        self.add_many([key], [vector])
+
+    def add_many(
+        self,
+        keys: Iterable[Hashable],
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+    ) -> None:
+        """Store many vectors at once; normalizes them in one pass."""
+        keys = list(keys)
+        if not keys:
+            return
+        rows = normalize(vectors).reshape(len(keys), -1)
+        if self._dim is None:
+            self._dim = rows.shape[1]
+            self._data = np.empty((0, self._dim), dtype=self._data.dtype)
+        if rows.shape[1] != self._dim:
+            raise ValueError(
+                f"vector has dimension {rows.shape[1]}, matrix expects {self._dim}"
+            )
+        for key in keys:
+            self.remove(key)
+
+        start, end = self._count, self._count + len(keys)
+        if end > len(self._data):
+            self._grow(max(256, end, 2 * len(self._data)))
+        if self.dtype == "int8":
+            peak = np.abs(rows).max(axis=1)
+            scale = np.where(peak > 0, peak / _INT8_MAX, 1.0).astype(np.float32)
+            self._data[start:end] = np.rint(rows / scale[:, None]).astype(np.int8)
+            self._scale[start:end] = scale
+        else:
+            self._data[start:end] = rows
+        self._alive[start:end] = True
+        for offset, key in enumerate(keys):
+            self._rows[key] = start + offset
+        self._keys.extend(keys)
+        self._count = end
+
+    def remove(self, key: Hashable) -> bool:
+        """Drop ``key``; returns False if it was not stored."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        self._keys[row] = None
+        dead = self._count - len(self._rows)
+        if dead > 64 and dead > len(self._rows):
+            self._compact()
+        return True
+
+    def clear(self) -> None:
+        """Drop every vector, keeping the dimension."""
+        self._count = 0
+        self._keys = []
+        self._rows = {}
+        self._alive[:] = False
+
+    def vector(self, key: Hashable) -> np.ndarray:
+        """The stored (normalized) vector for ``key`` as float32."""
+        row = self._rows[key]
+        return self._widen(row, row + 1)[0]
+
+    def scores(self, queries: Sequence[float] | Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+        """Cosine scores of one query (``N``) or a batch (``Q x N``) against every row.
+
+        Rows of removed keys score ``-inf``.
+        """
+        q = normalize(queries)
+        single = q.ndim == 1
+        q = q.reshape(-1, q.shape[-1])
+        if self._dim is not None and q.shape[1] != self._dim:
+            raise ValueError(
+                f"query has dimension {q.shape[1]}, matrix expects {self._dim}"
+            )
+        n = self._count
+        if n == 0:
+            out = np.zeros((len(q), 0), dtype=np.float32)
+        elif self.dtype == "float32":
+            out = q @ self._data[:n].T
+        else:
+            out = np.empty((len(q), n), dtype=np.float32)
+            for lo in range(0, n, _BLOCK_ROWS):
+                hi = min(lo + _BLOCK_ROWS, n)
+                out[:, lo:hi] = q @ self._widen(lo, hi).T
+        if len(self._rows) < n:
+            out[:, ~self._alive[:n]] = -np.inf
+        return out[0] if single else out
+
+    def search(
+        self,
+        query: Sequence[float] | np.ndarray,
+        k: int,
+        *,
+        threshold: float | None = None,
+        predicate: Callable[[Hashable], bool] | None = None,
+    ) -> list[tuple[Hashable, float]]:
+        """Up to ``k`` ``(key, similarity)`` pairs, best first.
+
+        Args:
+            query: Query vector.
+            k: Number of results.
+            threshold: Drop hits scoring below this.
+            predicate: Drop keys for which this returns False.
+        """
+        if k <= 0 or not self._rows:
+            return []
+        return self._select(self.scores(query), k, threshold, predicate)
+
+    def search_many(
+        self,
+        queries: Sequence[Sequence[float]] | np.ndarray,
+        k: int,
+        *,
+        threshold: float | None = None,
+    ) -> list[list[tuple[Hashable, float]]]:
+        """`search` for a batch of queries, scored with one matrix product."""
+        if k <= 0 or not self._rows:
+            return [[] for _ in range(len(queries))]
+        return [self._select(row, k, threshold, None) for row in self.scores(queries)]
+
+    def _select(
+        self,
+        scores: np.ndarray,
+        k: int,
+        threshold: float | None,
+        predicate: Callable[[Hashable], bool] | None,
+    ) -> list[tuple[Hashable, float]]:
+        live = len(self._rows)
+        want = k if predicate is None else min(4 * k, live)
+        while True:
+            hits: list[tuple[Hashable, float]] = []
+            for i in top_k(scores, min(want, live)):
+                score = float(scores[i])
+                if threshold is not None and score < threshold:
+                    return hits
+                key = self._keys[i]
+                if predicate is not None and not predicate(key):
+                    continue
+                hits.append((key, score))
+                if len(hits) == k:
+                    return hits
+            if want >= live:
+                return hits
+            want = min(4 * want, live)
+
+    def _widen(self, lo: int, hi: int) -> np.ndarray:
+        block = self._data[lo:hi].astype(np.float32)
+        if self.dtype == "int8":
+            block *= self._scale[lo:hi, None]
+        return block
+
+    def _grow(self, capacity: int) -> None:
+        data = np.empty((capacity, self._dim or 0), dtype=self._data.dtype)
+        data[: self._count] = self._data[: self._count]
+        self._data = data
+        if self.dtype == "int8":
+            self._scale = np.resize(self._scale, capacity)
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self._count] = self._alive[: self._count]
+        self._alive = alive
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive[: self._count])
+        n = len(keep)
+        self._data[:n] = self._data[keep]
+        if self.dtype == "int8":
+            self._scale[:n] = self._scale[keep]
+        self._alive[:n] = True
+        self._alive[n:] = False
+        self._keys = [self._keys[row] for row in keep]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._count = n
@@ -0,0 +1,172 @@
+"""`/v1/memories/add` latency and throughput under concurrent clients.
+
+Serves the app with uvicorn in a child process and runs ``--clients``
+keep-alive HTTP connections against it from this one, each adding one memory per request for
+``--seconds``, in two modes:
+
+* inline  — what the endpoint did: ``embed_single`` per memory, called on
+            the event loop, then one ``add_memory`` per memory;
+* batched — the current endpoint: `EmbeddingBatcher` plus ``add_memories``.
+
+The model is simulated: ``embed_batch`` sleeps (releasing the GIL, as ONNX
+inference does) for a fixed per-call cost plus a per-text cost. Storage is
+an in-memory SQLite database.
+
+    python tests/benchmark_embedding_batcher.py [--clients 200] [--seconds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import uvicorn
+from fastapi import FastAPI
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hanzo_memory import server  # noqa: E402
+from hanzo_memory.config import settings  # noqa: E402
+from hanzo_memory.db.sqlite_client import SQLiteMemoryClient  # noqa: E402
+from hanzo_memory.services import embedding_batcher, memory  # noqa: E402
+from hanzo_memory.services.embeddings import MinimalEmbeddingService  # noqa: E402
+
+
+class SimulatedModel(MinimalEmbeddingService):
+    def __init__(self, call_ms: float, text_ms: float):
+        super().__init__()
+        self.call_ms, self.text_ms = call_ms, text_ms
+
+    def embed_text(self, text):
+        texts = [text] if isinstance(text, str) else text
+        time.sleep((self.call_ms + self.text_ms * len(texts)) / 1000)
+        return super().embed_text(texts)
+
+    def embed_batch(self, texts, batch_size=32, show_progress=False):
+        return self.embed_text(texts)
+
+
+async def inline_add(request: dict) -> dict:
+    """The old endpoint body: model and database calls run on the event loop."""
+    service = memory.get_memory_service()
+    ids = [
+        service.create_memory(
+            user_id=request["userid"],
+            project_id=f"project_{request['userid']}_default",
+            content=content,
+            importance=5.0,
+        ).memory_id
+        for content in request["memoriestoadd"]
+    ]
+    return {"added_count": len(ids), "memory_ids": ids}
+
+
+def serve(mode: str, port: int, model: SimulatedModel) -> None:
+    settings.disable_auth = True
+    service = memory.MemoryService.__new__(memory.MemoryService)
+    service.db = SQLiteMemoryClient()
+    service.embeddings = model
+    service.llm = None
+    service._write_lock = threading.Lock()
+    memory._memory_service = service
+    embedding_batcher._embedding_batcher = embedding_batcher.EmbeddingBatcher(model)
+
+    app = server.app
+    if mode == "inline":
+        app = FastAPI()
+        app.post("/v1/memories/add")(inline_add)
+    uvicorn.run(app, port=port, lifespan="off", log_level="warning", backlog=4096)
+
+
+async def post(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, body: bytes) -> int:
+    """One keep-alive HTTP/1.1 POST; httpx costs more CPU than the server here."""
+    writer.write(
+        b"POST /v1/memories/add HTTP/1.1\r\nHost: bench\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+    )
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = next(
+        int(line.split(b":", 1)[1])
+        for line in head.split(b"\r\n")
+        if line.lower().startswith(b"content-length:")
+    )
+    await reader.readexactly(length)
+    return status
+
+
+async def load(port: int, clients: int, seconds: float) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    stop = time.perf_counter() + seconds
+
+    async def worker(i: int) -> None:
+        nonlocal errors
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        n = 0
+        while time.perf_counter() < stop:
+            request = {"userid": f"user{i % 20}", "memoriestoadd": [f"client {i} memory {n}"]}
+            t0 = time.perf_counter()
+            if await post(reader, writer, json.dumps(request).encode()) == 200:
+                latencies.append(time.perf_counter() - t0)
+            else:
+                errors += 1
+            n += 1
+        writer.close()
+
+    await asyncio.gather(*(worker(i) for i in range(clients)))
+    return latencies, errors
+
+
+def run(mode: str, clients: int, seconds: float, model: SimulatedModel) -> tuple[list[float], int]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    child = multiprocessing.Process(target=serve, args=(mode, port, model), daemon=True)
+    child.start()
+    try:
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+        return asyncio.run(load(port, clients, seconds))
+    finally:
+        child.terminate()
+        child.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--call-ms", type=float, default=5.0, help="model cost per call")
+    parser.add_argument("--text-ms", type=float, default=0.2, help="model cost per text")
+    args = parser.parse_args()
+
+    model = SimulatedModel(args.call_ms, args.text_ms)
+    print(
+        f"{args.clients} clients, {args.seconds:.0f} s, model {args.call_ms} ms/call"
+        f" + {args.text_ms} ms/text"
+    )
+    print(f"{'mode':>8}{'req/s':>9}{'p50':>10}{'p99':>10}{'errors':>8}")
+    for mode in ("inline", "batched"):
+        latencies, errors = run(mode, args.clients, args.seconds, model)
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+        print(
+            f"{mode:>8}{len(latencies) / args.seconds:>9.0f}{p50:>7.0f} ms{p99:>7.0f} ms{errors:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Embedding time with and without `EmbeddingCache` on a repetitive workload.
+
+Draws ``--calls`` texts from a vocabulary of ``--distinct`` with a Zipf
+distribution (repeated queries, re-imported notes) and embeds each with
+``embed_single`` through:
+
+* uncached — the bare service;
+* cached   — `CachedEmbeddingService` with a fresh cache;
+* restart  — a new process-local LRU over the SQLite file left by "cached".
+
+The model is simulated by a fixed sleep per call plus a per-text cost.
+
+    python tests/benchmark_embedding_cache.py [--calls 5000] [--distinct 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hanzo_memory.services.embedding_cache import (  # noqa: E402
+    CachedEmbeddingService,
+    EmbeddingCache,
+)
+from hanzo_memory.services.embeddings import MinimalEmbeddingService  # noqa: E402
+
+
+class SimulatedModel(MinimalEmbeddingService):
+    def __init__(self, call_ms: float, text_ms: float):
+        super().__init__()
+        self.call_ms, self.text_ms = call_ms, text_ms
+
+    def embed_text(self, text):
+        texts = [text] if isinstance(text, str) else text
+        time.sleep((self.call_ms + self.text_ms * len(texts)) / 1000)
+        return super().embed_text(texts)
+
+
+def timed(service, texts: list[str]) -> float:
+    t0 = time.perf_counter()
+    for text in texts:
+        service.embed_single(text)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--distinct", type=int, default=1000)
+    parser.add_argument("--zipf", type=float, default=1.2)
+    parser.add_argument("--call-ms", type=float, default=2.0)
+    parser.add_argument("--text-ms", type=float, default=0.5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    ranks = np.minimum(rng.zipf(args.zipf, args.calls), args.distinct)
+    texts = [f"remember that item {r} is important " * 4 for r in ranks]
+    model = SimulatedModel(args.call_ms, args.text_ms)
+    print(f"{args.calls} calls over {len(set(texts))} distinct texts")
+    print(f"{'mode':>9}{'total':>9}{'per call':>11}{'hit rate':>10}")
+
+    t = timed(model, texts)
+    print(f"{'uncached':>9}{t:>7.2f} s{t / args.calls * 1e3:>8.2f} ms{'-':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cache.sqlite"
+        for mode in ("cached", "restart"):
+            service = CachedEmbeddingService(model, EmbeddingCache(path))
+            t = timed(service, texts)
+            rate = service.cache.stats()["hit_rate"]
+            print(f"{mode:>9}{t:>7.2f} s{t / args.calls * 1e3:>8.2f} ms{rate:>10.3f}")
+            service.cache.close()
+
+
+if __name__ == "__main__":
+    main()
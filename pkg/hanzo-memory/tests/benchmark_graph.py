@@ -0,0 +1,168 @@
+"""Graph maintenance timings: SNN, PFNET and Louvain on CSR arrays.
+
+Generates planted-partition graphs (communities of 50 nodes, 80% of edges
+inside them, five edges per node) from ``--sizes`` edges and times
+`snn_score`, `pfnet_infinity` and `louvain`. Up to ``--reference-edges`` it
+also runs the previous dict/set implementations, kept below, and checks that
+SNN and PFNET give identical output; Louvain is compared by modularity.
+
+    python tests/benchmark_graph.py [--sizes 1000,10000,100000,1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hanzo_memory.algorithms import (  # noqa: E402
+    WeightedEdge,
+    louvain,
+    pfnet_infinity,
+    snn_score,
+)
+
+
+def reference_snn(edges: list[WeightedEdge], k: int = 10) -> list[WeightedEdge]:
+    adj: dict[str, list[WeightedEdge]] = {}
+    for e in edges:
+        adj.setdefault(e.source, []).append(e)
+        adj.setdefault(e.target, []).append(WeightedEdge(e.target, e.source, e.weight))
+    nbrs: dict[str, set[str]] = {}
+    for node, lst in adj.items():
+        lst.sort(key=lambda x: x.weight, reverse=True)
+        nbrs[node] = {x.target for x in lst[:k]}
+    out: list[WeightedEdge] = []
+    for e in edges:
+        a = nbrs.get(e.source, set())
+        b = nbrs.get(e.target, set())
+        union = len(a | b)
+        out.append(WeightedEdge(e.source, e.target, len(a & b) / union if union > 0 else 0.0))
+    return out
+
+
+def reference_pfnet(edges: list[WeightedEdge]) -> list[WeightedEdge]:
+    adj: dict[str, dict[str, float]] = {}
+    for e in edges:
+        adj.setdefault(e.source, {})[e.target] = max(adj.get(e.source, {}).get(e.target, 0), e.weight)
+    keep: list[WeightedEdge] = []
+    for e in edges:
+        dominated = False
+        for x, w_ux in adj.get(e.source, {}).items():
+            if x == e.target:
+                continue
+            w_xv = adj.get(x, {}).get(e.target)
+            if w_xv is not None and min(w_ux, w_xv) > e.weight:
+                dominated = True
+                break
+        if not dominated:
+            keep.append(e)
+    return keep
+
+
+def reference_louvain(edges: list[WeightedEdge], passes: int = 10) -> dict[str, int]:
+    nodes = {n for e in edges for n in (e.source, e.target)}
+    community = {n: i for i, n in enumerate(nodes)}
+    adj: dict[str, list[tuple[str, float]]] = {}
+    m = 0.0
+    for e in edges:
+        adj.setdefault(e.source, []).append((e.target, e.weight))
+        adj.setdefault(e.target, []).append((e.source, e.weight))
+        m += e.weight
+    deg = {n: sum(w for _, w in adj.get(n, [])) for n in nodes}
+    for _ in range(passes):
+        improved = False
+        for n in nodes:
+            cur = community[n]
+            w_to: dict[int, float] = {}
+            for nb, w in adj.get(n, []):
+                w_to[community[nb]] = w_to.get(community[nb], 0) + w
+            best, best_gain = cur, 0.0
+            for c, wnc in w_to.items():
+                if c == cur:
+                    continue
+                sigma_tot = sum(deg[o] for o, comm in community.items() if comm == c and o != n)
+                gain = wnc - (deg[n] * sigma_tot) / max(2 * m, 1e-9)
+                if gain > best_gain:
+                    best_gain, best = gain, c
+            if best != cur:
+                community[n] = best
+                improved = True
+        if not improved:
+            break
+    return community
+
+
+def modularity(edges: list[WeightedEdge], community: dict[str, int]) -> float:
+    m = sum(e.weight for e in edges)
+    inside: dict[int, float] = defaultdict(float)
+    total: dict[int, float] = defaultdict(float)
+    for e in edges:
+        total[community[e.source]] += e.weight
+        total[community[e.target]] += e.weight
+        if community[e.source] == community[e.target]:
+            inside[community[e.source]] += e.weight
+    return sum(inside[c] / m - (total[c] / (2 * m)) ** 2 for c in total)
+
+
+def planted(num_edges: int, rng: random.Random) -> list[WeightedEdge]:
+    nodes = max(num_edges // 5, 60)
+    size = 50
+    edges = []
+    for _ in range(num_edges):
+        a = rng.randrange(nodes)
+        if rng.random() < 0.8:
+            lo = a - a % size
+            b = rng.randrange(lo, min(lo + size, nodes))
+        else:
+            b = rng.randrange(nodes)
+        edges.append(WeightedEdge(f"n{a}", f"n{b}", round(rng.random(), 3)))
+    return edges
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000")
+    parser.add_argument("--reference-edges", type=int, default=100000)
+    parser.add_argument("--reference-louvain-edges", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'edges':>9}{'step':>9}{'csr':>10}{'before':>10}  result")
+    for size in map(int, args.sizes.split(",")):
+        edges = planted(size, random.Random(size))
+        for name, fn, ref in (
+            ("snn", snn_score, reference_snn),
+            ("pfnet", pfnet_infinity, reference_pfnet),
+            ("louvain", louvain, reference_louvain),
+        ):
+            out, t = timed(fn, edges)
+            limit = args.reference_louvain_edges if name == "louvain" else args.reference_edges
+            before, note = "-", ""
+            if size <= limit:
+                expected, t_ref = timed(ref, edges)
+                before = f"{t_ref:>8.2f} s"
+                if name == "louvain":
+                    note = f"Q {modularity(edges, out):.3f} (before {modularity(edges, expected):.3f})"
+                else:
+                    same = [(e.source, e.target, e.weight) for e in out] == [
+                        (e.source, e.target, e.weight) for e in expected
+                    ]
+                    note = "identical" if same else "DIFFERENT"
+            elif name == "louvain":
+                note = f"Q {modularity(edges, out):.3f}"
+            print(f"{size:>9}{name:>9}{t:>8.2f} s{before:>10}  {note}")
+
+
+if __name__ == "__main__":
+    main()
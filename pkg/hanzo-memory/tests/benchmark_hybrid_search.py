@@ -0,0 +1,122 @@
+"""Relevance and latency of `SQLiteMemoryClient.search_memories` by mode.
+
+Builds a synthetic corpus in an in-memory database: ``--docs`` memories in
+topics and subtopics, each with an embedding near its subtopic's centre, a
+few of its topic's words and a unique ticket number. Two kinds of query:
+
+* keyword  — a ticket number; its embedding only knows the topic, as
+             embedding models blur identifiers;
+* semantic — two topic words, with an embedding near one subtopic, whose
+             memories are the relevant ones.
+
+Modes: ``newest`` (what the search returned without sqlite-vec), ``text``
+(BM25 only), ``vector`` and ``hybrid`` (both, fused with RRF).
+
+    python tests/benchmark_hybrid_search.py [--docs 20000] [--queries 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hanzo_memory.algorithms import QueryEval, ndcg_at_k, recall_at_k  # noqa: E402
+from hanzo_memory.db.fts import fts_search  # noqa: E402
+from hanzo_memory.db.sqlite_client import SQLiteMemoryClient  # noqa: E402
+
+K = 10
+
+
+def build(client: SQLiteMemoryClient, docs: int, topics: int, dim: int, rng) -> dict:
+    subtopics = 4
+    centres = rng.normal(size=(topics, dim))
+    sub_centres = centres[:, None, :] + 0.6 * rng.normal(size=(topics, subtopics, dim))
+    words = [[f"word{t}x{j}" for j in range(6)] for t in range(topics)]
+    topic = rng.integers(topics, size=docs)
+    sub = rng.integers(subtopics, size=docs)
+    embeddings = sub_centres[topic, sub] + 0.4 * rng.normal(size=(docs, dim))
+    client.add_memories(
+        [
+            {
+                "memory_id": f"m{i}",
+                "user_id": "bench",
+                "project_id": "bench",
+                "content": " ".join(rng.choice(words[topic[i]], 3)) + f" ticket{i}",
+                "embedding": embeddings[i].tolist(),
+            }
+            for i in range(docs)
+        ]
+    )
+    return {"centres": centres, "sub_centres": sub_centres, "words": words, "topic": topic, "sub": sub}
+
+
+def make_queries(corpus: dict, n: int, rng) -> dict[str, list[tuple[str, np.ndarray, set[str]]]]:
+    topic, sub = corpus["topic"], corpus["sub"]
+    dim = corpus["centres"].shape[1]
+    keyword, semantic = [], []
+    for i in rng.choice(len(topic), n, replace=False):
+        embedding = corpus["centres"][topic[i]] + 0.3 * rng.normal(size=dim)
+        keyword.append((f"ticket{i}", embedding, {f"m{i}"}))
+    for _ in range(n):
+        t, s = rng.integers(len(corpus["centres"])), rng.integers(4)
+        text = " ".join(rng.choice(corpus["words"][t], 2, replace=False))
+        embedding = corpus["sub_centres"][t, s] + 0.2 * rng.normal(size=dim)
+        relevant = {f"m{i}" for i in np.flatnonzero((topic == t) & (sub == s))}
+        semantic.append((text, embedding, relevant))
+    return {"keyword": keyword, "semantic": semantic}
+
+
+def search(client: SQLiteMemoryClient, mode: str, text: str, embedding: np.ndarray) -> list[str]:
+    if mode == "newest":
+        rows = client.conn.execute(
+            "SELECT memory_id FROM memories WHERE user_id = ? ORDER BY timestamp DESC LIMIT ?",
+            ("bench", K),
+        )
+        return [row["memory_id"] for row in rows]
+    if mode == "text":
+        rows = fts_search(client.conn, text, "m.user_id = ?", ["bench"], K)
+        return [row["memory_id"] for row in rows]
+    query = text if mode == "hybrid" else None
+    results = client.search_memories("bench", embedding.tolist(), limit=K, query=query)
+    return [r["memory_id"] for r in results]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200, help="per kind")
+    parser.add_argument("--topics", type=int, default=100)
+    parser.add_argument("--dim", type=int, default=64)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    client = SQLiteMemoryClient()
+    t0 = time.perf_counter()
+    corpus = build(client, args.docs, args.topics, args.dim, rng)
+    print(f"{args.docs} memories indexed in {time.perf_counter() - t0:.1f} s")
+    queries = make_queries(corpus, args.queries, rng)
+
+    print(f"{'mode':>8}{'kind':>10}{'nDCG@10':>9}{'R@10':>7}{'p50':>10}{'p99':>10}")
+    for mode in ("newest", "text", "vector", "hybrid"):
+        for kind, batch in queries.items():
+            evals, latencies = [], []
+            for text, embedding, relevant in batch:
+                t0 = time.perf_counter()
+                predicted = search(client, mode, text, embedding)
+                latencies.append(time.perf_counter() - t0)
+                evals.append(QueryEval(predicted=predicted, relevant=sorted(relevant)))
+            ndcg = np.mean([ndcg_at_k(q, K) for q in evals])
+            recall = np.mean([recall_at_k(q, K) for q in evals])
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+            print(f"{mode:>8}{kind:>10}{ndcg:>9.3f}{recall:>7.3f}{p50:>7.2f} ms{p99:>7.2f} ms")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Local memory storage: whole-file rewrites vs the append-only `LogStore`.
+
+* rewrite — what ``LocalMemoryClient`` did: every insert re-serializes
+            ``memories.json`` and ``embeddings.npz`` in full. Timed at
+            ``--rewrite-sizes`` existing memories; the cost of one insert
+            grows with the store, so it is not run at the largest size;
+* log     — one appended record and vector per insert, with and without
+            fsync, and ``batch`` (one fsync per ``--batch`` inserts).
+
+Also reports cold-start time (open the store and read one memory) for the
+old format and for the log with and without a checkpoint.
+
+    python tests/benchmark_log_store.py [--size 100000] [--dim 384]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hanzo_memory.db.log_store import LogStore  # noqa: E402
+
+
+def memory(i: int) -> dict:
+    return {
+        "id": f"m{i}",
+        "memory_id": f"m{i}",
+        "project_id": "project",
+        "user_id": "user",
+        "content": f"memory number {i} " + "lorem ipsum " * 20,
+        "metadata": {},
+        "importance": 0.5,
+    }
+
+
+def rewrite_insert_cost(existing: int, dim: int, inserts: int) -> float:
+    rng = np.random.default_rng(existing)
+    memories = {f"m{i}": memory(i) for i in range(existing)}
+    embeddings = {f"memory_m{i}": rng.standard_normal(dim) for i in range(existing)}
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        for i in range(existing, existing + inserts):
+            memories[f"m{i}"] = memory(i)
+            embeddings[f"memory_m{i}"] = rng.standard_normal(dim)
+            with open(Path(tmp) / "memories.json", "w") as f:
+                json.dump(memories, f, indent=2, default=str)
+            np.savez_compressed(Path(tmp) / "embeddings.npz", **embeddings)
+        return (time.perf_counter() - t0) / inserts
+
+
+def log_inserts(path: Path, size: int, dim: int, *, fsync: bool, batch: int) -> float:
+    rng = np.random.default_rng(0)
+    store = LogStore(path, fsync=fsync)
+    memories = store.collection("memories")
+    t0 = time.perf_counter()
+    for lo in range(0, size, batch):
+        with store.batch():
+            for i in range(lo, min(lo + batch, size)):
+                memories[f"m{i}"] = memory(i)
+                store.vectors[f"memory_m{i}"] = rng.standard_normal(dim, dtype=np.float32)
+    elapsed = time.perf_counter() - t0
+    store.close()
+    return elapsed / size
+
+
+def old_cold_start(size: int, dim: int) -> float:
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(Path(tmp) / "memories.json", "w") as f:
+            json.dump({f"m{i}": memory(i) for i in range(size)}, f, indent=2)
+        np.savez_compressed(
+            Path(tmp) / "embeddings.npz",
+            **{f"memory_m{i}": rng.standard_normal(dim) for i in range(size)},
+        )
+        t0 = time.perf_counter()
+        with open(Path(tmp) / "memories.json") as f:
+            memories = json.load(f)
+        with np.load(Path(tmp) / "embeddings.npz", allow_pickle=True) as data:
+            embeddings = {k: v for k, v in data.items()}
+        memories["m0"], embeddings["memory_m0"]
+        return time.perf_counter() - t0
+
+
+def log_cold_start(path: Path) -> float:
+    t0 = time.perf_counter()
+    store = LogStore(path)
+    store.get("memories", "m0"), store.get_vector("memory_m0")
+    elapsed = time.perf_counter() - t0
+    store.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--rewrite-sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"dim {args.dim}; insert times are per memory")
+    for existing in args.rewrite_sizes:
+        t = rewrite_insert_cost(existing, args.dim, inserts=3)
+        print(f"  rewrite at {existing:>7} memories  {t * 1e3:>10.1f} ms")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, fsync, batch in [
+            ("log, fsync", True, 1),
+            (f"log, fsync per {args.batch}", True, args.batch),
+            ("log, no fsync", False, args.batch),
+        ]:
+            path = Path(tmp) / label.replace(" ", "_").replace(",", "")
+            n = args.size if batch > 1 else min(args.size, 10_000)
+            t = log_inserts(path, n, args.dim, fsync=fsync, batch=batch)
+            print(f"  {label:<31} {t * 1e6:>10.1f} us  ({n} inserts)")
+
+        print(f"cold start at {args.size} memories")
+        print(f"  json + npz                      {old_cold_start(args.size, args.dim):>10.2f} s")
+        path = Path(tmp) / "log_no_fsync"
+        print(f"  log, checkpointed               {log_cold_start(path):>10.3f} s")
+        (path / "index.json").unlink()
+        print(f"  log, full replay                {log_cold_start(path):>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Markdown import scans: manifest with mtime/size fast path vs hashing every file.
+
+Writes ``--files`` directories, each with an LLM.md of ``--sections``
+sections, and times a `MarkdownMemoryReader.scan` on a fresh manifest, a
+rescan with nothing changed and a rescan after one section of one file is
+edited. The previous import, which hashed every file, then re-read and
+re-parsed each changed one in full, is timed for the same three steps.
+
+    python tests/benchmark_markdown_import.py [--files 200] [--sections 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hanzo_memory.db.markdown_reader import MarkdownMemoryReader  # noqa: E402
+
+
+def write(path: Path, sections: int, edit: int = -1) -> None:
+    text = "".join(
+        f"## Section {i}\n" + ("edited " if i == edit else "") + f"notes {i} " * 40 + "\n"
+        for i in range(sections)
+    )
+    path.write_text(text)
+    stamp = time.time() - 60
+    os.utime(path, (stamp, stamp))
+
+
+def reference_scan(reader: MarkdownMemoryReader, hashes: dict[str, str]) -> int:
+    """Sections produced by the previous whole-file import."""
+    produced = 0
+    for filepath in reader.find_markdown_files():
+        file_id = str(filepath.absolute())
+        digest = hashlib.sha256(filepath.read_text(encoding="utf-8").encode()).hexdigest()
+        if hashes.get(file_id) == digest:
+            continue
+        content = filepath.read_text(encoding="utf-8")
+        hashes[file_id] = digest
+        for section in reader._parse_markdown_sections(content, filepath):
+            reader._section_memory(filepath, file_id, section, "", "")
+            produced += 1
+    return produced
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--sections", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs = [Path(tmp) / f"project{i}" for i in range(args.files)]
+        for d in dirs:
+            d.mkdir()
+            write(d / "LLM.md", args.sections)
+
+        reader = MarkdownMemoryReader(dirs, manifest_path=Path(tmp) / "manifest.json")
+        before = MarkdownMemoryReader(dirs)
+        hashes: dict[str, str] = {}
+
+        print(f"{'step':>10}{'manifest':>12}{'sections':>10}{'before':>12}{'sections':>10}")
+        for step in ("first", "unchanged", "one edit"):
+            if step == "one edit":
+                write(dirs[0] / "LLM.md", args.sections, edit=3)
+            changes, t = timed(reader.scan)
+            reader.save_manifest()
+            produced, t_ref = timed(reference_scan, before, hashes)
+            print(
+                f"{step:>10}{t * 1e3:>9.1f} ms{len(changes.added):>10}"
+                f"{t_ref * 1e3:>9.1f} ms{produced:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
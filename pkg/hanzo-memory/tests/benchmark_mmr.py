@@ -0,0 +1,95 @@
+"""MMR re-ranking time: per-pair cosine loop vs running max-similarity vector.
+
+Reranks ``--candidates`` random hits (scores in [0, 1), embeddings of
+``--dim`` dimensions) down to ``--limit`` with `mmr_rerank`, from the hits'
+embedding lists and from a pre-normalized matrix, and with the previous
+implementation, kept below. Checks that all three pick the same hits.
+
+    python tests/benchmark_mmr.py [--candidates 500] [--limit 50] [--dim 384]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hanzo_memory.algorithms import MmrInput, mmr_rerank  # noqa: E402
+from hanzo_memory.similarity import cosine, normalize  # noqa: E402
+
+
+def reference_mmr(hits: list[MmrInput], lambda_: float = 0.5, limit: int | None = None) -> list[MmrInput]:
+    limit = limit if limit is not None else len(hits)
+    embedded = [h for h in hits if h.embedding]
+    orphans = [h for h in hits if not h.embedding]
+    selected: list[MmrInput] = []
+    cands = list(embedded)
+    while len(selected) < limit and cands:
+        best_idx = -1
+        best_score = -math.inf
+        for i, c in enumerate(cands):
+            max_sim = 0.0
+            for s in selected:
+                sim = cosine(c.embedding or [], s.embedding or [])
+                if sim > max_sim:
+                    max_sim = sim
+            mmr = lambda_ * c.score - (1 - lambda_) * max_sim
+            if mmr > best_score:
+                best_score = mmr
+                best_idx = i
+        if best_idx < 0:
+            break
+        selected.append(cands.pop(best_idx))
+    for o in orphans:
+        if len(selected) >= limit:
+            break
+        selected.append(o)
+    return selected
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--lambda", dest="lambda_", type=float, default=0.5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Clustered, so redundancy matters
+    centres = rng.normal(size=(args.candidates // 10 or 1, args.dim))
+    vectors = centres[rng.integers(len(centres), size=args.candidates)]
+    vectors = vectors + 0.5 * rng.normal(size=vectors.shape)
+    hits = [
+        MmrInput(slug=f"h{i}", score=float(s), embedding=v.tolist())
+        for i, (s, v) in enumerate(zip(rng.random(args.candidates), vectors))
+    ]
+    matrix = normalize(vectors)
+
+    picks = {}
+    for name, fn, kwargs in (
+        ("before", reference_mmr, {}),
+        ("lists", mmr_rerank, {}),
+        ("matrix", mmr_rerank, {"embeddings": matrix}),
+    ):
+        out, t = timed(fn, hits, args.lambda_, args.limit, **kwargs)
+        picks[name] = [h.slug for h in out]
+        print(f"{name:>8}{t * 1e3:>10.1f} ms")
+    same = picks["lists"] == picks["before"] and picks["matrix"] == picks["before"]
+    print("identical picks" if same else "DIFFERENT picks")
+
+
+if __name__ == "__main__":
+    main()
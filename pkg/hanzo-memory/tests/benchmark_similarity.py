@@ -0,0 +1,97 @@
+"""Top-k cosine search at 10k/100k/1M vectors: per-pair loop vs `VectorMatrix`.
+
+* loop  — what the stores did before: one normalized dot product per stored
+          vector, then a full sort (timed up to ``--loop-max`` vectors);
+* f32 / f16 / i8 — `VectorMatrix` with float32, float16 and int8 storage,
+          one query at a time and as a batch of ``--batch`` queries scored
+          with one matrix product (per-query time shown).
+
+Also reports resident size of each storage form and recall@10 of the
+quantized forms against float32.
+
+    python tests/benchmark_similarity.py [--sizes 10000 100000 1000000] [--dim 384]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hanzo_memory.similarity import VectorMatrix  # noqa: E402
+
+K = 10
+_CHUNK = 50_000
+
+
+def fill(matrix: VectorMatrix, size: int, dim: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    for lo in range(0, size, _CHUNK):
+        hi = min(lo + _CHUNK, size)
+        matrix.add_many(range(lo, hi), rng.standard_normal((hi - lo, dim), dtype=np.float32))
+
+
+def loop_search(vectors: list[np.ndarray], query: np.ndarray) -> list[int]:
+    scores = []
+    for i, vec in enumerate(vectors):
+        denom = np.linalg.norm(query) * np.linalg.norm(vec)
+        scores.append((i, float(np.dot(query, vec) / denom) if denom else 0.0))
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return [i for i, _ in scores[:K]]
+
+
+def per_query(fn, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--loop-max", type=int, default=100_000)
+    args = parser.parse_args()
+
+    queries = np.random.default_rng(99).standard_normal((args.batch, args.dim), dtype=np.float32)
+    print(f"dim {args.dim}, k={K}; times are per query")
+    print(f"{'vectors':>9} {'store':>6} {'MiB':>7} {'single':>10} {'batched':>10} {'recall':>7}")
+    for size in args.sizes:
+        if size <= args.loop_max:
+            rng = np.random.default_rng(size)
+            vectors = list(rng.standard_normal((size, args.dim), dtype=np.float32))
+            t = per_query(lambda: loop_search(vectors, queries[0]), 3)
+            print(f"{size:>9} {'loop':>6} {size * args.dim * 4 / 2**20:>7.0f} {t * 1e3:>7.1f} ms {'-':>10} {'-':>7}")
+            del vectors
+
+        truth = None
+        for dtype in ("float32", "float16", "int8"):
+            matrix = VectorMatrix(args.dim, dtype=dtype)
+            fill(matrix, size, args.dim, seed=size)
+            single = per_query(lambda: matrix.search(queries[0], K), args.queries)
+            t0 = time.perf_counter()
+            hits = matrix.search_many(queries, K)
+            batched = (time.perf_counter() - t0) / len(queries)
+            found = [[key for key, _ in h] for h in hits]
+            if truth is None:
+                truth, recall = found, 1.0
+            else:
+                recall = np.mean([len(set(a) & set(b)) / K for a, b in zip(truth, found)])
+            label = {"float32": "f32", "float16": "f16", "int8": "i8"}[dtype]
+            print(
+                f"{size:>9} {label:>6} {matrix.nbytes / 2**20:>7.0f} {single * 1e3:>7.2f} ms"
+                f" {batched * 1e3:>7.2f} ms {recall:>7.3f}"
+            )
+            del matrix
+
+
+if __name__ == "__main__":
+    main()
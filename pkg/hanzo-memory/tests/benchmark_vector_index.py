@@ -0,0 +1,106 @@
+"""Memory search latency and recall: brute-force scan vs `IVFFlatIndex`.
+
+Fills an index with clustered random embeddings and answers the same queries
+three ways:
+
+* scan  — what ``LocalMemoryClient.search_memories`` did: one
+          ``_compute_similarity`` per stored memory, then a sort;
+* exact — the index with clustering disabled (one matrix product);
+* ivf   — the index after clustering, probing ``nprobe`` lists.
+
+Recall is the fraction of the scan's top 10 that ``ivf`` also returns. The
+scan is only timed up to ``--scan-max`` memories.
+
+    python tests/benchmark_vector_index.py [--sizes 10000 100000] [--dim 384] [--queries 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hanzo_memory.db.vector_index import IVFFlatIndex  # noqa: E402
+
+K = 10
+
+
+def clustered(n: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    means = rng.standard_normal((max(16, n // 200), dim)).astype(np.float32)
+    noise = rng.standard_normal((n, dim)).astype(np.float32)
+    return means[rng.integers(0, len(means), n)] + 0.5 * noise
+
+
+def compute_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    dot_product = np.dot(a, b)
+    norm1, norm2 = np.linalg.norm(a), np.linalg.norm(b)
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+    return float(dot_product / (norm1 * norm2))
+
+
+def scan(embeddings: dict[str, np.ndarray], query: np.ndarray) -> list[str]:
+    results = [(key, compute_similarity(query, vec)) for key, vec in embeddings.items()]
+    results.sort(key=lambda x: x[1], reverse=True)
+    return [key for key, _ in results[:K]]
+
+
+def timed(fn, queries: np.ndarray) -> tuple[float, list[list[str]]]:
+    t0 = time.perf_counter()
+    hits = [fn(q) for q in queries]
+    return (time.perf_counter() - t0) / len(queries), hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--scan-max", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'memories':>9}{'scan':>11}{'exact':>11}{'ivf':>11}{'recall@10':>11}{'build':>9}{'reload':>9}")
+    for size in args.sizes:
+        vectors = clustered(size, args.dim, rng)
+        picks = rng.integers(0, size, args.queries)
+        queries = vectors[picks] + 0.2 * rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            t0 = time.perf_counter()
+            index = IVFFlatIndex(tmp, exact_max=0)
+            for i, vec in enumerate(vectors):
+                index.add(f"m{i}", vec, "user", "project")
+            index.search(queries[0], K)  # clusters the index
+            index.flush()
+            build = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            index = IVFFlatIndex(tmp, exact_max=0)
+            reload = time.perf_counter() - t0
+
+            ivf_time, ivf_hits = timed(lambda q: [k for k, _ in index.search(q, K)], queries)
+            index.exact_max = size
+            exact_time, exact_hits = timed(lambda q: [k for k, _ in index.search(q, K)], queries)
+
+        scan_col = "-"
+        if size <= args.scan_max:
+            embeddings = {f"m{i}": vec for i, vec in enumerate(vectors)}
+            scan_time, exact_hits = timed(lambda q: scan(embeddings, q), queries[:10])
+            ivf_hits = ivf_hits[:10]
+            scan_col = f"{scan_time * 1e3:.1f} ms"
+
+        recall = np.mean([len(set(a) & set(b)) / K for a, b in zip(exact_hits, ivf_hits)])
+        print(
+            f"{size:>9}{scan_col:>11}{exact_time * 1e3:>8.1f} ms{ivf_time * 1e3:>8.2f} ms"
+            f"{recall:>11.3f}{build:>7.1f} s{reload:>7.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,11 @@ from fastapi.testclient import TestClient
 from hanzo_memory.config import settings
 from hanzo_memory.db.client import InfinityClient
 from hanzo_memory.db import reset_db_client
-from hanzo_memory.services import reset_memory_service
+from hanzo_memory.services import (
+    reset_embedding_batcher,
+    reset_embedding_service,
+    reset_memory_service,
+)
 from hanzo_memory.server import app
 
 
@@ -22,10 +26,15 @@ def test_settings(monkeypatch):
     # Reset any cached clients/services before each test
     reset_db_client()
     reset_memory_service()
+    reset_embedding_batcher()
+    reset_embedding_service()
 
     # Use temporary directory for testing
     with tempfile.TemporaryDirectory() as tmpdir:
         monkeypatch.setattr(settings, "infinity_db_path", Path(tmpdir) / "test_db")
+        monkeypatch.setattr(
+            settings, "embedding_cache_path", Path(tmpdir) / "embedding_cache.sqlite"
+        )
         monkeypatch.setattr(settings, "disable_auth", True)
         monkeypatch.setattr(settings, "llm_model", "gpt-3.5-turbo")
         yield
@@ -33,6 +42,8 @@ def test_settings(monkeypatch):
     # Reset again after test
     reset_db_client()
     reset_memory_service()
+    reset_embedding_batcher()
+    reset_embedding_service()
 
 
 @pytest.fixture(autouse=True)
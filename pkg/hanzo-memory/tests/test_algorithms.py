@@ -10,6 +10,7 @@ from __future__ import annotations
 import os
 import sys
 
+import numpy as np
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -18,6 +19,7 @@ from hanzo_memory.algorithms import (
     CaptionSegment,
     CircuitBreaker,
     CircuitOpenError,
+    CsrGraph,
     MmrInput,
     QueryEval,
     RuntimeConfig,
@@ -132,6 +134,35 @@ def test_mmr_picks_diverse_second():
     assert out[1].slug == "c"
 
 
+def test_mmr_matches_pairwise_cosine():
+    hits = [
+        MmrInput(slug="a", score=0.9, embedding=[1, 0]),
+        MmrInput(slug="none", score=1.0),
+        MmrInput(slug="b", score=0.8, embedding=[-1, 0]),
+        MmrInput(slug="c", score=0.7, embedding=[1, 0, 0]),
+        MmrInput(slug="zero", score=0.75, embedding=[0, 0]),
+        MmrInput(slug="d", score=0.85, embedding=[1, 0.1]),
+    ]
+    # Opposite and other-length vectors count as unrelated, not as diverse
+    out = mmr_rerank(hits, lambda_=0.5)
+    assert [h.slug for h in out] == ["a", "b", "zero", "c", "d", "none"]
+    assert [h.slug for h in mmr_rerank(hits, lambda_=0.5, limit=0)] == []
+
+
+def test_mmr_accepts_normalized_matrix():
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(40, 8))
+    hits = [
+        MmrInput(slug=str(i), score=float(s), embedding=v.tolist())
+        for i, (s, v) in enumerate(zip(rng.random(40), vectors))
+    ]
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    from_lists = mmr_rerank(hits, lambda_=0.4, limit=10)
+    from_matrix = mmr_rerank(hits, lambda_=0.4, limit=10, embeddings=unit)
+    assert [h.slug for h in from_matrix] == [h.slug for h in from_lists]
+    assert len({h.slug for h in from_lists}) == 10
+
+
 # ── Dedup ─────────────────────────────────────────────────────────────
 
 
@@ -359,6 +390,20 @@ def test_snn_score_bounds():
         assert 0 <= e.weight <= 1
 
 
+def test_snn_score_jaccard_of_top_k():
+    edges = [
+        WeightedEdge("a", "b", 0.9),
+        WeightedEdge("a", "c", 0.8),
+        WeightedEdge("a", "d", 0.1),
+        WeightedEdge("b", "c", 0.7),
+        WeightedEdge("b", "b", 0.5),
+    ]
+    # top-2: a {b, c}, b {a, c}, c {a, b}, d {a}
+    out = snn_score(edges, 2)
+    assert [(e.source, e.target) for e in out] == [(e.source, e.target) for e in edges]
+    assert [e.weight for e in out] == [1 / 3, 1 / 3, 0.0, 1 / 3, 1.0]
+
+
 def test_pfnet_drops_dominated():
     out = pfnet_infinity([
         WeightedEdge("a", "b", 0.9),
@@ -368,12 +413,61 @@ def test_pfnet_drops_dominated():
     assert not any(e.source == "a" and e.target == "c" for e in out)
 
 
+def test_pfnet_keeps_direction_and_order():
+    edges = [
+        WeightedEdge("a", "c", 0.5),
+        WeightedEdge("a", "b", 0.9),
+        WeightedEdge("c", "b", 0.9),  # a -> b -> c does not exist
+        WeightedEdge("a", "c", 0.95),  # parallel edge outweighing the path
+    ]
+    out = pfnet_infinity(edges)
+    assert out == edges
+
+
 def test_louvain_returns_mapping():
     edges = [WeightedEdge("a", "b", 1), WeightedEdge("b", "c", 1), WeightedEdge("a", "c", 1)]
     out = louvain(edges)
     assert set(out.keys()) == {"a", "b", "c"}
 
 
+def _clique(prefix: str, size: int) -> list[WeightedEdge]:
+    return [
+        WeightedEdge(f"{prefix}{i}", f"{prefix}{j}", 1.0)
+        for i in range(size)
+        for j in range(i + 1, size)
+    ]
+
+
+def test_louvain_separates_cliques():
+    edges = _clique("a", 5) + _clique("b", 4) + [WeightedEdge("a0", "b0", 0.1)]
+    out = louvain(edges)
+    assert out == {name: 0 if name[0] == "a" else 1 for name in out}
+    assert list(out)[:3] == ["a0", "a1", "a2"]
+
+
+def test_louvain_merges_communities_across_levels():
+    # A ring of cliques joined by single edges; neighbouring cliques merge
+    # only once the first level has collapsed each clique into one node.
+    edges = []
+    for c in range(30):
+        edges += _clique(f"c{c}_", 4)
+        edges.append(WeightedEdge(f"c{c}_0", f"c{(c + 1) % 30}_1", 1.0))
+    out = louvain(edges)
+    for c in range(30):
+        assert len({out[f"c{c}_{i}"] for i in range(4)}) == 1
+    assert len(set(out.values())) < 30
+
+
+def test_csr_graph_from_edges():
+    g = CsrGraph.from_edges([WeightedEdge("a", "b", 1.0), WeightedEdge("c", "a", 2.0)])
+    assert g.nodes == ["a", "b", "c"]
+    assert g.indptr.tolist() == [0, 2, 3, 4]
+    assert g.indices.tolist() == [1, 2, 0, 0]
+    assert g.degrees().tolist() == [3.0, 1.0, 2.0]
+    directed = CsrGraph.from_edges([WeightedEdge("a", "b", 1.0)], directed=True)
+    assert directed.indptr.tolist() == [0, 1, 1]
+
+
 # ── Doc types ─────────────────────────────────────────────────────────
 
 
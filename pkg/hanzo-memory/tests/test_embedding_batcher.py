@@ -0,0 +1,136 @@
+"""Tests for the embedding batcher and bulk memory inserts."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from hanzo_memory.db.local_client import LocalMemoryClient
+from hanzo_memory.db.sqlite_client import SQLiteMemoryClient
+from hanzo_memory.services.embedding_batcher import EmbeddingBatcher, EmbeddingQueueFull
+
+
+class RecordingEmbedder:
+    """Embeds text as [len(text)] and records each batch and its thread."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.batches: list[list[str]] = []
+        self.threads: set[str] = set()
+
+    def embed_batch(self, texts, batch_size=32, show_progress=False):
+        self.batches.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("model failed")
+        return [[float(len(text))] for text in texts]
+
+
+def test_concurrent_requests_share_batches() -> None:
+    embedder = RecordingEmbedder(delay=0.02)
+    batcher = EmbeddingBatcher(embedder, max_batch=32, max_wait=0.01)
+
+    async def run():
+        requests = [[f"text {i}-{j}" * (i + 1) for j in range(3)] for i in range(40)]
+        results = await asyncio.gather(*(batcher.embed(texts) for texts in requests))
+        await batcher.aclose()
+        return requests, results
+
+    requests, results = asyncio.run(run())
+    for texts, embeddings in zip(requests, results):
+        assert embeddings == [[float(len(text))] for text in texts]
+    assert sum(len(batch) for batch in embedder.batches) == 120
+    assert len(embedder.batches) <= 6
+    assert max(len(batch) for batch in embedder.batches) == 32
+    assert all(name.startswith("embedding-batcher") for name in embedder.threads)
+
+
+def test_event_loop_stays_responsive() -> None:
+    batcher = EmbeddingBatcher(RecordingEmbedder(delay=0.2), max_wait=0)
+
+    async def run():
+        embedding = asyncio.ensure_future(batcher.embed(["slow"]))
+        t0 = time.perf_counter()
+        await asyncio.sleep(0.01)
+        ticked = time.perf_counter() - t0
+        await embedding
+        await batcher.aclose()
+        return ticked
+
+    assert asyncio.run(run()) < 0.1
+
+
+def test_queue_full_raises() -> None:
+    batcher = EmbeddingBatcher(
+        RecordingEmbedder(delay=0.3), max_batch=1, max_wait=0, max_pending=1, queue_timeout=0.05
+    )
+
+    async def run():
+        # "a" is being embedded, the collector holds "b" and "c" fills the queue
+        waiting = [asyncio.ensure_future(batcher.embed([text])) for text in "abc"]
+        await asyncio.sleep(0.05)
+        assert batcher.pending == 1
+        with pytest.raises(EmbeddingQueueFull):
+            await batcher.embed(["d"])
+        assert await asyncio.gather(*waiting) == [[[1.0]]] * 3
+        await batcher.aclose()
+
+    asyncio.run(run())
+
+
+def test_errors_reach_every_caller() -> None:
+    batcher = EmbeddingBatcher(RecordingEmbedder(fail=True), max_wait=0.01)
+
+    async def run():
+        results = await asyncio.gather(
+            batcher.embed(["a"]), batcher.embed(["b", "c"]), return_exceptions=True
+        )
+        await batcher.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_batcher_survives_event_loop_change() -> None:
+    batcher = EmbeddingBatcher(RecordingEmbedder(), max_wait=0)
+    assert asyncio.run(batcher.embed(["ab"])) == [[2.0]]
+    assert asyncio.run(batcher.embed(["abc"])) == [[3.0]]
+
+
+def _rows(n: int) -> list[dict]:
+    return [
+        {
+            "memory_id": f"m{i}",
+            "user_id": "alice",
+            "project_id": "project",
+            "content": f"memory {i}",
+            "embedding": [1.0, float(i)],
+            "metadata": {"n": i},
+            "importance": 2.0,
+        }
+        for i in range(n)
+    ]
+
+
+def test_sqlite_add_memories() -> None:
+    client = SQLiteMemoryClient()
+    added = client.add_memories(_rows(5))
+    assert [m["memory_id"] for m in added] == [f"m{i}" for i in range(5)]
+    count = client.conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+    assert count == 5
+    row = client.conn.execute(
+        "SELECT content, metadata FROM memories WHERE memory_id = 'm4'"
+    ).fetchone()
+    assert row["content"] == "memory 4" and row["metadata"] == '{"n": 4}'
+
+
+def test_local_add_memories(tmp_path) -> None:
+    client = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    client.add_memories(_rows(5))
+    assert len(client.memories) == 5 and len(client.memory_index) == 5
+    reopened = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    assert reopened.memories["m3"]["metadata"] == {"n": 3}
@@ -0,0 +1,122 @@
+"""Tests for the embedding cache."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from hanzo_memory.config import Settings
+from hanzo_memory.services.embedding_cache import CachedEmbeddingService, EmbeddingCache
+
+
+class CountingEmbedder:
+    """Embeds text as [len(text), n] and counts the texts it is asked for."""
+
+    def __init__(self, model_name: str = "test-model", n: float = 1.0, dimensions: int = 2):
+        self.model_name = model_name
+        self.n = n
+        self.dimensions = dimensions
+        self.calls: list[list[str]] = []
+
+    def embed_text(self, text):
+        texts = [text] if isinstance(text, str) else text
+        self.calls.append(list(texts))
+        return [[float(len(t)), self.n] for t in texts]
+
+    def embed_batch(self, texts, batch_size=32, show_progress=False):
+        return self.embed_text(texts)
+
+    def get_model_info(self):
+        return {"model_name": self.model_name, "dimensions": self.dimensions}
+
+
+def test_repeated_texts_are_embedded_once() -> None:
+    embedder = CountingEmbedder()
+    service = CachedEmbeddingService(embedder, EmbeddingCache())
+
+    assert service.embed_batch(["a", "bb", "a"]) == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+    assert service.embed_text(["bb", "ccc"]) == [[2.0, 1.0], [3.0, 1.0]]
+    assert service.embed_single("a") == [1.0, 1.0]
+    assert embedder.calls == [["a", "bb"], ["ccc"]]
+
+    stats = service.get_model_info()["cache"]
+    assert stats["misses"] == 4 and stats["memory_hits"] == 2
+    assert stats["hit_rate"] == pytest.approx(2 / 6)
+    assert service.model_name == "test-model"
+
+
+def test_lru_is_bounded_by_bytes() -> None:
+    cache = EmbeddingCache(max_bytes=3 * (8 + 200))
+    for text in "abcd":
+        cache.put_many("m", "", [text], [[1.0, 2.0]])
+    assert cache.stats()["memory_entries"] == 3
+    assert cache.get_many("m", "", ["a"]) == [None]
+    assert cache.get_many("m", "", ["d"])[0].tolist() == [1.0, 2.0]
+    assert cache.stats()["memory_bytes"] <= cache.max_bytes
+
+
+def test_keys_include_model_and_prefix() -> None:
+    cache = EmbeddingCache()
+    cache.put_many("m1", "query: ", ["x"], [[1.0]])
+    assert cache.get_many("m1", "passage: ", ["x"]) == [None]
+    assert cache.get_many("m2", "query: ", ["x"]) == [None]
+    assert cache.get_many("m1", "query: ", ["x"])[0].tolist() == [1.0]
+
+
+def test_disk_tier_is_shared_and_persistent(tmp_path) -> None:
+    path = tmp_path / "cache.sqlite"
+    first = CachedEmbeddingService(CountingEmbedder(), EmbeddingCache(path))
+    first.embed_batch(["a", "bb"])
+
+    embedder = CountingEmbedder()
+    second = CachedEmbeddingService(embedder, EmbeddingCache(path))
+    assert second.embed_batch(["bb", "a", "new"]) == [[2.0, 1.0], [1.0, 1.0], [3.0, 1.0]]
+    assert embedder.calls == [["new"]]
+    assert second.cache.stats()["disk_hits"] == 2
+    first.cache.close()
+    second.cache.close()
+
+
+def test_backend_change_invalidates(tmp_path) -> None:
+    path = tmp_path / "cache.sqlite"
+    CachedEmbeddingService(CountingEmbedder(n=1.0), EmbeddingCache(path)).embed_text("a")
+
+    class OtherBackend(CountingEmbedder):
+        pass
+
+    embedder = OtherBackend(n=2.0)
+    service = CachedEmbeddingService(embedder, EmbeddingCache(path))
+    assert service.embed_text("a") == [[1.0, 2.0]]
+    assert embedder.calls == [["a"]]
+
+    # The same backend again keeps what is cached
+    again = CachedEmbeddingService(OtherBackend(n=3.0), EmbeddingCache(path))
+    assert again.embed_text("a") == [[1.0, 2.0]]
+
+
+def test_dimension_change_invalidates(tmp_path) -> None:
+    path = tmp_path / "cache.sqlite"
+    CachedEmbeddingService(CountingEmbedder(), EmbeddingCache(path)).embed_text("a")
+
+    embedder = CountingEmbedder(n=2.0, dimensions=3)
+    service = CachedEmbeddingService(embedder, EmbeddingCache(path))
+    assert service.embed_text("a") == [[1.0, 2.0]]
+    assert embedder.calls == [["a"]]
+
+
+def test_default_path_is_in_the_data_dir(tmp_path) -> None:
+    settings = Settings(data_dir=tmp_path)
+    assert settings.embedding_cache_file == tmp_path / "embedding_cache.sqlite"
+    settings = Settings(data_dir=tmp_path, embedding_cache_path=Path("elsewhere.sqlite"))
+    assert settings.embedding_cache_file == Path("elsewhere.sqlite")
+
+
+def test_invalidate() -> None:
+    cache = EmbeddingCache()
+    cache.put_many("m1", "", ["x"], [np.ones(2)])
+    cache.put_many("m2", "", ["x"], [np.ones(2)])
+    cache.invalidate("m1")
+    assert cache.get_many("m1", "", ["x"]) == [None]
+    assert cache.get_many("m2", "", ["x"])[0] is not None
+    cache.invalidate()
+    assert cache.stats()["memory_entries"] == 0
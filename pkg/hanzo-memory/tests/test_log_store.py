@@ -0,0 +1,217 @@
+"""Tests for hanzo_memory.db.log_store and its use by LocalMemoryClient."""
+
+import asyncio
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from hanzo_memory.db.local_client import LocalMemoryClient
+from hanzo_memory.db.log_store import LogStore
+from hanzo_memory.models.memory import MemoryCreate
+
+
+def test_records_and_vectors_round_trip(tmp_path) -> None:
+    store = LogStore(tmp_path)
+    memories = store.collection("memories")
+    memories["a"] = {"content": "first"}
+    memories["b"] = {"content": "second"}
+    memories["a"] = {"content": "changed"}
+    del memories["b"]
+    store.vectors["memory_a"] = [1.0, 2.0, 3.0]
+
+    assert dict(memories) == {"a": {"content": "changed"}}
+    assert "b" not in memories and len(memories) == 1
+    with pytest.raises(KeyError):
+        del memories["b"]
+    np.testing.assert_array_equal(store.vectors["memory_a"], [1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        store.collection("__vectors__")
+
+
+@pytest.mark.parametrize("checkpoint", [True, False])
+def test_reopen(tmp_path, checkpoint: bool) -> None:
+    store = LogStore(tmp_path)
+    facts = store.collection("facts")
+    for i in range(20):
+        facts[f"f{i}"] = {"n": i}
+        store.vectors[f"fact_f{i}"] = np.full(4, i, dtype=np.float32)
+    if checkpoint:
+        store.close()
+    facts["late"] = {"n": -1}  # reopens, and lands after the checkpoint
+    del store.vectors["fact_f0"]
+
+    reopened = LogStore(tmp_path)
+    assert reopened.count("facts") == 21
+    assert reopened.get("facts", "late") == {"n": -1}
+    assert reopened.vector_count() == 19 and not reopened.contains_vector("fact_f0")
+    np.testing.assert_array_equal(reopened.get_vector("fact_f7"), np.full(4, 7))
+
+
+def test_torn_tail_is_truncated(tmp_path) -> None:
+    store = LogStore(tmp_path)
+    store.collection("memories")["a"] = {"content": "kept"}
+    store.close()
+    log = next(tmp_path.glob("records.*.jsonl"))
+    with open(log, "ab") as f:
+        f.write(b'{"c":"memories","k":"b","v":{"cont')
+
+    reopened = LogStore(tmp_path)
+    assert reopened.keys("memories") == ["a"]
+    reopened.collection("memories")["c"] = {"content": "after"}
+    reopened.close()
+    assert LogStore(tmp_path).keys("memories") == ["a", "c"]
+
+
+def test_unreadable_checkpoint_replays_log(tmp_path) -> None:
+    store = LogStore(tmp_path)
+    store.collection("projects")["p"] = {"name": "x"}
+    store.close()
+    (tmp_path / "index.json").write_text("{not json")
+    assert LogStore(tmp_path).get("projects", "p") == {"name": "x"}
+
+
+def test_compaction_reclaims_space(tmp_path) -> None:
+    store = LogStore(tmp_path, compact_min_bytes=1 << 30)
+    memories = store.collection("memories")
+    for round_ in range(10):
+        for i in range(50):
+            memories[f"m{i}"] = {"content": "x" * 100, "round": round_}
+            store.vectors[f"memory_m{i}"] = np.full(8, round_, dtype=np.float32)
+    before = store.garbage_bytes
+    store.compact()
+
+    assert store.garbage_bytes < before / 10
+    assert sorted(tmp_path.glob("records.*.jsonl")) == [tmp_path / "records.1.jsonl"]
+    assert memories["m3"]["round"] == 9
+    np.testing.assert_array_equal(store.vectors["memory_m3"], np.full(8, 9))
+    state = json.loads((tmp_path / "index.json").read_text())
+    assert state["gen"] == 1
+
+    store.close()
+    reopened = LogStore(tmp_path)
+    assert reopened.count("memories") == 50 and reopened.vector_count() == 50
+
+
+def test_writes_during_background_compaction(tmp_path) -> None:
+    store = LogStore(tmp_path, fsync=False, compact_min_bytes=1 << 30)
+    memories = store.collection("memories")
+    for i in range(2000):
+        memories[f"m{i % 200}"] = {"i": i}
+
+    def writer() -> None:
+        for i in range(2000, 3000):
+            memories[f"m{i % 300}"] = {"i": i}
+            store.vectors[f"v{i % 300}"] = [float(i)]
+
+    thread = threading.Thread(target=writer)
+    store.compact(wait=False)
+    thread.start()
+    thread.join()
+    store.compact()
+    store.close()
+
+    reopened = LogStore(tmp_path)
+    assert reopened.count("memories") == 300
+    assert reopened.get("memories", "m250") == {"i": 2950}
+    assert reopened.get("memories", "m10") == {"i": 2710}
+    assert reopened.get_vector("v5").tolist() == [2705.0]
+
+
+def test_batch_defers_sync(tmp_path, monkeypatch) -> None:
+    store = LogStore(tmp_path)
+    store.collection("memories")["warm"] = {}
+    syncs = []
+    monkeypatch.setattr(store._seg, "sync", lambda: syncs.append(1))
+    with store.batch():
+        for i in range(10):
+            store.collection("memories")[f"m{i}"] = {"i": i}
+        assert syncs == []
+    assert syncs == [1]
+
+
+def test_cache_keeps_only_recent_reads(tmp_path) -> None:
+    store = LogStore(tmp_path, cache_size=2)
+    memories = store.collection("memories")
+    for key in "abc":
+        memories[key] = {"key": key}
+    assert [memories[key]["key"] for key in "abac"] == ["a", "b", "a", "c"]
+
+    assert list(store._cache) == [("memories", "a"), ("memories", "c")]
+    assert memories["b"] == {"key": "b"}
+
+
+def test_changed_since(tmp_path) -> None:
+    store = LogStore(tmp_path, compact_min_bytes=1 << 30)
+    store.collection("memories")["a"] = {}
+    mark = store.mark()
+    store.collection("memories")["b"] = {}
+    store.vectors["memory_b"] = [1.0]
+    del store.collection("memories")["a"]
+
+    assert store.changed_since(mark) == [
+        ("memories", "b"), ("__vectors__", "memory_b"), ("memories", "a")
+    ]
+    assert store.changed_since(store.mark()) == []
+    store.compact()
+    assert store.changed_since(mark) is None
+
+
+def _create(client: LocalMemoryClient, content: str, embedding: list[float]) -> str:
+    memory = asyncio.run(
+        client.create_memory(
+            MemoryCreate(content=content, embedding=embedding), project_id="project", user_id="alice"
+        )
+    )
+    return memory.memory_id
+
+
+def test_local_client_persists_through_the_log(tmp_path) -> None:
+    client = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    kept = _create(client, "kept", [1.0, 0.0])
+    dropped = _create(client, "dropped", [0.0, 1.0])
+    assert asyncio.run(client.delete_memory(dropped, "project"))
+    assert client.update_memory(kept, "alice", "project", content="edited")
+    assert not (tmp_path / "memories.json").exists()
+
+    reopened = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    assert list(reopened.memories) == [kept]
+    assert reopened.memories[kept]["content"] == "edited"
+    results = asyncio.run(reopened.search_memories_async([1.0, 0.0], "project", "alice"))
+    assert [r.memory.memory_id for r in results] == [kept]
+
+
+def test_local_client_reindexes_only_the_log_tail(tmp_path, monkeypatch) -> None:
+    client = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    dropped = _create(client, "dropped", [0.0, 1.0])
+    asyncio.run(client.close())
+
+    # Changed after the index was saved, then stopped without closing
+    client = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    kept = _create(client, "kept", [1.0, 0.0])
+    assert asyncio.run(client.delete_memory(dropped, "project"))
+
+    def scan(self):
+        raise AssertionError("every memory was scanned")
+
+    monkeypatch.setattr(type(client.memories), "__iter__", scan)
+    reopened = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    assert len(reopened.memory_index) == 1 and kept in reopened.memory_index
+
+
+def test_local_client_migrates_json_files(tmp_path) -> None:
+    memory = {"id": "m1", "memory_id": "m1", "project_id": "p", "user_id": "alice", "content": "old"}
+    (tmp_path / "memories.json").write_text(json.dumps({"m1": memory}))
+    (tmp_path / "projects.json").write_text(json.dumps({"p": {"id": "p", "user_id": "alice"}}))
+    np.savez_compressed(tmp_path / "embeddings.npz", memory_m1=np.array([0.5, 0.5]))
+
+    client = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    assert client.memories["m1"] == memory and "p" in client.projects
+    np.testing.assert_allclose(client.embeddings["memory_m1"], [0.5, 0.5])
+    assert (tmp_path / "memories.json.migrated").exists()
+    assert not (tmp_path / "embeddings.npz").exists()
+    assert len(client.memory_index) == 1
+
+    reopened = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    assert reopened.memories["m1"] == memory
@@ -0,0 +1,170 @@
+"""Tests for incremental markdown import (hanzo_memory.db.markdown_reader)."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from hanzo_memory.db.local_client import LocalMemoryClient
+from hanzo_memory.db.markdown_reader import (
+    MarkdownChanges,
+    MarkdownMemoryReader,
+    MarkdownWatcher,
+)
+
+
+def _write(path: Path, text: str, age: float = 60.0) -> None:
+    path.write_text(text)
+    # Old enough for the mtime/size fast path to trust it
+    stamp = time.time() - age
+    os.utime(path, (stamp, stamp))
+
+
+def _titles(changes: MarkdownChanges) -> list[str]:
+    return sorted(m.context["section_title"] for m in changes.added.values())
+
+
+def test_scan_reports_changed_sections_only(tmp_path) -> None:
+    llm = tmp_path / "LLM.md"
+    _write(llm, "# Setup\ninstall it\n# Usage\nrun it\n")
+    reader = MarkdownMemoryReader([tmp_path], manifest_path=tmp_path / "manifest.json")
+
+    first = reader.scan()
+    assert _titles(first) == ["Setup", "Usage"] and first.removed == []
+    assert not reader.scan()
+
+    _write(llm, "# Setup\ninstall it\n# Usage\nrun it twice\n", age=30.0)
+    edited = reader.scan()
+    assert _titles(edited) == ["Usage"]
+    old_usage = [i for i, m in first.added.items() if m.context["section_title"] == "Usage"]
+    assert edited.removed == old_usage
+
+    llm.unlink()
+    gone = reader.scan()
+    assert not gone.added and len(gone.removed) == 2
+
+
+def test_manifest_persists_and_skips_unchanged_files(tmp_path, monkeypatch) -> None:
+    _write(tmp_path / "AGENTS.md", "# Rules\nbe brief\n# Rules\nbe brief\n")
+    manifest = tmp_path / "manifest.json"
+    reader = MarkdownMemoryReader([tmp_path], manifest_path=manifest)
+    changes = reader.scan()
+    # Identical sections get distinct ids
+    assert len(changes.added) == 2
+    assert not manifest.exists()
+    reader.save_manifest()
+
+    def fail(self):
+        raise AssertionError(f"{self} was read")
+
+    monkeypatch.setattr(Path, "read_bytes", fail)
+    assert not MarkdownMemoryReader([tmp_path], manifest_path=manifest).scan()
+
+
+def test_recently_modified_files_are_rehashed(tmp_path) -> None:
+    path = tmp_path / "MEMORY.md"
+    _write(path, "# Note\nfirst\n", age=0.0)
+    reader = MarkdownMemoryReader([tmp_path])
+    assert _titles(reader.scan()) == ["Note"]
+
+    # Same size and mtime, different content
+    stat = path.stat()
+    path.write_text("# Note\nfixed\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert _titles(reader.scan()) == ["Note"]
+
+
+def test_local_client_applies_changes(tmp_path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    _write(docs / "LLM.md", "# Keep\nstays\n# Change\nbefore\n")
+    client = LocalMemoryClient(storage_dir=tmp_path / "store", enable_markdown=False)
+    # A memory imported by an earlier version, without a stable id
+    client.memories["legacy"] = {
+        "id": "legacy",
+        "project_id": "markdown_import",
+        "content": "stays\n",
+        "metadata": {"auto_imported": True, "markdown_file": True},
+    }
+    client._markdown_legacy = True
+    watcher = MarkdownWatcher(MarkdownMemoryReader([docs]), client._apply_markdown_changes)
+
+    watcher.scan_once()
+    contents = sorted(m["content"].strip() for m in client.memories.values())
+    assert contents == ["before", "stays"]
+    assert "legacy" not in client.memories
+
+    _write(docs / "LLM.md", "# Keep\nstays\n# Change\nafter\n", age=30.0)
+    watcher.scan_once()
+    contents = sorted(m["content"].strip() for m in client.memories.values())
+    assert contents == ["after", "stays"]
+
+
+def test_markdown_changes_wait_for_a_search_in_progress(tmp_path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    _write(docs / "LLM.md", "# One\ntext\n")
+    client = LocalMemoryClient(storage_dir=tmp_path / "store", enable_markdown=False)
+    client.add_memory("m1", "u", "p", "content", [1.0, 0.0])
+    watcher = MarkdownWatcher(MarkdownMemoryReader([docs]), client._apply_markdown_changes)
+
+    # Hold a search inside the index while the watcher applies a scan
+    searching, release = threading.Event(), threading.Event()
+    search = client.memory_index.search
+
+    def slow_search(*args, **kwargs):
+        searching.set()
+        release.wait(5)
+        return search(*args, **kwargs)
+
+    client.memory_index.search = slow_search
+    searcher = threading.Thread(target=client.search_memories, args=([1.0, 0.0], "u"))
+    searcher.start()
+    assert searching.wait(5)
+    applier = threading.Thread(target=watcher.scan_once)
+    applier.start()
+    applier.join(0.2)
+    assert applier.is_alive(), "markdown changes were applied during the search"
+
+    release.set()
+    searcher.join(5)
+    applier.join(5)
+    assert not applier.is_alive()
+    assert [m["content"].strip() for m in client.memories.values() if m["project_id"] == "markdown_import"] == ["text"]
+
+
+def test_failed_apply_is_retried(tmp_path) -> None:
+    _write(tmp_path / "LLM.md", "# One\ntext\n")
+    manifest = tmp_path / "manifest.json"
+    seen: list[MarkdownChanges] = []
+
+    def apply(changes: MarkdownChanges) -> None:
+        seen.append(changes)
+        if len(seen) == 1:
+            raise RuntimeError("store unavailable")
+
+    watcher = MarkdownWatcher(MarkdownMemoryReader([tmp_path], manifest_path=manifest), apply)
+    with pytest.raises(RuntimeError):
+        watcher.scan_once()
+    watcher.scan_once()
+    assert [len(c.added) for c in seen] == [1, 1]
+    assert manifest.exists()
+
+
+def test_watcher_polls_in_background(tmp_path) -> None:
+    path = tmp_path / "LLM.md"
+    _write(path, "# One\ntext\n")
+    seen: list[MarkdownChanges] = []
+    watcher = MarkdownWatcher(MarkdownMemoryReader([tmp_path]), seen.append, interval=0.01)
+    watcher.start()
+    try:
+        assert watcher.wait(5)
+        _write(path, "# One\ntext\n# Two\nmore\n", age=30.0)
+        deadline = time.monotonic() + 5
+        while len(seen) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop(5)
+    assert [_titles(c) for c in seen] == [["One"], ["Two"]]
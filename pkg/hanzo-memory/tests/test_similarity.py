@@ -0,0 +1,122 @@
+"""Tests for hanzo_memory.similarity."""
+
+import numpy as np
+import pytest
+
+from hanzo_memory.algorithms import cosine as algorithms_cosine
+from hanzo_memory.similarity import VectorMatrix, cosine, cosine_scores, normalize, top_k
+
+
+def _reference(query: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    return np.array(
+        [float(v @ query / (np.linalg.norm(v) * np.linalg.norm(query))) for v in vectors]
+    )
+
+
+def test_pairwise_cosine() -> None:
+    assert cosine([1, 0], [1, 0]) == pytest.approx(1.0)
+    assert cosine([1, 0], [0, 1]) == pytest.approx(0.0)
+    assert cosine([1, 2], [1, 2, 3]) == 0.0
+    assert cosine([0, 0], [1, 1]) == 0.0
+    assert algorithms_cosine is cosine
+
+
+def test_normalize_leaves_zero_rows() -> None:
+    rows = normalize([[3.0, 4.0], [0.0, 0.0]])
+    assert rows.dtype == np.float32
+    assert rows.tolist() == [[0.6000000238418579, 0.800000011920929], [0.0, 0.0]]
+
+
+def test_cosine_scores_single_and_batch() -> None:
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((50, 16))
+    queries = rng.standard_normal((3, 16))
+    np.testing.assert_allclose(cosine_scores(queries[0], vectors), _reference(queries[0], vectors), atol=1e-5)
+    batch = cosine_scores(queries, vectors)
+    assert batch.shape == (3, 50)
+    for q, row in zip(queries, batch):
+        np.testing.assert_allclose(row, _reference(q, vectors), atol=1e-5)
+
+
+def test_top_k_matches_stable_sort() -> None:
+    rng = np.random.default_rng(1)
+    scores = rng.integers(0, 5, 200).astype(np.float32)  # many ties
+    expected = np.argsort(-scores, kind="stable")
+    for k in (1, 7, 199, 200, 500):
+        assert top_k(scores, k).tolist() == expected[:k].tolist()
+    assert top_k(scores, 0).tolist() == []
+
+
+@pytest.mark.parametrize("dtype,tolerance", [("float32", 1e-5), ("float16", 2e-3), ("int8", 2e-2)])
+def test_vector_matrix_search(dtype: str, tolerance: float) -> None:
+    rng = np.random.default_rng(2)
+    vectors = rng.standard_normal((1000, 32))
+    matrix = VectorMatrix(dtype=dtype)
+    matrix.add_many(range(1000), vectors)
+
+    query = vectors[10] + 0.2 * rng.standard_normal(32)
+    expected = _reference(query, vectors)
+    hits = matrix.search(query, 5)
+    assert hits[0][0] == 10
+    for key, score in hits:
+        assert score == pytest.approx(expected[key], abs=tolerance)
+    if dtype == "float32":
+        assert [key for key, _ in hits] == np.argsort(-expected, kind="stable")[:5].tolist()
+
+
+def test_vector_matrix_storage_sizes() -> None:
+    vectors = np.ones((512, 64))
+    sizes = {}
+    for dtype in ("float32", "float16", "int8"):
+        matrix = VectorMatrix(dtype=dtype)
+        matrix.add_many(range(512), vectors)
+        sizes[dtype] = matrix.nbytes
+    assert sizes["float16"] == sizes["float32"] // 2
+    assert sizes["int8"] < sizes["float32"] // 3
+
+
+def test_vector_matrix_updates() -> None:
+    matrix = VectorMatrix()
+    matrix.add("a", [1.0, 0.0])
+    matrix.add("b", [0.0, 1.0])
+    matrix.add("a", [0.0, 2.0])
+    assert len(matrix) == 2 and matrix.keys() == ["b", "a"]
+    assert [key for key, _ in matrix.search([0.0, 1.0], 2)] == ["b", "a"]
+    np.testing.assert_allclose(matrix.vector("a"), [0.0, 1.0])
+
+    assert matrix.remove("b") and not matrix.remove("b")
+    assert matrix.search([1.0, 0.0], 5) == [("a", 0.0)]
+    assert matrix.search([1.0, 0.0], 5, threshold=0.5) == []
+    with pytest.raises(ValueError):
+        matrix.add("c", [1.0, 0.0, 0.0])
+
+    matrix.clear()
+    assert len(matrix) == 0 and matrix.search([1.0, 0.0], 5) == []
+
+
+def test_vector_matrix_compacts_holes() -> None:
+    matrix = VectorMatrix()
+    matrix.add_many(range(300), np.eye(300))
+    for key in range(0, 300, 3):
+        matrix.remove(key)
+    for key in range(1, 300, 3):
+        matrix.remove(key)
+    assert len(matrix) == 100 and matrix._count < 200
+    assert matrix.search(np.eye(300)[299], 1) == [(299, pytest.approx(1.0))]
+
+
+def test_predicate_and_batch() -> None:
+    rng = np.random.default_rng(3)
+    vectors = rng.standard_normal((500, 8))
+    matrix = VectorMatrix()
+    matrix.add_many(range(500), vectors)
+
+    odd = matrix.search(vectors[0], 20, predicate=lambda key: key % 2 == 1)
+    assert len(odd) == 20 and all(key % 2 == 1 for key, _ in odd)
+    assert matrix.search(vectors[0], 5, predicate=lambda key: False) == []
+
+    batch = matrix.search_many(vectors[:4], 3)
+    for hits, vector in zip(batch, vectors[:4]):
+        single = matrix.search(vector, 3)
+        assert [key for key, _ in hits] == [key for key, _ in single]
+        assert [score for _, score in hits] == pytest.approx([score for _, score in single], abs=1e-5)
@@ -0,0 +1,198 @@
+"""Tests for hybrid full-text and vector search in the SQLite backend."""
+
+from hanzo_memory.db.fts import fts_query, rebuild_fts
+from hanzo_memory.db.sqlite_client import SQLiteMemoryClient
+
+
+def _client(*memories: tuple[str, str, list[float]]) -> SQLiteMemoryClient:
+    client = SQLiteMemoryClient()
+    client.add_memories(
+        [
+            {
+                "memory_id": memory_id,
+                "user_id": "alice",
+                "project_id": "project",
+                "content": content,
+                "embedding": embedding,
+            }
+            for memory_id, content, embedding in memories
+        ]
+    )
+    return client
+
+
+def _ids(results: list[dict]) -> list[str]:
+    return [r["memory_id"] for r in results]
+
+
+def test_fts_query() -> None:
+    assert fts_query("python loops") == "(python OR loops)"
+    assert fts_query('"event loop"') == '"event loop"'
+    assert fts_query("python -java") == "python NOT java"
+    assert fts_query("cats AND dogs") == "cats AND dogs"
+    assert fts_query("机器学习") == '("机器 器学 学习")'
+    assert fts_query("? —") == ""
+
+
+def test_vector_search_without_sqlite_vec() -> None:
+    client = _client(
+        ("a", "first", [1.0, 0.0]),
+        ("b", "second", [0.0, 1.0]),
+        ("c", "third", [0.6, 0.8]),
+    )
+    results = client.search_memories("alice", [0.0, 1.0], limit=2)
+    assert _ids(results) == ["b", "c"]
+    assert results[0]["similarity_score"] == 1.0
+    assert _ids(client.search_memories("alice", [0.0, 1.0], min_similarity=0.9)) == ["b"]
+    assert client.search_memories("bob", [0.0, 1.0]) == []
+
+
+def test_vector_fallback_caches_embeddings_until_a_write(tmp_path) -> None:
+    path = tmp_path / "memories.db"
+    client = SQLiteMemoryClient(path)
+    client.add_memory("a", "alice", "p1", "first", [1.0, 0.0])
+    client.add_memory("b", "alice", "p2", "second", [0.0, 1.0])
+    assert _ids(client.search_memories("alice", [1.0, 0.0], limit=1)) == ["a"]
+    matrix, _ = client._user_vectors[("alice", 2)]
+    assert _ids(client.search_memories("alice", [1.0, 0.0], project_id="p2")) == ["b"]
+    assert client._user_vectors[("alice", 2)][0] is matrix
+
+    client.add_memory("c", "alice", "p1", "third", [0.9, 0.1])
+    assert _ids(client.search_memories("alice", [0.9, 0.1], limit=1)) == ["c"]
+    assert client.delete_memory("c", "alice", "p1")
+    assert _ids(client.search_memories("alice", [0.9, 0.1], limit=1)) == ["a"]
+
+    # Writes through another connection are seen too
+    other = SQLiteMemoryClient(path)
+    other.add_memory("d", "alice", "p1", "fourth", [0.9, 0.1])
+    assert _ids(client.search_memories("alice", [0.9, 0.1], limit=1)) == ["d"]
+    other.close()
+    client.close()
+
+
+def test_text_match_outranks_vector_neighbour() -> None:
+    client = _client(
+        ("near", "unrelated note", [1.0, 0.1]),
+        ("exact", "the invoice number is 4711", [0.5, 0.5]),
+        ("far", "shopping list", [0.0, 1.0]),
+    )
+    results = client.search_memories("alice", [1.0, 0.0], query="invoice 4711", limit=3)
+    assert _ids(results)[0] == "exact"
+    assert set(_ids(results)) == {"near", "exact", "far"}
+    assert all(0 < r["similarity_score"] <= 1 for r in results)
+    # Stemming
+    assert _ids(client.search_memories("alice", [0.0, 1.0], query="invoices", limit=1)) == [
+        "exact"
+    ]
+
+
+def test_cjk_bigrams_are_indexed() -> None:
+    client = _client(
+        ("zh", "我喜欢机器学习", [0.0, 1.0]),
+        ("en", "machine learning", [1.0, 0.0]),
+    )
+    assert _ids(client.search_memories("alice", [1.0, 0.0], query="机器", limit=1)) == ["zh"]
+
+
+def test_index_follows_updates_and_deletes() -> None:
+    client = _client(("m", "old words", [1.0]), ("n", "other", [1.0]))
+    client.update_memory("m", "alice", "project", content="新しい言葉")
+    assert _ids(client.search_memories("alice", [1.0], query="言葉", limit=1)) == ["m"]
+
+    # Writers that do not know about search_text still get indexed
+    client.conn.execute("UPDATE memories SET content = 'zebra' WHERE memory_id = 'm'")
+    client.conn.execute(
+        "INSERT INTO memories (id, memory_id, user_id, project_id, content) "
+        "VALUES ('x', 'raw', 'alice', 'project', 'giraffe')"
+    )
+    assert _ids(client.search_memories("alice", [1.0], query="zebra", limit=1)) == ["m"]
+    assert "raw" in _ids(client.search_memories("alice", [1.0], query="giraffe"))
+
+    client.delete_memory("m", "alice", "project")
+    rebuild_fts(client.conn)
+    count = client.conn.execute("SELECT COUNT(*) FROM memories_fts").fetchone()[0]
+    assert count == 2
+
+
+def test_existing_database_is_indexed(tmp_path) -> None:
+    path = tmp_path / "memories.db"
+    old = SQLiteMemoryClient(path)
+    old.conn.executescript(
+        """
+        DROP TABLE memories_fts;
+        DROP TRIGGER memories_fts_insert;
+        DROP TRIGGER memories_fts_delete;
+        DROP TRIGGER memories_fts_update;
+        """
+    )
+    old.conn.execute(
+        "INSERT INTO memories (id, memory_id, user_id, project_id, content) "
+        "VALUES ('x', 'kept', 'alice', 'project', 'legacy row')"
+    )
+    old.conn.commit()
+    old.close()
+
+    reopened = SQLiteMemoryClient(path)
+    assert _ids(reopened.search_memories("alice", [1.0], query="legacy")) == ["kept"]
+
+
+def test_search_survives_rowid_changes() -> None:
+    client = SQLiteMemoryClient()
+    client.add_memories(
+        [
+            {
+                "memory_id": f"m{i}",
+                "user_id": "alice",
+                "project_id": "project",
+                "content": f"note {i} about {word}",
+                "embedding": [1.0],
+            }
+            for i, word in enumerate(["apples", "boats", "cellos", "dunes"])
+        ]
+    )
+    client.delete_memory("m0", "alice", "project")
+    # As VACUUM or a dump and restore may renumber a table without an INTEGER PRIMARY KEY
+    client.conn.execute("UPDATE memories SET rowid = rowid - 1")
+
+    assert _ids(client.search_memories("alice", [1.0], query="dunes", limit=1)) == ["m3"]
+    assert _ids(client.search_memories("alice", [1.0], query="boats", limit=1)) == ["m1"]
+
+
+def test_rowid_keyed_index_is_replaced(tmp_path) -> None:
+    path = tmp_path / "memories.db"
+    old = SQLiteMemoryClient(path)
+    old.conn.executescript(
+        """
+        DROP TABLE memories_fts;
+        DROP TRIGGER memories_fts_insert;
+        CREATE VIRTUAL TABLE memories_fts USING fts5(body);
+        CREATE TRIGGER memories_fts_insert AFTER INSERT ON memories BEGIN
+            INSERT INTO memories_fts (rowid, body) VALUES (new.rowid, new.content);
+        END;
+        """
+    )
+    old.conn.execute(
+        "INSERT INTO memories (id, memory_id, user_id, project_id, content) "
+        "VALUES ('x', 'kept', 'alice', 'project', 'legacy row')"
+    )
+    old.conn.commit()
+    old.close()
+
+    reopened = SQLiteMemoryClient(path)
+    assert _ids(reopened.search_memories("alice", [1.0], query="legacy")) == ["kept"]
+    columns = {row[1] for row in reopened.conn.execute("PRAGMA table_info(memories_fts)")}
+    assert "memory_id" in columns
+
+
+def test_dedup_and_mmr() -> None:
+    client = _client(
+        ("doc#chunk-1", "alpha report", [1.0, 0.0]),
+        ("doc#chunk-2", "alpha report appendix", [1.0, 0.01]),
+        ("other", "beta summary", [0.7, 0.7]),
+    )
+    plain = client.search_memories("alice", [1.0, 0.0], limit=2)
+    assert _ids(plain) == ["doc#chunk-1", "doc#chunk-2"]
+    deduped = client.search_memories("alice", [1.0, 0.0], limit=2, dedup=True)
+    assert _ids(deduped) == ["doc#chunk-1", "other"]
+    diverse = client.search_memories("alice", [1.0, 0.0], limit=2, mmr_lambda=0.3)
+    assert _ids(diverse) == ["doc#chunk-1", "other"]
@@ -0,0 +1,176 @@
+"""Tests for hanzo_memory.db.vector_index and its use by LocalMemoryClient."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from hanzo_memory.db.local_client import LocalMemoryClient
+from hanzo_memory.db.vector_index import IVFFlatIndex
+from hanzo_memory.models.memory import MemoryCreate
+
+
+def _clustered(n: int, dim: int = 32, centers: int = 50, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    means = rng.standard_normal((centers, dim))
+    return means[rng.integers(0, centers, n)] + 0.3 * rng.standard_normal((n, dim))
+
+
+def _exact(vectors: np.ndarray, query: np.ndarray, k: int) -> list[int]:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return list(np.argsort(-(unit @ (query / np.linalg.norm(query))), kind="stable")[:k])
+
+
+def _filled(index: IVFFlatIndex, vectors: np.ndarray, users: int = 1, projects: int = 1) -> None:
+    for i, vec in enumerate(vectors):
+        index.add(f"m{i}", vec, f"u{i % users}", f"p{i % projects}")
+
+
+def test_small_index_is_exact() -> None:
+    vectors = _clustered(500)
+    index = IVFFlatIndex()
+    _filled(index, vectors)
+
+    query = vectors[7] + 0.1
+    hits = index.search(query, 10)
+    assert [key for key, _ in hits] == [f"m{i}" for i in _exact(vectors, query, 10)]
+    assert hits[0][1] == pytest.approx(
+        float(vectors[7] @ query / np.linalg.norm(vectors[7]) / np.linalg.norm(query)), abs=1e-5
+    )
+
+
+def test_clustered_search_recall() -> None:
+    vectors = _clustered(6000)
+    index = IVFFlatIndex(train_min=1000, exact_max=0)
+    _filled(index, vectors)
+
+    rng = np.random.default_rng(1)
+    found = 0
+    for q in rng.integers(0, len(vectors), 20):
+        query = vectors[q] + 0.05 * rng.standard_normal(vectors.shape[1])
+        truth = {f"m{i}" for i in _exact(vectors, query, 10)}
+        found += len(truth & {key for key, _ in index.search(query, 10)})
+    assert index._centroids is not None
+    assert found / 200 >= 0.95
+
+
+def test_filters_and_predicate() -> None:
+    vectors = _clustered(3000)
+    index = IVFFlatIndex(train_min=1000, exact_max=10)
+    _filled(index, vectors, users=3, projects=5)
+
+    hits = index.search(vectors[0], 20, user_id="u1", project_ids=["p2", "p4"])
+    assert len(hits) == 20
+    for key, _ in hits:
+        i = int(key[1:])
+        assert i % 3 == 1 and i % 5 in (2, 4)
+
+    even = index.search(vectors[0], 20, predicate=lambda key: int(key[1:]) % 2 == 0)
+    assert len(even) == 20 and all(int(key[1:]) % 2 == 0 for key, _ in even)
+
+    assert index.search(vectors[0], 5, user_id="nobody") == []
+    assert index.search(vectors[0], 5, project_ids=[]) == []
+
+
+def test_remove_and_replace() -> None:
+    index = IVFFlatIndex()
+    index.add("a", [1.0, 0.0], "u", "p")
+    index.add("b", [0.0, 1.0], "u", "p")
+    assert index.remove("a") and not index.remove("a")
+    assert "a" not in index and len(index) == 1
+    assert [key for key, _ in index.search([1.0, 0.0], 5)] == ["b"]
+
+    index.add("b", [1.0, 0.1], "u", "q")
+    assert len(index) == 1
+    assert index.search([1.0, 0.0], 5, project_ids=["p"]) == []
+    assert index.search([1.0, 0.0], 5, project_ids=["q"])[0][0] == "b"
+
+    with pytest.raises(ValueError):
+        index.add("c", [1.0, 0.0, 0.0], "u", "p")
+
+
+def test_ties_keep_insertion_order() -> None:
+    index = IVFFlatIndex()
+    for key in "dcba":
+        index.add(key, [1.0, 0.0], "u", "p")
+    assert [key for key, _ in index.search([1.0, 0.0], 3)] == ["d", "c", "b"]
+
+
+def test_persists_across_reloads(tmp_path) -> None:
+    vectors = _clustered(5000)
+    index = IVFFlatIndex(tmp_path, train_min=1000, exact_max=0)
+    _filled(index, vectors, projects=2)
+    for i in range(0, 2000):
+        index.remove(f"m{i}")
+    before = index.search(vectors[4321], 10, project_ids=["p1"])
+    index.flush()
+
+    reloaded = IVFFlatIndex(tmp_path, train_min=1000, exact_max=0)
+    assert len(reloaded) == 3000 and "m1999" not in reloaded
+    assert reloaded.search(vectors[4321], 10, project_ids=["p1"]) == before
+
+    reloaded.add("new", vectors[10], "u0", "p0")
+    reloaded.flush()
+    assert IVFFlatIndex(tmp_path).search(vectors[10], 1)[0][0] == "new"
+
+
+def test_small_corpus_trains_with_fewer_lists(tmp_path) -> None:
+    vectors = _clustered(10)
+    index = IVFFlatIndex(tmp_path, train_min=4, exact_max=0)
+    _filled(index, vectors)
+
+    query = vectors[3] + 0.1
+    assert [key for key, _ in index.search(query, 3)] == [f"m{i}" for i in _exact(vectors, query, 3)]
+    assert index._centroids is not None and len(index._centroids) <= 10
+
+
+def test_batches_and_training_persist_without_close(tmp_path) -> None:
+    vectors = _clustered(2000)
+    index = IVFFlatIndex(tmp_path, train_min=1000, exact_max=0)
+    index.add_many((f"m{i}", vec, "u0", "p0") for i, vec in enumerate(vectors))
+
+    # No flush() or close(): the batch was persisted when it ended
+    assert len(IVFFlatIndex(tmp_path)) == 2000
+
+    index.search(vectors[5], 5)
+    reloaded = IVFFlatIndex(tmp_path, train_min=1000, exact_max=0)
+    assert reloaded._centroids is not None
+    assert reloaded.search(vectors[5], 5) == index.search(vectors[5], 5)
+
+
+def test_unreadable_files_start_empty(tmp_path) -> None:
+    index = IVFFlatIndex(tmp_path)
+    index.add("a", [1.0, 0.0], "u", "p")
+    index.flush()
+    (tmp_path / "index.npz").write_bytes(b"not an archive")
+    assert len(IVFFlatIndex(tmp_path)) == 0
+
+
+def test_local_client_searches_through_the_index(tmp_path) -> None:
+    client = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    embeddings = {"near": [1.0, 0.1, 0.0], "far": [0.0, 1.0, 0.0], "other": [1.0, 0.0, 0.0]}
+    ids = {}
+    for name, embedding in embeddings.items():
+        memory = asyncio.run(
+            client.create_memory(
+                MemoryCreate(content=name, embedding=embedding, memory_type="note"),
+                project_id="other-project" if name == "other" else "project",
+                user_id="alice",
+            )
+        )
+        ids[memory.memory_id] = name
+
+    results = asyncio.run(client.search_memories_async([1.0, 0.0, 0.0], "project", "alice"))
+    assert [ids[r.memory.memory_id] for r in results] == ["near", "far"]
+
+    df = client.search_memories([1.0, 0.0, 0.0], "alice", limit=1)
+    assert ids[df.iloc[0]["memory_id"]] == "other"
+    assert client.search_memories([1.0, 0.0, 0.0], "alice", memory_type="fact").empty
+
+    asyncio.run(client.close())
+    reopened = LocalMemoryClient(storage_dir=tmp_path, enable_markdown=False)
+    assert len(reopened.memory_index) == 3
+    near = next(mid for mid, name in ids.items() if name == "near")
+    assert asyncio.run(reopened.delete_memory(near, "project"))
+    results = asyncio.run(reopened.search_memories_async([1.0, 0.0, 0.0], "project", "alice"))
+    assert [ids[r.memory.memory_id] for r in results] == ["far"]
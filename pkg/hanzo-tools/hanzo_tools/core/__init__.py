@@ -27,8 +27,10 @@ from hanzo_tools.core.unified import (
     InvalidParamsError,
     file_uri,
     content_hash,
+    register_mcp_tool,
 )
 from hanzo_tools.core.id_tool import IdTool, id_tool
+from hanzo_tools.core.result_cache import ResultCache
 from hanzo_tools.core.cloud import (
     NO_KEY,
     HanzoCloud,
@@ -58,6 +60,8 @@ __all__ = [
     "Range",
     "content_hash",
     "file_uri",
+    "register_mcp_tool",
+    "ResultCache",
     # Identity tool
     "IdTool",
     "id_tool",
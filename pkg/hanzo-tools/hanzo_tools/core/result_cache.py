@@ -0,0 +1,225 @@
+"""Result memoization for PURE tool actions.
+
+Actions that declare ``Effect: PURE`` return the same result for the same
+arguments and the same files, so ``BaseTool.call`` can answer repeated calls
+from memory. An entry is keyed on the canonicalized arguments and remembers a
+fingerprint of every file argument (mtime, size, inode); the entry is dropped
+as soon as any fingerprint changes. Files modified within the last
+``RACY_WINDOW`` seconds can change again without a visible mtime change, so
+their content hash is part of the fingerprint too (the same trick git uses for
+"racily clean" index entries).
+
+Memory is bounded by entry count and by pickled size, entries expire after a
+TTL, and ``invalidate`` drops entries explicitly by action or path.
+"""
+
+import os
+import json
+import time
+import pickle
+import hashlib
+from typing import Any, NamedTuple
+from dataclasses import dataclass
+from collections import OrderedDict
+
+# Parameter names whose values are files the action reads
+PATH_PARAMS = frozenset({"path", "paths", "uri", "file", "file_path", "files"})
+
+# Files modified this recently get their content hashed into the fingerprint
+RACY_WINDOW = 2.0
+
+# Recently modified files larger than this are not cached at all
+MAX_HASHED_FILE_SIZE = 4 * 1024 * 1024
+
+# (mtime_ns, size, inode[, content hash]), or None for a missing file
+Fingerprint = tuple | None
+
+
+class CacheKey(NamedTuple):
+    """Identity of a PURE call: canonical arguments plus file fingerprints."""
+
+    args: str
+    """Digest of the canonical JSON arguments."""
+
+    files: tuple[tuple[str, Fingerprint], ...]
+
+
+@dataclass
+class _Entry:
+    files: tuple[tuple[str, Fingerprint], ...]
+    payload: bytes
+    expires: float
+    action: str
+
+
+def _resolve(value: str, cwd: str | None) -> str:
+    if value.startswith("file://"):
+        value = value[len("file://") :]
+    path = os.path.expanduser(value)
+    if cwd and not os.path.isabs(path):
+        path = os.path.join(cwd, path)
+    return os.path.normpath(path)
+
+
+def file_fingerprint(path: str) -> Fingerprint | bool:
+    """Fingerprint a file for cache validation.
+
+    Returns:
+        ``(mtime_ns, size, inode)``, with a content hash appended for recently
+        modified files; ``None`` for a missing file; ``False`` if the path
+        can't be fingerprinted cheaply (a directory or a large, recently
+        modified file) and the call should not be cached.
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError:
+        return False
+    if not os.path.isfile(path):
+        return False
+    if time.time() - st.st_mtime >= RACY_WINDOW:
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    if st.st_size > MAX_HASHED_FILE_SIZE:
+        return False
+    try:
+        with open(path, "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return False
+    return (st.st_mtime_ns, st.st_size, st.st_ino, digest)
+
+
+class ResultCache:
+    """LRU cache of PURE action results for one tool instance.
+
+    Results are stored pickled, so callers never share (and can't mutate) a
+    cached object, and ``max_bytes`` bounds the real payload size.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: float | None = 300.0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def make_key(self, kwargs: dict[str, Any], cwd: str | None = None) -> CacheKey | None:
+        """Build the cache key for a call, or None if the call can't be cached."""
+        if self.max_entries <= 0:
+            return None
+        try:
+            args = json.dumps(kwargs, sort_keys=True, separators=(",", ":"), allow_nan=False)
+        except (TypeError, ValueError):
+            return None
+        # Arguments can carry whole files as text; keep only their digest
+        args = hashlib.blake2b(args.encode(), digest_size=32).hexdigest()
+
+        files: list[tuple[str, Fingerprint]] = []
+        for name in PATH_PARAMS.intersection(kwargs):
+            value = kwargs[name]
+            values = value if isinstance(value, list) else [value]
+            for item in values:
+                if not isinstance(item, str) or not item:
+                    continue
+                path = _resolve(item, cwd)
+                fingerprint = file_fingerprint(path)
+                if fingerprint is False:
+                    return None
+                files.append((path, fingerprint))
+        files.sort()
+        return CacheKey(args, tuple(files))
+
+    def get(self, action: str, key: CacheKey) -> tuple[bool, Any]:
+        """Look up a result. Returns ``(found, value)``."""
+        entry = self._entries.get((action, key.args))
+        if entry is not None:
+            if entry.files == key.files and (entry.expires > time.monotonic()):
+                self._entries.move_to_end((action, key.args))
+                self.hits += 1
+                return True, pickle.loads(entry.payload)
+            # A file changed or the entry expired
+            self._remove((action, key.args))
+        self.misses += 1
+        return False, None
+
+    def put(self, action: str, key: CacheKey, value: Any) -> None:
+        """Store a result, evicting least recently used entries to stay in bounds."""
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        if len(payload) > self.max_bytes:
+            return
+        cache_key = (action, key.args)
+        if cache_key in self._entries:
+            self._remove(cache_key)
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self._entries[cache_key] = _Entry(key.files, payload, expires, action)
+        self._bytes += len(payload)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(
+        self,
+        action: str | None = None,
+        path: str | None = None,
+        cwd: str | None = None,
+    ) -> int:
+        """Drop cached results.
+
+        Args:
+            action: Only results of this action
+            path: Only results that read this file (or any file under it, for
+                a directory)
+            cwd: Directory relative paths are resolved against
+
+        Returns:
+            Number of entries dropped
+        """
+        if path is not None:
+            path = _resolve(path, cwd)
+            prefix = path.rstrip(os.sep) + os.sep
+        stale = [
+            cache_key
+            for cache_key, entry in self._entries.items()
+            if (action is None or entry.action == action)
+            and (
+                path is None
+                or any(p == path or p.startswith(prefix) for p, _ in entry.files)
+            )
+        ]
+        for cache_key in stale:
+            self._remove(cache_key)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def _remove(self, cache_key: tuple[str, str]) -> None:
+        entry = self._entries.pop(cache_key)
+        self._bytes -= len(entry.payload)
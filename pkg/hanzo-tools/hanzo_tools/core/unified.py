@@ -17,6 +17,7 @@ Design principles:
 Reference: HIP-0300 Unified MCP Tools Architecture
 """
 
+import re
 import json
 import hashlib
 import inspect
@@ -29,6 +30,10 @@ from mcp.server import FastMCP
 from mcp.server.fastmcp import Context as MCPContext
 
 from .base import BaseTool as _BaseToolABC
+from .result_cache import ResultCache
+
+# "Effect: PURE" line in an action handler's docstring
+_EFFECT_RE = re.compile(r"^\s*Effect:\s*([A-Z_]+)", re.MULTILINE)
 
 # Error codes for structured error handling
 ErrorCode = Literal[
@@ -138,6 +143,7 @@ class ActionHandler:
     description: str
     schema: dict[str, Any] | None = None
     examples: list[str] = field(default_factory=list)
+    effect: str | None = None
 
 
 class BaseTool(_BaseToolABC):
@@ -181,8 +187,18 @@ class BaseTool(_BaseToolABC):
     # Param aliases for cross-implementation parity (e.g., {"path": "uri"})
     PARAM_ALIASES: ClassVar[dict[str, str]] = {}
 
+    # Memoization of PURE actions (CACHE_MAX_ENTRIES = 0 disables it)
+    CACHE_MAX_ENTRIES: ClassVar[int] = 256
+    CACHE_MAX_BYTES: ClassVar[int] = 32 * 1024 * 1024
+    CACHE_TTL: ClassVar[float | None] = 300.0
+
     def __init__(self):
         self._handlers: dict[str, ActionHandler] = {}
+        self._result_cache = ResultCache(
+            max_entries=self.CACHE_MAX_ENTRIES,
+            max_bytes=self.CACHE_MAX_BYTES,
+            ttl=self.CACHE_TTL,
+        )
         self._register_builtin_actions()
 
     def _register_builtin_actions(self):
@@ -226,6 +242,7 @@ class BaseTool(_BaseToolABC):
                 "version": self.VERSION,
                 "enabled": True,
                 "actions": list(self._handlers.keys()),
+                "cache": self._result_cache.stats(),
             }
 
     def action(
@@ -234,14 +251,21 @@ class BaseTool(_BaseToolABC):
         description: str = "",
         schema: dict[str, Any] | None = None,
         examples: list[str] | None = None,
+        effect: str | None = None,
     ) -> Callable:
         """Decorator to register an action handler.
 
+        Results of PURE actions are memoized: repeated calls with the same
+        arguments, and unchanged files behind any path arguments, are served
+        from the tool's result cache.
+
         Args:
             name: Action name (e.g., "read", "apply_patch")
             description: Human-readable description
             schema: Optional JSON Schema for parameters
             examples: Optional list of example usages
+            effect: Effect class (e.g., "PURE"); defaults to the handler
+                docstring's "Effect:" line
 
         Returns:
             Decorator function
@@ -255,13 +279,20 @@ class BaseTool(_BaseToolABC):
             if auto_schema is None:
                 auto_schema = self._generate_schema(fn)
 
+            action_effect = effect
+            if action_effect is None and fn.__doc__:
+                match = _EFFECT_RE.search(fn.__doc__)
+                action_effect = match.group(1) if match else None
+
             self._handlers[name] = ActionHandler(
                 name=name,
                 handler=fn,
                 description=description or fn.__doc__ or "",
                 schema=auto_schema,
                 examples=examples or [],
+                effect=action_effect,
             )
+            self._result_cache.invalidate(action=name)
             return fn
 
         return decorator
@@ -321,6 +352,7 @@ class BaseTool(_BaseToolABC):
         paging: Paging | None = None,
         backend: str | None = None,
         trace_id: str | None = None,
+        cache: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Wrap result in unified response envelope."""
         meta: dict[str, Any] = {
@@ -333,6 +365,8 @@ class BaseTool(_BaseToolABC):
             meta["backend"] = backend
         if trace_id:
             meta["trace_id"] = trace_id
+        if cache:
+            meta["cache"] = cache
 
         if paging:
             meta["paging"] = {
@@ -409,36 +443,57 @@ class BaseTool(_BaseToolABC):
 
         handler = self._handlers[action]
 
+        cache = self._result_cache
+        key = None
+        if handler.effect == "PURE":
+            key = cache.make_key(kwargs, getattr(self, "cwd", None))
+            if key is not None:
+                hit, result = cache.get(action, key)
+                if hit:
+                    return self._envelope(result, action=action, cache=self._cache_meta(True))
+
         try:
             result = await handler.handler(ctx, **kwargs)
+            if key is not None:
+                cache.put(action, key, result)
+                return self._envelope(result, action=action, cache=self._cache_meta(False))
             return self._envelope(result, action=action)
         except ToolError as e:
             return self._error(e.code, e.message, **e.details)
         except Exception as e:
             return self._error("INTERNAL_ERROR", str(e))
 
-    def register(self, mcp_server: FastMCP) -> None:
-        """Register this tool with the MCP server.
+    def _cache_meta(self, hit: bool) -> dict[str, Any]:
+        return {
+            "hit": hit,
+            "hits": self._result_cache.hits,
+            "misses": self._result_cache.misses,
+        }
 
-        Creates a single MCP tool with flat params matching TS wire format.
-        Bypasses FastMCP's function introspection to support arbitrary extra
-        parameters (action-specific params) as top-level fields.
+    def invalidate_cache(self, action: str | None = None, path: str | None = None) -> int:
+        """Drop memoized results of PURE actions.
 
-        Wire format: {"action": "read", "path": "/tmp/foo"} (flat, same as TS)
+        Call this when state a PURE action depends on changes outside its
+        arguments and files (e.g., after an external process rewrites a
+        directory).
+
+        Args:
+            action: Only results of this action
+            path: Only results that read this file, or files under this directory
+
+        Returns:
+            Number of results dropped
         """
-        from pydantic import ConfigDict
-        from mcp.server.fastmcp.tools.base import Tool as FastMCPTool
-        from mcp.server.fastmcp.utilities.func_metadata import (
-            ArgModelBase,
-            FuncMetadata,
+        return self._result_cache.invalidate(
+            action=action, path=path, cwd=getattr(self, "cwd", None)
         )
 
-        tool_name = self.name
-        tool_description = (
-            f"{self.description}\n\nActions: {', '.join(self._handlers.keys())}"
-        )
+    def mcp_description(self) -> str:
+        """Tool description as registered with MCP, listing the actions."""
+        return f"{self.description}\n\nActions: {', '.join(self._handlers.keys())}"
 
-        # Build combined JSON schema from all action handlers
+    def mcp_parameters(self) -> dict[str, Any]:
+        """Combined flat JSON Schema of all action parameters, as registered with MCP."""
         all_properties: dict[str, Any] = {
             "action": {
                 "type": "string",
@@ -452,45 +507,81 @@ class BaseTool(_BaseToolABC):
                     if k not in all_properties and k != "ctx":
                         all_properties[k] = v
 
-        parameters_schema = {
+        return {
             "type": "object",
             "properties": all_properties,
             "required": ["action"],
             "additionalProperties": True,
         }
 
-        # Permissive Pydantic model that accepts any extra fields
-        class _FlexArgs(ArgModelBase):
-            model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
-            action: str = "help"
-
-            def model_dump_one_level(self) -> dict[str, Any]:
-                result = super().model_dump_one_level()
-                if self.model_extra:
-                    result.update(self.model_extra)
-                return result
-
-        # Handler function — receives flat validated args
-        tool_ref = self
-
-        async def _handler(ctx: MCPContext, action: str = "help", **kwargs: Any) -> Any:
-            result = await tool_ref.call(ctx, action=action, **kwargs)
-            return _result_to_mcp(result)
-
-        metadata = FuncMetadata(arg_model=_FlexArgs)
-
-        tool = FastMCPTool(
-            fn=_handler,
-            name=tool_name,
-            description=tool_description,
-            parameters=parameters_schema,
-            fn_metadata=metadata,
-            is_async=True,
-            context_kwarg="ctx",
+    def register(self, mcp_server: FastMCP) -> None:
+        """Register this tool with the MCP server.
+
+        Creates a single MCP tool with flat params matching TS wire format.
+        Bypasses FastMCP's function introspection to support arbitrary extra
+        parameters (action-specific params) as top-level fields.
+
+        Wire format: {"action": "read", "path": "/tmp/foo"} (flat, same as TS)
+        """
+        register_mcp_tool(
+            mcp_server,
+            name=self.name,
+            description=self.mcp_description(),
+            parameters=self.mcp_parameters(),
+            call=self.call,
         )
 
-        # Register directly, bypassing Tool.from_function() introspection
-        mcp_server._tool_manager._tools[tool_name] = tool
+
+def register_mcp_tool(
+    mcp_server: FastMCP,
+    name: str,
+    description: str,
+    parameters: dict[str, Any],
+    call: Callable[..., Awaitable[dict[str, Any]]],
+) -> None:
+    """Register a flat-params MCP tool that routes to ``call(ctx, action=..., **kwargs)``.
+
+    This is what ``BaseTool.register`` does with a live tool; it is separate so a
+    tool can be registered from a recorded name, description and schema and be
+    imported only when first called.
+    """
+    from pydantic import ConfigDict
+    from mcp.server.fastmcp.tools.base import Tool as FastMCPTool
+    from mcp.server.fastmcp.utilities.func_metadata import (
+        ArgModelBase,
+        FuncMetadata,
+    )
+
+    # Permissive Pydantic model that accepts any extra fields
+    class _FlexArgs(ArgModelBase):
+        model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+        action: str = "help"
+
+        def model_dump_one_level(self) -> dict[str, Any]:
+            result = super().model_dump_one_level()
+            if self.model_extra:
+                result.update(self.model_extra)
+            return result
+
+    # Handler function — receives flat validated args
+    async def _handler(ctx: MCPContext, action: str = "help", **kwargs: Any) -> Any:
+        result = await call(ctx, action=action, **kwargs)
+        return _result_to_mcp(result)
+
+    metadata = FuncMetadata(arg_model=_FlexArgs)
+
+    tool = FastMCPTool(
+        fn=_handler,
+        name=name,
+        description=description,
+        parameters=parameters,
+        fn_metadata=metadata,
+        is_async=True,
+        context_kwarg="ctx",
+    )
+
+    # Register directly, bypassing Tool.from_function() introspection
+    mcp_server._tool_manager._tools[name] = tool
 
 
 # Utility functions for composability
@@ -8,6 +8,7 @@ import asyncio
 import json
 import ssl
 import struct
+from collections import deque
 from typing import Any
 from urllib.parse import urlparse
 
@@ -28,6 +29,11 @@ class ZapClient:
     """
     ZAP Client for connecting to ZAP servers.
 
+    A background reader routes every incoming message to whoever is waiting on
+    it: tool results (and errors) by their call ``id``, so concurrent
+    :meth:`call_tool` invocations share the connection and may complete in any
+    order, and every other reply to the oldest request still awaiting one.
+
     Example:
         >>> async with ZapClient.connect("zap://localhost:9999") as client:
         ...     tools = await client.list_tools()
@@ -43,6 +49,12 @@ class ZapClient:
         self._writer = writer
         self._server_info: ServerInfo | None = None
         self._request_id = 0
+        # Tool and batch replies carry the id they answer; all others arrive in
+        # the order their requests were sent.
+        self._tagged: dict[str, asyncio.Future[Any]] = {}
+        self._untagged: deque[asyncio.Future[Any]] = deque()
+        self._error: BaseException | None = None
+        self._read_task = asyncio.ensure_future(self._read_loop())
 
     @classmethod
     async def connect(cls, url: str) -> ZapClient:
@@ -64,14 +76,17 @@ class ZapClient:
 
         reader, writer = await asyncio.open_connection(host, port, ssl=ssl_ctx)
         client = cls(reader, writer)
-        await client._handshake()
+        try:
+            await client._handshake()
+        except BaseException:
+            await client.close()
+            raise
         return client
 
     async def _handshake(self) -> None:
         """Perform protocol handshake."""
         client_info = ClientInfo(name="hanzo-zap", version="0.6.1")
-        await self._send(MessageType.INIT, client_info.__dict__)
-        msg_type, payload = await self._recv()
+        msg_type, payload = await self._request(MessageType.INIT, client_info.__dict__)
 
         if msg_type != MessageType.INIT_ACK:
             raise ConnectionError(f"Expected INIT_ACK, got {msg_type}")
@@ -85,47 +100,65 @@ class ZapClient:
 
     async def list_tools(self) -> list[Tool]:
         """List available tools."""
-        await self._send(MessageType.LIST_TOOLS, {})
-        _, payload = await self._recv()
+        _, payload = await self._request(MessageType.LIST_TOOLS, {})
         return [Tool(**t) for t in payload]
 
     async def call_tool(self, name: str, args: dict[str, Any]) -> ToolResult:
-        """Call a tool by name."""
-        self._request_id += 1
-        call = ToolCall(id=f"req-{self._request_id}", name=name, args=args)
-        await self._send(MessageType.CALL_TOOL, call.__dict__)
-        _, payload = await self._recv()
+        """Call a tool by name; safe to call concurrently."""
+        call = ToolCall(id=self._next_id(), name=name, args=args)
+        payload = await self._request_tagged(MessageType.CALL_TOOL, call.id, call.__dict__)
         return ToolResult(**payload)
 
     async def batch(
         self, calls: list[dict[str, Any]]
     ) -> list[ToolResult]:
-        """Call multiple tools in a batch."""
-        return [await self.call_tool(c["name"], c["args"]) for c in calls]
+        """
+        Call multiple tools in a batch.
+
+        The calls run concurrently. Servers that advertise the ``batch``
+        capability receive them as one BATCH message; otherwise each goes out
+        as its own CALL_TOOL. Results are in the order of ``calls``.
+        """
+        if not (self._server_info and self._server_info.capabilities.get("batch")):
+            return list(
+                await asyncio.gather(*(self.call_tool(c["name"], c["args"]) for c in calls))
+            )
+
+        batch_id = self._next_id()
+        tool_calls = [
+            ToolCall(id=f"{batch_id}.{i}", name=c["name"], args=c["args"]).__dict__
+            for i, c in enumerate(calls)
+        ]
+        payload = await self._request_tagged(
+            MessageType.BATCH, batch_id, {"id": batch_id, "calls": tool_calls}
+        )
+        return [ToolResult(**r) for r in payload["results"]]
 
     async def list_resources(self) -> list[Resource]:
         """List available resources."""
-        await self._send(MessageType.LIST_RESOURCES, {})
-        _, payload = await self._recv()
+        _, payload = await self._request(MessageType.LIST_RESOURCES, {})
         return [Resource(**r) for r in payload]
 
     async def read_resource(self, uri: str) -> dict[str, Any]:
         """Read a resource by URI."""
-        await self._send(MessageType.READ_RESOURCE, {"uri": uri})
-        _, payload = await self._recv()
+        _, payload = await self._request(MessageType.READ_RESOURCE, {"uri": uri})
         return payload
 
     async def ping(self) -> None:
         """Send ping to check connection."""
-        await self._send(MessageType.PING, {})
-        msg_type, _ = await self._recv()
+        msg_type, _ = await self._request(MessageType.PING, {})
         if msg_type != MessageType.PONG:
             raise ConnectionError(f"Expected PONG, got {msg_type}")
 
     async def close(self) -> None:
-        """Close the connection."""
+        """Close the connection, failing any requests still waiting."""
+        self._read_task.cancel()
         self._writer.close()
-        await self._writer.wait_closed()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._fail(ConnectionError("ZAP connection closed"))
 
     async def __aenter__(self) -> ZapClient:
         return self
@@ -133,16 +166,81 @@ class ZapClient:
     async def __aexit__(self, *args: Any) -> None:
         await self.close()
 
+    def _next_id(self) -> str:
+        self._request_id += 1
+        return f"req-{self._request_id}"
+
+    async def _request(self, msg_type: MessageType, payload: dict[str, Any]) -> tuple[MessageType, Any]:
+        """Send a request answered in order and wait for its reply."""
+        future = self._expect()
+        self._untagged.append(future)
+        await self._send(msg_type, payload)
+        return await future
+
+    async def _request_tagged(self, msg_type: MessageType, request_id: str, payload: dict[str, Any]) -> Any:
+        """Send a request whose reply carries ``request_id`` and wait for it."""
+        future = self._expect()
+        self._tagged[request_id] = future
+        try:
+            await self._send(msg_type, payload)
+            _, reply = await future
+        finally:
+            self._tagged.pop(request_id, None)
+        return reply
+
+    def _expect(self) -> asyncio.Future[Any]:
+        if self._error is not None:
+            raise ConnectionError("ZAP connection closed") from self._error
+        return asyncio.get_running_loop().create_future()
+
     async def _send(self, msg_type: MessageType, payload: dict[str, Any]) -> None:
         """Send a message with ZAP wire format."""
         payload_bytes = json.dumps(payload).encode("utf-8") if payload else b""
         total_len = 1 + len(payload_bytes)
 
-        # Header: 4-byte LE length + 1-byte message type
+        # Header: 4-byte LE length + 1-byte message type. One write per
+        # message keeps concurrent senders from interleaving.
         header = struct.pack("<IB", total_len, msg_type)
         self._writer.write(header + payload_bytes)
         await self._writer.drain()
 
+    async def _read_loop(self) -> None:
+        """Read messages until the connection ends, routing each to its waiter."""
+        try:
+            while True:
+                msg_type, payload = await self._recv()
+                request_id = payload.get("id") if isinstance(payload, dict) else None
+                if msg_type in (MessageType.CALL_TOOL_RESPONSE, MessageType.BATCH_RESPONSE) or (
+                    msg_type == MessageType.ERROR and request_id
+                ):
+                    future = self._tagged.get(request_id or "")
+                elif self._untagged:
+                    future = self._untagged.popleft()
+                else:
+                    continue
+                if future is None or future.done():
+                    continue  # its caller gave up
+                if msg_type == MessageType.ERROR:
+                    future.set_exception(RuntimeError(payload.get("message", "Server error")))
+                else:
+                    future.set_result((msg_type, payload))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._fail(e)
+
+    def _fail(self, exc: BaseException) -> None:
+        """Fail every waiting request; later requests raise ConnectionError."""
+        if self._error is None:
+            self._error = exc
+        waiting = [*self._tagged.values(), *self._untagged]
+        self._untagged.clear()
+        for future in waiting:
+            if not future.done():
+                err = ConnectionError("ZAP connection lost")
+                err.__cause__ = exc
+                future.set_exception(err)
+
     async def _recv(self) -> tuple[MessageType, Any]:
         """Receive and parse a message."""
         # Read header
@@ -160,9 +258,4 @@ class ZapClient:
         else:
             payload = {}
 
-        msg_type = MessageType(msg_type_byte)
-
-        if msg_type == MessageType.ERROR:
-            raise RuntimeError(payload.get("message", "Server error"))
-
-        return msg_type, payload
+        return MessageType(msg_type_byte), payload
@@ -16,18 +16,19 @@ import asyncio
 import json
 import ssl
 import struct
+import warnings
 from typing import Any
 
 from .wire import (
     REQ_FLAG_REQ,
     REQ_FLAG_RESP,
+    FrameProtocol,
     Message,
     build_cloud_request,
     build_handshake,
+    frame_parts,
     parse_cloud_response,
     parse_handshake,
-    read_frame,
-    write_frame,
 )
 
 DEFAULT_ENDPOINT = "localhost:3692"
@@ -39,18 +40,67 @@ class CloudClient:
     A client that speaks the luxfi/zap binary wire protocol.
 
     Supports both plain TCP (localhost) and TLS (remote endpoints).
+
+    One connection carries any number of concurrent :meth:`call` invocations.
+    Each request is tagged with a fresh correlation id, and every response frame
+    is routed, as it arrives, to the future waiting on its id, so replies may
+    come back in any order. Frames queued in the same loop iteration go out in
+    one ``writelines``.
     """
 
     def __init__(
         self,
-        reader: asyncio.StreamReader,
-        writer: asyncio.StreamWriter,
-        peer_id: str,
+        protocol: FrameProtocol | asyncio.StreamReader,
+        peer_id: str | asyncio.StreamWriter,
+        *legacy: str,
+        timeout: float | None = None,
     ) -> None:
-        self._reader = reader
-        self._writer = writer
+        """
+        Wrap a connection whose handshake is done; :meth:`connect` does both.
+
+        Args:
+            protocol: The connection's frame protocol.
+            peer_id: The node ID the peer sent in its handshake.
+            timeout: Default per-call timeout in seconds (None = wait forever).
+
+        ``CloudClient(reader, writer, peer_id)``, the stream form of earlier
+        versions, is deprecated but still accepted: the stream's transport is
+        handed over to a :class:`FrameProtocol`.
+        """
+        buffered = b""
+        if isinstance(protocol, asyncio.StreamReader):
+            warnings.warn(
+                "CloudClient(reader, writer, peer_id) is deprecated; "
+                "use CloudClient.connect() or CloudClient(protocol, peer_id)",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            if not isinstance(peer_id, asyncio.StreamWriter) or len(legacy) != 1:
+                raise TypeError("expected CloudClient(reader, writer, peer_id)")
+            reader, writer, peer_id = protocol, peer_id, legacy[0]
+            # Bytes the stream already read belong to the next frame(s)
+            buffered = bytes(getattr(reader, "_buffer", b""))
+            protocol = FrameProtocol()
+            writer.transport.set_protocol(protocol)
+            protocol.connection_made(writer.transport)
+        elif legacy or not isinstance(peer_id, str):
+            raise TypeError("expected CloudClient(protocol, peer_id)")
+
+        self._protocol = protocol
         self._peer_id = peer_id
+        self._timeout = timeout
         self._req_id = 0
+        self._pending: dict[int, asyncio.Future[memoryview]] = {}
+        self._outbox: list[bytes | memoryview] = []
+        self._error: BaseException | None = None
+        protocol.on_frame = self._on_frame
+        protocol.on_lost = self._fail
+        while buffered:
+            chunk = protocol.get_buffer(len(buffered))
+            n = min(len(chunk), len(buffered))
+            chunk[:n] = buffered[:n]
+            buffered = buffered[n:]
+            protocol.buffer_updated(n)
 
     @classmethod
     async def connect(
@@ -59,6 +109,7 @@ class CloudClient:
         *,
         use_tls: bool | None = None,
         node_id: str = CLIENT_NODE_ID,
+        timeout: float | None = None,
     ) -> "CloudClient":
         """
         Connect to a ZAP endpoint, perform handshake.
@@ -67,6 +118,7 @@ class CloudClient:
             endpoint: "host:port" (default: localhost:3692)
             use_tls: Force TLS on/off. None = auto-detect (TLS for non-localhost).
             node_id: Client node ID for handshake.
+            timeout: Default per-call timeout in seconds (None = wait forever).
         """
         addr = endpoint or DEFAULT_ENDPOINT
         host, _, port_str = addr.rpartition(":")
@@ -83,59 +135,132 @@ class CloudClient:
         if use_tls:
             ssl_ctx = ssl.create_default_context()
 
-        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_ctx)
+        loop = asyncio.get_running_loop()
+        handshake: asyncio.Future[memoryview] = loop.create_future()
+
+        def on_handshake(frame: memoryview) -> None:
+            if not handshake.done():
+                handshake.set_result(frame)
 
-        # Send handshake
-        hs_bytes = build_handshake(node_id)
-        await write_frame(writer, hs_bytes)
+        def on_lost(exc: BaseException) -> None:
+            if not handshake.done():
+                handshake.set_exception(exc)
 
-        # Read handshake response
-        resp_data = await read_frame(reader)
-        resp_msg = Message.parse(resp_data)
-        peer_id = parse_handshake(resp_msg)
+        _, protocol = await loop.create_connection(
+            lambda: FrameProtocol(on_handshake, on_lost), host, port, ssl=ssl_ctx
+        )
+        try:
+            # Send handshake, read handshake response
+            protocol.write_frame(build_handshake(node_id))
+            peer_id = parse_handshake(Message.parse(await handshake))
+        except BaseException:
+            protocol.transport.abort()
+            raise
 
-        return cls(reader, writer, peer_id)
+        return cls(protocol, peer_id, timeout=timeout)
 
     @property
     def peer_id(self) -> str:
         return self._peer_id
 
+    @property
+    def closed(self) -> bool:
+        """True once the connection is closed or lost; every later call fails."""
+        return self._error is not None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls sent and still awaiting their response."""
+        return len(self._pending)
+
     async def call(
         self,
         method: str,
         auth: str,
         body: bytes,
-    ) -> tuple[int, bytes, str]:
+        *,
+        timeout: float | None = None,
+        view: bool = False,
+    ) -> tuple[int, bytes | memoryview, str]:
         """
         Send a MsgType 100 cloud service request and return (status, body, error).
-        """
-        self._req_id = (self._req_id + 1) & 0xFFFFFFFF
-        req_id = self._req_id
-
-        # Build ZAP message
-        msg_bytes = build_cloud_request(method, auth, body)
-
-        # Wrap with 8-byte Call correlation header
-        wrapped = struct.pack("<II", req_id, REQ_FLAG_REQ) + msg_bytes
 
-        # Send
-        await write_frame(self._writer, wrapped)
+        Safe to call concurrently from many tasks on one client.
 
-        # Read response — loop until we match our req_id
+        Args:
+            timeout: Seconds to wait for the response; defaults to the client's
+                ``timeout``. On expiry ``asyncio.TimeoutError`` is raised and a
+                late response is discarded. Cancelling the calling task does
+                the same.
+            view: Return the body as a ``memoryview`` over the received
+                frame instead of copying it out.
+
+        Raises:
+            ConnectionError: The connection is closed or was lost.
+        """
+        if self._error is not None:
+            raise ConnectionError("ZAP connection closed") from self._error
+
+        req_id = self._next_req_id()
+        future: asyncio.Future[memoryview] = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+        try:
+            # Build ZAP message, sent behind the 8-byte Call correlation header
+            msg_bytes = build_cloud_request(method, auth, body)
+            self._send(struct.pack("<II", req_id, REQ_FLAG_REQ), msg_bytes)
+            await self._protocol.drain()
+
+            if timeout is None:
+                timeout = self._timeout
+            data = await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(req_id, None)
+
+        # Parse ZAP message (skip 8-byte Call header)
+        msg = Message.parse(data[8:])
+        return parse_cloud_response(msg, view=view)
+
+    def _next_req_id(self) -> int:
         while True:
-            data = await read_frame(self._reader)
-            if len(data) < 8:
-                continue
-
-            resp_id, resp_flag = struct.unpack_from("<II", data, 0)
-            if resp_flag != REQ_FLAG_RESP:
-                continue
-            if resp_id != req_id:
-                continue
-
-            # Parse ZAP message (skip 8-byte Call header)
-            msg = Message.parse(data[8:])
-            return parse_cloud_response(msg)
+            self._req_id = (self._req_id + 1) & 0xFFFFFFFF
+            if self._req_id not in self._pending:
+                return self._req_id
+
+    def _send(self, *parts: bytes | memoryview) -> None:
+        """Queue a frame; everything queued this loop iteration is written at once."""
+        if not self._outbox:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._outbox.extend(frame_parts(*parts))
+
+    def _flush(self) -> None:
+        outbox, self._outbox = self._outbox, []
+        transport = self._protocol.transport
+        if self._error is None and transport is not None and not transport.is_closing():
+            transport.writelines(outbox)
+
+    def _on_frame(self, data: memoryview) -> None:
+        """Route a response frame to the call waiting on its req_id."""
+        if len(data) < 8:
+            return
+
+        resp_id, resp_flag = struct.unpack_from("<II", data, 0)
+        if resp_flag != REQ_FLAG_RESP:
+            return
+        # A call that timed out or was cancelled has already left `_pending`;
+        # its late response is dropped here.
+        future = self._pending.get(resp_id)
+        if future is not None and not future.done():
+            future.set_result(data)
+
+    def _fail(self, exc: BaseException) -> None:
+        """Fail every waiting call; later calls raise ConnectionError."""
+        if self._error is None:
+            self._error = exc
+        for future in self._pending.values():
+            if not future.done():
+                err = ConnectionError("ZAP connection lost")
+                err.__cause__ = exc
+                future.set_exception(err)
 
     async def chat_completion(
         self,
@@ -164,9 +289,11 @@ class CloudClient:
         return json.loads(resp_body)
 
     async def close(self) -> None:
-        """Close the connection."""
-        self._writer.close()
-        await self._writer.wait_closed()
+        """Close the connection, failing any calls still in flight."""
+        self._fail(ConnectionError("ZAP connection closed"))
+        if self._protocol.transport is not None:
+            self._protocol.transport.close()
+        await self._protocol.wait_closed()
 
     async def __aenter__(self) -> "CloudClient":
         return self
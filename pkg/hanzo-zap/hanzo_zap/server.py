@@ -5,9 +5,12 @@ ZAP Server implementation.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
+import logging
 import struct
 from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from .types import (
@@ -19,11 +22,44 @@ from .types import (
 
 ToolHandler = Callable[[str, dict[str, Any]], Awaitable[Any] | Any]
 
+logger = logging.getLogger(__name__)
+
+#: Tool calls one connection may have running at once before reads pause.
+DEFAULT_MAX_IN_FLIGHT = 64
+
+#: Batches one connection may have running at once before reads pause.
+DEFAULT_MAX_BATCHES = 8
+
+
+class _Connection:
+    """Per-connection dispatch state: the writer, its in-flight bounds, its tasks."""
+
+    def __init__(
+        self, writer: asyncio.StreamWriter, max_in_flight: int, max_batches: int
+    ) -> None:
+        self.writer = writer
+        self.slots = asyncio.Semaphore(max_in_flight)
+        self.batch_slots = asyncio.Semaphore(max_batches)
+        self.tasks: set[asyncio.Task[None]] = set()
+        self.drain_lock = asyncio.Lock()
+
+    def spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
 
 class ZapServer:
     """
     ZAP Server for hosting tools.
 
+    Each connection's tool calls run concurrently: a slow tool does not hold up
+    the requests behind it, and every response carries its call's ``id`` so it
+    may complete out of order. At most ``max_in_flight`` calls and
+    ``max_batches`` batches run per connection; beyond that the server stops
+    reading from it until one finishes. Synchronous handlers run on a thread pool of ``workers`` threads
+    so they do not block the event loop.
+
     Example:
         >>> server = ZapServer(name="my-tools", version="1.0.0")
         >>> @server.tool("greet", "Greet someone")
@@ -32,14 +68,26 @@ class ZapServer:
         >>> await server.serve(9999)
     """
 
-    def __init__(self, name: str, version: str) -> None:
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_batches: int = DEFAULT_MAX_BATCHES,
+        workers: int | None = None,
+    ) -> None:
         self._info = ServerInfo(
             name=name,
             version=version,
-            capabilities={"tools": True, "resources": False, "prompts": False},
+            capabilities={"tools": True, "resources": False, "prompts": False, "batch": True},
         )
         self._tools: dict[str, tuple[Tool, ToolHandler]] = {}
         self._server: asyncio.Server | None = None
+        self._max_in_flight = max_in_flight
+        self._max_batches = max_batches
+        self._workers = workers
+        self._executor: ThreadPoolExecutor | None = None
 
     def register_tool(
         self,
@@ -91,6 +139,9 @@ class ZapServer:
         if self._server:
             self._server.close()
             await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     async def _handle_connection(
         self,
@@ -98,6 +149,7 @@ class ZapServer:
         writer: asyncio.StreamWriter,
     ) -> None:
         """Handle a client connection."""
+        conn = _Connection(writer, self._max_in_flight, self._max_batches)
         try:
             while True:
                 # Read header
@@ -115,48 +167,105 @@ class ZapServer:
                     payload = {}
 
                 msg_type = MessageType(msg_type_byte)
-                await self._handle_message(writer, msg_type, payload)
+                if msg_type == MessageType.CALL_TOOL:
+                    # Wait for a free slot before reading on, so a client that
+                    # outpaces its tools is pushed back through TCP.
+                    await conn.slots.acquire()
+                    conn.spawn(self._dispatch_call(conn, payload))
+                elif msg_type == MessageType.BATCH:
+                    await conn.batch_slots.acquire()
+                    conn.spawn(self._dispatch_batch(conn, payload))
+                else:
+                    await self._handle_message(conn, msg_type, payload)
 
         except asyncio.IncompleteReadError:
             pass  # Connection closed cleanly
         except Exception:
-            import logging
-            logging.getLogger(__name__).warning("ZAP connection error", exc_info=True)
+            logger.warning("ZAP connection error", exc_info=True)
         finally:
+            for task in list(conn.tasks):
+                task.cancel()
+            await asyncio.gather(*conn.tasks, return_exceptions=True)
             writer.close()
-            await writer.wait_closed()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
 
     async def _handle_message(
         self,
-        writer: asyncio.StreamWriter,
+        conn: _Connection,
         msg_type: MessageType,
         payload: dict[str, Any],
     ) -> None:
         """Handle a message from client."""
         try:
             if msg_type == MessageType.INIT:
-                await self._send(writer, MessageType.INIT_ACK, self._info.__dict__)
+                await self._send(conn, MessageType.INIT_ACK, self._info.__dict__)
 
             elif msg_type == MessageType.LIST_TOOLS:
                 tools = [t.__dict__ for t, _ in self._tools.values()]
-                await self._send(writer, MessageType.LIST_TOOLS_RESPONSE, tools)
-
-            elif msg_type == MessageType.CALL_TOOL:
-                result = await self._execute_tool(payload)
-                await self._send(writer, MessageType.CALL_TOOL_RESPONSE, result.__dict__)
+                await self._send(conn, MessageType.LIST_TOOLS_RESPONSE, tools)
 
             elif msg_type == MessageType.PING:
-                await self._send(writer, MessageType.PONG, {})
+                await self._send(conn, MessageType.PONG, {})
 
             else:
                 await self._send(
-                    writer,
+                    conn,
                     MessageType.ERROR,
                     {"message": f"Unknown message type: {msg_type}"},
                 )
 
         except Exception as e:
-            await self._send(writer, MessageType.ERROR, {"message": str(e)})
+            await self._send(conn, MessageType.ERROR, {"message": str(e)})
+
+    async def _dispatch_call(self, conn: _Connection, call: dict[str, Any]) -> None:
+        """Run one tool call (holding a slot taken by the reader) and reply."""
+        try:
+            result = await self._execute_tool(call)
+            await self._send(conn, MessageType.CALL_TOOL_RESPONSE, result.__dict__)
+        except ConnectionError:
+            pass
+        except Exception as e:
+            # e.g. a result that isn't JSON-serializable: the caller still
+            # needs an answer for its id
+            await self._send_error(conn, call.get("id", ""), e)
+        finally:
+            conn.slots.release()
+
+    async def _dispatch_batch(self, conn: _Connection, batch: dict[str, Any]) -> None:
+        """Run a batch's calls concurrently (holding a batch slot taken by the reader)."""
+
+        async def run(call: dict[str, Any]) -> dict[str, Any]:
+            async with conn.slots:
+                return (await self._execute_tool(call)).__dict__
+
+        try:
+            calls = batch.get("calls", [])
+            results = await asyncio.gather(*(run(call) for call in calls))
+            await self._send(
+                conn,
+                MessageType.BATCH_RESPONSE,
+                {"id": batch.get("id", ""), "results": list(results)},
+            )
+        except ConnectionError:
+            pass
+        except Exception as e:
+            await self._send_error(conn, batch.get("id", ""), e)
+        finally:
+            conn.batch_slots.release()
+
+    async def _send_error(self, conn: _Connection, request_id: str, exc: Exception) -> None:
+        """Answer a tagged request with an ERROR carrying its id."""
+        try:
+            await self._send(
+                conn, MessageType.ERROR, {"id": request_id, "message": str(exc)}
+            )
+        except ConnectionError:
+            pass
+        except Exception:
+            logger.warning("Failed to send ZAP error for %s", request_id, exc_info=True)
 
     async def _execute_tool(self, call: dict[str, Any]) -> ToolResult:
         """Execute a tool call."""
@@ -169,22 +278,35 @@ class ZapServer:
 
         _, handler = self._tools[name]
         try:
-            result = handler(name, args)
-            if asyncio.iscoroutine(result):
-                result = await result
+            if asyncio.iscoroutinefunction(handler):
+                result = await handler(name, args)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._worker_pool(), functools.partial(handler, name, args)
+                )
+                if asyncio.iscoroutine(result):
+                    result = await result
             return ToolResult(id=call_id, content=result)
         except Exception as e:
             return ToolResult(id=call_id, content=None, error=str(e))
 
+    def _worker_pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="zap-tool"
+            )
+        return self._executor
+
     async def _send(
         self,
-        writer: asyncio.StreamWriter,
+        conn: _Connection,
         msg_type: MessageType,
         payload: Any,
     ) -> None:
-        """Send a message."""
+        """Send a message; safe to call from concurrent tasks."""
         payload_bytes = json.dumps(payload).encode("utf-8") if payload else b""
         total_len = 1 + len(payload_bytes)
         header = struct.pack("<IB", total_len, msg_type)
-        writer.write(header + payload_bytes)
-        await writer.drain()
+        conn.writer.write(header + payload_bytes)
+        async with conn.drain_lock:
+            await conn.writer.drain()
@@ -60,6 +60,8 @@ class MessageType(IntEnum):
     LIST_TOOLS_RESPONSE = 0x11
     CALL_TOOL = 0x12
     CALL_TOOL_RESPONSE = 0x13
+    BATCH = 0x14  # {"id", "calls": [ToolCall]} -> {"id", "results": [ToolResult]}
+    BATCH_RESPONSE = 0x15
 
     # Resources
     LIST_RESOURCES = 0x20
@@ -14,11 +14,18 @@ Wire format (defined and owned by ``zap.wire``):
   Message header (16 bytes): magic(4) + version(2) + flags(2) + root_offset(4) + size(4)
   Object fields: inline primitives; (relOffset:u32 + length:u32) for text/bytes,
   the offset being relative to the field's absolute position in the buffer.
+
+Receive and send avoid copying payloads: :class:`Message` is a view over the
+frame it was parsed from, :class:`FrameProtocol` reads frames into memory it
+hands straight to the caller, and frames go out as a scatter-gather
+``writelines`` of their parts.
 """
 
 from __future__ import annotations
 
+import asyncio
 import struct
+from collections.abc import Callable
 
 from zap import wire as _zw
 
@@ -30,6 +37,11 @@ VERSION = _zw.VERSION          # 1
 ALIGNMENT = _zw.ALIGNMENT      # 8
 MAX_MESSAGE_SIZE = 10 * 1024 * 1024  # 10 MB
 
+# Receive buffer shared by small frames; frames of at least
+# DIRECT_READ_THRESHOLD bytes are read into a buffer of their own instead.
+READ_BUFFER_SIZE = 256 * 1024
+DIRECT_READ_THRESHOLD = 64 * 1024
+
 # hanzo cloud-service schema (layered on the wire; not part of the codec).
 MSG_TYPE_CLOUD = 100
 
@@ -62,28 +74,41 @@ class Message:
     The object body is read with the canonical :class:`zap.wire.Object` (via the
     ``obj_*`` helpers below). This wrapper only exposes the 16-byte header fields
     in hanzo-zap's vocabulary (``msg_type``, ``root_offset``, ``total_size``).
+
+    The buffer is not copied: a ``Message`` is a ``memoryview`` over whatever it
+    was parsed from, so that buffer must not be modified while the message is
+    in use.
     """
 
     __slots__ = ("_data",)
 
-    def __init__(self, data: bytes | bytearray) -> None:
-        self._data = bytes(data)
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        self._data = data if isinstance(data, memoryview) else memoryview(data)
 
     @classmethod
-    def parse(cls, data: bytes | bytearray) -> "Message":
+    def parse(cls, data: bytes | bytearray | memoryview) -> "Message":
         if len(data) < HEADER_SIZE:
             raise ValueError(f"ZAP message too short: {len(data)} < {HEADER_SIZE}")
         if data[:4] != ZAP_MAGIC:
-            raise ValueError(f"Bad ZAP magic: {data[:4]!r}")
+            raise ValueError(f"Bad ZAP magic: {bytes(data[:4])!r}")
         ver = struct.unpack_from("<H", data, 4)[0]
         if ver != VERSION:
             raise ValueError(f"Unsupported ZAP version: {ver} (expected {VERSION})")
         return cls(data)
 
     @property
-    def bytes(self) -> bytes:
+    def view(self) -> memoryview:
+        """The message buffer, without copying."""
         return self._data
 
+    @property
+    def bytes(self) -> bytes:
+        """The message as ``bytes``; copies unless it was parsed from ``bytes``."""
+        data = self._data
+        if isinstance(data.obj, bytes) and len(data) == len(data.obj):
+            return data.obj
+        return data.tobytes()
+
     @property
     def version(self) -> int:
         return struct.unpack_from("<H", self._data, 4)[0]
@@ -105,22 +130,47 @@ class Message:
     def total_size(self) -> int:
         return struct.unpack_from("<I", self._data, 12)[0]
 
+    def root(self) -> _zw.Object:
+        """The root object, read in place."""
+        return _zw.Object(self._data, self.root_offset)
+
 
 # ── Object reader (delegates field decode to canonical zap.wire.Object) ──
 
-def obj_uint32(data: bytes, obj_offset: int, field_offset: int) -> int:
+def _view(data: bytes | memoryview) -> memoryview:
+    return data if isinstance(data, memoryview) else memoryview(data)
+
+
+def obj_uint32(data: bytes | memoryview, obj_offset: int, field_offset: int) -> int:
     """Read a u32 inline field from the object at ``obj_offset``."""
-    return _zw.Object(memoryview(data), obj_offset).uint32(field_offset)
+    return _zw.Object(_view(data), obj_offset).uint32(field_offset)
 
 
-def obj_bytes(data: bytes, obj_offset: int, field_offset: int) -> bytes:
+def obj_bytes(data: bytes | memoryview, obj_offset: int, field_offset: int) -> bytes:
     """Read a Bytes field (relOffset + length) from the object."""
-    return _zw.Object(memoryview(data), obj_offset).bytes(field_offset)
+    return _zw.Object(_view(data), obj_offset).bytes(field_offset)
 
 
-def obj_text(data: bytes, obj_offset: int, field_offset: int) -> str:
+def obj_text(data: bytes | memoryview, obj_offset: int, field_offset: int) -> str:
     """Read a Text field from the object."""
-    return _zw.Object(memoryview(data), obj_offset).text(field_offset)
+    return _zw.Object(_view(data), obj_offset).text(field_offset)
+
+
+def obj_bytes_view(obj: _zw.Object, data: memoryview, obj_offset: int, field_offset: int) -> memoryview:
+    """Read a Bytes field as a view into ``data`` instead of a copy.
+
+    :meth:`zap.wire.Object.bytes` always returns a copy. This reads the same
+    (relOffset, length) pointer through ``obj`` and applies the same rules: a
+    null pointer, a target inside the header, or one running past the buffer
+    reads as empty.
+    """
+    pos = obj_offset + field_offset
+    rel = obj.uint32(field_offset)
+    length = obj.uint32(field_offset + 4)
+    start = pos + rel
+    if rel == 0 or start < HEADER_SIZE or start + length > len(data):
+        return data[0:0]
+    return data[start:start + length]
 
 
 # ── Builder (delegates the codec to canonical zap.wire.Builder) ──────────
@@ -198,21 +248,26 @@ def build_cloud_response(status: int, body: bytes, error: str) -> bytes:
 
 def parse_cloud_request(msg: Message) -> tuple[str, str, bytes]:
     """Parse a cloud request → (method, auth, body)."""
-    data = msg.bytes
-    off = msg.root_offset
-    method = obj_text(data, off, CLOUD_REQ_METHOD)
-    auth = obj_text(data, off, CLOUD_REQ_AUTH)
-    body = obj_bytes(data, off, CLOUD_REQ_BODY)
+    obj = msg.root()
+    method = obj.text(CLOUD_REQ_METHOD)
+    auth = obj.text(CLOUD_REQ_AUTH)
+    body = obj.bytes(CLOUD_REQ_BODY)
     return method, auth, body
 
 
-def parse_cloud_response(msg: Message) -> tuple[int, bytes, str]:
-    """Parse a cloud response → (status, body, error)."""
-    data = msg.bytes
-    off = msg.root_offset
-    status = obj_uint32(data, off, CLOUD_RESP_STATUS)
-    body = obj_bytes(data, off, CLOUD_RESP_BODY)
-    error = obj_text(data, off, CLOUD_RESP_ERROR)
+def parse_cloud_response(msg: Message, *, view: bool = False) -> tuple[int, bytes | memoryview, str]:
+    """Parse a cloud response → (status, body, error).
+
+    With ``view=True`` the body is a ``memoryview`` into the message buffer
+    rather than a copy of it.
+    """
+    obj = msg.root()
+    status = obj.uint32(CLOUD_RESP_STATUS)
+    if view:
+        body: bytes | memoryview = obj_bytes_view(obj, msg.view, msg.root_offset, CLOUD_RESP_BODY)
+    else:
+        body = obj.bytes(CLOUD_RESP_BODY)
+    error = obj.text(CLOUD_RESP_ERROR)
     return status, body, error
 
 
@@ -232,16 +287,16 @@ def build_handshake(node_id: str) -> bytes:
 
 def parse_handshake(msg: Message) -> str:
     """Parse a handshake message → peer node ID."""
-    data = msg.bytes
+    data = msg.view
     off = msg.root_offset
-    id_len = obj_uint32(data, off, HANDSHAKE_ID_LEN_OFFSET)
+    id_len = msg.root().uint32(HANDSHAKE_ID_LEN_OFFSET)
     if id_len == 0:
         return ""
     start = off
     end = start + min(id_len, HANDSHAKE_ID_MAX)
     if end > len(data):
         return ""
-    return data[start:end].decode("utf-8", errors="replace")
+    return str(data[start:end], "utf-8", errors="replace")
 
 
 # ── Frame I/O ────────────────────────────────────────────────────────────
@@ -257,8 +312,149 @@ async def read_frame(reader) -> bytes:
     return await reader.readexactly(length)
 
 
-async def write_frame(writer, data: bytes) -> None:
+async def write_frame(writer, data: bytes | memoryview) -> None:
     """Write a length-prefixed frame."""
-    writer.write(struct.pack("<I", len(data)))
-    writer.write(data)
+    writer.writelines(frame_parts(data))
     await writer.drain()
+
+
+def frame_parts(*parts: bytes | memoryview) -> list[bytes | memoryview]:
+    """The buffers of one frame — length prefix, then ``parts`` — for ``writelines``.
+
+    Empty parts are left out: a zero-length buffer stalls some transports'
+    scatter-gather send.
+    """
+    size = sum(len(part) for part in parts)
+    return [struct.pack("<I", size), *(part for part in parts if part)]
+
+
+class FrameProtocol(asyncio.BufferedProtocol):
+    """Length-prefixed frame I/O on a transport, without intermediate copies.
+
+    The event loop reads straight into memory this protocol owns. Frames under
+    ``DIRECT_READ_THRESHOLD`` bytes are batched through one reusable receive
+    buffer and copied out once; larger frames get a buffer of their own that
+    the socket fills directly. Either way ``on_frame`` receives a ``memoryview``
+    it may keep — the memory behind it is never reused.
+
+    ``on_lost`` is called once with the error (``ConnectionResetError`` on a
+    clean EOF) when the connection goes away.
+    """
+
+    def __init__(
+        self,
+        on_frame: Callable[[memoryview], None] | None = None,
+        on_lost: Callable[[BaseException], None] | None = None,
+    ) -> None:
+        self.on_frame = on_frame
+        self.on_lost = on_lost
+        self.transport: asyncio.Transport | None = None
+        self._buf = memoryview(bytearray(READ_BUFFER_SIZE))
+        self._start = 0
+        self._end = 0
+        self._frame: memoryview | None = None  # large frame being filled in place
+        self._filled = 0
+        self._paused = False
+        self._drain_waiters: list[asyncio.Future[None]] = []
+        self._lost: BaseException | None = None
+        self._closed = asyncio.get_running_loop().create_future()
+
+    # -- receive --------------------------------------------------------------
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._frame is not None:
+            return self._frame[self._filled:]
+        if self._start and len(self._buf) - self._end < DIRECT_READ_THRESHOLD:
+            # Slide the partial frame to the front; it is under the threshold.
+            pending = self._end - self._start
+            self._buf[:pending] = self._buf[self._start:self._end]
+            self._start, self._end = 0, pending
+        return self._buf[self._end:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        if self._frame is not None:
+            self._filled += nbytes
+            if self._filled == len(self._frame):
+                frame, self._frame = self._frame, None
+                self._deliver(frame)
+            return
+
+        self._end += nbytes
+        buf = self._buf
+        while self._end - self._start >= 4:
+            length = struct.unpack_from("<I", buf, self._start)[0]
+            if length > MAX_MESSAGE_SIZE:
+                self._abort(ValueError(f"ZAP frame too large: {length}"))
+                return
+            begin = self._start + 4
+            have = self._end - begin
+            if have >= length:
+                self._start = begin + length
+                self._deliver(memoryview(buf[begin:self._start].tobytes()))
+            elif length >= DIRECT_READ_THRESHOLD:
+                frame = memoryview(bytearray(length))
+                frame[:have] = buf[begin:self._end]
+                self._frame, self._filled = frame, have
+                self._start = self._end = 0
+                return
+            else:
+                break
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def _deliver(self, frame: memoryview) -> None:
+        if self.on_frame is not None:
+            self.on_frame(frame)
+
+    def _abort(self, exc: BaseException) -> None:
+        self._lost = exc
+        assert self.transport is not None
+        self.transport.abort()
+
+    def eof_received(self) -> bool:
+        return False
+
+    def connection_lost(self, exc: BaseException | None) -> None:
+        if self._lost is None:
+            self._lost = exc or ConnectionResetError("ZAP connection closed by peer")
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_exception(ConnectionResetError("ZAP connection lost"))
+        self._drain_waiters.clear()
+        if not self._closed.done():
+            self._closed.set_result(None)
+        if self.on_lost is not None:
+            self.on_lost(self._lost)
+
+    # -- send -----------------------------------------------------------------
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._drain_waiters.clear()
+
+    def write_frame(self, *parts: bytes | memoryview) -> None:
+        """Send one frame made of ``parts``, which are not joined first."""
+        assert self.transport is not None
+        self.transport.writelines(frame_parts(*parts))
+
+    async def drain(self) -> None:
+        """Wait until the transport's send buffer is below its high-water mark."""
+        if self._lost is not None:
+            raise ConnectionResetError("ZAP connection lost") from self._lost
+        if not self._paused:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._drain_waiters.append(waiter)
+        await waiter
+
+    async def wait_closed(self) -> None:
+        await asyncio.shield(self._closed)
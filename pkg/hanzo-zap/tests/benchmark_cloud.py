@@ -0,0 +1,104 @@
+"""Throughput of `CloudClient` on one connection at 1/16/256 concurrent callers.
+
+Runs a local MsgType 100 echo server that answers each request from its own
+task after ``--latency-ms`` (standing in for the node's handler time), then
+drives ``--calls`` requests through a single `CloudClient` two ways:
+
+* serialized  — one call on the wire at a time (an ``asyncio.Lock`` around
+                ``call``), which is all the old read-until-my-id loop allowed;
+* multiplexed — every caller's request in flight together, replies routed
+                back by req_id.
+
+    python tests/benchmark_cloud.py [--calls 5000] [--latency-ms 1] [--body 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import struct
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hanzo_zap import CloudClient  # noqa: E402
+from hanzo_zap.wire import (  # noqa: E402
+    REQ_FLAG_RESP,
+    Message,
+    build_cloud_response,
+    build_handshake,
+    parse_cloud_request,
+    read_frame,
+    write_frame,
+)
+
+
+async def serve(latency: float) -> asyncio.Server:
+    async def answer(writer: asyncio.StreamWriter, req_id: int, msg: bytes) -> None:
+        _, _, body = parse_cloud_request(Message.parse(msg))
+        if latency:
+            await asyncio.sleep(latency)
+        frame = struct.pack("<II", req_id, REQ_FLAG_RESP) + build_cloud_response(200, body, "")
+        writer.write(struct.pack("<I", len(frame)) + frame)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await read_frame(reader)
+            await write_frame(writer, build_handshake("bench"))
+            while True:
+                data = await read_frame(reader)
+                req_id = struct.unpack_from("<I", data, 0)[0]
+                asyncio.ensure_future(answer(writer, req_id, data[8:]))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def run(client: CloudClient, callers: int, calls: int, body: bytes, serialized: bool) -> float:
+    lock = asyncio.Lock()
+    remaining = calls
+
+    async def caller() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            if serialized:
+                async with lock:
+                    await client.call("bench.echo", "", body)
+            else:
+                await client.call("bench.echo", "", body)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(callers)))
+    return calls / (time.perf_counter() - t0)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--body", type=int, default=256, help="request body bytes")
+    args = parser.parse_args()
+
+    server = await serve(args.latency_ms / 1000)
+    port = server.sockets[0].getsockname()[1]
+    body = b"x" * args.body
+    print(f"{args.calls} calls, {args.body} B bodies, {args.latency_ms} ms server latency, one connection")
+    print(f"{'callers':>8}{'serialized':>16}{'multiplexed':>16}")
+    try:
+        async with await CloudClient.connect(f"127.0.0.1:{port}") as client:
+            await run(client, 16, 200, body, serialized=False)  # warm up
+            for callers in (1, 16, 256):
+                serial = await run(client, callers, args.calls, body, serialized=True)
+                multi = await run(client, callers, args.calls, body, serialized=False)
+                print(f"{callers:>8}{serial:>12.0f} r/s{multi:>12.0f} r/s")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
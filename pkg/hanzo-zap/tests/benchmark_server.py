@@ -0,0 +1,98 @@
+"""Throughput of `ZapServer` tool dispatch on one connection, serial vs concurrent.
+
+Serves an async ``work`` tool that takes ``--latency-ms`` and drives ``--calls``
+calls from ``--callers`` concurrent tasks over a single `ZapClient`:
+
+* serial     — ``max_in_flight=1``: one call runs at a time, which is what the
+               old read-handle-reply loop allowed;
+* concurrent — the default bound: calls run side by side and their replies
+               come back tagged with their ids.
+
+Then the same calls as batches of ``--batch`` go out as one BATCH message each,
+against the old client-side loop of one awaited call after another.
+
+    python tests/benchmark_server.py [--calls 2000] [--callers 64] [--latency-ms 2] [--batch 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hanzo_zap import ZapClient, ZapServer  # noqa: E402
+from hanzo_zap.server import DEFAULT_MAX_IN_FLIGHT  # noqa: E402
+
+
+async def serve(latency: float, max_in_flight: int) -> tuple[ZapServer, int]:
+    server = ZapServer("bench", "0", max_in_flight=max_in_flight)
+
+    @server.tool("work", "Stand-in for a tool that waits on I/O")
+    async def work(name, args):
+        await asyncio.sleep(latency)
+        return args["n"]
+
+    await server.start(0, "127.0.0.1")
+    assert server._server is not None
+    return server, server._server.sockets[0].getsockname()[1]
+
+
+async def drive(client: ZapClient, callers: int, calls: int) -> float:
+    remaining = calls
+
+    async def caller() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await client.call_tool("work", {"n": remaining})
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(callers)))
+    return calls / (time.perf_counter() - t0)
+
+
+async def drive_batches(client: ZapClient, calls: int, size: int, looped: bool) -> float:
+    batch = [{"name": "work", "args": {"n": i}} for i in range(size)]
+    t0 = time.perf_counter()
+    for _ in range(calls // size):
+        if looped:
+            for call in batch:
+                await client.call_tool(call["name"], call["args"])
+        else:
+            await client.batch(batch)
+    return (calls // size) * size / (time.perf_counter() - t0)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--callers", type=int, default=64)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--batch", type=int, default=16)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    print(f"{args.calls} calls, {args.latency_ms} ms per tool call, one connection")
+    results = {}
+    for label, bound in (("serial", 1), ("concurrent", DEFAULT_MAX_IN_FLIGHT)):
+        server, port = await serve(latency, bound)
+        try:
+            async with await ZapClient.connect(f"zap://127.0.0.1:{port}") as client:
+                await drive(client, args.callers, 100)  # warm up
+                results[label] = await drive(client, args.callers, args.calls)
+                if label == "concurrent":
+                    looped = await drive_batches(client, args.calls // 4, args.batch, looped=True)
+                    batched = await drive_batches(client, args.calls, args.batch, looped=False)
+        finally:
+            await server.stop()
+
+    print(f"{args.callers} callers  serial {results['serial']:>8.0f} r/s   concurrent {results['concurrent']:>8.0f} r/s")
+    print(f"batches of {args.batch}  looped {looped:>8.0f} r/s   BATCH      {batched:>8.0f} r/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
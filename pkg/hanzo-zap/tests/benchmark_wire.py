@@ -0,0 +1,138 @@
+"""Receive cost of large ZAP cloud responses: latency and bytes copied per MB.
+
+A local server answers every request with a ``--size-mb`` response body. The
+client receives it two ways:
+
+* streams — ``asyncio.StreamReader`` + ``read_frame``, then what ``call`` did
+            before: slice off the Call header, copy into ``Message``, copy
+            the body out with ``obj_bytes``;
+* views   — `CloudClient.call(view=True)`: the frame is read straight into its
+            own buffer by `FrameProtocol` and the body is a view into it.
+
+"Copied" is the memory Python allocated while receiving one response, in
+multiples of the body (tracemalloc peak, measured in a separate pass so it
+does not skew latency). The server sends without copying, so 1.0x is the one
+unavoidable copy out of the socket.
+
+    python tests/benchmark_wire.py [--size-mb 1 4 8] [--runs 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import struct
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hanzo_zap import CloudClient  # noqa: E402
+from hanzo_zap.wire import (  # noqa: E402
+    CLOUD_RESP_BODY,
+    REQ_FLAG_REQ,
+    REQ_FLAG_RESP,
+    Message,
+    build_cloud_request,
+    build_cloud_response,
+    build_handshake,
+    frame_parts,
+    obj_bytes,
+    read_frame,
+    write_frame,
+)
+
+
+async def serve(body: bytes) -> asyncio.Server:
+    response = build_cloud_response(200, body, "")
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await read_frame(reader)
+            await write_frame(writer, build_handshake("bench"))
+            while True:
+                data = await read_frame(reader)
+                req_id = struct.unpack_from("<I", data, 0)[0]
+                writer.writelines(frame_parts(struct.pack("<II", req_id, REQ_FLAG_RESP), response))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def stream_client(port: int):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port, limit=1 << 24)
+    await write_frame(writer, build_handshake("bench"))
+    await read_frame(reader)
+    request = struct.pack("<II", 1, REQ_FLAG_REQ) + build_cloud_request("bench", "", b"")
+
+    async def call() -> bytes:
+        await write_frame(writer, request)
+        data = await read_frame(reader)
+        msg = Message.parse(bytes(data[8:]))  # the Call-header slice and Message copy
+        return obj_bytes(msg.bytes, msg.root_offset, CLOUD_RESP_BODY)
+
+    return call, writer.close
+
+
+async def view_client(port: int):
+    client = await CloudClient.connect(f"127.0.0.1:{port}")
+
+    async def call() -> memoryview:
+        _, body, _ = await client.call("bench", "", b"", view=True)
+        return body
+
+    return call, client.close
+
+
+async def measure(call, runs: int) -> tuple[float, float]:
+    await call()  # warm up
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        await call()
+    latency = (time.perf_counter() - t0) / runs
+
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(3):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            body = await call()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+            del body
+    finally:
+        tracemalloc.stop()
+    return latency, peak
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'body':>6}{'path':>9}{'ms/MB':>10}{'copied/MB':>12}")
+    for size_mb in args.size_mb:
+        size = int(size_mb * 1024 * 1024)
+        server = await serve(b"x" * size)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            for label, connect in (("streams", stream_client), ("views", view_client)):
+                call, close = await connect(port)
+                latency, copied = await measure(call, args.runs)
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+                mb = size / (1024 * 1024)
+                print(f"{size_mb:>5g}M{label:>9}{latency * 1000 / mb:>10.2f}{copied / size:>11.1f}x")
+        finally:
+            server.close()
+            await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
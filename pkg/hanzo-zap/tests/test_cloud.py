@@ -0,0 +1,207 @@
+"""CloudClient tests against a local MsgType 100 stand-in server.
+
+The stand-in speaks the same framing as the Rust node: handshake, then
+``[req_id:u32][flag:u32][ZAP message]`` frames. Each request is answered from
+its own task after a per-method delay, so replies come back out of order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+
+import pytest
+import pytest_asyncio
+
+from hanzo_zap import CloudClient
+from hanzo_zap.wire import (
+    REQ_FLAG_REQ,
+    REQ_FLAG_RESP,
+    Message,
+    build_cloud_response,
+    build_handshake,
+    parse_cloud_request,
+    parse_handshake,
+    read_frame,
+    write_frame,
+)
+
+
+class CloudStandIn:
+    """Echo server: ``sleep.<ms>`` waits that long, ``drop`` never answers."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+        self._writers: list[asyncio.StreamWriter] = []
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        for writer in self._writers:
+            writer.close()
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    def disconnect_all(self) -> None:
+        for writer in self._writers:
+            writer.transport.abort()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.append(writer)
+        try:
+            Message.parse(await read_frame(reader))
+            await write_frame(writer, build_handshake("stand-in"))
+            while True:
+                data = await read_frame(reader)
+                self.requests += 1
+                req_id, flag = struct.unpack_from("<II", data, 0)
+                assert flag == REQ_FLAG_REQ
+                asyncio.ensure_future(self._answer(writer, req_id, data[8:]))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    async def _answer(self, writer: asyncio.StreamWriter, req_id: int, msg: bytes) -> None:
+        method, auth, body = parse_cloud_request(Message.parse(msg))
+        if method == "drop":
+            return
+        if method.startswith("sleep."):
+            await asyncio.sleep(int(method.split(".")[1]) / 1000)
+        reply = json.dumps({"method": method, "auth": auth, "body": body.decode()}).encode()
+        frame = struct.pack("<II", req_id, REQ_FLAG_RESP) + build_cloud_response(200, reply, "")
+        if not writer.is_closing():
+            await write_frame(writer, frame)
+
+
+@pytest_asyncio.fixture
+async def stand_in():
+    server = CloudStandIn()
+    endpoint = await server.start()
+    server.endpoint = endpoint  # type: ignore[attr-defined]
+    yield server
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_call_roundtrip(stand_in):
+    async with await CloudClient.connect(stand_in.endpoint) as client:
+        assert client.peer_id == "stand-in"
+        status, body, error = await client.call("models", "Bearer t", b"{}")
+    assert status == 200 and error == ""
+    assert json.loads(body) == {"method": "models", "auth": "Bearer t", "body": "{}"}
+
+
+@pytest.mark.asyncio
+async def test_deprecated_stream_constructor(stand_in):
+    host, port = stand_in.endpoint.rsplit(":", 1)
+    reader, writer = await asyncio.open_connection(host, int(port))
+    await write_frame(writer, build_handshake("old-caller"))
+    peer_id = parse_handshake(Message.parse(await read_frame(reader)))
+
+    with pytest.warns(DeprecationWarning, match="reader, writer, peer_id"):
+        client = CloudClient(reader, writer, peer_id, timeout=5)
+    async with client:
+        assert client.peer_id == "stand-in"
+        status, body, _ = await client.call("models", "", b"{}")
+    assert status == 200 and json.loads(body)["method"] == "models"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_complete_out_of_order(stand_in):
+    """A slow call does not hold up faster ones sent after it."""
+    async with await CloudClient.connect(stand_in.endpoint) as client:
+        finished: list[str] = []
+
+        async def call(method: str, body: bytes) -> bytes:
+            _, reply, _ = await client.call(method, "", body)
+            finished.append(method)
+            return reply
+
+        replies = await asyncio.gather(
+            call("sleep.200", b"slow"),
+            *(call("sleep.0", str(i).encode()) for i in range(50)),
+        )
+        assert client.in_flight == 0
+
+    assert finished[-1] == "sleep.200"
+    assert [json.loads(r)["body"] for r in replies] == ["slow"] + [str(i) for i in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_timeout_discards_the_late_reply(stand_in):
+    async with await CloudClient.connect(stand_in.endpoint) as client:
+        with pytest.raises(asyncio.TimeoutError):
+            await client.call("sleep.200", "", b"late", timeout=0.02)
+        assert client.in_flight == 0
+        # The late reply arrives while this call is waiting and is dropped.
+        _, reply, _ = await client.call("sleep.300", "", b"next")
+    assert json.loads(reply)["body"] == "next"
+
+
+@pytest.mark.asyncio
+async def test_default_timeout_from_connect(stand_in):
+    async with await CloudClient.connect(stand_in.endpoint, timeout=0.02) as client:
+        with pytest.raises(asyncio.TimeoutError):
+            await client.call("drop", "", b"")
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_leaves_the_connection_usable(stand_in):
+    async with await CloudClient.connect(stand_in.endpoint) as client:
+        task = asyncio.ensure_future(client.call("sleep.100", "", b"x"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert client.in_flight == 0
+        status, _, _ = await client.call("models", "", b"")
+    assert status == 200
+
+
+@pytest.mark.asyncio
+async def test_connection_loss_fails_every_pending_call(stand_in):
+    client = await CloudClient.connect(stand_in.endpoint)
+    try:
+        calls = [asyncio.ensure_future(client.call("drop", "", b"")) for _ in range(5)]
+        while stand_in.requests < 5:
+            await asyncio.sleep(0.01)
+        stand_in.disconnect_all()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        assert all(isinstance(r, ConnectionError) for r in results)
+        with pytest.raises(ConnectionError):
+            await client.call("models", "", b"")
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_frames_queued_together_are_written_together(stand_in, monkeypatch):
+    async with await CloudClient.connect(stand_in.endpoint) as client:
+        batches: list[int] = []
+        transport = client._protocol.transport
+        writelines = transport.writelines
+
+        def counting(data):
+            data = list(data)
+            batches.append(sum(len(part) == 4 for part in data))
+            writelines(data)
+
+        monkeypatch.setattr(transport, "writelines", counting)
+        await asyncio.gather(*(client.call("models", "", b"") for _ in range(20)))
+
+    assert sum(batches) == 20
+    assert max(batches) > 1
+
+
+@pytest.mark.asyncio
+async def test_large_body_as_a_view(stand_in):
+    body = b"z" * (3 * 1024 * 1024)
+    async with await CloudClient.connect(stand_in.endpoint) as client:
+        status, reply, _ = await client.call("echo", "", body, view=True)
+    assert status == 200 and isinstance(reply, memoryview)
+    assert json.loads(reply.tobytes())["body"] == body.decode()
@@ -18,6 +18,8 @@ from hanzo_zap.wire import (
     CLOUD_RESP_BODY,
     CLOUD_RESP_ERROR,
     MAX_MESSAGE_SIZE,
+    DIRECT_READ_THRESHOLD,
+    FrameProtocol,
     Message,
     Builder,
     ObjectBuilder,
@@ -30,6 +32,7 @@ from hanzo_zap.wire import (
     obj_uint32,
     obj_bytes,
     obj_text,
+    frame_parts,
     read_frame,
     write_frame,
 )
@@ -253,6 +256,29 @@ def test_cloud_response_with_body_and_error():
     assert error == "bad request"
 
 
+def test_message_is_a_view_not_a_copy():
+    buf = bytearray(build_cloud_response(200, b"abc", ""))
+    msg = Message.parse(buf)
+    assert msg.view.obj is buf
+    buf[-1] ^= 0xFF
+    assert msg.view[-1] == buf[-1]
+
+    frame = build_cloud_response(200, b"abc", "")
+    assert Message.parse(frame).bytes is frame
+
+
+def test_cloud_response_body_as_view():
+    body = b"x" * 1000
+    buf = bytearray(build_cloud_response(200, body, "oops"))
+    status, view, error = parse_cloud_response(Message.parse(memoryview(buf)), view=True)
+    assert (status, error) == (200, "oops")
+    assert isinstance(view, memoryview) and view.obj is buf
+    assert view == body
+
+    _, empty, _ = parse_cloud_response(Message.parse(build_cloud_response(204, b"", "")), view=True)
+    assert empty == b""
+
+
 # ── Frame I/O helpers ─────────────────────────────────────────────────────
 
 async def _make_stream_pair():
@@ -338,3 +364,84 @@ async def test_full_message_through_frames():
         assert peer == "frame-test-node"
     finally:
         await cleanup()
+
+
+# ── FrameProtocol ─────────────────────────────────────────────────────────
+
+class _Transport:
+    def __init__(self) -> None:
+        self.aborted = False
+
+    def abort(self) -> None:
+        self.aborted = True
+
+
+def _feed(protocol: FrameProtocol, data: bytes, chunk: int) -> None:
+    """Drive the protocol the way the event loop does, ``chunk`` bytes per read."""
+    pos = 0
+    while pos < len(data):
+        buf = protocol.get_buffer(-1)
+        n = min(chunk, len(buf), len(data) - pos)
+        buf[:n] = data[pos:pos + n]
+        protocol.buffer_updated(n)
+        pos += n
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk", [1, 7, 4096, 1 << 20])
+async def test_frame_protocol_reassembles_frames(chunk):
+    frames = [b"", b"a" * 10, b"b" * (DIRECT_READ_THRESHOLD + 3), b"c" * 5, b"d" * 300_000, b"e"]
+    wire = b"".join(b"".join(frame_parts(f)) for f in frames)
+    received: list[memoryview] = []
+    protocol = FrameProtocol(received.append)
+    protocol.connection_made(_Transport())
+
+    _feed(protocol, wire, chunk)
+
+    assert [bytes(f) for f in received] == frames
+
+
+@pytest.mark.asyncio
+async def test_frame_protocol_frames_outlive_the_receive_buffer():
+    received: list[memoryview] = []
+    protocol = FrameProtocol(received.append)
+    protocol.connection_made(_Transport())
+    small = [bytes([i % 256]) * 1000 for i in range(600)]  # more than one buffer's worth
+
+    _feed(protocol, b"".join(b"".join(frame_parts(f)) for f in small), 65536)
+
+    assert [bytes(f) for f in received] == small
+
+
+@pytest.mark.asyncio
+async def test_frame_protocol_rejects_oversized():
+    lost: list[BaseException] = []
+    protocol = FrameProtocol(None, None)
+    transport = _Transport()
+    protocol.connection_made(transport)
+    _feed(protocol, struct.pack("<I", MAX_MESSAGE_SIZE + 1), 4)
+    assert transport.aborted
+
+    protocol.on_lost = lost.append
+    protocol.connection_lost(None)
+    assert isinstance(lost[0], ValueError) and "too large" in str(lost[0])
+
+
+@pytest.mark.asyncio
+async def test_frame_protocol_over_a_socket():
+    received: asyncio.Queue[memoryview] = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: FrameProtocol(received.put_nowait), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    _, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        big = bytes(range(256)) * 8192  # 2 MB
+        await write_frame(writer, b"hello")
+        await write_frame(writer, big)
+        assert bytes(await received.get()) == b"hello"
+        assert await received.get() == big
+    finally:
+        writer.close()
+        await writer.wait_closed()
+        server.close()
+        await server.wait_closed()
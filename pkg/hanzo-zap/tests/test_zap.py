@@ -7,6 +7,8 @@ and full client-server integration over TCP.
 import asyncio
 import json
 import struct
+import threading
+import time
 
 import pytest
 import pytest_asyncio
@@ -37,6 +39,8 @@ class TestMessageType:
         assert MessageType.LIST_TOOLS_RESPONSE == 0x11
         assert MessageType.CALL_TOOL == 0x12
         assert MessageType.CALL_TOOL_RESPONSE == 0x13
+        assert MessageType.BATCH == 0x14
+        assert MessageType.BATCH_RESPONSE == 0x15
 
     def test_resources(self):
         assert MessageType.LIST_RESOURCES == 0x20
@@ -525,3 +529,172 @@ class TestIntegration:
         result = await client.call_tool("greet", {})
         assert result.content == "Hello, world!"
         await client.close()
+
+
+# -- concurrent dispatch -------------------------------------------------------
+
+@pytest_asyncio.fixture
+async def concurrent_fixture():
+    server = ZapServer(name="concurrent", version="0.1.0", max_in_flight=4)
+    state = {"running": 0, "peak": 0}
+
+    @server.tool("sleep", "Sleep for args['ms'] milliseconds")
+    async def sleep(tool_name, args):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        try:
+            await asyncio.sleep(args["ms"] / 1000)
+        finally:
+            state["running"] -= 1
+        return args["ms"]
+
+    @server.tool("blocking", "Block a thread for args['ms'] milliseconds")
+    def blocking(tool_name, args):
+        time.sleep(args["ms"] / 1000)
+        return threading.current_thread().name
+
+    @server.tool("unserializable", "Return a result JSON can't encode")
+    async def unserializable(tool_name, args):
+        await asyncio.sleep(args.get("ms", 0) / 1000)
+        return object()
+
+    port = await _free_port()
+    await server.start(port, "127.0.0.1")
+    client = await ZapClient.connect(f"zap://127.0.0.1:{port}")
+    yield client, state
+    await client.close()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+class TestConcurrentDispatch:
+
+    async def test_advertises_batch(self, concurrent_fixture):
+        client, _ = concurrent_fixture
+        assert client.server_info.capabilities["batch"] is True
+
+    async def test_responses_complete_out_of_order(self, concurrent_fixture):
+        client, _ = concurrent_fixture
+        finished = []
+
+        async def call(ms):
+            result = await client.call_tool("sleep", {"ms": ms})
+            finished.append(result.content)
+            return result
+
+        results = await asyncio.gather(call(60), call(30), call(1))
+        assert [r.content for r in results] == [60, 30, 1]
+        assert finished == [1, 30, 60]
+        assert len({r.id for r in results}) == 3
+
+    async def test_slow_tool_does_not_block_others(self, concurrent_fixture):
+        client, _ = concurrent_fixture
+        slow = asyncio.ensure_future(client.call_tool("sleep", {"ms": 300}))
+        await asyncio.sleep(0.01)
+        t0 = time.perf_counter()
+        await client.call_tool("sleep", {"ms": 1})
+        await client.ping()
+        assert time.perf_counter() - t0 < 0.2
+        assert not slow.done()
+        assert (await slow).content == 300
+
+    async def test_in_flight_is_bounded(self, concurrent_fixture):
+        client, state = concurrent_fixture
+        results = await asyncio.gather(
+            *(client.call_tool("sleep", {"ms": 20}) for _ in range(12))
+        )
+        assert all(r.content == 20 for r in results)
+        assert state["peak"] == 4
+
+    async def test_batch_runs_concurrently(self, concurrent_fixture):
+        client, state = concurrent_fixture
+        t0 = time.perf_counter()
+        results = await client.batch([{"name": "sleep", "args": {"ms": 50}} for _ in range(4)])
+        elapsed = time.perf_counter() - t0
+        assert [r.content for r in results] == [50] * 4
+        assert state["peak"] == 4
+        assert elapsed < 0.15
+
+    async def test_batch_keeps_call_order_and_errors(self, concurrent_fixture):
+        client, _ = concurrent_fixture
+        results = await client.batch([
+            {"name": "sleep", "args": {"ms": 30}},
+            {"name": "missing", "args": {}},
+            {"name": "sleep", "args": {"ms": 1}},
+        ])
+        assert results[0].content == 30
+        assert "Unknown tool" in results[1].error
+        assert results[2].content == 1
+        assert results[0].id != results[2].id
+
+    async def test_sync_handlers_run_on_worker_threads(self, concurrent_fixture):
+        client, _ = concurrent_fixture
+        t0 = time.perf_counter()
+        results = await asyncio.gather(
+            *(client.call_tool("blocking", {"ms": 50}) for _ in range(4)),
+            client.ping(),
+        )
+        assert time.perf_counter() - t0 < 0.15
+        assert all(r.content.startswith("zap-tool") for r in results[:4])
+
+    async def test_pending_calls_fail_on_close(self):
+        server = ZapServer(name="s", version="1")
+
+        @server.tool("hang", "Never returns")
+        async def hang(tool_name, args):
+            await asyncio.Event().wait()
+
+        port = await _free_port()
+        await server.start(port, "127.0.0.1")
+        client = await ZapClient.connect(f"zap://127.0.0.1:{port}")
+        pending = asyncio.ensure_future(client.call_tool("hang", {}))
+        await asyncio.sleep(0.02)
+        await client.close()
+        with pytest.raises(ConnectionError):
+            await pending
+        with pytest.raises(ConnectionError):
+            await client.ping()
+        await server.stop()
+
+    async def test_unserializable_result_fails_only_its_call(self, concurrent_fixture):
+        client, _ = concurrent_fixture
+        # Without an error reply the callers would wait forever
+        bad, good, late_bad = await asyncio.wait_for(
+            asyncio.gather(
+                client.call_tool("unserializable", {"ms": 30}),
+                client.call_tool("sleep", {"ms": 10}),
+                client.batch([{"name": "unserializable", "args": {}}]),
+                return_exceptions=True,
+            ),
+            timeout=2,
+        )
+        assert isinstance(bad, RuntimeError) and "serializable" in str(bad)
+        assert isinstance(late_bad, RuntimeError)
+        assert good.content == 10
+        # The connection is still usable
+        await client.ping()
+        assert (await client.call_tool("sleep", {"ms": 1})).content == 1
+
+    async def test_batches_in_flight_are_bounded(self):
+        server = ZapServer(name="s", version="1", max_batches=2)
+        state = {"running": 0, "peak": 0}
+
+        @server.tool("sleep", "Sleep")
+        async def sleep(tool_name, args):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            try:
+                await asyncio.sleep(0.02)
+            finally:
+                state["running"] -= 1
+
+        port = await _free_port()
+        await server.start(port, "127.0.0.1")
+        client = await ZapClient.connect(f"zap://127.0.0.1:{port}")
+        results = await asyncio.gather(
+            *(client.batch([{"name": "sleep", "args": {}}]) for _ in range(6))
+        )
+        assert all(r[0].error is None for r in results)
+        assert state["peak"] == 2
+        await client.close()
+        await server.stop()
@@ -34,6 +34,7 @@ except PackageNotFoundError:  # source tree, not installed
 try:
     from . import zap as zap
     from .zap import (
+        ZapPool as ZapPool,
         ZapTransport as ZapTransport,
         AsyncZapTransport as AsyncZapTransport,
         zap_http_client as zap_http_client,
@@ -60,4 +61,17 @@ except ImportError:  # pragma: no cover - hanzoai[zap] not installed
 # service and which document a symbol came from.
 from . import cloud as cloud
 
+# Hand-written companions of the generated client. They live beside it rather
+# than in it because `hanzoai.cloud` is replaced wholesale on every
+# regeneration. Like the ZAP names above, additive and NOT part of the locked
+# `__all__`.
+from .cloud_async import AsyncApi as AsyncApi, AsyncApiClient as AsyncApiClient
+from .cloud_decode import CompiledApiClient as CompiledApiClient
+from .cloud_pagination import (
+    afetch_many as afetch_many,
+    apaginate as apaginate,
+    fetch_many as fetch_many,
+    paginate as paginate,
+)
+
 __all__ = ["cloud", "__version__"]
@@ -1,121 +1,379 @@
 # flake8: noqa
 
-# import apis into api package
-from hanzoai.cloud.api.account_api import AccountApi
-from hanzoai.cloud.api.ad_api import AdApi
-from hanzoai.cloud.api.affiliate_api import AffiliateApi
-from hanzoai.cloud.api.agents_api import AgentsApi
-from hanzoai.cloud.api.ai_api import AiApi
-from hanzoai.cloud.api.allowance_api import AllowanceApi
-from hanzoai.cloud.api.ask_api import AskApi
-from hanzoai.cloud.api.audit_api import AuditApi
-from hanzoai.cloud.api.author_api import AuthorApi
-from hanzoai.cloud.api.authz_api import AuthzApi
-from hanzoai.cloud.api.auto_api import AutoApi
-from hanzoai.cloud.api.base_api import BaseApi
-from hanzoai.cloud.api.benchmark_api import BenchmarkApi
-from hanzoai.cloud.api.billing_api import BillingApi
-from hanzoai.cloud.api.blueprint_api import BlueprintApi
-from hanzoai.cloud.api.books_api import BooksApi
-from hanzoai.cloud.api.bot_api import BotApi
-from hanzoai.cloud.api.campaign_api import CampaignApi
-from hanzoai.cloud.api.captable_api import CaptableApi
-from hanzoai.cloud.api.catalog_api import CatalogApi
-from hanzoai.cloud.api.channels_api import ChannelsApi
-from hanzoai.cloud.api.cloudflare_api import CloudflareApi
-from hanzoai.cloud.api.code_api import CodeApi
-from hanzoai.cloud.api.commerce_api import CommerceApi
-from hanzoai.cloud.api.company_api import CompanyApi
-from hanzoai.cloud.api.compliance_api import ComplianceApi
-from hanzoai.cloud.api.content_api import ContentApi
-from hanzoai.cloud.api.crawl_api import CrawlApi
-from hanzoai.cloud.api.crm_api import CrmApi
-from hanzoai.cloud.api.dataroom_api import DataroomApi
-from hanzoai.cloud.api.dataset_api import DatasetApi
-from hanzoai.cloud.api.deploy_api import DeployApi
-from hanzoai.cloud.api.destination_api import DestinationApi
-from hanzoai.cloud.api.domain_api import DomainApi
-from hanzoai.cloud.api.engine_api import EngineApi
-from hanzoai.cloud.api.entitlement_api import EntitlementApi
-from hanzoai.cloud.api.esign_api import EsignApi
-from hanzoai.cloud.api.eval_api import EvalApi
-from hanzoai.cloud.api.event_api import EventApi
-from hanzoai.cloud.api.exec_api import ExecApi
-from hanzoai.cloud.api.experiment_api import ExperimentApi
-from hanzoai.cloud.api.explorer_api import ExplorerApi
-from hanzoai.cloud.api.flags_api import FlagsApi
-from hanzoai.cloud.api.flow_api import FlowApi
-from hanzoai.cloud.api.framework_api import FrameworkApi
-from hanzoai.cloud.api.functions_api import FunctionsApi
-from hanzoai.cloud.api.gateway_api import GatewayApi
-from hanzoai.cloud.api.git_api import GitApi
-from hanzoai.cloud.api.graph_api import GraphApi
-from hanzoai.cloud.api.guide_api import GuideApi
-from hanzoai.cloud.api.help_api import HelpApi
-from hanzoai.cloud.api.iam_api import IamApi
-from hanzoai.cloud.api.index_api import IndexApi
-from hanzoai.cloud.api.ingress_api import IngressApi
-from hanzoai.cloud.api.integrations_api import IntegrationsApi
-from hanzoai.cloud.api.kms_api import KmsApi
-from hanzoai.cloud.api.knowledge_api import KnowledgeApi
-from hanzoai.cloud.api.kv_api import KvApi
-from hanzoai.cloud.api.label_api import LabelApi
-from hanzoai.cloud.api.leaderboard_api import LeaderboardApi
-from hanzoai.cloud.api.legal_api import LegalApi
-from hanzoai.cloud.api.licensing_api import LicensingApi
-from hanzoai.cloud.api.link_api import LinkApi
-from hanzoai.cloud.api.lsp_api import LspApi
-from hanzoai.cloud.api.marketing_api import MarketingApi
-from hanzoai.cloud.api.marketplace_api import MarketplaceApi
-from hanzoai.cloud.api.meet_api import MeetApi
-from hanzoai.cloud.api.metrics_api import MetricsApi
-from hanzoai.cloud.api.ml_api import MlApi
-from hanzoai.cloud.api.mq_api import MqApi
-from hanzoai.cloud.api.network_api import NetworkApi
-from hanzoai.cloud.api.node_api import NodeApi
-from hanzoai.cloud.api.notify_api import NotifyApi
-from hanzoai.cloud.api.o11y_api import O11yApi
-from hanzoai.cloud.api.openapi_api import OpenapiApi
-from hanzoai.cloud.api.plan_api import PlanApi
-from hanzoai.cloud.api.platform_api import PlatformApi
-from hanzoai.cloud.api.pref_api import PrefApi
-from hanzoai.cloud.api.pricing_api import PricingApi
-from hanzoai.cloud.api.projects_api import ProjectsApi
-from hanzoai.cloud.api.prompt_api import PromptApi
-from hanzoai.cloud.api.provisioning_api import ProvisioningApi
-from hanzoai.cloud.api.pubsub_api import PubsubApi
-from hanzoai.cloud.api.reference_api import ReferenceApi
-from hanzoai.cloud.api.referral_api import ReferralApi
-from hanzoai.cloud.api.registry_api import RegistryApi
-from hanzoai.cloud.api.risk_api import RiskApi
-from hanzoai.cloud.api.s3_api import S3Api
-from hanzoai.cloud.api.sandbox_api import SandboxApi
-from hanzoai.cloud.api.sbom_api import SbomApi
-from hanzoai.cloud.api.search_api import SearchApi
-from hanzoai.cloud.api.security_api import SecurityApi
-from hanzoai.cloud.api.seo_api import SeoApi
-from hanzoai.cloud.api.settings_api import SettingsApi
-from hanzoai.cloud.api.share_api import ShareApi
-from hanzoai.cloud.api.social_api import SocialApi
-from hanzoai.cloud.api.standing_api import StandingApi
-from hanzoai.cloud.api.sync_api import SyncApi
-from hanzoai.cloud.api.tasks_api import TasksApi
-from hanzoai.cloud.api.taxonomy_api import TaxonomyApi
-from hanzoai.cloud.api.team_api import TeamApi
-from hanzoai.cloud.api.tel_api import TelApi
-from hanzoai.cloud.api.template_api import TemplateApi
-from hanzoai.cloud.api.todo_api import TodoApi
-from hanzoai.cloud.api.tools_api import ToolsApi
-from hanzoai.cloud.api.translate_api import TranslateApi
-from hanzoai.cloud.api.treasury_api import TreasuryApi
-from hanzoai.cloud.api.trust_api import TrustApi
-from hanzoai.cloud.api.usage_api import UsageApi
-from hanzoai.cloud.api.validator_api import ValidatorApi
-from hanzoai.cloud.api.visor_api import VisorApi
-from hanzoai.cloud.api.wallet_api import WalletApi
-from hanzoai.cloud.api.web3_api import Web3Api
-from hanzoai.cloud.api.webhook_api import WebhookApi
-from hanzoai.cloud.api.websearch_api import WebsearchApi
-from hanzoai.cloud.api.world_api import WorldApi
-from hanzoai.cloud.api.x402_api import X402Api
+import importlib
+from typing import TYPE_CHECKING
 
+__all__ = [
+    "AccountApi",
+    "AdApi",
+    "AffiliateApi",
+    "AgentsApi",
+    "AiApi",
+    "AllowanceApi",
+    "AskApi",
+    "AuditApi",
+    "AuthorApi",
+    "AuthzApi",
+    "AutoApi",
+    "BaseApi",
+    "BenchmarkApi",
+    "BillingApi",
+    "BlueprintApi",
+    "BooksApi",
+    "BotApi",
+    "CampaignApi",
+    "CaptableApi",
+    "CatalogApi",
+    "ChannelsApi",
+    "CloudflareApi",
+    "CodeApi",
+    "CommerceApi",
+    "CompanyApi",
+    "ComplianceApi",
+    "ContentApi",
+    "CrawlApi",
+    "CrmApi",
+    "DataroomApi",
+    "DatasetApi",
+    "DeployApi",
+    "DestinationApi",
+    "DomainApi",
+    "EngineApi",
+    "EntitlementApi",
+    "EsignApi",
+    "EvalApi",
+    "EventApi",
+    "ExecApi",
+    "ExperimentApi",
+    "ExplorerApi",
+    "FlagsApi",
+    "FlowApi",
+    "FrameworkApi",
+    "FunctionsApi",
+    "GatewayApi",
+    "GitApi",
+    "GraphApi",
+    "GuideApi",
+    "HelpApi",
+    "IamApi",
+    "IndexApi",
+    "IngressApi",
+    "IntegrationsApi",
+    "KmsApi",
+    "KnowledgeApi",
+    "KvApi",
+    "LabelApi",
+    "LeaderboardApi",
+    "LegalApi",
+    "LicensingApi",
+    "LinkApi",
+    "LspApi",
+    "MarketingApi",
+    "MarketplaceApi",
+    "MeetApi",
+    "MetricsApi",
+    "MlApi",
+    "MqApi",
+    "NetworkApi",
+    "NodeApi",
+    "NotifyApi",
+    "O11yApi",
+    "OpenapiApi",
+    "PlanApi",
+    "PlatformApi",
+    "PrefApi",
+    "PricingApi",
+    "ProjectsApi",
+    "PromptApi",
+    "ProvisioningApi",
+    "PubsubApi",
+    "ReferenceApi",
+    "ReferralApi",
+    "RegistryApi",
+    "RiskApi",
+    "S3Api",
+    "SandboxApi",
+    "SbomApi",
+    "SearchApi",
+    "SecurityApi",
+    "SeoApi",
+    "SettingsApi",
+    "ShareApi",
+    "SocialApi",
+    "StandingApi",
+    "SyncApi",
+    "TasksApi",
+    "TaxonomyApi",
+    "TeamApi",
+    "TelApi",
+    "TemplateApi",
+    "TodoApi",
+    "ToolsApi",
+    "TranslateApi",
+    "TreasuryApi",
+    "TrustApi",
+    "UsageApi",
+    "ValidatorApi",
+    "VisorApi",
+    "WalletApi",
+    "Web3Api",
+    "WebhookApi",
+    "WebsearchApi",
+    "WorldApi",
+    "X402Api",
+]
+
+# API classes are imported on first access (PEP 562).
+_LAZY_IMPORTS = {
+    "AccountApi": "hanzoai.cloud.api.account_api",
+    "AdApi": "hanzoai.cloud.api.ad_api",
+    "AffiliateApi": "hanzoai.cloud.api.affiliate_api",
+    "AgentsApi": "hanzoai.cloud.api.agents_api",
+    "AiApi": "hanzoai.cloud.api.ai_api",
+    "AllowanceApi": "hanzoai.cloud.api.allowance_api",
+    "AskApi": "hanzoai.cloud.api.ask_api",
+    "AuditApi": "hanzoai.cloud.api.audit_api",
+    "AuthorApi": "hanzoai.cloud.api.author_api",
+    "AuthzApi": "hanzoai.cloud.api.authz_api",
+    "AutoApi": "hanzoai.cloud.api.auto_api",
+    "BaseApi": "hanzoai.cloud.api.base_api",
+    "BenchmarkApi": "hanzoai.cloud.api.benchmark_api",
+    "BillingApi": "hanzoai.cloud.api.billing_api",
+    "BlueprintApi": "hanzoai.cloud.api.blueprint_api",
+    "BooksApi": "hanzoai.cloud.api.books_api",
+    "BotApi": "hanzoai.cloud.api.bot_api",
+    "CampaignApi": "hanzoai.cloud.api.campaign_api",
+    "CaptableApi": "hanzoai.cloud.api.captable_api",
+    "CatalogApi": "hanzoai.cloud.api.catalog_api",
+    "ChannelsApi": "hanzoai.cloud.api.channels_api",
+    "CloudflareApi": "hanzoai.cloud.api.cloudflare_api",
+    "CodeApi": "hanzoai.cloud.api.code_api",
+    "CommerceApi": "hanzoai.cloud.api.commerce_api",
+    "CompanyApi": "hanzoai.cloud.api.company_api",
+    "ComplianceApi": "hanzoai.cloud.api.compliance_api",
+    "ContentApi": "hanzoai.cloud.api.content_api",
+    "CrawlApi": "hanzoai.cloud.api.crawl_api",
+    "CrmApi": "hanzoai.cloud.api.crm_api",
+    "DataroomApi": "hanzoai.cloud.api.dataroom_api",
+    "DatasetApi": "hanzoai.cloud.api.dataset_api",
+    "DeployApi": "hanzoai.cloud.api.deploy_api",
+    "DestinationApi": "hanzoai.cloud.api.destination_api",
+    "DomainApi": "hanzoai.cloud.api.domain_api",
+    "EngineApi": "hanzoai.cloud.api.engine_api",
+    "EntitlementApi": "hanzoai.cloud.api.entitlement_api",
+    "EsignApi": "hanzoai.cloud.api.esign_api",
+    "EvalApi": "hanzoai.cloud.api.eval_api",
+    "EventApi": "hanzoai.cloud.api.event_api",
+    "ExecApi": "hanzoai.cloud.api.exec_api",
+    "ExperimentApi": "hanzoai.cloud.api.experiment_api",
+    "ExplorerApi": "hanzoai.cloud.api.explorer_api",
+    "FlagsApi": "hanzoai.cloud.api.flags_api",
+    "FlowApi": "hanzoai.cloud.api.flow_api",
+    "FrameworkApi": "hanzoai.cloud.api.framework_api",
+    "FunctionsApi": "hanzoai.cloud.api.functions_api",
+    "GatewayApi": "hanzoai.cloud.api.gateway_api",
+    "GitApi": "hanzoai.cloud.api.git_api",
+    "GraphApi": "hanzoai.cloud.api.graph_api",
+    "GuideApi": "hanzoai.cloud.api.guide_api",
+    "HelpApi": "hanzoai.cloud.api.help_api",
+    "IamApi": "hanzoai.cloud.api.iam_api",
+    "IndexApi": "hanzoai.cloud.api.index_api",
+    "IngressApi": "hanzoai.cloud.api.ingress_api",
+    "IntegrationsApi": "hanzoai.cloud.api.integrations_api",
+    "KmsApi": "hanzoai.cloud.api.kms_api",
+    "KnowledgeApi": "hanzoai.cloud.api.knowledge_api",
+    "KvApi": "hanzoai.cloud.api.kv_api",
+    "LabelApi": "hanzoai.cloud.api.label_api",
+    "LeaderboardApi": "hanzoai.cloud.api.leaderboard_api",
+    "LegalApi": "hanzoai.cloud.api.legal_api",
+    "LicensingApi": "hanzoai.cloud.api.licensing_api",
+    "LinkApi": "hanzoai.cloud.api.link_api",
+    "LspApi": "hanzoai.cloud.api.lsp_api",
+    "MarketingApi": "hanzoai.cloud.api.marketing_api",
+    "MarketplaceApi": "hanzoai.cloud.api.marketplace_api",
+    "MeetApi": "hanzoai.cloud.api.meet_api",
+    "MetricsApi": "hanzoai.cloud.api.metrics_api",
+    "MlApi": "hanzoai.cloud.api.ml_api",
+    "MqApi": "hanzoai.cloud.api.mq_api",
+    "NetworkApi": "hanzoai.cloud.api.network_api",
+    "NodeApi": "hanzoai.cloud.api.node_api",
+    "NotifyApi": "hanzoai.cloud.api.notify_api",
+    "O11yApi": "hanzoai.cloud.api.o11y_api",
+    "OpenapiApi": "hanzoai.cloud.api.openapi_api",
+    "PlanApi": "hanzoai.cloud.api.plan_api",
+    "PlatformApi": "hanzoai.cloud.api.platform_api",
+    "PrefApi": "hanzoai.cloud.api.pref_api",
+    "PricingApi": "hanzoai.cloud.api.pricing_api",
+    "ProjectsApi": "hanzoai.cloud.api.projects_api",
+    "PromptApi": "hanzoai.cloud.api.prompt_api",
+    "ProvisioningApi": "hanzoai.cloud.api.provisioning_api",
+    "PubsubApi": "hanzoai.cloud.api.pubsub_api",
+    "ReferenceApi": "hanzoai.cloud.api.reference_api",
+    "ReferralApi": "hanzoai.cloud.api.referral_api",
+    "RegistryApi": "hanzoai.cloud.api.registry_api",
+    "RiskApi": "hanzoai.cloud.api.risk_api",
+    "S3Api": "hanzoai.cloud.api.s3_api",
+    "SandboxApi": "hanzoai.cloud.api.sandbox_api",
+    "SbomApi": "hanzoai.cloud.api.sbom_api",
+    "SearchApi": "hanzoai.cloud.api.search_api",
+    "SecurityApi": "hanzoai.cloud.api.security_api",
+    "SeoApi": "hanzoai.cloud.api.seo_api",
+    "SettingsApi": "hanzoai.cloud.api.settings_api",
+    "ShareApi": "hanzoai.cloud.api.share_api",
+    "SocialApi": "hanzoai.cloud.api.social_api",
+    "StandingApi": "hanzoai.cloud.api.standing_api",
+    "SyncApi": "hanzoai.cloud.api.sync_api",
+    "TasksApi": "hanzoai.cloud.api.tasks_api",
+    "TaxonomyApi": "hanzoai.cloud.api.taxonomy_api",
+    "TeamApi": "hanzoai.cloud.api.team_api",
+    "TelApi": "hanzoai.cloud.api.tel_api",
+    "TemplateApi": "hanzoai.cloud.api.template_api",
+    "TodoApi": "hanzoai.cloud.api.todo_api",
+    "ToolsApi": "hanzoai.cloud.api.tools_api",
+    "TranslateApi": "hanzoai.cloud.api.translate_api",
+    "TreasuryApi": "hanzoai.cloud.api.treasury_api",
+    "TrustApi": "hanzoai.cloud.api.trust_api",
+    "UsageApi": "hanzoai.cloud.api.usage_api",
+    "ValidatorApi": "hanzoai.cloud.api.validator_api",
+    "VisorApi": "hanzoai.cloud.api.visor_api",
+    "WalletApi": "hanzoai.cloud.api.wallet_api",
+    "Web3Api": "hanzoai.cloud.api.web3_api",
+    "WebhookApi": "hanzoai.cloud.api.webhook_api",
+    "WebsearchApi": "hanzoai.cloud.api.websearch_api",
+    "WorldApi": "hanzoai.cloud.api.world_api",
+    "X402Api": "hanzoai.cloud.api.x402_api",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    # Bind it so the next read is a plain module-dict hit.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from hanzoai.cloud.api.account_api import AccountApi
+    from hanzoai.cloud.api.ad_api import AdApi
+    from hanzoai.cloud.api.affiliate_api import AffiliateApi
+    from hanzoai.cloud.api.agents_api import AgentsApi
+    from hanzoai.cloud.api.ai_api import AiApi
+    from hanzoai.cloud.api.allowance_api import AllowanceApi
+    from hanzoai.cloud.api.ask_api import AskApi
+    from hanzoai.cloud.api.audit_api import AuditApi
+    from hanzoai.cloud.api.author_api import AuthorApi
+    from hanzoai.cloud.api.authz_api import AuthzApi
+    from hanzoai.cloud.api.auto_api import AutoApi
+    from hanzoai.cloud.api.base_api import BaseApi
+    from hanzoai.cloud.api.benchmark_api import BenchmarkApi
+    from hanzoai.cloud.api.billing_api import BillingApi
+    from hanzoai.cloud.api.blueprint_api import BlueprintApi
+    from hanzoai.cloud.api.books_api import BooksApi
+    from hanzoai.cloud.api.bot_api import BotApi
+    from hanzoai.cloud.api.campaign_api import CampaignApi
+    from hanzoai.cloud.api.captable_api import CaptableApi
+    from hanzoai.cloud.api.catalog_api import CatalogApi
+    from hanzoai.cloud.api.channels_api import ChannelsApi
+    from hanzoai.cloud.api.cloudflare_api import CloudflareApi
+    from hanzoai.cloud.api.code_api import CodeApi
+    from hanzoai.cloud.api.commerce_api import CommerceApi
+    from hanzoai.cloud.api.company_api import CompanyApi
+    from hanzoai.cloud.api.compliance_api import ComplianceApi
+    from hanzoai.cloud.api.content_api import ContentApi
+    from hanzoai.cloud.api.crawl_api import CrawlApi
+    from hanzoai.cloud.api.crm_api import CrmApi
+    from hanzoai.cloud.api.dataroom_api import DataroomApi
+    from hanzoai.cloud.api.dataset_api import DatasetApi
+    from hanzoai.cloud.api.deploy_api import DeployApi
+    from hanzoai.cloud.api.destination_api import DestinationApi
+    from hanzoai.cloud.api.domain_api import DomainApi
+    from hanzoai.cloud.api.engine_api import EngineApi
+    from hanzoai.cloud.api.entitlement_api import EntitlementApi
+    from hanzoai.cloud.api.esign_api import EsignApi
+    from hanzoai.cloud.api.eval_api import EvalApi
+    from hanzoai.cloud.api.event_api import EventApi
+    from hanzoai.cloud.api.exec_api import ExecApi
+    from hanzoai.cloud.api.experiment_api import ExperimentApi
+    from hanzoai.cloud.api.explorer_api import ExplorerApi
+    from hanzoai.cloud.api.flags_api import FlagsApi
+    from hanzoai.cloud.api.flow_api import FlowApi
+    from hanzoai.cloud.api.framework_api import FrameworkApi
+    from hanzoai.cloud.api.functions_api import FunctionsApi
+    from hanzoai.cloud.api.gateway_api import GatewayApi
+    from hanzoai.cloud.api.git_api import GitApi
+    from hanzoai.cloud.api.graph_api import GraphApi
+    from hanzoai.cloud.api.guide_api import GuideApi
+    from hanzoai.cloud.api.help_api import HelpApi
+    from hanzoai.cloud.api.iam_api import IamApi
+    from hanzoai.cloud.api.index_api import IndexApi
+    from hanzoai.cloud.api.ingress_api import IngressApi
+    from hanzoai.cloud.api.integrations_api import IntegrationsApi
+    from hanzoai.cloud.api.kms_api import KmsApi
+    from hanzoai.cloud.api.knowledge_api import KnowledgeApi
+    from hanzoai.cloud.api.kv_api import KvApi
+    from hanzoai.cloud.api.label_api import LabelApi
+    from hanzoai.cloud.api.leaderboard_api import LeaderboardApi
+    from hanzoai.cloud.api.legal_api import LegalApi
+    from hanzoai.cloud.api.licensing_api import LicensingApi
+    from hanzoai.cloud.api.link_api import LinkApi
+    from hanzoai.cloud.api.lsp_api import LspApi
+    from hanzoai.cloud.api.marketing_api import MarketingApi
+    from hanzoai.cloud.api.marketplace_api import MarketplaceApi
+    from hanzoai.cloud.api.meet_api import MeetApi
+    from hanzoai.cloud.api.metrics_api import MetricsApi
+    from hanzoai.cloud.api.ml_api import MlApi
+    from hanzoai.cloud.api.mq_api import MqApi
+    from hanzoai.cloud.api.network_api import NetworkApi
+    from hanzoai.cloud.api.node_api import NodeApi
+    from hanzoai.cloud.api.notify_api import NotifyApi
+    from hanzoai.cloud.api.o11y_api import O11yApi
+    from hanzoai.cloud.api.openapi_api import OpenapiApi
+    from hanzoai.cloud.api.plan_api import PlanApi
+    from hanzoai.cloud.api.platform_api import PlatformApi
+    from hanzoai.cloud.api.pref_api import PrefApi
+    from hanzoai.cloud.api.pricing_api import PricingApi
+    from hanzoai.cloud.api.projects_api import ProjectsApi
+    from hanzoai.cloud.api.prompt_api import PromptApi
+    from hanzoai.cloud.api.provisioning_api import ProvisioningApi
+    from hanzoai.cloud.api.pubsub_api import PubsubApi
+    from hanzoai.cloud.api.reference_api import ReferenceApi
+    from hanzoai.cloud.api.referral_api import ReferralApi
+    from hanzoai.cloud.api.registry_api import RegistryApi
+    from hanzoai.cloud.api.risk_api import RiskApi
+    from hanzoai.cloud.api.s3_api import S3Api
+    from hanzoai.cloud.api.sandbox_api import SandboxApi
+    from hanzoai.cloud.api.sbom_api import SbomApi
+    from hanzoai.cloud.api.search_api import SearchApi
+    from hanzoai.cloud.api.security_api import SecurityApi
+    from hanzoai.cloud.api.seo_api import SeoApi
+    from hanzoai.cloud.api.settings_api import SettingsApi
+    from hanzoai.cloud.api.share_api import ShareApi
+    from hanzoai.cloud.api.social_api import SocialApi
+    from hanzoai.cloud.api.standing_api import StandingApi
+    from hanzoai.cloud.api.sync_api import SyncApi
+    from hanzoai.cloud.api.tasks_api import TasksApi
+    from hanzoai.cloud.api.taxonomy_api import TaxonomyApi
+    from hanzoai.cloud.api.team_api import TeamApi
+    from hanzoai.cloud.api.tel_api import TelApi
+    from hanzoai.cloud.api.template_api import TemplateApi
+    from hanzoai.cloud.api.todo_api import TodoApi
+    from hanzoai.cloud.api.tools_api import ToolsApi
+    from hanzoai.cloud.api.translate_api import TranslateApi
+    from hanzoai.cloud.api.treasury_api import TreasuryApi
+    from hanzoai.cloud.api.trust_api import TrustApi
+    from hanzoai.cloud.api.usage_api import UsageApi
+    from hanzoai.cloud.api.validator_api import ValidatorApi
+    from hanzoai.cloud.api.visor_api import VisorApi
+    from hanzoai.cloud.api.wallet_api import WalletApi
+    from hanzoai.cloud.api.web3_api import Web3Api
+    from hanzoai.cloud.api.webhook_api import WebhookApi
+    from hanzoai.cloud.api.websearch_api import WebsearchApi
+    from hanzoai.cloud.api.world_api import WorldApi
+    from hanzoai.cloud.api.x402_api import X402Api
@@ -12,2292 +12,6892 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING
 
-# import models into model package
-from hanzoai.cloud.models.acc_list import AccList
-from hanzoai.cloud.models.acc_view import AccView
-from hanzoai.cloud.models.account import Account
-from hanzoai.cloud.models.account_list import AccountList
-from hanzoai.cloud.models.account_view import AccountView
-from hanzoai.cloud.models.accounts import Accounts
-from hanzoai.cloud.models.accounts_out import AccountsOut
-from hanzoai.cloud.models.accounts_total import AccountsTotal
-from hanzoai.cloud.models.accounts_usage import AccountsUsage
-from hanzoai.cloud.models.accreditation_decision import AccreditationDecision
-from hanzoai.cloud.models.accreditation_req import AccreditationReq
-from hanzoai.cloud.models.action_record import ActionRecord
-from hanzoai.cloud.models.actions_view import ActionsView
-from hanzoai.cloud.models.activation_req import ActivationReq
-from hanzoai.cloud.models.activation_set import ActivationSet
-from hanzoai.cloud.models.activity_feed import ActivityFeed
-from hanzoai.cloud.models.activity_out import ActivityOut
-from hanzoai.cloud.models.activity_point import ActivityPoint
-from hanzoai.cloud.models.activity_row import ActivityRow
-from hanzoai.cloud.models.activity_totals import ActivityTotals
-from hanzoai.cloud.models.activity_view import ActivityView
-from hanzoai.cloud.models.ad_campaign import AdCampaign
-from hanzoai.cloud.models.ad_summary import AdSummary
-from hanzoai.cloud.models.add_domain_req import AddDomainReq
-from hanzoai.cloud.models.admission import Admission
-from hanzoai.cloud.models.advance_in import AdvanceIn
-from hanzoai.cloud.models.affiliate_board import AffiliateBoard
-from hanzoai.cloud.models.affiliate_earnings import AffiliateEarnings
-from hanzoai.cloud.models.affiliate_links import AffiliateLinks
-from hanzoai.cloud.models.affiliate_self import AffiliateSelf
-from hanzoai.cloud.models.affiliate_standing import AffiliateStanding
-from hanzoai.cloud.models.agent_binding import AgentBinding
-from hanzoai.cloud.models.agent_detail import AgentDetail
-from hanzoai.cloud.models.agent_list import AgentList
-from hanzoai.cloud.models.agent_run_view import AgentRunView
-from hanzoai.cloud.models.agent_view import AgentView
-from hanzoai.cloud.models.ai_mcp_app import AiMCPApp
-from hanzoai.cloud.models.ai_mcp_surface import AiMCPSurface
-from hanzoai.cloud.models.alert import Alert
-from hanzoai.cloud.models.alert_patch import AlertPatch
-from hanzoai.cloud.models.alert_spec import AlertSpec
-from hanzoai.cloud.models.allowance import Allowance
-from hanzoai.cloud.models.allowlist_put_in import AllowlistPutIn
-from hanzoai.cloud.models.allowlist_view import AllowlistView
-from hanzoai.cloud.models.analysis import Analysis
-from hanzoai.cloud.models.analytics_view import AnalyticsView
-from hanzoai.cloud.models.analyze_query import AnalyzeQuery
-from hanzoai.cloud.models.answer import Answer
-from hanzoai.cloud.models.api_key import ApiKey
-from hanzoai.cloud.models.api_key_list import ApiKeyList
-from hanzoai.cloud.models.app_view import AppView
-from hanzoai.cloud.models.appearance import Appearance
-from hanzoai.cloud.models.application import Application
-from hanzoai.cloud.models.application_list import ApplicationList
-from hanzoai.cloud.models.apply_request import ApplyRequest
-from hanzoai.cloud.models.approve_pairing_in import ApprovePairingIn
-from hanzoai.cloud.models.argo_app import ArgoApp
-from hanzoai.cloud.models.argo_app_list import ArgoAppList
-from hanzoai.cloud.models.argo_cluster import ArgoCluster
-from hanzoai.cloud.models.argo_cluster_info import ArgoClusterInfo
-from hanzoai.cloud.models.argo_cluster_list import ArgoClusterList
-from hanzoai.cloud.models.argo_connection_state import ArgoConnectionState
-from hanzoai.cloud.models.argo_destination import ArgoDestination
-from hanzoai.cloud.models.argo_group_kind import ArgoGroupKind
-from hanzoai.cloud.models.argo_health import ArgoHealth
-from hanzoai.cloud.models.argo_info_item import ArgoInfoItem
-from hanzoai.cloud.models.argo_list_meta import ArgoListMeta
-from hanzoai.cloud.models.argo_meta import ArgoMeta
-from hanzoai.cloud.models.argo_node import ArgoNode
-from hanzoai.cloud.models.argo_project import ArgoProject
-from hanzoai.cloud.models.argo_project_list import ArgoProjectList
-from hanzoai.cloud.models.argo_project_spec import ArgoProjectSpec
-from hanzoai.cloud.models.argo_resource_ref import ArgoResourceRef
-from hanzoai.cloud.models.argo_resource_status import ArgoResourceStatus
-from hanzoai.cloud.models.argo_revision_metadata import ArgoRevisionMetadata
-from hanzoai.cloud.models.argo_source import ArgoSource
-from hanzoai.cloud.models.argo_spec import ArgoSpec
-from hanzoai.cloud.models.argo_status import ArgoStatus
-from hanzoai.cloud.models.argo_summary import ArgoSummary
-from hanzoai.cloud.models.argo_sync_status import ArgoSyncStatus
-from hanzoai.cloud.models.argo_sync_windows import ArgoSyncWindows
-from hanzoai.cloud.models.argo_tree import ArgoTree
-from hanzoai.cloud.models.arm import Arm
-from hanzoai.cloud.models.ask_answer import AskAnswer
-from hanzoai.cloud.models.ask_post_in import AskPostIn
-from hanzoai.cloud.models.ask_request import AskRequest
-from hanzoai.cloud.models.ask_response import AskResponse
-from hanzoai.cloud.models.assignment import Assignment
-from hanzoai.cloud.models.attribute_request import AttributeRequest
-from hanzoai.cloud.models.attribution import Attribution
-from hanzoai.cloud.models.audience import Audience
-from hanzoai.cloud.models.audience_list import AudienceList
-from hanzoai.cloud.models.audience_preview import AudiencePreview
-from hanzoai.cloud.models.audit_list import AuditList
-from hanzoai.cloud.models.author_repo import AuthorRepo
-from hanzoai.cloud.models.authored_plugin import AuthoredPlugin
-from hanzoai.cloud.models.authored_plugin_list import AuthoredPluginList
-from hanzoai.cloud.models.authored_skill_list import AuthoredSkillList
-from hanzoai.cloud.models.authorize_out import AuthorizeOut
-from hanzoai.cloud.models.backend import Backend
-from hanzoai.cloud.models.backend_status import BackendStatus
-from hanzoai.cloud.models.balance_line import BalanceLine
-from hanzoai.cloud.models.balance_sheet import BalanceSheet
-from hanzoai.cloud.models.balances import Balances
-from hanzoai.cloud.models.bank_question import BankQuestion
-from hanzoai.cloud.models.bank_tally import BankTally
-from hanzoai.cloud.models.bank_txn_row import BankTxnRow
-from hanzoai.cloud.models.base_health import BaseHealth
-from hanzoai.cloud.models.begin_in import BeginIn
-from hanzoai.cloud.models.benchmark import Benchmark
-from hanzoai.cloud.models.benchmark_catalog import BenchmarkCatalog
-from hanzoai.cloud.models.billing_account import BillingAccount
-from hanzoai.cloud.models.billing_invoice import BillingInvoice
-from hanzoai.cloud.models.binary_spec import BinarySpec
-from hanzoai.cloud.models.bind_agent_req import BindAgentReq
-from hanzoai.cloud.models.binding_list import BindingList
-from hanzoai.cloud.models.blob import Blob
-from hanzoai.cloud.models.blob_json import BlobJSON
-from hanzoai.cloud.models.blog import Blog
-from hanzoai.cloud.models.blueprint import Blueprint
-from hanzoai.cloud.models.blueprint_counts import BlueprintCounts
-from hanzoai.cloud.models.blueprint_health import BlueprintHealth
-from hanzoai.cloud.models.blueprint_index import BlueprintIndex
-from hanzoai.cloud.models.blueprint_row import BlueprintRow
-from hanzoai.cloud.models.blueprint_versions_view import BlueprintVersionsView
-from hanzoai.cloud.models.blueprint_view import BlueprintView
-from hanzoai.cloud.models.board import Board
-from hanzoai.cloud.models.board_item import BoardItem
-from hanzoai.cloud.models.board_page import BoardPage
-from hanzoai.cloud.models.board_point import BoardPoint
-from hanzoai.cloud.models.board_range import BoardRange
-from hanzoai.cloud.models.board_resp import BoardResp
-from hanzoai.cloud.models.board_scope import BoardScope
-from hanzoai.cloud.models.board_totals import BoardTotals
-from hanzoai.cloud.models.book_request import BookRequest
-from hanzoai.cloud.models.book_response import BookResponse
-from hanzoai.cloud.models.bot_list import BotList
-from hanzoai.cloud.models.bot_member import BotMember
-from hanzoai.cloud.models.bot_roster import BotRoster
-from hanzoai.cloud.models.bot_run import BotRun
-from hanzoai.cloud.models.bot_runs import BotRuns
-from hanzoai.cloud.models.bot_stopped import BotStopped
-from hanzoai.cloud.models.bot_sync import BotSync
-from hanzoai.cloud.models.bot_view import BotView
-from hanzoai.cloud.models.breakdown import Breakdown
-from hanzoai.cloud.models.breakdown_row import BreakdownRow
-from hanzoai.cloud.models.browser_tag_out import BrowserTagOut
-from hanzoai.cloud.models.bucket_create_in import BucketCreateIn
-from hanzoai.cloud.models.bucket_in import BucketIn
-from hanzoai.cloud.models.bucket_item import BucketItem
-from hanzoai.cloud.models.bucket_list import BucketList
-from hanzoai.cloud.models.bucket_record import BucketRecord
-from hanzoai.cloud.models.bucket_write import BucketWrite
-from hanzoai.cloud.models.build_board import BuildBoard
-from hanzoai.cloud.models.build_list import BuildList
-from hanzoai.cloud.models.build_out import BuildOut
-from hanzoai.cloud.models.build_request import BuildRequest
-from hanzoai.cloud.models.build_row import BuildRow
-from hanzoai.cloud.models.build_summary import BuildSummary
-from hanzoai.cloud.models.build_turn import BuildTurn
-from hanzoai.cloud.models.build_view import BuildView
-from hanzoai.cloud.models.bus_ack import BusAck
-from hanzoai.cloud.models.bus_message import BusMessage
-from hanzoai.cloud.models.bus_publish import BusPublish
-from hanzoai.cloud.models.bus_request import BusRequest
-from hanzoai.cloud.models.buy_input import BuyInput
-from hanzoai.cloud.models.byo_gpu import ByoGPU
-from hanzoai.cloud.models.byo_worker import ByoWorker
-from hanzoai.cloud.models.calendar_post import CalendarPost
-from hanzoai.cloud.models.call import Call
-from hanzoai.cloud.models.call_input import CallInput
-from hanzoai.cloud.models.call_list import CallList
-from hanzoai.cloud.models.campaign import Campaign
-from hanzoai.cloud.models.campaign_input import CampaignInput
-from hanzoai.cloud.models.campaign_list import CampaignList
-from hanzoai.cloud.models.campaign_page import CampaignPage
-from hanzoai.cloud.models.campaign_record import CampaignRecord
-from hanzoai.cloud.models.campaign_results import CampaignResults
-from hanzoai.cloud.models.campaign_summary import CampaignSummary
-from hanzoai.cloud.models.campaign_update import CampaignUpdate
-from hanzoai.cloud.models.campaign_write import CampaignWrite
-from hanzoai.cloud.models.cap_verdict import CapVerdict
-from hanzoai.cloud.models.capabilities import Capabilities
-from hanzoai.cloud.models.capability import Capability
-from hanzoai.cloud.models.captable_class_holding import CaptableClassHolding
-from hanzoai.cloud.models.captable_company import CaptableCompany
-from hanzoai.cloud.models.captable_company_update import CaptableCompanyUpdate
-from hanzoai.cloud.models.captable_convertibles import CaptableConvertibles
-from hanzoai.cloud.models.captable_deleted import CaptableDeleted
-from hanzoai.cloud.models.captable_equity_plan import CaptableEquityPlan
-from hanzoai.cloud.models.captable_equity_plans import CaptableEquityPlans
-from hanzoai.cloud.models.captable_holding import CaptableHolding
-from hanzoai.cloud.models.captable_instrument_total import CaptableInstrumentTotal
-from hanzoai.cloud.models.captable_investment import CaptableInvestment
-from hanzoai.cloud.models.captable_investments import CaptableInvestments
-from hanzoai.cloud.models.captable_note import CaptableNote
-from hanzoai.cloud.models.captable_notes import CaptableNotes
-from hanzoai.cloud.models.captable_option import CaptableOption
-from hanzoai.cloud.models.captable_options import CaptableOptions
-from hanzoai.cloud.models.captable_round import CaptableRound
-from hanzoai.cloud.models.captable_round_close_request import CaptableRoundCloseRequest
-from hanzoai.cloud.models.captable_round_detail import CaptableRoundDetail
-from hanzoai.cloud.models.captable_round_investment import CaptableRoundInvestment
-from hanzoai.cloud.models.captable_round_totals import CaptableRoundTotals
-from hanzoai.cloud.models.captable_rounds import CaptableRounds
-from hanzoai.cloud.models.captable_safe import CaptableSafe
-from hanzoai.cloud.models.captable_safes import CaptableSafes
-from hanzoai.cloud.models.captable_share import CaptableShare
-from hanzoai.cloud.models.captable_share_class import CaptableShareClass
-from hanzoai.cloud.models.captable_shares import CaptableShares
-from hanzoai.cloud.models.captable_stakeholder import CaptableStakeholder
-from hanzoai.cloud.models.captable_stakeholder_patch import CaptableStakeholderPatch
-from hanzoai.cloud.models.captable_summary import CaptableSummary
-from hanzoai.cloud.models.captable_summary_company import CaptableSummaryCompany
-from hanzoai.cloud.models.captable_totals import CaptableTotals
-from hanzoai.cloud.models.captable_updated import CaptableUpdated
-from hanzoai.cloud.models.capture_batch import CaptureBatch
-from hanzoai.cloud.models.capture_event import CaptureEvent
-from hanzoai.cloud.models.capture_result import CaptureResult
-from hanzoai.cloud.models.captured_error import CapturedError
-from hanzoai.cloud.models.cart import Cart
-from hanzoai.cloud.models.cart_item import CartItem
-from hanzoai.cloud.models.cart_item_set import CartItemSet
-from hanzoai.cloud.models.cart_open import CartOpen
-from hanzoai.cloud.models.catalog import Catalog
-from hanzoai.cloud.models.catalog_entry import CatalogEntry
-from hanzoai.cloud.models.catalog_list import CatalogList
-from hanzoai.cloud.models.catalog_out import CatalogOut
-from hanzoai.cloud.models.catalog_page import CatalogPage
-from hanzoai.cloud.models.category import Category
-from hanzoai.cloud.models.category_in import CategoryIn
-from hanzoai.cloud.models.category_spend import CategorySpend
-from hanzoai.cloud.models.centre import Centre
-from hanzoai.cloud.models.chain import Chain
-from hanzoai.cloud.models.chain_list import ChainList
-from hanzoai.cloud.models.chain_status import ChainStatus
-from hanzoai.cloud.models.challenge_view import ChallengeView
-from hanzoai.cloud.models.channel import Channel
-from hanzoai.cloud.models.channel_add import ChannelAdd
-from hanzoai.cloud.models.channel_list import ChannelList
-from hanzoai.cloud.models.channel_metric import ChannelMetric
-from hanzoai.cloud.models.channel_result import ChannelResult
-from hanzoai.cloud.models.channel_spec import ChannelSpec
-from hanzoai.cloud.models.channel_view import ChannelView
-from hanzoai.cloud.models.charge import Charge
-from hanzoai.cloud.models.chat_channels import ChatChannels
-from hanzoai.cloud.models.chat_request import ChatRequest
-from hanzoai.cloud.models.chat_response import ChatResponse
-from hanzoai.cloud.models.check_list import CheckList
-from hanzoai.cloud.models.check_view import CheckView
-from hanzoai.cloud.models.citation import Citation
-from hanzoai.cloud.models.claim import Claim
-from hanzoai.cloud.models.claim_key_out import ClaimKeyOut
-from hanzoai.cloud.models.claim_request import ClaimRequest
-from hanzoai.cloud.models.claim_row import ClaimRow
-from hanzoai.cloud.models.claim_view import ClaimView
-from hanzoai.cloud.models.claims_out import ClaimsOut
-from hanzoai.cloud.models.clause_coverage import ClauseCoverage
-from hanzoai.cloud.models.clause_row import ClauseRow
-from hanzoai.cloud.models.clear_reference_out import ClearReferenceOut
-from hanzoai.cloud.models.click_count import ClickCount
-from hanzoai.cloud.models.click_request import ClickRequest
-from hanzoai.cloud.models.clip_body import ClipBody
-from hanzoai.cloud.models.cluster_attach import ClusterAttach
-from hanzoai.cloud.models.cluster_detached import ClusterDetached
-from hanzoai.cloud.models.cluster_detail_view import ClusterDetailView
-from hanzoai.cloud.models.cluster_list import ClusterList
-from hanzoai.cloud.models.cluster_view import ClusterView
-from hanzoai.cloud.models.code_file import CodeFile
-from hanzoai.cloud.models.code_result import CodeResult
-from hanzoai.cloud.models.code_run import CodeRun
-from hanzoai.cloud.models.code_view import CodeView
-from hanzoai.cloud.models.coding_start_in import CodingStartIn
-from hanzoai.cloud.models.coding_started import CodingStarted
-from hanzoai.cloud.models.collab_payload import CollabPayload
-from hanzoai.cloud.models.collab_request import CollabRequest
-from hanzoai.cloud.models.collab_result import CollabResult
-from hanzoai.cloud.models.collected import Collected
-from hanzoai.cloud.models.commerce_overview import CommerceOverview
-from hanzoai.cloud.models.commit_json import CommitJSON
-from hanzoai.cloud.models.commits_json import CommitsJSON
-from hanzoai.cloud.models.company import Company
-from hanzoai.cloud.models.company_list import CompanyList
-from hanzoai.cloud.models.company_req import CompanyReq
-from hanzoai.cloud.models.completion import Completion
-from hanzoai.cloud.models.config import Config
-from hanzoai.cloud.models.conn_view import ConnView
-from hanzoai.cloud.models.connect_in import ConnectIn
-from hanzoai.cloud.models.connect_out import ConnectOut
-from hanzoai.cloud.models.connect_request import ConnectRequest
-from hanzoai.cloud.models.connection_out import ConnectionOut
-from hanzoai.cloud.models.connection_view import ConnectionView
-from hanzoai.cloud.models.connector_action import ConnectorAction
-from hanzoai.cloud.models.connector_auth import ConnectorAuth
-from hanzoai.cloud.models.connector_metadata import ConnectorMetadata
-from hanzoai.cloud.models.connector_provider_view import ConnectorProviderView
-from hanzoai.cloud.models.connector_providers_out import ConnectorProvidersOut
-from hanzoai.cloud.models.connector_token_out import ConnectorTokenOut
-from hanzoai.cloud.models.connector_trigger import ConnectorTrigger
-from hanzoai.cloud.models.connector_view import ConnectorView
-from hanzoai.cloud.models.connectors_out import ConnectorsOut
-from hanzoai.cloud.models.console_settings import ConsoleSettings
-from hanzoai.cloud.models.console_settings_dex_config import ConsoleSettingsDexConfig
-from hanzoai.cloud.models.console_settings_google_analytics import ConsoleSettingsGoogleAnalytics
-from hanzoai.cloud.models.console_settings_help import ConsoleSettingsHelp
-from hanzoai.cloud.models.consumer import Consumer
-from hanzoai.cloud.models.contact import Contact
-from hanzoai.cloud.models.contact_list import ContactList
-from hanzoai.cloud.models.contact_req import ContactReq
-from hanzoai.cloud.models.contacts import Contacts
-from hanzoai.cloud.models.context_bundle import ContextBundle
-from hanzoai.cloud.models.context_in import ContextIn
-from hanzoai.cloud.models.control_command_view import ControlCommandView
-from hanzoai.cloud.models.control_drain import ControlDrain
-from hanzoai.cloud.models.control_list import ControlList
-from hanzoai.cloud.models.cookie_ack import CookieAck
-from hanzoai.cloud.models.corpus_view import CorpusView
-from hanzoai.cloud.models.cost_line import CostLine
-from hanzoai.cloud.models.cover_row import CoverRow
-from hanzoai.cloud.models.crawl_document import CrawlDocument
-from hanzoai.cloud.models.crawl_request import CrawlRequest
-from hanzoai.cloud.models.crawl_result import CrawlResult
-from hanzoai.cloud.models.create_account_in import CreateAccountIn
-from hanzoai.cloud.models.create_agent_in import CreateAgentIn
-from hanzoai.cloud.models.create_app_req import CreateAppReq
-from hanzoai.cloud.models.create_body import CreateBody
-from hanzoai.cloud.models.create_cluster_req import CreateClusterReq
-from hanzoai.cloud.models.create_cluster_req_node_pool import CreateClusterReqNodePool
-from hanzoai.cloud.models.create_endpoint_in import CreateEndpointIn
-from hanzoai.cloud.models.create_flow_req import CreateFlowReq
-from hanzoai.cloud.models.create_link_request import CreateLinkRequest
-from hanzoai.cloud.models.create_req import CreateReq
-from hanzoai.cloud.models.create_server_req import CreateServerReq
-from hanzoai.cloud.models.create_version_in import CreateVersionIn
-from hanzoai.cloud.models.create_wallet_in import CreateWalletIn
-from hanzoai.cloud.models.credential_in import CredentialIn
-from hanzoai.cloud.models.credential_out import CredentialOut
-from hanzoai.cloud.models.credit_balance import CreditBalance
-from hanzoai.cloud.models.credit_entry import CreditEntry
-from hanzoai.cloud.models.credit_grant import CreditGrant
-from hanzoai.cloud.models.credit_grants import CreditGrants
-from hanzoai.cloud.models.crm_summary import CrmSummary
-from hanzoai.cloud.models.crypto_asset import CryptoAsset
-from hanzoai.cloud.models.crypto_deposit import CryptoDeposit
-from hanzoai.cloud.models.crypto_options import CryptoOptions
-from hanzoai.cloud.models.csrf_resp import CsrfResp
-from hanzoai.cloud.models.curate_req import CurateReq
-from hanzoai.cloud.models.curriculum import Curriculum
-from hanzoai.cloud.models.curriculum_view import CurriculumView
-from hanzoai.cloud.models.d1_query import D1Query
-from hanzoai.cloud.models.dash_resp import DashResp
-from hanzoai.cloud.models.database_create_in import DatabaseCreateIn
-from hanzoai.cloud.models.dataroom_add_document import DataroomAddDocument
-from hanzoai.cloud.models.dataroom_create import DataroomCreate
-from hanzoai.cloud.models.dataroom_document import DataroomDocument
-from hanzoai.cloud.models.dataroom_document_one import DataroomDocumentOne
-from hanzoai.cloud.models.dataroom_documents import DataroomDocuments
-from hanzoai.cloud.models.dataroom_link import DataroomLink
-from hanzoai.cloud.models.dataroom_link_create import DataroomLinkCreate
-from hanzoai.cloud.models.dataroom_link_one import DataroomLinkOne
-from hanzoai.cloud.models.dataroom_link_stats import DataroomLinkStats
-from hanzoai.cloud.models.dataroom_links import DataroomLinks
-from hanzoai.cloud.models.dataroom_member import DataroomMember
-from hanzoai.cloud.models.dataroom_membership import DataroomMembership
-from hanzoai.cloud.models.dataroom_page_stat import DataroomPageStat
-from hanzoai.cloud.models.dataroom_room import DataroomRoom
-from hanzoai.cloud.models.dataroom_room_detail import DataroomRoomDetail
-from hanzoai.cloud.models.dataroom_room_detail_one import DataroomRoomDetailOne
-from hanzoai.cloud.models.dataroom_room_one import DataroomRoomOne
-from hanzoai.cloud.models.dataroom_rooms import DataroomRooms
-from hanzoai.cloud.models.dataroom_stats import DataroomStats
-from hanzoai.cloud.models.dataset_list import DatasetList
-from hanzoai.cloud.models.dataset_req import DatasetReq
-from hanzoai.cloud.models.dataset_view import DatasetView
-from hanzoai.cloud.models.decide_body import DecideBody
-from hanzoai.cloud.models.decision_in import DecisionIn
-from hanzoai.cloud.models.deck_out import DeckOut
-from hanzoai.cloud.models.def_row import DefRow
-from hanzoai.cloud.models.definition import Definition
-from hanzoai.cloud.models.defs_out import DefsOut
-from hanzoai.cloud.models.deleted import Deleted
-from hanzoai.cloud.models.deleted_out import DeletedOut
-from hanzoai.cloud.models.delivery import Delivery
-from hanzoai.cloud.models.delivery_list import DeliveryList
-from hanzoai.cloud.models.delivery_row import DeliveryRow
-from hanzoai.cloud.models.deploy_logs import DeployLogs
-from hanzoai.cloud.models.deploy_record import DeployRecord
-from hanzoai.cloud.models.deploy_req import DeployReq
-from hanzoai.cloud.models.deploy_request import DeployRequest
-from hanzoai.cloud.models.deployment_view import DeploymentView
-from hanzoai.cloud.models.destination_disconnected import DestinationDisconnected
-from hanzoai.cloud.models.destination_field import DestinationField
-from hanzoai.cloud.models.destination_list import DestinationList
-from hanzoai.cloud.models.destination_status import DestinationStatus
-from hanzoai.cloud.models.destination_test import DestinationTest
-from hanzoai.cloud.models.device_poll_out import DevicePollOut
-from hanzoai.cloud.models.device_start_in import DeviceStartIn
-from hanzoai.cloud.models.device_start_out import DeviceStartOut
-from hanzoai.cloud.models.device_view import DeviceView
-from hanzoai.cloud.models.diagnostic import Diagnostic
-from hanzoai.cloud.models.disconnect_out import DisconnectOut
-from hanzoai.cloud.models.doc_field import DocField
-from hanzoai.cloud.models.doc_perm import DocPerm
-from hanzoai.cloud.models.doc_row import DocRow
-from hanzoai.cloud.models.doc_type import DocType
-from hanzoai.cloud.models.doc_type_list import DocTypeList
-from hanzoai.cloud.models.document_list import DocumentList
-from hanzoai.cloud.models.document_page import DocumentPage
-from hanzoai.cloud.models.document_reply import DocumentReply
-from hanzoai.cloud.models.document_summary import DocumentSummary
-from hanzoai.cloud.models.document_view import DocumentView
-from hanzoai.cloud.models.domain_add_in import DomainAddIn
-from hanzoai.cloud.models.domain_view import DomainView
-from hanzoai.cloud.models.drift_board import DriftBoard
-from hanzoai.cloud.models.drift_flag import DriftFlag
-from hanzoai.cloud.models.drift_tally import DriftTally
-from hanzoai.cloud.models.dropped import Dropped
-from hanzoai.cloud.models.durable import Durable
-from hanzoai.cloud.models.ein import EIN
-from hanzoai.cloud.models.edge_state import EdgeState
-from hanzoai.cloud.models.ein_in import EinIn
-from hanzoai.cloud.models.embed_status_resp import EmbedStatusResp
-from hanzoai.cloud.models.enable_resp import EnableResp
-from hanzoai.cloud.models.enablement_board import EnablementBoard
-from hanzoai.cloud.models.enablement_opt_ref import EnablementOptRef
-from hanzoai.cloud.models.end_in import EndIn
-from hanzoai.cloud.models.endpoint import Endpoint
-from hanzoai.cloud.models.endpoint_list import EndpointList
-from hanzoai.cloud.models.endpoint_req import EndpointReq
-from hanzoai.cloud.models.endpoint_view import EndpointView
-from hanzoai.cloud.models.engine_advertisement import EngineAdvertisement
-from hanzoai.cloud.models.engine_status import EngineStatus
-from hanzoai.cloud.models.enroll_input import EnrollInput
-from hanzoai.cloud.models.enroll_req import EnrollReq
-from hanzoai.cloud.models.enroll_result import EnrollResult
-from hanzoai.cloud.models.enrollment import Enrollment
-from hanzoai.cloud.models.enrollment_list import EnrollmentList
-from hanzoai.cloud.models.enrolment import Enrolment
-from hanzoai.cloud.models.entitlements_view import EntitlementsView
-from hanzoai.cloud.models.entry import Entry
-from hanzoai.cloud.models.env_var_json import EnvVarJSON
-from hanzoai.cloud.models.environment_board import EnvironmentBoard
-from hanzoai.cloud.models.environment_row import EnvironmentRow
-from hanzoai.cloud.models.error_list import ErrorList
-from hanzoai.cloud.models.esign_complete_in import EsignCompleteIn
-from hanzoai.cloud.models.esign_completion import EsignCompletion
-from hanzoai.cloud.models.esign_document import EsignDocument
-from hanzoai.cloud.models.esign_documents import EsignDocuments
-from hanzoai.cloud.models.esign_event import EsignEvent
-from hanzoai.cloud.models.esign_field import EsignField
-from hanzoai.cloud.models.esign_field_in import EsignFieldIn
-from hanzoai.cloud.models.esign_health import EsignHealth
-from hanzoai.cloud.models.esign_insertion import EsignInsertion
-from hanzoai.cloud.models.esign_invite import EsignInvite
-from hanzoai.cloud.models.esign_link import EsignLink
-from hanzoai.cloud.models.esign_links import EsignLinks
-from hanzoai.cloud.models.esign_out import EsignOut
-from hanzoai.cloud.models.esign_pdf import EsignPDF
-from hanzoai.cloud.models.esign_placement import EsignPlacement
-from hanzoai.cloud.models.esign_recipient import EsignRecipient
-from hanzoai.cloud.models.esign_recipient_in import EsignRecipientIn
-from hanzoai.cloud.models.esign_reject_in import EsignRejectIn
-from hanzoai.cloud.models.esign_rejection import EsignRejection
-from hanzoai.cloud.models.esign_session import EsignSession
-from hanzoai.cloud.models.esign_signer import EsignSigner
-from hanzoai.cloud.models.esign_state import EsignState
-from hanzoai.cloud.models.esign_trail import EsignTrail
-from hanzoai.cloud.models.esign_upload_in import EsignUploadIn
-from hanzoai.cloud.models.esign_value_in import EsignValueIn
-from hanzoai.cloud.models.evaluate_in import EvaluateIn
-from hanzoai.cloud.models.evaluator_list import EvaluatorList
-from hanzoai.cloud.models.evaluator_req import EvaluatorReq
-from hanzoai.cloud.models.evaluator_view import EvaluatorView
-from hanzoai.cloud.models.event import Event
-from hanzoai.cloud.models.event_list import EventList
-from hanzoai.cloud.models.event_view import EventView
-from hanzoai.cloud.models.exception import Exception
-from hanzoai.cloud.models.exec_request import ExecRequest
-from hanzoai.cloud.models.exec_result import ExecResult
-from hanzoai.cloud.models.experiment_list import ExperimentList
-from hanzoai.cloud.models.extracted import Extracted
-from hanzoai.cloud.models.faq_list import FaqList
-from hanzoai.cloud.models.figure import Figure
-from hanzoai.cloud.models.file_content import FileContent
-from hanzoai.cloud.models.file_input import FileInput
-from hanzoai.cloud.models.file_json import FileJSON
-from hanzoai.cloud.models.files_json import FilesJSON
-from hanzoai.cloud.models.filing import Filing
-from hanzoai.cloud.models.filing_page import FilingPage
-from hanzoai.cloud.models.filing_reply import FilingReply
-from hanzoai.cloud.models.filing_request import FilingRequest
-from hanzoai.cloud.models.filters import Filters
-from hanzoai.cloud.models.finance_ledger_entry import FinanceLedgerEntry
-from hanzoai.cloud.models.financial_package import FinancialPackage
-from hanzoai.cloud.models.finding_list import FindingList
-from hanzoai.cloud.models.finding_view import FindingView
-from hanzoai.cloud.models.fleet_board import FleetBoard
-from hanzoai.cloud.models.fleet_metrics import FleetMetrics
-from hanzoai.cloud.models.fleet_spec import FleetSpec
-from hanzoai.cloud.models.fleet_summary import FleetSummary
-from hanzoai.cloud.models.fleet_unit import FleetUnit
-from hanzoai.cloud.models.flow import Flow
-from hanzoai.cloud.models.flow_action import FlowAction
-from hanzoai.cloud.models.flow_create import FlowCreate
-from hanzoai.cloud.models.flow_page import FlowPage
-from hanzoai.cloud.models.flow_run import FlowRun
-from hanzoai.cloud.models.flow_status import FlowStatus
-from hanzoai.cloud.models.flow_trigger import FlowTrigger
-from hanzoai.cloud.models.flow_update import FlowUpdate
-from hanzoai.cloud.models.flow_version import FlowVersion
-from hanzoai.cloud.models.fn_list import FnList
-from hanzoai.cloud.models.form import Form
-from hanzoai.cloud.models.formation import Formation
-from hanzoai.cloud.models.formation_view import FormationView
-from hanzoai.cloud.models.founder import Founder
-from hanzoai.cloud.models.founders_in import FoundersIn
-from hanzoai.cloud.models.frame import Frame
-from hanzoai.cloud.models.framework_list import FrameworkList
-from hanzoai.cloud.models.framework_row import FrameworkRow
-from hanzoai.cloud.models.function_detail import FunctionDetail
-from hanzoai.cloud.models.function_view import FunctionView
-from hanzoai.cloud.models.funnel import Funnel
-from hanzoai.cloud.models.gl_row import GLRow
-from hanzoai.cloud.models.gpu import GPU
-from hanzoai.cloud.models.gc_out import GcOut
-from hanzoai.cloud.models.generate_input import GenerateInput
-from hanzoai.cloud.models.generate_request import GenerateRequest
-from hanzoai.cloud.models.generate_result import GenerateResult
-from hanzoai.cloud.models.genesis import Genesis
-from hanzoai.cloud.models.git_ops_app import GitOpsApp
-from hanzoai.cloud.models.git_ops_deploy import GitOpsDeploy
-from hanzoai.cloud.models.git_ops_operation import GitOpsOperation
-from hanzoai.cloud.models.git_ops_plane import GitOpsPlane
-from hanzoai.cloud.models.git_origin import GitOrigin
-from hanzoai.cloud.models.git_source import GitSource
-from hanzoai.cloud.models.github_backfill_in import GithubBackfillIn
-from hanzoai.cloud.models.github_backfill_result import GithubBackfillResult
-from hanzoai.cloud.models.github_claim_in import GithubClaimIn
-from hanzoai.cloud.models.github_claim_out import GithubClaimOut
-from hanzoai.cloud.models.github_fork_out import GithubForkOut
-from hanzoai.cloud.models.github_fork_req import GithubForkReq
-from hanzoai.cloud.models.github_import_in import GithubImportIn
-from hanzoai.cloud.models.github_import_out import GithubImportOut
-from hanzoai.cloud.models.github_installation_view import GithubInstallationView
-from hanzoai.cloud.models.github_installations_out import GithubInstallationsOut
-from hanzoai.cloud.models.github_pages_build_out import GithubPagesBuildOut
-from hanzoai.cloud.models.github_pages_disabled_out import GithubPagesDisabledOut
-from hanzoai.cloud.models.github_pages_enable_req import GithubPagesEnableReq
-from hanzoai.cloud.models.github_pages_source import GithubPagesSource
-from hanzoai.cloud.models.github_pages_update_req import GithubPagesUpdateReq
-from hanzoai.cloud.models.github_pages_updated_out import GithubPagesUpdatedOut
-from hanzoai.cloud.models.github_pages_view import GithubPagesView
-from hanzoai.cloud.models.github_repo_view import GithubRepoView
-from hanzoai.cloud.models.github_repos_out import GithubReposOut
-from hanzoai.cloud.models.github_search_hit import GithubSearchHit
-from hanzoai.cloud.models.github_search_out import GithubSearchOut
-from hanzoai.cloud.models.github_search_req import GithubSearchReq
-from hanzoai.cloud.models.gitlab_project_view import GitlabProjectView
-from hanzoai.cloud.models.gitlab_projects_out import GitlabProjectsOut
-from hanzoai.cloud.models.gpu_alert_list import GpuAlertList
-from hanzoai.cloud.models.gpu_job import GpuJob
-from hanzoai.cloud.models.gpu_list import GpuList
-from hanzoai.cloud.models.gpu_view import GpuView
-from hanzoai.cloud.models.graph_assert_in import GraphAssertIn
-from hanzoai.cloud.models.graph_assert_out import GraphAssertOut
-from hanzoai.cloud.models.graph_edge import GraphEdge
-from hanzoai.cloud.models.graph_fact import GraphFact
-from hanzoai.cloud.models.graph_neighbors_in import GraphNeighborsIn
-from hanzoai.cloud.models.graph_neighbors_out import GraphNeighborsOut
-from hanzoai.cloud.models.graph_node import GraphNode
-from hanzoai.cloud.models.graph_out import GraphOut
-from hanzoai.cloud.models.graph_ql_error import GraphQLError
-from hanzoai.cloud.models.graph_qlin import GraphQLIn
-from hanzoai.cloud.models.graph_ql_out import GraphQLOut
-from hanzoai.cloud.models.graph_read_out import GraphReadOut
-from hanzoai.cloud.models.graph_resolve_in import GraphResolveIn
-from hanzoai.cloud.models.graph_resolve_out import GraphResolveOut
-from hanzoai.cloud.models.graph_vocabulary_out import GraphVocabularyOut
-from hanzoai.cloud.models.handle_request import HandleRequest
-from hanzoai.cloud.models.handle_set import HandleSet
-from hanzoai.cloud.models.health import Health
-from hanzoai.cloud.models.health_lens import HealthLens
-from hanzoai.cloud.models.health_lenses import HealthLenses
-from hanzoai.cloud.models.health_out import HealthOut
-from hanzoai.cloud.models.health_plane import HealthPlane
-from hanzoai.cloud.models.health_report import HealthReport
-from hanzoai.cloud.models.health_view import HealthView
-from hanzoai.cloud.models.help_article import HelpArticle
-from hanzoai.cloud.models.help_article_card import HelpArticleCard
-from hanzoai.cloud.models.help_article_list import HelpArticleList
-from hanzoai.cloud.models.help_category import HelpCategory
-from hanzoai.cloud.models.help_category_list import HelpCategoryList
-from hanzoai.cloud.models.help_ticket_filed import HelpTicketFiled
-from hanzoai.cloud.models.help_ticket_intake import HelpTicketIntake
-from hanzoai.cloud.models.history_out import HistoryOut
-from hanzoai.cloud.models.hit import Hit
-from hanzoai.cloud.models.holder import Holder
-from hanzoai.cloud.models.holding import Holding
-from hanzoai.cloud.models.holdings import Holdings
-from hanzoai.cloud.models.iam_account_body import IamAccountBody
-from hanzoai.cloud.models.iam_account_item import IamAccountItem
-from hanzoai.cloud.models.iam_address import IamAddress
-from hanzoai.cloud.models.iam_answer import IamAnswer
-from hanzoai.cloud.models.iam_application import IamApplication
-from hanzoai.cloud.models.iam_application_list_result import IamApplicationListResult
-from hanzoai.cloud.models.iam_assume_body import IamAssumeBody
-from hanzoai.cloud.models.iam_audit_log import IamAuditLog
-from hanzoai.cloud.models.iam_bulk import IamBulk
-from hanzoai.cloud.models.iam_cart_item import IamCartItem
-from hanzoai.cloud.models.iam_cert import IamCert
-from hanzoai.cloud.models.iam_certs_delete_output import IamCertsDeleteOutput
-from hanzoai.cloud.models.iam_certs_list_output import IamCertsListOutput
-from hanzoai.cloud.models.iam_config import IamConfig
-from hanzoai.cloud.models.iam_consent_record import IamConsentRecord
-from hanzoai.cloud.models.iam_create_input import IamCreateInput
-from hanzoai.cloud.models.iam_create_organization_input import IamCreateOrganizationInput
-from hanzoai.cloud.models.iam_create_session_in import IamCreateSessionIn
-from hanzoai.cloud.models.iam_delete_organization_output import IamDeleteOrganizationOutput
-from hanzoai.cloud.models.iam_delete_output import IamDeleteOutput
-from hanzoai.cloud.models.iam_delete_response import IamDeleteResponse
-from hanzoai.cloud.models.iam_delete_result import IamDeleteResult
-from hanzoai.cloud.models.iam_delete_session_out import IamDeleteSessionOut
-from hanzoai.cloud.models.iam_face_id import IamFaceId
-from hanzoai.cloud.models.iam_filter import IamFilter
-from hanzoai.cloud.models.iam_input import IamInput
-from hanzoai.cloud.models.iam_invitation import IamInvitation
-from hanzoai.cloud.models.iam_invitations_delete_output import IamInvitationsDeleteOutput
-from hanzoai.cloud.models.iam_invitations_input import IamInvitationsInput
-from hanzoai.cloud.models.iam_invitations_list_output import IamInvitationsListOutput
-from hanzoai.cloud.models.iam_jwt_item import IamJwtItem
-from hanzoai.cloud.models.iam_key import IamKey
-from hanzoai.cloud.models.iam_list_organizations_output import IamListOrganizationsOutput
-from hanzoai.cloud.models.iam_list_output import IamListOutput
-from hanzoai.cloud.models.iam_list_providers_out import IamListProvidersOut
-from hanzoai.cloud.models.iam_list_response import IamListResponse
-from hanzoai.cloud.models.iam_list_sessions_out import IamListSessionsOut
-from hanzoai.cloud.models.iam_list_tokens_out import IamListTokensOut
-from hanzoai.cloud.models.iam_list_webauthn_credentials_out import IamListWebauthnCredentialsOut
-from hanzoai.cloud.models.iam_managed_account import IamManagedAccount
-from hanzoai.cloud.models.iam_mfa_account import IamMfaAccount
-from hanzoai.cloud.models.iam_mfa_item import IamMfaItem
-from hanzoai.cloud.models.iam_mfa_props import IamMfaProps
-from hanzoai.cloud.models.iam_mutation_result import IamMutationResult
-from hanzoai.cloud.models.iam_organization import IamOrganization
-from hanzoai.cloud.models.iam_password_body import IamPasswordBody
-from hanzoai.cloud.models.iam_permission import IamPermission
-from hanzoai.cloud.models.iam_permission_delete_response import IamPermissionDeleteResponse
-from hanzoai.cloud.models.iam_permission_list_response import IamPermissionListResponse
-from hanzoai.cloud.models.iam_person import IamPerson
-from hanzoai.cloud.models.iam_project import IamProject
-from hanzoai.cloud.models.iam_projects_delete_output import IamProjectsDeleteOutput
-from hanzoai.cloud.models.iam_projects_input import IamProjectsInput
-from hanzoai.cloud.models.iam_projects_list_output import IamProjectsListOutput
-from hanzoai.cloud.models.iam_provider import IamProvider
-from hanzoai.cloud.models.iam_provider_item import IamProviderItem
-from hanzoai.cloud.models.iam_provider_result import IamProviderResult
-from hanzoai.cloud.models.iam_registration import IamRegistration
-from hanzoai.cloud.models.iam_reply import IamReply
-from hanzoai.cloud.models.iam_role import IamRole
-from hanzoai.cloud.models.iam_roles_delete_output import IamRolesDeleteOutput
-from hanzoai.cloud.models.iam_roles_input import IamRolesInput
-from hanzoai.cloud.models.iam_roles_list_output import IamRolesListOutput
-from hanzoai.cloud.models.iam_saml_item import IamSamlItem
-from hanzoai.cloud.models.iam_scheme import IamScheme
-from hanzoai.cloud.models.iam_scope_description import IamScopeDescription
-from hanzoai.cloud.models.iam_scope_item import IamScopeItem
-from hanzoai.cloud.models.iam_session import IamSession
-from hanzoai.cloud.models.iam_set_avatar_input import IamSetAvatarInput
-from hanzoai.cloud.models.iam_signin_item import IamSigninItem
-from hanzoai.cloud.models.iam_signin_method import IamSigninMethod
-from hanzoai.cloud.models.iam_signup_item import IamSignupItem
-from hanzoai.cloud.models.iam_theme_data import IamThemeData
-from hanzoai.cloud.models.iam_toggle import IamToggle
-from hanzoai.cloud.models.iam_token import IamToken
-from hanzoai.cloud.models.iam_token_mutation import IamTokenMutation
-from hanzoai.cloud.models.iam_token_result import IamTokenResult
-from hanzoai.cloud.models.iam_update_input import IamUpdateInput
-from hanzoai.cloud.models.iam_update_organization_input import IamUpdateOrganizationInput
-from hanzoai.cloud.models.iam_update_session_in import IamUpdateSessionIn
-from hanzoai.cloud.models.iam_user import IamUser
-from hanzoai.cloud.models.iam_users_delete_output import IamUsersDeleteOutput
-from hanzoai.cloud.models.iam_users_list_output import IamUsersListOutput
-from hanzoai.cloud.models.iam_webauthn_credential import IamWebauthnCredential
-from hanzoai.cloud.models.iam_webauthn_credential_mutation_result import IamWebauthnCredentialMutationResult
-from hanzoai.cloud.models.iam_webauthn_credential_result import IamWebauthnCredentialResult
-from hanzoai.cloud.models.iam_workspace import IamWorkspace
-from hanzoai.cloud.models.iam_workspaces_delete_output import IamWorkspacesDeleteOutput
-from hanzoai.cloud.models.iam_workspaces_input import IamWorkspacesInput
-from hanzoai.cloud.models.iam_workspaces_list_output import IamWorkspacesListOutput
-from hanzoai.cloud.models.image_origin import ImageOrigin
-from hanzoai.cloud.models.image_view import ImageView
-from hanzoai.cloud.models.import_cap_table_in import ImportCapTableIn
-from hanzoai.cloud.models.import_cap_table_out import ImportCapTableOut
-from hanzoai.cloud.models.import_documents_in import ImportDocumentsIn
-from hanzoai.cloud.models.import_documents_out import ImportDocumentsOut
-from hanzoai.cloud.models.inbox_item import InboxItem
-from hanzoai.cloud.models.inbox_out import InboxOut
-from hanzoai.cloud.models.inbox_page import InboxPage
-from hanzoai.cloud.models.inbox_view import InboxView
-from hanzoai.cloud.models.index import Index
-from hanzoai.cloud.models.index_count import IndexCount
-from hanzoai.cloud.models.index_documents import IndexDocuments
-from hanzoai.cloud.models.index_enqueued import IndexEnqueued
-from hanzoai.cloud.models.index_filter import IndexFilter
-from hanzoai.cloud.models.index_health import IndexHealth
-from hanzoai.cloud.models.index_hits import IndexHits
-from hanzoai.cloud.models.index_in import IndexIn
-from hanzoai.cloud.models.index_list import IndexList
-from hanzoai.cloud.models.index_new import IndexNew
-from hanzoai.cloud.models.index_query import IndexQuery
-from hanzoai.cloud.models.index_result import IndexResult
-from hanzoai.cloud.models.index_settings import IndexSettings
-from hanzoai.cloud.models.index_stats import IndexStats
-from hanzoai.cloud.models.index_task import IndexTask
-from hanzoai.cloud.models.index_version import IndexVersion
-from hanzoai.cloud.models.index_view import IndexView
-from hanzoai.cloud.models.indexer_view import IndexerView
-from hanzoai.cloud.models.indexers_out import IndexersOut
-from hanzoai.cloud.models.info_out import InfoOut
-from hanzoai.cloud.models.ingest_req import IngestReq
-from hanzoai.cloud.models.ingest_resp import IngestResp
-from hanzoai.cloud.models.ingress_middlewares import IngressMiddlewares
-from hanzoai.cloud.models.ingress_routes import IngressRoutes
-from hanzoai.cloud.models.ingress_services import IngressServices
-from hanzoai.cloud.models.ingress_status import IngressStatus
-from hanzoai.cloud.models.ingress_tls import IngressTLS
-from hanzoai.cloud.models.insights_body import InsightsBody
-from hanzoai.cloud.models.insights_event import InsightsEvent
-from hanzoai.cloud.models.insights_status import InsightsStatus
-from hanzoai.cloud.models.install import Install
-from hanzoai.cloud.models.install_req import InstallReq
-from hanzoai.cloud.models.install_state import InstallState
-from hanzoai.cloud.models.invocation_list import InvocationList
-from hanzoai.cloud.models.invocation_view import InvocationView
-from hanzoai.cloud.models.invoice import Invoice
-from hanzoai.cloud.models.invoice_line import InvoiceLine
-from hanzoai.cloud.models.invoice_line_item import InvoiceLineItem
-from hanzoai.cloud.models.invoices import Invoices
-from hanzoai.cloud.models.invoke_req import InvokeReq
-from hanzoai.cloud.models.issue_edit import IssueEdit
-from hanzoai.cloud.models.issue_hit import IssueHit
-from hanzoai.cloud.models.issue_hits import IssueHits
-from hanzoai.cloud.models.issue_view import IssueView
-from hanzoai.cloud.models.item_list import ItemList
-from hanzoai.cloud.models.item_req import ItemReq
-from hanzoai.cloud.models.item_result import ItemResult
-from hanzoai.cloud.models.item_view import ItemView
-from hanzoai.cloud.models.job_cancel import JobCancel
-from hanzoai.cloud.models.job_canceled import JobCanceled
-from hanzoai.cloud.models.job_list import JobList
-from hanzoai.cloud.models.journey_step import JourneyStep
-from hanzoai.cloud.models.judge_spec import JudgeSpec
-from hanzoai.cloud.models.kb_authorize_out import KbAuthorizeOut
-from hanzoai.cloud.models.kb_connectors_out import KbConnectorsOut
-from hanzoai.cloud.models.kb_sync_out import KbSyncOut
-from hanzoai.cloud.models.key_list import KeyList
-from hanzoai.cloud.models.key_type_in import KeyTypeIn
-from hanzoai.cloud.models.key_view import KeyView
-from hanzoai.cloud.models.kit_list import KitList
-from hanzoai.cloud.models.kms_config import KmsConfig
-from hanzoai.cloud.models.kms_health import KmsHealth
-from hanzoai.cloud.models.kms_login import KmsLogin
-from hanzoai.cloud.models.kms_put import KmsPut
-from hanzoai.cloud.models.kms_secrets import KmsSecrets
-from hanzoai.cloud.models.kms_stored import KmsStored
-from hanzoai.cloud.models.kms_token import KmsToken
-from hanzoai.cloud.models.kv_ack import KvAck
-from hanzoai.cloud.models.kv_entry import KvEntry
-from hanzoai.cloud.models.kv_page import KvPage
-from hanzoai.cloud.models.kv_write import KvWrite
-from hanzoai.cloud.models.kyc_refresh_out import KycRefreshOut
-from hanzoai.cloud.models.kyc_session import KycSession
-from hanzoai.cloud.models.kyc_start_out import KycStartOut
-from hanzoai.cloud.models.llm import LLM
-from hanzoai.cloud.models.llm_overview import LLMOverview
-from hanzoai.cloud.models.last_event_view import LastEventView
-from hanzoai.cloud.models.latency_stat import LatencyStat
-from hanzoai.cloud.models.leader_row import LeaderRow
-from hanzoai.cloud.models.leaderboard import Leaderboard
-from hanzoai.cloud.models.leaderboard_row import LeaderboardRow
-from hanzoai.cloud.models.leaderboard_view import LeaderboardView
-from hanzoai.cloud.models.lease_in import LeaseIn
-from hanzoai.cloud.models.leased import Leased
-from hanzoai.cloud.models.leg import Leg
-from hanzoai.cloud.models.legal_filing import LegalFiling
-from hanzoai.cloud.models.legal_health import LegalHealth
-from hanzoai.cloud.models.legal_signer import LegalSigner
-from hanzoai.cloud.models.legal_template import LegalTemplate
-from hanzoai.cloud.models.level_view import LevelView
-from hanzoai.cloud.models.licensing_device_signals import LicensingDeviceSignals
-from hanzoai.cloud.models.licensing_fingerprint_request import LicensingFingerprintRequest
-from hanzoai.cloud.models.licensing_fingerprint_response import LicensingFingerprintResponse
-from hanzoai.cloud.models.licensing_health_view import LicensingHealthView
-from hanzoai.cloud.models.licensing_issue_request import LicensingIssueRequest
-from hanzoai.cloud.models.licensing_issue_response import LicensingIssueResponse
-from hanzoai.cloud.models.licensing_jwk import LicensingJWK
-from hanzoai.cloud.models.licensing_pubkey_view import LicensingPubkeyView
-from hanzoai.cloud.models.licensing_release import LicensingRelease
-from hanzoai.cloud.models.licensing_release_asset import LicensingReleaseAsset
-from hanzoai.cloud.models.licensing_release_list import LicensingReleaseList
-from hanzoai.cloud.models.licensing_revocation_entry import LicensingRevocationEntry
-from hanzoai.cloud.models.licensing_revoke_request import LicensingRevokeRequest
-from hanzoai.cloud.models.licensing_revoke_response import LicensingRevokeResponse
-from hanzoai.cloud.models.licensing_verify_request import LicensingVerifyRequest
-from hanzoai.cloud.models.licensing_verify_response import LicensingVerifyResponse
-from hanzoai.cloud.models.limits_block import LimitsBlock
-from hanzoai.cloud.models.limits_view import LimitsView
-from hanzoai.cloud.models.line_item import LineItem
-from hanzoai.cloud.models.link import Link
-from hanzoai.cloud.models.link_list import LinkList
-from hanzoai.cloud.models.link_mint import LinkMint
-from hanzoai.cloud.models.link_view import LinkView
-from hanzoai.cloud.models.list_out import ListOut
-from hanzoai.cloud.models.listing import Listing
-from hanzoai.cloud.models.listing_page import ListingPage
-from hanzoai.cloud.models.liveness import Liveness
-from hanzoai.cloud.models.location import Location
-from hanzoai.cloud.models.log_body import LogBody
-from hanzoai.cloud.models.log_lines import LogLines
-from hanzoai.cloud.models.loss import Loss
-from hanzoai.cloud.models.mcp_error import MCPError
-from hanzoai.cloud.models.mcp_listing import MCPListing
-from hanzoai.cloud.models.mcp_package import MCPPackage
-from hanzoai.cloud.models.mcp_remote import MCPRemote
-from hanzoai.cloud.models.mcp_request import MCPRequest
-from hanzoai.cloud.models.mcp_response import MCPResponse
-from hanzoai.cloud.models.mcp_server import MCPServer
-from hanzoai.cloud.models.machine_list import MachineList
-from hanzoai.cloud.models.machine_view import MachineView
-from hanzoai.cloud.models.make_in import MakeIn
-from hanzoai.cloud.models.market_catalog import MarketCatalog
-from hanzoai.cloud.models.market_item import MarketItem
-from hanzoai.cloud.models.match import Match
-from hanzoai.cloud.models.mcp_catalog import McpCatalog
-from hanzoai.cloud.models.mcp_catalog_sync import McpCatalogSync
-from hanzoai.cloud.models.mcp_server_list import McpServerList
-from hanzoai.cloud.models.meet_health import MeetHealth
-from hanzoai.cloud.models.memory_entry import MemoryEntry
-from hanzoai.cloud.models.memory_page import MemoryPage
-from hanzoai.cloud.models.mesh_service_list import MeshServiceList
-from hanzoai.cloud.models.mesh_view import MeshView
-from hanzoai.cloud.models.message_input import MessageInput
-from hanzoai.cloud.models.message_list import MessageList
-from hanzoai.cloud.models.metric_body import MetricBody
-from hanzoai.cloud.models.metric_list import MetricList
-from hanzoai.cloud.models.metric_row import MetricRow
-from hanzoai.cloud.models.metrics import Metrics
-from hanzoai.cloud.models.metrics_response import MetricsResponse
-from hanzoai.cloud.models.metrics_view import MetricsView
-from hanzoai.cloud.models.middleware import Middleware
-from hanzoai.cloud.models.minted_key import MintedKey
-from hanzoai.cloud.models.mirror_list import MirrorList
-from hanzoai.cloud.models.mirror_req import MirrorReq
-from hanzoai.cloud.models.mirror_target_req import MirrorTargetReq
-from hanzoai.cloud.models.mirror_target_view import MirrorTargetView
-from hanzoai.cloud.models.ml_create import MlCreate
-from hanzoai.cloud.models.ml_resource import MlResource
-from hanzoai.cloud.models.ml_resource_list import MlResourceList
-from hanzoai.cloud.models.mode import Mode
-from hanzoai.cloud.models.mode_in import ModeIn
-from hanzoai.cloud.models.model_field import ModelField
-from hanzoai.cloud.models.model_history import ModelHistory
-from hanzoai.cloud.models.model_row import ModelRow
-from hanzoai.cloud.models.model_stat import ModelStat
-from hanzoai.cloud.models.module_info import ModuleInfo
-from hanzoai.cloud.models.module_list import ModuleList
-from hanzoai.cloud.models.module_state import ModuleState
-from hanzoai.cloud.models.mutate_req import MutateReq
-from hanzoai.cloud.models.my_referral_view import MyReferralView
-from hanzoai.cloud.models.my_referrals import MyReferrals
-from hanzoai.cloud.models.namespace_create_in import NamespaceCreateIn
-from hanzoai.cloud.models.network_list import NetworkList
-from hanzoai.cloud.models.network_view import NetworkView
-from hanzoai.cloud.models.new_issue import NewIssue
-from hanzoai.cloud.models.news_item import NewsItem
-from hanzoai.cloud.models.news_response import NewsResponse
-from hanzoai.cloud.models.next_in import NextIn
-from hanzoai.cloud.models.node_list import NodeList
-from hanzoai.cloud.models.node_pool_view import NodePoolView
-from hanzoai.cloud.models.node_view import NodeView
-from hanzoai.cloud.models.nodes_view import NodesView
-from hanzoai.cloud.models.notify_health import NotifyHealth
-from hanzoai.cloud.models.notify_send import NotifySend
-from hanzoai.cloud.models.number import Number
-from hanzoai.cloud.models.number_list import NumberList
-from hanzoai.cloud.models.o11y_aws_account_config import O11yAWSAccountConfig
-from hanzoai.cloud.models.o11y_aws_cloud_watch_logs_subscription import O11yAWSCloudWatchLogsSubscription
-from hanzoai.cloud.models.o11y_aws_cloud_watch_metric_stream_filter import O11yAWSCloudWatchMetricStreamFilter
-from hanzoai.cloud.models.o11y_aws_connection_artifact import O11yAWSConnectionArtifact
-from hanzoai.cloud.models.o11y_aws_integration_config import O11yAWSIntegrationConfig
-from hanzoai.cloud.models.o11y_aws_logs_collection_strategy import O11yAWSLogsCollectionStrategy
-from hanzoai.cloud.models.o11y_aws_metrics_collection_strategy import O11yAWSMetricsCollectionStrategy
-from hanzoai.cloud.models.o11y_aws_postable_account_config import O11yAWSPostableAccountConfig
-from hanzoai.cloud.models.o11y_aws_service_config import O11yAWSServiceConfig
-from hanzoai.cloud.models.o11y_aws_service_logs_config import O11yAWSServiceLogsConfig
-from hanzoai.cloud.models.o11y_aws_service_metrics_config import O11yAWSServiceMetricsConfig
-from hanzoai.cloud.models.o11y_aws_telemetry_collection_strategy import O11yAWSTelemetryCollectionStrategy
-from hanzoai.cloud.models.o11y_account import O11yAccount
-from hanzoai.cloud.models.o11y_account_config import O11yAccountConfig
-from hanzoai.cloud.models.o11y_add_items_in import O11yAddItemsIn
-from hanzoai.cloud.models.o11y_agent_report import O11yAgentReport
-from hanzoai.cloud.models.o11y_aggregate_attribute_response import O11yAggregateAttributeResponse
-from hanzoai.cloud.models.o11y_alert import O11yAlert
-from hanzoai.cloud.models.o11y_alert_status import O11yAlertStatus
-from hanzoai.cloud.models.o11y_alertmanagertypes_receiver import O11yAlertmanagertypesReceiver
-from hanzoai.cloud.models.o11y_ann_item_list import O11yAnnItemList
-from hanzoai.cloud.models.o11y_ann_item_view import O11yAnnItemView
-from hanzoai.cloud.models.o11y_ann_items_created import O11yAnnItemsCreated
-from hanzoai.cloud.models.o11y_ann_queue_deleted import O11yAnnQueueDeleted
-from hanzoai.cloud.models.o11y_ann_queue_detail_view import O11yAnnQueueDetailView
-from hanzoai.cloud.models.o11y_ann_queue_list import O11yAnnQueueList
-from hanzoai.cloud.models.o11y_ann_queue_view import O11yAnnQueueView
-from hanzoai.cloud.models.o11y_associated_component import O11yAssociatedComponent
-from hanzoai.cloud.models.o11y_attribute_key import O11yAttributeKey
-from hanzoai.cloud.models.o11y_attributes_component_entry import O11yAttributesComponentEntry
-from hanzoai.cloud.models.o11y_authorization import O11yAuthorization
-from hanzoai.cloud.models.o11y_availability_point import O11yAvailabilityPoint
-from hanzoai.cloud.models.o11y_availability_response import O11yAvailabilityResponse
-from hanzoai.cloud.models.o11y_availability_response_range import O11yAvailabilityResponseRange
-from hanzoai.cloud.models.o11y_azure_account_config import O11yAzureAccountConfig
-from hanzoai.cloud.models.o11y_azure_connection_artifact import O11yAzureConnectionArtifact
-from hanzoai.cloud.models.o11y_azure_integration_config import O11yAzureIntegrationConfig
-from hanzoai.cloud.models.o11y_azure_logs_collection_strategy import O11yAzureLogsCollectionStrategy
-from hanzoai.cloud.models.o11y_azure_service_config import O11yAzureServiceConfig
-from hanzoai.cloud.models.o11y_azure_service_logs_config import O11yAzureServiceLogsConfig
-from hanzoai.cloud.models.o11y_azure_service_metrics_config import O11yAzureServiceMetricsConfig
-from hanzoai.cloud.models.o11y_azure_telemetry_collection_strategy import O11yAzureTelemetryCollectionStrategy
-from hanzoai.cloud.models.o11y_basic_auth import O11yBasicAuth
-from hanzoai.cloud.models.o11y_builder_query import O11yBuilderQuery
-from hanzoai.cloud.models.o11y_channel import O11yChannel
-from hanzoai.cloud.models.o11y_checks import O11yChecks
-from hanzoai.cloud.models.o11y_cloud_integration_service import O11yCloudIntegrationService
-from hanzoai.cloud.models.o11y_cluster_list_record import O11yClusterListRecord
-from hanzoai.cloud.models.o11y_cluster_list_request import O11yClusterListRequest
-from hanzoai.cloud.models.o11y_cluster_list_response import O11yClusterListResponse
-from hanzoai.cloud.models.o11y_cluster_record import O11yClusterRecord
-from hanzoai.cloud.models.o11y_clusters import O11yClusters
-from hanzoai.cloud.models.o11y_collected_log_attribute import O11yCollectedLogAttribute
-from hanzoai.cloud.models.o11y_collected_metric import O11yCollectedMetric
-from hanzoai.cloud.models.o11y_composite_query import O11yCompositeQuery
-from hanzoai.cloud.models.o11y_connection_artifact import O11yConnectionArtifact
-from hanzoai.cloud.models.o11y_create_queue_req import O11yCreateQueueReq
-from hanzoai.cloud.models.o11y_credentials import O11yCredentials
-from hanzoai.cloud.models.o11y_daemon_set_list_record import O11yDaemonSetListRecord
-from hanzoai.cloud.models.o11y_daemon_set_list_request import O11yDaemonSetListRequest
-from hanzoai.cloud.models.o11y_daemon_set_list_response import O11yDaemonSetListResponse
-from hanzoai.cloud.models.o11y_daemon_set_record import O11yDaemonSetRecord
-from hanzoai.cloud.models.o11y_daemon_sets import O11yDaemonSets
-from hanzoai.cloud.models.o11y_data_collected import O11yDataCollected
-from hanzoai.cloud.models.o11y_data_collected_for_integration import O11yDataCollectedForIntegration
-from hanzoai.cloud.models.o11y_datastore_query import O11yDatastoreQuery
-from hanzoai.cloud.models.o11y_deployment import O11yDeployment
-from hanzoai.cloud.models.o11y_deployment_list_record import O11yDeploymentListRecord
-from hanzoai.cloud.models.o11y_deployment_list_request import O11yDeploymentListRequest
-from hanzoai.cloud.models.o11y_deployment_list_response import O11yDeploymentListResponse
-from hanzoai.cloud.models.o11y_deployment_record import O11yDeploymentRecord
-from hanzoai.cloud.models.o11y_deployments import O11yDeployments
-from hanzoai.cloud.models.o11y_deprecated_gettable_alert import O11yDeprecatedGettableAlert
-from hanzoai.cloud.models.o11y_discord_config import O11yDiscordConfig
-from hanzoai.cloud.models.o11y_email_config import O11yEmailConfig
-from hanzoai.cloud.models.o11y_event import O11yEvent
-from hanzoai.cloud.models.o11y_filter import O11yFilter
-from hanzoai.cloud.models.o11y_filter_attribute_key_response import O11yFilterAttributeKeyResponse
-from hanzoai.cloud.models.o11y_filter_attribute_value_request import O11yFilterAttributeValueRequest
-from hanzoai.cloud.models.o11y_filter_attribute_value_response import O11yFilterAttributeValueResponse
-from hanzoai.cloud.models.o11y_filter_item import O11yFilterItem
-from hanzoai.cloud.models.o11y_filter_set import O11yFilterSet
-from hanzoai.cloud.models.o11y_flamegraph_span import O11yFlamegraphSpan
-from hanzoai.cloud.models.o11y_format_options import O11yFormatOptions
-from hanzoai.cloud.models.o11y_function import O11yFunction
-from hanzoai.cloud.models.o11y_funnel_step import O11yFunnelStep
-from hanzoai.cloud.models.o11y_gcp_account_config import O11yGCPAccountConfig
-from hanzoai.cloud.models.o11y_gcp_service_config import O11yGCPServiceConfig
-from hanzoai.cloud.models.o11y_gcp_service_logs_config import O11yGCPServiceLogsConfig
-from hanzoai.cloud.models.o11y_gcp_service_metrics_config import O11yGCPServiceMetricsConfig
-from hanzoai.cloud.models.o11y_gettable_account_with_connection_artifact import O11yGettableAccountWithConnectionArtifact
-from hanzoai.cloud.models.o11y_gettable_accounts import O11yGettableAccounts
-from hanzoai.cloud.models.o11y_gettable_agent_check_in import O11yGettableAgentCheckIn
-from hanzoai.cloud.models.o11y_gettable_created_ingestion_key import O11yGettableCreatedIngestionKey
-from hanzoai.cloud.models.o11y_gettable_created_ingestion_key_limit import O11yGettableCreatedIngestionKeyLimit
-from hanzoai.cloud.models.o11y_gettable_field_keys import O11yGettableFieldKeys
-from hanzoai.cloud.models.o11y_gettable_field_values import O11yGettableFieldValues
-from hanzoai.cloud.models.o11y_gettable_flamegraph_trace import O11yGettableFlamegraphTrace
-from hanzoai.cloud.models.o11y_gettable_funnel import O11yGettableFunnel
-from hanzoai.cloud.models.o11y_gettable_host import O11yGettableHost
-from hanzoai.cloud.models.o11y_gettable_ingestion_keys import O11yGettableIngestionKeys
-from hanzoai.cloud.models.o11y_gettable_route_policy import O11yGettableRoutePolicy
-from hanzoai.cloud.models.o11y_gettable_rule_state_history import O11yGettableRuleStateHistory
-from hanzoai.cloud.models.o11y_gettable_rule_state_history_contributor import O11yGettableRuleStateHistoryContributor
-from hanzoai.cloud.models.o11y_gettable_rule_state_history_stats import O11yGettableRuleStateHistoryStats
-from hanzoai.cloud.models.o11y_gettable_rule_state_timeline import O11yGettableRuleStateTimeline
-from hanzoai.cloud.models.o11y_gettable_rule_state_window import O11yGettableRuleStateWindow
-from hanzoai.cloud.models.o11y_gettable_services_metadata import O11yGettableServicesMetadata
-from hanzoai.cloud.models.o11y_gettable_span_mapper_groups import O11yGettableSpanMapperGroups
-from hanzoai.cloud.models.o11y_gettable_span_mappers import O11yGettableSpanMappers
-from hanzoai.cloud.models.o11y_gettable_test_rule import O11yGettableTestRule
-from hanzoai.cloud.models.o11y_gettable_trace_aggregations import O11yGettableTraceAggregations
-from hanzoai.cloud.models.o11y_gettable_waterfall_trace import O11yGettableWaterfallTrace
-from hanzoai.cloud.models.o11y_google_chat_receiver_config import O11yGoogleChatReceiverConfig
-from hanzoai.cloud.models.o11y_group_by_key import O11yGroupByKey
-from hanzoai.cloud.models.o11y_http_client_config import O11yHTTPClientConfig
-from hanzoai.cloud.models.o11y_having import O11yHaving
-from hanzoai.cloud.models.o11y_host import O11yHost
-from hanzoai.cloud.models.o11y_host_filter import O11yHostFilter
-from hanzoai.cloud.models.o11y_host_list_record import O11yHostListRecord
-from hanzoai.cloud.models.o11y_host_list_request import O11yHostListRequest
-from hanzoai.cloud.models.o11y_host_list_response import O11yHostListResponse
-from hanzoai.cloud.models.o11y_host_record import O11yHostRecord
-from hanzoai.cloud.models.o11y_hosts import O11yHosts
-from hanzoai.cloud.models.o11y_incidentio_config import O11yIncidentioConfig
-from hanzoai.cloud.models.o11y_ingestion_key import O11yIngestionKey
-from hanzoai.cloud.models.o11y_install_integration_request import O11yInstallIntegrationRequest
-from hanzoai.cloud.models.o11y_installed_integration import O11yInstalledIntegration
-from hanzoai.cloud.models.o11y_integration import O11yIntegration
-from hanzoai.cloud.models.o11y_integration_assets import O11yIntegrationAssets
-from hanzoai.cloud.models.o11y_integration_author import O11yIntegrationAuthor
-from hanzoai.cloud.models.o11y_integration_config import O11yIntegrationConfig
-from hanzoai.cloud.models.o11y_integration_config_step import O11yIntegrationConfigStep
-from hanzoai.cloud.models.o11y_integration_connection_status import O11yIntegrationConnectionStatus
-from hanzoai.cloud.models.o11y_integration_connection_tests import O11yIntegrationConnectionTests
-from hanzoai.cloud.models.o11y_integrations_collected_log_attribute import O11yIntegrationsCollectedLogAttribute
-from hanzoai.cloud.models.o11y_integrations_collected_metric import O11yIntegrationsCollectedMetric
-from hanzoai.cloud.models.o11y_integrations_list_item import O11yIntegrationsListItem
-from hanzoai.cloud.models.o11y_integrations_list_response import O11yIntegrationsListResponse
-from hanzoai.cloud.models.o11y_item_input import O11yItemInput
-from hanzoai.cloud.models.o11y_jira_config import O11yJiraConfig
-from hanzoai.cloud.models.o11y_jira_field_config import O11yJiraFieldConfig
-from hanzoai.cloud.models.o11y_job_list_record import O11yJobListRecord
-from hanzoai.cloud.models.o11y_job_list_request import O11yJobListRequest
-from hanzoai.cloud.models.o11y_job_list_response import O11yJobListResponse
-from hanzoai.cloud.models.o11y_job_record import O11yJobRecord
-from hanzoai.cloud.models.o11y_jobs import O11yJobs
-from hanzoai.cloud.models.o11y_label import O11yLabel
-from hanzoai.cloud.models.o11y_limit import O11yLimit
-from hanzoai.cloud.models.o11y_limit_config import O11yLimitConfig
-from hanzoai.cloud.models.o11y_limit_metric import O11yLimitMetric
-from hanzoai.cloud.models.o11y_limit_metric_value import O11yLimitMetricValue
-from hanzoai.cloud.models.o11y_limit_value import O11yLimitValue
-from hanzoai.cloud.models.o11y_list_meta import O11yListMeta
-from hanzoai.cloud.models.o11y_logs_assets import O11yLogsAssets
-from hanzoai.cloud.models.o11y_logs_connection_test import O11yLogsConnectionTest
-from hanzoai.cloud.models.o11y_ms_teams_config import O11yMSTeamsConfig
-from hanzoai.cloud.models.o11y_ms_teams_v2_config import O11yMSTeamsV2Config
-from hanzoai.cloud.models.o11y_mattermost_attachment import O11yMattermostAttachment
-from hanzoai.cloud.models.o11y_mattermost_config import O11yMattermostConfig
-from hanzoai.cloud.models.o11y_mattermost_field import O11yMattermostField
-from hanzoai.cloud.models.o11y_mattermost_priority import O11yMattermostPriority
-from hanzoai.cloud.models.o11y_mattermost_props import O11yMattermostProps
-from hanzoai.cloud.models.o11y_metrics_component_entry import O11yMetricsComponentEntry
-from hanzoai.cloud.models.o11y_metrics_response import O11yMetricsResponse
-from hanzoai.cloud.models.o11y_metrics_response_range import O11yMetricsResponseRange
-from hanzoai.cloud.models.o11y_metrics_response_series import O11yMetricsResponseSeries
-from hanzoai.cloud.models.o11y_metrics_response_summary import O11yMetricsResponseSummary
-from hanzoai.cloud.models.o11y_metrics_response_usage import O11yMetricsResponseUsage
-from hanzoai.cloud.models.o11y_missing_attributes_component_entry import O11yMissingAttributesComponentEntry
-from hanzoai.cloud.models.o11y_missing_metrics_component_entry import O11yMissingMetricsComponentEntry
-from hanzoai.cloud.models.o11y_namespace_list_record import O11yNamespaceListRecord
-from hanzoai.cloud.models.o11y_namespace_list_request import O11yNamespaceListRequest
-from hanzoai.cloud.models.o11y_namespace_list_response import O11yNamespaceListResponse
-from hanzoai.cloud.models.o11y_namespace_record import O11yNamespaceRecord
-from hanzoai.cloud.models.o11y_namespaces import O11yNamespaces
-from hanzoai.cloud.models.o11y_node_count_by_condition import O11yNodeCountByCondition
-from hanzoai.cloud.models.o11y_node_counts_by_readiness import O11yNodeCountsByReadiness
-from hanzoai.cloud.models.o11y_node_list_record import O11yNodeListRecord
-from hanzoai.cloud.models.o11y_node_list_request import O11yNodeListRequest
-from hanzoai.cloud.models.o11y_node_list_response import O11yNodeListResponse
-from hanzoai.cloud.models.o11y_node_record import O11yNodeRecord
-from hanzoai.cloud.models.o11y_nodes import O11yNodes
-from hanzoai.cloud.models.o11y_notifier_config import O11yNotifierConfig
-from hanzoai.cloud.models.o11y_o11y_api_key import O11yO11yAPIKey
-from hanzoai.cloud.models.o11y_o11y_api_key_create_in import O11yO11yAPIKeyCreateIn
-from hanzoai.cloud.models.o11y_o11y_api_key_create_out import O11yO11yAPIKeyCreateOut
-from hanzoai.cloud.models.o11y_o11y_api_key_secret import O11yO11yAPIKeySecret
-from hanzoai.cloud.models.o11y_o11y_api_key_update_in import O11yO11yAPIKeyUpdateIn
-from hanzoai.cloud.models.o11y_o11y_api_keys_out import O11yO11yAPIKeysOut
-from hanzoai.cloud.models.o11y_o11y_account_out import O11yO11yAccountOut
-from hanzoai.cloud.models.o11y_o11y_accounts_out import O11yO11yAccountsOut
-from hanzoai.cloud.models.o11y_o11y_ack import O11yO11yAck
-from hanzoai.cloud.models.o11y_o11y_affected_asset import O11yO11yAffectedAsset
-from hanzoai.cloud.models.o11y_o11y_affected_widget import O11yO11yAffectedWidget
-from hanzoai.cloud.models.o11y_o11y_agent_check_in_in import O11yO11yAgentCheckInIn
-from hanzoai.cloud.models.o11y_o11y_agent_check_in_out import O11yO11yAgentCheckInOut
-from hanzoai.cloud.models.o11y_o11y_aggregate_attributes_out import O11yO11yAggregateAttributesOut
-from hanzoai.cloud.models.o11y_o11y_aggregation import O11yO11yAggregation
-from hanzoai.cloud.models.o11y_o11y_aggregation_meta import O11yO11yAggregationMeta
-from hanzoai.cloud.models.o11y_o11y_alerts_out import O11yO11yAlertsOut
-from hanzoai.cloud.models.o11y_o11y_analyze_in import O11yO11yAnalyzeIn
-from hanzoai.cloud.models.o11y_o11y_analyze_out import O11yO11yAnalyzeOut
-from hanzoai.cloud.models.o11y_o11y_apdex_out import O11yO11yApdexOut
-from hanzoai.cloud.models.o11y_o11y_apdex_set_in import O11yO11yApdexSetIn
-from hanzoai.cloud.models.o11y_o11y_apdex_set_out import O11yO11yApdexSetOut
-from hanzoai.cloud.models.o11y_o11y_apdex_settings import O11yO11yApdexSettings
-from hanzoai.cloud.models.o11y_o11y_attribute_key import O11yO11yAttributeKey
-from hanzoai.cloud.models.o11y_o11y_attribute_keys_out import O11yO11yAttributeKeysOut
-from hanzoai.cloud.models.o11y_o11y_attribute_mapping import O11yO11yAttributeMapping
-from hanzoai.cloud.models.o11y_o11y_attribute_values_out import O11yO11yAttributeValuesOut
-from hanzoai.cloud.models.o11y_o11y_auth_domain import O11yO11yAuthDomain
-from hanzoai.cloud.models.o11y_o11y_auth_domain_config import O11yO11yAuthDomainConfig
-from hanzoai.cloud.models.o11y_o11y_auth_domain_out import O11yO11yAuthDomainOut
-from hanzoai.cloud.models.o11y_o11y_auth_domains_out import O11yO11yAuthDomainsOut
-from hanzoai.cloud.models.o11y_o11y_auth_n_provider_info import O11yO11yAuthNProviderInfo
-from hanzoai.cloud.models.o11y_o11y_auth_n_support import O11yO11yAuthNSupport
-from hanzoai.cloud.models.o11y_o11y_bulk_invite_in import O11yO11yBulkInviteIn
-from hanzoai.cloud.models.o11y_o11y_callback_auth_n import O11yO11yCallbackAuthN
-from hanzoai.cloud.models.o11y_o11y_change_password_in import O11yO11yChangePasswordIn
-from hanzoai.cloud.models.o11y_o11y_channel_out import O11yO11yChannelOut
-from hanzoai.cloud.models.o11y_o11y_channel_update_in import O11yO11yChannelUpdateIn
-from hanzoai.cloud.models.o11y_o11y_channels_out import O11yO11yChannelsOut
-from hanzoai.cloud.models.o11y_o11y_check_out import O11yO11yCheckOut
-from hanzoai.cloud.models.o11y_o11y_cluster_list_out import O11yO11yClusterListOut
-from hanzoai.cloud.models.o11y_o11y_column_info import O11yO11yColumnInfo
-from hanzoai.cloud.models.o11y_o11y_connection_status_out import O11yO11yConnectionStatusOut
-from hanzoai.cloud.models.o11y_o11y_create_account_in import O11yO11yCreateAccountIn
-from hanzoai.cloud.models.o11y_o11y_create_account_out import O11yO11yCreateAccountOut
-from hanzoai.cloud.models.o11y_o11y_create_limit_in import O11yO11yCreateLimitIn
-from hanzoai.cloud.models.o11y_o11y_created import O11yO11yCreated
-from hanzoai.cloud.models.o11y_o11y_created_ingestion_key_out import O11yO11yCreatedIngestionKeyOut
-from hanzoai.cloud.models.o11y_o11y_created_limit_out import O11yO11yCreatedLimitOut
-from hanzoai.cloud.models.o11y_o11y_created_out import O11yO11yCreatedOut
-from hanzoai.cloud.models.o11y_o11y_credentials_out import O11yO11yCredentialsOut
-from hanzoai.cloud.models.o11y_o11y_daemon_set_list_out import O11yO11yDaemonSetListOut
-from hanzoai.cloud.models.o11y_o11y_dashboard import O11yO11yDashboard
-from hanzoai.cloud.models.o11y_o11y_dashboard_display import O11yO11yDashboardDisplay
-from hanzoai.cloud.models.o11y_o11y_dashboard_list import O11yO11yDashboardList
-from hanzoai.cloud.models.o11y_o11y_dashboard_list_for_user import O11yO11yDashboardListForUser
-from hanzoai.cloud.models.o11y_o11y_dashboard_list_for_user_out import O11yO11yDashboardListForUserOut
-from hanzoai.cloud.models.o11y_o11y_dashboard_list_item import O11yO11yDashboardListItem
-from hanzoai.cloud.models.o11y_o11y_dashboard_list_item_for_user import O11yO11yDashboardListItemForUser
-from hanzoai.cloud.models.o11y_o11y_dashboard_list_out import O11yO11yDashboardListOut
-from hanzoai.cloud.models.o11y_o11y_dashboard_list_spec import O11yO11yDashboardListSpec
-from hanzoai.cloud.models.o11y_o11y_dashboard_out import O11yO11yDashboardOut
-from hanzoai.cloud.models.o11y_o11y_dashboard_patch_in import O11yO11yDashboardPatchIn
-from hanzoai.cloud.models.o11y_o11y_dashboard_patch_op import O11yO11yDashboardPatchOp
-from hanzoai.cloud.models.o11y_o11y_dashboard_postable import O11yO11yDashboardPostable
-from hanzoai.cloud.models.o11y_o11y_dashboard_postable_tag import O11yO11yDashboardPostableTag
-from hanzoai.cloud.models.o11y_o11y_dashboard_tag import O11yO11yDashboardTag
-from hanzoai.cloud.models.o11y_o11y_dashboard_update_in import O11yO11yDashboardUpdateIn
-from hanzoai.cloud.models.o11y_o11y_dashboard_var_values import O11yO11yDashboardVarValues
-from hanzoai.cloud.models.o11y_o11y_dashboard_vars_in import O11yO11yDashboardVarsIn
-from hanzoai.cloud.models.o11y_o11y_dashboard_vars_out import O11yO11yDashboardVarsOut
-from hanzoai.cloud.models.o11y_o11y_dashboard_view import O11yO11yDashboardView
-from hanzoai.cloud.models.o11y_o11y_dashboard_view_data import O11yO11yDashboardViewData
-from hanzoai.cloud.models.o11y_o11y_dashboard_view_list import O11yO11yDashboardViewList
-from hanzoai.cloud.models.o11y_o11y_dashboard_view_list_out import O11yO11yDashboardViewListOut
-from hanzoai.cloud.models.o11y_o11y_dashboard_view_out import O11yO11yDashboardViewOut
-from hanzoai.cloud.models.o11y_o11y_dashboard_view_postable import O11yO11yDashboardViewPostable
-from hanzoai.cloud.models.o11y_o11y_dashboard_view_update_in import O11yO11yDashboardViewUpdateIn
-from hanzoai.cloud.models.o11y_o11y_dependency import O11yO11yDependency
-from hanzoai.cloud.models.o11y_o11y_dependency_graph_in import O11yO11yDependencyGraphIn
-from hanzoai.cloud.models.o11y_o11y_deployment_list_out import O11yO11yDeploymentListOut
-from hanzoai.cloud.models.o11y_o11y_deprecated_user import O11yO11yDeprecatedUser
-from hanzoai.cloud.models.o11y_o11y_deprecated_user_out import O11yO11yDeprecatedUserOut
-from hanzoai.cloud.models.o11y_o11y_deprecated_user_update import O11yO11yDeprecatedUserUpdate
-from hanzoai.cloud.models.o11y_o11y_deprecated_users_out import O11yO11yDeprecatedUsersOut
-from hanzoai.cloud.models.o11y_o11y_discover_in import O11yO11yDiscoverIn
-from hanzoai.cloud.models.o11y_o11y_discover_out import O11yO11yDiscoverOut
-from hanzoai.cloud.models.o11y_o11y_disk import O11yO11yDisk
-from hanzoai.cloud.models.o11y_o11y_domain_filter import O11yO11yDomainFilter
-from hanzoai.cloud.models.o11y_o11y_domain_group_by import O11yO11yDomainGroupBy
-from hanzoai.cloud.models.o11y_o11y_domains_answer import O11yO11yDomainsAnswer
-from hanzoai.cloud.models.o11y_o11y_domains_data import O11yO11yDomainsData
-from hanzoai.cloud.models.o11y_o11y_domains_in import O11yO11yDomainsIn
-from hanzoai.cloud.models.o11y_o11y_domains_out import O11yO11yDomainsOut
-from hanzoai.cloud.models.o11y_o11y_downtime_schedule_out import O11yO11yDowntimeScheduleOut
-from hanzoai.cloud.models.o11y_o11y_downtime_schedules_out import O11yO11yDowntimeSchedulesOut
-from hanzoai.cloud.models.o11y_o11y_downtime_update_in import O11yO11yDowntimeUpdateIn
-from hanzoai.cloud.models.o11y_o11y_draft_funnel_in import O11yO11yDraftFunnelIn
-from hanzoai.cloud.models.o11y_o11y_email_password_session_in import O11yO11yEmailPasswordSessionIn
-from hanzoai.cloud.models.o11y_o11y_error_detail import O11yO11yErrorDetail
-from hanzoai.cloud.models.o11y_o11y_error_gettable_issue import O11yO11yErrorGettableIssue
-from hanzoai.cloud.models.o11y_o11y_error_gettable_issue_out import O11yO11yErrorGettableIssueOut
-from hanzoai.cloud.models.o11y_o11y_error_issue import O11yO11yErrorIssue
-from hanzoai.cloud.models.o11y_o11y_error_issue_out import O11yO11yErrorIssueOut
-from hanzoai.cloud.models.o11y_o11y_error_issues import O11yO11yErrorIssues
-from hanzoai.cloud.models.o11y_o11y_error_issues_out import O11yO11yErrorIssuesOut
-from hanzoai.cloud.models.o11y_o11y_error_item import O11yO11yErrorItem
-from hanzoai.cloud.models.o11y_o11y_error_update_issue_in import O11yO11yErrorUpdateIssueIn
-from hanzoai.cloud.models.o11y_o11y_error_with_span import O11yO11yErrorWithSpan
-from hanzoai.cloud.models.o11y_o11y_errors_count_in import O11yO11yErrorsCountIn
-from hanzoai.cloud.models.o11y_o11y_errors_list_in import O11yO11yErrorsListIn
-from hanzoai.cloud.models.o11y_o11y_event import O11yO11yEvent
-from hanzoai.cloud.models.o11y_o11y_event_in import O11yO11yEventIn
-from hanzoai.cloud.models.o11y_o11y_event_user import O11yO11yEventUser
-from hanzoai.cloud.models.o11y_o11y_events import O11yO11yEvents
-from hanzoai.cloud.models.o11y_o11y_feature import O11yO11yFeature
-from hanzoai.cloud.models.o11y_o11y_features_out import O11yO11yFeaturesOut
-from hanzoai.cloud.models.o11y_o11y_field_catalog_out import O11yO11yFieldCatalogOut
-from hanzoai.cloud.models.o11y_o11y_field_keys_out import O11yO11yFieldKeysOut
-from hanzoai.cloud.models.o11y_o11y_field_setting import O11yO11yFieldSetting
-from hanzoai.cloud.models.o11y_o11y_field_values_out import O11yO11yFieldValuesOut
-from hanzoai.cloud.models.o11y_o11y_filter import O11yO11yFilter
-from hanzoai.cloud.models.o11y_o11y_filter_item import O11yO11yFilterItem
-from hanzoai.cloud.models.o11y_o11y_filter_key import O11yO11yFilterKey
-from hanzoai.cloud.models.o11y_o11y_filter_set import O11yO11yFilterSet
-from hanzoai.cloud.models.o11y_o11y_filter_suggestions import O11yO11yFilterSuggestions
-from hanzoai.cloud.models.o11y_o11y_filter_suggestions_out import O11yO11yFilterSuggestionsOut
-from hanzoai.cloud.models.o11y_o11y_forgot_password_in import O11yO11yForgotPasswordIn
-from hanzoai.cloud.models.o11y_o11y_frame import O11yO11yFrame
-from hanzoai.cloud.models.o11y_o11y_funnel_create_in import O11yO11yFunnelCreateIn
-from hanzoai.cloud.models.o11y_o11y_funnel_delete_out import O11yO11yFunnelDeleteOut
-from hanzoai.cloud.models.o11y_o11y_funnel_out import O11yO11yFunnelOut
-from hanzoai.cloud.models.o11y_o11y_funnel_row import O11yO11yFunnelRow
-from hanzoai.cloud.models.o11y_o11y_funnel_rows_out import O11yO11yFunnelRowsOut
-from hanzoai.cloud.models.o11y_o11y_funnel_step_window_in import O11yO11yFunnelStepWindowIn
-from hanzoai.cloud.models.o11y_o11y_funnel_steps_update_in import O11yO11yFunnelStepsUpdateIn
-from hanzoai.cloud.models.o11y_o11y_funnel_update_in import O11yO11yFunnelUpdateIn
-from hanzoai.cloud.models.o11y_o11y_funnel_window_in import O11yO11yFunnelWindowIn
-from hanzoai.cloud.models.o11y_o11y_funnels_out import O11yO11yFunnelsOut
-from hanzoai.cloud.models.o11y_o11y_gettable_host_out import O11yO11yGettableHostOut
-from hanzoai.cloud.models.o11y_o11y_global_config import O11yO11yGlobalConfig
-from hanzoai.cloud.models.o11y_o11y_global_config_out import O11yO11yGlobalConfigOut
-from hanzoai.cloud.models.o11y_o11y_google_config import O11yO11yGoogleConfig
-from hanzoai.cloud.models.o11y_o11y_health_out import O11yO11yHealthOut
-from hanzoai.cloud.models.o11y_o11y_host_list_out import O11yO11yHostListOut
-from hanzoai.cloud.models.o11y_o11y_ident_n import O11yO11yIdentN
-from hanzoai.cloud.models.o11y_o11y_identifiable import O11yO11yIdentifiable
-from hanzoai.cloud.models.o11y_o11y_identifiable_out import O11yO11yIdentifiableOut
-from hanzoai.cloud.models.o11y_o11y_infra_attribute_keys_out import O11yO11yInfraAttributeKeysOut
-from hanzoai.cloud.models.o11y_o11y_infra_attribute_values_out import O11yO11yInfraAttributeValuesOut
-from hanzoai.cloud.models.o11y_o11y_infra_checks_out import O11yO11yInfraChecksOut
-from hanzoai.cloud.models.o11y_o11y_infra_clusters_out import O11yO11yInfraClustersOut
-from hanzoai.cloud.models.o11y_o11y_infra_daemon_sets_out import O11yO11yInfraDaemonSetsOut
-from hanzoai.cloud.models.o11y_o11y_infra_deployments_out import O11yO11yInfraDeploymentsOut
-from hanzoai.cloud.models.o11y_o11y_infra_hosts_out import O11yO11yInfraHostsOut
-from hanzoai.cloud.models.o11y_o11y_infra_jobs_out import O11yO11yInfraJobsOut
-from hanzoai.cloud.models.o11y_o11y_infra_namespaces_out import O11yO11yInfraNamespacesOut
-from hanzoai.cloud.models.o11y_o11y_infra_nodes_out import O11yO11yInfraNodesOut
-from hanzoai.cloud.models.o11y_o11y_infra_pods_out import O11yO11yInfraPodsOut
-from hanzoai.cloud.models.o11y_o11y_infra_stateful_sets_out import O11yO11yInfraStatefulSetsOut
-from hanzoai.cloud.models.o11y_o11y_infra_volumes_out import O11yO11yInfraVolumesOut
-from hanzoai.cloud.models.o11y_o11y_ingestion_keys_out import O11yO11yIngestionKeysOut
-from hanzoai.cloud.models.o11y_o11y_install_out import O11yO11yInstallOut
-from hanzoai.cloud.models.o11y_o11y_integration_ack import O11yO11yIntegrationAck
-from hanzoai.cloud.models.o11y_o11y_integration_out import O11yO11yIntegrationOut
-from hanzoai.cloud.models.o11y_o11y_integrations_list_out import O11yO11yIntegrationsListOut
-from hanzoai.cloud.models.o11y_o11y_invite import O11yO11yInvite
-from hanzoai.cloud.models.o11y_o11y_invite_in import O11yO11yInviteIn
-from hanzoai.cloud.models.o11y_o11y_invite_out import O11yO11yInviteOut
-from hanzoai.cloud.models.o11y_o11y_job_list_out import O11yO11yJobListOut
-from hanzoai.cloud.models.o11y_o11y_k8s_onboarding import O11yO11yK8sOnboarding
-from hanzoai.cloud.models.o11y_o11y_llm_annotation import O11yO11yLLMAnnotation
-from hanzoai.cloud.models.o11y_o11y_llm_annotation_out import O11yO11yLLMAnnotationOut
-from hanzoai.cloud.models.o11y_o11y_llm_annotations_out import O11yO11yLLMAnnotationsOut
-from hanzoai.cloud.models.o11y_o11y_llm_annotations_page import O11yO11yLLMAnnotationsPage
-from hanzoai.cloud.models.o11y_o11y_llm_ingest_annotation import O11yO11yLLMIngestAnnotation
-from hanzoai.cloud.models.o11y_o11y_llm_ingest_score import O11yO11yLLMIngestScore
-from hanzoai.cloud.models.o11y_o11y_llm_observation import O11yO11yLLMObservation
-from hanzoai.cloud.models.o11y_o11y_llm_observations_out import O11yO11yLLMObservationsOut
-from hanzoai.cloud.models.o11y_o11y_llm_observations_page import O11yO11yLLMObservationsPage
-from hanzoai.cloud.models.o11y_o11y_llm_pricing_cache_costs import O11yO11yLLMPricingCacheCosts
-from hanzoai.cloud.models.o11y_o11y_llm_pricing_rule import O11yO11yLLMPricingRule
-from hanzoai.cloud.models.o11y_o11y_llm_pricing_rule_out import O11yO11yLLMPricingRuleOut
-from hanzoai.cloud.models.o11y_o11y_llm_pricing_rules_out import O11yO11yLLMPricingRulesOut
-from hanzoai.cloud.models.o11y_o11y_llm_pricing_rules_page import O11yO11yLLMPricingRulesPage
-from hanzoai.cloud.models.o11y_o11y_llm_rule_pricing import O11yO11yLLMRulePricing
-from hanzoai.cloud.models.o11y_o11y_llm_score import O11yO11yLLMScore
-from hanzoai.cloud.models.o11y_o11y_llm_score_out import O11yO11yLLMScoreOut
-from hanzoai.cloud.models.o11y_o11y_llm_scores_out import O11yO11yLLMScoresOut
-from hanzoai.cloud.models.o11y_o11y_llm_scores_page import O11yO11yLLMScoresPage
-from hanzoai.cloud.models.o11y_o11y_llm_session import O11yO11yLLMSession
-from hanzoai.cloud.models.o11y_o11y_llm_sessions_out import O11yO11yLLMSessionsOut
-from hanzoai.cloud.models.o11y_o11y_llm_sessions_page import O11yO11yLLMSessionsPage
-from hanzoai.cloud.models.o11y_o11y_llm_trace import O11yO11yLLMTrace
-from hanzoai.cloud.models.o11y_o11y_llm_traces_out import O11yO11yLLMTracesOut
-from hanzoai.cloud.models.o11y_o11y_llm_traces_page import O11yO11yLLMTracesPage
-from hanzoai.cloud.models.o11y_o11y_llm_updatable_pricing_rule import O11yO11yLLMUpdatablePricingRule
-from hanzoai.cloud.models.o11y_o11y_llm_updatable_pricing_rules import O11yO11yLLMUpdatablePricingRules
-from hanzoai.cloud.models.o11y_o11y_llm_user import O11yO11yLLMUser
-from hanzoai.cloud.models.o11y_o11y_llm_users_out import O11yO11yLLMUsersOut
-from hanzoai.cloud.models.o11y_o11y_llm_users_page import O11yO11yLLMUsersPage
-from hanzoai.cloud.models.o11y_o11y_license_active_out import O11yO11yLicenseActiveOut
-from hanzoai.cloud.models.o11y_o11y_licenses_out import O11yO11yLicensesOut
-from hanzoai.cloud.models.o11y_o11y_list_error import O11yO11yListError
-from hanzoai.cloud.models.o11y_o11y_log_aggregate_bucket import O11yO11yLogAggregateBucket
-from hanzoai.cloud.models.o11y_o11y_log_aggregate_out import O11yO11yLogAggregateOut
-from hanzoai.cloud.models.o11y_o11y_log_config_version import O11yO11yLogConfigVersion
-from hanzoai.cloud.models.o11y_o11y_log_filter import O11yO11yLogFilter
-from hanzoai.cloud.models.o11y_o11y_log_filter_item import O11yO11yLogFilterItem
-from hanzoai.cloud.models.o11y_o11y_log_filter_key import O11yO11yLogFilterKey
-from hanzoai.cloud.models.o11y_o11y_log_parse_from import O11yO11yLogParseFrom
-from hanzoai.cloud.models.o11y_o11y_log_pipeline import O11yO11yLogPipeline
-from hanzoai.cloud.models.o11y_o11y_log_pipeline_create_in import O11yO11yLogPipelineCreateIn
-from hanzoai.cloud.models.o11y_o11y_log_pipeline_operator import O11yO11yLogPipelineOperator
-from hanzoai.cloud.models.o11y_o11y_log_pipeline_preview import O11yO11yLogPipelinePreview
-from hanzoai.cloud.models.o11y_o11y_log_pipeline_preview_in import O11yO11yLogPipelinePreviewIn
-from hanzoai.cloud.models.o11y_o11y_log_pipeline_preview_out import O11yO11yLogPipelinePreviewOut
-from hanzoai.cloud.models.o11y_o11y_log_pipeline_route import O11yO11yLogPipelineRoute
-from hanzoai.cloud.models.o11y_o11y_log_pipelines import O11yO11yLogPipelines
-from hanzoai.cloud.models.o11y_o11y_log_pipelines_out import O11yO11yLogPipelinesOut
-from hanzoai.cloud.models.o11y_o11y_log_postable_pipeline import O11yO11yLogPostablePipeline
-from hanzoai.cloud.models.o11y_o11y_log_promote_index import O11yO11yLogPromoteIndex
-from hanzoai.cloud.models.o11y_o11y_log_promote_out import O11yO11yLogPromoteOut
-from hanzoai.cloud.models.o11y_o11y_log_promote_path import O11yO11yLogPromotePath
-from hanzoai.cloud.models.o11y_o11y_log_promoted_out import O11yO11yLogPromotedOut
-from hanzoai.cloud.models.o11y_o11y_log_record import O11yO11yLogRecord
-from hanzoai.cloud.models.o11y_o11y_log_records_out import O11yO11yLogRecordsOut
-from hanzoai.cloud.models.o11y_o11y_logs_out import O11yO11yLogsOut
-from hanzoai.cloud.models.o11y_o11y_message import O11yO11yMessage
-from hanzoai.cloud.models.o11y_o11y_metric_ack_out import O11yO11yMetricAckOut
-from hanzoai.cloud.models.o11y_o11y_metric_alert import O11yO11yMetricAlert
-from hanzoai.cloud.models.o11y_o11y_metric_alerts import O11yO11yMetricAlerts
-from hanzoai.cloud.models.o11y_o11y_metric_alerts_out import O11yO11yMetricAlertsOut
-from hanzoai.cloud.models.o11y_o11y_metric_attribute import O11yO11yMetricAttribute
-from hanzoai.cloud.models.o11y_o11y_metric_attributes import O11yO11yMetricAttributes
-from hanzoai.cloud.models.o11y_o11y_metric_attributes_out import O11yO11yMetricAttributesOut
-from hanzoai.cloud.models.o11y_o11y_metric_dashboards import O11yO11yMetricDashboards
-from hanzoai.cloud.models.o11y_o11y_metric_dashboards_out import O11yO11yMetricDashboardsOut
-from hanzoai.cloud.models.o11y_o11y_metric_field import O11yO11yMetricField
-from hanzoai.cloud.models.o11y_o11y_metric_filter import O11yO11yMetricFilter
-from hanzoai.cloud.models.o11y_o11y_metric_highlights import O11yO11yMetricHighlights
-from hanzoai.cloud.models.o11y_o11y_metric_highlights_out import O11yO11yMetricHighlightsOut
-from hanzoai.cloud.models.o11y_o11y_metric_inspect_in import O11yO11yMetricInspectIn
-from hanzoai.cloud.models.o11y_o11y_metric_inspect_out import O11yO11yMetricInspectOut
-from hanzoai.cloud.models.o11y_o11y_metric_label import O11yO11yMetricLabel
-from hanzoai.cloud.models.o11y_o11y_metric_list import O11yO11yMetricList
-from hanzoai.cloud.models.o11y_o11y_metric_list_out import O11yO11yMetricListOut
-from hanzoai.cloud.models.o11y_o11y_metric_metadata import O11yO11yMetricMetadata
-from hanzoai.cloud.models.o11y_o11y_metric_metadata_out import O11yO11yMetricMetadataOut
-from hanzoai.cloud.models.o11y_o11y_metric_metadata_save_in import O11yO11yMetricMetadataSaveIn
-from hanzoai.cloud.models.o11y_o11y_metric_onboarding import O11yO11yMetricOnboarding
-from hanzoai.cloud.models.o11y_o11y_metric_onboarding_out import O11yO11yMetricOnboardingOut
-from hanzoai.cloud.models.o11y_o11y_metric_order import O11yO11yMetricOrder
-from hanzoai.cloud.models.o11y_o11y_metric_panel import O11yO11yMetricPanel
-from hanzoai.cloud.models.o11y_o11y_metric_point import O11yO11yMetricPoint
-from hanzoai.cloud.models.o11y_o11y_metric_series import O11yO11yMetricSeries
-from hanzoai.cloud.models.o11y_o11y_metric_series_set import O11yO11yMetricSeriesSet
-from hanzoai.cloud.models.o11y_o11y_metric_stat import O11yO11yMetricStat
-from hanzoai.cloud.models.o11y_o11y_metric_stats import O11yO11yMetricStats
-from hanzoai.cloud.models.o11y_o11y_metric_stats_in import O11yO11yMetricStatsIn
-from hanzoai.cloud.models.o11y_o11y_metric_stats_out import O11yO11yMetricStatsOut
-from hanzoai.cloud.models.o11y_o11y_metric_summary import O11yO11yMetricSummary
-from hanzoai.cloud.models.o11y_o11y_metric_treemap import O11yO11yMetricTreemap
-from hanzoai.cloud.models.o11y_o11y_metric_treemap_in import O11yO11yMetricTreemapIn
-from hanzoai.cloud.models.o11y_o11y_metric_treemap_out import O11yO11yMetricTreemapOut
-from hanzoai.cloud.models.o11y_o11y_metrics_query_range_out import O11yO11yMetricsQueryRangeOut
-from hanzoai.cloud.models.o11y_o11y_my_service_account_update_in import O11yO11yMyServiceAccountUpdateIn
-from hanzoai.cloud.models.o11y_o11y_namespace_list_out import O11yO11yNamespaceListOut
-from hanzoai.cloud.models.o11y_o11y_next_prev_error_ids import O11yO11yNextPrevErrorIDs
-from hanzoai.cloud.models.o11y_o11y_node_list_out import O11yO11yNodeListOut
-from hanzoai.cloud.models.o11y_o11y_oidc_config import O11yO11yOIDCConfig
-from hanzoai.cloud.models.o11y_o11y_object import O11yO11yObject
-from hanzoai.cloud.models.o11y_o11y_object_group import O11yO11yObjectGroup
-from hanzoai.cloud.models.o11y_o11y_occurrence import O11yO11yOccurrence
-from hanzoai.cloud.models.o11y_o11y_occurrence_frame import O11yO11yOccurrenceFrame
-from hanzoai.cloud.models.o11y_o11y_onboarding_out import O11yO11yOnboardingOut
-from hanzoai.cloud.models.o11y_o11y_operation import O11yO11yOperation
-from hanzoai.cloud.models.o11y_o11y_operations_in import O11yO11yOperationsIn
-from hanzoai.cloud.models.o11y_o11y_operations_out import O11yO11yOperationsOut
-from hanzoai.cloud.models.o11y_o11y_org_stats_out import O11yO11yOrgStatsOut
-from hanzoai.cloud.models.o11y_o11y_organization import O11yO11yOrganization
-from hanzoai.cloud.models.o11y_o11y_organization_out import O11yO11yOrganizationOut
-from hanzoai.cloud.models.o11y_o11y_overall_state_transitions_out import O11yO11yOverallStateTransitionsOut
-from hanzoai.cloud.models.o11y_o11y_password_auth_n import O11yO11yPasswordAuthN
-from hanzoai.cloud.models.o11y_o11y_percentile_position import O11yO11yPercentilePosition
-from hanzoai.cloud.models.o11y_o11y_percentiles import O11yO11yPercentiles
-from hanzoai.cloud.models.o11y_o11y_pod_list_out import O11yO11yPodListOut
-from hanzoai.cloud.models.o11y_o11y_pod_onboarding import O11yO11yPodOnboarding
-from hanzoai.cloud.models.o11y_o11y_postable_auth_domain import O11yO11yPostableAuthDomain
-from hanzoai.cloud.models.o11y_o11y_postable_user import O11yO11yPostableUser
-from hanzoai.cloud.models.o11y_o11y_preference import O11yO11yPreference
-from hanzoai.cloud.models.o11y_o11y_preference_out import O11yO11yPreferenceOut
-from hanzoai.cloud.models.o11y_o11y_preferences_out import O11yO11yPreferencesOut
-from hanzoai.cloud.models.o11y_o11y_process_list_out import O11yO11yProcessListOut
-from hanzoai.cloud.models.o11y_o11y_prom_query_out import O11yO11yPromQueryOut
-from hanzoai.cloud.models.o11y_o11y_prom_result import O11yO11yPromResult
-from hanzoai.cloud.models.o11y_o11y_public_dashboard import O11yO11yPublicDashboard
-from hanzoai.cloud.models.o11y_o11y_public_dashboard_data import O11yO11yPublicDashboardData
-from hanzoai.cloud.models.o11y_o11y_public_dashboard_data_out import O11yO11yPublicDashboardDataOut
-from hanzoai.cloud.models.o11y_o11y_public_dashboard_out import O11yO11yPublicDashboardOut
-from hanzoai.cloud.models.o11y_o11y_public_dashboard_v1 import O11yO11yPublicDashboardV1
-from hanzoai.cloud.models.o11y_o11y_public_dashboard_write_in import O11yO11yPublicDashboardWriteIn
-from hanzoai.cloud.models.o11y_o11y_pvc_list_out import O11yO11yPvcListOut
-from hanzoai.cloud.models.o11y_o11y_query_filter_analysis import O11yO11yQueryFilterAnalysis
-from hanzoai.cloud.models.o11y_o11y_query_range import O11yO11yQueryRange
-from hanzoai.cloud.models.o11y_o11y_query_range_data import O11yO11yQueryRangeData
-from hanzoai.cloud.models.o11y_o11y_query_range_format_out import O11yO11yQueryRangeFormatOut
-from hanzoai.cloud.models.o11y_o11y_query_range_out import O11yO11yQueryRangeOut
-from hanzoai.cloud.models.o11y_o11y_query_range_preview_in import O11yO11yQueryRangePreviewIn
-from hanzoai.cloud.models.o11y_o11y_query_range_preview_out import O11yO11yQueryRangePreviewOut
-from hanzoai.cloud.models.o11y_o11y_query_stats import O11yO11yQueryStats
-from hanzoai.cloud.models.o11y_o11y_query_warning import O11yO11yQueryWarning
-from hanzoai.cloud.models.o11y_o11y_query_warning_note import O11yO11yQueryWarningNote
-from hanzoai.cloud.models.o11y_o11y_queue_check import O11yO11yQueueCheck
-from hanzoai.cloud.models.o11y_o11y_queue_checks_out import O11yO11yQueueChecksOut
-from hanzoai.cloud.models.o11y_o11y_queue_filter_key import O11yO11yQueueFilterKey
-from hanzoai.cloud.models.o11y_o11y_queue_filter_rule import O11yO11yQueueFilterRule
-from hanzoai.cloud.models.o11y_o11y_queue_filter_set import O11yO11yQueueFilterSet
-from hanzoai.cloud.models.o11y_o11y_queue_in import O11yO11yQueueIn
-from hanzoai.cloud.models.o11y_o11y_queue_list_in import O11yO11yQueueListIn
-from hanzoai.cloud.models.o11y_o11y_queue_row import O11yO11yQueueRow
-from hanzoai.cloud.models.o11y_o11y_queue_rows_out import O11yO11yQueueRowsOut
-from hanzoai.cloud.models.o11y_o11y_quick_filters_out import O11yO11yQuickFiltersOut
-from hanzoai.cloud.models.o11y_o11y_reduction_rule import O11yO11yReductionRule
-from hanzoai.cloud.models.o11y_o11y_reduction_rule_create_in import O11yO11yReductionRuleCreateIn
-from hanzoai.cloud.models.o11y_o11y_reduction_rule_list_out import O11yO11yReductionRuleListOut
-from hanzoai.cloud.models.o11y_o11y_reduction_rule_out import O11yO11yReductionRuleOut
-from hanzoai.cloud.models.o11y_o11y_reduction_rule_preview import O11yO11yReductionRulePreview
-from hanzoai.cloud.models.o11y_o11y_reduction_rule_preview_in import O11yO11yReductionRulePreviewIn
-from hanzoai.cloud.models.o11y_o11y_reduction_rule_preview_out import O11yO11yReductionRulePreviewOut
-from hanzoai.cloud.models.o11y_o11y_reduction_rule_save_in import O11yO11yReductionRuleSaveIn
-from hanzoai.cloud.models.o11y_o11y_reduction_rules import O11yO11yReductionRules
-from hanzoai.cloud.models.o11y_o11y_reduction_series_out import O11yO11yReductionSeriesOut
-from hanzoai.cloud.models.o11y_o11y_reduction_series_result import O11yO11yReductionSeriesResult
-from hanzoai.cloud.models.o11y_o11y_reduction_stats import O11yO11yReductionStats
-from hanzoai.cloud.models.o11y_o11y_reduction_stats_out import O11yO11yReductionStatsOut
-from hanzoai.cloud.models.o11y_o11y_register_in import O11yO11yRegisterIn
-from hanzoai.cloud.models.o11y_o11y_register_out import O11yO11yRegisterOut
-from hanzoai.cloud.models.o11y_o11y_reset_password_in import O11yO11yResetPasswordIn
-from hanzoai.cloud.models.o11y_o11y_reset_token import O11yO11yResetToken
-from hanzoai.cloud.models.o11y_o11y_reset_token_out import O11yO11yResetTokenOut
-from hanzoai.cloud.models.o11y_o11y_reset_token_ref import O11yO11yResetTokenRef
-from hanzoai.cloud.models.o11y_o11y_resource_ref import O11yO11yResourceRef
-from hanzoai.cloud.models.o11y_o11y_retention_match import O11yO11yRetentionMatch
-from hanzoai.cloud.models.o11y_o11y_retention_out import O11yO11yRetentionOut
-from hanzoai.cloud.models.o11y_o11y_retention_rule import O11yO11yRetentionRule
-from hanzoai.cloud.models.o11y_o11y_retention_set_in import O11yO11yRetentionSetIn
-from hanzoai.cloud.models.o11y_o11y_retention_set_out import O11yO11yRetentionSetOut
-from hanzoai.cloud.models.o11y_o11y_retry import O11yO11yRetry
-from hanzoai.cloud.models.o11y_o11y_role import O11yO11yRole
-from hanzoai.cloud.models.o11y_o11y_role_create_in import O11yO11yRoleCreateIn
-from hanzoai.cloud.models.o11y_o11y_role_create_out import O11yO11yRoleCreateOut
-from hanzoai.cloud.models.o11y_o11y_role_detail import O11yO11yRoleDetail
-from hanzoai.cloud.models.o11y_o11y_role_id import O11yO11yRoleID
-from hanzoai.cloud.models.o11y_o11y_role_mapping import O11yO11yRoleMapping
-from hanzoai.cloud.models.o11y_o11y_role_out import O11yO11yRoleOut
-from hanzoai.cloud.models.o11y_o11y_role_update_in import O11yO11yRoleUpdateIn
-from hanzoai.cloud.models.o11y_o11y_roles_out import O11yO11yRolesOut
-from hanzoai.cloud.models.o11y_o11y_rotate_session_in import O11yO11yRotateSessionIn
-from hanzoai.cloud.models.o11y_o11y_route_policies_out import O11yO11yRoutePoliciesOut
-from hanzoai.cloud.models.o11y_o11y_route_policy_out import O11yO11yRoutePolicyOut
-from hanzoai.cloud.models.o11y_o11y_route_policy_update_in import O11yO11yRoutePolicyUpdateIn
-from hanzoai.cloud.models.o11y_o11y_rule_history_contributors_out import O11yO11yRuleHistoryContributorsOut
-from hanzoai.cloud.models.o11y_o11y_rule_history_filter_keys_out import O11yO11yRuleHistoryFilterKeysOut
-from hanzoai.cloud.models.o11y_o11y_rule_history_filter_values_out import O11yO11yRuleHistoryFilterValuesOut
-from hanzoai.cloud.models.o11y_o11y_rule_history_overall_status_out import O11yO11yRuleHistoryOverallStatusOut
-from hanzoai.cloud.models.o11y_o11y_rule_history_query_in import O11yO11yRuleHistoryQueryIn
-from hanzoai.cloud.models.o11y_o11y_rule_history_stats_out import O11yO11yRuleHistoryStatsOut
-from hanzoai.cloud.models.o11y_o11y_rule_history_timeline_out import O11yO11yRuleHistoryTimelineOut
-from hanzoai.cloud.models.o11y_o11y_rule_out import O11yO11yRuleOut
-from hanzoai.cloud.models.o11y_o11y_rule_state_contributors_out import O11yO11yRuleStateContributorsOut
-from hanzoai.cloud.models.o11y_o11y_rule_state_timeline_out import O11yO11yRuleStateTimelineOut
-from hanzoai.cloud.models.o11y_o11y_rule_stats_out import O11yO11yRuleStatsOut
-from hanzoai.cloud.models.o11y_o11y_rules_out import O11yO11yRulesOut
-from hanzoai.cloud.models.o11y_o11y_saml_config import O11yO11ySAMLConfig
-from hanzoai.cloud.models.o11y_o11y_saved_view_create_out import O11yO11ySavedViewCreateOut
-from hanzoai.cloud.models.o11y_o11y_saved_view_delete_out import O11yO11ySavedViewDeleteOut
-from hanzoai.cloud.models.o11y_o11y_saved_view_list_out import O11yO11ySavedViewListOut
-from hanzoai.cloud.models.o11y_o11y_saved_view_out import O11yO11ySavedViewOut
-from hanzoai.cloud.models.o11y_o11y_saved_view_update_in import O11yO11ySavedViewUpdateIn
-from hanzoai.cloud.models.o11y_o11y_sentry_event_out import O11yO11ySentryEventOut
-from hanzoai.cloud.models.o11y_o11y_sentry_issue_events_out import O11yO11ySentryIssueEventsOut
-from hanzoai.cloud.models.o11y_o11y_sentry_postable_project import O11yO11ySentryPostableProject
-from hanzoai.cloud.models.o11y_o11y_sentry_project import O11yO11ySentryProject
-from hanzoai.cloud.models.o11y_o11y_sentry_project_out import O11yO11ySentryProjectOut
-from hanzoai.cloud.models.o11y_o11y_sentry_projects import O11yO11ySentryProjects
-from hanzoai.cloud.models.o11y_o11y_sentry_projects_out import O11yO11ySentryProjectsOut
-from hanzoai.cloud.models.o11y_o11y_sentry_update_issue_in import O11yO11ySentryUpdateIssueIn
-from hanzoai.cloud.models.o11y_o11y_service import O11yO11yService
-from hanzoai.cloud.models.o11y_o11y_service_account import O11yO11yServiceAccount
-from hanzoai.cloud.models.o11y_o11y_service_account_create_in import O11yO11yServiceAccountCreateIn
-from hanzoai.cloud.models.o11y_o11y_service_account_create_out import O11yO11yServiceAccountCreateOut
-from hanzoai.cloud.models.o11y_o11y_service_account_detail import O11yO11yServiceAccountDetail
-from hanzoai.cloud.models.o11y_o11y_service_account_out import O11yO11yServiceAccountOut
-from hanzoai.cloud.models.o11y_o11y_service_account_role import O11yO11yServiceAccountRole
-from hanzoai.cloud.models.o11y_o11y_service_account_role_grant_in import O11yO11yServiceAccountRoleGrantIn
-from hanzoai.cloud.models.o11y_o11y_service_account_roles_out import O11yO11yServiceAccountRolesOut
-from hanzoai.cloud.models.o11y_o11y_service_account_update_in import O11yO11yServiceAccountUpdateIn
-from hanzoai.cloud.models.o11y_o11y_service_accounts_out import O11yO11yServiceAccountsOut
-from hanzoai.cloud.models.o11y_o11y_service_out import O11yO11yServiceOut
-from hanzoai.cloud.models.o11y_o11y_service_tag import O11yO11yServiceTag
-from hanzoai.cloud.models.o11y_o11y_service_warning import O11yO11yServiceWarning
-from hanzoai.cloud.models.o11y_o11y_services_in import O11yO11yServicesIn
-from hanzoai.cloud.models.o11y_o11y_services_metadata_out import O11yO11yServicesMetadataOut
-from hanzoai.cloud.models.o11y_o11y_services_out import O11yO11yServicesOut
-from hanzoai.cloud.models.o11y_o11y_session_context import O11yO11ySessionContext
-from hanzoai.cloud.models.o11y_o11y_session_context_out import O11yO11ySessionContextOut
-from hanzoai.cloud.models.o11y_o11y_session_org import O11yO11ySessionOrg
-from hanzoai.cloud.models.o11y_o11y_set_role_in import O11yO11ySetRoleIn
-from hanzoai.cloud.models.o11y_o11y_signal_filters import O11yO11ySignalFilters
-from hanzoai.cloud.models.o11y_o11y_signal_filters_out import O11yO11ySignalFiltersOut
-from hanzoai.cloud.models.o11y_o11y_span_mapper_create_in import O11yO11ySpanMapperCreateIn
-from hanzoai.cloud.models.o11y_o11y_span_mapper_group_out import O11yO11ySpanMapperGroupOut
-from hanzoai.cloud.models.o11y_o11y_span_mapper_group_update_in import O11yO11ySpanMapperGroupUpdateIn
-from hanzoai.cloud.models.o11y_o11y_span_mapper_groups_out import O11yO11ySpanMapperGroupsOut
-from hanzoai.cloud.models.o11y_o11y_span_mapper_out import O11yO11ySpanMapperOut
-from hanzoai.cloud.models.o11y_o11y_span_mapper_update_in import O11yO11ySpanMapperUpdateIn
-from hanzoai.cloud.models.o11y_o11y_span_mappers_out import O11yO11ySpanMappersOut
-from hanzoai.cloud.models.o11y_o11y_span_percentile import O11yO11ySpanPercentile
-from hanzoai.cloud.models.o11y_o11y_span_percentile_in import O11yO11ySpanPercentileIn
-from hanzoai.cloud.models.o11y_o11y_span_percentile_out import O11yO11ySpanPercentileOut
-from hanzoai.cloud.models.o11y_o11y_stat import O11yO11yStat
-from hanzoai.cloud.models.o11y_o11y_stateful_set_list_out import O11yO11yStatefulSetListOut
-from hanzoai.cloud.models.o11y_o11y_stats import O11yO11yStats
-from hanzoai.cloud.models.o11y_o11y_stats_out import O11yO11yStatsOut
-from hanzoai.cloud.models.o11y_o11y_substitute_vars_out import O11yO11ySubstituteVarsOut
-from hanzoai.cloud.models.o11y_o11y_table import O11yO11yTable
-from hanzoai.cloud.models.o11y_o11y_tag_filter import O11yO11yTagFilter
-from hanzoai.cloud.models.o11y_o11y_tag_query import O11yO11yTagQuery
-from hanzoai.cloud.models.o11y_o11y_telemetry_field import O11yO11yTelemetryField
-from hanzoai.cloud.models.o11y_o11y_test_notification_out import O11yO11yTestNotificationOut
-from hanzoai.cloud.models.o11y_o11y_test_notification_result import O11yO11yTestNotificationResult
-from hanzoai.cloud.models.o11y_o11y_test_rule_out import O11yO11yTestRuleOut
-from hanzoai.cloud.models.o11y_o11y_toggle import O11yO11yToggle
-from hanzoai.cloud.models.o11y_o11y_token import O11yO11yToken
-from hanzoai.cloud.models.o11y_o11y_token_out import O11yO11yTokenOut
-from hanzoai.cloud.models.o11y_o11y_top_level_ops_in import O11yO11yTopLevelOpsIn
-from hanzoai.cloud.models.o11y_o11y_trace import O11yO11yTrace
-from hanzoai.cloud.models.o11y_o11y_trace_aggregations_in import O11yO11yTraceAggregationsIn
-from hanzoai.cloud.models.o11y_o11y_trace_aggregations_out import O11yO11yTraceAggregationsOut
-from hanzoai.cloud.models.o11y_o11y_trace_detail import O11yO11yTraceDetail
-from hanzoai.cloud.models.o11y_o11y_trace_flamegraph_in import O11yO11yTraceFlamegraphIn
-from hanzoai.cloud.models.o11y_o11y_trace_flamegraph_out import O11yO11yTraceFlamegraphOut
-from hanzoai.cloud.models.o11y_o11y_trace_out import O11yO11yTraceOut
-from hanzoai.cloud.models.o11y_o11y_trace_span_window import O11yO11yTraceSpanWindow
-from hanzoai.cloud.models.o11y_o11y_trace_waterfall_in import O11yO11yTraceWaterfallIn
-from hanzoai.cloud.models.o11y_o11y_trace_waterfall_out import O11yO11yTraceWaterfallOut
-from hanzoai.cloud.models.o11y_o11y_traces import O11yO11yTraces
-from hanzoai.cloud.models.o11y_o11y_traces_out import O11yO11yTracesOut
-from hanzoai.cloud.models.o11y_o11y_transaction import O11yO11yTransaction
-from hanzoai.cloud.models.o11y_o11y_transaction_group import O11yO11yTransactionGroup
-from hanzoai.cloud.models.o11y_o11y_transaction_result import O11yO11yTransactionResult
-from hanzoai.cloud.models.o11y_o11y_treemap_entry import O11yO11yTreemapEntry
-from hanzoai.cloud.models.o11y_o11y_updatable_auth_domain import O11yO11yUpdatableAuthDomain
-from hanzoai.cloud.models.o11y_o11y_updatable_preference import O11yO11yUpdatablePreference
-from hanzoai.cloud.models.o11y_o11y_updatable_quick_filters import O11yO11yUpdatableQuickFilters
-from hanzoai.cloud.models.o11y_o11y_updatable_user import O11yO11yUpdatableUser
-from hanzoai.cloud.models.o11y_o11y_update_account_in import O11yO11yUpdateAccountIn
-from hanzoai.cloud.models.o11y_o11y_update_ingestion_key_in import O11yO11yUpdateIngestionKeyIn
-from hanzoai.cloud.models.o11y_o11y_update_limit_in import O11yO11yUpdateLimitIn
-from hanzoai.cloud.models.o11y_o11y_update_service_in import O11yO11yUpdateServiceIn
-from hanzoai.cloud.models.o11y_o11y_usage_item import O11yO11yUsageItem
-from hanzoai.cloud.models.o11y_o11y_user import O11yO11yUser
-from hanzoai.cloud.models.o11y_o11y_user_role import O11yO11yUserRole
-from hanzoai.cloud.models.o11y_o11y_user_update import O11yO11yUserUpdate
-from hanzoai.cloud.models.o11y_o11y_user_with_roles import O11yO11yUserWithRoles
-from hanzoai.cloud.models.o11y_o11y_user_with_roles_out import O11yO11yUserWithRolesOut
-from hanzoai.cloud.models.o11y_o11y_users_out import O11yO11yUsersOut
-from hanzoai.cloud.models.o11y_o11y_version_out import O11yO11yVersionOut
-from hanzoai.cloud.models.o11y_o11y_widget_query_range import O11yO11yWidgetQueryRange
-from hanzoai.cloud.models.o11y_o11y_widget_query_range_out import O11yO11yWidgetQueryRangeOut
-from hanzoai.cloud.models.o11y_o_auth2 import O11yOAuth2
-from hanzoai.cloud.models.o11y_old_aws_collection_strategy import O11yOldAWSCollectionStrategy
-from hanzoai.cloud.models.o11y_old_aws_logs_strategy import O11yOldAWSLogsStrategy
-from hanzoai.cloud.models.o11y_old_aws_logs_strategy_cloudwatch_logs_subscriptions_inner import O11yOldAWSLogsStrategyCloudwatchLogsSubscriptionsInner
-from hanzoai.cloud.models.o11y_old_aws_metrics_strategy import O11yOldAWSMetricsStrategy
-from hanzoai.cloud.models.o11y_old_aws_metrics_strategy_cloudwatch_metric_stream_filters_inner import O11yOldAWSMetricsStrategyCloudwatchMetricStreamFiltersInner
-from hanzoai.cloud.models.o11y_ops_genie_config import O11yOpsGenieConfig
-from hanzoai.cloud.models.o11y_ops_genie_config_responder import O11yOpsGenieConfigResponder
-from hanzoai.cloud.models.o11y_order_by import O11yOrderBy
-from hanzoai.cloud.models.o11y_order_by_key import O11yOrderByKey
-from hanzoai.cloud.models.o11y_otel_span_ref import O11yOtelSpanRef
-from hanzoai.cloud.models.o11y_pagerduty_config import O11yPagerdutyConfig
-from hanzoai.cloud.models.o11y_pagerduty_image import O11yPagerdutyImage
-from hanzoai.cloud.models.o11y_pagerduty_link import O11yPagerdutyLink
-from hanzoai.cloud.models.o11y_pagination import O11yPagination
-from hanzoai.cloud.models.o11y_pod_count_by_phase import O11yPodCountByPhase
-from hanzoai.cloud.models.o11y_pod_counts_by_phase import O11yPodCountsByPhase
-from hanzoai.cloud.models.o11y_pod_list_record import O11yPodListRecord
-from hanzoai.cloud.models.o11y_pod_list_request import O11yPodListRequest
-from hanzoai.cloud.models.o11y_pod_list_response import O11yPodListResponse
-from hanzoai.cloud.models.o11y_pod_record import O11yPodRecord
-from hanzoai.cloud.models.o11y_pods import O11yPods
-from hanzoai.cloud.models.o11y_point import O11yPoint
-from hanzoai.cloud.models.o11y_postable_account_config import O11yPostableAccountConfig
-from hanzoai.cloud.models.o11y_postable_channel import O11yPostableChannel
-from hanzoai.cloud.models.o11y_postable_clusters import O11yPostableClusters
-from hanzoai.cloud.models.o11y_postable_daemon_sets import O11yPostableDaemonSets
-from hanzoai.cloud.models.o11y_postable_deployments import O11yPostableDeployments
-from hanzoai.cloud.models.o11y_postable_host import O11yPostableHost
-from hanzoai.cloud.models.o11y_postable_hosts import O11yPostableHosts
-from hanzoai.cloud.models.o11y_postable_ingestion_key import O11yPostableIngestionKey
-from hanzoai.cloud.models.o11y_postable_jobs import O11yPostableJobs
-from hanzoai.cloud.models.o11y_postable_namespaces import O11yPostableNamespaces
-from hanzoai.cloud.models.o11y_postable_nodes import O11yPostableNodes
-from hanzoai.cloud.models.o11y_postable_pipeline import O11yPostablePipeline
-from hanzoai.cloud.models.o11y_postable_planned_maintenance import O11yPostablePlannedMaintenance
-from hanzoai.cloud.models.o11y_postable_pods import O11yPostablePods
-from hanzoai.cloud.models.o11y_postable_profile import O11yPostableProfile
-from hanzoai.cloud.models.o11y_postable_route_policy import O11yPostableRoutePolicy
-from hanzoai.cloud.models.o11y_postable_span_mapper_group import O11yPostableSpanMapperGroup
-from hanzoai.cloud.models.o11y_postable_stateful_sets import O11yPostableStatefulSets
-from hanzoai.cloud.models.o11y_postable_volumes import O11yPostableVolumes
-from hanzoai.cloud.models.o11y_process_list_record import O11yProcessListRecord
-from hanzoai.cloud.models.o11y_process_list_request import O11yProcessListRequest
-from hanzoai.cloud.models.o11y_process_list_response import O11yProcessListResponse
-from hanzoai.cloud.models.o11y_prom_query import O11yPromQuery
-from hanzoai.cloud.models.o11y_provider_integration_config import O11yProviderIntegrationConfig
-from hanzoai.cloud.models.o11y_pushover_config import O11yPushoverConfig
-from hanzoai.cloud.models.o11y_query_envelope import O11yQueryEnvelope
-from hanzoai.cloud.models.o11y_query_range_params_v3 import O11yQueryRangeParamsV3
-from hanzoai.cloud.models.o11y_query_range_request import O11yQueryRangeRequest
-from hanzoai.cloud.models.o11y_query_warn_data import O11yQueryWarnData
-from hanzoai.cloud.models.o11y_query_warn_data_additional import O11yQueryWarnDataAdditional
-from hanzoai.cloud.models.o11y_querybuildertypesv5_composite_query import O11yQuerybuildertypesv5CompositeQuery
-from hanzoai.cloud.models.o11y_querybuildertypesv5_order_by import O11yQuerybuildertypesv5OrderBy
-from hanzoai.cloud.models.o11y_receiver import O11yReceiver
-from hanzoai.cloud.models.o11y_rele_state_item import O11yReleStateItem
-from hanzoai.cloud.models.o11y_rocketchat_attachment_action import O11yRocketchatAttachmentAction
-from hanzoai.cloud.models.o11y_rocketchat_attachment_field import O11yRocketchatAttachmentField
-from hanzoai.cloud.models.o11y_rocketchat_config import O11yRocketchatConfig
-from hanzoai.cloud.models.o11y_rule_state_history import O11yRuleStateHistory
-from hanzoai.cloud.models.o11y_rule_state_history_contributor import O11yRuleStateHistoryContributor
-from hanzoai.cloud.models.o11y_rule_state_timeline import O11yRuleStateTimeline
-from hanzoai.cloud.models.o11y_sns_config import O11ySNSConfig
-from hanzoai.cloud.models.o11y_saved_view import O11ySavedView
-from hanzoai.cloud.models.o11y_series import O11ySeries
-from hanzoai.cloud.models.o11y_service import O11yService
-from hanzoai.cloud.models.o11y_service_assets import O11yServiceAssets
-from hanzoai.cloud.models.o11y_service_config import O11yServiceConfig
-from hanzoai.cloud.models.o11y_service_dashboard import O11yServiceDashboard
-from hanzoai.cloud.models.o11y_service_metadata import O11yServiceMetadata
-from hanzoai.cloud.models.o11y_service_up import O11yServiceUp
-from hanzoai.cloud.models.o11y_sig_v4_config import O11ySigV4Config
-from hanzoai.cloud.models.o11y_signal_connection_status import O11ySignalConnectionStatus
-from hanzoai.cloud.models.o11y_slack_action import O11ySlackAction
-from hanzoai.cloud.models.o11y_slack_config import O11ySlackConfig
-from hanzoai.cloud.models.o11y_slack_confirmation_field import O11ySlackConfirmationField
-from hanzoai.cloud.models.o11y_slack_field import O11ySlackField
-from hanzoai.cloud.models.o11y_span_aggregation import O11ySpanAggregation
-from hanzoai.cloud.models.o11y_span_aggregation_result import O11ySpanAggregationResult
-from hanzoai.cloud.models.o11y_span_mapper import O11ySpanMapper
-from hanzoai.cloud.models.o11y_span_mapper_config import O11ySpanMapperConfig
-from hanzoai.cloud.models.o11y_span_mapper_group import O11ySpanMapperGroup
-from hanzoai.cloud.models.o11y_span_mapper_group_condition import O11ySpanMapperGroupCondition
-from hanzoai.cloud.models.o11y_span_mapper_source import O11ySpanMapperSource
-from hanzoai.cloud.models.o11y_stateful_set_list_record import O11yStatefulSetListRecord
-from hanzoai.cloud.models.o11y_stateful_set_list_request import O11yStatefulSetListRequest
-from hanzoai.cloud.models.o11y_stateful_set_list_response import O11yStatefulSetListResponse
-from hanzoai.cloud.models.o11y_stateful_set_record import O11yStatefulSetRecord
-from hanzoai.cloud.models.o11y_stateful_sets import O11yStatefulSets
-from hanzoai.cloud.models.o11y_stats import O11yStats
-from hanzoai.cloud.models.o11y_status_component import O11yStatusComponent
-from hanzoai.cloud.models.o11y_status_incident import O11yStatusIncident
-from hanzoai.cloud.models.o11y_status_maintenance import O11yStatusMaintenance
-from hanzoai.cloud.models.o11y_status_result import O11yStatusResult
-from hanzoai.cloud.models.o11y_status_summary import O11yStatusSummary
-from hanzoai.cloud.models.o11y_storable_funnel import O11yStorableFunnel
-from hanzoai.cloud.models.o11y_storable_integration_dashboard import O11yStorableIntegrationDashboard
-from hanzoai.cloud.models.o11y_supported_signals import O11ySupportedSignals
-from hanzoai.cloud.models.o11y_tls_config import O11yTLSConfig
-from hanzoai.cloud.models.o11y_telegram_config import O11yTelegramConfig
-from hanzoai.cloud.models.o11y_telemetry_field_key import O11yTelemetryFieldKey
-from hanzoai.cloud.models.o11y_telemetry_field_values import O11yTelemetryFieldValues
-from hanzoai.cloud.models.o11y_threading_config import O11yThreadingConfig
-from hanzoai.cloud.models.o11y_time_series import O11yTimeSeries
-from hanzoai.cloud.models.o11y_trace_row import O11yTraceRow
-from hanzoai.cloud.models.o11y_traces_out import O11yTracesOut
-from hanzoai.cloud.models.o11y_uninstall_integration_request import O11yUninstallIntegrationRequest
-from hanzoai.cloud.models.o11y_updatable_account_config import O11yUpdatableAccountConfig
-from hanzoai.cloud.models.o11y_updatable_azure_account_config import O11yUpdatableAzureAccountConfig
-from hanzoai.cloud.models.o11y_updatable_gcp_account_config import O11yUpdatableGCPAccountConfig
-from hanzoai.cloud.models.o11y_update_item_in import O11yUpdateItemIn
-from hanzoai.cloud.models.o11y_update_queue_in import O11yUpdateQueueIn
-from hanzoai.cloud.models.o11y_usage_bucket import O11yUsageBucket
-from hanzoai.cloud.models.o11y_user import O11yUser
-from hanzoai.cloud.models.o11y_variable_item import O11yVariableItem
-from hanzoai.cloud.models.o11y_victor_ops_config import O11yVictorOpsConfig
-from hanzoai.cloud.models.o11y_volume_list_record import O11yVolumeListRecord
-from hanzoai.cloud.models.o11y_volume_list_request import O11yVolumeListRequest
-from hanzoai.cloud.models.o11y_volume_list_response import O11yVolumeListResponse
-from hanzoai.cloud.models.o11y_volume_record import O11yVolumeRecord
-from hanzoai.cloud.models.o11y_volumes import O11yVolumes
-from hanzoai.cloud.models.o11y_waterfall_span import O11yWaterfallSpan
-from hanzoai.cloud.models.o11y_webex_config import O11yWebexConfig
-from hanzoai.cloud.models.o11y_webhook_config import O11yWebhookConfig
-from hanzoai.cloud.models.o11y_wechat_config import O11yWechatConfig
-from hanzoai.cloud.models.oauth_bundle_in import OauthBundleIn
-from hanzoai.cloud.models.object_item import ObjectItem
-from hanzoai.cloud.models.object_list import ObjectList
-from hanzoai.cloud.models.obligation import Obligation
-from hanzoai.cloud.models.offer import Offer
-from hanzoai.cloud.models.onboard_req import OnboardReq
-from hanzoai.cloud.models.onboard_resp import OnboardResp
-from hanzoai.cloud.models.op import Op
-from hanzoai.cloud.models.open_req import OpenReq
-from hanzoai.cloud.models.opp_list import OppList
-from hanzoai.cloud.models.opp_req import OppReq
-from hanzoai.cloud.models.opportunity import Opportunity
-from hanzoai.cloud.models.optin_view import OptinView
-from hanzoai.cloud.models.oracle_view import OracleView
-from hanzoai.cloud.models.oracles_out import OraclesOut
-from hanzoai.cloud.models.order import Order
-from hanzoai.cloud.models.org_earning_view import OrgEarningView
-from hanzoai.cloud.models.org_optin_req import OrgOptinReq
-from hanzoai.cloud.models.org_optin_view import OrgOptinView
-from hanzoai.cloud.models.org_view import OrgView
-from hanzoai.cloud.models.outcome import Outcome
-from hanzoai.cloud.models.overview import Overview
-from hanzoai.cloud.models.overview_view import OverviewView
-from hanzoai.cloud.models.page import Page
-from hanzoai.cloud.models.pages_build_config import PagesBuildConfig
-from hanzoai.cloud.models.pages_d1_binding import PagesD1Binding
-from hanzoai.cloud.models.pages_deploy import PagesDeploy
-from hanzoai.cloud.models.pages_deployment_config import PagesDeploymentConfig
-from hanzoai.cloud.models.pages_deployment_configs import PagesDeploymentConfigs
-from hanzoai.cloud.models.pages_env_var import PagesEnvVar
-from hanzoai.cloud.models.pages_kv_binding import PagesKVBinding
-from hanzoai.cloud.models.pages_project_create import PagesProjectCreate
-from hanzoai.cloud.models.pages_r2_binding import PagesR2Binding
-from hanzoai.cloud.models.pairing import Pairing
-from hanzoai.cloud.models.pairing_approved import PairingApproved
-from hanzoai.cloud.models.pairing_queue import PairingQueue
-from hanzoai.cloud.models.pairing_view import PairingView
-from hanzoai.cloud.models.patch_application_in import PatchApplicationIn
-from hanzoai.cloud.models.patch_flow_in import PatchFlowIn
-from hanzoai.cloud.models.patch_in import PatchIn
-from hanzoai.cloud.models.patch_session_in import PatchSessionIn
-from hanzoai.cloud.models.patch_sync_in import PatchSyncIn
-from hanzoai.cloud.models.patch_target_in import PatchTargetIn
-from hanzoai.cloud.models.path_in import PathIn
-from hanzoai.cloud.models.payment_config import PaymentConfig
-from hanzoai.cloud.models.payment_in import PaymentIn
-from hanzoai.cloud.models.payment_out import PaymentOut
-from hanzoai.cloud.models.payment_record import PaymentRecord
-from hanzoai.cloud.models.payout import Payout
-from hanzoai.cloud.models.period_earning_view import PeriodEarningView
-from hanzoai.cloud.models.pick_out import PickOut
-from hanzoai.cloud.models.pipeline_board import PipelineBoard
-from hanzoai.cloud.models.pipeline_req import PipelineReq
-from hanzoai.cloud.models.pipeline_row import PipelineRow
-from hanzoai.cloud.models.pipeline_view import PipelineView
-from hanzoai.cloud.models.plan_entitlements import PlanEntitlements
-from hanzoai.cloud.models.plan_health import PlanHealth
-from hanzoai.cloud.models.plan_info import PlanInfo
-from hanzoai.cloud.models.plan_list import PlanList
-from hanzoai.cloud.models.plan_region_list import PlanRegionList
-from hanzoai.cloud.models.plan_resolution import PlanResolution
-from hanzoai.cloud.models.plan_schemas import PlanSchemas
-from hanzoai.cloud.models.plan_tier_list import PlanTierList
-from hanzoai.cloud.models.plan_tool_list import PlanToolList
-from hanzoai.cloud.models.plan_vocab import PlanVocab
-from hanzoai.cloud.models.plugin_deleted import PluginDeleted
-from hanzoai.cloud.models.plugin_mount import PluginMount
-from hanzoai.cloud.models.plugin_mount_list import PluginMountList
-from hanzoai.cloud.models.pn_l import PnL
-from hanzoai.cloud.models.pn_l_line import PnLLine
-from hanzoai.cloud.models.point_view import PointView
-from hanzoai.cloud.models.policy import Policy
-from hanzoai.cloud.models.policy_list import PolicyList
-from hanzoai.cloud.models.pool_create import PoolCreate
-from hanzoai.cloud.models.pool_scale import PoolScale
-from hanzoai.cloud.models.populated_flow import PopulatedFlow
-from hanzoai.cloud.models.position import Position
-from hanzoai.cloud.models.post_event_request import PostEventRequest
-from hanzoai.cloud.models.post_index_indexes_by_uid_documents_delete_batch_request import PostIndexIndexesByUidDocumentsDeleteBatchRequest
-from hanzoai.cloud.models.post_list import PostList
-from hanzoai.cloud.models.prefs_view import PrefsView
-from hanzoai.cloud.models.preset import Preset
-from hanzoai.cloud.models.preset_accepted import PresetAccepted
-from hanzoai.cloud.models.preset_list import PresetList
-from hanzoai.cloud.models.presign_response import PresignResponse
-from hanzoai.cloud.models.preview_req import PreviewReq
-from hanzoai.cloud.models.preview_view import PreviewView
-from hanzoai.cloud.models.price import Price
-from hanzoai.cloud.models.pricing_health import PricingHealth
-from hanzoai.cloud.models.pricing_model_list import PricingModelList
-from hanzoai.cloud.models.pricing_plan_list import PricingPlanList
-from hanzoai.cloud.models.pricing_preset_list import PricingPresetList
-from hanzoai.cloud.models.pricing_provider_list import PricingProviderList
-from hanzoai.cloud.models.pricing_region_list import PricingRegionList
-from hanzoai.cloud.models.pricing_sync_out import PricingSyncOut
-from hanzoai.cloud.models.pricing_tier_list import PricingTierList
-from hanzoai.cloud.models.pricing_tool_list import PricingToolList
-from hanzoai.cloud.models.principle import Principle
-from hanzoai.cloud.models.product_event import ProductEvent
-from hanzoai.cloud.models.product_row import ProductRow
-from hanzoai.cloud.models.profile_metrics import ProfileMetrics
-from hanzoai.cloud.models.profile_response import ProfileResponse
-from hanzoai.cloud.models.program_application import ProgramApplication
-from hanzoai.cloud.models.progress_view import ProgressView
-from hanzoai.cloud.models.project_view import ProjectView
-from hanzoai.cloud.models.projection_view import ProjectionView
-from hanzoai.cloud.models.projects_bound_domains import ProjectsBoundDomains
-from hanzoai.cloud.models.projects_build_site import ProjectsBuildSite
-from hanzoai.cloud.models.projects_complete import ProjectsComplete
-from hanzoai.cloud.models.projects_create import ProjectsCreate
-from hanzoai.cloud.models.projects_create_repo import ProjectsCreateRepo
-from hanzoai.cloud.models.projects_deploy_site import ProjectsDeploySite
-from hanzoai.cloud.models.projects_deploy_start import ProjectsDeployStart
-from hanzoai.cloud.models.projects_deployment import ProjectsDeployment
-from hanzoai.cloud.models.projects_domain import ProjectsDomain
-from hanzoai.cloud.models.projects_domains import ProjectsDomains
-from hanzoai.cloud.models.projects_domains_bind import ProjectsDomainsBind
-from hanzoai.cloud.models.projects_file import ProjectsFile
-from hanzoai.cloud.models.projects_fork import ProjectsFork
-from hanzoai.cloud.models.projects_project import ProjectsProject
-from hanzoai.cloud.models.projects_publish import ProjectsPublish
-from hanzoai.cloud.models.projects_release import ProjectsRelease
-from hanzoai.cloud.models.projects_repo import ProjectsRepo
-from hanzoai.cloud.models.projects_site import ProjectsSite
-from hanzoai.cloud.models.projects_site_deploy import ProjectsSiteDeploy
-from hanzoai.cloud.models.projects_update import ProjectsUpdate
-from hanzoai.cloud.models.projects_update_repo import ProjectsUpdateRepo
-from hanzoai.cloud.models.projects_upload_grant import ProjectsUploadGrant
-from hanzoai.cloud.models.promo import Promo
-from hanzoai.cloud.models.promo_list import PromoList
-from hanzoai.cloud.models.promo_status import PromoStatus
-from hanzoai.cloud.models.promote_req import PromoteReq
-from hanzoai.cloud.models.prompt_detail import PromptDetail
-from hanzoai.cloud.models.prompt_list import PromptList
-from hanzoai.cloud.models.prompt_meta import PromptMeta
-from hanzoai.cloud.models.prompt_req import PromptReq
-from hanzoai.cloud.models.prop_spec import PropSpec
-from hanzoai.cloud.models.provider_breakdown import ProviderBreakdown
-from hanzoai.cloud.models.provider_info import ProviderInfo
-from hanzoai.cloud.models.provider_row import ProviderRow
-from hanzoai.cloud.models.provider_view import ProviderView
-from hanzoai.cloud.models.provision_request import ProvisionRequest
-from hanzoai.cloud.models.provision_result import ProvisionResult
-from hanzoai.cloud.models.provisioned_resource import ProvisionedResource
-from hanzoai.cloud.models.provisioned_summary import ProvisionedSummary
-from hanzoai.cloud.models.publish_input import PublishInput
-from hanzoai.cloud.models.publish_kit_in import PublishKitIn
-from hanzoai.cloud.models.publish_req import PublishReq
-from hanzoai.cloud.models.publish_result import PublishResult
-from hanzoai.cloud.models.published_claim import PublishedClaim
-from hanzoai.cloud.models.pull_list import PullList
-from hanzoai.cloud.models.pull_view import PullView
-from hanzoai.cloud.models.purge import Purge
-from hanzoai.cloud.models.purge_in import PurgeIn
-from hanzoai.cloud.models.purge_out import PurgeOut
-from hanzoai.cloud.models.push import Push
-from hanzoai.cloud.models.push_file import PushFile
-from hanzoai.cloud.models.push_pusher import PushPusher
-from hanzoai.cloud.models.push_repository import PushRepository
-from hanzoai.cloud.models.push_req import PushReq
-from hanzoai.cloud.models.push_resp import PushResp
-from hanzoai.cloud.models.put_claims_in import PutClaimsIn
-from hanzoai.cloud.models.put_claims_out import PutClaimsOut
-from hanzoai.cloud.models.query import Query
-from hanzoai.cloud.models.question import Question
-from hanzoai.cloud.models.questions_response import QuestionsResponse
-from hanzoai.cloud.models.quote import Quote
-from hanzoai.cloud.models.quote_list import QuoteList
-from hanzoai.cloud.models.raise_in import RaiseIn
-from hanzoai.cloud.models.ran import Ran
-from hanzoai.cloud.models.range import Range
-from hanzoai.cloud.models.rate_card import RateCard
-from hanzoai.cloud.models.reachability import Reachability
-from hanzoai.cloud.models.read_out import ReadOut
-from hanzoai.cloud.models.readiness import Readiness
-from hanzoai.cloud.models.reading_req import ReadingReq
-from hanzoai.cloud.models.reading_view import ReadingView
-from hanzoai.cloud.models.readme_json import ReadmeJSON
-from hanzoai.cloud.models.receipt import Receipt
-from hanzoai.cloud.models.record import Record
-from hanzoai.cloud.models.record_list import RecordList
-from hanzoai.cloud.models.redeem_input import RedeemInput
-from hanzoai.cloud.models.redeem_result import RedeemResult
-from hanzoai.cloud.models.redemption import Redemption
-from hanzoai.cloud.models.ref_json import RefJSON
-from hanzoai.cloud.models.reference_answer import ReferenceAnswer
-from hanzoai.cloud.models.reference_out import ReferenceOut
-from hanzoai.cloud.models.reference_override import ReferenceOverride
-from hanzoai.cloud.models.reference_override_in import ReferenceOverrideIn
-from hanzoai.cloud.models.reference_receipt import ReferenceReceipt
-from hanzoai.cloud.models.reference_set import ReferenceSet
-from hanzoai.cloud.models.reference_sets_out import ReferenceSetsOut
-from hanzoai.cloud.models.reference_source import ReferenceSource
-from hanzoai.cloud.models.reference_taken import ReferenceTaken
-from hanzoai.cloud.models.reference_version import ReferenceVersion
-from hanzoai.cloud.models.refresh_out import RefreshOut
-from hanzoai.cloud.models.refresh_reference_in import RefreshReferenceIn
-from hanzoai.cloud.models.refresh_reference_out import RefreshReferenceOut
-from hanzoai.cloud.models.refs_json import RefsJSON
-from hanzoai.cloud.models.register_counts import RegisterCounts
-from hanzoai.cloud.models.register_key_req import RegisterKeyReq
-from hanzoai.cloud.models.register_page import RegisterPage
-from hanzoai.cloud.models.register_req import RegisterReq
-from hanzoai.cloud.models.register_result import RegisterResult
-from hanzoai.cloud.models.registrant import Registrant
-from hanzoai.cloud.models.registration import Registration
-from hanzoai.cloud.models.registration_view import RegistrationView
-from hanzoai.cloud.models.registry_image import RegistryImage
-from hanzoai.cloud.models.registry_image_list import RegistryImageList
-from hanzoai.cloud.models.registry_mint import RegistryMint
-from hanzoai.cloud.models.registry_package import RegistryPackage
-from hanzoai.cloud.models.registry_package_list import RegistryPackageList
-from hanzoai.cloud.models.registry_project import RegistryProject
-from hanzoai.cloud.models.registry_project_list import RegistryProjectList
-from hanzoai.cloud.models.registry_status import RegistryStatus
-from hanzoai.cloud.models.registry_tag_list import RegistryTagList
-from hanzoai.cloud.models.registry_token import RegistryToken
-from hanzoai.cloud.models.release_board import ReleaseBoard
-from hanzoai.cloud.models.release_row import ReleaseRow
-from hanzoai.cloud.models.remittance import Remittance
-from hanzoai.cloud.models.renew_req import RenewReq
-from hanzoai.cloud.models.renew_result import RenewResult
-from hanzoai.cloud.models.replace_kit_in import ReplaceKitIn
-from hanzoai.cloud.models.replay_body import ReplayBody
-from hanzoai.cloud.models.repo_list import RepoList
-from hanzoai.cloud.models.repo_tree import RepoTree
-from hanzoai.cloud.models.repo_view import RepoView
-from hanzoai.cloud.models.report import Report
-from hanzoai.cloud.models.report_out import ReportOut
-from hanzoai.cloud.models.report_req import ReportReq
-from hanzoai.cloud.models.report_resp import ReportResp
-from hanzoai.cloud.models.report_run_in import ReportRunIn
-from hanzoai.cloud.models.request import Request
-from hanzoai.cloud.models.resolve_reference_in import ResolveReferenceIn
-from hanzoai.cloud.models.resolve_reference_out import ResolveReferenceOut
-from hanzoai.cloud.models.resource_usage import ResourceUsage
-from hanzoai.cloud.models.response import Response
-from hanzoai.cloud.models.responsible import Responsible
-from hanzoai.cloud.models.restart_ref import RestartRef
-from hanzoai.cloud.models.restarted import Restarted
-from hanzoai.cloud.models.review_queue import ReviewQueue
-from hanzoai.cloud.models.review_request import ReviewRequest
-from hanzoai.cloud.models.revoke_resp import RevokeResp
-from hanzoai.cloud.models.revoked_key import RevokedKey
-from hanzoai.cloud.models.risk_adopt_in import RiskAdoptIn
-from hanzoai.cloud.models.risk_aggregates import RiskAggregates
-from hanzoai.cloud.models.risk_appetite_in import RiskAppetiteIn
-from hanzoai.cloud.models.risk_band import RiskBand
-from hanzoai.cloud.models.risk_catalog import RiskCatalog
-from hanzoai.cloud.models.risk_cause import RiskCause
-from hanzoai.cloud.models.risk_dataset import RiskDataset
-from hanzoai.cloud.models.risk_dataset_disposal import RiskDatasetDisposal
-from hanzoai.cloud.models.risk_dataset_list import RiskDatasetList
-from hanzoai.cloud.models.risk_dataset_row import RiskDatasetRow
-from hanzoai.cloud.models.risk_dataset_rows import RiskDatasetRows
-from hanzoai.cloud.models.risk_dataset_spec import RiskDatasetSpec
-from hanzoai.cloud.models.risk_dataset_versions import RiskDatasetVersions
-from hanzoai.cloud.models.risk_dispose_in import RiskDisposeIn
-from hanzoai.cloud.models.risk_dispose_out import RiskDisposeOut
-from hanzoai.cloud.models.risk_event import RiskEvent
-from hanzoai.cloud.models.risk_hold_in import RiskHoldIn
-from hanzoai.cloud.models.risk_hold_out import RiskHoldOut
-from hanzoai.cloud.models.risk_label_coverage import RiskLabelCoverage
-from hanzoai.cloud.models.risk_label_event import RiskLabelEvent
-from hanzoai.cloud.models.risk_label_fact import RiskLabelFact
-from hanzoai.cloud.models.risk_label_in import RiskLabelIn
-from hanzoai.cloud.models.risk_label_out import RiskLabelOut
-from hanzoai.cloud.models.risk_label_record import RiskLabelRecord
-from hanzoai.cloud.models.risk_label_result import RiskLabelResult
-from hanzoai.cloud.models.risk_label_vocabulary import RiskLabelVocabulary
-from hanzoai.cloud.models.risk_labels_out import RiskLabelsOut
-from hanzoai.cloud.models.risk_learn_in import RiskLearnIn
-from hanzoai.cloud.models.risk_learn_out import RiskLearnOut
-from hanzoai.cloud.models.risk_lineage import RiskLineage
-from hanzoai.cloud.models.risk_model_feature import RiskModelFeature
-from hanzoai.cloud.models.risk_model_state import RiskModelState
-from hanzoai.cloud.models.risk_model_value import RiskModelValue
-from hanzoai.cloud.models.risk_org_feature import RiskOrgFeature
-from hanzoai.cloud.models.risk_policy_out import RiskPolicyOut
-from hanzoai.cloud.models.risk_policy_version import RiskPolicyVersion
-from hanzoai.cloud.models.risk_publish_out import RiskPublishOut
-from hanzoai.cloud.models.risk_resolve_in import RiskResolveIn
-from hanzoai.cloud.models.risk_resolve_out import RiskResolveOut
-from hanzoai.cloud.models.risk_resolved import RiskResolved
-from hanzoai.cloud.models.risk_score_in import RiskScoreIn
-from hanzoai.cloud.models.risk_score_out import RiskScoreOut
-from hanzoai.cloud.models.risk_search_in import RiskSearchIn
-from hanzoai.cloud.models.risk_search_report import RiskSearchReport
-from hanzoai.cloud.models.risk_search_run import RiskSearchRun
-from hanzoai.cloud.models.risk_source_coverage import RiskSourceCoverage
-from hanzoai.cloud.models.risk_split_counts import RiskSplitCounts
-from hanzoai.cloud.models.risk_surface import RiskSurface
-from hanzoai.cloud.models.risk_topology import RiskTopology
-from hanzoai.cloud.models.risk_trial import RiskTrial
-from hanzoai.cloud.models.risk_value import RiskValue
-from hanzoai.cloud.models.role_assignment import RoleAssignment
-from hanzoai.cloud.models.role_list import RoleList
-from hanzoai.cloud.models.rollback_req import RollbackReq
-from hanzoai.cloud.models.rollup import Rollup
-from hanzoai.cloud.models.rollup_allotment import RollupAllotment
-from hanzoai.cloud.models.rollup_balance import RollupBalance
-from hanzoai.cloud.models.root import Root
-from hanzoai.cloud.models.round_input import RoundInput
-from hanzoai.cloud.models.round_out import RoundOut
-from hanzoai.cloud.models.route import Route
-from hanzoai.cloud.models.route_candidate import RouteCandidate
-from hanzoai.cloud.models.route_create_in import RouteCreateIn
-from hanzoai.cloud.models.route_plan import RoutePlan
-from hanzoai.cloud.models.routed_run_out import RoutedRunOut
-from hanzoai.cloud.models.routed_usage import RoutedUsage
-from hanzoai.cloud.models.router_list import RouterList
-from hanzoai.cloud.models.router_view import RouterView
-from hanzoai.cloud.models.rpc_error import RpcError
-from hanzoai.cloud.models.rpc_in import RpcIn
-from hanzoai.cloud.models.rpc_out import RpcOut
-from hanzoai.cloud.models.rule import Rule
-from hanzoai.cloud.models.rule_list import RuleList
-from hanzoai.cloud.models.rule_view import RuleView
-from hanzoai.cloud.models.rules_out import RulesOut
-from hanzoai.cloud.models.ruleset import Ruleset
-from hanzoai.cloud.models.run_in import RunIn
-from hanzoai.cloud.models.run_list import RunList
-from hanzoai.cloud.models.run_page import RunPage
-from hanzoai.cloud.models.run_point import RunPoint
-from hanzoai.cloud.models.run_record import RunRecord
-from hanzoai.cloud.models.run_req import RunReq
-from hanzoai.cloud.models.run_request import RunRequest
-from hanzoai.cloud.models.run_resp import RunResp
-from hanzoai.cloud.models.run_summary import RunSummary
-from hanzoai.cloud.models.run_view import RunView
-from hanzoai.cloud.models.runner_build_req import RunnerBuildReq
-from hanzoai.cloud.models.runner_build_resp import RunnerBuildResp
-from hanzoai.cloud.models.runs import Runs
-from hanzoai.cloud.models.s3_health import S3Health
-from hanzoai.cloud.models.sms import SMS
-from hanzoai.cloud.models.safe_in import SafeIn
-from hanzoai.cloud.models.safe_out import SafeOut
-from hanzoai.cloud.models.safe_proposal import SafeProposal
-from hanzoai.cloud.models.safe_tx_in import SafeTxIn
-from hanzoai.cloud.models.sample_accepted import SampleAccepted
-from hanzoai.cloud.models.sample_ingest import SampleIngest
-from hanzoai.cloud.models.sample_list import SampleList
-from hanzoai.cloud.models.sample_req import SampleReq
-from hanzoai.cloud.models.sample_view import SampleView
-from hanzoai.cloud.models.sandbox import Sandbox
-from hanzoai.cloud.models.sandbox_list import SandboxList
-from hanzoai.cloud.models.sbom_health import SbomHealth
-from hanzoai.cloud.models.sbom_ingest import SbomIngest
-from hanzoai.cloud.models.sbom_ingested import SbomIngested
-from hanzoai.cloud.models.scan import Scan
-from hanzoai.cloud.models.scan_detail import ScanDetail
-from hanzoai.cloud.models.scan_draft import ScanDraft
-from hanzoai.cloud.models.scan_list import ScanList
-from hanzoai.cloud.models.scan_view import ScanView
-from hanzoai.cloud.models.schedule_input import ScheduleInput
-from hanzoai.cloud.models.scope import Scope
-from hanzoai.cloud.models.score_config_list import ScoreConfigList
-from hanzoai.cloud.models.score_config_req import ScoreConfigReq
-from hanzoai.cloud.models.score_config_view import ScoreConfigView
-from hanzoai.cloud.models.score_list import ScoreList
-from hanzoai.cloud.models.score_req import ScoreReq
-from hanzoai.cloud.models.score_view import ScoreView
-from hanzoai.cloud.models.screen_result import ScreenResult
-from hanzoai.cloud.models.search_in import SearchIn
-from hanzoai.cloud.models.search_out import SearchOut
-from hanzoai.cloud.models.search_results import SearchResults
-from hanzoai.cloud.models.secret_list import SecretList
-from hanzoai.cloud.models.secret_meta import SecretMeta
-from hanzoai.cloud.models.secret_view import SecretView
-from hanzoai.cloud.models.section import Section
-from hanzoai.cloud.models.section_write import SectionWrite
-from hanzoai.cloud.models.self_rank import SelfRank
-from hanzoai.cloud.models.seo_audit_in import SeoAuditIn
-from hanzoai.cloud.models.seo_audit_out import SeoAuditOut
-from hanzoai.cloud.models.seo_backlink_in import SeoBacklinkIn
-from hanzoai.cloud.models.seo_backlink_out import SeoBacklinkOut
-from hanzoai.cloud.models.seo_charge import SeoCharge
-from hanzoai.cloud.models.seo_competitor_in import SeoCompetitorIn
-from hanzoai.cloud.models.seo_competitor_out import SeoCompetitorOut
-from hanzoai.cloud.models.seo_domain import SeoDomain
-from hanzoai.cloud.models.seo_idea_in import SeoIdeaIn
-from hanzoai.cloud.models.seo_idea_out import SeoIdeaOut
-from hanzoai.cloud.models.seo_keyword_in import SeoKeywordIn
-from hanzoai.cloud.models.seo_keyword_out import SeoKeywordOut
-from hanzoai.cloud.models.seo_metric import SeoMetric
-from hanzoai.cloud.models.seo_rank_in import SeoRankIn
-from hanzoai.cloud.models.seo_rank_out import SeoRankOut
-from hanzoai.cloud.models.seo_ranking import SeoRanking
-from hanzoai.cloud.models.seo_rate_out import SeoRateOut
-from hanzoai.cloud.models.sequence import Sequence
-from hanzoai.cloud.models.sequence_list import SequenceList
-from hanzoai.cloud.models.sequence_status import SequenceStatus
-from hanzoai.cloud.models.sequence_view import SequenceView
-from hanzoai.cloud.models.sequences import Sequences
-from hanzoai.cloud.models.series_line import SeriesLine
-from hanzoai.cloud.models.series_point import SeriesPoint
-from hanzoai.cloud.models.session_detail import SessionDetail
-from hanzoai.cloud.models.session_list import SessionList
-from hanzoai.cloud.models.session_user import SessionUser
-from hanzoai.cloud.models.session_view import SessionView
-from hanzoai.cloud.models.set_env_req import SetEnvReq
-from hanzoai.cloud.models.set_reference_in import SetReferenceIn
-from hanzoai.cloud.models.set_reference_out import SetReferenceOut
-from hanzoai.cloud.models.settings_req import SettingsReq
-from hanzoai.cloud.models.settings_view import SettingsView
-from hanzoai.cloud.models.share_policy import SharePolicy
-from hanzoai.cloud.models.share_view import ShareView
-from hanzoai.cloud.models.shares_out import SharesOut
-from hanzoai.cloud.models.sign_in import SignIn
-from hanzoai.cloud.models.sign_reply import SignReply
-from hanzoai.cloud.models.sign_request import SignRequest
-from hanzoai.cloud.models.signature import Signature
-from hanzoai.cloud.models.signer import Signer
-from hanzoai.cloud.models.skill import Skill
-from hanzoai.cloud.models.skill_deleted import SkillDeleted
-from hanzoai.cloud.models.skill_in import SkillIn
-from hanzoai.cloud.models.skill_written import SkillWritten
-from hanzoai.cloud.models.slot_view import SlotView
-from hanzoai.cloud.models.social_account import SocialAccount
-from hanzoai.cloud.models.social_account_body import SocialAccountBody
-from hanzoai.cloud.models.social_account_write import SocialAccountWrite
-from hanzoai.cloud.models.social_accounts import SocialAccounts
-from hanzoai.cloud.models.social_post import SocialPost
-from hanzoai.cloud.models.social_post_body import SocialPostBody
-from hanzoai.cloud.models.social_post_write import SocialPostWrite
-from hanzoai.cloud.models.social_posts import SocialPosts
-from hanzoai.cloud.models.social_provider import SocialProvider
-from hanzoai.cloud.models.social_providers import SocialProviders
-from hanzoai.cloud.models.social_summary import SocialSummary
-from hanzoai.cloud.models.source import Source
-from hanzoai.cloud.models.source_failure import SourceFailure
-from hanzoai.cloud.models.source_state import SourceState
-from hanzoai.cloud.models.source_tool_list import SourceToolList
-from hanzoai.cloud.models.sources import Sources
-from hanzoai.cloud.models.span import Span
-from hanzoai.cloud.models.span_body import SpanBody
-from hanzoai.cloud.models.spec import Spec
-from hanzoai.cloud.models.spend import Spend
-from hanzoai.cloud.models.spend_point import SpendPoint
-from hanzoai.cloud.models.stage_event import StageEvent
-from hanzoai.cloud.models.starter_kit import StarterKit
-from hanzoai.cloud.models.state import State
-from hanzoai.cloud.models.state_graph import StateGraph
-from hanzoai.cloud.models.stats_out import StatsOut
-from hanzoai.cloud.models.stats_sessions import StatsSessions
-from hanzoai.cloud.models.stats_user import StatsUser
-from hanzoai.cloud.models.status_breakdown import StatusBreakdown
-from hanzoai.cloud.models.status_counts import StatusCounts
-from hanzoai.cloud.models.status_view import StatusView
-from hanzoai.cloud.models.step import Step
-from hanzoai.cloud.models.step_input import StepInput
-from hanzoai.cloud.models.step_list import StepList
-from hanzoai.cloud.models.step_settings import StepSettings
-from hanzoai.cloud.models.step_view import StepView
-from hanzoai.cloud.models.stop_in import StopIn
-from hanzoai.cloud.models.stopped import Stopped
-from hanzoai.cloud.models.storefront_result import StorefrontResult
-from hanzoai.cloud.models.strategy import Strategy
-from hanzoai.cloud.models.strategy_view import StrategyView
-from hanzoai.cloud.models.stream import Stream
-from hanzoai.cloud.models.streams import Streams
-from hanzoai.cloud.models.structure_in import StructureIn
-from hanzoai.cloud.models.subdomain_set_in import SubdomainSetIn
-from hanzoai.cloud.models.subject import Subject
-from hanzoai.cloud.models.subject_list import SubjectList
-from hanzoai.cloud.models.subject_req import SubjectReq
-from hanzoai.cloud.models.subject_summary import SubjectSummary
-from hanzoai.cloud.models.submit_req import SubmitReq
-from hanzoai.cloud.models.subprocessor_list import SubprocessorList
-from hanzoai.cloud.models.subscribe_req import SubscribeReq
-from hanzoai.cloud.models.subscription import Subscription
-from hanzoai.cloud.models.subscription_list import SubscriptionList
-from hanzoai.cloud.models.subscription_plan import SubscriptionPlan
-from hanzoai.cloud.models.subscription_ref import SubscriptionRef
-from hanzoai.cloud.models.subscription_view import SubscriptionView
-from hanzoai.cloud.models.subscriptions import Subscriptions
-from hanzoai.cloud.models.suggest_response import SuggestResponse
-from hanzoai.cloud.models.suggestion import Suggestion
-from hanzoai.cloud.models.suite import Suite
-from hanzoai.cloud.models.summary import Summary
-from hanzoai.cloud.models.summary_resp import SummaryResp
-from hanzoai.cloud.models.summary_view import SummaryView
-from hanzoai.cloud.models.suppression import Suppression
-from hanzoai.cloud.models.suppression_list import SuppressionList
-from hanzoai.cloud.models.symbol import Symbol
-from hanzoai.cloud.models.sync_list import SyncList
-from hanzoai.cloud.models.sync_queued import SyncQueued
-from hanzoai.cloud.models.sync_req import SyncReq
-from hanzoai.cloud.models.sync_tally import SyncTally
-from hanzoai.cloud.models.sync_view import SyncView
-from hanzoai.cloud.models.tls_config import TLSConfig
-from hanzoai.cloud.models.tag_config import TagConfig
-from hanzoai.cloud.models.target_deleted import TargetDeleted
-from hanzoai.cloud.models.target_list import TargetList
-from hanzoai.cloud.models.target_req import TargetReq
-from hanzoai.cloud.models.target_view import TargetView
-from hanzoai.cloud.models.tariff import Tariff
-from hanzoai.cloud.models.tariff_in import TariffIn
-from hanzoai.cloud.models.taxon import Taxon
-from hanzoai.cloud.models.taxon_in import TaxonIn
-from hanzoai.cloud.models.taxonomy import Taxonomy
-from hanzoai.cloud.models.template_catalog import TemplateCatalog
-from hanzoai.cloud.models.template_override import TemplateOverride
-from hanzoai.cloud.models.template_reply import TemplateReply
-from hanzoai.cloud.models.template_view import TemplateView
-from hanzoai.cloud.models.test_result import TestResult
-from hanzoai.cloud.models.ticket_grant import TicketGrant
-from hanzoai.cloud.models.tier import Tier
-from hanzoai.cloud.models.tier_balance import TierBalance
-from hanzoai.cloud.models.tier_limits import TierLimits
-from hanzoai.cloud.models.timeseries import Timeseries
-from hanzoai.cloud.models.todo_project import TodoProject
-from hanzoai.cloud.models.tool import Tool
-from hanzoai.cloud.models.tool_call import ToolCall
-from hanzoai.cloud.models.tool_list import ToolList
-from hanzoai.cloud.models.tool_result import ToolResult
-from hanzoai.cloud.models.top import Top
-from hanzoai.cloud.models.top_models import TopModels
-from hanzoai.cloud.models.top_products import TopProducts
-from hanzoai.cloud.models.total_view import TotalView
-from hanzoai.cloud.models.trace_list import TraceList
-from hanzoai.cloud.models.trace_view import TraceView
-from hanzoai.cloud.models.traffic_caller import TrafficCaller
-from hanzoai.cloud.models.traffic_view import TrafficView
-from hanzoai.cloud.models.trail_page import TrailPage
-from hanzoai.cloud.models.transaction import Transaction
-from hanzoai.cloud.models.transactions import Transactions
-from hanzoai.cloud.models.transactions_out import TransactionsOut
-from hanzoai.cloud.models.transfer_req import TransferReq
-from hanzoai.cloud.models.transition_in import TransitionIn
-from hanzoai.cloud.models.transition_result import TransitionResult
-from hanzoai.cloud.models.treasury_report import TreasuryReport
-from hanzoai.cloud.models.tree_entry import TreeEntry
-from hanzoai.cloud.models.tree_entry_json import TreeEntryJSON
-from hanzoai.cloud.models.tree_json import TreeJSON
-from hanzoai.cloud.models.tree_node import TreeNode
-from hanzoai.cloud.models.trial import Trial
-from hanzoai.cloud.models.trial_balance import TrialBalance
-from hanzoai.cloud.models.trial_balance_row import TrialBalanceRow
-from hanzoai.cloud.models.trigger_list import TriggerList
-from hanzoai.cloud.models.trigger_view import TriggerView
-from hanzoai.cloud.models.trust_ask import TrustAsk
-from hanzoai.cloud.models.trust_ask_view import TrustAskView
-from hanzoai.cloud.models.trust_asked import TrustAsked
-from hanzoai.cloud.models.trust_coverage import TrustCoverage
-from hanzoai.cloud.models.trust_decision import TrustDecision
-from hanzoai.cloud.models.trust_desk import TrustDesk
-from hanzoai.cloud.models.trust_documents import TrustDocuments
-from hanzoai.cloud.models.trust_edit import TrustEdit
-from hanzoai.cloud.models.trust_grant_view import TrustGrantView
-from hanzoai.cloud.models.trust_granted import TrustGranted
-from hanzoai.cloud.models.trust_item import TrustItem
-from hanzoai.cloud.models.trust_item_view import TrustItemView
-from hanzoai.cloud.models.trust_page import TrustPage
-from hanzoai.cloud.models.trust_publish import TrustPublish
-from hanzoai.cloud.models.trust_refused import TrustRefused
-from hanzoai.cloud.models.trust_settings import TrustSettings
-from hanzoai.cloud.models.trust_tally import TrustTally
-from hanzoai.cloud.models.txn import Txn
-from hanzoai.cloud.models.utm import UTM
-from hanzoai.cloud.models.unreconciled_out import UnreconciledOut
-from hanzoai.cloud.models.unsubscribed import Unsubscribed
-from hanzoai.cloud.models.update_agent_in import UpdateAgentIn
-from hanzoai.cloud.models.update_campaign_in import UpdateCampaignIn
-from hanzoai.cloud.models.update_endpoint_in import UpdateEndpointIn
-from hanzoai.cloud.models.update_list import UpdateList
-from hanzoai.cloud.models.upkeep import Upkeep
-from hanzoai.cloud.models.upkeep_in import UpkeepIn
-from hanzoai.cloud.models.upload_in import UploadIn
-from hanzoai.cloud.models.upstream import Upstream
-from hanzoai.cloud.models.usage import Usage
-from hanzoai.cloud.models.usage_analytics_access import UsageAnalyticsAccess
-from hanzoai.cloud.models.usage_analytics_grant import UsageAnalyticsGrant
-from hanzoai.cloud.models.usage_analytics_view import UsageAnalyticsView
-from hanzoai.cloud.models.usage_point import UsagePoint
-from hanzoai.cloud.models.usage_repo import UsageRepo
-from hanzoai.cloud.models.usage_scope import UsageScope
-from hanzoai.cloud.models.usage_summary import UsageSummary
-from hanzoai.cloud.models.usage_view import UsageView
-from hanzoai.cloud.models.usage_window_view import UsageWindowView
-from hanzoai.cloud.models.user_enablement_item import UserEnablementItem
-from hanzoai.cloud.models.user_optin_req import UserOptinReq
-from hanzoai.cloud.models.user_optin_view import UserOptinView
-from hanzoai.cloud.models.validator_claim import ValidatorClaim
-from hanzoai.cloud.models.validator_list import ValidatorList
-from hanzoai.cloud.models.variant import Variant
-from hanzoai.cloud.models.vendor_row import VendorRow
-from hanzoai.cloud.models.vendors_out import VendorsOut
-from hanzoai.cloud.models.verdict import Verdict
-from hanzoai.cloud.models.verification_decision import VerificationDecision
-from hanzoai.cloud.models.verification_req import VerificationReq
-from hanzoai.cloud.models.verification_tally import VerificationTally
-from hanzoai.cloud.models.verify_out import VerifyOut
-from hanzoai.cloud.models.verify_request import VerifyRequest
-from hanzoai.cloud.models.version_message import VersionMessage
-from hanzoai.cloud.models.version_meta import VersionMeta
-from hanzoai.cloud.models.version_page import VersionPage
-from hanzoai.cloud.models.version_view import VersionView
-from hanzoai.cloud.models.voucher import Voucher
-from hanzoai.cloud.models.waiting import Waiting
-from hanzoai.cloud.models.wallet import Wallet
-from hanzoai.cloud.models.wallet_account import WalletAccount
-from hanzoai.cloud.models.wallet_list import WalletList
-from hanzoai.cloud.models.web_engine import WebEngine
-from hanzoai.cloud.models.web_overview import WebOverview
-from hanzoai.cloud.models.web_question import WebQuestion
-from hanzoai.cloud.models.web_result import WebResult
-from hanzoai.cloud.models.web_search_query import WebSearchQuery
-from hanzoai.cloud.models.web_search_results import WebSearchResults
-from hanzoai.cloud.models.window import Window
-from hanzoai.cloud.models.wire import Wire
-from hanzoai.cloud.models.wire_fact import WireFact
-from hanzoai.cloud.models.wire_instructions import WireInstructions
-from hanzoai.cloud.models.worker_list import WorkerList
-from hanzoai.cloud.models.worker_script_put import WorkerScriptPut
-from hanzoai.cloud.models.world_index import WorldIndex
-from hanzoai.cloud.models.world_wire import WorldWire
-from hanzoai.cloud.models.write_in import WriteIn
-from hanzoai.cloud.models.written import Written
-from hanzoai.cloud.models.wrote import Wrote
-from hanzoai.cloud.models.zap_proc_req import ZapProcReq
+__all__ = [
+    "AccList",
+    "AccView",
+    "Account",
+    "AccountList",
+    "AccountView",
+    "Accounts",
+    "AccountsOut",
+    "AccountsTotal",
+    "AccountsUsage",
+    "AccreditationDecision",
+    "AccreditationReq",
+    "ActionRecord",
+    "ActionsView",
+    "ActivationReq",
+    "ActivationSet",
+    "ActivityFeed",
+    "ActivityOut",
+    "ActivityPoint",
+    "ActivityRow",
+    "ActivityTotals",
+    "ActivityView",
+    "AdCampaign",
+    "AdSummary",
+    "AddDomainReq",
+    "Admission",
+    "AdvanceIn",
+    "AffiliateBoard",
+    "AffiliateEarnings",
+    "AffiliateLinks",
+    "AffiliateSelf",
+    "AffiliateStanding",
+    "AgentBinding",
+    "AgentDetail",
+    "AgentList",
+    "AgentRunView",
+    "AgentView",
+    "AiMCPApp",
+    "AiMCPSurface",
+    "Alert",
+    "AlertPatch",
+    "AlertSpec",
+    "Allowance",
+    "AllowlistPutIn",
+    "AllowlistView",
+    "Analysis",
+    "AnalyticsView",
+    "AnalyzeQuery",
+    "Answer",
+    "ApiKey",
+    "ApiKeyList",
+    "AppView",
+    "Appearance",
+    "Application",
+    "ApplicationList",
+    "ApplyRequest",
+    "ApprovePairingIn",
+    "ArgoApp",
+    "ArgoAppList",
+    "ArgoCluster",
+    "ArgoClusterInfo",
+    "ArgoClusterList",
+    "ArgoConnectionState",
+    "ArgoDestination",
+    "ArgoGroupKind",
+    "ArgoHealth",
+    "ArgoInfoItem",
+    "ArgoListMeta",
+    "ArgoMeta",
+    "ArgoNode",
+    "ArgoProject",
+    "ArgoProjectList",
+    "ArgoProjectSpec",
+    "ArgoResourceRef",
+    "ArgoResourceStatus",
+    "ArgoRevisionMetadata",
+    "ArgoSource",
+    "ArgoSpec",
+    "ArgoStatus",
+    "ArgoSummary",
+    "ArgoSyncStatus",
+    "ArgoSyncWindows",
+    "ArgoTree",
+    "Arm",
+    "AskAnswer",
+    "AskPostIn",
+    "AskRequest",
+    "AskResponse",
+    "Assignment",
+    "AttributeRequest",
+    "Attribution",
+    "Audience",
+    "AudienceList",
+    "AudiencePreview",
+    "AuditList",
+    "AuthorRepo",
+    "AuthoredPlugin",
+    "AuthoredPluginList",
+    "AuthoredSkillList",
+    "AuthorizeOut",
+    "Backend",
+    "BackendStatus",
+    "BalanceLine",
+    "BalanceSheet",
+    "Balances",
+    "BankQuestion",
+    "BankTally",
+    "BankTxnRow",
+    "BaseHealth",
+    "BeginIn",
+    "Benchmark",
+    "BenchmarkCatalog",
+    "BillingAccount",
+    "BillingInvoice",
+    "BinarySpec",
+    "BindAgentReq",
+    "BindingList",
+    "Blob",
+    "BlobJSON",
+    "Blog",
+    "Blueprint",
+    "BlueprintCounts",
+    "BlueprintHealth",
+    "BlueprintIndex",
+    "BlueprintRow",
+    "BlueprintVersionsView",
+    "BlueprintView",
+    "Board",
+    "BoardItem",
+    "BoardPage",
+    "BoardPoint",
+    "BoardRange",
+    "BoardResp",
+    "BoardScope",
+    "BoardTotals",
+    "BookRequest",
+    "BookResponse",
+    "BotList",
+    "BotMember",
+    "BotRoster",
+    "BotRun",
+    "BotRuns",
+    "BotStopped",
+    "BotSync",
+    "BotView",
+    "Breakdown",
+    "BreakdownRow",
+    "BrowserTagOut",
+    "BucketCreateIn",
+    "BucketIn",
+    "BucketItem",
+    "BucketList",
+    "BucketRecord",
+    "BucketWrite",
+    "BuildBoard",
+    "BuildList",
+    "BuildOut",
+    "BuildRequest",
+    "BuildRow",
+    "BuildSummary",
+    "BuildTurn",
+    "BuildView",
+    "BusAck",
+    "BusMessage",
+    "BusPublish",
+    "BusRequest",
+    "BuyInput",
+    "ByoGPU",
+    "ByoWorker",
+    "CalendarPost",
+    "Call",
+    "CallInput",
+    "CallList",
+    "Campaign",
+    "CampaignInput",
+    "CampaignList",
+    "CampaignPage",
+    "CampaignRecord",
+    "CampaignResults",
+    "CampaignSummary",
+    "CampaignUpdate",
+    "CampaignWrite",
+    "CapVerdict",
+    "Capabilities",
+    "Capability",
+    "CaptableClassHolding",
+    "CaptableCompany",
+    "CaptableCompanyUpdate",
+    "CaptableConvertibles",
+    "CaptableDeleted",
+    "CaptableEquityPlan",
+    "CaptableEquityPlans",
+    "CaptableHolding",
+    "CaptableInstrumentTotal",
+    "CaptableInvestment",
+    "CaptableInvestments",
+    "CaptableNote",
+    "CaptableNotes",
+    "CaptableOption",
+    "CaptableOptions",
+    "CaptableRound",
+    "CaptableRoundCloseRequest",
+    "CaptableRoundDetail",
+    "CaptableRoundInvestment",
+    "CaptableRoundTotals",
+    "CaptableRounds",
+    "CaptableSafe",
+    "CaptableSafes",
+    "CaptableShare",
+    "CaptableShareClass",
+    "CaptableShares",
+    "CaptableStakeholder",
+    "CaptableStakeholderPatch",
+    "CaptableSummary",
+    "CaptableSummaryCompany",
+    "CaptableTotals",
+    "CaptableUpdated",
+    "CaptureBatch",
+    "CaptureEvent",
+    "CaptureResult",
+    "CapturedError",
+    "Cart",
+    "CartItem",
+    "CartItemSet",
+    "CartOpen",
+    "Catalog",
+    "CatalogEntry",
+    "CatalogList",
+    "CatalogOut",
+    "CatalogPage",
+    "Category",
+    "CategoryIn",
+    "CategorySpend",
+    "Centre",
+    "Chain",
+    "ChainList",
+    "ChainStatus",
+    "ChallengeView",
+    "Channel",
+    "ChannelAdd",
+    "ChannelList",
+    "ChannelMetric",
+    "ChannelResult",
+    "ChannelSpec",
+    "ChannelView",
+    "Charge",
+    "ChatChannels",
+    "ChatRequest",
+    "ChatResponse",
+    "CheckList",
+    "CheckView",
+    "Citation",
+    "Claim",
+    "ClaimKeyOut",
+    "ClaimRequest",
+    "ClaimRow",
+    "ClaimView",
+    "ClaimsOut",
+    "ClauseCoverage",
+    "ClauseRow",
+    "ClearReferenceOut",
+    "ClickCount",
+    "ClickRequest",
+    "ClipBody",
+    "ClusterAttach",
+    "ClusterDetached",
+    "ClusterDetailView",
+    "ClusterList",
+    "ClusterView",
+    "CodeFile",
+    "CodeResult",
+    "CodeRun",
+    "CodeView",
+    "CodingStartIn",
+    "CodingStarted",
+    "CollabPayload",
+    "CollabRequest",
+    "CollabResult",
+    "Collected",
+    "CommerceOverview",
+    "CommitJSON",
+    "CommitsJSON",
+    "Company",
+    "CompanyList",
+    "CompanyReq",
+    "Completion",
+    "Config",
+    "ConnView",
+    "ConnectIn",
+    "ConnectOut",
+    "ConnectRequest",
+    "ConnectionOut",
+    "ConnectionView",
+    "ConnectorAction",
+    "ConnectorAuth",
+    "ConnectorMetadata",
+    "ConnectorProviderView",
+    "ConnectorProvidersOut",
+    "ConnectorTokenOut",
+    "ConnectorTrigger",
+    "ConnectorView",
+    "ConnectorsOut",
+    "ConsoleSettings",
+    "ConsoleSettingsDexConfig",
+    "ConsoleSettingsGoogleAnalytics",
+    "ConsoleSettingsHelp",
+    "Consumer",
+    "Contact",
+    "ContactList",
+    "ContactReq",
+    "Contacts",
+    "ContextBundle",
+    "ContextIn",
+    "ControlCommandView",
+    "ControlDrain",
+    "ControlList",
+    "CookieAck",
+    "CorpusView",
+    "CostLine",
+    "CoverRow",
+    "CrawlDocument",
+    "CrawlRequest",
+    "CrawlResult",
+    "CreateAccountIn",
+    "CreateAgentIn",
+    "CreateAppReq",
+    "CreateBody",
+    "CreateClusterReq",
+    "CreateClusterReqNodePool",
+    "CreateEndpointIn",
+    "CreateFlowReq",
+    "CreateLinkRequest",
+    "CreateReq",
+    "CreateServerReq",
+    "CreateVersionIn",
+    "CreateWalletIn",
+    "CredentialIn",
+    "CredentialOut",
+    "CreditBalance",
+    "CreditEntry",
+    "CreditGrant",
+    "CreditGrants",
+    "CrmSummary",
+    "CryptoAsset",
+    "CryptoDeposit",
+    "CryptoOptions",
+    "CsrfResp",
+    "CurateReq",
+    "Curriculum",
+    "CurriculumView",
+    "D1Query",
+    "DashResp",
+    "DatabaseCreateIn",
+    "DataroomAddDocument",
+    "DataroomCreate",
+    "DataroomDocument",
+    "DataroomDocumentOne",
+    "DataroomDocuments",
+    "DataroomLink",
+    "DataroomLinkCreate",
+    "DataroomLinkOne",
+    "DataroomLinkStats",
+    "DataroomLinks",
+    "DataroomMember",
+    "DataroomMembership",
+    "DataroomPageStat",
+    "DataroomRoom",
+    "DataroomRoomDetail",
+    "DataroomRoomDetailOne",
+    "DataroomRoomOne",
+    "DataroomRooms",
+    "DataroomStats",
+    "DatasetList",
+    "DatasetReq",
+    "DatasetView",
+    "DecideBody",
+    "DecisionIn",
+    "DeckOut",
+    "DefRow",
+    "Definition",
+    "DefsOut",
+    "Deleted",
+    "DeletedOut",
+    "Delivery",
+    "DeliveryList",
+    "DeliveryRow",
+    "DeployLogs",
+    "DeployRecord",
+    "DeployReq",
+    "DeployRequest",
+    "DeploymentView",
+    "DestinationDisconnected",
+    "DestinationField",
+    "DestinationList",
+    "DestinationStatus",
+    "DestinationTest",
+    "DevicePollOut",
+    "DeviceStartIn",
+    "DeviceStartOut",
+    "DeviceView",
+    "Diagnostic",
+    "DisconnectOut",
+    "DocField",
+    "DocPerm",
+    "DocRow",
+    "DocType",
+    "DocTypeList",
+    "DocumentList",
+    "DocumentPage",
+    "DocumentReply",
+    "DocumentSummary",
+    "DocumentView",
+    "DomainAddIn",
+    "DomainView",
+    "DriftBoard",
+    "DriftFlag",
+    "DriftTally",
+    "Dropped",
+    "Durable",
+    "EIN",
+    "EdgeState",
+    "EinIn",
+    "EmbedStatusResp",
+    "EnableResp",
+    "EnablementBoard",
+    "EnablementOptRef",
+    "EndIn",
+    "Endpoint",
+    "EndpointList",
+    "EndpointReq",
+    "EndpointView",
+    "EngineAdvertisement",
+    "EngineStatus",
+    "EnrollInput",
+    "EnrollReq",
+    "EnrollResult",
+    "Enrollment",
+    "EnrollmentList",
+    "Enrolment",
+    "EntitlementsView",
+    "Entry",
+    "EnvVarJSON",
+    "EnvironmentBoard",
+    "EnvironmentRow",
+    "ErrorList",
+    "EsignCompleteIn",
+    "EsignCompletion",
+    "EsignDocument",
+    "EsignDocuments",
+    "EsignEvent",
+    "EsignField",
+    "EsignFieldIn",
+    "EsignHealth",
+    "EsignInsertion",
+    "EsignInvite",
+    "EsignLink",
+    "EsignLinks",
+    "EsignOut",
+    "EsignPDF",
+    "EsignPlacement",
+    "EsignRecipient",
+    "EsignRecipientIn",
+    "EsignRejectIn",
+    "EsignRejection",
+    "EsignSession",
+    "EsignSigner",
+    "EsignState",
+    "EsignTrail",
+    "EsignUploadIn",
+    "EsignValueIn",
+    "EvaluateIn",
+    "EvaluatorList",
+    "EvaluatorReq",
+    "EvaluatorView",
+    "Event",
+    "EventList",
+    "EventView",
+    "Exception",
+    "ExecRequest",
+    "ExecResult",
+    "ExperimentList",
+    "Extracted",
+    "FaqList",
+    "Figure",
+    "FileContent",
+    "FileInput",
+    "FileJSON",
+    "FilesJSON",
+    "Filing",
+    "FilingPage",
+    "FilingReply",
+    "FilingRequest",
+    "Filters",
+    "FinanceLedgerEntry",
+    "FinancialPackage",
+    "FindingList",
+    "FindingView",
+    "FleetBoard",
+    "FleetMetrics",
+    "FleetSpec",
+    "FleetSummary",
+    "FleetUnit",
+    "Flow",
+    "FlowAction",
+    "FlowCreate",
+    "FlowPage",
+    "FlowRun",
+    "FlowStatus",
+    "FlowTrigger",
+    "FlowUpdate",
+    "FlowVersion",
+    "FnList",
+    "Form",
+    "Formation",
+    "FormationView",
+    "Founder",
+    "FoundersIn",
+    "Frame",
+    "FrameworkList",
+    "FrameworkRow",
+    "FunctionDetail",
+    "FunctionView",
+    "Funnel",
+    "GLRow",
+    "GPU",
+    "GcOut",
+    "GenerateInput",
+    "GenerateRequest",
+    "GenerateResult",
+    "Genesis",
+    "GitOpsApp",
+    "GitOpsDeploy",
+    "GitOpsOperation",
+    "GitOpsPlane",
+    "GitOrigin",
+    "GitSource",
+    "GithubBackfillIn",
+    "GithubBackfillResult",
+    "GithubClaimIn",
+    "GithubClaimOut",
+    "GithubForkOut",
+    "GithubForkReq",
+    "GithubImportIn",
+    "GithubImportOut",
+    "GithubInstallationView",
+    "GithubInstallationsOut",
+    "GithubPagesBuildOut",
+    "GithubPagesDisabledOut",
+    "GithubPagesEnableReq",
+    "GithubPagesSource",
+    "GithubPagesUpdateReq",
+    "GithubPagesUpdatedOut",
+    "GithubPagesView",
+    "GithubRepoView",
+    "GithubReposOut",
+    "GithubSearchHit",
+    "GithubSearchOut",
+    "GithubSearchReq",
+    "GitlabProjectView",
+    "GitlabProjectsOut",
+    "GpuAlertList",
+    "GpuJob",
+    "GpuList",
+    "GpuView",
+    "GraphAssertIn",
+    "GraphAssertOut",
+    "GraphEdge",
+    "GraphFact",
+    "GraphNeighborsIn",
+    "GraphNeighborsOut",
+    "GraphNode",
+    "GraphOut",
+    "GraphQLError",
+    "GraphQLIn",
+    "GraphQLOut",
+    "GraphReadOut",
+    "GraphResolveIn",
+    "GraphResolveOut",
+    "GraphVocabularyOut",
+    "HandleRequest",
+    "HandleSet",
+    "Health",
+    "HealthLens",
+    "HealthLenses",
+    "HealthOut",
+    "HealthPlane",
+    "HealthReport",
+    "HealthView",
+    "HelpArticle",
+    "HelpArticleCard",
+    "HelpArticleList",
+    "HelpCategory",
+    "HelpCategoryList",
+    "HelpTicketFiled",
+    "HelpTicketIntake",
+    "HistoryOut",
+    "Hit",
+    "Holder",
+    "Holding",
+    "Holdings",
+    "IamAccountBody",
+    "IamAccountItem",
+    "IamAddress",
+    "IamAnswer",
+    "IamApplication",
+    "IamApplicationListResult",
+    "IamAssumeBody",
+    "IamAuditLog",
+    "IamBulk",
+    "IamCartItem",
+    "IamCert",
+    "IamCertsDeleteOutput",
+    "IamCertsListOutput",
+    "IamConfig",
+    "IamConsentRecord",
+    "IamCreateInput",
+    "IamCreateOrganizationInput",
+    "IamCreateSessionIn",
+    "IamDeleteOrganizationOutput",
+    "IamDeleteOutput",
+    "IamDeleteResponse",
+    "IamDeleteResult",
+    "IamDeleteSessionOut",
+    "IamFaceId",
+    "IamFilter",
+    "IamInput",
+    "IamInvitation",
+    "IamInvitationsDeleteOutput",
+    "IamInvitationsInput",
+    "IamInvitationsListOutput",
+    "IamJwtItem",
+    "IamKey",
+    "IamListOrganizationsOutput",
+    "IamListOutput",
+    "IamListProvidersOut",
+    "IamListResponse",
+    "IamListSessionsOut",
+    "IamListTokensOut",
+    "IamListWebauthnCredentialsOut",
+    "IamManagedAccount",
+    "IamMfaAccount",
+    "IamMfaItem",
+    "IamMfaProps",
+    "IamMutationResult",
+    "IamOrganization",
+    "IamPasswordBody",
+    "IamPermission",
+    "IamPermissionDeleteResponse",
+    "IamPermissionListResponse",
+    "IamPerson",
+    "IamProject",
+    "IamProjectsDeleteOutput",
+    "IamProjectsInput",
+    "IamProjectsListOutput",
+    "IamProvider",
+    "IamProviderItem",
+    "IamProviderResult",
+    "IamRegistration",
+    "IamReply",
+    "IamRole",
+    "IamRolesDeleteOutput",
+    "IamRolesInput",
+    "IamRolesListOutput",
+    "IamSamlItem",
+    "IamScheme",
+    "IamScopeDescription",
+    "IamScopeItem",
+    "IamSession",
+    "IamSetAvatarInput",
+    "IamSigninItem",
+    "IamSigninMethod",
+    "IamSignupItem",
+    "IamThemeData",
+    "IamToggle",
+    "IamToken",
+    "IamTokenMutation",
+    "IamTokenResult",
+    "IamUpdateInput",
+    "IamUpdateOrganizationInput",
+    "IamUpdateSessionIn",
+    "IamUser",
+    "IamUsersDeleteOutput",
+    "IamUsersListOutput",
+    "IamWebauthnCredential",
+    "IamWebauthnCredentialMutationResult",
+    "IamWebauthnCredentialResult",
+    "IamWorkspace",
+    "IamWorkspacesDeleteOutput",
+    "IamWorkspacesInput",
+    "IamWorkspacesListOutput",
+    "ImageOrigin",
+    "ImageView",
+    "ImportCapTableIn",
+    "ImportCapTableOut",
+    "ImportDocumentsIn",
+    "ImportDocumentsOut",
+    "InboxItem",
+    "InboxOut",
+    "InboxPage",
+    "InboxView",
+    "Index",
+    "IndexCount",
+    "IndexDocuments",
+    "IndexEnqueued",
+    "IndexFilter",
+    "IndexHealth",
+    "IndexHits",
+    "IndexIn",
+    "IndexList",
+    "IndexNew",
+    "IndexQuery",
+    "IndexResult",
+    "IndexSettings",
+    "IndexStats",
+    "IndexTask",
+    "IndexVersion",
+    "IndexView",
+    "IndexerView",
+    "IndexersOut",
+    "InfoOut",
+    "IngestReq",
+    "IngestResp",
+    "IngressMiddlewares",
+    "IngressRoutes",
+    "IngressServices",
+    "IngressStatus",
+    "IngressTLS",
+    "InsightsBody",
+    "InsightsEvent",
+    "InsightsStatus",
+    "Install",
+    "InstallReq",
+    "InstallState",
+    "InvocationList",
+    "InvocationView",
+    "Invoice",
+    "InvoiceLine",
+    "InvoiceLineItem",
+    "Invoices",
+    "InvokeReq",
+    "IssueEdit",
+    "IssueHit",
+    "IssueHits",
+    "IssueView",
+    "ItemList",
+    "ItemReq",
+    "ItemResult",
+    "ItemView",
+    "JobCancel",
+    "JobCanceled",
+    "JobList",
+    "JourneyStep",
+    "JudgeSpec",
+    "KbAuthorizeOut",
+    "KbConnectorsOut",
+    "KbSyncOut",
+    "KeyList",
+    "KeyTypeIn",
+    "KeyView",
+    "KitList",
+    "KmsConfig",
+    "KmsHealth",
+    "KmsLogin",
+    "KmsPut",
+    "KmsSecrets",
+    "KmsStored",
+    "KmsToken",
+    "KvAck",
+    "KvEntry",
+    "KvPage",
+    "KvWrite",
+    "KycRefreshOut",
+    "KycSession",
+    "KycStartOut",
+    "LLM",
+    "LLMOverview",
+    "LastEventView",
+    "LatencyStat",
+    "LeaderRow",
+    "Leaderboard",
+    "LeaderboardRow",
+    "LeaderboardView",
+    "LeaseIn",
+    "Leased",
+    "Leg",
+    "LegalFiling",
+    "LegalHealth",
+    "LegalSigner",
+    "LegalTemplate",
+    "LevelView",
+    "LicensingDeviceSignals",
+    "LicensingFingerprintRequest",
+    "LicensingFingerprintResponse",
+    "LicensingHealthView",
+    "LicensingIssueRequest",
+    "LicensingIssueResponse",
+    "LicensingJWK",
+    "LicensingPubkeyView",
+    "LicensingRelease",
+    "LicensingReleaseAsset",
+    "LicensingReleaseList",
+    "LicensingRevocationEntry",
+    "LicensingRevokeRequest",
+    "LicensingRevokeResponse",
+    "LicensingVerifyRequest",
+    "LicensingVerifyResponse",
+    "LimitsBlock",
+    "LimitsView",
+    "LineItem",
+    "Link",
+    "LinkList",
+    "LinkMint",
+    "LinkView",
+    "ListOut",
+    "Listing",
+    "ListingPage",
+    "Liveness",
+    "Location",
+    "LogBody",
+    "LogLines",
+    "Loss",
+    "MCPError",
+    "MCPListing",
+    "MCPPackage",
+    "MCPRemote",
+    "MCPRequest",
+    "MCPResponse",
+    "MCPServer",
+    "MachineList",
+    "MachineView",
+    "MakeIn",
+    "MarketCatalog",
+    "MarketItem",
+    "Match",
+    "McpCatalog",
+    "McpCatalogSync",
+    "McpServerList",
+    "MeetHealth",
+    "MemoryEntry",
+    "MemoryPage",
+    "MeshServiceList",
+    "MeshView",
+    "MessageInput",
+    "MessageList",
+    "MetricBody",
+    "MetricList",
+    "MetricRow",
+    "Metrics",
+    "MetricsResponse",
+    "MetricsView",
+    "Middleware",
+    "MintedKey",
+    "MirrorList",
+    "MirrorReq",
+    "MirrorTargetReq",
+    "MirrorTargetView",
+    "MlCreate",
+    "MlResource",
+    "MlResourceList",
+    "Mode",
+    "ModeIn",
+    "ModelField",
+    "ModelHistory",
+    "ModelRow",
+    "ModelStat",
+    "ModuleInfo",
+    "ModuleList",
+    "ModuleState",
+    "MutateReq",
+    "MyReferralView",
+    "MyReferrals",
+    "NamespaceCreateIn",
+    "NetworkList",
+    "NetworkView",
+    "NewIssue",
+    "NewsItem",
+    "NewsResponse",
+    "NextIn",
+    "NodeList",
+    "NodePoolView",
+    "NodeView",
+    "NodesView",
+    "NotifyHealth",
+    "NotifySend",
+    "Number",
+    "NumberList",
+    "O11yAWSAccountConfig",
+    "O11yAWSCloudWatchLogsSubscription",
+    "O11yAWSCloudWatchMetricStreamFilter",
+    "O11yAWSConnectionArtifact",
+    "O11yAWSIntegrationConfig",
+    "O11yAWSLogsCollectionStrategy",
+    "O11yAWSMetricsCollectionStrategy",
+    "O11yAWSPostableAccountConfig",
+    "O11yAWSServiceConfig",
+    "O11yAWSServiceLogsConfig",
+    "O11yAWSServiceMetricsConfig",
+    "O11yAWSTelemetryCollectionStrategy",
+    "O11yAccount",
+    "O11yAccountConfig",
+    "O11yAddItemsIn",
+    "O11yAgentReport",
+    "O11yAggregateAttributeResponse",
+    "O11yAlert",
+    "O11yAlertStatus",
+    "O11yAlertmanagertypesReceiver",
+    "O11yAnnItemList",
+    "O11yAnnItemView",
+    "O11yAnnItemsCreated",
+    "O11yAnnQueueDeleted",
+    "O11yAnnQueueDetailView",
+    "O11yAnnQueueList",
+    "O11yAnnQueueView",
+    "O11yAssociatedComponent",
+    "O11yAttributeKey",
+    "O11yAttributesComponentEntry",
+    "O11yAuthorization",
+    "O11yAvailabilityPoint",
+    "O11yAvailabilityResponse",
+    "O11yAvailabilityResponseRange",
+    "O11yAzureAccountConfig",
+    "O11yAzureConnectionArtifact",
+    "O11yAzureIntegrationConfig",
+    "O11yAzureLogsCollectionStrategy",
+    "O11yAzureServiceConfig",
+    "O11yAzureServiceLogsConfig",
+    "O11yAzureServiceMetricsConfig",
+    "O11yAzureTelemetryCollectionStrategy",
+    "O11yBasicAuth",
+    "O11yBuilderQuery",
+    "O11yChannel",
+    "O11yChecks",
+    "O11yCloudIntegrationService",
+    "O11yClusterListRecord",
+    "O11yClusterListRequest",
+    "O11yClusterListResponse",
+    "O11yClusterRecord",
+    "O11yClusters",
+    "O11yCollectedLogAttribute",
+    "O11yCollectedMetric",
+    "O11yCompositeQuery",
+    "O11yConnectionArtifact",
+    "O11yCreateQueueReq",
+    "O11yCredentials",
+    "O11yDaemonSetListRecord",
+    "O11yDaemonSetListRequest",
+    "O11yDaemonSetListResponse",
+    "O11yDaemonSetRecord",
+    "O11yDaemonSets",
+    "O11yDataCollected",
+    "O11yDataCollectedForIntegration",
+    "O11yDatastoreQuery",
+    "O11yDeployment",
+    "O11yDeploymentListRecord",
+    "O11yDeploymentListRequest",
+    "O11yDeploymentListResponse",
+    "O11yDeploymentRecord",
+    "O11yDeployments",
+    "O11yDeprecatedGettableAlert",
+    "O11yDiscordConfig",
+    "O11yEmailConfig",
+    "O11yEvent",
+    "O11yFilter",
+    "O11yFilterAttributeKeyResponse",
+    "O11yFilterAttributeValueRequest",
+    "O11yFilterAttributeValueResponse",
+    "O11yFilterItem",
+    "O11yFilterSet",
+    "O11yFlamegraphSpan",
+    "O11yFormatOptions",
+    "O11yFunction",
+    "O11yFunnelStep",
+    "O11yGCPAccountConfig",
+    "O11yGCPServiceConfig",
+    "O11yGCPServiceLogsConfig",
+    "O11yGCPServiceMetricsConfig",
+    "O11yGettableAccountWithConnectionArtifact",
+    "O11yGettableAccounts",
+    "O11yGettableAgentCheckIn",
+    "O11yGettableCreatedIngestionKey",
+    "O11yGettableCreatedIngestionKeyLimit",
+    "O11yGettableFieldKeys",
+    "O11yGettableFieldValues",
+    "O11yGettableFlamegraphTrace",
+    "O11yGettableFunnel",
+    "O11yGettableHost",
+    "O11yGettableIngestionKeys",
+    "O11yGettableRoutePolicy",
+    "O11yGettableRuleStateHistory",
+    "O11yGettableRuleStateHistoryContributor",
+    "O11yGettableRuleStateHistoryStats",
+    "O11yGettableRuleStateTimeline",
+    "O11yGettableRuleStateWindow",
+    "O11yGettableServicesMetadata",
+    "O11yGettableSpanMapperGroups",
+    "O11yGettableSpanMappers",
+    "O11yGettableTestRule",
+    "O11yGettableTraceAggregations",
+    "O11yGettableWaterfallTrace",
+    "O11yGoogleChatReceiverConfig",
+    "O11yGroupByKey",
+    "O11yHTTPClientConfig",
+    "O11yHaving",
+    "O11yHost",
+    "O11yHostFilter",
+    "O11yHostListRecord",
+    "O11yHostListRequest",
+    "O11yHostListResponse",
+    "O11yHostRecord",
+    "O11yHosts",
+    "O11yIncidentioConfig",
+    "O11yIngestionKey",
+    "O11yInstallIntegrationRequest",
+    "O11yInstalledIntegration",
+    "O11yIntegration",
+    "O11yIntegrationAssets",
+    "O11yIntegrationAuthor",
+    "O11yIntegrationConfig",
+    "O11yIntegrationConfigStep",
+    "O11yIntegrationConnectionStatus",
+    "O11yIntegrationConnectionTests",
+    "O11yIntegrationsCollectedLogAttribute",
+    "O11yIntegrationsCollectedMetric",
+    "O11yIntegrationsListItem",
+    "O11yIntegrationsListResponse",
+    "O11yItemInput",
+    "O11yJiraConfig",
+    "O11yJiraFieldConfig",
+    "O11yJobListRecord",
+    "O11yJobListRequest",
+    "O11yJobListResponse",
+    "O11yJobRecord",
+    "O11yJobs",
+    "O11yLabel",
+    "O11yLimit",
+    "O11yLimitConfig",
+    "O11yLimitMetric",
+    "O11yLimitMetricValue",
+    "O11yLimitValue",
+    "O11yListMeta",
+    "O11yLogsAssets",
+    "O11yLogsConnectionTest",
+    "O11yMSTeamsConfig",
+    "O11yMSTeamsV2Config",
+    "O11yMattermostAttachment",
+    "O11yMattermostConfig",
+    "O11yMattermostField",
+    "O11yMattermostPriority",
+    "O11yMattermostProps",
+    "O11yMetricsComponentEntry",
+    "O11yMetricsResponse",
+    "O11yMetricsResponseRange",
+    "O11yMetricsResponseSeries",
+    "O11yMetricsResponseSummary",
+    "O11yMetricsResponseUsage",
+    "O11yMissingAttributesComponentEntry",
+    "O11yMissingMetricsComponentEntry",
+    "O11yNamespaceListRecord",
+    "O11yNamespaceListRequest",
+    "O11yNamespaceListResponse",
+    "O11yNamespaceRecord",
+    "O11yNamespaces",
+    "O11yNodeCountByCondition",
+    "O11yNodeCountsByReadiness",
+    "O11yNodeListRecord",
+    "O11yNodeListRequest",
+    "O11yNodeListResponse",
+    "O11yNodeRecord",
+    "O11yNodes",
+    "O11yNotifierConfig",
+    "O11yO11yAPIKey",
+    "O11yO11yAPIKeyCreateIn",
+    "O11yO11yAPIKeyCreateOut",
+    "O11yO11yAPIKeySecret",
+    "O11yO11yAPIKeyUpdateIn",
+    "O11yO11yAPIKeysOut",
+    "O11yO11yAccountOut",
+    "O11yO11yAccountsOut",
+    "O11yO11yAck",
+    "O11yO11yAffectedAsset",
+    "O11yO11yAffectedWidget",
+    "O11yO11yAgentCheckInIn",
+    "O11yO11yAgentCheckInOut",
+    "O11yO11yAggregateAttributesOut",
+    "O11yO11yAggregation",
+    "O11yO11yAggregationMeta",
+    "O11yO11yAlertsOut",
+    "O11yO11yAnalyzeIn",
+    "O11yO11yAnalyzeOut",
+    "O11yO11yApdexOut",
+    "O11yO11yApdexSetIn",
+    "O11yO11yApdexSetOut",
+    "O11yO11yApdexSettings",
+    "O11yO11yAttributeKey",
+    "O11yO11yAttributeKeysOut",
+    "O11yO11yAttributeMapping",
+    "O11yO11yAttributeValuesOut",
+    "O11yO11yAuthDomain",
+    "O11yO11yAuthDomainConfig",
+    "O11yO11yAuthDomainOut",
+    "O11yO11yAuthDomainsOut",
+    "O11yO11yAuthNProviderInfo",
+    "O11yO11yAuthNSupport",
+    "O11yO11yBulkInviteIn",
+    "O11yO11yCallbackAuthN",
+    "O11yO11yChangePasswordIn",
+    "O11yO11yChannelOut",
+    "O11yO11yChannelUpdateIn",
+    "O11yO11yChannelsOut",
+    "O11yO11yCheckOut",
+    "O11yO11yClusterListOut",
+    "O11yO11yColumnInfo",
+    "O11yO11yConnectionStatusOut",
+    "O11yO11yCreateAccountIn",
+    "O11yO11yCreateAccountOut",
+    "O11yO11yCreateLimitIn",
+    "O11yO11yCreated",
+    "O11yO11yCreatedIngestionKeyOut",
+    "O11yO11yCreatedLimitOut",
+    "O11yO11yCreatedOut",
+    "O11yO11yCredentialsOut",
+    "O11yO11yDaemonSetListOut",
+    "O11yO11yDashboard",
+    "O11yO11yDashboardDisplay",
+    "O11yO11yDashboardList",
+    "O11yO11yDashboardListForUser",
+    "O11yO11yDashboardListForUserOut",
+    "O11yO11yDashboardListItem",
+    "O11yO11yDashboardListItemForUser",
+    "O11yO11yDashboardListOut",
+    "O11yO11yDashboardListSpec",
+    "O11yO11yDashboardOut",
+    "O11yO11yDashboardPatchIn",
+    "O11yO11yDashboardPatchOp",
+    "O11yO11yDashboardPostable",
+    "O11yO11yDashboardPostableTag",
+    "O11yO11yDashboardTag",
+    "O11yO11yDashboardUpdateIn",
+    "O11yO11yDashboardVarValues",
+    "O11yO11yDashboardVarsIn",
+    "O11yO11yDashboardVarsOut",
+    "O11yO11yDashboardView",
+    "O11yO11yDashboardViewData",
+    "O11yO11yDashboardViewList",
+    "O11yO11yDashboardViewListOut",
+    "O11yO11yDashboardViewOut",
+    "O11yO11yDashboardViewPostable",
+    "O11yO11yDashboardViewUpdateIn",
+    "O11yO11yDependency",
+    "O11yO11yDependencyGraphIn",
+    "O11yO11yDeploymentListOut",
+    "O11yO11yDeprecatedUser",
+    "O11yO11yDeprecatedUserOut",
+    "O11yO11yDeprecatedUserUpdate",
+    "O11yO11yDeprecatedUsersOut",
+    "O11yO11yDiscoverIn",
+    "O11yO11yDiscoverOut",
+    "O11yO11yDisk",
+    "O11yO11yDomainFilter",
+    "O11yO11yDomainGroupBy",
+    "O11yO11yDomainsAnswer",
+    "O11yO11yDomainsData",
+    "O11yO11yDomainsIn",
+    "O11yO11yDomainsOut",
+    "O11yO11yDowntimeScheduleOut",
+    "O11yO11yDowntimeSchedulesOut",
+    "O11yO11yDowntimeUpdateIn",
+    "O11yO11yDraftFunnelIn",
+    "O11yO11yEmailPasswordSessionIn",
+    "O11yO11yErrorDetail",
+    "O11yO11yErrorGettableIssue",
+    "O11yO11yErrorGettableIssueOut",
+    "O11yO11yErrorIssue",
+    "O11yO11yErrorIssueOut",
+    "O11yO11yErrorIssues",
+    "O11yO11yErrorIssuesOut",
+    "O11yO11yErrorItem",
+    "O11yO11yErrorUpdateIssueIn",
+    "O11yO11yErrorWithSpan",
+    "O11yO11yErrorsCountIn",
+    "O11yO11yErrorsListIn",
+    "O11yO11yEvent",
+    "O11yO11yEventIn",
+    "O11yO11yEventUser",
+    "O11yO11yEvents",
+    "O11yO11yFeature",
+    "O11yO11yFeaturesOut",
+    "O11yO11yFieldCatalogOut",
+    "O11yO11yFieldKeysOut",
+    "O11yO11yFieldSetting",
+    "O11yO11yFieldValuesOut",
+    "O11yO11yFilter",
+    "O11yO11yFilterItem",
+    "O11yO11yFilterKey",
+    "O11yO11yFilterSet",
+    "O11yO11yFilterSuggestions",
+    "O11yO11yFilterSuggestionsOut",
+    "O11yO11yForgotPasswordIn",
+    "O11yO11yFrame",
+    "O11yO11yFunnelCreateIn",
+    "O11yO11yFunnelDeleteOut",
+    "O11yO11yFunnelOut",
+    "O11yO11yFunnelRow",
+    "O11yO11yFunnelRowsOut",
+    "O11yO11yFunnelStepWindowIn",
+    "O11yO11yFunnelStepsUpdateIn",
+    "O11yO11yFunnelUpdateIn",
+    "O11yO11yFunnelWindowIn",
+    "O11yO11yFunnelsOut",
+    "O11yO11yGettableHostOut",
+    "O11yO11yGlobalConfig",
+    "O11yO11yGlobalConfigOut",
+    "O11yO11yGoogleConfig",
+    "O11yO11yHealthOut",
+    "O11yO11yHostListOut",
+    "O11yO11yIdentN",
+    "O11yO11yIdentifiable",
+    "O11yO11yIdentifiableOut",
+    "O11yO11yInfraAttributeKeysOut",
+    "O11yO11yInfraAttributeValuesOut",
+    "O11yO11yInfraChecksOut",
+    "O11yO11yInfraClustersOut",
+    "O11yO11yInfraDaemonSetsOut",
+    "O11yO11yInfraDeploymentsOut",
+    "O11yO11yInfraHostsOut",
+    "O11yO11yInfraJobsOut",
+    "O11yO11yInfraNamespacesOut",
+    "O11yO11yInfraNodesOut",
+    "O11yO11yInfraPodsOut",
+    "O11yO11yInfraStatefulSetsOut",
+    "O11yO11yInfraVolumesOut",
+    "O11yO11yIngestionKeysOut",
+    "O11yO11yInstallOut",
+    "O11yO11yIntegrationAck",
+    "O11yO11yIntegrationOut",
+    "O11yO11yIntegrationsListOut",
+    "O11yO11yInvite",
+    "O11yO11yInviteIn",
+    "O11yO11yInviteOut",
+    "O11yO11yJobListOut",
+    "O11yO11yK8sOnboarding",
+    "O11yO11yLLMAnnotation",
+    "O11yO11yLLMAnnotationOut",
+    "O11yO11yLLMAnnotationsOut",
+    "O11yO11yLLMAnnotationsPage",
+    "O11yO11yLLMIngestAnnotation",
+    "O11yO11yLLMIngestScore",
+    "O11yO11yLLMObservation",
+    "O11yO11yLLMObservationsOut",
+    "O11yO11yLLMObservationsPage",
+    "O11yO11yLLMPricingCacheCosts",
+    "O11yO11yLLMPricingRule",
+    "O11yO11yLLMPricingRuleOut",
+    "O11yO11yLLMPricingRulesOut",
+    "O11yO11yLLMPricingRulesPage",
+    "O11yO11yLLMRulePricing",
+    "O11yO11yLLMScore",
+    "O11yO11yLLMScoreOut",
+    "O11yO11yLLMScoresOut",
+    "O11yO11yLLMScoresPage",
+    "O11yO11yLLMSession",
+    "O11yO11yLLMSessionsOut",
+    "O11yO11yLLMSessionsPage",
+    "O11yO11yLLMTrace",
+    "O11yO11yLLMTracesOut",
+    "O11yO11yLLMTracesPage",
+    "O11yO11yLLMUpdatablePricingRule",
+    "O11yO11yLLMUpdatablePricingRules",
+    "O11yO11yLLMUser",
+    "O11yO11yLLMUsersOut",
+    "O11yO11yLLMUsersPage",
+    "O11yO11yLicenseActiveOut",
+    "O11yO11yLicensesOut",
+    "O11yO11yListError",
+    "O11yO11yLogAggregateBucket",
+    "O11yO11yLogAggregateOut",
+    "O11yO11yLogConfigVersion",
+    "O11yO11yLogFilter",
+    "O11yO11yLogFilterItem",
+    "O11yO11yLogFilterKey",
+    "O11yO11yLogParseFrom",
+    "O11yO11yLogPipeline",
+    "O11yO11yLogPipelineCreateIn",
+    "O11yO11yLogPipelineOperator",
+    "O11yO11yLogPipelinePreview",
+    "O11yO11yLogPipelinePreviewIn",
+    "O11yO11yLogPipelinePreviewOut",
+    "O11yO11yLogPipelineRoute",
+    "O11yO11yLogPipelines",
+    "O11yO11yLogPipelinesOut",
+    "O11yO11yLogPostablePipeline",
+    "O11yO11yLogPromoteIndex",
+    "O11yO11yLogPromoteOut",
+    "O11yO11yLogPromotePath",
+    "O11yO11yLogPromotedOut",
+    "O11yO11yLogRecord",
+    "O11yO11yLogRecordsOut",
+    "O11yO11yLogsOut",
+    "O11yO11yMessage",
+    "O11yO11yMetricAckOut",
+    "O11yO11yMetricAlert",
+    "O11yO11yMetricAlerts",
+    "O11yO11yMetricAlertsOut",
+    "O11yO11yMetricAttribute",
+    "O11yO11yMetricAttributes",
+    "O11yO11yMetricAttributesOut",
+    "O11yO11yMetricDashboards",
+    "O11yO11yMetricDashboardsOut",
+    "O11yO11yMetricField",
+    "O11yO11yMetricFilter",
+    "O11yO11yMetricHighlights",
+    "O11yO11yMetricHighlightsOut",
+    "O11yO11yMetricInspectIn",
+    "O11yO11yMetricInspectOut",
+    "O11yO11yMetricLabel",
+    "O11yO11yMetricList",
+    "O11yO11yMetricListOut",
+    "O11yO11yMetricMetadata",
+    "O11yO11yMetricMetadataOut",
+    "O11yO11yMetricMetadataSaveIn",
+    "O11yO11yMetricOnboarding",
+    "O11yO11yMetricOnboardingOut",
+    "O11yO11yMetricOrder",
+    "O11yO11yMetricPanel",
+    "O11yO11yMetricPoint",
+    "O11yO11yMetricSeries",
+    "O11yO11yMetricSeriesSet",
+    "O11yO11yMetricStat",
+    "O11yO11yMetricStats",
+    "O11yO11yMetricStatsIn",
+    "O11yO11yMetricStatsOut",
+    "O11yO11yMetricSummary",
+    "O11yO11yMetricTreemap",
+    "O11yO11yMetricTreemapIn",
+    "O11yO11yMetricTreemapOut",
+    "O11yO11yMetricsQueryRangeOut",
+    "O11yO11yMyServiceAccountUpdateIn",
+    "O11yO11yNamespaceListOut",
+    "O11yO11yNextPrevErrorIDs",
+    "O11yO11yNodeListOut",
+    "O11yO11yOIDCConfig",
+    "O11yO11yObject",
+    "O11yO11yObjectGroup",
+    "O11yO11yOccurrence",
+    "O11yO11yOccurrenceFrame",
+    "O11yO11yOnboardingOut",
+    "O11yO11yOperation",
+    "O11yO11yOperationsIn",
+    "O11yO11yOperationsOut",
+    "O11yO11yOrgStatsOut",
+    "O11yO11yOrganization",
+    "O11yO11yOrganizationOut",
+    "O11yO11yOverallStateTransitionsOut",
+    "O11yO11yPasswordAuthN",
+    "O11yO11yPercentilePosition",
+    "O11yO11yPercentiles",
+    "O11yO11yPodListOut",
+    "O11yO11yPodOnboarding",
+    "O11yO11yPostableAuthDomain",
+    "O11yO11yPostableUser",
+    "O11yO11yPreference",
+    "O11yO11yPreferenceOut",
+    "O11yO11yPreferencesOut",
+    "O11yO11yProcessListOut",
+    "O11yO11yPromQueryOut",
+    "O11yO11yPromResult",
+    "O11yO11yPublicDashboard",
+    "O11yO11yPublicDashboardData",
+    "O11yO11yPublicDashboardDataOut",
+    "O11yO11yPublicDashboardOut",
+    "O11yO11yPublicDashboardV1",
+    "O11yO11yPublicDashboardWriteIn",
+    "O11yO11yPvcListOut",
+    "O11yO11yQueryFilterAnalysis",
+    "O11yO11yQueryRange",
+    "O11yO11yQueryRangeData",
+    "O11yO11yQueryRangeFormatOut",
+    "O11yO11yQueryRangeOut",
+    "O11yO11yQueryRangePreviewIn",
+    "O11yO11yQueryRangePreviewOut",
+    "O11yO11yQueryStats",
+    "O11yO11yQueryWarning",
+    "O11yO11yQueryWarningNote",
+    "O11yO11yQueueCheck",
+    "O11yO11yQueueChecksOut",
+    "O11yO11yQueueFilterKey",
+    "O11yO11yQueueFilterRule",
+    "O11yO11yQueueFilterSet",
+    "O11yO11yQueueIn",
+    "O11yO11yQueueListIn",
+    "O11yO11yQueueRow",
+    "O11yO11yQueueRowsOut",
+    "O11yO11yQuickFiltersOut",
+    "O11yO11yReductionRule",
+    "O11yO11yReductionRuleCreateIn",
+    "O11yO11yReductionRuleListOut",
+    "O11yO11yReductionRuleOut",
+    "O11yO11yReductionRulePreview",
+    "O11yO11yReductionRulePreviewIn",
+    "O11yO11yReductionRulePreviewOut",
+    "O11yO11yReductionRuleSaveIn",
+    "O11yO11yReductionRules",
+    "O11yO11yReductionSeriesOut",
+    "O11yO11yReductionSeriesResult",
+    "O11yO11yReductionStats",
+    "O11yO11yReductionStatsOut",
+    "O11yO11yRegisterIn",
+    "O11yO11yRegisterOut",
+    "O11yO11yResetPasswordIn",
+    "O11yO11yResetToken",
+    "O11yO11yResetTokenOut",
+    "O11yO11yResetTokenRef",
+    "O11yO11yResourceRef",
+    "O11yO11yRetentionMatch",
+    "O11yO11yRetentionOut",
+    "O11yO11yRetentionRule",
+    "O11yO11yRetentionSetIn",
+    "O11yO11yRetentionSetOut",
+    "O11yO11yRetry",
+    "O11yO11yRole",
+    "O11yO11yRoleCreateIn",
+    "O11yO11yRoleCreateOut",
+    "O11yO11yRoleDetail",
+    "O11yO11yRoleID",
+    "O11yO11yRoleMapping",
+    "O11yO11yRoleOut",
+    "O11yO11yRoleUpdateIn",
+    "O11yO11yRolesOut",
+    "O11yO11yRotateSessionIn",
+    "O11yO11yRoutePoliciesOut",
+    "O11yO11yRoutePolicyOut",
+    "O11yO11yRoutePolicyUpdateIn",
+    "O11yO11yRuleHistoryContributorsOut",
+    "O11yO11yRuleHistoryFilterKeysOut",
+    "O11yO11yRuleHistoryFilterValuesOut",
+    "O11yO11yRuleHistoryOverallStatusOut",
+    "O11yO11yRuleHistoryQueryIn",
+    "O11yO11yRuleHistoryStatsOut",
+    "O11yO11yRuleHistoryTimelineOut",
+    "O11yO11yRuleOut",
+    "O11yO11yRuleStateContributorsOut",
+    "O11yO11yRuleStateTimelineOut",
+    "O11yO11yRuleStatsOut",
+    "O11yO11yRulesOut",
+    "O11yO11ySAMLConfig",
+    "O11yO11ySavedViewCreateOut",
+    "O11yO11ySavedViewDeleteOut",
+    "O11yO11ySavedViewListOut",
+    "O11yO11ySavedViewOut",
+    "O11yO11ySavedViewUpdateIn",
+    "O11yO11ySentryEventOut",
+    "O11yO11ySentryIssueEventsOut",
+    "O11yO11ySentryPostableProject",
+    "O11yO11ySentryProject",
+    "O11yO11ySentryProjectOut",
+    "O11yO11ySentryProjects",
+    "O11yO11ySentryProjectsOut",
+    "O11yO11ySentryUpdateIssueIn",
+    "O11yO11yService",
+    "O11yO11yServiceAccount",
+    "O11yO11yServiceAccountCreateIn",
+    "O11yO11yServiceAccountCreateOut",
+    "O11yO11yServiceAccountDetail",
+    "O11yO11yServiceAccountOut",
+    "O11yO11yServiceAccountRole",
+    "O11yO11yServiceAccountRoleGrantIn",
+    "O11yO11yServiceAccountRolesOut",
+    "O11yO11yServiceAccountUpdateIn",
+    "O11yO11yServiceAccountsOut",
+    "O11yO11yServiceOut",
+    "O11yO11yServiceTag",
+    "O11yO11yServiceWarning",
+    "O11yO11yServicesIn",
+    "O11yO11yServicesMetadataOut",
+    "O11yO11yServicesOut",
+    "O11yO11ySessionContext",
+    "O11yO11ySessionContextOut",
+    "O11yO11ySessionOrg",
+    "O11yO11ySetRoleIn",
+    "O11yO11ySignalFilters",
+    "O11yO11ySignalFiltersOut",
+    "O11yO11ySpanMapperCreateIn",
+    "O11yO11ySpanMapperGroupOut",
+    "O11yO11ySpanMapperGroupUpdateIn",
+    "O11yO11ySpanMapperGroupsOut",
+    "O11yO11ySpanMapperOut",
+    "O11yO11ySpanMapperUpdateIn",
+    "O11yO11ySpanMappersOut",
+    "O11yO11ySpanPercentile",
+    "O11yO11ySpanPercentileIn",
+    "O11yO11ySpanPercentileOut",
+    "O11yO11yStat",
+    "O11yO11yStatefulSetListOut",
+    "O11yO11yStats",
+    "O11yO11yStatsOut",
+    "O11yO11ySubstituteVarsOut",
+    "O11yO11yTable",
+    "O11yO11yTagFilter",
+    "O11yO11yTagQuery",
+    "O11yO11yTelemetryField",
+    "O11yO11yTestNotificationOut",
+    "O11yO11yTestNotificationResult",
+    "O11yO11yTestRuleOut",
+    "O11yO11yToggle",
+    "O11yO11yToken",
+    "O11yO11yTokenOut",
+    "O11yO11yTopLevelOpsIn",
+    "O11yO11yTrace",
+    "O11yO11yTraceAggregationsIn",
+    "O11yO11yTraceAggregationsOut",
+    "O11yO11yTraceDetail",
+    "O11yO11yTraceFlamegraphIn",
+    "O11yO11yTraceFlamegraphOut",
+    "O11yO11yTraceOut",
+    "O11yO11yTraceSpanWindow",
+    "O11yO11yTraceWaterfallIn",
+    "O11yO11yTraceWaterfallOut",
+    "O11yO11yTraces",
+    "O11yO11yTracesOut",
+    "O11yO11yTransaction",
+    "O11yO11yTransactionGroup",
+    "O11yO11yTransactionResult",
+    "O11yO11yTreemapEntry",
+    "O11yO11yUpdatableAuthDomain",
+    "O11yO11yUpdatablePreference",
+    "O11yO11yUpdatableQuickFilters",
+    "O11yO11yUpdatableUser",
+    "O11yO11yUpdateAccountIn",
+    "O11yO11yUpdateIngestionKeyIn",
+    "O11yO11yUpdateLimitIn",
+    "O11yO11yUpdateServiceIn",
+    "O11yO11yUsageItem",
+    "O11yO11yUser",
+    "O11yO11yUserRole",
+    "O11yO11yUserUpdate",
+    "O11yO11yUserWithRoles",
+    "O11yO11yUserWithRolesOut",
+    "O11yO11yUsersOut",
+    "O11yO11yVersionOut",
+    "O11yO11yWidgetQueryRange",
+    "O11yO11yWidgetQueryRangeOut",
+    "O11yOAuth2",
+    "O11yOldAWSCollectionStrategy",
+    "O11yOldAWSLogsStrategy",
+    "O11yOldAWSLogsStrategyCloudwatchLogsSubscriptionsInner",
+    "O11yOldAWSMetricsStrategy",
+    "O11yOldAWSMetricsStrategyCloudwatchMetricStreamFiltersInner",
+    "O11yOpsGenieConfig",
+    "O11yOpsGenieConfigResponder",
+    "O11yOrderBy",
+    "O11yOrderByKey",
+    "O11yOtelSpanRef",
+    "O11yPagerdutyConfig",
+    "O11yPagerdutyImage",
+    "O11yPagerdutyLink",
+    "O11yPagination",
+    "O11yPodCountByPhase",
+    "O11yPodCountsByPhase",
+    "O11yPodListRecord",
+    "O11yPodListRequest",
+    "O11yPodListResponse",
+    "O11yPodRecord",
+    "O11yPods",
+    "O11yPoint",
+    "O11yPostableAccountConfig",
+    "O11yPostableChannel",
+    "O11yPostableClusters",
+    "O11yPostableDaemonSets",
+    "O11yPostableDeployments",
+    "O11yPostableHost",
+    "O11yPostableHosts",
+    "O11yPostableIngestionKey",
+    "O11yPostableJobs",
+    "O11yPostableNamespaces",
+    "O11yPostableNodes",
+    "O11yPostablePipeline",
+    "O11yPostablePlannedMaintenance",
+    "O11yPostablePods",
+    "O11yPostableProfile",
+    "O11yPostableRoutePolicy",
+    "O11yPostableSpanMapperGroup",
+    "O11yPostableStatefulSets",
+    "O11yPostableVolumes",
+    "O11yProcessListRecord",
+    "O11yProcessListRequest",
+    "O11yProcessListResponse",
+    "O11yPromQuery",
+    "O11yProviderIntegrationConfig",
+    "O11yPushoverConfig",
+    "O11yQueryEnvelope",
+    "O11yQueryRangeParamsV3",
+    "O11yQueryRangeRequest",
+    "O11yQueryWarnData",
+    "O11yQueryWarnDataAdditional",
+    "O11yQuerybuildertypesv5CompositeQuery",
+    "O11yQuerybuildertypesv5OrderBy",
+    "O11yReceiver",
+    "O11yReleStateItem",
+    "O11yRocketchatAttachmentAction",
+    "O11yRocketchatAttachmentField",
+    "O11yRocketchatConfig",
+    "O11yRuleStateHistory",
+    "O11yRuleStateHistoryContributor",
+    "O11yRuleStateTimeline",
+    "O11ySNSConfig",
+    "O11ySavedView",
+    "O11ySeries",
+    "O11yService",
+    "O11yServiceAssets",
+    "O11yServiceConfig",
+    "O11yServiceDashboard",
+    "O11yServiceMetadata",
+    "O11yServiceUp",
+    "O11ySigV4Config",
+    "O11ySignalConnectionStatus",
+    "O11ySlackAction",
+    "O11ySlackConfig",
+    "O11ySlackConfirmationField",
+    "O11ySlackField",
+    "O11ySpanAggregation",
+    "O11ySpanAggregationResult",
+    "O11ySpanMapper",
+    "O11ySpanMapperConfig",
+    "O11ySpanMapperGroup",
+    "O11ySpanMapperGroupCondition",
+    "O11ySpanMapperSource",
+    "O11yStatefulSetListRecord",
+    "O11yStatefulSetListRequest",
+    "O11yStatefulSetListResponse",
+    "O11yStatefulSetRecord",
+    "O11yStatefulSets",
+    "O11yStats",
+    "O11yStatusComponent",
+    "O11yStatusIncident",
+    "O11yStatusMaintenance",
+    "O11yStatusResult",
+    "O11yStatusSummary",
+    "O11yStorableFunnel",
+    "O11yStorableIntegrationDashboard",
+    "O11ySupportedSignals",
+    "O11yTLSConfig",
+    "O11yTelegramConfig",
+    "O11yTelemetryFieldKey",
+    "O11yTelemetryFieldValues",
+    "O11yThreadingConfig",
+    "O11yTimeSeries",
+    "O11yTraceRow",
+    "O11yTracesOut",
+    "O11yUninstallIntegrationRequest",
+    "O11yUpdatableAccountConfig",
+    "O11yUpdatableAzureAccountConfig",
+    "O11yUpdatableGCPAccountConfig",
+    "O11yUpdateItemIn",
+    "O11yUpdateQueueIn",
+    "O11yUsageBucket",
+    "O11yUser",
+    "O11yVariableItem",
+    "O11yVictorOpsConfig",
+    "O11yVolumeListRecord",
+    "O11yVolumeListRequest",
+    "O11yVolumeListResponse",
+    "O11yVolumeRecord",
+    "O11yVolumes",
+    "O11yWaterfallSpan",
+    "O11yWebexConfig",
+    "O11yWebhookConfig",
+    "O11yWechatConfig",
+    "OauthBundleIn",
+    "ObjectItem",
+    "ObjectList",
+    "Obligation",
+    "Offer",
+    "OnboardReq",
+    "OnboardResp",
+    "Op",
+    "OpenReq",
+    "OppList",
+    "OppReq",
+    "Opportunity",
+    "OptinView",
+    "OracleView",
+    "OraclesOut",
+    "Order",
+    "OrgEarningView",
+    "OrgOptinReq",
+    "OrgOptinView",
+    "OrgView",
+    "Outcome",
+    "Overview",
+    "OverviewView",
+    "Page",
+    "PagesBuildConfig",
+    "PagesD1Binding",
+    "PagesDeploy",
+    "PagesDeploymentConfig",
+    "PagesDeploymentConfigs",
+    "PagesEnvVar",
+    "PagesKVBinding",
+    "PagesProjectCreate",
+    "PagesR2Binding",
+    "Pairing",
+    "PairingApproved",
+    "PairingQueue",
+    "PairingView",
+    "PatchApplicationIn",
+    "PatchFlowIn",
+    "PatchIn",
+    "PatchSessionIn",
+    "PatchSyncIn",
+    "PatchTargetIn",
+    "PathIn",
+    "PaymentConfig",
+    "PaymentIn",
+    "PaymentOut",
+    "PaymentRecord",
+    "Payout",
+    "PeriodEarningView",
+    "PickOut",
+    "PipelineBoard",
+    "PipelineReq",
+    "PipelineRow",
+    "PipelineView",
+    "PlanEntitlements",
+    "PlanHealth",
+    "PlanInfo",
+    "PlanList",
+    "PlanRegionList",
+    "PlanResolution",
+    "PlanSchemas",
+    "PlanTierList",
+    "PlanToolList",
+    "PlanVocab",
+    "PluginDeleted",
+    "PluginMount",
+    "PluginMountList",
+    "PnL",
+    "PnLLine",
+    "PointView",
+    "Policy",
+    "PolicyList",
+    "PoolCreate",
+    "PoolScale",
+    "PopulatedFlow",
+    "Position",
+    "PostEventRequest",
+    "PostIndexIndexesByUidDocumentsDeleteBatchRequest",
+    "PostList",
+    "PrefsView",
+    "Preset",
+    "PresetAccepted",
+    "PresetList",
+    "PresignResponse",
+    "PreviewReq",
+    "PreviewView",
+    "Price",
+    "PricingHealth",
+    "PricingModelList",
+    "PricingPlanList",
+    "PricingPresetList",
+    "PricingProviderList",
+    "PricingRegionList",
+    "PricingSyncOut",
+    "PricingTierList",
+    "PricingToolList",
+    "Principle",
+    "ProductEvent",
+    "ProductRow",
+    "ProfileMetrics",
+    "ProfileResponse",
+    "ProgramApplication",
+    "ProgressView",
+    "ProjectView",
+    "ProjectionView",
+    "ProjectsBoundDomains",
+    "ProjectsBuildSite",
+    "ProjectsComplete",
+    "ProjectsCreate",
+    "ProjectsCreateRepo",
+    "ProjectsDeploySite",
+    "ProjectsDeployStart",
+    "ProjectsDeployment",
+    "ProjectsDomain",
+    "ProjectsDomains",
+    "ProjectsDomainsBind",
+    "ProjectsFile",
+    "ProjectsFork",
+    "ProjectsProject",
+    "ProjectsPublish",
+    "ProjectsRelease",
+    "ProjectsRepo",
+    "ProjectsSite",
+    "ProjectsSiteDeploy",
+    "ProjectsUpdate",
+    "ProjectsUpdateRepo",
+    "ProjectsUploadGrant",
+    "Promo",
+    "PromoList",
+    "PromoStatus",
+    "PromoteReq",
+    "PromptDetail",
+    "PromptList",
+    "PromptMeta",
+    "PromptReq",
+    "PropSpec",
+    "ProviderBreakdown",
+    "ProviderInfo",
+    "ProviderRow",
+    "ProviderView",
+    "ProvisionRequest",
+    "ProvisionResult",
+    "ProvisionedResource",
+    "ProvisionedSummary",
+    "PublishInput",
+    "PublishKitIn",
+    "PublishReq",
+    "PublishResult",
+    "PublishedClaim",
+    "PullList",
+    "PullView",
+    "Purge",
+    "PurgeIn",
+    "PurgeOut",
+    "Push",
+    "PushFile",
+    "PushPusher",
+    "PushRepository",
+    "PushReq",
+    "PushResp",
+    "PutClaimsIn",
+    "PutClaimsOut",
+    "Query",
+    "Question",
+    "QuestionsResponse",
+    "Quote",
+    "QuoteList",
+    "RaiseIn",
+    "Ran",
+    "Range",
+    "RateCard",
+    "Reachability",
+    "ReadOut",
+    "Readiness",
+    "ReadingReq",
+    "ReadingView",
+    "ReadmeJSON",
+    "Receipt",
+    "Record",
+    "RecordList",
+    "RedeemInput",
+    "RedeemResult",
+    "Redemption",
+    "RefJSON",
+    "ReferenceAnswer",
+    "ReferenceOut",
+    "ReferenceOverride",
+    "ReferenceOverrideIn",
+    "ReferenceReceipt",
+    "ReferenceSet",
+    "ReferenceSetsOut",
+    "ReferenceSource",
+    "ReferenceTaken",
+    "ReferenceVersion",
+    "RefreshOut",
+    "RefreshReferenceIn",
+    "RefreshReferenceOut",
+    "RefsJSON",
+    "RegisterCounts",
+    "RegisterKeyReq",
+    "RegisterPage",
+    "RegisterReq",
+    "RegisterResult",
+    "Registrant",
+    "Registration",
+    "RegistrationView",
+    "RegistryImage",
+    "RegistryImageList",
+    "RegistryMint",
+    "RegistryPackage",
+    "RegistryPackageList",
+    "RegistryProject",
+    "RegistryProjectList",
+    "RegistryStatus",
+    "RegistryTagList",
+    "RegistryToken",
+    "ReleaseBoard",
+    "ReleaseRow",
+    "Remittance",
+    "RenewReq",
+    "RenewResult",
+    "ReplaceKitIn",
+    "ReplayBody",
+    "RepoList",
+    "RepoTree",
+    "RepoView",
+    "Report",
+    "ReportOut",
+    "ReportReq",
+    "ReportResp",
+    "ReportRunIn",
+    "Request",
+    "ResolveReferenceIn",
+    "ResolveReferenceOut",
+    "ResourceUsage",
+    "Response",
+    "Responsible",
+    "RestartRef",
+    "Restarted",
+    "ReviewQueue",
+    "ReviewRequest",
+    "RevokeResp",
+    "RevokedKey",
+    "RiskAdoptIn",
+    "RiskAggregates",
+    "RiskAppetiteIn",
+    "RiskBand",
+    "RiskCatalog",
+    "RiskCause",
+    "RiskDataset",
+    "RiskDatasetDisposal",
+    "RiskDatasetList",
+    "RiskDatasetRow",
+    "RiskDatasetRows",
+    "RiskDatasetSpec",
+    "RiskDatasetVersions",
+    "RiskDisposeIn",
+    "RiskDisposeOut",
+    "RiskEvent",
+    "RiskHoldIn",
+    "RiskHoldOut",
+    "RiskLabelCoverage",
+    "RiskLabelEvent",
+    "RiskLabelFact",
+    "RiskLabelIn",
+    "RiskLabelOut",
+    "RiskLabelRecord",
+    "RiskLabelResult",
+    "RiskLabelVocabulary",
+    "RiskLabelsOut",
+    "RiskLearnIn",
+    "RiskLearnOut",
+    "RiskLineage",
+    "RiskModelFeature",
+    "RiskModelState",
+    "RiskModelValue",
+    "RiskOrgFeature",
+    "RiskPolicyOut",
+    "RiskPolicyVersion",
+    "RiskPublishOut",
+    "RiskResolveIn",
+    "RiskResolveOut",
+    "RiskResolved",
+    "RiskScoreIn",
+    "RiskScoreOut",
+    "RiskSearchIn",
+    "RiskSearchReport",
+    "RiskSearchRun",
+    "RiskSourceCoverage",
+    "RiskSplitCounts",
+    "RiskSurface",
+    "RiskTopology",
+    "RiskTrial",
+    "RiskValue",
+    "RoleAssignment",
+    "RoleList",
+    "RollbackReq",
+    "Rollup",
+    "RollupAllotment",
+    "RollupBalance",
+    "Root",
+    "RoundInput",
+    "RoundOut",
+    "Route",
+    "RouteCandidate",
+    "RouteCreateIn",
+    "RoutePlan",
+    "RoutedRunOut",
+    "RoutedUsage",
+    "RouterList",
+    "RouterView",
+    "RpcError",
+    "RpcIn",
+    "RpcOut",
+    "Rule",
+    "RuleList",
+    "RuleView",
+    "RulesOut",
+    "Ruleset",
+    "RunIn",
+    "RunList",
+    "RunPage",
+    "RunPoint",
+    "RunRecord",
+    "RunReq",
+    "RunRequest",
+    "RunResp",
+    "RunSummary",
+    "RunView",
+    "RunnerBuildReq",
+    "RunnerBuildResp",
+    "Runs",
+    "S3Health",
+    "SMS",
+    "SafeIn",
+    "SafeOut",
+    "SafeProposal",
+    "SafeTxIn",
+    "SampleAccepted",
+    "SampleIngest",
+    "SampleList",
+    "SampleReq",
+    "SampleView",
+    "Sandbox",
+    "SandboxList",
+    "SbomHealth",
+    "SbomIngest",
+    "SbomIngested",
+    "Scan",
+    "ScanDetail",
+    "ScanDraft",
+    "ScanList",
+    "ScanView",
+    "ScheduleInput",
+    "Scope",
+    "ScoreConfigList",
+    "ScoreConfigReq",
+    "ScoreConfigView",
+    "ScoreList",
+    "ScoreReq",
+    "ScoreView",
+    "ScreenResult",
+    "SearchIn",
+    "SearchOut",
+    "SearchResults",
+    "SecretList",
+    "SecretMeta",
+    "SecretView",
+    "Section",
+    "SectionWrite",
+    "SelfRank",
+    "SeoAuditIn",
+    "SeoAuditOut",
+    "SeoBacklinkIn",
+    "SeoBacklinkOut",
+    "SeoCharge",
+    "SeoCompetitorIn",
+    "SeoCompetitorOut",
+    "SeoDomain",
+    "SeoIdeaIn",
+    "SeoIdeaOut",
+    "SeoKeywordIn",
+    "SeoKeywordOut",
+    "SeoMetric",
+    "SeoRankIn",
+    "SeoRankOut",
+    "SeoRanking",
+    "SeoRateOut",
+    "Sequence",
+    "SequenceList",
+    "SequenceStatus",
+    "SequenceView",
+    "Sequences",
+    "SeriesLine",
+    "SeriesPoint",
+    "SessionDetail",
+    "SessionList",
+    "SessionUser",
+    "SessionView",
+    "SetEnvReq",
+    "SetReferenceIn",
+    "SetReferenceOut",
+    "SettingsReq",
+    "SettingsView",
+    "SharePolicy",
+    "ShareView",
+    "SharesOut",
+    "SignIn",
+    "SignReply",
+    "SignRequest",
+    "Signature",
+    "Signer",
+    "Skill",
+    "SkillDeleted",
+    "SkillIn",
+    "SkillWritten",
+    "SlotView",
+    "SocialAccount",
+    "SocialAccountBody",
+    "SocialAccountWrite",
+    "SocialAccounts",
+    "SocialPost",
+    "SocialPostBody",
+    "SocialPostWrite",
+    "SocialPosts",
+    "SocialProvider",
+    "SocialProviders",
+    "SocialSummary",
+    "Source",
+    "SourceFailure",
+    "SourceState",
+    "SourceToolList",
+    "Sources",
+    "Span",
+    "SpanBody",
+    "Spec",
+    "Spend",
+    "SpendPoint",
+    "StageEvent",
+    "StarterKit",
+    "State",
+    "StateGraph",
+    "StatsOut",
+    "StatsSessions",
+    "StatsUser",
+    "StatusBreakdown",
+    "StatusCounts",
+    "StatusView",
+    "Step",
+    "StepInput",
+    "StepList",
+    "StepSettings",
+    "StepView",
+    "StopIn",
+    "Stopped",
+    "StorefrontResult",
+    "Strategy",
+    "StrategyView",
+    "Stream",
+    "Streams",
+    "StructureIn",
+    "SubdomainSetIn",
+    "Subject",
+    "SubjectList",
+    "SubjectReq",
+    "SubjectSummary",
+    "SubmitReq",
+    "SubprocessorList",
+    "SubscribeReq",
+    "Subscription",
+    "SubscriptionList",
+    "SubscriptionPlan",
+    "SubscriptionRef",
+    "SubscriptionView",
+    "Subscriptions",
+    "SuggestResponse",
+    "Suggestion",
+    "Suite",
+    "Summary",
+    "SummaryResp",
+    "SummaryView",
+    "Suppression",
+    "SuppressionList",
+    "Symbol",
+    "SyncList",
+    "SyncQueued",
+    "SyncReq",
+    "SyncTally",
+    "SyncView",
+    "TLSConfig",
+    "TagConfig",
+    "TargetDeleted",
+    "TargetList",
+    "TargetReq",
+    "TargetView",
+    "Tariff",
+    "TariffIn",
+    "Taxon",
+    "TaxonIn",
+    "Taxonomy",
+    "TemplateCatalog",
+    "TemplateOverride",
+    "TemplateReply",
+    "TemplateView",
+    "TestResult",
+    "TicketGrant",
+    "Tier",
+    "TierBalance",
+    "TierLimits",
+    "Timeseries",
+    "TodoProject",
+    "Tool",
+    "ToolCall",
+    "ToolList",
+    "ToolResult",
+    "Top",
+    "TopModels",
+    "TopProducts",
+    "TotalView",
+    "TraceList",
+    "TraceView",
+    "TrafficCaller",
+    "TrafficView",
+    "TrailPage",
+    "Transaction",
+    "Transactions",
+    "TransactionsOut",
+    "TransferReq",
+    "TransitionIn",
+    "TransitionResult",
+    "TreasuryReport",
+    "TreeEntry",
+    "TreeEntryJSON",
+    "TreeJSON",
+    "TreeNode",
+    "Trial",
+    "TrialBalance",
+    "TrialBalanceRow",
+    "TriggerList",
+    "TriggerView",
+    "TrustAsk",
+    "TrustAskView",
+    "TrustAsked",
+    "TrustCoverage",
+    "TrustDecision",
+    "TrustDesk",
+    "TrustDocuments",
+    "TrustEdit",
+    "TrustGrantView",
+    "TrustGranted",
+    "TrustItem",
+    "TrustItemView",
+    "TrustPage",
+    "TrustPublish",
+    "TrustRefused",
+    "TrustSettings",
+    "TrustTally",
+    "Txn",
+    "UTM",
+    "UnreconciledOut",
+    "Unsubscribed",
+    "UpdateAgentIn",
+    "UpdateCampaignIn",
+    "UpdateEndpointIn",
+    "UpdateList",
+    "Upkeep",
+    "UpkeepIn",
+    "UploadIn",
+    "Upstream",
+    "Usage",
+    "UsageAnalyticsAccess",
+    "UsageAnalyticsGrant",
+    "UsageAnalyticsView",
+    "UsagePoint",
+    "UsageRepo",
+    "UsageScope",
+    "UsageSummary",
+    "UsageView",
+    "UsageWindowView",
+    "UserEnablementItem",
+    "UserOptinReq",
+    "UserOptinView",
+    "ValidatorClaim",
+    "ValidatorList",
+    "Variant",
+    "VendorRow",
+    "VendorsOut",
+    "Verdict",
+    "VerificationDecision",
+    "VerificationReq",
+    "VerificationTally",
+    "VerifyOut",
+    "VerifyRequest",
+    "VersionMessage",
+    "VersionMeta",
+    "VersionPage",
+    "VersionView",
+    "Voucher",
+    "Waiting",
+    "Wallet",
+    "WalletAccount",
+    "WalletList",
+    "WebEngine",
+    "WebOverview",
+    "WebQuestion",
+    "WebResult",
+    "WebSearchQuery",
+    "WebSearchResults",
+    "Window",
+    "Wire",
+    "WireFact",
+    "WireInstructions",
+    "WorkerList",
+    "WorkerScriptPut",
+    "WorldIndex",
+    "WorldWire",
+    "WriteIn",
+    "Written",
+    "Wrote",
+    "ZapProcReq",
+]
+
+# Model classes are imported on first access (PEP 562), so resolving one by
+# name — `getattr(models, "Name")`, as `ApiClient` does for a response type —
+# imports that model's module and nothing else.
+_LAZY_IMPORTS = {
+    "AccList": "hanzoai.cloud.models.acc_list",
+    "AccView": "hanzoai.cloud.models.acc_view",
+    "Account": "hanzoai.cloud.models.account",
+    "AccountList": "hanzoai.cloud.models.account_list",
+    "AccountView": "hanzoai.cloud.models.account_view",
+    "Accounts": "hanzoai.cloud.models.accounts",
+    "AccountsOut": "hanzoai.cloud.models.accounts_out",
+    "AccountsTotal": "hanzoai.cloud.models.accounts_total",
+    "AccountsUsage": "hanzoai.cloud.models.accounts_usage",
+    "AccreditationDecision": "hanzoai.cloud.models.accreditation_decision",
+    "AccreditationReq": "hanzoai.cloud.models.accreditation_req",
+    "ActionRecord": "hanzoai.cloud.models.action_record",
+    "ActionsView": "hanzoai.cloud.models.actions_view",
+    "ActivationReq": "hanzoai.cloud.models.activation_req",
+    "ActivationSet": "hanzoai.cloud.models.activation_set",
+    "ActivityFeed": "hanzoai.cloud.models.activity_feed",
+    "ActivityOut": "hanzoai.cloud.models.activity_out",
+    "ActivityPoint": "hanzoai.cloud.models.activity_point",
+    "ActivityRow": "hanzoai.cloud.models.activity_row",
+    "ActivityTotals": "hanzoai.cloud.models.activity_totals",
+    "ActivityView": "hanzoai.cloud.models.activity_view",
+    "AdCampaign": "hanzoai.cloud.models.ad_campaign",
+    "AdSummary": "hanzoai.cloud.models.ad_summary",
+    "AddDomainReq": "hanzoai.cloud.models.add_domain_req",
+    "Admission": "hanzoai.cloud.models.admission",
+    "AdvanceIn": "hanzoai.cloud.models.advance_in",
+    "AffiliateBoard": "hanzoai.cloud.models.affiliate_board",
+    "AffiliateEarnings": "hanzoai.cloud.models.affiliate_earnings",
+    "AffiliateLinks": "hanzoai.cloud.models.affiliate_links",
+    "AffiliateSelf": "hanzoai.cloud.models.affiliate_self",
+    "AffiliateStanding": "hanzoai.cloud.models.affiliate_standing",
+    "AgentBinding": "hanzoai.cloud.models.agent_binding",
+    "AgentDetail": "hanzoai.cloud.models.agent_detail",
+    "AgentList": "hanzoai.cloud.models.agent_list",
+    "AgentRunView": "hanzoai.cloud.models.agent_run_view",
+    "AgentView": "hanzoai.cloud.models.agent_view",
+    "AiMCPApp": "hanzoai.cloud.models.ai_mcp_app",
+    "AiMCPSurface": "hanzoai.cloud.models.ai_mcp_surface",
+    "Alert": "hanzoai.cloud.models.alert",
+    "AlertPatch": "hanzoai.cloud.models.alert_patch",
+    "AlertSpec": "hanzoai.cloud.models.alert_spec",
+    "Allowance": "hanzoai.cloud.models.allowance",
+    "AllowlistPutIn": "hanzoai.cloud.models.allowlist_put_in",
+    "AllowlistView": "hanzoai.cloud.models.allowlist_view",
+    "Analysis": "hanzoai.cloud.models.analysis",
+    "AnalyticsView": "hanzoai.cloud.models.analytics_view",
+    "AnalyzeQuery": "hanzoai.cloud.models.analyze_query",
+    "Answer": "hanzoai.cloud.models.answer",
+    "ApiKey": "hanzoai.cloud.models.api_key",
+    "ApiKeyList": "hanzoai.cloud.models.api_key_list",
+    "AppView": "hanzoai.cloud.models.app_view",
+    "Appearance": "hanzoai.cloud.models.appearance",
+    "Application": "hanzoai.cloud.models.application",
+    "ApplicationList": "hanzoai.cloud.models.application_list",
+    "ApplyRequest": "hanzoai.cloud.models.apply_request",
+    "ApprovePairingIn": "hanzoai.cloud.models.approve_pairing_in",
+    "ArgoApp": "hanzoai.cloud.models.argo_app",
+    "ArgoAppList": "hanzoai.cloud.models.argo_app_list",
+    "ArgoCluster": "hanzoai.cloud.models.argo_cluster",
+    "ArgoClusterInfo": "hanzoai.cloud.models.argo_cluster_info",
+    "ArgoClusterList": "hanzoai.cloud.models.argo_cluster_list",
+    "ArgoConnectionState": "hanzoai.cloud.models.argo_connection_state",
+    "ArgoDestination": "hanzoai.cloud.models.argo_destination",
+    "ArgoGroupKind": "hanzoai.cloud.models.argo_group_kind",
+    "ArgoHealth": "hanzoai.cloud.models.argo_health",
+    "ArgoInfoItem": "hanzoai.cloud.models.argo_info_item",
+    "ArgoListMeta": "hanzoai.cloud.models.argo_list_meta",
+    "ArgoMeta": "hanzoai.cloud.models.argo_meta",
+    "ArgoNode": "hanzoai.cloud.models.argo_node",
+    "ArgoProject": "hanzoai.cloud.models.argo_project",
+    "ArgoProjectList": "hanzoai.cloud.models.argo_project_list",
+    "ArgoProjectSpec": "hanzoai.cloud.models.argo_project_spec",
+    "ArgoResourceRef": "hanzoai.cloud.models.argo_resource_ref",
+    "ArgoResourceStatus": "hanzoai.cloud.models.argo_resource_status",
+    "ArgoRevisionMetadata": "hanzoai.cloud.models.argo_revision_metadata",
+    "ArgoSource": "hanzoai.cloud.models.argo_source",
+    "ArgoSpec": "hanzoai.cloud.models.argo_spec",
+    "ArgoStatus": "hanzoai.cloud.models.argo_status",
+    "ArgoSummary": "hanzoai.cloud.models.argo_summary",
+    "ArgoSyncStatus": "hanzoai.cloud.models.argo_sync_status",
+    "ArgoSyncWindows": "hanzoai.cloud.models.argo_sync_windows",
+    "ArgoTree": "hanzoai.cloud.models.argo_tree",
+    "Arm": "hanzoai.cloud.models.arm",
+    "AskAnswer": "hanzoai.cloud.models.ask_answer",
+    "AskPostIn": "hanzoai.cloud.models.ask_post_in",
+    "AskRequest": "hanzoai.cloud.models.ask_request",
+    "AskResponse": "hanzoai.cloud.models.ask_response",
+    "Assignment": "hanzoai.cloud.models.assignment",
+    "AttributeRequest": "hanzoai.cloud.models.attribute_request",
+    "Attribution": "hanzoai.cloud.models.attribution",
+    "Audience": "hanzoai.cloud.models.audience",
+    "AudienceList": "hanzoai.cloud.models.audience_list",
+    "AudiencePreview": "hanzoai.cloud.models.audience_preview",
+    "AuditList": "hanzoai.cloud.models.audit_list",
+    "AuthorRepo": "hanzoai.cloud.models.author_repo",
+    "AuthoredPlugin": "hanzoai.cloud.models.authored_plugin",
+    "AuthoredPluginList": "hanzoai.cloud.models.authored_plugin_list",
+    "AuthoredSkillList": "hanzoai.cloud.models.authored_skill_list",
+    "AuthorizeOut": "hanzoai.cloud.models.authorize_out",
+    "Backend": "hanzoai.cloud.models.backend",
+    "BackendStatus": "hanzoai.cloud.models.backend_status",
+    "BalanceLine": "hanzoai.cloud.models.balance_line",
+    "BalanceSheet": "hanzoai.cloud.models.balance_sheet",
+    "Balances": "hanzoai.cloud.models.balances",
+    "BankQuestion": "hanzoai.cloud.models.bank_question",
+    "BankTally": "hanzoai.cloud.models.bank_tally",
+    "BankTxnRow": "hanzoai.cloud.models.bank_txn_row",
+    "BaseHealth": "hanzoai.cloud.models.base_health",
+    "BeginIn": "hanzoai.cloud.models.begin_in",
+    "Benchmark": "hanzoai.cloud.models.benchmark",
+    "BenchmarkCatalog": "hanzoai.cloud.models.benchmark_catalog",
+    "BillingAccount": "hanzoai.cloud.models.billing_account",
+    "BillingInvoice": "hanzoai.cloud.models.billing_invoice",
+    "BinarySpec": "hanzoai.cloud.models.binary_spec",
+    "BindAgentReq": "hanzoai.cloud.models.bind_agent_req",
+    "BindingList": "hanzoai.cloud.models.binding_list",
+    "Blob": "hanzoai.cloud.models.blob",
+    "BlobJSON": "hanzoai.cloud.models.blob_json",
+    "Blog": "hanzoai.cloud.models.blog",
+    "Blueprint": "hanzoai.cloud.models.blueprint",
+    "BlueprintCounts": "hanzoai.cloud.models.blueprint_counts",
+    "BlueprintHealth": "hanzoai.cloud.models.blueprint_health",
+    "BlueprintIndex": "hanzoai.cloud.models.blueprint_index",
+    "BlueprintRow": "hanzoai.cloud.models.blueprint_row",
+    "BlueprintVersionsView": "hanzoai.cloud.models.blueprint_versions_view",
+    "BlueprintView": "hanzoai.cloud.models.blueprint_view",
+    "Board": "hanzoai.cloud.models.board",
+    "BoardItem": "hanzoai.cloud.models.board_item",
+    "BoardPage": "hanzoai.cloud.models.board_page",
+    "BoardPoint": "hanzoai.cloud.models.board_point",
+    "BoardRange": "hanzoai.cloud.models.board_range",
+    "BoardResp": "hanzoai.cloud.models.board_resp",
+    "BoardScope": "hanzoai.cloud.models.board_scope",
+    "BoardTotals": "hanzoai.cloud.models.board_totals",
+    "BookRequest": "hanzoai.cloud.models.book_request",
+    "BookResponse": "hanzoai.cloud.models.book_response",
+    "BotList": "hanzoai.cloud.models.bot_list",
+    "BotMember": "hanzoai.cloud.models.bot_member",
+    "BotRoster": "hanzoai.cloud.models.bot_roster",
+    "BotRun": "hanzoai.cloud.models.bot_run",
+    "BotRuns": "hanzoai.cloud.models.bot_runs",
+    "BotStopped": "hanzoai.cloud.models.bot_stopped",
+    "BotSync": "hanzoai.cloud.models.bot_sync",
+    "BotView": "hanzoai.cloud.models.bot_view",
+    "Breakdown": "hanzoai.cloud.models.breakdown",
+    "BreakdownRow": "hanzoai.cloud.models.breakdown_row",
+    "BrowserTagOut": "hanzoai.cloud.models.browser_tag_out",
+    "BucketCreateIn": "hanzoai.cloud.models.bucket_create_in",
+    "BucketIn": "hanzoai.cloud.models.bucket_in",
+    "BucketItem": "hanzoai.cloud.models.bucket_item",
+    "BucketList": "hanzoai.cloud.models.bucket_list",
+    "BucketRecord": "hanzoai.cloud.models.bucket_record",
+    "BucketWrite": "hanzoai.cloud.models.bucket_write",
+    "BuildBoard": "hanzoai.cloud.models.build_board",
+    "BuildList": "hanzoai.cloud.models.build_list",
+    "BuildOut": "hanzoai.cloud.models.build_out",
+    "BuildRequest": "hanzoai.cloud.models.build_request",
+    "BuildRow": "hanzoai.cloud.models.build_row",
+    "BuildSummary": "hanzoai.cloud.models.build_summary",
+    "BuildTurn": "hanzoai.cloud.models.build_turn",
+    "BuildView": "hanzoai.cloud.models.build_view",
+    "BusAck": "hanzoai.cloud.models.bus_ack",
+    "BusMessage": "hanzoai.cloud.models.bus_message",
+    "BusPublish": "hanzoai.cloud.models.bus_publish",
+    "BusRequest": "hanzoai.cloud.models.bus_request",
+    "BuyInput": "hanzoai.cloud.models.buy_input",
+    "ByoGPU": "hanzoai.cloud.models.byo_gpu",
+    "ByoWorker": "hanzoai.cloud.models.byo_worker",
+    "CalendarPost": "hanzoai.cloud.models.calendar_post",
+    "Call": "hanzoai.cloud.models.call",
+    "CallInput": "hanzoai.cloud.models.call_input",
+    "CallList": "hanzoai.cloud.models.call_list",
+    "Campaign": "hanzoai.cloud.models.campaign",
+    "CampaignInput": "hanzoai.cloud.models.campaign_input",
+    "CampaignList": "hanzoai.cloud.models.campaign_list",
+    "CampaignPage": "hanzoai.cloud.models.campaign_page",
+    "CampaignRecord": "hanzoai.cloud.models.campaign_record",
+    "CampaignResults": "hanzoai.cloud.models.campaign_results",
+    "CampaignSummary": "hanzoai.cloud.models.campaign_summary",
+    "CampaignUpdate": "hanzoai.cloud.models.campaign_update",
+    "CampaignWrite": "hanzoai.cloud.models.campaign_write",
+    "CapVerdict": "hanzoai.cloud.models.cap_verdict",
+    "Capabilities": "hanzoai.cloud.models.capabilities",
+    "Capability": "hanzoai.cloud.models.capability",
+    "CaptableClassHolding": "hanzoai.cloud.models.captable_class_holding",
+    "CaptableCompany": "hanzoai.cloud.models.captable_company",
+    "CaptableCompanyUpdate": "hanzoai.cloud.models.captable_company_update",
+    "CaptableConvertibles": "hanzoai.cloud.models.captable_convertibles",
+    "CaptableDeleted": "hanzoai.cloud.models.captable_deleted",
+    "CaptableEquityPlan": "hanzoai.cloud.models.captable_equity_plan",
+    "CaptableEquityPlans": "hanzoai.cloud.models.captable_equity_plans",
+    "CaptableHolding": "hanzoai.cloud.models.captable_holding",
+    "CaptableInstrumentTotal": "hanzoai.cloud.models.captable_instrument_total",
+    "CaptableInvestment": "hanzoai.cloud.models.captable_investment",
+    "CaptableInvestments": "hanzoai.cloud.models.captable_investments",
+    "CaptableNote": "hanzoai.cloud.models.captable_note",
+    "CaptableNotes": "hanzoai.cloud.models.captable_notes",
+    "CaptableOption": "hanzoai.cloud.models.captable_option",
+    "CaptableOptions": "hanzoai.cloud.models.captable_options",
+    "CaptableRound": "hanzoai.cloud.models.captable_round",
+    "CaptableRoundCloseRequest": "hanzoai.cloud.models.captable_round_close_request",
+    "CaptableRoundDetail": "hanzoai.cloud.models.captable_round_detail",
+    "CaptableRoundInvestment": "hanzoai.cloud.models.captable_round_investment",
+    "CaptableRoundTotals": "hanzoai.cloud.models.captable_round_totals",
+    "CaptableRounds": "hanzoai.cloud.models.captable_rounds",
+    "CaptableSafe": "hanzoai.cloud.models.captable_safe",
+    "CaptableSafes": "hanzoai.cloud.models.captable_safes",
+    "CaptableShare": "hanzoai.cloud.models.captable_share",
+    "CaptableShareClass": "hanzoai.cloud.models.captable_share_class",
+    "CaptableShares": "hanzoai.cloud.models.captable_shares",
+    "CaptableStakeholder": "hanzoai.cloud.models.captable_stakeholder",
+    "CaptableStakeholderPatch": "hanzoai.cloud.models.captable_stakeholder_patch",
+    "CaptableSummary": "hanzoai.cloud.models.captable_summary",
+    "CaptableSummaryCompany": "hanzoai.cloud.models.captable_summary_company",
+    "CaptableTotals": "hanzoai.cloud.models.captable_totals",
+    "CaptableUpdated": "hanzoai.cloud.models.captable_updated",
+    "CaptureBatch": "hanzoai.cloud.models.capture_batch",
+    "CaptureEvent": "hanzoai.cloud.models.capture_event",
+    "CaptureResult": "hanzoai.cloud.models.capture_result",
+    "CapturedError": "hanzoai.cloud.models.captured_error",
+    "Cart": "hanzoai.cloud.models.cart",
+    "CartItem": "hanzoai.cloud.models.cart_item",
+    "CartItemSet": "hanzoai.cloud.models.cart_item_set",
+    "CartOpen": "hanzoai.cloud.models.cart_open",
+    "Catalog": "hanzoai.cloud.models.catalog",
+    "CatalogEntry": "hanzoai.cloud.models.catalog_entry",
+    "CatalogList": "hanzoai.cloud.models.catalog_list",
+    "CatalogOut": "hanzoai.cloud.models.catalog_out",
+    "CatalogPage": "hanzoai.cloud.models.catalog_page",
+    "Category": "hanzoai.cloud.models.category",
+    "CategoryIn": "hanzoai.cloud.models.category_in",
+    "CategorySpend": "hanzoai.cloud.models.category_spend",
+    "Centre": "hanzoai.cloud.models.centre",
+    "Chain": "hanzoai.cloud.models.chain",
+    "ChainList": "hanzoai.cloud.models.chain_list",
+    "ChainStatus": "hanzoai.cloud.models.chain_status",
+    "ChallengeView": "hanzoai.cloud.models.challenge_view",
+    "Channel": "hanzoai.cloud.models.channel",
+    "ChannelAdd": "hanzoai.cloud.models.channel_add",
+    "ChannelList": "hanzoai.cloud.models.channel_list",
+    "ChannelMetric": "hanzoai.cloud.models.channel_metric",
+    "ChannelResult": "hanzoai.cloud.models.channel_result",
+    "ChannelSpec": "hanzoai.cloud.models.channel_spec",
+    "ChannelView": "hanzoai.cloud.models.channel_view",
+    "Charge": "hanzoai.cloud.models.charge",
+    "ChatChannels": "hanzoai.cloud.models.chat_channels",
+    "ChatRequest": "hanzoai.cloud.models.chat_request",
+    "ChatResponse": "hanzoai.cloud.models.chat_response",
+    "CheckList": "hanzoai.cloud.models.check_list",
+    "CheckView": "hanzoai.cloud.models.check_view",
+    "Citation": "hanzoai.cloud.models.citation",
+    "Claim": "hanzoai.cloud.models.claim",
+    "ClaimKeyOut": "hanzoai.cloud.models.claim_key_out",
+    "ClaimRequest": "hanzoai.cloud.models.claim_request",
+    "ClaimRow": "hanzoai.cloud.models.claim_row",
+    "ClaimView": "hanzoai.cloud.models.claim_view",
+    "ClaimsOut": "hanzoai.cloud.models.claims_out",
+    "ClauseCoverage": "hanzoai.cloud.models.clause_coverage",
+    "ClauseRow": "hanzoai.cloud.models.clause_row",
+    "ClearReferenceOut": "hanzoai.cloud.models.clear_reference_out",
+    "ClickCount": "hanzoai.cloud.models.click_count",
+    "ClickRequest": "hanzoai.cloud.models.click_request",
+    "ClipBody": "hanzoai.cloud.models.clip_body",
+    "ClusterAttach": "hanzoai.cloud.models.cluster_attach",
+    "ClusterDetached": "hanzoai.cloud.models.cluster_detached",
+    "ClusterDetailView": "hanzoai.cloud.models.cluster_detail_view",
+    "ClusterList": "hanzoai.cloud.models.cluster_list",
+    "ClusterView": "hanzoai.cloud.models.cluster_view",
+    "CodeFile": "hanzoai.cloud.models.code_file",
+    "CodeResult": "hanzoai.cloud.models.code_result",
+    "CodeRun": "hanzoai.cloud.models.code_run",
+    "CodeView": "hanzoai.cloud.models.code_view",
+    "CodingStartIn": "hanzoai.cloud.models.coding_start_in",
+    "CodingStarted": "hanzoai.cloud.models.coding_started",
+    "CollabPayload": "hanzoai.cloud.models.collab_payload",
+    "CollabRequest": "hanzoai.cloud.models.collab_request",
+    "CollabResult": "hanzoai.cloud.models.collab_result",
+    "Collected": "hanzoai.cloud.models.collected",
+    "CommerceOverview": "hanzoai.cloud.models.commerce_overview",
+    "CommitJSON": "hanzoai.cloud.models.commit_json",
+    "CommitsJSON": "hanzoai.cloud.models.commits_json",
+    "Company": "hanzoai.cloud.models.company",
+    "CompanyList": "hanzoai.cloud.models.company_list",
+    "CompanyReq": "hanzoai.cloud.models.company_req",
+    "Completion": "hanzoai.cloud.models.completion",
+    "Config": "hanzoai.cloud.models.config",
+    "ConnView": "hanzoai.cloud.models.conn_view",
+    "ConnectIn": "hanzoai.cloud.models.connect_in",
+    "ConnectOut": "hanzoai.cloud.models.connect_out",
+    "ConnectRequest": "hanzoai.cloud.models.connect_request",
+    "ConnectionOut": "hanzoai.cloud.models.connection_out",
+    "ConnectionView": "hanzoai.cloud.models.connection_view",
+    "ConnectorAction": "hanzoai.cloud.models.connector_action",
+    "ConnectorAuth": "hanzoai.cloud.models.connector_auth",
+    "ConnectorMetadata": "hanzoai.cloud.models.connector_metadata",
+    "ConnectorProviderView": "hanzoai.cloud.models.connector_provider_view",
+    "ConnectorProvidersOut": "hanzoai.cloud.models.connector_providers_out",
+    "ConnectorTokenOut": "hanzoai.cloud.models.connector_token_out",
+    "ConnectorTrigger": "hanzoai.cloud.models.connector_trigger",
+    "ConnectorView": "hanzoai.cloud.models.connector_view",
+    "ConnectorsOut": "hanzoai.cloud.models.connectors_out",
+    "ConsoleSettings": "hanzoai.cloud.models.console_settings",
+    "ConsoleSettingsDexConfig": "hanzoai.cloud.models.console_settings_dex_config",
+    "ConsoleSettingsGoogleAnalytics": "hanzoai.cloud.models.console_settings_google_analytics",
+    "ConsoleSettingsHelp": "hanzoai.cloud.models.console_settings_help",
+    "Consumer": "hanzoai.cloud.models.consumer",
+    "Contact": "hanzoai.cloud.models.contact",
+    "ContactList": "hanzoai.cloud.models.contact_list",
+    "ContactReq": "hanzoai.cloud.models.contact_req",
+    "Contacts": "hanzoai.cloud.models.contacts",
+    "ContextBundle": "hanzoai.cloud.models.context_bundle",
+    "ContextIn": "hanzoai.cloud.models.context_in",
+    "ControlCommandView": "hanzoai.cloud.models.control_command_view",
+    "ControlDrain": "hanzoai.cloud.models.control_drain",
+    "ControlList": "hanzoai.cloud.models.control_list",
+    "CookieAck": "hanzoai.cloud.models.cookie_ack",
+    "CorpusView": "hanzoai.cloud.models.corpus_view",
+    "CostLine": "hanzoai.cloud.models.cost_line",
+    "CoverRow": "hanzoai.cloud.models.cover_row",
+    "CrawlDocument": "hanzoai.cloud.models.crawl_document",
+    "CrawlRequest": "hanzoai.cloud.models.crawl_request",
+    "CrawlResult": "hanzoai.cloud.models.crawl_result",
+    "CreateAccountIn": "hanzoai.cloud.models.create_account_in",
+    "CreateAgentIn": "hanzoai.cloud.models.create_agent_in",
+    "CreateAppReq": "hanzoai.cloud.models.create_app_req",
+    "CreateBody": "hanzoai.cloud.models.create_body",
+    "CreateClusterReq": "hanzoai.cloud.models.create_cluster_req",
+    "CreateClusterReqNodePool": "hanzoai.cloud.models.create_cluster_req_node_pool",
+    "CreateEndpointIn": "hanzoai.cloud.models.create_endpoint_in",
+    "CreateFlowReq": "hanzoai.cloud.models.create_flow_req",
+    "CreateLinkRequest": "hanzoai.cloud.models.create_link_request",
+    "CreateReq": "hanzoai.cloud.models.create_req",
+    "CreateServerReq": "hanzoai.cloud.models.create_server_req",
+    "CreateVersionIn": "hanzoai.cloud.models.create_version_in",
+    "CreateWalletIn": "hanzoai.cloud.models.create_wallet_in",
+    "CredentialIn": "hanzoai.cloud.models.credential_in",
+    "CredentialOut": "hanzoai.cloud.models.credential_out",
+    "CreditBalance": "hanzoai.cloud.models.credit_balance",
+    "CreditEntry": "hanzoai.cloud.models.credit_entry",
+    "CreditGrant": "hanzoai.cloud.models.credit_grant",
+    "CreditGrants": "hanzoai.cloud.models.credit_grants",
+    "CrmSummary": "hanzoai.cloud.models.crm_summary",
+    "CryptoAsset": "hanzoai.cloud.models.crypto_asset",
+    "CryptoDeposit": "hanzoai.cloud.models.crypto_deposit",
+    "CryptoOptions": "hanzoai.cloud.models.crypto_options",
+    "CsrfResp": "hanzoai.cloud.models.csrf_resp",
+    "CurateReq": "hanzoai.cloud.models.curate_req",
+    "Curriculum": "hanzoai.cloud.models.curriculum",
+    "CurriculumView": "hanzoai.cloud.models.curriculum_view",
+    "D1Query": "hanzoai.cloud.models.d1_query",
+    "DashResp": "hanzoai.cloud.models.dash_resp",
+    "DatabaseCreateIn": "hanzoai.cloud.models.database_create_in",
+    "DataroomAddDocument": "hanzoai.cloud.models.dataroom_add_document",
+    "DataroomCreate": "hanzoai.cloud.models.dataroom_create",
+    "DataroomDocument": "hanzoai.cloud.models.dataroom_document",
+    "DataroomDocumentOne": "hanzoai.cloud.models.dataroom_document_one",
+    "DataroomDocuments": "hanzoai.cloud.models.dataroom_documents",
+    "DataroomLink": "hanzoai.cloud.models.dataroom_link",
+    "DataroomLinkCreate": "hanzoai.cloud.models.dataroom_link_create",
+    "DataroomLinkOne": "hanzoai.cloud.models.dataroom_link_one",
+    "DataroomLinkStats": "hanzoai.cloud.models.dataroom_link_stats",
+    "DataroomLinks": "hanzoai.cloud.models.dataroom_links",
+    "DataroomMember": "hanzoai.cloud.models.dataroom_member",
+    "DataroomMembership": "hanzoai.cloud.models.dataroom_membership",
+    "DataroomPageStat": "hanzoai.cloud.models.dataroom_page_stat",
+    "DataroomRoom": "hanzoai.cloud.models.dataroom_room",
+    "DataroomRoomDetail": "hanzoai.cloud.models.dataroom_room_detail",
+    "DataroomRoomDetailOne": "hanzoai.cloud.models.dataroom_room_detail_one",
+    "DataroomRoomOne": "hanzoai.cloud.models.dataroom_room_one",
+    "DataroomRooms": "hanzoai.cloud.models.dataroom_rooms",
+    "DataroomStats": "hanzoai.cloud.models.dataroom_stats",
+    "DatasetList": "hanzoai.cloud.models.dataset_list",
+    "DatasetReq": "hanzoai.cloud.models.dataset_req",
+    "DatasetView": "hanzoai.cloud.models.dataset_view",
+    "DecideBody": "hanzoai.cloud.models.decide_body",
+    "DecisionIn": "hanzoai.cloud.models.decision_in",
+    "DeckOut": "hanzoai.cloud.models.deck_out",
+    "DefRow": "hanzoai.cloud.models.def_row",
+    "Definition": "hanzoai.cloud.models.definition",
+    "DefsOut": "hanzoai.cloud.models.defs_out",
+    "Deleted": "hanzoai.cloud.models.deleted",
+    "DeletedOut": "hanzoai.cloud.models.deleted_out",
+    "Delivery": "hanzoai.cloud.models.delivery",
+    "DeliveryList": "hanzoai.cloud.models.delivery_list",
+    "DeliveryRow": "hanzoai.cloud.models.delivery_row",
+    "DeployLogs": "hanzoai.cloud.models.deploy_logs",
+    "DeployRecord": "hanzoai.cloud.models.deploy_record",
+    "DeployReq": "hanzoai.cloud.models.deploy_req",
+    "DeployRequest": "hanzoai.cloud.models.deploy_request",
+    "DeploymentView": "hanzoai.cloud.models.deployment_view",
+    "DestinationDisconnected": "hanzoai.cloud.models.destination_disconnected",
+    "DestinationField": "hanzoai.cloud.models.destination_field",
+    "DestinationList": "hanzoai.cloud.models.destination_list",
+    "DestinationStatus": "hanzoai.cloud.models.destination_status",
+    "DestinationTest": "hanzoai.cloud.models.destination_test",
+    "DevicePollOut": "hanzoai.cloud.models.device_poll_out",
+    "DeviceStartIn": "hanzoai.cloud.models.device_start_in",
+    "DeviceStartOut": "hanzoai.cloud.models.device_start_out",
+    "DeviceView": "hanzoai.cloud.models.device_view",
+    "Diagnostic": "hanzoai.cloud.models.diagnostic",
+    "DisconnectOut": "hanzoai.cloud.models.disconnect_out",
+    "DocField": "hanzoai.cloud.models.doc_field",
+    "DocPerm": "hanzoai.cloud.models.doc_perm",
+    "DocRow": "hanzoai.cloud.models.doc_row",
+    "DocType": "hanzoai.cloud.models.doc_type",
+    "DocTypeList": "hanzoai.cloud.models.doc_type_list",
+    "DocumentList": "hanzoai.cloud.models.document_list",
+    "DocumentPage": "hanzoai.cloud.models.document_page",
+    "DocumentReply": "hanzoai.cloud.models.document_reply",
+    "DocumentSummary": "hanzoai.cloud.models.document_summary",
+    "DocumentView": "hanzoai.cloud.models.document_view",
+    "DomainAddIn": "hanzoai.cloud.models.domain_add_in",
+    "DomainView": "hanzoai.cloud.models.domain_view",
+    "DriftBoard": "hanzoai.cloud.models.drift_board",
+    "DriftFlag": "hanzoai.cloud.models.drift_flag",
+    "DriftTally": "hanzoai.cloud.models.drift_tally",
+    "Dropped": "hanzoai.cloud.models.dropped",
+    "Durable": "hanzoai.cloud.models.durable",
+    "EIN": "hanzoai.cloud.models.ein",
+    "EdgeState": "hanzoai.cloud.models.edge_state",
+    "EinIn": "hanzoai.cloud.models.ein_in",
+    "EmbedStatusResp": "hanzoai.cloud.models.embed_status_resp",
+    "EnableResp": "hanzoai.cloud.models.enable_resp",
+    "EnablementBoard": "hanzoai.cloud.models.enablement_board",
+    "EnablementOptRef": "hanzoai.cloud.models.enablement_opt_ref",
+    "EndIn": "hanzoai.cloud.models.end_in",
+    "Endpoint": "hanzoai.cloud.models.endpoint",
+    "EndpointList": "hanzoai.cloud.models.endpoint_list",
+    "EndpointReq": "hanzoai.cloud.models.endpoint_req",
+    "EndpointView": "hanzoai.cloud.models.endpoint_view",
+    "EngineAdvertisement": "hanzoai.cloud.models.engine_advertisement",
+    "EngineStatus": "hanzoai.cloud.models.engine_status",
+    "EnrollInput": "hanzoai.cloud.models.enroll_input",
+    "EnrollReq": "hanzoai.cloud.models.enroll_req",
+    "EnrollResult": "hanzoai.cloud.models.enroll_result",
+    "Enrollment": "hanzoai.cloud.models.enrollment",
+    "EnrollmentList": "hanzoai.cloud.models.enrollment_list",
+    "Enrolment": "hanzoai.cloud.models.enrolment",
+    "EntitlementsView": "hanzoai.cloud.models.entitlements_view",
+    "Entry": "hanzoai.cloud.models.entry",
+    "EnvVarJSON": "hanzoai.cloud.models.env_var_json",
+    "EnvironmentBoard": "hanzoai.cloud.models.environment_board",
+    "EnvironmentRow": "hanzoai.cloud.models.environment_row",
+    "ErrorList": "hanzoai.cloud.models.error_list",
+    "EsignCompleteIn": "hanzoai.cloud.models.esign_complete_in",
+    "EsignCompletion": "hanzoai.cloud.models.esign_completion",
+    "EsignDocument": "hanzoai.cloud.models.esign_document",
+    "EsignDocuments": "hanzoai.cloud.models.esign_documents",
+    "EsignEvent": "hanzoai.cloud.models.esign_event",
+    "EsignField": "hanzoai.cloud.models.esign_field",
+    "EsignFieldIn": "hanzoai.cloud.models.esign_field_in",
+    "EsignHealth": "hanzoai.cloud.models.esign_health",
+    "EsignInsertion": "hanzoai.cloud.models.esign_insertion",
+    "EsignInvite": "hanzoai.cloud.models.esign_invite",
+    "EsignLink": "hanzoai.cloud.models.esign_link",
+    "EsignLinks": "hanzoai.cloud.models.esign_links",
+    "EsignOut": "hanzoai.cloud.models.esign_out",
+    "EsignPDF": "hanzoai.cloud.models.esign_pdf",
+    "EsignPlacement": "hanzoai.cloud.models.esign_placement",
+    "EsignRecipient": "hanzoai.cloud.models.esign_recipient",
+    "EsignRecipientIn": "hanzoai.cloud.models.esign_recipient_in",
+    "EsignRejectIn": "hanzoai.cloud.models.esign_reject_in",
+    "EsignRejection": "hanzoai.cloud.models.esign_rejection",
+    "EsignSession": "hanzoai.cloud.models.esign_session",
+    "EsignSigner": "hanzoai.cloud.models.esign_signer",
+    "EsignState": "hanzoai.cloud.models.esign_state",
+    "EsignTrail": "hanzoai.cloud.models.esign_trail",
+    "EsignUploadIn": "hanzoai.cloud.models.esign_upload_in",
+    "EsignValueIn": "hanzoai.cloud.models.esign_value_in",
+    "EvaluateIn": "hanzoai.cloud.models.evaluate_in",
+    "EvaluatorList": "hanzoai.cloud.models.evaluator_list",
+    "EvaluatorReq": "hanzoai.cloud.models.evaluator_req",
+    "EvaluatorView": "hanzoai.cloud.models.evaluator_view",
+    "Event": "hanzoai.cloud.models.event",
+    "EventList": "hanzoai.cloud.models.event_list",
+    "EventView": "hanzoai.cloud.models.event_view",
+    "Exception": "hanzoai.cloud.models.exception",
+    "ExecRequest": "hanzoai.cloud.models.exec_request",
+    "ExecResult": "hanzoai.cloud.models.exec_result",
+    "ExperimentList": "hanzoai.cloud.models.experiment_list",
+    "Extracted": "hanzoai.cloud.models.extracted",
+    "FaqList": "hanzoai.cloud.models.faq_list",
+    "Figure": "hanzoai.cloud.models.figure",
+    "FileContent": "hanzoai.cloud.models.file_content",
+    "FileInput": "hanzoai.cloud.models.file_input",
+    "FileJSON": "hanzoai.cloud.models.file_json",
+    "FilesJSON": "hanzoai.cloud.models.files_json",
+    "Filing": "hanzoai.cloud.models.filing",
+    "FilingPage": "hanzoai.cloud.models.filing_page",
+    "FilingReply": "hanzoai.cloud.models.filing_reply",
+    "FilingRequest": "hanzoai.cloud.models.filing_request",
+    "Filters": "hanzoai.cloud.models.filters",
+    "FinanceLedgerEntry": "hanzoai.cloud.models.finance_ledger_entry",
+    "FinancialPackage": "hanzoai.cloud.models.financial_package",
+    "FindingList": "hanzoai.cloud.models.finding_list",
+    "FindingView": "hanzoai.cloud.models.finding_view",
+    "FleetBoard": "hanzoai.cloud.models.fleet_board",
+    "FleetMetrics": "hanzoai.cloud.models.fleet_metrics",
+    "FleetSpec": "hanzoai.cloud.models.fleet_spec",
+    "FleetSummary": "hanzoai.cloud.models.fleet_summary",
+    "FleetUnit": "hanzoai.cloud.models.fleet_unit",
+    "Flow": "hanzoai.cloud.models.flow",
+    "FlowAction": "hanzoai.cloud.models.flow_action",
+    "FlowCreate": "hanzoai.cloud.models.flow_create",
+    "FlowPage": "hanzoai.cloud.models.flow_page",
+    "FlowRun": "hanzoai.cloud.models.flow_run",
+    "FlowStatus": "hanzoai.cloud.models.flow_status",
+    "FlowTrigger": "hanzoai.cloud.models.flow_trigger",
+    "FlowUpdate": "hanzoai.cloud.models.flow_update",
+    "FlowVersion": "hanzoai.cloud.models.flow_version",
+    "FnList": "hanzoai.cloud.models.fn_list",
+    "Form": "hanzoai.cloud.models.form",
+    "Formation": "hanzoai.cloud.models.formation",
+    "FormationView": "hanzoai.cloud.models.formation_view",
+    "Founder": "hanzoai.cloud.models.founder",
+    "FoundersIn": "hanzoai.cloud.models.founders_in",
+    "Frame": "hanzoai.cloud.models.frame",
+    "FrameworkList": "hanzoai.cloud.models.framework_list",
+    "FrameworkRow": "hanzoai.cloud.models.framework_row",
+    "FunctionDetail": "hanzoai.cloud.models.function_detail",
+    "FunctionView": "hanzoai.cloud.models.function_view",
+    "Funnel": "hanzoai.cloud.models.funnel",
+    "GLRow": "hanzoai.cloud.models.gl_row",
+    "GPU": "hanzoai.cloud.models.gpu",
+    "GcOut": "hanzoai.cloud.models.gc_out",
+    "GenerateInput": "hanzoai.cloud.models.generate_input",
+    "GenerateRequest": "hanzoai.cloud.models.generate_request",
+    "GenerateResult": "hanzoai.cloud.models.generate_result",
+    "Genesis": "hanzoai.cloud.models.genesis",
+    "GitOpsApp": "hanzoai.cloud.models.git_ops_app",
+    "GitOpsDeploy": "hanzoai.cloud.models.git_ops_deploy",
+    "GitOpsOperation": "hanzoai.cloud.models.git_ops_operation",
+    "GitOpsPlane": "hanzoai.cloud.models.git_ops_plane",
+    "GitOrigin": "hanzoai.cloud.models.git_origin",
+    "GitSource": "hanzoai.cloud.models.git_source",
+    "GithubBackfillIn": "hanzoai.cloud.models.github_backfill_in",
+    "GithubBackfillResult": "hanzoai.cloud.models.github_backfill_result",
+    "GithubClaimIn": "hanzoai.cloud.models.github_claim_in",
+    "GithubClaimOut": "hanzoai.cloud.models.github_claim_out",
+    "GithubForkOut": "hanzoai.cloud.models.github_fork_out",
+    "GithubForkReq": "hanzoai.cloud.models.github_fork_req",
+    "GithubImportIn": "hanzoai.cloud.models.github_import_in",
+    "GithubImportOut": "hanzoai.cloud.models.github_import_out",
+    "GithubInstallationView": "hanzoai.cloud.models.github_installation_view",
+    "GithubInstallationsOut": "hanzoai.cloud.models.github_installations_out",
+    "GithubPagesBuildOut": "hanzoai.cloud.models.github_pages_build_out",
+    "GithubPagesDisabledOut": "hanzoai.cloud.models.github_pages_disabled_out",
+    "GithubPagesEnableReq": "hanzoai.cloud.models.github_pages_enable_req",
+    "GithubPagesSource": "hanzoai.cloud.models.github_pages_source",
+    "GithubPagesUpdateReq": "hanzoai.cloud.models.github_pages_update_req",
+    "GithubPagesUpdatedOut": "hanzoai.cloud.models.github_pages_updated_out",
+    "GithubPagesView": "hanzoai.cloud.models.github_pages_view",
+    "GithubRepoView": "hanzoai.cloud.models.github_repo_view",
+    "GithubReposOut": "hanzoai.cloud.models.github_repos_out",
+    "GithubSearchHit": "hanzoai.cloud.models.github_search_hit",
+    "GithubSearchOut": "hanzoai.cloud.models.github_search_out",
+    "GithubSearchReq": "hanzoai.cloud.models.github_search_req",
+    "GitlabProjectView": "hanzoai.cloud.models.gitlab_project_view",
+    "GitlabProjectsOut": "hanzoai.cloud.models.gitlab_projects_out",
+    "GpuAlertList": "hanzoai.cloud.models.gpu_alert_list",
+    "GpuJob": "hanzoai.cloud.models.gpu_job",
+    "GpuList": "hanzoai.cloud.models.gpu_list",
+    "GpuView": "hanzoai.cloud.models.gpu_view",
+    "GraphAssertIn": "hanzoai.cloud.models.graph_assert_in",
+    "GraphAssertOut": "hanzoai.cloud.models.graph_assert_out",
+    "GraphEdge": "hanzoai.cloud.models.graph_edge",
+    "GraphFact": "hanzoai.cloud.models.graph_fact",
+    "GraphNeighborsIn": "hanzoai.cloud.models.graph_neighbors_in",
+    "GraphNeighborsOut": "hanzoai.cloud.models.graph_neighbors_out",
+    "GraphNode": "hanzoai.cloud.models.graph_node",
+    "GraphOut": "hanzoai.cloud.models.graph_out",
+    "GraphQLError": "hanzoai.cloud.models.graph_ql_error",
+    "GraphQLIn": "hanzoai.cloud.models.graph_qlin",
+    "GraphQLOut": "hanzoai.cloud.models.graph_ql_out",
+    "GraphReadOut": "hanzoai.cloud.models.graph_read_out",
+    "GraphResolveIn": "hanzoai.cloud.models.graph_resolve_in",
+    "GraphResolveOut": "hanzoai.cloud.models.graph_resolve_out",
+    "GraphVocabularyOut": "hanzoai.cloud.models.graph_vocabulary_out",
+    "HandleRequest": "hanzoai.cloud.models.handle_request",
+    "HandleSet": "hanzoai.cloud.models.handle_set",
+    "Health": "hanzoai.cloud.models.health",
+    "HealthLens": "hanzoai.cloud.models.health_lens",
+    "HealthLenses": "hanzoai.cloud.models.health_lenses",
+    "HealthOut": "hanzoai.cloud.models.health_out",
+    "HealthPlane": "hanzoai.cloud.models.health_plane",
+    "HealthReport": "hanzoai.cloud.models.health_report",
+    "HealthView": "hanzoai.cloud.models.health_view",
+    "HelpArticle": "hanzoai.cloud.models.help_article",
+    "HelpArticleCard": "hanzoai.cloud.models.help_article_card",
+    "HelpArticleList": "hanzoai.cloud.models.help_article_list",
+    "HelpCategory": "hanzoai.cloud.models.help_category",
+    "HelpCategoryList": "hanzoai.cloud.models.help_category_list",
+    "HelpTicketFiled": "hanzoai.cloud.models.help_ticket_filed",
+    "HelpTicketIntake": "hanzoai.cloud.models.help_ticket_intake",
+    "HistoryOut": "hanzoai.cloud.models.history_out",
+    "Hit": "hanzoai.cloud.models.hit",
+    "Holder": "hanzoai.cloud.models.holder",
+    "Holding": "hanzoai.cloud.models.holding",
+    "Holdings": "hanzoai.cloud.models.holdings",
+    "IamAccountBody": "hanzoai.cloud.models.iam_account_body",
+    "IamAccountItem": "hanzoai.cloud.models.iam_account_item",
+    "IamAddress": "hanzoai.cloud.models.iam_address",
+    "IamAnswer": "hanzoai.cloud.models.iam_answer",
+    "IamApplication": "hanzoai.cloud.models.iam_application",
+    "IamApplicationListResult": "hanzoai.cloud.models.iam_application_list_result",
+    "IamAssumeBody": "hanzoai.cloud.models.iam_assume_body",
+    "IamAuditLog": "hanzoai.cloud.models.iam_audit_log",
+    "IamBulk": "hanzoai.cloud.models.iam_bulk",
+    "IamCartItem": "hanzoai.cloud.models.iam_cart_item",
+    "IamCert": "hanzoai.cloud.models.iam_cert",
+    "IamCertsDeleteOutput": "hanzoai.cloud.models.iam_certs_delete_output",
+    "IamCertsListOutput": "hanzoai.cloud.models.iam_certs_list_output",
+    "IamConfig": "hanzoai.cloud.models.iam_config",
+    "IamConsentRecord": "hanzoai.cloud.models.iam_consent_record",
+    "IamCreateInput": "hanzoai.cloud.models.iam_create_input",
+    "IamCreateOrganizationInput": "hanzoai.cloud.models.iam_create_organization_input",
+    "IamCreateSessionIn": "hanzoai.cloud.models.iam_create_session_in",
+    "IamDeleteOrganizationOutput": "hanzoai.cloud.models.iam_delete_organization_output",
+    "IamDeleteOutput": "hanzoai.cloud.models.iam_delete_output",
+    "IamDeleteResponse": "hanzoai.cloud.models.iam_delete_response",
+    "IamDeleteResult": "hanzoai.cloud.models.iam_delete_result",
+    "IamDeleteSessionOut": "hanzoai.cloud.models.iam_delete_session_out",
+    "IamFaceId": "hanzoai.cloud.models.iam_face_id",
+    "IamFilter": "hanzoai.cloud.models.iam_filter",
+    "IamInput": "hanzoai.cloud.models.iam_input",
+    "IamInvitation": "hanzoai.cloud.models.iam_invitation",
+    "IamInvitationsDeleteOutput": "hanzoai.cloud.models.iam_invitations_delete_output",
+    "IamInvitationsInput": "hanzoai.cloud.models.iam_invitations_input",
+    "IamInvitationsListOutput": "hanzoai.cloud.models.iam_invitations_list_output",
+    "IamJwtItem": "hanzoai.cloud.models.iam_jwt_item",
+    "IamKey": "hanzoai.cloud.models.iam_key",
+    "IamListOrganizationsOutput": "hanzoai.cloud.models.iam_list_organizations_output",
+    "IamListOutput": "hanzoai.cloud.models.iam_list_output",
+    "IamListProvidersOut": "hanzoai.cloud.models.iam_list_providers_out",
+    "IamListResponse": "hanzoai.cloud.models.iam_list_response",
+    "IamListSessionsOut": "hanzoai.cloud.models.iam_list_sessions_out",
+    "IamListTokensOut": "hanzoai.cloud.models.iam_list_tokens_out",
+    "IamListWebauthnCredentialsOut": "hanzoai.cloud.models.iam_list_webauthn_credentials_out",
+    "IamManagedAccount": "hanzoai.cloud.models.iam_managed_account",
+    "IamMfaAccount": "hanzoai.cloud.models.iam_mfa_account",
+    "IamMfaItem": "hanzoai.cloud.models.iam_mfa_item",
+    "IamMfaProps": "hanzoai.cloud.models.iam_mfa_props",
+    "IamMutationResult": "hanzoai.cloud.models.iam_mutation_result",
+    "IamOrganization": "hanzoai.cloud.models.iam_organization",
+    "IamPasswordBody": "hanzoai.cloud.models.iam_password_body",
+    "IamPermission": "hanzoai.cloud.models.iam_permission",
+    "IamPermissionDeleteResponse": "hanzoai.cloud.models.iam_permission_delete_response",
+    "IamPermissionListResponse": "hanzoai.cloud.models.iam_permission_list_response",
+    "IamPerson": "hanzoai.cloud.models.iam_person",
+    "IamProject": "hanzoai.cloud.models.iam_project",
+    "IamProjectsDeleteOutput": "hanzoai.cloud.models.iam_projects_delete_output",
+    "IamProjectsInput": "hanzoai.cloud.models.iam_projects_input",
+    "IamProjectsListOutput": "hanzoai.cloud.models.iam_projects_list_output",
+    "IamProvider": "hanzoai.cloud.models.iam_provider",
+    "IamProviderItem": "hanzoai.cloud.models.iam_provider_item",
+    "IamProviderResult": "hanzoai.cloud.models.iam_provider_result",
+    "IamRegistration": "hanzoai.cloud.models.iam_registration",
+    "IamReply": "hanzoai.cloud.models.iam_reply",
+    "IamRole": "hanzoai.cloud.models.iam_role",
+    "IamRolesDeleteOutput": "hanzoai.cloud.models.iam_roles_delete_output",
+    "IamRolesInput": "hanzoai.cloud.models.iam_roles_input",
+    "IamRolesListOutput": "hanzoai.cloud.models.iam_roles_list_output",
+    "IamSamlItem": "hanzoai.cloud.models.iam_saml_item",
+    "IamScheme": "hanzoai.cloud.models.iam_scheme",
+    "IamScopeDescription": "hanzoai.cloud.models.iam_scope_description",
+    "IamScopeItem": "hanzoai.cloud.models.iam_scope_item",
+    "IamSession": "hanzoai.cloud.models.iam_session",
+    "IamSetAvatarInput": "hanzoai.cloud.models.iam_set_avatar_input",
+    "IamSigninItem": "hanzoai.cloud.models.iam_signin_item",
+    "IamSigninMethod": "hanzoai.cloud.models.iam_signin_method",
+    "IamSignupItem": "hanzoai.cloud.models.iam_signup_item",
+    "IamThemeData": "hanzoai.cloud.models.iam_theme_data",
+    "IamToggle": "hanzoai.cloud.models.iam_toggle",
+    "IamToken": "hanzoai.cloud.models.iam_token",
+    "IamTokenMutation": "hanzoai.cloud.models.iam_token_mutation",
+    "IamTokenResult": "hanzoai.cloud.models.iam_token_result",
+    "IamUpdateInput": "hanzoai.cloud.models.iam_update_input",
+    "IamUpdateOrganizationInput": "hanzoai.cloud.models.iam_update_organization_input",
+    "IamUpdateSessionIn": "hanzoai.cloud.models.iam_update_session_in",
+    "IamUser": "hanzoai.cloud.models.iam_user",
+    "IamUsersDeleteOutput": "hanzoai.cloud.models.iam_users_delete_output",
+    "IamUsersListOutput": "hanzoai.cloud.models.iam_users_list_output",
+    "IamWebauthnCredential": "hanzoai.cloud.models.iam_webauthn_credential",
+    "IamWebauthnCredentialMutationResult": "hanzoai.cloud.models.iam_webauthn_credential_mutation_result",
+    "IamWebauthnCredentialResult": "hanzoai.cloud.models.iam_webauthn_credential_result",
+    "IamWorkspace": "hanzoai.cloud.models.iam_workspace",
+    "IamWorkspacesDeleteOutput": "hanzoai.cloud.models.iam_workspaces_delete_output",
+    "IamWorkspacesInput": "hanzoai.cloud.models.iam_workspaces_input",
+    "IamWorkspacesListOutput": "hanzoai.cloud.models.iam_workspaces_list_output",
+    "ImageOrigin": "hanzoai.cloud.models.image_origin",
+    "ImageView": "hanzoai.cloud.models.image_view",
+    "ImportCapTableIn": "hanzoai.cloud.models.import_cap_table_in",
+    "ImportCapTableOut": "hanzoai.cloud.models.import_cap_table_out",
+    "ImportDocumentsIn": "hanzoai.cloud.models.import_documents_in",
+    "ImportDocumentsOut": "hanzoai.cloud.models.import_documents_out",
+    "InboxItem": "hanzoai.cloud.models.inbox_item",
+    "InboxOut": "hanzoai.cloud.models.inbox_out",
+    "InboxPage": "hanzoai.cloud.models.inbox_page",
+    "InboxView": "hanzoai.cloud.models.inbox_view",
+    "Index": "hanzoai.cloud.models.index",
+    "IndexCount": "hanzoai.cloud.models.index_count",
+    "IndexDocuments": "hanzoai.cloud.models.index_documents",
+    "IndexEnqueued": "hanzoai.cloud.models.index_enqueued",
+    "IndexFilter": "hanzoai.cloud.models.index_filter",
+    "IndexHealth": "hanzoai.cloud.models.index_health",
+    "IndexHits": "hanzoai.cloud.models.index_hits",
+    "IndexIn": "hanzoai.cloud.models.index_in",
+    "IndexList": "hanzoai.cloud.models.index_list",
+    "IndexNew": "hanzoai.cloud.models.index_new",
+    "IndexQuery": "hanzoai.cloud.models.index_query",
+    "IndexResult": "hanzoai.cloud.models.index_result",
+    "IndexSettings": "hanzoai.cloud.models.index_settings",
+    "IndexStats": "hanzoai.cloud.models.index_stats",
+    "IndexTask": "hanzoai.cloud.models.index_task",
+    "IndexVersion": "hanzoai.cloud.models.index_version",
+    "IndexView": "hanzoai.cloud.models.index_view",
+    "IndexerView": "hanzoai.cloud.models.indexer_view",
+    "IndexersOut": "hanzoai.cloud.models.indexers_out",
+    "InfoOut": "hanzoai.cloud.models.info_out",
+    "IngestReq": "hanzoai.cloud.models.ingest_req",
+    "IngestResp": "hanzoai.cloud.models.ingest_resp",
+    "IngressMiddlewares": "hanzoai.cloud.models.ingress_middlewares",
+    "IngressRoutes": "hanzoai.cloud.models.ingress_routes",
+    "IngressServices": "hanzoai.cloud.models.ingress_services",
+    "IngressStatus": "hanzoai.cloud.models.ingress_status",
+    "IngressTLS": "hanzoai.cloud.models.ingress_tls",
+    "InsightsBody": "hanzoai.cloud.models.insights_body",
+    "InsightsEvent": "hanzoai.cloud.models.insights_event",
+    "InsightsStatus": "hanzoai.cloud.models.insights_status",
+    "Install": "hanzoai.cloud.models.install",
+    "InstallReq": "hanzoai.cloud.models.install_req",
+    "InstallState": "hanzoai.cloud.models.install_state",
+    "InvocationList": "hanzoai.cloud.models.invocation_list",
+    "InvocationView": "hanzoai.cloud.models.invocation_view",
+    "Invoice": "hanzoai.cloud.models.invoice",
+    "InvoiceLine": "hanzoai.cloud.models.invoice_line",
+    "InvoiceLineItem": "hanzoai.cloud.models.invoice_line_item",
+    "Invoices": "hanzoai.cloud.models.invoices",
+    "InvokeReq": "hanzoai.cloud.models.invoke_req",
+    "IssueEdit": "hanzoai.cloud.models.issue_edit",
+    "IssueHit": "hanzoai.cloud.models.issue_hit",
+    "IssueHits": "hanzoai.cloud.models.issue_hits",
+    "IssueView": "hanzoai.cloud.models.issue_view",
+    "ItemList": "hanzoai.cloud.models.item_list",
+    "ItemReq": "hanzoai.cloud.models.item_req",
+    "ItemResult": "hanzoai.cloud.models.item_result",
+    "ItemView": "hanzoai.cloud.models.item_view",
+    "JobCancel": "hanzoai.cloud.models.job_cancel",
+    "JobCanceled": "hanzoai.cloud.models.job_canceled",
+    "JobList": "hanzoai.cloud.models.job_list",
+    "JourneyStep": "hanzoai.cloud.models.journey_step",
+    "JudgeSpec": "hanzoai.cloud.models.judge_spec",
+    "KbAuthorizeOut": "hanzoai.cloud.models.kb_authorize_out",
+    "KbConnectorsOut": "hanzoai.cloud.models.kb_connectors_out",
+    "KbSyncOut": "hanzoai.cloud.models.kb_sync_out",
+    "KeyList": "hanzoai.cloud.models.key_list",
+    "KeyTypeIn": "hanzoai.cloud.models.key_type_in",
+    "KeyView": "hanzoai.cloud.models.key_view",
+    "KitList": "hanzoai.cloud.models.kit_list",
+    "KmsConfig": "hanzoai.cloud.models.kms_config",
+    "KmsHealth": "hanzoai.cloud.models.kms_health",
+    "KmsLogin": "hanzoai.cloud.models.kms_login",
+    "KmsPut": "hanzoai.cloud.models.kms_put",
+    "KmsSecrets": "hanzoai.cloud.models.kms_secrets",
+    "KmsStored": "hanzoai.cloud.models.kms_stored",
+    "KmsToken": "hanzoai.cloud.models.kms_token",
+    "KvAck": "hanzoai.cloud.models.kv_ack",
+    "KvEntry": "hanzoai.cloud.models.kv_entry",
+    "KvPage": "hanzoai.cloud.models.kv_page",
+    "KvWrite": "hanzoai.cloud.models.kv_write",
+    "KycRefreshOut": "hanzoai.cloud.models.kyc_refresh_out",
+    "KycSession": "hanzoai.cloud.models.kyc_session",
+    "KycStartOut": "hanzoai.cloud.models.kyc_start_out",
+    "LLM": "hanzoai.cloud.models.llm",
+    "LLMOverview": "hanzoai.cloud.models.llm_overview",
+    "LastEventView": "hanzoai.cloud.models.last_event_view",
+    "LatencyStat": "hanzoai.cloud.models.latency_stat",
+    "LeaderRow": "hanzoai.cloud.models.leader_row",
+    "Leaderboard": "hanzoai.cloud.models.leaderboard",
+    "LeaderboardRow": "hanzoai.cloud.models.leaderboard_row",
+    "LeaderboardView": "hanzoai.cloud.models.leaderboard_view",
+    "LeaseIn": "hanzoai.cloud.models.lease_in",
+    "Leased": "hanzoai.cloud.models.leased",
+    "Leg": "hanzoai.cloud.models.leg",
+    "LegalFiling": "hanzoai.cloud.models.legal_filing",
+    "LegalHealth": "hanzoai.cloud.models.legal_health",
+    "LegalSigner": "hanzoai.cloud.models.legal_signer",
+    "LegalTemplate": "hanzoai.cloud.models.legal_template",
+    "LevelView": "hanzoai.cloud.models.level_view",
+    "LicensingDeviceSignals": "hanzoai.cloud.models.licensing_device_signals",
+    "LicensingFingerprintRequest": "hanzoai.cloud.models.licensing_fingerprint_request",
+    "LicensingFingerprintResponse": "hanzoai.cloud.models.licensing_fingerprint_response",
+    "LicensingHealthView": "hanzoai.cloud.models.licensing_health_view",
+    "LicensingIssueRequest": "hanzoai.cloud.models.licensing_issue_request",
+    "LicensingIssueResponse": "hanzoai.cloud.models.licensing_issue_response",
+    "LicensingJWK": "hanzoai.cloud.models.licensing_jwk",
+    "LicensingPubkeyView": "hanzoai.cloud.models.licensing_pubkey_view",
+    "LicensingRelease": "hanzoai.cloud.models.licensing_release",
+    "LicensingReleaseAsset": "hanzoai.cloud.models.licensing_release_asset",
+    "LicensingReleaseList": "hanzoai.cloud.models.licensing_release_list",
+    "LicensingRevocationEntry": "hanzoai.cloud.models.licensing_revocation_entry",
+    "LicensingRevokeRequest": "hanzoai.cloud.models.licensing_revoke_request",
+    "LicensingRevokeResponse": "hanzoai.cloud.models.licensing_revoke_response",
+    "LicensingVerifyRequest": "hanzoai.cloud.models.licensing_verify_request",
+    "LicensingVerifyResponse": "hanzoai.cloud.models.licensing_verify_response",
+    "LimitsBlock": "hanzoai.cloud.models.limits_block",
+    "LimitsView": "hanzoai.cloud.models.limits_view",
+    "LineItem": "hanzoai.cloud.models.line_item",
+    "Link": "hanzoai.cloud.models.link",
+    "LinkList": "hanzoai.cloud.models.link_list",
+    "LinkMint": "hanzoai.cloud.models.link_mint",
+    "LinkView": "hanzoai.cloud.models.link_view",
+    "ListOut": "hanzoai.cloud.models.list_out",
+    "Listing": "hanzoai.cloud.models.listing",
+    "ListingPage": "hanzoai.cloud.models.listing_page",
+    "Liveness": "hanzoai.cloud.models.liveness",
+    "Location": "hanzoai.cloud.models.location",
+    "LogBody": "hanzoai.cloud.models.log_body",
+    "LogLines": "hanzoai.cloud.models.log_lines",
+    "Loss": "hanzoai.cloud.models.loss",
+    "MCPError": "hanzoai.cloud.models.mcp_error",
+    "MCPListing": "hanzoai.cloud.models.mcp_listing",
+    "MCPPackage": "hanzoai.cloud.models.mcp_package",
+    "MCPRemote": "hanzoai.cloud.models.mcp_remote",
+    "MCPRequest": "hanzoai.cloud.models.mcp_request",
+    "MCPResponse": "hanzoai.cloud.models.mcp_response",
+    "MCPServer": "hanzoai.cloud.models.mcp_server",
+    "MachineList": "hanzoai.cloud.models.machine_list",
+    "MachineView": "hanzoai.cloud.models.machine_view",
+    "MakeIn": "hanzoai.cloud.models.make_in",
+    "MarketCatalog": "hanzoai.cloud.models.market_catalog",
+    "MarketItem": "hanzoai.cloud.models.market_item",
+    "Match": "hanzoai.cloud.models.match",
+    "McpCatalog": "hanzoai.cloud.models.mcp_catalog",
+    "McpCatalogSync": "hanzoai.cloud.models.mcp_catalog_sync",
+    "McpServerList": "hanzoai.cloud.models.mcp_server_list",
+    "MeetHealth": "hanzoai.cloud.models.meet_health",
+    "MemoryEntry": "hanzoai.cloud.models.memory_entry",
+    "MemoryPage": "hanzoai.cloud.models.memory_page",
+    "MeshServiceList": "hanzoai.cloud.models.mesh_service_list",
+    "MeshView": "hanzoai.cloud.models.mesh_view",
+    "MessageInput": "hanzoai.cloud.models.message_input",
+    "MessageList": "hanzoai.cloud.models.message_list",
+    "MetricBody": "hanzoai.cloud.models.metric_body",
+    "MetricList": "hanzoai.cloud.models.metric_list",
+    "MetricRow": "hanzoai.cloud.models.metric_row",
+    "Metrics": "hanzoai.cloud.models.metrics",
+    "MetricsResponse": "hanzoai.cloud.models.metrics_response",
+    "MetricsView": "hanzoai.cloud.models.metrics_view",
+    "Middleware": "hanzoai.cloud.models.middleware",
+    "MintedKey": "hanzoai.cloud.models.minted_key",
+    "MirrorList": "hanzoai.cloud.models.mirror_list",
+    "MirrorReq": "hanzoai.cloud.models.mirror_req",
+    "MirrorTargetReq": "hanzoai.cloud.models.mirror_target_req",
+    "MirrorTargetView": "hanzoai.cloud.models.mirror_target_view",
+    "MlCreate": "hanzoai.cloud.models.ml_create",
+    "MlResource": "hanzoai.cloud.models.ml_resource",
+    "MlResourceList": "hanzoai.cloud.models.ml_resource_list",
+    "Mode": "hanzoai.cloud.models.mode",
+    "ModeIn": "hanzoai.cloud.models.mode_in",
+    "ModelField": "hanzoai.cloud.models.model_field",
+    "ModelHistory": "hanzoai.cloud.models.model_history",
+    "ModelRow": "hanzoai.cloud.models.model_row",
+    "ModelStat": "hanzoai.cloud.models.model_stat",
+    "ModuleInfo": "hanzoai.cloud.models.module_info",
+    "ModuleList": "hanzoai.cloud.models.module_list",
+    "ModuleState": "hanzoai.cloud.models.module_state",
+    "MutateReq": "hanzoai.cloud.models.mutate_req",
+    "MyReferralView": "hanzoai.cloud.models.my_referral_view",
+    "MyReferrals": "hanzoai.cloud.models.my_referrals",
+    "NamespaceCreateIn": "hanzoai.cloud.models.namespace_create_in",
+    "NetworkList": "hanzoai.cloud.models.network_list",
+    "NetworkView": "hanzoai.cloud.models.network_view",
+    "NewIssue": "hanzoai.cloud.models.new_issue",
+    "NewsItem": "hanzoai.cloud.models.news_item",
+    "NewsResponse": "hanzoai.cloud.models.news_response",
+    "NextIn": "hanzoai.cloud.models.next_in",
+    "NodeList": "hanzoai.cloud.models.node_list",
+    "NodePoolView": "hanzoai.cloud.models.node_pool_view",
+    "NodeView": "hanzoai.cloud.models.node_view",
+    "NodesView": "hanzoai.cloud.models.nodes_view",
+    "NotifyHealth": "hanzoai.cloud.models.notify_health",
+    "NotifySend": "hanzoai.cloud.models.notify_send",
+    "Number": "hanzoai.cloud.models.number",
+    "NumberList": "hanzoai.cloud.models.number_list",
+    "O11yAWSAccountConfig": "hanzoai.cloud.models.o11y_aws_account_config",
+    "O11yAWSCloudWatchLogsSubscription": "hanzoai.cloud.models.o11y_aws_cloud_watch_logs_subscription",
+    "O11yAWSCloudWatchMetricStreamFilter": "hanzoai.cloud.models.o11y_aws_cloud_watch_metric_stream_filter",
+    "O11yAWSConnectionArtifact": "hanzoai.cloud.models.o11y_aws_connection_artifact",
+    "O11yAWSIntegrationConfig": "hanzoai.cloud.models.o11y_aws_integration_config",
+    "O11yAWSLogsCollectionStrategy": "hanzoai.cloud.models.o11y_aws_logs_collection_strategy",
+    "O11yAWSMetricsCollectionStrategy": "hanzoai.cloud.models.o11y_aws_metrics_collection_strategy",
+    "O11yAWSPostableAccountConfig": "hanzoai.cloud.models.o11y_aws_postable_account_config",
+    "O11yAWSServiceConfig": "hanzoai.cloud.models.o11y_aws_service_config",
+    "O11yAWSServiceLogsConfig": "hanzoai.cloud.models.o11y_aws_service_logs_config",
+    "O11yAWSServiceMetricsConfig": "hanzoai.cloud.models.o11y_aws_service_metrics_config",
+    "O11yAWSTelemetryCollectionStrategy": "hanzoai.cloud.models.o11y_aws_telemetry_collection_strategy",
+    "O11yAccount": "hanzoai.cloud.models.o11y_account",
+    "O11yAccountConfig": "hanzoai.cloud.models.o11y_account_config",
+    "O11yAddItemsIn": "hanzoai.cloud.models.o11y_add_items_in",
+    "O11yAgentReport": "hanzoai.cloud.models.o11y_agent_report",
+    "O11yAggregateAttributeResponse": "hanzoai.cloud.models.o11y_aggregate_attribute_response",
+    "O11yAlert": "hanzoai.cloud.models.o11y_alert",
+    "O11yAlertStatus": "hanzoai.cloud.models.o11y_alert_status",
+    "O11yAlertmanagertypesReceiver": "hanzoai.cloud.models.o11y_alertmanagertypes_receiver",
+    "O11yAnnItemList": "hanzoai.cloud.models.o11y_ann_item_list",
+    "O11yAnnItemView": "hanzoai.cloud.models.o11y_ann_item_view",
+    "O11yAnnItemsCreated": "hanzoai.cloud.models.o11y_ann_items_created",
+    "O11yAnnQueueDeleted": "hanzoai.cloud.models.o11y_ann_queue_deleted",
+    "O11yAnnQueueDetailView": "hanzoai.cloud.models.o11y_ann_queue_detail_view",
+    "O11yAnnQueueList": "hanzoai.cloud.models.o11y_ann_queue_list",
+    "O11yAnnQueueView": "hanzoai.cloud.models.o11y_ann_queue_view",
+    "O11yAssociatedComponent": "hanzoai.cloud.models.o11y_associated_component",
+    "O11yAttributeKey": "hanzoai.cloud.models.o11y_attribute_key",
+    "O11yAttributesComponentEntry": "hanzoai.cloud.models.o11y_attributes_component_entry",
+    "O11yAuthorization": "hanzoai.cloud.models.o11y_authorization",
+    "O11yAvailabilityPoint": "hanzoai.cloud.models.o11y_availability_point",
+    "O11yAvailabilityResponse": "hanzoai.cloud.models.o11y_availability_response",
+    "O11yAvailabilityResponseRange": "hanzoai.cloud.models.o11y_availability_response_range",
+    "O11yAzureAccountConfig": "hanzoai.cloud.models.o11y_azure_account_config",
+    "O11yAzureConnectionArtifact": "hanzoai.cloud.models.o11y_azure_connection_artifact",
+    "O11yAzureIntegrationConfig": "hanzoai.cloud.models.o11y_azure_integration_config",
+    "O11yAzureLogsCollectionStrategy": "hanzoai.cloud.models.o11y_azure_logs_collection_strategy",
+    "O11yAzureServiceConfig": "hanzoai.cloud.models.o11y_azure_service_config",
+    "O11yAzureServiceLogsConfig": "hanzoai.cloud.models.o11y_azure_service_logs_config",
+    "O11yAzureServiceMetricsConfig": "hanzoai.cloud.models.o11y_azure_service_metrics_config",
+    "O11yAzureTelemetryCollectionStrategy": "hanzoai.cloud.models.o11y_azure_telemetry_collection_strategy",
+    "O11yBasicAuth": "hanzoai.cloud.models.o11y_basic_auth",
+    "O11yBuilderQuery": "hanzoai.cloud.models.o11y_builder_query",
+    "O11yChannel": "hanzoai.cloud.models.o11y_channel",
+    "O11yChecks": "hanzoai.cloud.models.o11y_checks",
+    "O11yCloudIntegrationService": "hanzoai.cloud.models.o11y_cloud_integration_service",
+    "O11yClusterListRecord": "hanzoai.cloud.models.o11y_cluster_list_record",
+    "O11yClusterListRequest": "hanzoai.cloud.models.o11y_cluster_list_request",
+    "O11yClusterListResponse": "hanzoai.cloud.models.o11y_cluster_list_response",
+    "O11yClusterRecord": "hanzoai.cloud.models.o11y_cluster_record",
+    "O11yClusters": "hanzoai.cloud.models.o11y_clusters",
+    "O11yCollectedLogAttribute": "hanzoai.cloud.models.o11y_collected_log_attribute",
+    "O11yCollectedMetric": "hanzoai.cloud.models.o11y_collected_metric",
+    "O11yCompositeQuery": "hanzoai.cloud.models.o11y_composite_query",
+    "O11yConnectionArtifact": "hanzoai.cloud.models.o11y_connection_artifact",
+    "O11yCreateQueueReq": "hanzoai.cloud.models.o11y_create_queue_req",
+    "O11yCredentials": "hanzoai.cloud.models.o11y_credentials",
+    "O11yDaemonSetListRecord": "hanzoai.cloud.models.o11y_daemon_set_list_record",
+    "O11yDaemonSetListRequest": "hanzoai.cloud.models.o11y_daemon_set_list_request",
+    "O11yDaemonSetListResponse": "hanzoai.cloud.models.o11y_daemon_set_list_response",
+    "O11yDaemonSetRecord": "hanzoai.cloud.models.o11y_daemon_set_record",
+    "O11yDaemonSets": "hanzoai.cloud.models.o11y_daemon_sets",
+    "O11yDataCollected": "hanzoai.cloud.models.o11y_data_collected",
+    "O11yDataCollectedForIntegration": "hanzoai.cloud.models.o11y_data_collected_for_integration",
+    "O11yDatastoreQuery": "hanzoai.cloud.models.o11y_datastore_query",
+    "O11yDeployment": "hanzoai.cloud.models.o11y_deployment",
+    "O11yDeploymentListRecord": "hanzoai.cloud.models.o11y_deployment_list_record",
+    "O11yDeploymentListRequest": "hanzoai.cloud.models.o11y_deployment_list_request",
+    "O11yDeploymentListResponse": "hanzoai.cloud.models.o11y_deployment_list_response",
+    "O11yDeploymentRecord": "hanzoai.cloud.models.o11y_deployment_record",
+    "O11yDeployments": "hanzoai.cloud.models.o11y_deployments",
+    "O11yDeprecatedGettableAlert": "hanzoai.cloud.models.o11y_deprecated_gettable_alert",
+    "O11yDiscordConfig": "hanzoai.cloud.models.o11y_discord_config",
+    "O11yEmailConfig": "hanzoai.cloud.models.o11y_email_config",
+    "O11yEvent": "hanzoai.cloud.models.o11y_event",
+    "O11yFilter": "hanzoai.cloud.models.o11y_filter",
+    "O11yFilterAttributeKeyResponse": "hanzoai.cloud.models.o11y_filter_attribute_key_response",
+    "O11yFilterAttributeValueRequest": "hanzoai.cloud.models.o11y_filter_attribute_value_request",
+    "O11yFilterAttributeValueResponse": "hanzoai.cloud.models.o11y_filter_attribute_value_response",
+    "O11yFilterItem": "hanzoai.cloud.models.o11y_filter_item",
+    "O11yFilterSet": "hanzoai.cloud.models.o11y_filter_set",
+    "O11yFlamegraphSpan": "hanzoai.cloud.models.o11y_flamegraph_span",
+    "O11yFormatOptions": "hanzoai.cloud.models.o11y_format_options",
+    "O11yFunction": "hanzoai.cloud.models.o11y_function",
+    "O11yFunnelStep": "hanzoai.cloud.models.o11y_funnel_step",
+    "O11yGCPAccountConfig": "hanzoai.cloud.models.o11y_gcp_account_config",
+    "O11yGCPServiceConfig": "hanzoai.cloud.models.o11y_gcp_service_config",
+    "O11yGCPServiceLogsConfig": "hanzoai.cloud.models.o11y_gcp_service_logs_config",
+    "O11yGCPServiceMetricsConfig": "hanzoai.cloud.models.o11y_gcp_service_metrics_config",
+    "O11yGettableAccountWithConnectionArtifact": "hanzoai.cloud.models.o11y_gettable_account_with_connection_artifact",
+    "O11yGettableAccounts": "hanzoai.cloud.models.o11y_gettable_accounts",
+    "O11yGettableAgentCheckIn": "hanzoai.cloud.models.o11y_gettable_agent_check_in",
+    "O11yGettableCreatedIngestionKey": "hanzoai.cloud.models.o11y_gettable_created_ingestion_key",
+    "O11yGettableCreatedIngestionKeyLimit": "hanzoai.cloud.models.o11y_gettable_created_ingestion_key_limit",
+    "O11yGettableFieldKeys": "hanzoai.cloud.models.o11y_gettable_field_keys",
+    "O11yGettableFieldValues": "hanzoai.cloud.models.o11y_gettable_field_values",
+    "O11yGettableFlamegraphTrace": "hanzoai.cloud.models.o11y_gettable_flamegraph_trace",
+    "O11yGettableFunnel": "hanzoai.cloud.models.o11y_gettable_funnel",
+    "O11yGettableHost": "hanzoai.cloud.models.o11y_gettable_host",
+    "O11yGettableIngestionKeys": "hanzoai.cloud.models.o11y_gettable_ingestion_keys",
+    "O11yGettableRoutePolicy": "hanzoai.cloud.models.o11y_gettable_route_policy",
+    "O11yGettableRuleStateHistory": "hanzoai.cloud.models.o11y_gettable_rule_state_history",
+    "O11yGettableRuleStateHistoryContributor": "hanzoai.cloud.models.o11y_gettable_rule_state_history_contributor",
+    "O11yGettableRuleStateHistoryStats": "hanzoai.cloud.models.o11y_gettable_rule_state_history_stats",
+    "O11yGettableRuleStateTimeline": "hanzoai.cloud.models.o11y_gettable_rule_state_timeline",
+    "O11yGettableRuleStateWindow": "hanzoai.cloud.models.o11y_gettable_rule_state_window",
+    "O11yGettableServicesMetadata": "hanzoai.cloud.models.o11y_gettable_services_metadata",
+    "O11yGettableSpanMapperGroups": "hanzoai.cloud.models.o11y_gettable_span_mapper_groups",
+    "O11yGettableSpanMappers": "hanzoai.cloud.models.o11y_gettable_span_mappers",
+    "O11yGettableTestRule": "hanzoai.cloud.models.o11y_gettable_test_rule",
+    "O11yGettableTraceAggregations": "hanzoai.cloud.models.o11y_gettable_trace_aggregations",
+    "O11yGettableWaterfallTrace": "hanzoai.cloud.models.o11y_gettable_waterfall_trace",
+    "O11yGoogleChatReceiverConfig": "hanzoai.cloud.models.o11y_google_chat_receiver_config",
+    "O11yGroupByKey": "hanzoai.cloud.models.o11y_group_by_key",
+    "O11yHTTPClientConfig": "hanzoai.cloud.models.o11y_http_client_config",
+    "O11yHaving": "hanzoai.cloud.models.o11y_having",
+    "O11yHost": "hanzoai.cloud.models.o11y_host",
+    "O11yHostFilter": "hanzoai.cloud.models.o11y_host_filter",
+    "O11yHostListRecord": "hanzoai.cloud.models.o11y_host_list_record",
+    "O11yHostListRequest": "hanzoai.cloud.models.o11y_host_list_request",
+    "O11yHostListResponse": "hanzoai.cloud.models.o11y_host_list_response",
+    "O11yHostRecord": "hanzoai.cloud.models.o11y_host_record",
+    "O11yHosts": "hanzoai.cloud.models.o11y_hosts",
+    "O11yIncidentioConfig": "hanzoai.cloud.models.o11y_incidentio_config",
+    "O11yIngestionKey": "hanzoai.cloud.models.o11y_ingestion_key",
+    "O11yInstallIntegrationRequest": "hanzoai.cloud.models.o11y_install_integration_request",
+    "O11yInstalledIntegration": "hanzoai.cloud.models.o11y_installed_integration",
+    "O11yIntegration": "hanzoai.cloud.models.o11y_integration",
+    "O11yIntegrationAssets": "hanzoai.cloud.models.o11y_integration_assets",
+    "O11yIntegrationAuthor": "hanzoai.cloud.models.o11y_integration_author",
+    "O11yIntegrationConfig": "hanzoai.cloud.models.o11y_integration_config",
+    "O11yIntegrationConfigStep": "hanzoai.cloud.models.o11y_integration_config_step",
+    "O11yIntegrationConnectionStatus": "hanzoai.cloud.models.o11y_integration_connection_status",
+    "O11yIntegrationConnectionTests": "hanzoai.cloud.models.o11y_integration_connection_tests",
+    "O11yIntegrationsCollectedLogAttribute": "hanzoai.cloud.models.o11y_integrations_collected_log_attribute",
+    "O11yIntegrationsCollectedMetric": "hanzoai.cloud.models.o11y_integrations_collected_metric",
+    "O11yIntegrationsListItem": "hanzoai.cloud.models.o11y_integrations_list_item",
+    "O11yIntegrationsListResponse": "hanzoai.cloud.models.o11y_integrations_list_response",
+    "O11yItemInput": "hanzoai.cloud.models.o11y_item_input",
+    "O11yJiraConfig": "hanzoai.cloud.models.o11y_jira_config",
+    "O11yJiraFieldConfig": "hanzoai.cloud.models.o11y_jira_field_config",
+    "O11yJobListRecord": "hanzoai.cloud.models.o11y_job_list_record",
+    "O11yJobListRequest": "hanzoai.cloud.models.o11y_job_list_request",
+    "O11yJobListResponse": "hanzoai.cloud.models.o11y_job_list_response",
+    "O11yJobRecord": "hanzoai.cloud.models.o11y_job_record",
+    "O11yJobs": "hanzoai.cloud.models.o11y_jobs",
+    "O11yLabel": "hanzoai.cloud.models.o11y_label",
+    "O11yLimit": "hanzoai.cloud.models.o11y_limit",
+    "O11yLimitConfig": "hanzoai.cloud.models.o11y_limit_config",
+    "O11yLimitMetric": "hanzoai.cloud.models.o11y_limit_metric",
+    "O11yLimitMetricValue": "hanzoai.cloud.models.o11y_limit_metric_value",
+    "O11yLimitValue": "hanzoai.cloud.models.o11y_limit_value",
+    "O11yListMeta": "hanzoai.cloud.models.o11y_list_meta",
+    "O11yLogsAssets": "hanzoai.cloud.models.o11y_logs_assets",
+    "O11yLogsConnectionTest": "hanzoai.cloud.models.o11y_logs_connection_test",
+    "O11yMSTeamsConfig": "hanzoai.cloud.models.o11y_ms_teams_config",
+    "O11yMSTeamsV2Config": "hanzoai.cloud.models.o11y_ms_teams_v2_config",
+    "O11yMattermostAttachment": "hanzoai.cloud.models.o11y_mattermost_attachment",
+    "O11yMattermostConfig": "hanzoai.cloud.models.o11y_mattermost_config",
+    "O11yMattermostField": "hanzoai.cloud.models.o11y_mattermost_field",
+    "O11yMattermostPriority": "hanzoai.cloud.models.o11y_mattermost_priority",
+    "O11yMattermostProps": "hanzoai.cloud.models.o11y_mattermost_props",
+    "O11yMetricsComponentEntry": "hanzoai.cloud.models.o11y_metrics_component_entry",
+    "O11yMetricsResponse": "hanzoai.cloud.models.o11y_metrics_response",
+    "O11yMetricsResponseRange": "hanzoai.cloud.models.o11y_metrics_response_range",
+    "O11yMetricsResponseSeries": "hanzoai.cloud.models.o11y_metrics_response_series",
+    "O11yMetricsResponseSummary": "hanzoai.cloud.models.o11y_metrics_response_summary",
+    "O11yMetricsResponseUsage": "hanzoai.cloud.models.o11y_metrics_response_usage",
+    "O11yMissingAttributesComponentEntry": "hanzoai.cloud.models.o11y_missing_attributes_component_entry",
+    "O11yMissingMetricsComponentEntry": "hanzoai.cloud.models.o11y_missing_metrics_component_entry",
+    "O11yNamespaceListRecord": "hanzoai.cloud.models.o11y_namespace_list_record",
+    "O11yNamespaceListRequest": "hanzoai.cloud.models.o11y_namespace_list_request",
+    "O11yNamespaceListResponse": "hanzoai.cloud.models.o11y_namespace_list_response",
+    "O11yNamespaceRecord": "hanzoai.cloud.models.o11y_namespace_record",
+    "O11yNamespaces": "hanzoai.cloud.models.o11y_namespaces",
+    "O11yNodeCountByCondition": "hanzoai.cloud.models.o11y_node_count_by_condition",
+    "O11yNodeCountsByReadiness": "hanzoai.cloud.models.o11y_node_counts_by_readiness",
+    "O11yNodeListRecord": "hanzoai.cloud.models.o11y_node_list_record",
+    "O11yNodeListRequest": "hanzoai.cloud.models.o11y_node_list_request",
+    "O11yNodeListResponse": "hanzoai.cloud.models.o11y_node_list_response",
+    "O11yNodeRecord": "hanzoai.cloud.models.o11y_node_record",
+    "O11yNodes": "hanzoai.cloud.models.o11y_nodes",
+    "O11yNotifierConfig": "hanzoai.cloud.models.o11y_notifier_config",
+    "O11yO11yAPIKey": "hanzoai.cloud.models.o11y_o11y_api_key",
+    "O11yO11yAPIKeyCreateIn": "hanzoai.cloud.models.o11y_o11y_api_key_create_in",
+    "O11yO11yAPIKeyCreateOut": "hanzoai.cloud.models.o11y_o11y_api_key_create_out",
+    "O11yO11yAPIKeySecret": "hanzoai.cloud.models.o11y_o11y_api_key_secret",
+    "O11yO11yAPIKeyUpdateIn": "hanzoai.cloud.models.o11y_o11y_api_key_update_in",
+    "O11yO11yAPIKeysOut": "hanzoai.cloud.models.o11y_o11y_api_keys_out",
+    "O11yO11yAccountOut": "hanzoai.cloud.models.o11y_o11y_account_out",
+    "O11yO11yAccountsOut": "hanzoai.cloud.models.o11y_o11y_accounts_out",
+    "O11yO11yAck": "hanzoai.cloud.models.o11y_o11y_ack",
+    "O11yO11yAffectedAsset": "hanzoai.cloud.models.o11y_o11y_affected_asset",
+    "O11yO11yAffectedWidget": "hanzoai.cloud.models.o11y_o11y_affected_widget",
+    "O11yO11yAgentCheckInIn": "hanzoai.cloud.models.o11y_o11y_agent_check_in_in",
+    "O11yO11yAgentCheckInOut": "hanzoai.cloud.models.o11y_o11y_agent_check_in_out",
+    "O11yO11yAggregateAttributesOut": "hanzoai.cloud.models.o11y_o11y_aggregate_attributes_out",
+    "O11yO11yAggregation": "hanzoai.cloud.models.o11y_o11y_aggregation",
+    "O11yO11yAggregationMeta": "hanzoai.cloud.models.o11y_o11y_aggregation_meta",
+    "O11yO11yAlertsOut": "hanzoai.cloud.models.o11y_o11y_alerts_out",
+    "O11yO11yAnalyzeIn": "hanzoai.cloud.models.o11y_o11y_analyze_in",
+    "O11yO11yAnalyzeOut": "hanzoai.cloud.models.o11y_o11y_analyze_out",
+    "O11yO11yApdexOut": "hanzoai.cloud.models.o11y_o11y_apdex_out",
+    "O11yO11yApdexSetIn": "hanzoai.cloud.models.o11y_o11y_apdex_set_in",
+    "O11yO11yApdexSetOut": "hanzoai.cloud.models.o11y_o11y_apdex_set_out",
+    "O11yO11yApdexSettings": "hanzoai.cloud.models.o11y_o11y_apdex_settings",
+    "O11yO11yAttributeKey": "hanzoai.cloud.models.o11y_o11y_attribute_key",
+    "O11yO11yAttributeKeysOut": "hanzoai.cloud.models.o11y_o11y_attribute_keys_out",
+    "O11yO11yAttributeMapping": "hanzoai.cloud.models.o11y_o11y_attribute_mapping",
+    "O11yO11yAttributeValuesOut": "hanzoai.cloud.models.o11y_o11y_attribute_values_out",
+    "O11yO11yAuthDomain": "hanzoai.cloud.models.o11y_o11y_auth_domain",
+    "O11yO11yAuthDomainConfig": "hanzoai.cloud.models.o11y_o11y_auth_domain_config",
+    "O11yO11yAuthDomainOut": "hanzoai.cloud.models.o11y_o11y_auth_domain_out",
+    "O11yO11yAuthDomainsOut": "hanzoai.cloud.models.o11y_o11y_auth_domains_out",
+    "O11yO11yAuthNProviderInfo": "hanzoai.cloud.models.o11y_o11y_auth_n_provider_info",
+    "O11yO11yAuthNSupport": "hanzoai.cloud.models.o11y_o11y_auth_n_support",
+    "O11yO11yBulkInviteIn": "hanzoai.cloud.models.o11y_o11y_bulk_invite_in",
+    "O11yO11yCallbackAuthN": "hanzoai.cloud.models.o11y_o11y_callback_auth_n",
+    "O11yO11yChangePasswordIn": "hanzoai.cloud.models.o11y_o11y_change_password_in",
+    "O11yO11yChannelOut": "hanzoai.cloud.models.o11y_o11y_channel_out",
+    "O11yO11yChannelUpdateIn": "hanzoai.cloud.models.o11y_o11y_channel_update_in",
+    "O11yO11yChannelsOut": "hanzoai.cloud.models.o11y_o11y_channels_out",
+    "O11yO11yCheckOut": "hanzoai.cloud.models.o11y_o11y_check_out",
+    "O11yO11yClusterListOut": "hanzoai.cloud.models.o11y_o11y_cluster_list_out",
+    "O11yO11yColumnInfo": "hanzoai.cloud.models.o11y_o11y_column_info",
+    "O11yO11yConnectionStatusOut": "hanzoai.cloud.models.o11y_o11y_connection_status_out",
+    "O11yO11yCreateAccountIn": "hanzoai.cloud.models.o11y_o11y_create_account_in",
+    "O11yO11yCreateAccountOut": "hanzoai.cloud.models.o11y_o11y_create_account_out",
+    "O11yO11yCreateLimitIn": "hanzoai.cloud.models.o11y_o11y_create_limit_in",
+    "O11yO11yCreated": "hanzoai.cloud.models.o11y_o11y_created",
+    "O11yO11yCreatedIngestionKeyOut": "hanzoai.cloud.models.o11y_o11y_created_ingestion_key_out",
+    "O11yO11yCreatedLimitOut": "hanzoai.cloud.models.o11y_o11y_created_limit_out",
+    "O11yO11yCreatedOut": "hanzoai.cloud.models.o11y_o11y_created_out",
+    "O11yO11yCredentialsOut": "hanzoai.cloud.models.o11y_o11y_credentials_out",
+    "O11yO11yDaemonSetListOut": "hanzoai.cloud.models.o11y_o11y_daemon_set_list_out",
+    "O11yO11yDashboard": "hanzoai.cloud.models.o11y_o11y_dashboard",
+    "O11yO11yDashboardDisplay": "hanzoai.cloud.models.o11y_o11y_dashboard_display",
+    "O11yO11yDashboardList": "hanzoai.cloud.models.o11y_o11y_dashboard_list",
+    "O11yO11yDashboardListForUser": "hanzoai.cloud.models.o11y_o11y_dashboard_list_for_user",
+    "O11yO11yDashboardListForUserOut": "hanzoai.cloud.models.o11y_o11y_dashboard_list_for_user_out",
+    "O11yO11yDashboardListItem": "hanzoai.cloud.models.o11y_o11y_dashboard_list_item",
+    "O11yO11yDashboardListItemForUser": "hanzoai.cloud.models.o11y_o11y_dashboard_list_item_for_user",
+    "O11yO11yDashboardListOut": "hanzoai.cloud.models.o11y_o11y_dashboard_list_out",
+    "O11yO11yDashboardListSpec": "hanzoai.cloud.models.o11y_o11y_dashboard_list_spec",
+    "O11yO11yDashboardOut": "hanzoai.cloud.models.o11y_o11y_dashboard_out",
+    "O11yO11yDashboardPatchIn": "hanzoai.cloud.models.o11y_o11y_dashboard_patch_in",
+    "O11yO11yDashboardPatchOp": "hanzoai.cloud.models.o11y_o11y_dashboard_patch_op",
+    "O11yO11yDashboardPostable": "hanzoai.cloud.models.o11y_o11y_dashboard_postable",
+    "O11yO11yDashboardPostableTag": "hanzoai.cloud.models.o11y_o11y_dashboard_postable_tag",
+    "O11yO11yDashboardTag": "hanzoai.cloud.models.o11y_o11y_dashboard_tag",
+    "O11yO11yDashboardUpdateIn": "hanzoai.cloud.models.o11y_o11y_dashboard_update_in",
+    "O11yO11yDashboardVarValues": "hanzoai.cloud.models.o11y_o11y_dashboard_var_values",
+    "O11yO11yDashboardVarsIn": "hanzoai.cloud.models.o11y_o11y_dashboard_vars_in",
+    "O11yO11yDashboardVarsOut": "hanzoai.cloud.models.o11y_o11y_dashboard_vars_out",
+    "O11yO11yDashboardView": "hanzoai.cloud.models.o11y_o11y_dashboard_view",
+    "O11yO11yDashboardViewData": "hanzoai.cloud.models.o11y_o11y_dashboard_view_data",
+    "O11yO11yDashboardViewList": "hanzoai.cloud.models.o11y_o11y_dashboard_view_list",
+    "O11yO11yDashboardViewListOut": "hanzoai.cloud.models.o11y_o11y_dashboard_view_list_out",
+    "O11yO11yDashboardViewOut": "hanzoai.cloud.models.o11y_o11y_dashboard_view_out",
+    "O11yO11yDashboardViewPostable": "hanzoai.cloud.models.o11y_o11y_dashboard_view_postable",
+    "O11yO11yDashboardViewUpdateIn": "hanzoai.cloud.models.o11y_o11y_dashboard_view_update_in",
+    "O11yO11yDependency": "hanzoai.cloud.models.o11y_o11y_dependency",
+    "O11yO11yDependencyGraphIn": "hanzoai.cloud.models.o11y_o11y_dependency_graph_in",
+    "O11yO11yDeploymentListOut": "hanzoai.cloud.models.o11y_o11y_deployment_list_out",
+    "O11yO11yDeprecatedUser": "hanzoai.cloud.models.o11y_o11y_deprecated_user",
+    "O11yO11yDeprecatedUserOut": "hanzoai.cloud.models.o11y_o11y_deprecated_user_out",
+    "O11yO11yDeprecatedUserUpdate": "hanzoai.cloud.models.o11y_o11y_deprecated_user_update",
+    "O11yO11yDeprecatedUsersOut": "hanzoai.cloud.models.o11y_o11y_deprecated_users_out",
+    "O11yO11yDiscoverIn": "hanzoai.cloud.models.o11y_o11y_discover_in",
+    "O11yO11yDiscoverOut": "hanzoai.cloud.models.o11y_o11y_discover_out",
+    "O11yO11yDisk": "hanzoai.cloud.models.o11y_o11y_disk",
+    "O11yO11yDomainFilter": "hanzoai.cloud.models.o11y_o11y_domain_filter",
+    "O11yO11yDomainGroupBy": "hanzoai.cloud.models.o11y_o11y_domain_group_by",
+    "O11yO11yDomainsAnswer": "hanzoai.cloud.models.o11y_o11y_domains_answer",
+    "O11yO11yDomainsData": "hanzoai.cloud.models.o11y_o11y_domains_data",
+    "O11yO11yDomainsIn": "hanzoai.cloud.models.o11y_o11y_domains_in",
+    "O11yO11yDomainsOut": "hanzoai.cloud.models.o11y_o11y_domains_out",
+    "O11yO11yDowntimeScheduleOut": "hanzoai.cloud.models.o11y_o11y_downtime_schedule_out",
+    "O11yO11yDowntimeSchedulesOut": "hanzoai.cloud.models.o11y_o11y_downtime_schedules_out",
+    "O11yO11yDowntimeUpdateIn": "hanzoai.cloud.models.o11y_o11y_downtime_update_in",
+    "O11yO11yDraftFunnelIn": "hanzoai.cloud.models.o11y_o11y_draft_funnel_in",
+    "O11yO11yEmailPasswordSessionIn": "hanzoai.cloud.models.o11y_o11y_email_password_session_in",
+    "O11yO11yErrorDetail": "hanzoai.cloud.models.o11y_o11y_error_detail",
+    "O11yO11yErrorGettableIssue": "hanzoai.cloud.models.o11y_o11y_error_gettable_issue",
+    "O11yO11yErrorGettableIssueOut": "hanzoai.cloud.models.o11y_o11y_error_gettable_issue_out",
+    "O11yO11yErrorIssue": "hanzoai.cloud.models.o11y_o11y_error_issue",
+    "O11yO11yErrorIssueOut": "hanzoai.cloud.models.o11y_o11y_error_issue_out",
+    "O11yO11yErrorIssues": "hanzoai.cloud.models.o11y_o11y_error_issues",
+    "O11yO11yErrorIssuesOut": "hanzoai.cloud.models.o11y_o11y_error_issues_out",
+    "O11yO11yErrorItem": "hanzoai.cloud.models.o11y_o11y_error_item",
+    "O11yO11yErrorUpdateIssueIn": "hanzoai.cloud.models.o11y_o11y_error_update_issue_in",
+    "O11yO11yErrorWithSpan": "hanzoai.cloud.models.o11y_o11y_error_with_span",
+    "O11yO11yErrorsCountIn": "hanzoai.cloud.models.o11y_o11y_errors_count_in",
+    "O11yO11yErrorsListIn": "hanzoai.cloud.models.o11y_o11y_errors_list_in",
+    "O11yO11yEvent": "hanzoai.cloud.models.o11y_o11y_event",
+    "O11yO11yEventIn": "hanzoai.cloud.models.o11y_o11y_event_in",
+    "O11yO11yEventUser": "hanzoai.cloud.models.o11y_o11y_event_user",
+    "O11yO11yEvents": "hanzoai.cloud.models.o11y_o11y_events",
+    "O11yO11yFeature": "hanzoai.cloud.models.o11y_o11y_feature",
+    "O11yO11yFeaturesOut": "hanzoai.cloud.models.o11y_o11y_features_out",
+    "O11yO11yFieldCatalogOut": "hanzoai.cloud.models.o11y_o11y_field_catalog_out",
+    "O11yO11yFieldKeysOut": "hanzoai.cloud.models.o11y_o11y_field_keys_out",
+    "O11yO11yFieldSetting": "hanzoai.cloud.models.o11y_o11y_field_setting",
+    "O11yO11yFieldValuesOut": "hanzoai.cloud.models.o11y_o11y_field_values_out",
+    "O11yO11yFilter": "hanzoai.cloud.models.o11y_o11y_filter",
+    "O11yO11yFilterItem": "hanzoai.cloud.models.o11y_o11y_filter_item",
+    "O11yO11yFilterKey": "hanzoai.cloud.models.o11y_o11y_filter_key",
+    "O11yO11yFilterSet": "hanzoai.cloud.models.o11y_o11y_filter_set",
+    "O11yO11yFilterSuggestions": "hanzoai.cloud.models.o11y_o11y_filter_suggestions",
+    "O11yO11yFilterSuggestionsOut": "hanzoai.cloud.models.o11y_o11y_filter_suggestions_out",
+    "O11yO11yForgotPasswordIn": "hanzoai.cloud.models.o11y_o11y_forgot_password_in",
+    "O11yO11yFrame": "hanzoai.cloud.models.o11y_o11y_frame",
+    "O11yO11yFunnelCreateIn": "hanzoai.cloud.models.o11y_o11y_funnel_create_in",
+    "O11yO11yFunnelDeleteOut": "hanzoai.cloud.models.o11y_o11y_funnel_delete_out",
+    "O11yO11yFunnelOut": "hanzoai.cloud.models.o11y_o11y_funnel_out",
+    "O11yO11yFunnelRow": "hanzoai.cloud.models.o11y_o11y_funnel_row",
+    "O11yO11yFunnelRowsOut": "hanzoai.cloud.models.o11y_o11y_funnel_rows_out",
+    "O11yO11yFunnelStepWindowIn": "hanzoai.cloud.models.o11y_o11y_funnel_step_window_in",
+    "O11yO11yFunnelStepsUpdateIn": "hanzoai.cloud.models.o11y_o11y_funnel_steps_update_in",
+    "O11yO11yFunnelUpdateIn": "hanzoai.cloud.models.o11y_o11y_funnel_update_in",
+    "O11yO11yFunnelWindowIn": "hanzoai.cloud.models.o11y_o11y_funnel_window_in",
+    "O11yO11yFunnelsOut": "hanzoai.cloud.models.o11y_o11y_funnels_out",
+    "O11yO11yGettableHostOut": "hanzoai.cloud.models.o11y_o11y_gettable_host_out",
+    "O11yO11yGlobalConfig": "hanzoai.cloud.models.o11y_o11y_global_config",
+    "O11yO11yGlobalConfigOut": "hanzoai.cloud.models.o11y_o11y_global_config_out",
+    "O11yO11yGoogleConfig": "hanzoai.cloud.models.o11y_o11y_google_config",
+    "O11yO11yHealthOut": "hanzoai.cloud.models.o11y_o11y_health_out",
+    "O11yO11yHostListOut": "hanzoai.cloud.models.o11y_o11y_host_list_out",
+    "O11yO11yIdentN": "hanzoai.cloud.models.o11y_o11y_ident_n",
+    "O11yO11yIdentifiable": "hanzoai.cloud.models.o11y_o11y_identifiable",
+    "O11yO11yIdentifiableOut": "hanzoai.cloud.models.o11y_o11y_identifiable_out",
+    "O11yO11yInfraAttributeKeysOut": "hanzoai.cloud.models.o11y_o11y_infra_attribute_keys_out",
+    "O11yO11yInfraAttributeValuesOut": "hanzoai.cloud.models.o11y_o11y_infra_attribute_values_out",
+    "O11yO11yInfraChecksOut": "hanzoai.cloud.models.o11y_o11y_infra_checks_out",
+    "O11yO11yInfraClustersOut": "hanzoai.cloud.models.o11y_o11y_infra_clusters_out",
+    "O11yO11yInfraDaemonSetsOut": "hanzoai.cloud.models.o11y_o11y_infra_daemon_sets_out",
+    "O11yO11yInfraDeploymentsOut": "hanzoai.cloud.models.o11y_o11y_infra_deployments_out",
+    "O11yO11yInfraHostsOut": "hanzoai.cloud.models.o11y_o11y_infra_hosts_out",
+    "O11yO11yInfraJobsOut": "hanzoai.cloud.models.o11y_o11y_infra_jobs_out",
+    "O11yO11yInfraNamespacesOut": "hanzoai.cloud.models.o11y_o11y_infra_namespaces_out",
+    "O11yO11yInfraNodesOut": "hanzoai.cloud.models.o11y_o11y_infra_nodes_out",
+    "O11yO11yInfraPodsOut": "hanzoai.cloud.models.o11y_o11y_infra_pods_out",
+    "O11yO11yInfraStatefulSetsOut": "hanzoai.cloud.models.o11y_o11y_infra_stateful_sets_out",
+    "O11yO11yInfraVolumesOut": "hanzoai.cloud.models.o11y_o11y_infra_volumes_out",
+    "O11yO11yIngestionKeysOut": "hanzoai.cloud.models.o11y_o11y_ingestion_keys_out",
+    "O11yO11yInstallOut": "hanzoai.cloud.models.o11y_o11y_install_out",
+    "O11yO11yIntegrationAck": "hanzoai.cloud.models.o11y_o11y_integration_ack",
+    "O11yO11yIntegrationOut": "hanzoai.cloud.models.o11y_o11y_integration_out",
+    "O11yO11yIntegrationsListOut": "hanzoai.cloud.models.o11y_o11y_integrations_list_out",
+    "O11yO11yInvite": "hanzoai.cloud.models.o11y_o11y_invite",
+    "O11yO11yInviteIn": "hanzoai.cloud.models.o11y_o11y_invite_in",
+    "O11yO11yInviteOut": "hanzoai.cloud.models.o11y_o11y_invite_out",
+    "O11yO11yJobListOut": "hanzoai.cloud.models.o11y_o11y_job_list_out",
+    "O11yO11yK8sOnboarding": "hanzoai.cloud.models.o11y_o11y_k8s_onboarding",
+    "O11yO11yLLMAnnotation": "hanzoai.cloud.models.o11y_o11y_llm_annotation",
+    "O11yO11yLLMAnnotationOut": "hanzoai.cloud.models.o11y_o11y_llm_annotation_out",
+    "O11yO11yLLMAnnotationsOut": "hanzoai.cloud.models.o11y_o11y_llm_annotations_out",
+    "O11yO11yLLMAnnotationsPage": "hanzoai.cloud.models.o11y_o11y_llm_annotations_page",
+    "O11yO11yLLMIngestAnnotation": "hanzoai.cloud.models.o11y_o11y_llm_ingest_annotation",
+    "O11yO11yLLMIngestScore": "hanzoai.cloud.models.o11y_o11y_llm_ingest_score",
+    "O11yO11yLLMObservation": "hanzoai.cloud.models.o11y_o11y_llm_observation",
+    "O11yO11yLLMObservationsOut": "hanzoai.cloud.models.o11y_o11y_llm_observations_out",
+    "O11yO11yLLMObservationsPage": "hanzoai.cloud.models.o11y_o11y_llm_observations_page",
+    "O11yO11yLLMPricingCacheCosts": "hanzoai.cloud.models.o11y_o11y_llm_pricing_cache_costs",
+    "O11yO11yLLMPricingRule": "hanzoai.cloud.models.o11y_o11y_llm_pricing_rule",
+    "O11yO11yLLMPricingRuleOut": "hanzoai.cloud.models.o11y_o11y_llm_pricing_rule_out",
+    "O11yO11yLLMPricingRulesOut": "hanzoai.cloud.models.o11y_o11y_llm_pricing_rules_out",
+    "O11yO11yLLMPricingRulesPage": "hanzoai.cloud.models.o11y_o11y_llm_pricing_rules_page",
+    "O11yO11yLLMRulePricing": "hanzoai.cloud.models.o11y_o11y_llm_rule_pricing",
+    "O11yO11yLLMScore": "hanzoai.cloud.models.o11y_o11y_llm_score",
+    "O11yO11yLLMScoreOut": "hanzoai.cloud.models.o11y_o11y_llm_score_out",
+    "O11yO11yLLMScoresOut": "hanzoai.cloud.models.o11y_o11y_llm_scores_out",
+    "O11yO11yLLMScoresPage": "hanzoai.cloud.models.o11y_o11y_llm_scores_page",
+    "O11yO11yLLMSession": "hanzoai.cloud.models.o11y_o11y_llm_session",
+    "O11yO11yLLMSessionsOut": "hanzoai.cloud.models.o11y_o11y_llm_sessions_out",
+    "O11yO11yLLMSessionsPage": "hanzoai.cloud.models.o11y_o11y_llm_sessions_page",
+    "O11yO11yLLMTrace": "hanzoai.cloud.models.o11y_o11y_llm_trace",
+    "O11yO11yLLMTracesOut": "hanzoai.cloud.models.o11y_o11y_llm_traces_out",
+    "O11yO11yLLMTracesPage": "hanzoai.cloud.models.o11y_o11y_llm_traces_page",
+    "O11yO11yLLMUpdatablePricingRule": "hanzoai.cloud.models.o11y_o11y_llm_updatable_pricing_rule",
+    "O11yO11yLLMUpdatablePricingRules": "hanzoai.cloud.models.o11y_o11y_llm_updatable_pricing_rules",
+    "O11yO11yLLMUser": "hanzoai.cloud.models.o11y_o11y_llm_user",
+    "O11yO11yLLMUsersOut": "hanzoai.cloud.models.o11y_o11y_llm_users_out",
+    "O11yO11yLLMUsersPage": "hanzoai.cloud.models.o11y_o11y_llm_users_page",
+    "O11yO11yLicenseActiveOut": "hanzoai.cloud.models.o11y_o11y_license_active_out",
+    "O11yO11yLicensesOut": "hanzoai.cloud.models.o11y_o11y_licenses_out",
+    "O11yO11yListError": "hanzoai.cloud.models.o11y_o11y_list_error",
+    "O11yO11yLogAggregateBucket": "hanzoai.cloud.models.o11y_o11y_log_aggregate_bucket",
+    "O11yO11yLogAggregateOut": "hanzoai.cloud.models.o11y_o11y_log_aggregate_out",
+    "O11yO11yLogConfigVersion": "hanzoai.cloud.models.o11y_o11y_log_config_version",
+    "O11yO11yLogFilter": "hanzoai.cloud.models.o11y_o11y_log_filter",
+    "O11yO11yLogFilterItem": "hanzoai.cloud.models.o11y_o11y_log_filter_item",
+    "O11yO11yLogFilterKey": "hanzoai.cloud.models.o11y_o11y_log_filter_key",
+    "O11yO11yLogParseFrom": "hanzoai.cloud.models.o11y_o11y_log_parse_from",
+    "O11yO11yLogPipeline": "hanzoai.cloud.models.o11y_o11y_log_pipeline",
+    "O11yO11yLogPipelineCreateIn": "hanzoai.cloud.models.o11y_o11y_log_pipeline_create_in",
+    "O11yO11yLogPipelineOperator": "hanzoai.cloud.models.o11y_o11y_log_pipeline_operator",
+    "O11yO11yLogPipelinePreview": "hanzoai.cloud.models.o11y_o11y_log_pipeline_preview",
+    "O11yO11yLogPipelinePreviewIn": "hanzoai.cloud.models.o11y_o11y_log_pipeline_preview_in",
+    "O11yO11yLogPipelinePreviewOut": "hanzoai.cloud.models.o11y_o11y_log_pipeline_preview_out",
+    "O11yO11yLogPipelineRoute": "hanzoai.cloud.models.o11y_o11y_log_pipeline_route",
+    "O11yO11yLogPipelines": "hanzoai.cloud.models.o11y_o11y_log_pipelines",
+    "O11yO11yLogPipelinesOut": "hanzoai.cloud.models.o11y_o11y_log_pipelines_out",
+    "O11yO11yLogPostablePipeline": "hanzoai.cloud.models.o11y_o11y_log_postable_pipeline",
+    "O11yO11yLogPromoteIndex": "hanzoai.cloud.models.o11y_o11y_log_promote_index",
+    "O11yO11yLogPromoteOut": "hanzoai.cloud.models.o11y_o11y_log_promote_out",
+    "O11yO11yLogPromotePath": "hanzoai.cloud.models.o11y_o11y_log_promote_path",
+    "O11yO11yLogPromotedOut": "hanzoai.cloud.models.o11y_o11y_log_promoted_out",
+    "O11yO11yLogRecord": "hanzoai.cloud.models.o11y_o11y_log_record",
+    "O11yO11yLogRecordsOut": "hanzoai.cloud.models.o11y_o11y_log_records_out",
+    "O11yO11yLogsOut": "hanzoai.cloud.models.o11y_o11y_logs_out",
+    "O11yO11yMessage": "hanzoai.cloud.models.o11y_o11y_message",
+    "O11yO11yMetricAckOut": "hanzoai.cloud.models.o11y_o11y_metric_ack_out",
+    "O11yO11yMetricAlert": "hanzoai.cloud.models.o11y_o11y_metric_alert",
+    "O11yO11yMetricAlerts": "hanzoai.cloud.models.o11y_o11y_metric_alerts",
+    "O11yO11yMetricAlertsOut": "hanzoai.cloud.models.o11y_o11y_metric_alerts_out",
+    "O11yO11yMetricAttribute": "hanzoai.cloud.models.o11y_o11y_metric_attribute",
+    "O11yO11yMetricAttributes": "hanzoai.cloud.models.o11y_o11y_metric_attributes",
+    "O11yO11yMetricAttributesOut": "hanzoai.cloud.models.o11y_o11y_metric_attributes_out",
+    "O11yO11yMetricDashboards": "hanzoai.cloud.models.o11y_o11y_metric_dashboards",
+    "O11yO11yMetricDashboardsOut": "hanzoai.cloud.models.o11y_o11y_metric_dashboards_out",
+    "O11yO11yMetricField": "hanzoai.cloud.models.o11y_o11y_metric_field",
+    "O11yO11yMetricFilter": "hanzoai.cloud.models.o11y_o11y_metric_filter",
+    "O11yO11yMetricHighlights": "hanzoai.cloud.models.o11y_o11y_metric_highlights",
+    "O11yO11yMetricHighlightsOut": "hanzoai.cloud.models.o11y_o11y_metric_highlights_out",
+    "O11yO11yMetricInspectIn": "hanzoai.cloud.models.o11y_o11y_metric_inspect_in",
+    "O11yO11yMetricInspectOut": "hanzoai.cloud.models.o11y_o11y_metric_inspect_out",
+    "O11yO11yMetricLabel": "hanzoai.cloud.models.o11y_o11y_metric_label",
+    "O11yO11yMetricList": "hanzoai.cloud.models.o11y_o11y_metric_list",
+    "O11yO11yMetricListOut": "hanzoai.cloud.models.o11y_o11y_metric_list_out",
+    "O11yO11yMetricMetadata": "hanzoai.cloud.models.o11y_o11y_metric_metadata",
+    "O11yO11yMetricMetadataOut": "hanzoai.cloud.models.o11y_o11y_metric_metadata_out",
+    "O11yO11yMetricMetadataSaveIn": "hanzoai.cloud.models.o11y_o11y_metric_metadata_save_in",
+    "O11yO11yMetricOnboarding": "hanzoai.cloud.models.o11y_o11y_metric_onboarding",
+    "O11yO11yMetricOnboardingOut": "hanzoai.cloud.models.o11y_o11y_metric_onboarding_out",
+    "O11yO11yMetricOrder": "hanzoai.cloud.models.o11y_o11y_metric_order",
+    "O11yO11yMetricPanel": "hanzoai.cloud.models.o11y_o11y_metric_panel",
+    "O11yO11yMetricPoint": "hanzoai.cloud.models.o11y_o11y_metric_point",
+    "O11yO11yMetricSeries": "hanzoai.cloud.models.o11y_o11y_metric_series",
+    "O11yO11yMetricSeriesSet": "hanzoai.cloud.models.o11y_o11y_metric_series_set",
+    "O11yO11yMetricStat": "hanzoai.cloud.models.o11y_o11y_metric_stat",
+    "O11yO11yMetricStats": "hanzoai.cloud.models.o11y_o11y_metric_stats",
+    "O11yO11yMetricStatsIn": "hanzoai.cloud.models.o11y_o11y_metric_stats_in",
+    "O11yO11yMetricStatsOut": "hanzoai.cloud.models.o11y_o11y_metric_stats_out",
+    "O11yO11yMetricSummary": "hanzoai.cloud.models.o11y_o11y_metric_summary",
+    "O11yO11yMetricTreemap": "hanzoai.cloud.models.o11y_o11y_metric_treemap",
+    "O11yO11yMetricTreemapIn": "hanzoai.cloud.models.o11y_o11y_metric_treemap_in",
+    "O11yO11yMetricTreemapOut": "hanzoai.cloud.models.o11y_o11y_metric_treemap_out",
+    "O11yO11yMetricsQueryRangeOut": "hanzoai.cloud.models.o11y_o11y_metrics_query_range_out",
+    "O11yO11yMyServiceAccountUpdateIn": "hanzoai.cloud.models.o11y_o11y_my_service_account_update_in",
+    "O11yO11yNamespaceListOut": "hanzoai.cloud.models.o11y_o11y_namespace_list_out",
+    "O11yO11yNextPrevErrorIDs": "hanzoai.cloud.models.o11y_o11y_next_prev_error_ids",
+    "O11yO11yNodeListOut": "hanzoai.cloud.models.o11y_o11y_node_list_out",
+    "O11yO11yOIDCConfig": "hanzoai.cloud.models.o11y_o11y_oidc_config",
+    "O11yO11yObject": "hanzoai.cloud.models.o11y_o11y_object",
+    "O11yO11yObjectGroup": "hanzoai.cloud.models.o11y_o11y_object_group",
+    "O11yO11yOccurrence": "hanzoai.cloud.models.o11y_o11y_occurrence",
+    "O11yO11yOccurrenceFrame": "hanzoai.cloud.models.o11y_o11y_occurrence_frame",
+    "O11yO11yOnboardingOut": "hanzoai.cloud.models.o11y_o11y_onboarding_out",
+    "O11yO11yOperation": "hanzoai.cloud.models.o11y_o11y_operation",
+    "O11yO11yOperationsIn": "hanzoai.cloud.models.o11y_o11y_operations_in",
+    "O11yO11yOperationsOut": "hanzoai.cloud.models.o11y_o11y_operations_out",
+    "O11yO11yOrgStatsOut": "hanzoai.cloud.models.o11y_o11y_org_stats_out",
+    "O11yO11yOrganization": "hanzoai.cloud.models.o11y_o11y_organization",
+    "O11yO11yOrganizationOut": "hanzoai.cloud.models.o11y_o11y_organization_out",
+    "O11yO11yOverallStateTransitionsOut": "hanzoai.cloud.models.o11y_o11y_overall_state_transitions_out",
+    "O11yO11yPasswordAuthN": "hanzoai.cloud.models.o11y_o11y_password_auth_n",
+    "O11yO11yPercentilePosition": "hanzoai.cloud.models.o11y_o11y_percentile_position",
+    "O11yO11yPercentiles": "hanzoai.cloud.models.o11y_o11y_percentiles",
+    "O11yO11yPodListOut": "hanzoai.cloud.models.o11y_o11y_pod_list_out",
+    "O11yO11yPodOnboarding": "hanzoai.cloud.models.o11y_o11y_pod_onboarding",
+    "O11yO11yPostableAuthDomain": "hanzoai.cloud.models.o11y_o11y_postable_auth_domain",
+    "O11yO11yPostableUser": "hanzoai.cloud.models.o11y_o11y_postable_user",
+    "O11yO11yPreference": "hanzoai.cloud.models.o11y_o11y_preference",
+    "O11yO11yPreferenceOut": "hanzoai.cloud.models.o11y_o11y_preference_out",
+    "O11yO11yPreferencesOut": "hanzoai.cloud.models.o11y_o11y_preferences_out",
+    "O11yO11yProcessListOut": "hanzoai.cloud.models.o11y_o11y_process_list_out",
+    "O11yO11yPromQueryOut": "hanzoai.cloud.models.o11y_o11y_prom_query_out",
+    "O11yO11yPromResult": "hanzoai.cloud.models.o11y_o11y_prom_result",
+    "O11yO11yPublicDashboard": "hanzoai.cloud.models.o11y_o11y_public_dashboard",
+    "O11yO11yPublicDashboardData": "hanzoai.cloud.models.o11y_o11y_public_dashboard_data",
+    "O11yO11yPublicDashboardDataOut": "hanzoai.cloud.models.o11y_o11y_public_dashboard_data_out",
+    "O11yO11yPublicDashboardOut": "hanzoai.cloud.models.o11y_o11y_public_dashboard_out",
+    "O11yO11yPublicDashboardV1": "hanzoai.cloud.models.o11y_o11y_public_dashboard_v1",
+    "O11yO11yPublicDashboardWriteIn": "hanzoai.cloud.models.o11y_o11y_public_dashboard_write_in",
+    "O11yO11yPvcListOut": "hanzoai.cloud.models.o11y_o11y_pvc_list_out",
+    "O11yO11yQueryFilterAnalysis": "hanzoai.cloud.models.o11y_o11y_query_filter_analysis",
+    "O11yO11yQueryRange": "hanzoai.cloud.models.o11y_o11y_query_range",
+    "O11yO11yQueryRangeData": "hanzoai.cloud.models.o11y_o11y_query_range_data",
+    "O11yO11yQueryRangeFormatOut": "hanzoai.cloud.models.o11y_o11y_query_range_format_out",
+    "O11yO11yQueryRangeOut": "hanzoai.cloud.models.o11y_o11y_query_range_out",
+    "O11yO11yQueryRangePreviewIn": "hanzoai.cloud.models.o11y_o11y_query_range_preview_in",
+    "O11yO11yQueryRangePreviewOut": "hanzoai.cloud.models.o11y_o11y_query_range_preview_out",
+    "O11yO11yQueryStats": "hanzoai.cloud.models.o11y_o11y_query_stats",
+    "O11yO11yQueryWarning": "hanzoai.cloud.models.o11y_o11y_query_warning",
+    "O11yO11yQueryWarningNote": "hanzoai.cloud.models.o11y_o11y_query_warning_note",
+    "O11yO11yQueueCheck": "hanzoai.cloud.models.o11y_o11y_queue_check",
+    "O11yO11yQueueChecksOut": "hanzoai.cloud.models.o11y_o11y_queue_checks_out",
+    "O11yO11yQueueFilterKey": "hanzoai.cloud.models.o11y_o11y_queue_filter_key",
+    "O11yO11yQueueFilterRule": "hanzoai.cloud.models.o11y_o11y_queue_filter_rule",
+    "O11yO11yQueueFilterSet": "hanzoai.cloud.models.o11y_o11y_queue_filter_set",
+    "O11yO11yQueueIn": "hanzoai.cloud.models.o11y_o11y_queue_in",
+    "O11yO11yQueueListIn": "hanzoai.cloud.models.o11y_o11y_queue_list_in",
+    "O11yO11yQueueRow": "hanzoai.cloud.models.o11y_o11y_queue_row",
+    "O11yO11yQueueRowsOut": "hanzoai.cloud.models.o11y_o11y_queue_rows_out",
+    "O11yO11yQuickFiltersOut": "hanzoai.cloud.models.o11y_o11y_quick_filters_out",
+    "O11yO11yReductionRule": "hanzoai.cloud.models.o11y_o11y_reduction_rule",
+    "O11yO11yReductionRuleCreateIn": "hanzoai.cloud.models.o11y_o11y_reduction_rule_create_in",
+    "O11yO11yReductionRuleListOut": "hanzoai.cloud.models.o11y_o11y_reduction_rule_list_out",
+    "O11yO11yReductionRuleOut": "hanzoai.cloud.models.o11y_o11y_reduction_rule_out",
+    "O11yO11yReductionRulePreview": "hanzoai.cloud.models.o11y_o11y_reduction_rule_preview",
+    "O11yO11yReductionRulePreviewIn": "hanzoai.cloud.models.o11y_o11y_reduction_rule_preview_in",
+    "O11yO11yReductionRulePreviewOut": "hanzoai.cloud.models.o11y_o11y_reduction_rule_preview_out",
+    "O11yO11yReductionRuleSaveIn": "hanzoai.cloud.models.o11y_o11y_reduction_rule_save_in",
+    "O11yO11yReductionRules": "hanzoai.cloud.models.o11y_o11y_reduction_rules",
+    "O11yO11yReductionSeriesOut": "hanzoai.cloud.models.o11y_o11y_reduction_series_out",
+    "O11yO11yReductionSeriesResult": "hanzoai.cloud.models.o11y_o11y_reduction_series_result",
+    "O11yO11yReductionStats": "hanzoai.cloud.models.o11y_o11y_reduction_stats",
+    "O11yO11yReductionStatsOut": "hanzoai.cloud.models.o11y_o11y_reduction_stats_out",
+    "O11yO11yRegisterIn": "hanzoai.cloud.models.o11y_o11y_register_in",
+    "O11yO11yRegisterOut": "hanzoai.cloud.models.o11y_o11y_register_out",
+    "O11yO11yResetPasswordIn": "hanzoai.cloud.models.o11y_o11y_reset_password_in",
+    "O11yO11yResetToken": "hanzoai.cloud.models.o11y_o11y_reset_token",
+    "O11yO11yResetTokenOut": "hanzoai.cloud.models.o11y_o11y_reset_token_out",
+    "O11yO11yResetTokenRef": "hanzoai.cloud.models.o11y_o11y_reset_token_ref",
+    "O11yO11yResourceRef": "hanzoai.cloud.models.o11y_o11y_resource_ref",
+    "O11yO11yRetentionMatch": "hanzoai.cloud.models.o11y_o11y_retention_match",
+    "O11yO11yRetentionOut": "hanzoai.cloud.models.o11y_o11y_retention_out",
+    "O11yO11yRetentionRule": "hanzoai.cloud.models.o11y_o11y_retention_rule",
+    "O11yO11yRetentionSetIn": "hanzoai.cloud.models.o11y_o11y_retention_set_in",
+    "O11yO11yRetentionSetOut": "hanzoai.cloud.models.o11y_o11y_retention_set_out",
+    "O11yO11yRetry": "hanzoai.cloud.models.o11y_o11y_retry",
+    "O11yO11yRole": "hanzoai.cloud.models.o11y_o11y_role",
+    "O11yO11yRoleCreateIn": "hanzoai.cloud.models.o11y_o11y_role_create_in",
+    "O11yO11yRoleCreateOut": "hanzoai.cloud.models.o11y_o11y_role_create_out",
+    "O11yO11yRoleDetail": "hanzoai.cloud.models.o11y_o11y_role_detail",
+    "O11yO11yRoleID": "hanzoai.cloud.models.o11y_o11y_role_id",
+    "O11yO11yRoleMapping": "hanzoai.cloud.models.o11y_o11y_role_mapping",
+    "O11yO11yRoleOut": "hanzoai.cloud.models.o11y_o11y_role_out",
+    "O11yO11yRoleUpdateIn": "hanzoai.cloud.models.o11y_o11y_role_update_in",
+    "O11yO11yRolesOut": "hanzoai.cloud.models.o11y_o11y_roles_out",
+    "O11yO11yRotateSessionIn": "hanzoai.cloud.models.o11y_o11y_rotate_session_in",
+    "O11yO11yRoutePoliciesOut": "hanzoai.cloud.models.o11y_o11y_route_policies_out",
+    "O11yO11yRoutePolicyOut": "hanzoai.cloud.models.o11y_o11y_route_policy_out",
+    "O11yO11yRoutePolicyUpdateIn": "hanzoai.cloud.models.o11y_o11y_route_policy_update_in",
+    "O11yO11yRuleHistoryContributorsOut": "hanzoai.cloud.models.o11y_o11y_rule_history_contributors_out",
+    "O11yO11yRuleHistoryFilterKeysOut": "hanzoai.cloud.models.o11y_o11y_rule_history_filter_keys_out",
+    "O11yO11yRuleHistoryFilterValuesOut": "hanzoai.cloud.models.o11y_o11y_rule_history_filter_values_out",
+    "O11yO11yRuleHistoryOverallStatusOut": "hanzoai.cloud.models.o11y_o11y_rule_history_overall_status_out",
+    "O11yO11yRuleHistoryQueryIn": "hanzoai.cloud.models.o11y_o11y_rule_history_query_in",
+    "O11yO11yRuleHistoryStatsOut": "hanzoai.cloud.models.o11y_o11y_rule_history_stats_out",
+    "O11yO11yRuleHistoryTimelineOut": "hanzoai.cloud.models.o11y_o11y_rule_history_timeline_out",
+    "O11yO11yRuleOut": "hanzoai.cloud.models.o11y_o11y_rule_out",
+    "O11yO11yRuleStateContributorsOut": "hanzoai.cloud.models.o11y_o11y_rule_state_contributors_out",
+    "O11yO11yRuleStateTimelineOut": "hanzoai.cloud.models.o11y_o11y_rule_state_timeline_out",
+    "O11yO11yRuleStatsOut": "hanzoai.cloud.models.o11y_o11y_rule_stats_out",
+    "O11yO11yRulesOut": "hanzoai.cloud.models.o11y_o11y_rules_out",
+    "O11yO11ySAMLConfig": "hanzoai.cloud.models.o11y_o11y_saml_config",
+    "O11yO11ySavedViewCreateOut": "hanzoai.cloud.models.o11y_o11y_saved_view_create_out",
+    "O11yO11ySavedViewDeleteOut": "hanzoai.cloud.models.o11y_o11y_saved_view_delete_out",
+    "O11yO11ySavedViewListOut": "hanzoai.cloud.models.o11y_o11y_saved_view_list_out",
+    "O11yO11ySavedViewOut": "hanzoai.cloud.models.o11y_o11y_saved_view_out",
+    "O11yO11ySavedViewUpdateIn": "hanzoai.cloud.models.o11y_o11y_saved_view_update_in",
+    "O11yO11ySentryEventOut": "hanzoai.cloud.models.o11y_o11y_sentry_event_out",
+    "O11yO11ySentryIssueEventsOut": "hanzoai.cloud.models.o11y_o11y_sentry_issue_events_out",
+    "O11yO11ySentryPostableProject": "hanzoai.cloud.models.o11y_o11y_sentry_postable_project",
+    "O11yO11ySentryProject": "hanzoai.cloud.models.o11y_o11y_sentry_project",
+    "O11yO11ySentryProjectOut": "hanzoai.cloud.models.o11y_o11y_sentry_project_out",
+    "O11yO11ySentryProjects": "hanzoai.cloud.models.o11y_o11y_sentry_projects",
+    "O11yO11ySentryProjectsOut": "hanzoai.cloud.models.o11y_o11y_sentry_projects_out",
+    "O11yO11ySentryUpdateIssueIn": "hanzoai.cloud.models.o11y_o11y_sentry_update_issue_in",
+    "O11yO11yService": "hanzoai.cloud.models.o11y_o11y_service",
+    "O11yO11yServiceAccount": "hanzoai.cloud.models.o11y_o11y_service_account",
+    "O11yO11yServiceAccountCreateIn": "hanzoai.cloud.models.o11y_o11y_service_account_create_in",
+    "O11yO11yServiceAccountCreateOut": "hanzoai.cloud.models.o11y_o11y_service_account_create_out",
+    "O11yO11yServiceAccountDetail": "hanzoai.cloud.models.o11y_o11y_service_account_detail",
+    "O11yO11yServiceAccountOut": "hanzoai.cloud.models.o11y_o11y_service_account_out",
+    "O11yO11yServiceAccountRole": "hanzoai.cloud.models.o11y_o11y_service_account_role",
+    "O11yO11yServiceAccountRoleGrantIn": "hanzoai.cloud.models.o11y_o11y_service_account_role_grant_in",
+    "O11yO11yServiceAccountRolesOut": "hanzoai.cloud.models.o11y_o11y_service_account_roles_out",
+    "O11yO11yServiceAccountUpdateIn": "hanzoai.cloud.models.o11y_o11y_service_account_update_in",
+    "O11yO11yServiceAccountsOut": "hanzoai.cloud.models.o11y_o11y_service_accounts_out",
+    "O11yO11yServiceOut": "hanzoai.cloud.models.o11y_o11y_service_out",
+    "O11yO11yServiceTag": "hanzoai.cloud.models.o11y_o11y_service_tag",
+    "O11yO11yServiceWarning": "hanzoai.cloud.models.o11y_o11y_service_warning",
+    "O11yO11yServicesIn": "hanzoai.cloud.models.o11y_o11y_services_in",
+    "O11yO11yServicesMetadataOut": "hanzoai.cloud.models.o11y_o11y_services_metadata_out",
+    "O11yO11yServicesOut": "hanzoai.cloud.models.o11y_o11y_services_out",
+    "O11yO11ySessionContext": "hanzoai.cloud.models.o11y_o11y_session_context",
+    "O11yO11ySessionContextOut": "hanzoai.cloud.models.o11y_o11y_session_context_out",
+    "O11yO11ySessionOrg": "hanzoai.cloud.models.o11y_o11y_session_org",
+    "O11yO11ySetRoleIn": "hanzoai.cloud.models.o11y_o11y_set_role_in",
+    "O11yO11ySignalFilters": "hanzoai.cloud.models.o11y_o11y_signal_filters",
+    "O11yO11ySignalFiltersOut": "hanzoai.cloud.models.o11y_o11y_signal_filters_out",
+    "O11yO11ySpanMapperCreateIn": "hanzoai.cloud.models.o11y_o11y_span_mapper_create_in",
+    "O11yO11ySpanMapperGroupOut": "hanzoai.cloud.models.o11y_o11y_span_mapper_group_out",
+    "O11yO11ySpanMapperGroupUpdateIn": "hanzoai.cloud.models.o11y_o11y_span_mapper_group_update_in",
+    "O11yO11ySpanMapperGroupsOut": "hanzoai.cloud.models.o11y_o11y_span_mapper_groups_out",
+    "O11yO11ySpanMapperOut": "hanzoai.cloud.models.o11y_o11y_span_mapper_out",
+    "O11yO11ySpanMapperUpdateIn": "hanzoai.cloud.models.o11y_o11y_span_mapper_update_in",
+    "O11yO11ySpanMappersOut": "hanzoai.cloud.models.o11y_o11y_span_mappers_out",
+    "O11yO11ySpanPercentile": "hanzoai.cloud.models.o11y_o11y_span_percentile",
+    "O11yO11ySpanPercentileIn": "hanzoai.cloud.models.o11y_o11y_span_percentile_in",
+    "O11yO11ySpanPercentileOut": "hanzoai.cloud.models.o11y_o11y_span_percentile_out",
+    "O11yO11yStat": "hanzoai.cloud.models.o11y_o11y_stat",
+    "O11yO11yStatefulSetListOut": "hanzoai.cloud.models.o11y_o11y_stateful_set_list_out",
+    "O11yO11yStats": "hanzoai.cloud.models.o11y_o11y_stats",
+    "O11yO11yStatsOut": "hanzoai.cloud.models.o11y_o11y_stats_out",
+    "O11yO11ySubstituteVarsOut": "hanzoai.cloud.models.o11y_o11y_substitute_vars_out",
+    "O11yO11yTable": "hanzoai.cloud.models.o11y_o11y_table",
+    "O11yO11yTagFilter": "hanzoai.cloud.models.o11y_o11y_tag_filter",
+    "O11yO11yTagQuery": "hanzoai.cloud.models.o11y_o11y_tag_query",
+    "O11yO11yTelemetryField": "hanzoai.cloud.models.o11y_o11y_telemetry_field",
+    "O11yO11yTestNotificationOut": "hanzoai.cloud.models.o11y_o11y_test_notification_out",
+    "O11yO11yTestNotificationResult": "hanzoai.cloud.models.o11y_o11y_test_notification_result",
+    "O11yO11yTestRuleOut": "hanzoai.cloud.models.o11y_o11y_test_rule_out",
+    "O11yO11yToggle": "hanzoai.cloud.models.o11y_o11y_toggle",
+    "O11yO11yToken": "hanzoai.cloud.models.o11y_o11y_token",
+    "O11yO11yTokenOut": "hanzoai.cloud.models.o11y_o11y_token_out",
+    "O11yO11yTopLevelOpsIn": "hanzoai.cloud.models.o11y_o11y_top_level_ops_in",
+    "O11yO11yTrace": "hanzoai.cloud.models.o11y_o11y_trace",
+    "O11yO11yTraceAggregationsIn": "hanzoai.cloud.models.o11y_o11y_trace_aggregations_in",
+    "O11yO11yTraceAggregationsOut": "hanzoai.cloud.models.o11y_o11y_trace_aggregations_out",
+    "O11yO11yTraceDetail": "hanzoai.cloud.models.o11y_o11y_trace_detail",
+    "O11yO11yTraceFlamegraphIn": "hanzoai.cloud.models.o11y_o11y_trace_flamegraph_in",
+    "O11yO11yTraceFlamegraphOut": "hanzoai.cloud.models.o11y_o11y_trace_flamegraph_out",
+    "O11yO11yTraceOut": "hanzoai.cloud.models.o11y_o11y_trace_out",
+    "O11yO11yTraceSpanWindow": "hanzoai.cloud.models.o11y_o11y_trace_span_window",
+    "O11yO11yTraceWaterfallIn": "hanzoai.cloud.models.o11y_o11y_trace_waterfall_in",
+    "O11yO11yTraceWaterfallOut": "hanzoai.cloud.models.o11y_o11y_trace_waterfall_out",
+    "O11yO11yTraces": "hanzoai.cloud.models.o11y_o11y_traces",
+    "O11yO11yTracesOut": "hanzoai.cloud.models.o11y_o11y_traces_out",
+    "O11yO11yTransaction": "hanzoai.cloud.models.o11y_o11y_transaction",
+    "O11yO11yTransactionGroup": "hanzoai.cloud.models.o11y_o11y_transaction_group",
+    "O11yO11yTransactionResult": "hanzoai.cloud.models.o11y_o11y_transaction_result",
+    "O11yO11yTreemapEntry": "hanzoai.cloud.models.o11y_o11y_treemap_entry",
+    "O11yO11yUpdatableAuthDomain": "hanzoai.cloud.models.o11y_o11y_updatable_auth_domain",
+    "O11yO11yUpdatablePreference": "hanzoai.cloud.models.o11y_o11y_updatable_preference",
+    "O11yO11yUpdatableQuickFilters": "hanzoai.cloud.models.o11y_o11y_updatable_quick_filters",
+    "O11yO11yUpdatableUser": "hanzoai.cloud.models.o11y_o11y_updatable_user",
+    "O11yO11yUpdateAccountIn": "hanzoai.cloud.models.o11y_o11y_update_account_in",
+    "O11yO11yUpdateIngestionKeyIn": "hanzoai.cloud.models.o11y_o11y_update_ingestion_key_in",
+    "O11yO11yUpdateLimitIn": "hanzoai.cloud.models.o11y_o11y_update_limit_in",
+    "O11yO11yUpdateServiceIn": "hanzoai.cloud.models.o11y_o11y_update_service_in",
+    "O11yO11yUsageItem": "hanzoai.cloud.models.o11y_o11y_usage_item",
+    "O11yO11yUser": "hanzoai.cloud.models.o11y_o11y_user",
+    "O11yO11yUserRole": "hanzoai.cloud.models.o11y_o11y_user_role",
+    "O11yO11yUserUpdate": "hanzoai.cloud.models.o11y_o11y_user_update",
+    "O11yO11yUserWithRoles": "hanzoai.cloud.models.o11y_o11y_user_with_roles",
+    "O11yO11yUserWithRolesOut": "hanzoai.cloud.models.o11y_o11y_user_with_roles_out",
+    "O11yO11yUsersOut": "hanzoai.cloud.models.o11y_o11y_users_out",
+    "O11yO11yVersionOut": "hanzoai.cloud.models.o11y_o11y_version_out",
+    "O11yO11yWidgetQueryRange": "hanzoai.cloud.models.o11y_o11y_widget_query_range",
+    "O11yO11yWidgetQueryRangeOut": "hanzoai.cloud.models.o11y_o11y_widget_query_range_out",
+    "O11yOAuth2": "hanzoai.cloud.models.o11y_o_auth2",
+    "O11yOldAWSCollectionStrategy": "hanzoai.cloud.models.o11y_old_aws_collection_strategy",
+    "O11yOldAWSLogsStrategy": "hanzoai.cloud.models.o11y_old_aws_logs_strategy",
+    "O11yOldAWSLogsStrategyCloudwatchLogsSubscriptionsInner": "hanzoai.cloud.models.o11y_old_aws_logs_strategy_cloudwatch_logs_subscriptions_inner",
+    "O11yOldAWSMetricsStrategy": "hanzoai.cloud.models.o11y_old_aws_metrics_strategy",
+    "O11yOldAWSMetricsStrategyCloudwatchMetricStreamFiltersInner": "hanzoai.cloud.models.o11y_old_aws_metrics_strategy_cloudwatch_metric_stream_filters_inner",
+    "O11yOpsGenieConfig": "hanzoai.cloud.models.o11y_ops_genie_config",
+    "O11yOpsGenieConfigResponder": "hanzoai.cloud.models.o11y_ops_genie_config_responder",
+    "O11yOrderBy": "hanzoai.cloud.models.o11y_order_by",
+    "O11yOrderByKey": "hanzoai.cloud.models.o11y_order_by_key",
+    "O11yOtelSpanRef": "hanzoai.cloud.models.o11y_otel_span_ref",
+    "O11yPagerdutyConfig": "hanzoai.cloud.models.o11y_pagerduty_config",
+    "O11yPagerdutyImage": "hanzoai.cloud.models.o11y_pagerduty_image",
+    "O11yPagerdutyLink": "hanzoai.cloud.models.o11y_pagerduty_link",
+    "O11yPagination": "hanzoai.cloud.models.o11y_pagination",
+    "O11yPodCountByPhase": "hanzoai.cloud.models.o11y_pod_count_by_phase",
+    "O11yPodCountsByPhase": "hanzoai.cloud.models.o11y_pod_counts_by_phase",
+    "O11yPodListRecord": "hanzoai.cloud.models.o11y_pod_list_record",
+    "O11yPodListRequest": "hanzoai.cloud.models.o11y_pod_list_request",
+    "O11yPodListResponse": "hanzoai.cloud.models.o11y_pod_list_response",
+    "O11yPodRecord": "hanzoai.cloud.models.o11y_pod_record",
+    "O11yPods": "hanzoai.cloud.models.o11y_pods",
+    "O11yPoint": "hanzoai.cloud.models.o11y_point",
+    "O11yPostableAccountConfig": "hanzoai.cloud.models.o11y_postable_account_config",
+    "O11yPostableChannel": "hanzoai.cloud.models.o11y_postable_channel",
+    "O11yPostableClusters": "hanzoai.cloud.models.o11y_postable_clusters",
+    "O11yPostableDaemonSets": "hanzoai.cloud.models.o11y_postable_daemon_sets",
+    "O11yPostableDeployments": "hanzoai.cloud.models.o11y_postable_deployments",
+    "O11yPostableHost": "hanzoai.cloud.models.o11y_postable_host",
+    "O11yPostableHosts": "hanzoai.cloud.models.o11y_postable_hosts",
+    "O11yPostableIngestionKey": "hanzoai.cloud.models.o11y_postable_ingestion_key",
+    "O11yPostableJobs": "hanzoai.cloud.models.o11y_postable_jobs",
+    "O11yPostableNamespaces": "hanzoai.cloud.models.o11y_postable_namespaces",
+    "O11yPostableNodes": "hanzoai.cloud.models.o11y_postable_nodes",
+    "O11yPostablePipeline": "hanzoai.cloud.models.o11y_postable_pipeline",
+    "O11yPostablePlannedMaintenance": "hanzoai.cloud.models.o11y_postable_planned_maintenance",
+    "O11yPostablePods": "hanzoai.cloud.models.o11y_postable_pods",
+    "O11yPostableProfile": "hanzoai.cloud.models.o11y_postable_profile",
+    "O11yPostableRoutePolicy": "hanzoai.cloud.models.o11y_postable_route_policy",
+    "O11yPostableSpanMapperGroup": "hanzoai.cloud.models.o11y_postable_span_mapper_group",
+    "O11yPostableStatefulSets": "hanzoai.cloud.models.o11y_postable_stateful_sets",
+    "O11yPostableVolumes": "hanzoai.cloud.models.o11y_postable_volumes",
+    "O11yProcessListRecord": "hanzoai.cloud.models.o11y_process_list_record",
+    "O11yProcessListRequest": "hanzoai.cloud.models.o11y_process_list_request",
+    "O11yProcessListResponse": "hanzoai.cloud.models.o11y_process_list_response",
+    "O11yPromQuery": "hanzoai.cloud.models.o11y_prom_query",
+    "O11yProviderIntegrationConfig": "hanzoai.cloud.models.o11y_provider_integration_config",
+    "O11yPushoverConfig": "hanzoai.cloud.models.o11y_pushover_config",
+    "O11yQueryEnvelope": "hanzoai.cloud.models.o11y_query_envelope",
+    "O11yQueryRangeParamsV3": "hanzoai.cloud.models.o11y_query_range_params_v3",
+    "O11yQueryRangeRequest": "hanzoai.cloud.models.o11y_query_range_request",
+    "O11yQueryWarnData": "hanzoai.cloud.models.o11y_query_warn_data",
+    "O11yQueryWarnDataAdditional": "hanzoai.cloud.models.o11y_query_warn_data_additional",
+    "O11yQuerybuildertypesv5CompositeQuery": "hanzoai.cloud.models.o11y_querybuildertypesv5_composite_query",
+    "O11yQuerybuildertypesv5OrderBy": "hanzoai.cloud.models.o11y_querybuildertypesv5_order_by",
+    "O11yReceiver": "hanzoai.cloud.models.o11y_receiver",
+    "O11yReleStateItem": "hanzoai.cloud.models.o11y_rele_state_item",
+    "O11yRocketchatAttachmentAction": "hanzoai.cloud.models.o11y_rocketchat_attachment_action",
+    "O11yRocketchatAttachmentField": "hanzoai.cloud.models.o11y_rocketchat_attachment_field",
+    "O11yRocketchatConfig": "hanzoai.cloud.models.o11y_rocketchat_config",
+    "O11yRuleStateHistory": "hanzoai.cloud.models.o11y_rule_state_history",
+    "O11yRuleStateHistoryContributor": "hanzoai.cloud.models.o11y_rule_state_history_contributor",
+    "O11yRuleStateTimeline": "hanzoai.cloud.models.o11y_rule_state_timeline",
+    "O11ySNSConfig": "hanzoai.cloud.models.o11y_sns_config",
+    "O11ySavedView": "hanzoai.cloud.models.o11y_saved_view",
+    "O11ySeries": "hanzoai.cloud.models.o11y_series",
+    "O11yService": "hanzoai.cloud.models.o11y_service",
+    "O11yServiceAssets": "hanzoai.cloud.models.o11y_service_assets",
+    "O11yServiceConfig": "hanzoai.cloud.models.o11y_service_config",
+    "O11yServiceDashboard": "hanzoai.cloud.models.o11y_service_dashboard",
+    "O11yServiceMetadata": "hanzoai.cloud.models.o11y_service_metadata",
+    "O11yServiceUp": "hanzoai.cloud.models.o11y_service_up",
+    "O11ySigV4Config": "hanzoai.cloud.models.o11y_sig_v4_config",
+    "O11ySignalConnectionStatus": "hanzoai.cloud.models.o11y_signal_connection_status",
+    "O11ySlackAction": "hanzoai.cloud.models.o11y_slack_action",
+    "O11ySlackConfig": "hanzoai.cloud.models.o11y_slack_config",
+    "O11ySlackConfirmationField": "hanzoai.cloud.models.o11y_slack_confirmation_field",
+    "O11ySlackField": "hanzoai.cloud.models.o11y_slack_field",
+    "O11ySpanAggregation": "hanzoai.cloud.models.o11y_span_aggregation",
+    "O11ySpanAggregationResult": "hanzoai.cloud.models.o11y_span_aggregation_result",
+    "O11ySpanMapper": "hanzoai.cloud.models.o11y_span_mapper",
+    "O11ySpanMapperConfig": "hanzoai.cloud.models.o11y_span_mapper_config",
+    "O11ySpanMapperGroup": "hanzoai.cloud.models.o11y_span_mapper_group",
+    "O11ySpanMapperGroupCondition": "hanzoai.cloud.models.o11y_span_mapper_group_condition",
+    "O11ySpanMapperSource": "hanzoai.cloud.models.o11y_span_mapper_source",
+    "O11yStatefulSetListRecord": "hanzoai.cloud.models.o11y_stateful_set_list_record",
+    "O11yStatefulSetListRequest": "hanzoai.cloud.models.o11y_stateful_set_list_request",
+    "O11yStatefulSetListResponse": "hanzoai.cloud.models.o11y_stateful_set_list_response",
+    "O11yStatefulSetRecord": "hanzoai.cloud.models.o11y_stateful_set_record",
+    "O11yStatefulSets": "hanzoai.cloud.models.o11y_stateful_sets",
+    "O11yStats": "hanzoai.cloud.models.o11y_stats",
+    "O11yStatusComponent": "hanzoai.cloud.models.o11y_status_component",
+    "O11yStatusIncident": "hanzoai.cloud.models.o11y_status_incident",
+    "O11yStatusMaintenance": "hanzoai.cloud.models.o11y_status_maintenance",
+    "O11yStatusResult": "hanzoai.cloud.models.o11y_status_result",
+    "O11yStatusSummary": "hanzoai.cloud.models.o11y_status_summary",
+    "O11yStorableFunnel": "hanzoai.cloud.models.o11y_storable_funnel",
+    "O11yStorableIntegrationDashboard": "hanzoai.cloud.models.o11y_storable_integration_dashboard",
+    "O11ySupportedSignals": "hanzoai.cloud.models.o11y_supported_signals",
+    "O11yTLSConfig": "hanzoai.cloud.models.o11y_tls_config",
+    "O11yTelegramConfig": "hanzoai.cloud.models.o11y_telegram_config",
+    "O11yTelemetryFieldKey": "hanzoai.cloud.models.o11y_telemetry_field_key",
+    "O11yTelemetryFieldValues": "hanzoai.cloud.models.o11y_telemetry_field_values",
+    "O11yThreadingConfig": "hanzoai.cloud.models.o11y_threading_config",
+    "O11yTimeSeries": "hanzoai.cloud.models.o11y_time_series",
+    "O11yTraceRow": "hanzoai.cloud.models.o11y_trace_row",
+    "O11yTracesOut": "hanzoai.cloud.models.o11y_traces_out",
+    "O11yUninstallIntegrationRequest": "hanzoai.cloud.models.o11y_uninstall_integration_request",
+    "O11yUpdatableAccountConfig": "hanzoai.cloud.models.o11y_updatable_account_config",
+    "O11yUpdatableAzureAccountConfig": "hanzoai.cloud.models.o11y_updatable_azure_account_config",
+    "O11yUpdatableGCPAccountConfig": "hanzoai.cloud.models.o11y_updatable_gcp_account_config",
+    "O11yUpdateItemIn": "hanzoai.cloud.models.o11y_update_item_in",
+    "O11yUpdateQueueIn": "hanzoai.cloud.models.o11y_update_queue_in",
+    "O11yUsageBucket": "hanzoai.cloud.models.o11y_usage_bucket",
+    "O11yUser": "hanzoai.cloud.models.o11y_user",
+    "O11yVariableItem": "hanzoai.cloud.models.o11y_variable_item",
+    "O11yVictorOpsConfig": "hanzoai.cloud.models.o11y_victor_ops_config",
+    "O11yVolumeListRecord": "hanzoai.cloud.models.o11y_volume_list_record",
+    "O11yVolumeListRequest": "hanzoai.cloud.models.o11y_volume_list_request",
+    "O11yVolumeListResponse": "hanzoai.cloud.models.o11y_volume_list_response",
+    "O11yVolumeRecord": "hanzoai.cloud.models.o11y_volume_record",
+    "O11yVolumes": "hanzoai.cloud.models.o11y_volumes",
+    "O11yWaterfallSpan": "hanzoai.cloud.models.o11y_waterfall_span",
+    "O11yWebexConfig": "hanzoai.cloud.models.o11y_webex_config",
+    "O11yWebhookConfig": "hanzoai.cloud.models.o11y_webhook_config",
+    "O11yWechatConfig": "hanzoai.cloud.models.o11y_wechat_config",
+    "OauthBundleIn": "hanzoai.cloud.models.oauth_bundle_in",
+    "ObjectItem": "hanzoai.cloud.models.object_item",
+    "ObjectList": "hanzoai.cloud.models.object_list",
+    "Obligation": "hanzoai.cloud.models.obligation",
+    "Offer": "hanzoai.cloud.models.offer",
+    "OnboardReq": "hanzoai.cloud.models.onboard_req",
+    "OnboardResp": "hanzoai.cloud.models.onboard_resp",
+    "Op": "hanzoai.cloud.models.op",
+    "OpenReq": "hanzoai.cloud.models.open_req",
+    "OppList": "hanzoai.cloud.models.opp_list",
+    "OppReq": "hanzoai.cloud.models.opp_req",
+    "Opportunity": "hanzoai.cloud.models.opportunity",
+    "OptinView": "hanzoai.cloud.models.optin_view",
+    "OracleView": "hanzoai.cloud.models.oracle_view",
+    "OraclesOut": "hanzoai.cloud.models.oracles_out",
+    "Order": "hanzoai.cloud.models.order",
+    "OrgEarningView": "hanzoai.cloud.models.org_earning_view",
+    "OrgOptinReq": "hanzoai.cloud.models.org_optin_req",
+    "OrgOptinView": "hanzoai.cloud.models.org_optin_view",
+    "OrgView": "hanzoai.cloud.models.org_view",
+    "Outcome": "hanzoai.cloud.models.outcome",
+    "Overview": "hanzoai.cloud.models.overview",
+    "OverviewView": "hanzoai.cloud.models.overview_view",
+    "Page": "hanzoai.cloud.models.page",
+    "PagesBuildConfig": "hanzoai.cloud.models.pages_build_config",
+    "PagesD1Binding": "hanzoai.cloud.models.pages_d1_binding",
+    "PagesDeploy": "hanzoai.cloud.models.pages_deploy",
+    "PagesDeploymentConfig": "hanzoai.cloud.models.pages_deployment_config",
+    "PagesDeploymentConfigs": "hanzoai.cloud.models.pages_deployment_configs",
+    "PagesEnvVar": "hanzoai.cloud.models.pages_env_var",
+    "PagesKVBinding": "hanzoai.cloud.models.pages_kv_binding",
+    "PagesProjectCreate": "hanzoai.cloud.models.pages_project_create",
+    "PagesR2Binding": "hanzoai.cloud.models.pages_r2_binding",
+    "Pairing": "hanzoai.cloud.models.pairing",
+    "PairingApproved": "hanzoai.cloud.models.pairing_approved",
+    "PairingQueue": "hanzoai.cloud.models.pairing_queue",
+    "PairingView": "hanzoai.cloud.models.pairing_view",
+    "PatchApplicationIn": "hanzoai.cloud.models.patch_application_in",
+    "PatchFlowIn": "hanzoai.cloud.models.patch_flow_in",
+    "PatchIn": "hanzoai.cloud.models.patch_in",
+    "PatchSessionIn": "hanzoai.cloud.models.patch_session_in",
+    "PatchSyncIn": "hanzoai.cloud.models.patch_sync_in",
+    "PatchTargetIn": "hanzoai.cloud.models.patch_target_in",
+    "PathIn": "hanzoai.cloud.models.path_in",
+    "PaymentConfig": "hanzoai.cloud.models.payment_config",
+    "PaymentIn": "hanzoai.cloud.models.payment_in",
+    "PaymentOut": "hanzoai.cloud.models.payment_out",
+    "PaymentRecord": "hanzoai.cloud.models.payment_record",
+    "Payout": "hanzoai.cloud.models.payout",
+    "PeriodEarningView": "hanzoai.cloud.models.period_earning_view",
+    "PickOut": "hanzoai.cloud.models.pick_out",
+    "PipelineBoard": "hanzoai.cloud.models.pipeline_board",
+    "PipelineReq": "hanzoai.cloud.models.pipeline_req",
+    "PipelineRow": "hanzoai.cloud.models.pipeline_row",
+    "PipelineView": "hanzoai.cloud.models.pipeline_view",
+    "PlanEntitlements": "hanzoai.cloud.models.plan_entitlements",
+    "PlanHealth": "hanzoai.cloud.models.plan_health",
+    "PlanInfo": "hanzoai.cloud.models.plan_info",
+    "PlanList": "hanzoai.cloud.models.plan_list",
+    "PlanRegionList": "hanzoai.cloud.models.plan_region_list",
+    "PlanResolution": "hanzoai.cloud.models.plan_resolution",
+    "PlanSchemas": "hanzoai.cloud.models.plan_schemas",
+    "PlanTierList": "hanzoai.cloud.models.plan_tier_list",
+    "PlanToolList": "hanzoai.cloud.models.plan_tool_list",
+    "PlanVocab": "hanzoai.cloud.models.plan_vocab",
+    "PluginDeleted": "hanzoai.cloud.models.plugin_deleted",
+    "PluginMount": "hanzoai.cloud.models.plugin_mount",
+    "PluginMountList": "hanzoai.cloud.models.plugin_mount_list",
+    "PnL": "hanzoai.cloud.models.pn_l",
+    "PnLLine": "hanzoai.cloud.models.pn_l_line",
+    "PointView": "hanzoai.cloud.models.point_view",
+    "Policy": "hanzoai.cloud.models.policy",
+    "PolicyList": "hanzoai.cloud.models.policy_list",
+    "PoolCreate": "hanzoai.cloud.models.pool_create",
+    "PoolScale": "hanzoai.cloud.models.pool_scale",
+    "PopulatedFlow": "hanzoai.cloud.models.populated_flow",
+    "Position": "hanzoai.cloud.models.position",
+    "PostEventRequest": "hanzoai.cloud.models.post_event_request",
+    "PostIndexIndexesByUidDocumentsDeleteBatchRequest": "hanzoai.cloud.models.post_index_indexes_by_uid_documents_delete_batch_request",
+    "PostList": "hanzoai.cloud.models.post_list",
+    "PrefsView": "hanzoai.cloud.models.prefs_view",
+    "Preset": "hanzoai.cloud.models.preset",
+    "PresetAccepted": "hanzoai.cloud.models.preset_accepted",
+    "PresetList": "hanzoai.cloud.models.preset_list",
+    "PresignResponse": "hanzoai.cloud.models.presign_response",
+    "PreviewReq": "hanzoai.cloud.models.preview_req",
+    "PreviewView": "hanzoai.cloud.models.preview_view",
+    "Price": "hanzoai.cloud.models.price",
+    "PricingHealth": "hanzoai.cloud.models.pricing_health",
+    "PricingModelList": "hanzoai.cloud.models.pricing_model_list",
+    "PricingPlanList": "hanzoai.cloud.models.pricing_plan_list",
+    "PricingPresetList": "hanzoai.cloud.models.pricing_preset_list",
+    "PricingProviderList": "hanzoai.cloud.models.pricing_provider_list",
+    "PricingRegionList": "hanzoai.cloud.models.pricing_region_list",
+    "PricingSyncOut": "hanzoai.cloud.models.pricing_sync_out",
+    "PricingTierList": "hanzoai.cloud.models.pricing_tier_list",
+    "PricingToolList": "hanzoai.cloud.models.pricing_tool_list",
+    "Principle": "hanzoai.cloud.models.principle",
+    "ProductEvent": "hanzoai.cloud.models.product_event",
+    "ProductRow": "hanzoai.cloud.models.product_row",
+    "ProfileMetrics": "hanzoai.cloud.models.profile_metrics",
+    "ProfileResponse": "hanzoai.cloud.models.profile_response",
+    "ProgramApplication": "hanzoai.cloud.models.program_application",
+    "ProgressView": "hanzoai.cloud.models.progress_view",
+    "ProjectView": "hanzoai.cloud.models.project_view",
+    "ProjectionView": "hanzoai.cloud.models.projection_view",
+    "ProjectsBoundDomains": "hanzoai.cloud.models.projects_bound_domains",
+    "ProjectsBuildSite": "hanzoai.cloud.models.projects_build_site",
+    "ProjectsComplete": "hanzoai.cloud.models.projects_complete",
+    "ProjectsCreate": "hanzoai.cloud.models.projects_create",
+    "ProjectsCreateRepo": "hanzoai.cloud.models.projects_create_repo",
+    "ProjectsDeploySite": "hanzoai.cloud.models.projects_deploy_site",
+    "ProjectsDeployStart": "hanzoai.cloud.models.projects_deploy_start",
+    "ProjectsDeployment": "hanzoai.cloud.models.projects_deployment",
+    "ProjectsDomain": "hanzoai.cloud.models.projects_domain",
+    "ProjectsDomains": "hanzoai.cloud.models.projects_domains",
+    "ProjectsDomainsBind": "hanzoai.cloud.models.projects_domains_bind",
+    "ProjectsFile": "hanzoai.cloud.models.projects_file",
+    "ProjectsFork": "hanzoai.cloud.models.projects_fork",
+    "ProjectsProject": "hanzoai.cloud.models.projects_project",
+    "ProjectsPublish": "hanzoai.cloud.models.projects_publish",
+    "ProjectsRelease": "hanzoai.cloud.models.projects_release",
+    "ProjectsRepo": "hanzoai.cloud.models.projects_repo",
+    "ProjectsSite": "hanzoai.cloud.models.projects_site",
+    "ProjectsSiteDeploy": "hanzoai.cloud.models.projects_site_deploy",
+    "ProjectsUpdate": "hanzoai.cloud.models.projects_update",
+    "ProjectsUpdateRepo": "hanzoai.cloud.models.projects_update_repo",
+    "ProjectsUploadGrant": "hanzoai.cloud.models.projects_upload_grant",
+    "Promo": "hanzoai.cloud.models.promo",
+    "PromoList": "hanzoai.cloud.models.promo_list",
+    "PromoStatus": "hanzoai.cloud.models.promo_status",
+    "PromoteReq": "hanzoai.cloud.models.promote_req",
+    "PromptDetail": "hanzoai.cloud.models.prompt_detail",
+    "PromptList": "hanzoai.cloud.models.prompt_list",
+    "PromptMeta": "hanzoai.cloud.models.prompt_meta",
+    "PromptReq": "hanzoai.cloud.models.prompt_req",
+    "PropSpec": "hanzoai.cloud.models.prop_spec",
+    "ProviderBreakdown": "hanzoai.cloud.models.provider_breakdown",
+    "ProviderInfo": "hanzoai.cloud.models.provider_info",
+    "ProviderRow": "hanzoai.cloud.models.provider_row",
+    "ProviderView": "hanzoai.cloud.models.provider_view",
+    "ProvisionRequest": "hanzoai.cloud.models.provision_request",
+    "ProvisionResult": "hanzoai.cloud.models.provision_result",
+    "ProvisionedResource": "hanzoai.cloud.models.provisioned_resource",
+    "ProvisionedSummary": "hanzoai.cloud.models.provisioned_summary",
+    "PublishInput": "hanzoai.cloud.models.publish_input",
+    "PublishKitIn": "hanzoai.cloud.models.publish_kit_in",
+    "PublishReq": "hanzoai.cloud.models.publish_req",
+    "PublishResult": "hanzoai.cloud.models.publish_result",
+    "PublishedClaim": "hanzoai.cloud.models.published_claim",
+    "PullList": "hanzoai.cloud.models.pull_list",
+    "PullView": "hanzoai.cloud.models.pull_view",
+    "Purge": "hanzoai.cloud.models.purge",
+    "PurgeIn": "hanzoai.cloud.models.purge_in",
+    "PurgeOut": "hanzoai.cloud.models.purge_out",
+    "Push": "hanzoai.cloud.models.push",
+    "PushFile": "hanzoai.cloud.models.push_file",
+    "PushPusher": "hanzoai.cloud.models.push_pusher",
+    "PushRepository": "hanzoai.cloud.models.push_repository",
+    "PushReq": "hanzoai.cloud.models.push_req",
+    "PushResp": "hanzoai.cloud.models.push_resp",
+    "PutClaimsIn": "hanzoai.cloud.models.put_claims_in",
+    "PutClaimsOut": "hanzoai.cloud.models.put_claims_out",
+    "Query": "hanzoai.cloud.models.query",
+    "Question": "hanzoai.cloud.models.question",
+    "QuestionsResponse": "hanzoai.cloud.models.questions_response",
+    "Quote": "hanzoai.cloud.models.quote",
+    "QuoteList": "hanzoai.cloud.models.quote_list",
+    "RaiseIn": "hanzoai.cloud.models.raise_in",
+    "Ran": "hanzoai.cloud.models.ran",
+    "Range": "hanzoai.cloud.models.range",
+    "RateCard": "hanzoai.cloud.models.rate_card",
+    "Reachability": "hanzoai.cloud.models.reachability",
+    "ReadOut": "hanzoai.cloud.models.read_out",
+    "Readiness": "hanzoai.cloud.models.readiness",
+    "ReadingReq": "hanzoai.cloud.models.reading_req",
+    "ReadingView": "hanzoai.cloud.models.reading_view",
+    "ReadmeJSON": "hanzoai.cloud.models.readme_json",
+    "Receipt": "hanzoai.cloud.models.receipt",
+    "Record": "hanzoai.cloud.models.record",
+    "RecordList": "hanzoai.cloud.models.record_list",
+    "RedeemInput": "hanzoai.cloud.models.redeem_input",
+    "RedeemResult": "hanzoai.cloud.models.redeem_result",
+    "Redemption": "hanzoai.cloud.models.redemption",
+    "RefJSON": "hanzoai.cloud.models.ref_json",
+    "ReferenceAnswer": "hanzoai.cloud.models.reference_answer",
+    "ReferenceOut": "hanzoai.cloud.models.reference_out",
+    "ReferenceOverride": "hanzoai.cloud.models.reference_override",
+    "ReferenceOverrideIn": "hanzoai.cloud.models.reference_override_in",
+    "ReferenceReceipt": "hanzoai.cloud.models.reference_receipt",
+    "ReferenceSet": "hanzoai.cloud.models.reference_set",
+    "ReferenceSetsOut": "hanzoai.cloud.models.reference_sets_out",
+    "ReferenceSource": "hanzoai.cloud.models.reference_source",
+    "ReferenceTaken": "hanzoai.cloud.models.reference_taken",
+    "ReferenceVersion": "hanzoai.cloud.models.reference_version",
+    "RefreshOut": "hanzoai.cloud.models.refresh_out",
+    "RefreshReferenceIn": "hanzoai.cloud.models.refresh_reference_in",
+    "RefreshReferenceOut": "hanzoai.cloud.models.refresh_reference_out",
+    "RefsJSON": "hanzoai.cloud.models.refs_json",
+    "RegisterCounts": "hanzoai.cloud.models.register_counts",
+    "RegisterKeyReq": "hanzoai.cloud.models.register_key_req",
+    "RegisterPage": "hanzoai.cloud.models.register_page",
+    "RegisterReq": "hanzoai.cloud.models.register_req",
+    "RegisterResult": "hanzoai.cloud.models.register_result",
+    "Registrant": "hanzoai.cloud.models.registrant",
+    "Registration": "hanzoai.cloud.models.registration",
+    "RegistrationView": "hanzoai.cloud.models.registration_view",
+    "RegistryImage": "hanzoai.cloud.models.registry_image",
+    "RegistryImageList": "hanzoai.cloud.models.registry_image_list",
+    "RegistryMint": "hanzoai.cloud.models.registry_mint",
+    "RegistryPackage": "hanzoai.cloud.models.registry_package",
+    "RegistryPackageList": "hanzoai.cloud.models.registry_package_list",
+    "RegistryProject": "hanzoai.cloud.models.registry_project",
+    "RegistryProjectList": "hanzoai.cloud.models.registry_project_list",
+    "RegistryStatus": "hanzoai.cloud.models.registry_status",
+    "RegistryTagList": "hanzoai.cloud.models.registry_tag_list",
+    "RegistryToken": "hanzoai.cloud.models.registry_token",
+    "ReleaseBoard": "hanzoai.cloud.models.release_board",
+    "ReleaseRow": "hanzoai.cloud.models.release_row",
+    "Remittance": "hanzoai.cloud.models.remittance",
+    "RenewReq": "hanzoai.cloud.models.renew_req",
+    "RenewResult": "hanzoai.cloud.models.renew_result",
+    "ReplaceKitIn": "hanzoai.cloud.models.replace_kit_in",
+    "ReplayBody": "hanzoai.cloud.models.replay_body",
+    "RepoList": "hanzoai.cloud.models.repo_list",
+    "RepoTree": "hanzoai.cloud.models.repo_tree",
+    "RepoView": "hanzoai.cloud.models.repo_view",
+    "Report": "hanzoai.cloud.models.report",
+    "ReportOut": "hanzoai.cloud.models.report_out",
+    "ReportReq": "hanzoai.cloud.models.report_req",
+    "ReportResp": "hanzoai.cloud.models.report_resp",
+    "ReportRunIn": "hanzoai.cloud.models.report_run_in",
+    "Request": "hanzoai.cloud.models.request",
+    "ResolveReferenceIn": "hanzoai.cloud.models.resolve_reference_in",
+    "ResolveReferenceOut": "hanzoai.cloud.models.resolve_reference_out",
+    "ResourceUsage": "hanzoai.cloud.models.resource_usage",
+    "Response": "hanzoai.cloud.models.response",
+    "Responsible": "hanzoai.cloud.models.responsible",
+    "RestartRef": "hanzoai.cloud.models.restart_ref",
+    "Restarted": "hanzoai.cloud.models.restarted",
+    "ReviewQueue": "hanzoai.cloud.models.review_queue",
+    "ReviewRequest": "hanzoai.cloud.models.review_request",
+    "RevokeResp": "hanzoai.cloud.models.revoke_resp",
+    "RevokedKey": "hanzoai.cloud.models.revoked_key",
+    "RiskAdoptIn": "hanzoai.cloud.models.risk_adopt_in",
+    "RiskAggregates": "hanzoai.cloud.models.risk_aggregates",
+    "RiskAppetiteIn": "hanzoai.cloud.models.risk_appetite_in",
+    "RiskBand": "hanzoai.cloud.models.risk_band",
+    "RiskCatalog": "hanzoai.cloud.models.risk_catalog",
+    "RiskCause": "hanzoai.cloud.models.risk_cause",
+    "RiskDataset": "hanzoai.cloud.models.risk_dataset",
+    "RiskDatasetDisposal": "hanzoai.cloud.models.risk_dataset_disposal",
+    "RiskDatasetList": "hanzoai.cloud.models.risk_dataset_list",
+    "RiskDatasetRow": "hanzoai.cloud.models.risk_dataset_row",
+    "RiskDatasetRows": "hanzoai.cloud.models.risk_dataset_rows",
+    "RiskDatasetSpec": "hanzoai.cloud.models.risk_dataset_spec",
+    "RiskDatasetVersions": "hanzoai.cloud.models.risk_dataset_versions",
+    "RiskDisposeIn": "hanzoai.cloud.models.risk_dispose_in",
+    "RiskDisposeOut": "hanzoai.cloud.models.risk_dispose_out",
+    "RiskEvent": "hanzoai.cloud.models.risk_event",
+    "RiskHoldIn": "hanzoai.cloud.models.risk_hold_in",
+    "RiskHoldOut": "hanzoai.cloud.models.risk_hold_out",
+    "RiskLabelCoverage": "hanzoai.cloud.models.risk_label_coverage",
+    "RiskLabelEvent": "hanzoai.cloud.models.risk_label_event",
+    "RiskLabelFact": "hanzoai.cloud.models.risk_label_fact",
+    "RiskLabelIn": "hanzoai.cloud.models.risk_label_in",
+    "RiskLabelOut": "hanzoai.cloud.models.risk_label_out",
+    "RiskLabelRecord": "hanzoai.cloud.models.risk_label_record",
+    "RiskLabelResult": "hanzoai.cloud.models.risk_label_result",
+    "RiskLabelVocabulary": "hanzoai.cloud.models.risk_label_vocabulary",
+    "RiskLabelsOut": "hanzoai.cloud.models.risk_labels_out",
+    "RiskLearnIn": "hanzoai.cloud.models.risk_learn_in",
+    "RiskLearnOut": "hanzoai.cloud.models.risk_learn_out",
+    "RiskLineage": "hanzoai.cloud.models.risk_lineage",
+    "RiskModelFeature": "hanzoai.cloud.models.risk_model_feature",
+    "RiskModelState": "hanzoai.cloud.models.risk_model_state",
+    "RiskModelValue": "hanzoai.cloud.models.risk_model_value",
+    "RiskOrgFeature": "hanzoai.cloud.models.risk_org_feature",
+    "RiskPolicyOut": "hanzoai.cloud.models.risk_policy_out",
+    "RiskPolicyVersion": "hanzoai.cloud.models.risk_policy_version",
+    "RiskPublishOut": "hanzoai.cloud.models.risk_publish_out",
+    "RiskResolveIn": "hanzoai.cloud.models.risk_resolve_in",
+    "RiskResolveOut": "hanzoai.cloud.models.risk_resolve_out",
+    "RiskResolved": "hanzoai.cloud.models.risk_resolved",
+    "RiskScoreIn": "hanzoai.cloud.models.risk_score_in",
+    "RiskScoreOut": "hanzoai.cloud.models.risk_score_out",
+    "RiskSearchIn": "hanzoai.cloud.models.risk_search_in",
+    "RiskSearchReport": "hanzoai.cloud.models.risk_search_report",
+    "RiskSearchRun": "hanzoai.cloud.models.risk_search_run",
+    "RiskSourceCoverage": "hanzoai.cloud.models.risk_source_coverage",
+    "RiskSplitCounts": "hanzoai.cloud.models.risk_split_counts",
+    "RiskSurface": "hanzoai.cloud.models.risk_surface",
+    "RiskTopology": "hanzoai.cloud.models.risk_topology",
+    "RiskTrial": "hanzoai.cloud.models.risk_trial",
+    "RiskValue": "hanzoai.cloud.models.risk_value",
+    "RoleAssignment": "hanzoai.cloud.models.role_assignment",
+    "RoleList": "hanzoai.cloud.models.role_list",
+    "RollbackReq": "hanzoai.cloud.models.rollback_req",
+    "Rollup": "hanzoai.cloud.models.rollup",
+    "RollupAllotment": "hanzoai.cloud.models.rollup_allotment",
+    "RollupBalance": "hanzoai.cloud.models.rollup_balance",
+    "Root": "hanzoai.cloud.models.root",
+    "RoundInput": "hanzoai.cloud.models.round_input",
+    "RoundOut": "hanzoai.cloud.models.round_out",
+    "Route": "hanzoai.cloud.models.route",
+    "RouteCandidate": "hanzoai.cloud.models.route_candidate",
+    "RouteCreateIn": "hanzoai.cloud.models.route_create_in",
+    "RoutePlan": "hanzoai.cloud.models.route_plan",
+    "RoutedRunOut": "hanzoai.cloud.models.routed_run_out",
+    "RoutedUsage": "hanzoai.cloud.models.routed_usage",
+    "RouterList": "hanzoai.cloud.models.router_list",
+    "RouterView": "hanzoai.cloud.models.router_view",
+    "RpcError": "hanzoai.cloud.models.rpc_error",
+    "RpcIn": "hanzoai.cloud.models.rpc_in",
+    "RpcOut": "hanzoai.cloud.models.rpc_out",
+    "Rule": "hanzoai.cloud.models.rule",
+    "RuleList": "hanzoai.cloud.models.rule_list",
+    "RuleView": "hanzoai.cloud.models.rule_view",
+    "RulesOut": "hanzoai.cloud.models.rules_out",
+    "Ruleset": "hanzoai.cloud.models.ruleset",
+    "RunIn": "hanzoai.cloud.models.run_in",
+    "RunList": "hanzoai.cloud.models.run_list",
+    "RunPage": "hanzoai.cloud.models.run_page",
+    "RunPoint": "hanzoai.cloud.models.run_point",
+    "RunRecord": "hanzoai.cloud.models.run_record",
+    "RunReq": "hanzoai.cloud.models.run_req",
+    "RunRequest": "hanzoai.cloud.models.run_request",
+    "RunResp": "hanzoai.cloud.models.run_resp",
+    "RunSummary": "hanzoai.cloud.models.run_summary",
+    "RunView": "hanzoai.cloud.models.run_view",
+    "RunnerBuildReq": "hanzoai.cloud.models.runner_build_req",
+    "RunnerBuildResp": "hanzoai.cloud.models.runner_build_resp",
+    "Runs": "hanzoai.cloud.models.runs",
+    "S3Health": "hanzoai.cloud.models.s3_health",
+    "SMS": "hanzoai.cloud.models.sms",
+    "SafeIn": "hanzoai.cloud.models.safe_in",
+    "SafeOut": "hanzoai.cloud.models.safe_out",
+    "SafeProposal": "hanzoai.cloud.models.safe_proposal",
+    "SafeTxIn": "hanzoai.cloud.models.safe_tx_in",
+    "SampleAccepted": "hanzoai.cloud.models.sample_accepted",
+    "SampleIngest": "hanzoai.cloud.models.sample_ingest",
+    "SampleList": "hanzoai.cloud.models.sample_list",
+    "SampleReq": "hanzoai.cloud.models.sample_req",
+    "SampleView": "hanzoai.cloud.models.sample_view",
+    "Sandbox": "hanzoai.cloud.models.sandbox",
+    "SandboxList": "hanzoai.cloud.models.sandbox_list",
+    "SbomHealth": "hanzoai.cloud.models.sbom_health",
+    "SbomIngest": "hanzoai.cloud.models.sbom_ingest",
+    "SbomIngested": "hanzoai.cloud.models.sbom_ingested",
+    "Scan": "hanzoai.cloud.models.scan",
+    "ScanDetail": "hanzoai.cloud.models.scan_detail",
+    "ScanDraft": "hanzoai.cloud.models.scan_draft",
+    "ScanList": "hanzoai.cloud.models.scan_list",
+    "ScanView": "hanzoai.cloud.models.scan_view",
+    "ScheduleInput": "hanzoai.cloud.models.schedule_input",
+    "Scope": "hanzoai.cloud.models.scope",
+    "ScoreConfigList": "hanzoai.cloud.models.score_config_list",
+    "ScoreConfigReq": "hanzoai.cloud.models.score_config_req",
+    "ScoreConfigView": "hanzoai.cloud.models.score_config_view",
+    "ScoreList": "hanzoai.cloud.models.score_list",
+    "ScoreReq": "hanzoai.cloud.models.score_req",
+    "ScoreView": "hanzoai.cloud.models.score_view",
+    "ScreenResult": "hanzoai.cloud.models.screen_result",
+    "SearchIn": "hanzoai.cloud.models.search_in",
+    "SearchOut": "hanzoai.cloud.models.search_out",
+    "SearchResults": "hanzoai.cloud.models.search_results",
+    "SecretList": "hanzoai.cloud.models.secret_list",
+    "SecretMeta": "hanzoai.cloud.models.secret_meta",
+    "SecretView": "hanzoai.cloud.models.secret_view",
+    "Section": "hanzoai.cloud.models.section",
+    "SectionWrite": "hanzoai.cloud.models.section_write",
+    "SelfRank": "hanzoai.cloud.models.self_rank",
+    "SeoAuditIn": "hanzoai.cloud.models.seo_audit_in",
+    "SeoAuditOut": "hanzoai.cloud.models.seo_audit_out",
+    "SeoBacklinkIn": "hanzoai.cloud.models.seo_backlink_in",
+    "SeoBacklinkOut": "hanzoai.cloud.models.seo_backlink_out",
+    "SeoCharge": "hanzoai.cloud.models.seo_charge",
+    "SeoCompetitorIn": "hanzoai.cloud.models.seo_competitor_in",
+    "SeoCompetitorOut": "hanzoai.cloud.models.seo_competitor_out",
+    "SeoDomain": "hanzoai.cloud.models.seo_domain",
+    "SeoIdeaIn": "hanzoai.cloud.models.seo_idea_in",
+    "SeoIdeaOut": "hanzoai.cloud.models.seo_idea_out",
+    "SeoKeywordIn": "hanzoai.cloud.models.seo_keyword_in",
+    "SeoKeywordOut": "hanzoai.cloud.models.seo_keyword_out",
+    "SeoMetric": "hanzoai.cloud.models.seo_metric",
+    "SeoRankIn": "hanzoai.cloud.models.seo_rank_in",
+    "SeoRankOut": "hanzoai.cloud.models.seo_rank_out",
+    "SeoRanking": "hanzoai.cloud.models.seo_ranking",
+    "SeoRateOut": "hanzoai.cloud.models.seo_rate_out",
+    "Sequence": "hanzoai.cloud.models.sequence",
+    "SequenceList": "hanzoai.cloud.models.sequence_list",
+    "SequenceStatus": "hanzoai.cloud.models.sequence_status",
+    "SequenceView": "hanzoai.cloud.models.sequence_view",
+    "Sequences": "hanzoai.cloud.models.sequences",
+    "SeriesLine": "hanzoai.cloud.models.series_line",
+    "SeriesPoint": "hanzoai.cloud.models.series_point",
+    "SessionDetail": "hanzoai.cloud.models.session_detail",
+    "SessionList": "hanzoai.cloud.models.session_list",
+    "SessionUser": "hanzoai.cloud.models.session_user",
+    "SessionView": "hanzoai.cloud.models.session_view",
+    "SetEnvReq": "hanzoai.cloud.models.set_env_req",
+    "SetReferenceIn": "hanzoai.cloud.models.set_reference_in",
+    "SetReferenceOut": "hanzoai.cloud.models.set_reference_out",
+    "SettingsReq": "hanzoai.cloud.models.settings_req",
+    "SettingsView": "hanzoai.cloud.models.settings_view",
+    "SharePolicy": "hanzoai.cloud.models.share_policy",
+    "ShareView": "hanzoai.cloud.models.share_view",
+    "SharesOut": "hanzoai.cloud.models.shares_out",
+    "SignIn": "hanzoai.cloud.models.sign_in",
+    "SignReply": "hanzoai.cloud.models.sign_reply",
+    "SignRequest": "hanzoai.cloud.models.sign_request",
+    "Signature": "hanzoai.cloud.models.signature",
+    "Signer": "hanzoai.cloud.models.signer",
+    "Skill": "hanzoai.cloud.models.skill",
+    "SkillDeleted": "hanzoai.cloud.models.skill_deleted",
+    "SkillIn": "hanzoai.cloud.models.skill_in",
+    "SkillWritten": "hanzoai.cloud.models.skill_written",
+    "SlotView": "hanzoai.cloud.models.slot_view",
+    "SocialAccount": "hanzoai.cloud.models.social_account",
+    "SocialAccountBody": "hanzoai.cloud.models.social_account_body",
+    "SocialAccountWrite": "hanzoai.cloud.models.social_account_write",
+    "SocialAccounts": "hanzoai.cloud.models.social_accounts",
+    "SocialPost": "hanzoai.cloud.models.social_post",
+    "SocialPostBody": "hanzoai.cloud.models.social_post_body",
+    "SocialPostWrite": "hanzoai.cloud.models.social_post_write",
+    "SocialPosts": "hanzoai.cloud.models.social_posts",
+    "SocialProvider": "hanzoai.cloud.models.social_provider",
+    "SocialProviders": "hanzoai.cloud.models.social_providers",
+    "SocialSummary": "hanzoai.cloud.models.social_summary",
+    "Source": "hanzoai.cloud.models.source",
+    "SourceFailure": "hanzoai.cloud.models.source_failure",
+    "SourceState": "hanzoai.cloud.models.source_state",
+    "SourceToolList": "hanzoai.cloud.models.source_tool_list",
+    "Sources": "hanzoai.cloud.models.sources",
+    "Span": "hanzoai.cloud.models.span",
+    "SpanBody": "hanzoai.cloud.models.span_body",
+    "Spec": "hanzoai.cloud.models.spec",
+    "Spend": "hanzoai.cloud.models.spend",
+    "SpendPoint": "hanzoai.cloud.models.spend_point",
+    "StageEvent": "hanzoai.cloud.models.stage_event",
+    "StarterKit": "hanzoai.cloud.models.starter_kit",
+    "State": "hanzoai.cloud.models.state",
+    "StateGraph": "hanzoai.cloud.models.state_graph",
+    "StatsOut": "hanzoai.cloud.models.stats_out",
+    "StatsSessions": "hanzoai.cloud.models.stats_sessions",
+    "StatsUser": "hanzoai.cloud.models.stats_user",
+    "StatusBreakdown": "hanzoai.cloud.models.status_breakdown",
+    "StatusCounts": "hanzoai.cloud.models.status_counts",
+    "StatusView": "hanzoai.cloud.models.status_view",
+    "Step": "hanzoai.cloud.models.step",
+    "StepInput": "hanzoai.cloud.models.step_input",
+    "StepList": "hanzoai.cloud.models.step_list",
+    "StepSettings": "hanzoai.cloud.models.step_settings",
+    "StepView": "hanzoai.cloud.models.step_view",
+    "StopIn": "hanzoai.cloud.models.stop_in",
+    "Stopped": "hanzoai.cloud.models.stopped",
+    "StorefrontResult": "hanzoai.cloud.models.storefront_result",
+    "Strategy": "hanzoai.cloud.models.strategy",
+    "StrategyView": "hanzoai.cloud.models.strategy_view",
+    "Stream": "hanzoai.cloud.models.stream",
+    "Streams": "hanzoai.cloud.models.streams",
+    "StructureIn": "hanzoai.cloud.models.structure_in",
+    "SubdomainSetIn": "hanzoai.cloud.models.subdomain_set_in",
+    "Subject": "hanzoai.cloud.models.subject",
+    "SubjectList": "hanzoai.cloud.models.subject_list",
+    "SubjectReq": "hanzoai.cloud.models.subject_req",
+    "SubjectSummary": "hanzoai.cloud.models.subject_summary",
+    "SubmitReq": "hanzoai.cloud.models.submit_req",
+    "SubprocessorList": "hanzoai.cloud.models.subprocessor_list",
+    "SubscribeReq": "hanzoai.cloud.models.subscribe_req",
+    "Subscription": "hanzoai.cloud.models.subscription",
+    "SubscriptionList": "hanzoai.cloud.models.subscription_list",
+    "SubscriptionPlan": "hanzoai.cloud.models.subscription_plan",
+    "SubscriptionRef": "hanzoai.cloud.models.subscription_ref",
+    "SubscriptionView": "hanzoai.cloud.models.subscription_view",
+    "Subscriptions": "hanzoai.cloud.models.subscriptions",
+    "SuggestResponse": "hanzoai.cloud.models.suggest_response",
+    "Suggestion": "hanzoai.cloud.models.suggestion",
+    "Suite": "hanzoai.cloud.models.suite",
+    "Summary": "hanzoai.cloud.models.summary",
+    "SummaryResp": "hanzoai.cloud.models.summary_resp",
+    "SummaryView": "hanzoai.cloud.models.summary_view",
+    "Suppression": "hanzoai.cloud.models.suppression",
+    "SuppressionList": "hanzoai.cloud.models.suppression_list",
+    "Symbol": "hanzoai.cloud.models.symbol",
+    "SyncList": "hanzoai.cloud.models.sync_list",
+    "SyncQueued": "hanzoai.cloud.models.sync_queued",
+    "SyncReq": "hanzoai.cloud.models.sync_req",
+    "SyncTally": "hanzoai.cloud.models.sync_tally",
+    "SyncView": "hanzoai.cloud.models.sync_view",
+    "TLSConfig": "hanzoai.cloud.models.tls_config",
+    "TagConfig": "hanzoai.cloud.models.tag_config",
+    "TargetDeleted": "hanzoai.cloud.models.target_deleted",
+    "TargetList": "hanzoai.cloud.models.target_list",
+    "TargetReq": "hanzoai.cloud.models.target_req",
+    "TargetView": "hanzoai.cloud.models.target_view",
+    "Tariff": "hanzoai.cloud.models.tariff",
+    "TariffIn": "hanzoai.cloud.models.tariff_in",
+    "Taxon": "hanzoai.cloud.models.taxon",
+    "TaxonIn": "hanzoai.cloud.models.taxon_in",
+    "Taxonomy": "hanzoai.cloud.models.taxonomy",
+    "TemplateCatalog": "hanzoai.cloud.models.template_catalog",
+    "TemplateOverride": "hanzoai.cloud.models.template_override",
+    "TemplateReply": "hanzoai.cloud.models.template_reply",
+    "TemplateView": "hanzoai.cloud.models.template_view",
+    "TestResult": "hanzoai.cloud.models.test_result",
+    "TicketGrant": "hanzoai.cloud.models.ticket_grant",
+    "Tier": "hanzoai.cloud.models.tier",
+    "TierBalance": "hanzoai.cloud.models.tier_balance",
+    "TierLimits": "hanzoai.cloud.models.tier_limits",
+    "Timeseries": "hanzoai.cloud.models.timeseries",
+    "TodoProject": "hanzoai.cloud.models.todo_project",
+    "Tool": "hanzoai.cloud.models.tool",
+    "ToolCall": "hanzoai.cloud.models.tool_call",
+    "ToolList": "hanzoai.cloud.models.tool_list",
+    "ToolResult": "hanzoai.cloud.models.tool_result",
+    "Top": "hanzoai.cloud.models.top",
+    "TopModels": "hanzoai.cloud.models.top_models",
+    "TopProducts": "hanzoai.cloud.models.top_products",
+    "TotalView": "hanzoai.cloud.models.total_view",
+    "TraceList": "hanzoai.cloud.models.trace_list",
+    "TraceView": "hanzoai.cloud.models.trace_view",
+    "TrafficCaller": "hanzoai.cloud.models.traffic_caller",
+    "TrafficView": "hanzoai.cloud.models.traffic_view",
+    "TrailPage": "hanzoai.cloud.models.trail_page",
+    "Transaction": "hanzoai.cloud.models.transaction",
+    "Transactions": "hanzoai.cloud.models.transactions",
+    "TransactionsOut": "hanzoai.cloud.models.transactions_out",
+    "TransferReq": "hanzoai.cloud.models.transfer_req",
+    "TransitionIn": "hanzoai.cloud.models.transition_in",
+    "TransitionResult": "hanzoai.cloud.models.transition_result",
+    "TreasuryReport": "hanzoai.cloud.models.treasury_report",
+    "TreeEntry": "hanzoai.cloud.models.tree_entry",
+    "TreeEntryJSON": "hanzoai.cloud.models.tree_entry_json",
+    "TreeJSON": "hanzoai.cloud.models.tree_json",
+    "TreeNode": "hanzoai.cloud.models.tree_node",
+    "Trial": "hanzoai.cloud.models.trial",
+    "TrialBalance": "hanzoai.cloud.models.trial_balance",
+    "TrialBalanceRow": "hanzoai.cloud.models.trial_balance_row",
+    "TriggerList": "hanzoai.cloud.models.trigger_list",
+    "TriggerView": "hanzoai.cloud.models.trigger_view",
+    "TrustAsk": "hanzoai.cloud.models.trust_ask",
+    "TrustAskView": "hanzoai.cloud.models.trust_ask_view",
+    "TrustAsked": "hanzoai.cloud.models.trust_asked",
+    "TrustCoverage": "hanzoai.cloud.models.trust_coverage",
+    "TrustDecision": "hanzoai.cloud.models.trust_decision",
+    "TrustDesk": "hanzoai.cloud.models.trust_desk",
+    "TrustDocuments": "hanzoai.cloud.models.trust_documents",
+    "TrustEdit": "hanzoai.cloud.models.trust_edit",
+    "TrustGrantView": "hanzoai.cloud.models.trust_grant_view",
+    "TrustGranted": "hanzoai.cloud.models.trust_granted",
+    "TrustItem": "hanzoai.cloud.models.trust_item",
+    "TrustItemView": "hanzoai.cloud.models.trust_item_view",
+    "TrustPage": "hanzoai.cloud.models.trust_page",
+    "TrustPublish": "hanzoai.cloud.models.trust_publish",
+    "TrustRefused": "hanzoai.cloud.models.trust_refused",
+    "TrustSettings": "hanzoai.cloud.models.trust_settings",
+    "TrustTally": "hanzoai.cloud.models.trust_tally",
+    "Txn": "hanzoai.cloud.models.txn",
+    "UTM": "hanzoai.cloud.models.utm",
+    "UnreconciledOut": "hanzoai.cloud.models.unreconciled_out",
+    "Unsubscribed": "hanzoai.cloud.models.unsubscribed",
+    "UpdateAgentIn": "hanzoai.cloud.models.update_agent_in",
+    "UpdateCampaignIn": "hanzoai.cloud.models.update_campaign_in",
+    "UpdateEndpointIn": "hanzoai.cloud.models.update_endpoint_in",
+    "UpdateList": "hanzoai.cloud.models.update_list",
+    "Upkeep": "hanzoai.cloud.models.upkeep",
+    "UpkeepIn": "hanzoai.cloud.models.upkeep_in",
+    "UploadIn": "hanzoai.cloud.models.upload_in",
+    "Upstream": "hanzoai.cloud.models.upstream",
+    "Usage": "hanzoai.cloud.models.usage",
+    "UsageAnalyticsAccess": "hanzoai.cloud.models.usage_analytics_access",
+    "UsageAnalyticsGrant": "hanzoai.cloud.models.usage_analytics_grant",
+    "UsageAnalyticsView": "hanzoai.cloud.models.usage_analytics_view",
+    "UsagePoint": "hanzoai.cloud.models.usage_point",
+    "UsageRepo": "hanzoai.cloud.models.usage_repo",
+    "UsageScope": "hanzoai.cloud.models.usage_scope",
+    "UsageSummary": "hanzoai.cloud.models.usage_summary",
+    "UsageView": "hanzoai.cloud.models.usage_view",
+    "UsageWindowView": "hanzoai.cloud.models.usage_window_view",
+    "UserEnablementItem": "hanzoai.cloud.models.user_enablement_item",
+    "UserOptinReq": "hanzoai.cloud.models.user_optin_req",
+    "UserOptinView": "hanzoai.cloud.models.user_optin_view",
+    "ValidatorClaim": "hanzoai.cloud.models.validator_claim",
+    "ValidatorList": "hanzoai.cloud.models.validator_list",
+    "Variant": "hanzoai.cloud.models.variant",
+    "VendorRow": "hanzoai.cloud.models.vendor_row",
+    "VendorsOut": "hanzoai.cloud.models.vendors_out",
+    "Verdict": "hanzoai.cloud.models.verdict",
+    "VerificationDecision": "hanzoai.cloud.models.verification_decision",
+    "VerificationReq": "hanzoai.cloud.models.verification_req",
+    "VerificationTally": "hanzoai.cloud.models.verification_tally",
+    "VerifyOut": "hanzoai.cloud.models.verify_out",
+    "VerifyRequest": "hanzoai.cloud.models.verify_request",
+    "VersionMessage": "hanzoai.cloud.models.version_message",
+    "VersionMeta": "hanzoai.cloud.models.version_meta",
+    "VersionPage": "hanzoai.cloud.models.version_page",
+    "VersionView": "hanzoai.cloud.models.version_view",
+    "Voucher": "hanzoai.cloud.models.voucher",
+    "Waiting": "hanzoai.cloud.models.waiting",
+    "Wallet": "hanzoai.cloud.models.wallet",
+    "WalletAccount": "hanzoai.cloud.models.wallet_account",
+    "WalletList": "hanzoai.cloud.models.wallet_list",
+    "WebEngine": "hanzoai.cloud.models.web_engine",
+    "WebOverview": "hanzoai.cloud.models.web_overview",
+    "WebQuestion": "hanzoai.cloud.models.web_question",
+    "WebResult": "hanzoai.cloud.models.web_result",
+    "WebSearchQuery": "hanzoai.cloud.models.web_search_query",
+    "WebSearchResults": "hanzoai.cloud.models.web_search_results",
+    "Window": "hanzoai.cloud.models.window",
+    "Wire": "hanzoai.cloud.models.wire",
+    "WireFact": "hanzoai.cloud.models.wire_fact",
+    "WireInstructions": "hanzoai.cloud.models.wire_instructions",
+    "WorkerList": "hanzoai.cloud.models.worker_list",
+    "WorkerScriptPut": "hanzoai.cloud.models.worker_script_put",
+    "WorldIndex": "hanzoai.cloud.models.world_index",
+    "WorldWire": "hanzoai.cloud.models.world_wire",
+    "WriteIn": "hanzoai.cloud.models.write_in",
+    "Written": "hanzoai.cloud.models.written",
+    "Wrote": "hanzoai.cloud.models.wrote",
+    "ZapProcReq": "hanzoai.cloud.models.zap_proc_req",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    # Bind it so the next read is a plain module-dict hit.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    # import models into model package
+    from hanzoai.cloud.models.acc_list import AccList
+    from hanzoai.cloud.models.acc_view import AccView
+    from hanzoai.cloud.models.account import Account
+    from hanzoai.cloud.models.account_list import AccountList
+    from hanzoai.cloud.models.account_view import AccountView
+    from hanzoai.cloud.models.accounts import Accounts
+    from hanzoai.cloud.models.accounts_out import AccountsOut
+    from hanzoai.cloud.models.accounts_total import AccountsTotal
+    from hanzoai.cloud.models.accounts_usage import AccountsUsage
+    from hanzoai.cloud.models.accreditation_decision import AccreditationDecision
+    from hanzoai.cloud.models.accreditation_req import AccreditationReq
+    from hanzoai.cloud.models.action_record import ActionRecord
+    from hanzoai.cloud.models.actions_view import ActionsView
+    from hanzoai.cloud.models.activation_req import ActivationReq
+    from hanzoai.cloud.models.activation_set import ActivationSet
+    from hanzoai.cloud.models.activity_feed import ActivityFeed
+    from hanzoai.cloud.models.activity_out import ActivityOut
+    from hanzoai.cloud.models.activity_point import ActivityPoint
+    from hanzoai.cloud.models.activity_row import ActivityRow
+    from hanzoai.cloud.models.activity_totals import ActivityTotals
+    from hanzoai.cloud.models.activity_view import ActivityView
+    from hanzoai.cloud.models.ad_campaign import AdCampaign
+    from hanzoai.cloud.models.ad_summary import AdSummary
+    from hanzoai.cloud.models.add_domain_req import AddDomainReq
+    from hanzoai.cloud.models.admission import Admission
+    from hanzoai.cloud.models.advance_in import AdvanceIn
+    from hanzoai.cloud.models.affiliate_board import AffiliateBoard
+    from hanzoai.cloud.models.affiliate_earnings import AffiliateEarnings
+    from hanzoai.cloud.models.affiliate_links import AffiliateLinks
+    from hanzoai.cloud.models.affiliate_self import AffiliateSelf
+    from hanzoai.cloud.models.affiliate_standing import AffiliateStanding
+    from hanzoai.cloud.models.agent_binding import AgentBinding
+    from hanzoai.cloud.models.agent_detail import AgentDetail
+    from hanzoai.cloud.models.agent_list import AgentList
+    from hanzoai.cloud.models.agent_run_view import AgentRunView
+    from hanzoai.cloud.models.agent_view import AgentView
+    from hanzoai.cloud.models.ai_mcp_app import AiMCPApp
+    from hanzoai.cloud.models.ai_mcp_surface import AiMCPSurface
+    from hanzoai.cloud.models.alert import Alert
+    from hanzoai.cloud.models.alert_patch import AlertPatch
+    from hanzoai.cloud.models.alert_spec import AlertSpec
+    from hanzoai.cloud.models.allowance import Allowance
+    from hanzoai.cloud.models.allowlist_put_in import AllowlistPutIn
+    from hanzoai.cloud.models.allowlist_view import AllowlistView
+    from hanzoai.cloud.models.analysis import Analysis
+    from hanzoai.cloud.models.analytics_view import AnalyticsView
+    from hanzoai.cloud.models.analyze_query import AnalyzeQuery
+    from hanzoai.cloud.models.answer import Answer
+    from hanzoai.cloud.models.api_key import ApiKey
+    from hanzoai.cloud.models.api_key_list import ApiKeyList
+    from hanzoai.cloud.models.app_view import AppView
+    from hanzoai.cloud.models.appearance import Appearance
+    from hanzoai.cloud.models.application import Application
+    from hanzoai.cloud.models.application_list import ApplicationList
+    from hanzoai.cloud.models.apply_request import ApplyRequest
+    from hanzoai.cloud.models.approve_pairing_in import ApprovePairingIn
+    from hanzoai.cloud.models.argo_app import ArgoApp
+    from hanzoai.cloud.models.argo_app_list import ArgoAppList
+    from hanzoai.cloud.models.argo_cluster import ArgoCluster
+    from hanzoai.cloud.models.argo_cluster_info import ArgoClusterInfo
+    from hanzoai.cloud.models.argo_cluster_list import ArgoClusterList
+    from hanzoai.cloud.models.argo_connection_state import ArgoConnectionState
+    from hanzoai.cloud.models.argo_destination import ArgoDestination
+    from hanzoai.cloud.models.argo_group_kind import ArgoGroupKind
+    from hanzoai.cloud.models.argo_health import ArgoHealth
+    from hanzoai.cloud.models.argo_info_item import ArgoInfoItem
+    from hanzoai.cloud.models.argo_list_meta import ArgoListMeta
+    from hanzoai.cloud.models.argo_meta import ArgoMeta
+    from hanzoai.cloud.models.argo_node import ArgoNode
+    from hanzoai.cloud.models.argo_project import ArgoProject
+    from hanzoai.cloud.models.argo_project_list import ArgoProjectList
+    from hanzoai.cloud.models.argo_project_spec import ArgoProjectSpec
+    from hanzoai.cloud.models.argo_resource_ref import ArgoResourceRef
+    from hanzoai.cloud.models.argo_resource_status import ArgoResourceStatus
+    from hanzoai.cloud.models.argo_revision_metadata import ArgoRevisionMetadata
+    from hanzoai.cloud.models.argo_source import ArgoSource
+    from hanzoai.cloud.models.argo_spec import ArgoSpec
+    from hanzoai.cloud.models.argo_status import ArgoStatus
+    from hanzoai.cloud.models.argo_summary import ArgoSummary
+    from hanzoai.cloud.models.argo_sync_status import ArgoSyncStatus
+    from hanzoai.cloud.models.argo_sync_windows import ArgoSyncWindows
+    from hanzoai.cloud.models.argo_tree import ArgoTree
+    from hanzoai.cloud.models.arm import Arm
+    from hanzoai.cloud.models.ask_answer import AskAnswer
+    from hanzoai.cloud.models.ask_post_in import AskPostIn
+    from hanzoai.cloud.models.ask_request import AskRequest
+    from hanzoai.cloud.models.ask_response import AskResponse
+    from hanzoai.cloud.models.assignment import Assignment
+    from hanzoai.cloud.models.attribute_request import AttributeRequest
+    from hanzoai.cloud.models.attribution import Attribution
+    from hanzoai.cloud.models.audience import Audience
+    from hanzoai.cloud.models.audience_list import AudienceList
+    from hanzoai.cloud.models.audience_preview import AudiencePreview
+    from hanzoai.cloud.models.audit_list import AuditList
+    from hanzoai.cloud.models.author_repo import AuthorRepo
+    from hanzoai.cloud.models.authored_plugin import AuthoredPlugin
+    from hanzoai.cloud.models.authored_plugin_list import AuthoredPluginList
+    from hanzoai.cloud.models.authored_skill_list import AuthoredSkillList
+    from hanzoai.cloud.models.authorize_out import AuthorizeOut
+    from hanzoai.cloud.models.backend import Backend
+    from hanzoai.cloud.models.backend_status import BackendStatus
+    from hanzoai.cloud.models.balance_line import BalanceLine
+    from hanzoai.cloud.models.balance_sheet import BalanceSheet
+    from hanzoai.cloud.models.balances import Balances
+    from hanzoai.cloud.models.bank_question import BankQuestion
+    from hanzoai.cloud.models.bank_tally import BankTally
+    from hanzoai.cloud.models.bank_txn_row import BankTxnRow
+    from hanzoai.cloud.models.base_health import BaseHealth
+    from hanzoai.cloud.models.begin_in import BeginIn
+    from hanzoai.cloud.models.benchmark import Benchmark
+    from hanzoai.cloud.models.benchmark_catalog import BenchmarkCatalog
+    from hanzoai.cloud.models.billing_account import BillingAccount
+    from hanzoai.cloud.models.billing_invoice import BillingInvoice
+    from hanzoai.cloud.models.binary_spec import BinarySpec
+    from hanzoai.cloud.models.bind_agent_req import BindAgentReq
+    from hanzoai.cloud.models.binding_list import BindingList
+    from hanzoai.cloud.models.blob import Blob
+    from hanzoai.cloud.models.blob_json import BlobJSON
+    from hanzoai.cloud.models.blog import Blog
+    from hanzoai.cloud.models.blueprint import Blueprint
+    from hanzoai.cloud.models.blueprint_counts import BlueprintCounts
+    from hanzoai.cloud.models.blueprint_health import BlueprintHealth
+    from hanzoai.cloud.models.blueprint_index import BlueprintIndex
+    from hanzoai.cloud.models.blueprint_row import BlueprintRow
+    from hanzoai.cloud.models.blueprint_versions_view import BlueprintVersionsView
+    from hanzoai.cloud.models.blueprint_view import BlueprintView
+    from hanzoai.cloud.models.board import Board
+    from hanzoai.cloud.models.board_item import BoardItem
+    from hanzoai.cloud.models.board_page import BoardPage
+    from hanzoai.cloud.models.board_point import BoardPoint
+    from hanzoai.cloud.models.board_range import BoardRange
+    from hanzoai.cloud.models.board_resp import BoardResp
+    from hanzoai.cloud.models.board_scope import BoardScope
+    from hanzoai.cloud.models.board_totals import BoardTotals
+    from hanzoai.cloud.models.book_request import BookRequest
+    from hanzoai.cloud.models.book_response import BookResponse
+    from hanzoai.cloud.models.bot_list import BotList
+    from hanzoai.cloud.models.bot_member import BotMember
+    from hanzoai.cloud.models.bot_roster import BotRoster
+    from hanzoai.cloud.models.bot_run import BotRun
+    from hanzoai.cloud.models.bot_runs import BotRuns
+    from hanzoai.cloud.models.bot_stopped import BotStopped
+    from hanzoai.cloud.models.bot_sync import BotSync
+    from hanzoai.cloud.models.bot_view import BotView
+    from hanzoai.cloud.models.breakdown import Breakdown
+    from hanzoai.cloud.models.breakdown_row import BreakdownRow
+    from hanzoai.cloud.models.browser_tag_out import BrowserTagOut
+    from hanzoai.cloud.models.bucket_create_in import BucketCreateIn
+    from hanzoai.cloud.models.bucket_in import BucketIn
+    from hanzoai.cloud.models.bucket_item import BucketItem
+    from hanzoai.cloud.models.bucket_list import BucketList
+    from hanzoai.cloud.models.bucket_record import BucketRecord
+    from hanzoai.cloud.models.bucket_write import BucketWrite
+    from hanzoai.cloud.models.build_board import BuildBoard
+    from hanzoai.cloud.models.build_list import BuildList
+    from hanzoai.cloud.models.build_out import BuildOut
+    from hanzoai.cloud.models.build_request import BuildRequest
+    from hanzoai.cloud.models.build_row import BuildRow
+    from hanzoai.cloud.models.build_summary import BuildSummary
+    from hanzoai.cloud.models.build_turn import BuildTurn
+    from hanzoai.cloud.models.build_view import BuildView
+    from hanzoai.cloud.models.bus_ack import BusAck
+    from hanzoai.cloud.models.bus_message import BusMessage
+    from hanzoai.cloud.models.bus_publish import BusPublish
+    from hanzoai.cloud.models.bus_request import BusRequest
+    from hanzoai.cloud.models.buy_input import BuyInput
+    from hanzoai.cloud.models.byo_gpu import ByoGPU
+    from hanzoai.cloud.models.byo_worker import ByoWorker
+    from hanzoai.cloud.models.calendar_post import CalendarPost
+    from hanzoai.cloud.models.call import Call
+    from hanzoai.cloud.models.call_input import CallInput
+    from hanzoai.cloud.models.call_list import CallList
+    from hanzoai.cloud.models.campaign import Campaign
+    from hanzoai.cloud.models.campaign_input import CampaignInput
+    from hanzoai.cloud.models.campaign_list import CampaignList
+    from hanzoai.cloud.models.campaign_page import CampaignPage
+    from hanzoai.cloud.models.campaign_record import CampaignRecord
+    from hanzoai.cloud.models.campaign_results import CampaignResults
+    from hanzoai.cloud.models.campaign_summary import CampaignSummary
+    from hanzoai.cloud.models.campaign_update import CampaignUpdate
+    from hanzoai.cloud.models.campaign_write import CampaignWrite
+    from hanzoai.cloud.models.cap_verdict import CapVerdict
+    from hanzoai.cloud.models.capabilities import Capabilities
+    from hanzoai.cloud.models.capability import Capability
+    from hanzoai.cloud.models.captable_class_holding import CaptableClassHolding
+    from hanzoai.cloud.models.captable_company import CaptableCompany
+    from hanzoai.cloud.models.captable_company_update import CaptableCompanyUpdate
+    from hanzoai.cloud.models.captable_convertibles import CaptableConvertibles
+    from hanzoai.cloud.models.captable_deleted import CaptableDeleted
+    from hanzoai.cloud.models.captable_equity_plan import CaptableEquityPlan
+    from hanzoai.cloud.models.captable_equity_plans import CaptableEquityPlans
+    from hanzoai.cloud.models.captable_holding import CaptableHolding
+    from hanzoai.cloud.models.captable_instrument_total import CaptableInstrumentTotal
+    from hanzoai.cloud.models.captable_investment import CaptableInvestment
+    from hanzoai.cloud.models.captable_investments import CaptableInvestments
+    from hanzoai.cloud.models.captable_note import CaptableNote
+    from hanzoai.cloud.models.captable_notes import CaptableNotes
+    from hanzoai.cloud.models.captable_option import CaptableOption
+    from hanzoai.cloud.models.captable_options import CaptableOptions
+    from hanzoai.cloud.models.captable_round import CaptableRound
+    from hanzoai.cloud.models.captable_round_close_request import CaptableRoundCloseRequest
+    from hanzoai.cloud.models.captable_round_detail import CaptableRoundDetail
+    from hanzoai.cloud.models.captable_round_investment import CaptableRoundInvestment
+    from hanzoai.cloud.models.captable_round_totals import CaptableRoundTotals
+    from hanzoai.cloud.models.captable_rounds import CaptableRounds
+    from hanzoai.cloud.models.captable_safe import CaptableSafe
+    from hanzoai.cloud.models.captable_safes import CaptableSafes
+    from hanzoai.cloud.models.captable_share import CaptableShare
+    from hanzoai.cloud.models.captable_share_class import CaptableShareClass
+    from hanzoai.cloud.models.captable_shares import CaptableShares
+    from hanzoai.cloud.models.captable_stakeholder import CaptableStakeholder
+    from hanzoai.cloud.models.captable_stakeholder_patch import CaptableStakeholderPatch
+    from hanzoai.cloud.models.captable_summary import CaptableSummary
+    from hanzoai.cloud.models.captable_summary_company import CaptableSummaryCompany
+    from hanzoai.cloud.models.captable_totals import CaptableTotals
+    from hanzoai.cloud.models.captable_updated import CaptableUpdated
+    from hanzoai.cloud.models.capture_batch import CaptureBatch
+    from hanzoai.cloud.models.capture_event import CaptureEvent
+    from hanzoai.cloud.models.capture_result import CaptureResult
+    from hanzoai.cloud.models.captured_error import CapturedError
+    from hanzoai.cloud.models.cart import Cart
+    from hanzoai.cloud.models.cart_item import CartItem
+    from hanzoai.cloud.models.cart_item_set import CartItemSet
+    from hanzoai.cloud.models.cart_open import CartOpen
+    from hanzoai.cloud.models.catalog import Catalog
+    from hanzoai.cloud.models.catalog_entry import CatalogEntry
+    from hanzoai.cloud.models.catalog_list import CatalogList
+    from hanzoai.cloud.models.catalog_out import CatalogOut
+    from hanzoai.cloud.models.catalog_page import CatalogPage
+    from hanzoai.cloud.models.category import Category
+    from hanzoai.cloud.models.category_in import CategoryIn
+    from hanzoai.cloud.models.category_spend import CategorySpend
+    from hanzoai.cloud.models.centre import Centre
+    from hanzoai.cloud.models.chain import Chain
+    from hanzoai.cloud.models.chain_list import ChainList
+    from hanzoai.cloud.models.chain_status import ChainStatus
+    from hanzoai.cloud.models.challenge_view import ChallengeView
+    from hanzoai.cloud.models.channel import Channel
+    from hanzoai.cloud.models.channel_add import ChannelAdd
+    from hanzoai.cloud.models.channel_list import ChannelList
+    from hanzoai.cloud.models.channel_metric import ChannelMetric
+    from hanzoai.cloud.models.channel_result import ChannelResult
+    from hanzoai.cloud.models.channel_spec import ChannelSpec
+    from hanzoai.cloud.models.channel_view import ChannelView
+    from hanzoai.cloud.models.charge import Charge
+    from hanzoai.cloud.models.chat_channels import ChatChannels
+    from hanzoai.cloud.models.chat_request import ChatRequest
+    from hanzoai.cloud.models.chat_response import ChatResponse
+    from hanzoai.cloud.models.check_list import CheckList
+    from hanzoai.cloud.models.check_view import CheckView
+    from hanzoai.cloud.models.citation import Citation
+    from hanzoai.cloud.models.claim import Claim
+    from hanzoai.cloud.models.claim_key_out import ClaimKeyOut
+    from hanzoai.cloud.models.claim_request import ClaimRequest
+    from hanzoai.cloud.models.claim_row import ClaimRow
+    from hanzoai.cloud.models.claim_view import ClaimView
+    from hanzoai.cloud.models.claims_out import ClaimsOut
+    from hanzoai.cloud.models.clause_coverage import ClauseCoverage
+    from hanzoai.cloud.models.clause_row import ClauseRow
+    from hanzoai.cloud.models.clear_reference_out import ClearReferenceOut
+    from hanzoai.cloud.models.click_count import ClickCount
+    from hanzoai.cloud.models.click_request import ClickRequest
+    from hanzoai.cloud.models.clip_body import ClipBody
+    from hanzoai.cloud.models.cluster_attach import ClusterAttach
+    from hanzoai.cloud.models.cluster_detached import ClusterDetached
+    from hanzoai.cloud.models.cluster_detail_view import ClusterDetailView
+    from hanzoai.cloud.models.cluster_list import ClusterList
+    from hanzoai.cloud.models.cluster_view import ClusterView
+    from hanzoai.cloud.models.code_file import CodeFile
+    from hanzoai.cloud.models.code_result import CodeResult
+    from hanzoai.cloud.models.code_run import CodeRun
+    from hanzoai.cloud.models.code_view import CodeView
+    from hanzoai.cloud.models.coding_start_in import CodingStartIn
+    from hanzoai.cloud.models.coding_started import CodingStarted
+    from hanzoai.cloud.models.collab_payload import CollabPayload
+    from hanzoai.cloud.models.collab_request import CollabRequest
+    from hanzoai.cloud.models.collab_result import CollabResult
+    from hanzoai.cloud.models.collected import Collected
+    from hanzoai.cloud.models.commerce_overview import CommerceOverview
+    from hanzoai.cloud.models.commit_json import CommitJSON
+    from hanzoai.cloud.models.commits_json import CommitsJSON
+    from hanzoai.cloud.models.company import Company
+    from hanzoai.cloud.models.company_list import CompanyList
+    from hanzoai.cloud.models.company_req import CompanyReq
+    from hanzoai.cloud.models.completion import Completion
+    from hanzoai.cloud.models.config import Config
+    from hanzoai.cloud.models.conn_view import ConnView
+    from hanzoai.cloud.models.connect_in import ConnectIn
+    from hanzoai.cloud.models.connect_out import ConnectOut
+    from hanzoai.cloud.models.connect_request import ConnectRequest
+    from hanzoai.cloud.models.connection_out import ConnectionOut
+    from hanzoai.cloud.models.connection_view import ConnectionView
+    from hanzoai.cloud.models.connector_action import ConnectorAction
+    from hanzoai.cloud.models.connector_auth import ConnectorAuth
+    from hanzoai.cloud.models.connector_metadata import ConnectorMetadata
+    from hanzoai.cloud.models.connector_provider_view import ConnectorProviderView
+    from hanzoai.cloud.models.connector_providers_out import ConnectorProvidersOut
+    from hanzoai.cloud.models.connector_token_out import ConnectorTokenOut
+    from hanzoai.cloud.models.connector_trigger import ConnectorTrigger
+    from hanzoai.cloud.models.connector_view import ConnectorView
+    from hanzoai.cloud.models.connectors_out import ConnectorsOut
+    from hanzoai.cloud.models.console_settings import ConsoleSettings
+    from hanzoai.cloud.models.console_settings_dex_config import ConsoleSettingsDexConfig
+    from hanzoai.cloud.models.console_settings_google_analytics import ConsoleSettingsGoogleAnalytics
+    from hanzoai.cloud.models.console_settings_help import ConsoleSettingsHelp
+    from hanzoai.cloud.models.consumer import Consumer
+    from hanzoai.cloud.models.contact import Contact
+    from hanzoai.cloud.models.contact_list import ContactList
+    from hanzoai.cloud.models.contact_req import ContactReq
+    from hanzoai.cloud.models.contacts import Contacts
+    from hanzoai.cloud.models.context_bundle import ContextBundle
+    from hanzoai.cloud.models.context_in import ContextIn
+    from hanzoai.cloud.models.control_command_view import ControlCommandView
+    from hanzoai.cloud.models.control_drain import ControlDrain
+    from hanzoai.cloud.models.control_list import ControlList
+    from hanzoai.cloud.models.cookie_ack import CookieAck
+    from hanzoai.cloud.models.corpus_view import CorpusView
+    from hanzoai.cloud.models.cost_line import CostLine
+    from hanzoai.cloud.models.cover_row import CoverRow
+    from hanzoai.cloud.models.crawl_document import CrawlDocument
+    from hanzoai.cloud.models.crawl_request import CrawlRequest
+    from hanzoai.cloud.models.crawl_result import CrawlResult
+    from hanzoai.cloud.models.create_account_in import CreateAccountIn
+    from hanzoai.cloud.models.create_agent_in import CreateAgentIn
+    from hanzoai.cloud.models.create_app_req import CreateAppReq
+    from hanzoai.cloud.models.create_body import CreateBody
+    from hanzoai.cloud.models.create_cluster_req import CreateClusterReq
+    from hanzoai.cloud.models.create_cluster_req_node_pool import CreateClusterReqNodePool
+    from hanzoai.cloud.models.create_endpoint_in import CreateEndpointIn
+    from hanzoai.cloud.models.create_flow_req import CreateFlowReq
+    from hanzoai.cloud.models.create_link_request import CreateLinkRequest
+    from hanzoai.cloud.models.create_req import CreateReq
+    from hanzoai.cloud.models.create_server_req import CreateServerReq
+    from hanzoai.cloud.models.create_version_in import CreateVersionIn
+    from hanzoai.cloud.models.create_wallet_in import CreateWalletIn
+    from hanzoai.cloud.models.credential_in import CredentialIn
+    from hanzoai.cloud.models.credential_out import CredentialOut
+    from hanzoai.cloud.models.credit_balance import CreditBalance
+    from hanzoai.cloud.models.credit_entry import CreditEntry
+    from hanzoai.cloud.models.credit_grant import CreditGrant
+    from hanzoai.cloud.models.credit_grants import CreditGrants
+    from hanzoai.cloud.models.crm_summary import CrmSummary
+    from hanzoai.cloud.models.crypto_asset import CryptoAsset
+    from hanzoai.cloud.models.crypto_deposit import CryptoDeposit
+    from hanzoai.cloud.models.crypto_options import CryptoOptions
+    from hanzoai.cloud.models.csrf_resp import CsrfResp
+    from hanzoai.cloud.models.curate_req import CurateReq
+    from hanzoai.cloud.models.curriculum import Curriculum
+    from hanzoai.cloud.models.curriculum_view import CurriculumView
+    from hanzoai.cloud.models.d1_query import D1Query
+    from hanzoai.cloud.models.dash_resp import DashResp
+    from hanzoai.cloud.models.database_create_in import DatabaseCreateIn
+    from hanzoai.cloud.models.dataroom_add_document import DataroomAddDocument
+    from hanzoai.cloud.models.dataroom_create import DataroomCreate
+    from hanzoai.cloud.models.dataroom_document import DataroomDocument
+    from hanzoai.cloud.models.dataroom_document_one import DataroomDocumentOne
+    from hanzoai.cloud.models.dataroom_documents import DataroomDocuments
+    from hanzoai.cloud.models.dataroom_link import DataroomLink
+    from hanzoai.cloud.models.dataroom_link_create import DataroomLinkCreate
+    from hanzoai.cloud.models.dataroom_link_one import DataroomLinkOne
+    from hanzoai.cloud.models.dataroom_link_stats import DataroomLinkStats
+    from hanzoai.cloud.models.dataroom_links import DataroomLinks
+    from hanzoai.cloud.models.dataroom_member import DataroomMember
+    from hanzoai.cloud.models.dataroom_membership import DataroomMembership
+    from hanzoai.cloud.models.dataroom_page_stat import DataroomPageStat
+    from hanzoai.cloud.models.dataroom_room import DataroomRoom
+    from hanzoai.cloud.models.dataroom_room_detail import DataroomRoomDetail
+    from hanzoai.cloud.models.dataroom_room_detail_one import DataroomRoomDetailOne
+    from hanzoai.cloud.models.dataroom_room_one import DataroomRoomOne
+    from hanzoai.cloud.models.dataroom_rooms import DataroomRooms
+    from hanzoai.cloud.models.dataroom_stats import DataroomStats
+    from hanzoai.cloud.models.dataset_list import DatasetList
+    from hanzoai.cloud.models.dataset_req import DatasetReq
+    from hanzoai.cloud.models.dataset_view import DatasetView
+    from hanzoai.cloud.models.decide_body import DecideBody
+    from hanzoai.cloud.models.decision_in import DecisionIn
+    from hanzoai.cloud.models.deck_out import DeckOut
+    from hanzoai.cloud.models.def_row import DefRow
+    from hanzoai.cloud.models.definition import Definition
+    from hanzoai.cloud.models.defs_out import DefsOut
+    from hanzoai.cloud.models.deleted import Deleted
+    from hanzoai.cloud.models.deleted_out import DeletedOut
+    from hanzoai.cloud.models.delivery import Delivery
+    from hanzoai.cloud.models.delivery_list import DeliveryList
+    from hanzoai.cloud.models.delivery_row import DeliveryRow
+    from hanzoai.cloud.models.deploy_logs import DeployLogs
+    from hanzoai.cloud.models.deploy_record import DeployRecord
+    from hanzoai.cloud.models.deploy_req import DeployReq
+    from hanzoai.cloud.models.deploy_request import DeployRequest
+    from hanzoai.cloud.models.deployment_view import DeploymentView
+    from hanzoai.cloud.models.destination_disconnected import DestinationDisconnected
+    from hanzoai.cloud.models.destination_field import DestinationField
+    from hanzoai.cloud.models.destination_list import DestinationList
+    from hanzoai.cloud.models.destination_status import DestinationStatus
+    from hanzoai.cloud.models.destination_test import DestinationTest
+    from hanzoai.cloud.models.device_poll_out import DevicePollOut
+    from hanzoai.cloud.models.device_start_in import DeviceStartIn
+    from hanzoai.cloud.models.device_start_out import DeviceStartOut
+    from hanzoai.cloud.models.device_view import DeviceView
+    from hanzoai.cloud.models.diagnostic import Diagnostic
+    from hanzoai.cloud.models.disconnect_out import DisconnectOut
+    from hanzoai.cloud.models.doc_field import DocField
+    from hanzoai.cloud.models.doc_perm import DocPerm
+    from hanzoai.cloud.models.doc_row import DocRow
+    from hanzoai.cloud.models.doc_type import DocType
+    from hanzoai.cloud.models.doc_type_list import DocTypeList
+    from hanzoai.cloud.models.document_list import DocumentList
+    from hanzoai.cloud.models.document_page import DocumentPage
+    from hanzoai.cloud.models.document_reply import DocumentReply
+    from hanzoai.cloud.models.document_summary import DocumentSummary
+    from hanzoai.cloud.models.document_view import DocumentView
+    from hanzoai.cloud.models.domain_add_in import DomainAddIn
+    from hanzoai.cloud.models.domain_view import DomainView
+    from hanzoai.cloud.models.drift_board import DriftBoard
+    from hanzoai.cloud.models.drift_flag import DriftFlag
+    from hanzoai.cloud.models.drift_tally import DriftTally
+    from hanzoai.cloud.models.dropped import Dropped
+    from hanzoai.cloud.models.durable import Durable
+    from hanzoai.cloud.models.ein import EIN
+    from hanzoai.cloud.models.edge_state import EdgeState
+    from hanzoai.cloud.models.ein_in import EinIn
+    from hanzoai.cloud.models.embed_status_resp import EmbedStatusResp
+    from hanzoai.cloud.models.enable_resp import EnableResp
+    from hanzoai.cloud.models.enablement_board import EnablementBoard
+    from hanzoai.cloud.models.enablement_opt_ref import EnablementOptRef
+    from hanzoai.cloud.models.end_in import EndIn
+    from hanzoai.cloud.models.endpoint import Endpoint
+    from hanzoai.cloud.models.endpoint_list import EndpointList
+    from hanzoai.cloud.models.endpoint_req import EndpointReq
+    from hanzoai.cloud.models.endpoint_view import EndpointView
+    from hanzoai.cloud.models.engine_advertisement import EngineAdvertisement
+    from hanzoai.cloud.models.engine_status import EngineStatus
+    from hanzoai.cloud.models.enroll_input import EnrollInput
+    from hanzoai.cloud.models.enroll_req import EnrollReq
+    from hanzoai.cloud.models.enroll_result import EnrollResult
+    from hanzoai.cloud.models.enrollment import Enrollment
+    from hanzoai.cloud.models.enrollment_list import EnrollmentList
+    from hanzoai.cloud.models.enrolment import Enrolment
+    from hanzoai.cloud.models.entitlements_view import EntitlementsView
+    from hanzoai.cloud.models.entry import Entry
+    from hanzoai.cloud.models.env_var_json import EnvVarJSON
+    from hanzoai.cloud.models.environment_board import EnvironmentBoard
+    from hanzoai.cloud.models.environment_row import EnvironmentRow
+    from hanzoai.cloud.models.error_list import ErrorList
+    from hanzoai.cloud.models.esign_complete_in import EsignCompleteIn
+    from hanzoai.cloud.models.esign_completion import EsignCompletion
+    from hanzoai.cloud.models.esign_document import EsignDocument
+    from hanzoai.cloud.models.esign_documents import EsignDocuments
+    from hanzoai.cloud.models.esign_event import EsignEvent
+    from hanzoai.cloud.models.esign_field import EsignField
+    from hanzoai.cloud.models.esign_field_in import EsignFieldIn
+    from hanzoai.cloud.models.esign_health import EsignHealth
+    from hanzoai.cloud.models.esign_insertion import EsignInsertion
+    from hanzoai.cloud.models.esign_invite import EsignInvite
+    from hanzoai.cloud.models.esign_link import EsignLink
+    from hanzoai.cloud.models.esign_links import EsignLinks
+    from hanzoai.cloud.models.esign_out import EsignOut
+    from hanzoai.cloud.models.esign_pdf import EsignPDF
+    from hanzoai.cloud.models.esign_placement import EsignPlacement
+    from hanzoai.cloud.models.esign_recipient import EsignRecipient
+    from hanzoai.cloud.models.esign_recipient_in import EsignRecipientIn
+    from hanzoai.cloud.models.esign_reject_in import EsignRejectIn
+    from hanzoai.cloud.models.esign_rejection import EsignRejection
+    from hanzoai.cloud.models.esign_session import EsignSession
+    from hanzoai.cloud.models.esign_signer import EsignSigner
+    from hanzoai.cloud.models.esign_state import EsignState
+    from hanzoai.cloud.models.esign_trail import EsignTrail
+    from hanzoai.cloud.models.esign_upload_in import EsignUploadIn
+    from hanzoai.cloud.models.esign_value_in import EsignValueIn
+    from hanzoai.cloud.models.evaluate_in import EvaluateIn
+    from hanzoai.cloud.models.evaluator_list import EvaluatorList
+    from hanzoai.cloud.models.evaluator_req import EvaluatorReq
+    from hanzoai.cloud.models.evaluator_view import EvaluatorView
+    from hanzoai.cloud.models.event import Event
+    from hanzoai.cloud.models.event_list import EventList
+    from hanzoai.cloud.models.event_view import EventView
+    from hanzoai.cloud.models.exception import Exception
+    from hanzoai.cloud.models.exec_request import ExecRequest
+    from hanzoai.cloud.models.exec_result import ExecResult
+    from hanzoai.cloud.models.experiment_list import ExperimentList
+    from hanzoai.cloud.models.extracted import Extracted
+    from hanzoai.cloud.models.faq_list import FaqList
+    from hanzoai.cloud.models.figure import Figure
+    from hanzoai.cloud.models.file_content import FileContent
+    from hanzoai.cloud.models.file_input import FileInput
+    from hanzoai.cloud.models.file_json import FileJSON
+    from hanzoai.cloud.models.files_json import FilesJSON
+    from hanzoai.cloud.models.filing import Filing
+    from hanzoai.cloud.models.filing_page import FilingPage
+    from hanzoai.cloud.models.filing_reply import FilingReply
+    from hanzoai.cloud.models.filing_request import FilingRequest
+    from hanzoai.cloud.models.filters import Filters
+    from hanzoai.cloud.models.finance_ledger_entry import FinanceLedgerEntry
+    from hanzoai.cloud.models.financial_package import FinancialPackage
+    from hanzoai.cloud.models.finding_list import FindingList
+    from hanzoai.cloud.models.finding_view import FindingView
+    from hanzoai.cloud.models.fleet_board import FleetBoard
+    from hanzoai.cloud.models.fleet_metrics import FleetMetrics
+    from hanzoai.cloud.models.fleet_spec import FleetSpec
+    from hanzoai.cloud.models.fleet_summary import FleetSummary
+    from hanzoai.cloud.models.fleet_unit import FleetUnit
+    from hanzoai.cloud.models.flow import Flow
+    from hanzoai.cloud.models.flow_action import FlowAction
+    from hanzoai.cloud.models.flow_create import FlowCreate
+    from hanzoai.cloud.models.flow_page import FlowPage
+    from hanzoai.cloud.models.flow_run import FlowRun
+    from hanzoai.cloud.models.flow_status import FlowStatus
+    from hanzoai.cloud.models.flow_trigger import FlowTrigger
+    from hanzoai.cloud.models.flow_update import FlowUpdate
+    from hanzoai.cloud.models.flow_version import FlowVersion
+    from hanzoai.cloud.models.fn_list import FnList
+    from hanzoai.cloud.models.form import Form
+    from hanzoai.cloud.models.formation import Formation
+    from hanzoai.cloud.models.formation_view import FormationView
+    from hanzoai.cloud.models.founder import Founder
+    from hanzoai.cloud.models.founders_in import FoundersIn
+    from hanzoai.cloud.models.frame import Frame
+    from hanzoai.cloud.models.framework_list import FrameworkList
+    from hanzoai.cloud.models.framework_row import FrameworkRow
+    from hanzoai.cloud.models.function_detail import FunctionDetail
+    from hanzoai.cloud.models.function_view import FunctionView
+    from hanzoai.cloud.models.funnel import Funnel
+    from hanzoai.cloud.models.gl_row import GLRow
+    from hanzoai.cloud.models.gpu import GPU
+    from hanzoai.cloud.models.gc_out import GcOut
+    from hanzoai.cloud.models.generate_input import GenerateInput
+    from hanzoai.cloud.models.generate_request import GenerateRequest
+    from hanzoai.cloud.models.generate_result import GenerateResult
+    from hanzoai.cloud.models.genesis import Genesis
+    from hanzoai.cloud.models.git_ops_app import GitOpsApp
+    from hanzoai.cloud.models.git_ops_deploy import GitOpsDeploy
+    from hanzoai.cloud.models.git_ops_operation import GitOpsOperation
+    from hanzoai.cloud.models.git_ops_plane import GitOpsPlane
+    from hanzoai.cloud.models.git_origin import GitOrigin
+    from hanzoai.cloud.models.git_source import GitSource
+    from hanzoai.cloud.models.github_backfill_in import GithubBackfillIn
+    from hanzoai.cloud.models.github_backfill_result import GithubBackfillResult
+    from hanzoai.cloud.models.github_claim_in import GithubClaimIn
+    from hanzoai.cloud.models.github_claim_out import GithubClaimOut
+    from hanzoai.cloud.models.github_fork_out import GithubForkOut
+    from hanzoai.cloud.models.github_fork_req import GithubForkReq
+    from hanzoai.cloud.models.github_import_in import GithubImportIn
+    from hanzoai.cloud.models.github_import_out import GithubImportOut
+    from hanzoai.cloud.models.github_installation_view import GithubInstallationView
+    from hanzoai.cloud.models.github_installations_out import GithubInstallationsOut
+    from hanzoai.cloud.models.github_pages_build_out import GithubPagesBuildOut
+    from hanzoai.cloud.models.github_pages_disabled_out import GithubPagesDisabledOut
+    from hanzoai.cloud.models.github_pages_enable_req import GithubPagesEnableReq
+    from hanzoai.cloud.models.github_pages_source import GithubPagesSource
+    from hanzoai.cloud.models.github_pages_update_req import GithubPagesUpdateReq
+    from hanzoai.cloud.models.github_pages_updated_out import GithubPagesUpdatedOut
+    from hanzoai.cloud.models.github_pages_view import GithubPagesView
+    from hanzoai.cloud.models.github_repo_view import GithubRepoView
+    from hanzoai.cloud.models.github_repos_out import GithubReposOut
+    from hanzoai.cloud.models.github_search_hit import GithubSearchHit
+    from hanzoai.cloud.models.github_search_out import GithubSearchOut
+    from hanzoai.cloud.models.github_search_req import GithubSearchReq
+    from hanzoai.cloud.models.gitlab_project_view import GitlabProjectView
+    from hanzoai.cloud.models.gitlab_projects_out import GitlabProjectsOut
+    from hanzoai.cloud.models.gpu_alert_list import GpuAlertList
+    from hanzoai.cloud.models.gpu_job import GpuJob
+    from hanzoai.cloud.models.gpu_list import GpuList
+    from hanzoai.cloud.models.gpu_view import GpuView
+    from hanzoai.cloud.models.graph_assert_in import GraphAssertIn
+    from hanzoai.cloud.models.graph_assert_out import GraphAssertOut
+    from hanzoai.cloud.models.graph_edge import GraphEdge
+    from hanzoai.cloud.models.graph_fact import GraphFact
+    from hanzoai.cloud.models.graph_neighbors_in import GraphNeighborsIn
+    from hanzoai.cloud.models.graph_neighbors_out import GraphNeighborsOut
+    from hanzoai.cloud.models.graph_node import GraphNode
+    from hanzoai.cloud.models.graph_out import GraphOut
+    from hanzoai.cloud.models.graph_ql_error import GraphQLError
+    from hanzoai.cloud.models.graph_qlin import GraphQLIn
+    from hanzoai.cloud.models.graph_ql_out import GraphQLOut
+    from hanzoai.cloud.models.graph_read_out import GraphReadOut
+    from hanzoai.cloud.models.graph_resolve_in import GraphResolveIn
+    from hanzoai.cloud.models.graph_resolve_out import GraphResolveOut
+    from hanzoai.cloud.models.graph_vocabulary_out import GraphVocabularyOut
+    from hanzoai.cloud.models.handle_request import HandleRequest
+    from hanzoai.cloud.models.handle_set import HandleSet
+    from hanzoai.cloud.models.health import Health
+    from hanzoai.cloud.models.health_lens import HealthLens
+    from hanzoai.cloud.models.health_lenses import HealthLenses
+    from hanzoai.cloud.models.health_out import HealthOut
+    from hanzoai.cloud.models.health_plane import HealthPlane
+    from hanzoai.cloud.models.health_report import HealthReport
+    from hanzoai.cloud.models.health_view import HealthView
+    from hanzoai.cloud.models.help_article import HelpArticle
+    from hanzoai.cloud.models.help_article_card import HelpArticleCard
+    from hanzoai.cloud.models.help_article_list import HelpArticleList
+    from hanzoai.cloud.models.help_category import HelpCategory
+    from hanzoai.cloud.models.help_category_list import HelpCategoryList
+    from hanzoai.cloud.models.help_ticket_filed import HelpTicketFiled
+    from hanzoai.cloud.models.help_ticket_intake import HelpTicketIntake
+    from hanzoai.cloud.models.history_out import HistoryOut
+    from hanzoai.cloud.models.hit import Hit
+    from hanzoai.cloud.models.holder import Holder
+    from hanzoai.cloud.models.holding import Holding
+    from hanzoai.cloud.models.holdings import Holdings
+    from hanzoai.cloud.models.iam_account_body import IamAccountBody
+    from hanzoai.cloud.models.iam_account_item import IamAccountItem
+    from hanzoai.cloud.models.iam_address import IamAddress
+    from hanzoai.cloud.models.iam_answer import IamAnswer
+    from hanzoai.cloud.models.iam_application import IamApplication
+    from hanzoai.cloud.models.iam_application_list_result import IamApplicationListResult
+    from hanzoai.cloud.models.iam_assume_body import IamAssumeBody
+    from hanzoai.cloud.models.iam_audit_log import IamAuditLog
+    from hanzoai.cloud.models.iam_bulk import IamBulk
+    from hanzoai.cloud.models.iam_cart_item import IamCartItem
+    from hanzoai.cloud.models.iam_cert import IamCert
+    from hanzoai.cloud.models.iam_certs_delete_output import IamCertsDeleteOutput
+    from hanzoai.cloud.models.iam_certs_list_output import IamCertsListOutput
+    from hanzoai.cloud.models.iam_config import IamConfig
+    from hanzoai.cloud.models.iam_consent_record import IamConsentRecord
+    from hanzoai.cloud.models.iam_create_input import IamCreateInput
+    from hanzoai.cloud.models.iam_create_organization_input import IamCreateOrganizationInput
+    from hanzoai.cloud.models.iam_create_session_in import IamCreateSessionIn
+    from hanzoai.cloud.models.iam_delete_organization_output import IamDeleteOrganizationOutput
+    from hanzoai.cloud.models.iam_delete_output import IamDeleteOutput
+    from hanzoai.cloud.models.iam_delete_response import IamDeleteResponse
+    from hanzoai.cloud.models.iam_delete_result import IamDeleteResult
+    from hanzoai.cloud.models.iam_delete_session_out import IamDeleteSessionOut
+    from hanzoai.cloud.models.iam_face_id import IamFaceId
+    from hanzoai.cloud.models.iam_filter import IamFilter
+    from hanzoai.cloud.models.iam_input import IamInput
+    from hanzoai.cloud.models.iam_invitation import IamInvitation
+    from hanzoai.cloud.models.iam_invitations_delete_output import IamInvitationsDeleteOutput
+    from hanzoai.cloud.models.iam_invitations_input import IamInvitationsInput
+    from hanzoai.cloud.models.iam_invitations_list_output import IamInvitationsListOutput
+    from hanzoai.cloud.models.iam_jwt_item import IamJwtItem
+    from hanzoai.cloud.models.iam_key import IamKey
+    from hanzoai.cloud.models.iam_list_organizations_output import IamListOrganizationsOutput
+    from hanzoai.cloud.models.iam_list_output import IamListOutput
+    from hanzoai.cloud.models.iam_list_providers_out import IamListProvidersOut
+    from hanzoai.cloud.models.iam_list_response import IamListResponse
+    from hanzoai.cloud.models.iam_list_sessions_out import IamListSessionsOut
+    from hanzoai.cloud.models.iam_list_tokens_out import IamListTokensOut
+    from hanzoai.cloud.models.iam_list_webauthn_credentials_out import IamListWebauthnCredentialsOut
+    from hanzoai.cloud.models.iam_managed_account import IamManagedAccount
+    from hanzoai.cloud.models.iam_mfa_account import IamMfaAccount
+    from hanzoai.cloud.models.iam_mfa_item import IamMfaItem
+    from hanzoai.cloud.models.iam_mfa_props import IamMfaProps
+    from hanzoai.cloud.models.iam_mutation_result import IamMutationResult
+    from hanzoai.cloud.models.iam_organization import IamOrganization
+    from hanzoai.cloud.models.iam_password_body import IamPasswordBody
+    from hanzoai.cloud.models.iam_permission import IamPermission
+    from hanzoai.cloud.models.iam_permission_delete_response import IamPermissionDeleteResponse
+    from hanzoai.cloud.models.iam_permission_list_response import IamPermissionListResponse
+    from hanzoai.cloud.models.iam_person import IamPerson
+    from hanzoai.cloud.models.iam_project import IamProject
+    from hanzoai.cloud.models.iam_projects_delete_output import IamProjectsDeleteOutput
+    from hanzoai.cloud.models.iam_projects_input import IamProjectsInput
+    from hanzoai.cloud.models.iam_projects_list_output import IamProjectsListOutput
+    from hanzoai.cloud.models.iam_provider import IamProvider
+    from hanzoai.cloud.models.iam_provider_item import IamProviderItem
+    from hanzoai.cloud.models.iam_provider_result import IamProviderResult
+    from hanzoai.cloud.models.iam_registration import IamRegistration
+    from hanzoai.cloud.models.iam_reply import IamReply
+    from hanzoai.cloud.models.iam_role import IamRole
+    from hanzoai.cloud.models.iam_roles_delete_output import IamRolesDeleteOutput
+    from hanzoai.cloud.models.iam_roles_input import IamRolesInput
+    from hanzoai.cloud.models.iam_roles_list_output import IamRolesListOutput
+    from hanzoai.cloud.models.iam_saml_item import IamSamlItem
+    from hanzoai.cloud.models.iam_scheme import IamScheme
+    from hanzoai.cloud.models.iam_scope_description import IamScopeDescription
+    from hanzoai.cloud.models.iam_scope_item import IamScopeItem
+    from hanzoai.cloud.models.iam_session import IamSession
+    from hanzoai.cloud.models.iam_set_avatar_input import IamSetAvatarInput
+    from hanzoai.cloud.models.iam_signin_item import IamSigninItem
+    from hanzoai.cloud.models.iam_signin_method import IamSigninMethod
+    from hanzoai.cloud.models.iam_signup_item import IamSignupItem
+    from hanzoai.cloud.models.iam_theme_data import IamThemeData
+    from hanzoai.cloud.models.iam_toggle import IamToggle
+    from hanzoai.cloud.models.iam_token import IamToken
+    from hanzoai.cloud.models.iam_token_mutation import IamTokenMutation
+    from hanzoai.cloud.models.iam_token_result import IamTokenResult
+    from hanzoai.cloud.models.iam_update_input import IamUpdateInput
+    from hanzoai.cloud.models.iam_update_organization_input import IamUpdateOrganizationInput
+    from hanzoai.cloud.models.iam_update_session_in import IamUpdateSessionIn
+    from hanzoai.cloud.models.iam_user import IamUser
+    from hanzoai.cloud.models.iam_users_delete_output import IamUsersDeleteOutput
+    from hanzoai.cloud.models.iam_users_list_output import IamUsersListOutput
+    from hanzoai.cloud.models.iam_webauthn_credential import IamWebauthnCredential
+    from hanzoai.cloud.models.iam_webauthn_credential_mutation_result import IamWebauthnCredentialMutationResult
+    from hanzoai.cloud.models.iam_webauthn_credential_result import IamWebauthnCredentialResult
+    from hanzoai.cloud.models.iam_workspace import IamWorkspace
+    from hanzoai.cloud.models.iam_workspaces_delete_output import IamWorkspacesDeleteOutput
+    from hanzoai.cloud.models.iam_workspaces_input import IamWorkspacesInput
+    from hanzoai.cloud.models.iam_workspaces_list_output import IamWorkspacesListOutput
+    from hanzoai.cloud.models.image_origin import ImageOrigin
+    from hanzoai.cloud.models.image_view import ImageView
+    from hanzoai.cloud.models.import_cap_table_in import ImportCapTableIn
+    from hanzoai.cloud.models.import_cap_table_out import ImportCapTableOut
+    from hanzoai.cloud.models.import_documents_in import ImportDocumentsIn
+    from hanzoai.cloud.models.import_documents_out import ImportDocumentsOut
+    from hanzoai.cloud.models.inbox_item import InboxItem
+    from hanzoai.cloud.models.inbox_out import InboxOut
+    from hanzoai.cloud.models.inbox_page import InboxPage
+    from hanzoai.cloud.models.inbox_view import InboxView
+    from hanzoai.cloud.models.index import Index
+    from hanzoai.cloud.models.index_count import IndexCount
+    from hanzoai.cloud.models.index_documents import IndexDocuments
+    from hanzoai.cloud.models.index_enqueued import IndexEnqueued
+    from hanzoai.cloud.models.index_filter import IndexFilter
+    from hanzoai.cloud.models.index_health import IndexHealth
+    from hanzoai.cloud.models.index_hits import IndexHits
+    from hanzoai.cloud.models.index_in import IndexIn
+    from hanzoai.cloud.models.index_list import IndexList
+    from hanzoai.cloud.models.index_new import IndexNew
+    from hanzoai.cloud.models.index_query import IndexQuery
+    from hanzoai.cloud.models.index_result import IndexResult
+    from hanzoai.cloud.models.index_settings import IndexSettings
+    from hanzoai.cloud.models.index_stats import IndexStats
+    from hanzoai.cloud.models.index_task import IndexTask
+    from hanzoai.cloud.models.index_version import IndexVersion
+    from hanzoai.cloud.models.index_view import IndexView
+    from hanzoai.cloud.models.indexer_view import IndexerView
+    from hanzoai.cloud.models.indexers_out import IndexersOut
+    from hanzoai.cloud.models.info_out import InfoOut
+    from hanzoai.cloud.models.ingest_req import IngestReq
+    from hanzoai.cloud.models.ingest_resp import IngestResp
+    from hanzoai.cloud.models.ingress_middlewares import IngressMiddlewares
+    from hanzoai.cloud.models.ingress_routes import IngressRoutes
+    from hanzoai.cloud.models.ingress_services import IngressServices
+    from hanzoai.cloud.models.ingress_status import IngressStatus
+    from hanzoai.cloud.models.ingress_tls import IngressTLS
+    from hanzoai.cloud.models.insights_body import InsightsBody
+    from hanzoai.cloud.models.insights_event import InsightsEvent
+    from hanzoai.cloud.models.insights_status import InsightsStatus
+    from hanzoai.cloud.models.install import Install
+    from hanzoai.cloud.models.install_req import InstallReq
+    from hanzoai.cloud.models.install_state import InstallState
+    from hanzoai.cloud.models.invocation_list import InvocationList
+    from hanzoai.cloud.models.invocation_view import InvocationView
+    from hanzoai.cloud.models.invoice import Invoice
+    from hanzoai.cloud.models.invoice_line import InvoiceLine
+    from hanzoai.cloud.models.invoice_line_item import InvoiceLineItem
+    from hanzoai.cloud.models.invoices import Invoices
+    from hanzoai.cloud.models.invoke_req import InvokeReq
+    from hanzoai.cloud.models.issue_edit import IssueEdit
+    from hanzoai.cloud.models.issue_hit import IssueHit
+    from hanzoai.cloud.models.issue_hits import IssueHits
+    from hanzoai.cloud.models.issue_view import IssueView
+    from hanzoai.cloud.models.item_list import ItemList
+    from hanzoai.cloud.models.item_req import ItemReq
+    from hanzoai.cloud.models.item_result import ItemResult
+    from hanzoai.cloud.models.item_view import ItemView
+    from hanzoai.cloud.models.job_cancel import JobCancel
+    from hanzoai.cloud.models.job_canceled import JobCanceled
+    from hanzoai.cloud.models.job_list import JobList
+    from hanzoai.cloud.models.journey_step import JourneyStep
+    from hanzoai.cloud.models.judge_spec import JudgeSpec
+    from hanzoai.cloud.models.kb_authorize_out import KbAuthorizeOut
+    from hanzoai.cloud.models.kb_connectors_out import KbConnectorsOut
+    from hanzoai.cloud.models.kb_sync_out import KbSyncOut
+    from hanzoai.cloud.models.key_list import KeyList
+    from hanzoai.cloud.models.key_type_in import KeyTypeIn
+    from hanzoai.cloud.models.key_view import KeyView
+    from hanzoai.cloud.models.kit_list import KitList
+    from hanzoai.cloud.models.kms_config import KmsConfig
+    from hanzoai.cloud.models.kms_health import KmsHealth
+    from hanzoai.cloud.models.kms_login import KmsLogin
+    from hanzoai.cloud.models.kms_put import KmsPut
+    from hanzoai.cloud.models.kms_secrets import KmsSecrets
+    from hanzoai.cloud.models.kms_stored import KmsStored
+    from hanzoai.cloud.models.kms_token import KmsToken
+    from hanzoai.cloud.models.kv_ack import KvAck
+    from hanzoai.cloud.models.kv_entry import KvEntry
+    from hanzoai.cloud.models.kv_page import KvPage
+    from hanzoai.cloud.models.kv_write import KvWrite
+    from hanzoai.cloud.models.kyc_refresh_out import KycRefreshOut
+    from hanzoai.cloud.models.kyc_session import KycSession
+    from hanzoai.cloud.models.kyc_start_out import KycStartOut
+    from hanzoai.cloud.models.llm import LLM
+    from hanzoai.cloud.models.llm_overview import LLMOverview
+    from hanzoai.cloud.models.last_event_view import LastEventView
+    from hanzoai.cloud.models.latency_stat import LatencyStat
+    from hanzoai.cloud.models.leader_row import LeaderRow
+    from hanzoai.cloud.models.leaderboard import Leaderboard
+    from hanzoai.cloud.models.leaderboard_row import LeaderboardRow
+    from hanzoai.cloud.models.leaderboard_view import LeaderboardView
+    from hanzoai.cloud.models.lease_in import LeaseIn
+    from hanzoai.cloud.models.leased import Leased
+    from hanzoai.cloud.models.leg import Leg
+    from hanzoai.cloud.models.legal_filing import LegalFiling
+    from hanzoai.cloud.models.legal_health import LegalHealth
+    from hanzoai.cloud.models.legal_signer import LegalSigner
+    from hanzoai.cloud.models.legal_template import LegalTemplate
+    from hanzoai.cloud.models.level_view import LevelView
+    from hanzoai.cloud.models.licensing_device_signals import LicensingDeviceSignals
+    from hanzoai.cloud.models.licensing_fingerprint_request import LicensingFingerprintRequest
+    from hanzoai.cloud.models.licensing_fingerprint_response import LicensingFingerprintResponse
+    from hanzoai.cloud.models.licensing_health_view import LicensingHealthView
+    from hanzoai.cloud.models.licensing_issue_request import LicensingIssueRequest
+    from hanzoai.cloud.models.licensing_issue_response import LicensingIssueResponse
+    from hanzoai.cloud.models.licensing_jwk import LicensingJWK
+    from hanzoai.cloud.models.licensing_pubkey_view import LicensingPubkeyView
+    from hanzoai.cloud.models.licensing_release import LicensingRelease
+    from hanzoai.cloud.models.licensing_release_asset import LicensingReleaseAsset
+    from hanzoai.cloud.models.licensing_release_list import LicensingReleaseList
+    from hanzoai.cloud.models.licensing_revocation_entry import LicensingRevocationEntry
+    from hanzoai.cloud.models.licensing_revoke_request import LicensingRevokeRequest
+    from hanzoai.cloud.models.licensing_revoke_response import LicensingRevokeResponse
+    from hanzoai.cloud.models.licensing_verify_request import LicensingVerifyRequest
+    from hanzoai.cloud.models.licensing_verify_response import LicensingVerifyResponse
+    from hanzoai.cloud.models.limits_block import LimitsBlock
+    from hanzoai.cloud.models.limits_view import LimitsView
+    from hanzoai.cloud.models.line_item import LineItem
+    from hanzoai.cloud.models.link import Link
+    from hanzoai.cloud.models.link_list import LinkList
+    from hanzoai.cloud.models.link_mint import LinkMint
+    from hanzoai.cloud.models.link_view import LinkView
+    from hanzoai.cloud.models.list_out import ListOut
+    from hanzoai.cloud.models.listing import Listing
+    from hanzoai.cloud.models.listing_page import ListingPage
+    from hanzoai.cloud.models.liveness import Liveness
+    from hanzoai.cloud.models.location import Location
+    from hanzoai.cloud.models.log_body import LogBody
+    from hanzoai.cloud.models.log_lines import LogLines
+    from hanzoai.cloud.models.loss import Loss
+    from hanzoai.cloud.models.mcp_error import MCPError
+    from hanzoai.cloud.models.mcp_listing import MCPListing
+    from hanzoai.cloud.models.mcp_package import MCPPackage
+    from hanzoai.cloud.models.mcp_remote import MCPRemote
+    from hanzoai.cloud.models.mcp_request import MCPRequest
+    from hanzoai.cloud.models.mcp_response import MCPResponse
+    from hanzoai.cloud.models.mcp_server import MCPServer
+    from hanzoai.cloud.models.machine_list import MachineList
+    from hanzoai.cloud.models.machine_view import MachineView
+    from hanzoai.cloud.models.make_in import MakeIn
+    from hanzoai.cloud.models.market_catalog import MarketCatalog
+    from hanzoai.cloud.models.market_item import MarketItem
+    from hanzoai.cloud.models.match import Match
+    from hanzoai.cloud.models.mcp_catalog import McpCatalog
+    from hanzoai.cloud.models.mcp_catalog_sync import McpCatalogSync
+    from hanzoai.cloud.models.mcp_server_list import McpServerList
+    from hanzoai.cloud.models.meet_health import MeetHealth
+    from hanzoai.cloud.models.memory_entry import MemoryEntry
+    from hanzoai.cloud.models.memory_page import MemoryPage
+    from hanzoai.cloud.models.mesh_service_list import MeshServiceList
+    from hanzoai.cloud.models.mesh_view import MeshView
+    from hanzoai.cloud.models.message_input import MessageInput
+    from hanzoai.cloud.models.message_list import MessageList
+    from hanzoai.cloud.models.metric_body import MetricBody
+    from hanzoai.cloud.models.metric_list import MetricList
+    from hanzoai.cloud.models.metric_row import MetricRow
+    from hanzoai.cloud.models.metrics import Metrics
+    from hanzoai.cloud.models.metrics_response import MetricsResponse
+    from hanzoai.cloud.models.metrics_view import MetricsView
+    from hanzoai.cloud.models.middleware import Middleware
+    from hanzoai.cloud.models.minted_key import MintedKey
+    from hanzoai.cloud.models.mirror_list import MirrorList
+    from hanzoai.cloud.models.mirror_req import MirrorReq
+    from hanzoai.cloud.models.mirror_target_req import MirrorTargetReq
+    from hanzoai.cloud.models.mirror_target_view import MirrorTargetView
+    from hanzoai.cloud.models.ml_create import MlCreate
+    from hanzoai.cloud.models.ml_resource import MlResource
+    from hanzoai.cloud.models.ml_resource_list import MlResourceList
+    from hanzoai.cloud.models.mode import Mode
+    from hanzoai.cloud.models.mode_in import ModeIn
+    from hanzoai.cloud.models.model_field import ModelField
+    from hanzoai.cloud.models.model_history import ModelHistory
+    from hanzoai.cloud.models.model_row import ModelRow
+    from hanzoai.cloud.models.model_stat import ModelStat
+    from hanzoai.cloud.models.module_info import ModuleInfo
+    from hanzoai.cloud.models.module_list import ModuleList
+    from hanzoai.cloud.models.module_state import ModuleState
+    from hanzoai.cloud.models.mutate_req import MutateReq
+    from hanzoai.cloud.models.my_referral_view import MyReferralView
+    from hanzoai.cloud.models.my_referrals import MyReferrals
+    from hanzoai.cloud.models.namespace_create_in import NamespaceCreateIn
+    from hanzoai.cloud.models.network_list import NetworkList
+    from hanzoai.cloud.models.network_view import NetworkView
+    from hanzoai.cloud.models.new_issue import NewIssue
+    from hanzoai.cloud.models.news_item import NewsItem
+    from hanzoai.cloud.models.news_response import NewsResponse
+    from hanzoai.cloud.models.next_in import NextIn
+    from hanzoai.cloud.models.node_list import NodeList
+    from hanzoai.cloud.models.node_pool_view import NodePoolView
+    from hanzoai.cloud.models.node_view import NodeView
+    from hanzoai.cloud.models.nodes_view import NodesView
+    from hanzoai.cloud.models.notify_health import NotifyHealth
+    from hanzoai.cloud.models.notify_send import NotifySend
+    from hanzoai.cloud.models.number import Number
+    from hanzoai.cloud.models.number_list import NumberList
+    from hanzoai.cloud.models.o11y_aws_account_config import O11yAWSAccountConfig
+    from hanzoai.cloud.models.o11y_aws_cloud_watch_logs_subscription import O11yAWSCloudWatchLogsSubscription
+    from hanzoai.cloud.models.o11y_aws_cloud_watch_metric_stream_filter import O11yAWSCloudWatchMetricStreamFilter
+    from hanzoai.cloud.models.o11y_aws_connection_artifact import O11yAWSConnectionArtifact
+    from hanzoai.cloud.models.o11y_aws_integration_config import O11yAWSIntegrationConfig
+    from hanzoai.cloud.models.o11y_aws_logs_collection_strategy import O11yAWSLogsCollectionStrategy
+    from hanzoai.cloud.models.o11y_aws_metrics_collection_strategy import O11yAWSMetricsCollectionStrategy
+    from hanzoai.cloud.models.o11y_aws_postable_account_config import O11yAWSPostableAccountConfig
+    from hanzoai.cloud.models.o11y_aws_service_config import O11yAWSServiceConfig
+    from hanzoai.cloud.models.o11y_aws_service_logs_config import O11yAWSServiceLogsConfig
+    from hanzoai.cloud.models.o11y_aws_service_metrics_config import O11yAWSServiceMetricsConfig
+    from hanzoai.cloud.models.o11y_aws_telemetry_collection_strategy import O11yAWSTelemetryCollectionStrategy
+    from hanzoai.cloud.models.o11y_account import O11yAccount
+    from hanzoai.cloud.models.o11y_account_config import O11yAccountConfig
+    from hanzoai.cloud.models.o11y_add_items_in import O11yAddItemsIn
+    from hanzoai.cloud.models.o11y_agent_report import O11yAgentReport
+    from hanzoai.cloud.models.o11y_aggregate_attribute_response import O11yAggregateAttributeResponse
+    from hanzoai.cloud.models.o11y_alert import O11yAlert
+    from hanzoai.cloud.models.o11y_alert_status import O11yAlertStatus
+    from hanzoai.cloud.models.o11y_alertmanagertypes_receiver import O11yAlertmanagertypesReceiver
+    from hanzoai.cloud.models.o11y_ann_item_list import O11yAnnItemList
+    from hanzoai.cloud.models.o11y_ann_item_view import O11yAnnItemView
+    from hanzoai.cloud.models.o11y_ann_items_created import O11yAnnItemsCreated
+    from hanzoai.cloud.models.o11y_ann_queue_deleted import O11yAnnQueueDeleted
+    from hanzoai.cloud.models.o11y_ann_queue_detail_view import O11yAnnQueueDetailView
+    from hanzoai.cloud.models.o11y_ann_queue_list import O11yAnnQueueList
+    from hanzoai.cloud.models.o11y_ann_queue_view import O11yAnnQueueView
+    from hanzoai.cloud.models.o11y_associated_component import O11yAssociatedComponent
+    from hanzoai.cloud.models.o11y_attribute_key import O11yAttributeKey
+    from hanzoai.cloud.models.o11y_attributes_component_entry import O11yAttributesComponentEntry
+    from hanzoai.cloud.models.o11y_authorization import O11yAuthorization
+    from hanzoai.cloud.models.o11y_availability_point import O11yAvailabilityPoint
+    from hanzoai.cloud.models.o11y_availability_response import O11yAvailabilityResponse
+    from hanzoai.cloud.models.o11y_availability_response_range import O11yAvailabilityResponseRange
+    from hanzoai.cloud.models.o11y_azure_account_config import O11yAzureAccountConfig
+    from hanzoai.cloud.models.o11y_azure_connection_artifact import O11yAzureConnectionArtifact
+    from hanzoai.cloud.models.o11y_azure_integration_config import O11yAzureIntegrationConfig
+    from hanzoai.cloud.models.o11y_azure_logs_collection_strategy import O11yAzureLogsCollectionStrategy
+    from hanzoai.cloud.models.o11y_azure_service_config import O11yAzureServiceConfig
+    from hanzoai.cloud.models.o11y_azure_service_logs_config import O11yAzureServiceLogsConfig
+    from hanzoai.cloud.models.o11y_azure_service_metrics_config import O11yAzureServiceMetricsConfig
+    from hanzoai.cloud.models.o11y_azure_telemetry_collection_strategy import O11yAzureTelemetryCollectionStrategy
+    from hanzoai.cloud.models.o11y_basic_auth import O11yBasicAuth
+    from hanzoai.cloud.models.o11y_builder_query import O11yBuilderQuery
+    from hanzoai.cloud.models.o11y_channel import O11yChannel
+    from hanzoai.cloud.models.o11y_checks import O11yChecks
+    from hanzoai.cloud.models.o11y_cloud_integration_service import O11yCloudIntegrationService
+    from hanzoai.cloud.models.o11y_cluster_list_record import O11yClusterListRecord
+    from hanzoai.cloud.models.o11y_cluster_list_request import O11yClusterListRequest
+    from hanzoai.cloud.models.o11y_cluster_list_response import O11yClusterListResponse
+    from hanzoai.cloud.models.o11y_cluster_record import O11yClusterRecord
+    from hanzoai.cloud.models.o11y_clusters import O11yClusters
+    from hanzoai.cloud.models.o11y_collected_log_attribute import O11yCollectedLogAttribute
+    from hanzoai.cloud.models.o11y_collected_metric import O11yCollectedMetric
+    from hanzoai.cloud.models.o11y_composite_query import O11yCompositeQuery
+    from hanzoai.cloud.models.o11y_connection_artifact import O11yConnectionArtifact
+    from hanzoai.cloud.models.o11y_create_queue_req import O11yCreateQueueReq
+    from hanzoai.cloud.models.o11y_credentials import O11yCredentials
+    from hanzoai.cloud.models.o11y_daemon_set_list_record import O11yDaemonSetListRecord
+    from hanzoai.cloud.models.o11y_daemon_set_list_request import O11yDaemonSetListRequest
+    from hanzoai.cloud.models.o11y_daemon_set_list_response import O11yDaemonSetListResponse
+    from hanzoai.cloud.models.o11y_daemon_set_record import O11yDaemonSetRecord
+    from hanzoai.cloud.models.o11y_daemon_sets import O11yDaemonSets
+    from hanzoai.cloud.models.o11y_data_collected import O11yDataCollected
+    from hanzoai.cloud.models.o11y_data_collected_for_integration import O11yDataCollectedForIntegration
+    from hanzoai.cloud.models.o11y_datastore_query import O11yDatastoreQuery
+    from hanzoai.cloud.models.o11y_deployment import O11yDeployment
+    from hanzoai.cloud.models.o11y_deployment_list_record import O11yDeploymentListRecord
+    from hanzoai.cloud.models.o11y_deployment_list_request import O11yDeploymentListRequest
+    from hanzoai.cloud.models.o11y_deployment_list_response import O11yDeploymentListResponse
+    from hanzoai.cloud.models.o11y_deployment_record import O11yDeploymentRecord
+    from hanzoai.cloud.models.o11y_deployments import O11yDeployments
+    from hanzoai.cloud.models.o11y_deprecated_gettable_alert import O11yDeprecatedGettableAlert
+    from hanzoai.cloud.models.o11y_discord_config import O11yDiscordConfig
+    from hanzoai.cloud.models.o11y_email_config import O11yEmailConfig
+    from hanzoai.cloud.models.o11y_event import O11yEvent
+    from hanzoai.cloud.models.o11y_filter import O11yFilter
+    from hanzoai.cloud.models.o11y_filter_attribute_key_response import O11yFilterAttributeKeyResponse
+    from hanzoai.cloud.models.o11y_filter_attribute_value_request import O11yFilterAttributeValueRequest
+    from hanzoai.cloud.models.o11y_filter_attribute_value_response import O11yFilterAttributeValueResponse
+    from hanzoai.cloud.models.o11y_filter_item import O11yFilterItem
+    from hanzoai.cloud.models.o11y_filter_set import O11yFilterSet
+    from hanzoai.cloud.models.o11y_flamegraph_span import O11yFlamegraphSpan
+    from hanzoai.cloud.models.o11y_format_options import O11yFormatOptions
+    from hanzoai.cloud.models.o11y_function import O11yFunction
+    from hanzoai.cloud.models.o11y_funnel_step import O11yFunnelStep
+    from hanzoai.cloud.models.o11y_gcp_account_config import O11yGCPAccountConfig
+    from hanzoai.cloud.models.o11y_gcp_service_config import O11yGCPServiceConfig
+    from hanzoai.cloud.models.o11y_gcp_service_logs_config import O11yGCPServiceLogsConfig
+    from hanzoai.cloud.models.o11y_gcp_service_metrics_config import O11yGCPServiceMetricsConfig
+    from hanzoai.cloud.models.o11y_gettable_account_with_connection_artifact import O11yGettableAccountWithConnectionArtifact
+    from hanzoai.cloud.models.o11y_gettable_accounts import O11yGettableAccounts
+    from hanzoai.cloud.models.o11y_gettable_agent_check_in import O11yGettableAgentCheckIn
+    from hanzoai.cloud.models.o11y_gettable_created_ingestion_key import O11yGettableCreatedIngestionKey
+    from hanzoai.cloud.models.o11y_gettable_created_ingestion_key_limit import O11yGettableCreatedIngestionKeyLimit
+    from hanzoai.cloud.models.o11y_gettable_field_keys import O11yGettableFieldKeys
+    from hanzoai.cloud.models.o11y_gettable_field_values import O11yGettableFieldValues
+    from hanzoai.cloud.models.o11y_gettable_flamegraph_trace import O11yGettableFlamegraphTrace
+    from hanzoai.cloud.models.o11y_gettable_funnel import O11yGettableFunnel
+    from hanzoai.cloud.models.o11y_gettable_host import O11yGettableHost
+    from hanzoai.cloud.models.o11y_gettable_ingestion_keys import O11yGettableIngestionKeys
+    from hanzoai.cloud.models.o11y_gettable_route_policy import O11yGettableRoutePolicy
+    from hanzoai.cloud.models.o11y_gettable_rule_state_history import O11yGettableRuleStateHistory
+    from hanzoai.cloud.models.o11y_gettable_rule_state_history_contributor import O11yGettableRuleStateHistoryContributor
+    from hanzoai.cloud.models.o11y_gettable_rule_state_history_stats import O11yGettableRuleStateHistoryStats
+    from hanzoai.cloud.models.o11y_gettable_rule_state_timeline import O11yGettableRuleStateTimeline
+    from hanzoai.cloud.models.o11y_gettable_rule_state_window import O11yGettableRuleStateWindow
+    from hanzoai.cloud.models.o11y_gettable_services_metadata import O11yGettableServicesMetadata
+    from hanzoai.cloud.models.o11y_gettable_span_mapper_groups import O11yGettableSpanMapperGroups
+    from hanzoai.cloud.models.o11y_gettable_span_mappers import O11yGettableSpanMappers
+    from hanzoai.cloud.models.o11y_gettable_test_rule import O11yGettableTestRule
+    from hanzoai.cloud.models.o11y_gettable_trace_aggregations import O11yGettableTraceAggregations
+    from hanzoai.cloud.models.o11y_gettable_waterfall_trace import O11yGettableWaterfallTrace
+    from hanzoai.cloud.models.o11y_google_chat_receiver_config import O11yGoogleChatReceiverConfig
+    from hanzoai.cloud.models.o11y_group_by_key import O11yGroupByKey
+    from hanzoai.cloud.models.o11y_http_client_config import O11yHTTPClientConfig
+    from hanzoai.cloud.models.o11y_having import O11yHaving
+    from hanzoai.cloud.models.o11y_host import O11yHost
+    from hanzoai.cloud.models.o11y_host_filter import O11yHostFilter
+    from hanzoai.cloud.models.o11y_host_list_record import O11yHostListRecord
+    from hanzoai.cloud.models.o11y_host_list_request import O11yHostListRequest
+    from hanzoai.cloud.models.o11y_host_list_response import O11yHostListResponse
+    from hanzoai.cloud.models.o11y_host_record import O11yHostRecord
+    from hanzoai.cloud.models.o11y_hosts import O11yHosts
+    from hanzoai.cloud.models.o11y_incidentio_config import O11yIncidentioConfig
+    from hanzoai.cloud.models.o11y_ingestion_key import O11yIngestionKey
+    from hanzoai.cloud.models.o11y_install_integration_request import O11yInstallIntegrationRequest
+    from hanzoai.cloud.models.o11y_installed_integration import O11yInstalledIntegration
+    from hanzoai.cloud.models.o11y_integration import O11yIntegration
+    from hanzoai.cloud.models.o11y_integration_assets import O11yIntegrationAssets
+    from hanzoai.cloud.models.o11y_integration_author import O11yIntegrationAuthor
+    from hanzoai.cloud.models.o11y_integration_config import O11yIntegrationConfig
+    from hanzoai.cloud.models.o11y_integration_config_step import O11yIntegrationConfigStep
+    from hanzoai.cloud.models.o11y_integration_connection_status import O11yIntegrationConnectionStatus
+    from hanzoai.cloud.models.o11y_integration_connection_tests import O11yIntegrationConnectionTests
+    from hanzoai.cloud.models.o11y_integrations_collected_log_attribute import O11yIntegrationsCollectedLogAttribute
+    from hanzoai.cloud.models.o11y_integrations_collected_metric import O11yIntegrationsCollectedMetric
+    from hanzoai.cloud.models.o11y_integrations_list_item import O11yIntegrationsListItem
+    from hanzoai.cloud.models.o11y_integrations_list_response import O11yIntegrationsListResponse
+    from hanzoai.cloud.models.o11y_item_input import O11yItemInput
+    from hanzoai.cloud.models.o11y_jira_config import O11yJiraConfig
+    from hanzoai.cloud.models.o11y_jira_field_config import O11yJiraFieldConfig
+    from hanzoai.cloud.models.o11y_job_list_record import O11yJobListRecord
+    from hanzoai.cloud.models.o11y_job_list_request import O11yJobListRequest
+    from hanzoai.cloud.models.o11y_job_list_response import O11yJobListResponse
+    from hanzoai.cloud.models.o11y_job_record import O11yJobRecord
+    from hanzoai.cloud.models.o11y_jobs import O11yJobs
+    from hanzoai.cloud.models.o11y_label import O11yLabel
+    from hanzoai.cloud.models.o11y_limit import O11yLimit
+    from hanzoai.cloud.models.o11y_limit_config import O11yLimitConfig
+    from hanzoai.cloud.models.o11y_limit_metric import O11yLimitMetric
+    from hanzoai.cloud.models.o11y_limit_metric_value import O11yLimitMetricValue
+    from hanzoai.cloud.models.o11y_limit_value import O11yLimitValue
+    from hanzoai.cloud.models.o11y_list_meta import O11yListMeta
+    from hanzoai.cloud.models.o11y_logs_assets import O11yLogsAssets
+    from hanzoai.cloud.models.o11y_logs_connection_test import O11yLogsConnectionTest
+    from hanzoai.cloud.models.o11y_ms_teams_config import O11yMSTeamsConfig
+    from hanzoai.cloud.models.o11y_ms_teams_v2_config import O11yMSTeamsV2Config
+    from hanzoai.cloud.models.o11y_mattermost_attachment import O11yMattermostAttachment
+    from hanzoai.cloud.models.o11y_mattermost_config import O11yMattermostConfig
+    from hanzoai.cloud.models.o11y_mattermost_field import O11yMattermostField
+    from hanzoai.cloud.models.o11y_mattermost_priority import O11yMattermostPriority
+    from hanzoai.cloud.models.o11y_mattermost_props import O11yMattermostProps
+    from hanzoai.cloud.models.o11y_metrics_component_entry import O11yMetricsComponentEntry
+    from hanzoai.cloud.models.o11y_metrics_response import O11yMetricsResponse
+    from hanzoai.cloud.models.o11y_metrics_response_range import O11yMetricsResponseRange
+    from hanzoai.cloud.models.o11y_metrics_response_series import O11yMetricsResponseSeries
+    from hanzoai.cloud.models.o11y_metrics_response_summary import O11yMetricsResponseSummary
+    from hanzoai.cloud.models.o11y_metrics_response_usage import O11yMetricsResponseUsage
+    from hanzoai.cloud.models.o11y_missing_attributes_component_entry import O11yMissingAttributesComponentEntry
+    from hanzoai.cloud.models.o11y_missing_metrics_component_entry import O11yMissingMetricsComponentEntry
+    from hanzoai.cloud.models.o11y_namespace_list_record import O11yNamespaceListRecord
+    from hanzoai.cloud.models.o11y_namespace_list_request import O11yNamespaceListRequest
+    from hanzoai.cloud.models.o11y_namespace_list_response import O11yNamespaceListResponse
+    from hanzoai.cloud.models.o11y_namespace_record import O11yNamespaceRecord
+    from hanzoai.cloud.models.o11y_namespaces import O11yNamespaces
+    from hanzoai.cloud.models.o11y_node_count_by_condition import O11yNodeCountByCondition
+    from hanzoai.cloud.models.o11y_node_counts_by_readiness import O11yNodeCountsByReadiness
+    from hanzoai.cloud.models.o11y_node_list_record import O11yNodeListRecord
+    from hanzoai.cloud.models.o11y_node_list_request import O11yNodeListRequest
+    from hanzoai.cloud.models.o11y_node_list_response import O11yNodeListResponse
+    from hanzoai.cloud.models.o11y_node_record import O11yNodeRecord
+    from hanzoai.cloud.models.o11y_nodes import O11yNodes
+    from hanzoai.cloud.models.o11y_notifier_config import O11yNotifierConfig
+    from hanzoai.cloud.models.o11y_o11y_api_key import O11yO11yAPIKey
+    from hanzoai.cloud.models.o11y_o11y_api_key_create_in import O11yO11yAPIKeyCreateIn
+    from hanzoai.cloud.models.o11y_o11y_api_key_create_out import O11yO11yAPIKeyCreateOut
+    from hanzoai.cloud.models.o11y_o11y_api_key_secret import O11yO11yAPIKeySecret
+    from hanzoai.cloud.models.o11y_o11y_api_key_update_in import O11yO11yAPIKeyUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_api_keys_out import O11yO11yAPIKeysOut
+    from hanzoai.cloud.models.o11y_o11y_account_out import O11yO11yAccountOut
+    from hanzoai.cloud.models.o11y_o11y_accounts_out import O11yO11yAccountsOut
+    from hanzoai.cloud.models.o11y_o11y_ack import O11yO11yAck
+    from hanzoai.cloud.models.o11y_o11y_affected_asset import O11yO11yAffectedAsset
+    from hanzoai.cloud.models.o11y_o11y_affected_widget import O11yO11yAffectedWidget
+    from hanzoai.cloud.models.o11y_o11y_agent_check_in_in import O11yO11yAgentCheckInIn
+    from hanzoai.cloud.models.o11y_o11y_agent_check_in_out import O11yO11yAgentCheckInOut
+    from hanzoai.cloud.models.o11y_o11y_aggregate_attributes_out import O11yO11yAggregateAttributesOut
+    from hanzoai.cloud.models.o11y_o11y_aggregation import O11yO11yAggregation
+    from hanzoai.cloud.models.o11y_o11y_aggregation_meta import O11yO11yAggregationMeta
+    from hanzoai.cloud.models.o11y_o11y_alerts_out import O11yO11yAlertsOut
+    from hanzoai.cloud.models.o11y_o11y_analyze_in import O11yO11yAnalyzeIn
+    from hanzoai.cloud.models.o11y_o11y_analyze_out import O11yO11yAnalyzeOut
+    from hanzoai.cloud.models.o11y_o11y_apdex_out import O11yO11yApdexOut
+    from hanzoai.cloud.models.o11y_o11y_apdex_set_in import O11yO11yApdexSetIn
+    from hanzoai.cloud.models.o11y_o11y_apdex_set_out import O11yO11yApdexSetOut
+    from hanzoai.cloud.models.o11y_o11y_apdex_settings import O11yO11yApdexSettings
+    from hanzoai.cloud.models.o11y_o11y_attribute_key import O11yO11yAttributeKey
+    from hanzoai.cloud.models.o11y_o11y_attribute_keys_out import O11yO11yAttributeKeysOut
+    from hanzoai.cloud.models.o11y_o11y_attribute_mapping import O11yO11yAttributeMapping
+    from hanzoai.cloud.models.o11y_o11y_attribute_values_out import O11yO11yAttributeValuesOut
+    from hanzoai.cloud.models.o11y_o11y_auth_domain import O11yO11yAuthDomain
+    from hanzoai.cloud.models.o11y_o11y_auth_domain_config import O11yO11yAuthDomainConfig
+    from hanzoai.cloud.models.o11y_o11y_auth_domain_out import O11yO11yAuthDomainOut
+    from hanzoai.cloud.models.o11y_o11y_auth_domains_out import O11yO11yAuthDomainsOut
+    from hanzoai.cloud.models.o11y_o11y_auth_n_provider_info import O11yO11yAuthNProviderInfo
+    from hanzoai.cloud.models.o11y_o11y_auth_n_support import O11yO11yAuthNSupport
+    from hanzoai.cloud.models.o11y_o11y_bulk_invite_in import O11yO11yBulkInviteIn
+    from hanzoai.cloud.models.o11y_o11y_callback_auth_n import O11yO11yCallbackAuthN
+    from hanzoai.cloud.models.o11y_o11y_change_password_in import O11yO11yChangePasswordIn
+    from hanzoai.cloud.models.o11y_o11y_channel_out import O11yO11yChannelOut
+    from hanzoai.cloud.models.o11y_o11y_channel_update_in import O11yO11yChannelUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_channels_out import O11yO11yChannelsOut
+    from hanzoai.cloud.models.o11y_o11y_check_out import O11yO11yCheckOut
+    from hanzoai.cloud.models.o11y_o11y_cluster_list_out import O11yO11yClusterListOut
+    from hanzoai.cloud.models.o11y_o11y_column_info import O11yO11yColumnInfo
+    from hanzoai.cloud.models.o11y_o11y_connection_status_out import O11yO11yConnectionStatusOut
+    from hanzoai.cloud.models.o11y_o11y_create_account_in import O11yO11yCreateAccountIn
+    from hanzoai.cloud.models.o11y_o11y_create_account_out import O11yO11yCreateAccountOut
+    from hanzoai.cloud.models.o11y_o11y_create_limit_in import O11yO11yCreateLimitIn
+    from hanzoai.cloud.models.o11y_o11y_created import O11yO11yCreated
+    from hanzoai.cloud.models.o11y_o11y_created_ingestion_key_out import O11yO11yCreatedIngestionKeyOut
+    from hanzoai.cloud.models.o11y_o11y_created_limit_out import O11yO11yCreatedLimitOut
+    from hanzoai.cloud.models.o11y_o11y_created_out import O11yO11yCreatedOut
+    from hanzoai.cloud.models.o11y_o11y_credentials_out import O11yO11yCredentialsOut
+    from hanzoai.cloud.models.o11y_o11y_daemon_set_list_out import O11yO11yDaemonSetListOut
+    from hanzoai.cloud.models.o11y_o11y_dashboard import O11yO11yDashboard
+    from hanzoai.cloud.models.o11y_o11y_dashboard_display import O11yO11yDashboardDisplay
+    from hanzoai.cloud.models.o11y_o11y_dashboard_list import O11yO11yDashboardList
+    from hanzoai.cloud.models.o11y_o11y_dashboard_list_for_user import O11yO11yDashboardListForUser
+    from hanzoai.cloud.models.o11y_o11y_dashboard_list_for_user_out import O11yO11yDashboardListForUserOut
+    from hanzoai.cloud.models.o11y_o11y_dashboard_list_item import O11yO11yDashboardListItem
+    from hanzoai.cloud.models.o11y_o11y_dashboard_list_item_for_user import O11yO11yDashboardListItemForUser
+    from hanzoai.cloud.models.o11y_o11y_dashboard_list_out import O11yO11yDashboardListOut
+    from hanzoai.cloud.models.o11y_o11y_dashboard_list_spec import O11yO11yDashboardListSpec
+    from hanzoai.cloud.models.o11y_o11y_dashboard_out import O11yO11yDashboardOut
+    from hanzoai.cloud.models.o11y_o11y_dashboard_patch_in import O11yO11yDashboardPatchIn
+    from hanzoai.cloud.models.o11y_o11y_dashboard_patch_op import O11yO11yDashboardPatchOp
+    from hanzoai.cloud.models.o11y_o11y_dashboard_postable import O11yO11yDashboardPostable
+    from hanzoai.cloud.models.o11y_o11y_dashboard_postable_tag import O11yO11yDashboardPostableTag
+    from hanzoai.cloud.models.o11y_o11y_dashboard_tag import O11yO11yDashboardTag
+    from hanzoai.cloud.models.o11y_o11y_dashboard_update_in import O11yO11yDashboardUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_dashboard_var_values import O11yO11yDashboardVarValues
+    from hanzoai.cloud.models.o11y_o11y_dashboard_vars_in import O11yO11yDashboardVarsIn
+    from hanzoai.cloud.models.o11y_o11y_dashboard_vars_out import O11yO11yDashboardVarsOut
+    from hanzoai.cloud.models.o11y_o11y_dashboard_view import O11yO11yDashboardView
+    from hanzoai.cloud.models.o11y_o11y_dashboard_view_data import O11yO11yDashboardViewData
+    from hanzoai.cloud.models.o11y_o11y_dashboard_view_list import O11yO11yDashboardViewList
+    from hanzoai.cloud.models.o11y_o11y_dashboard_view_list_out import O11yO11yDashboardViewListOut
+    from hanzoai.cloud.models.o11y_o11y_dashboard_view_out import O11yO11yDashboardViewOut
+    from hanzoai.cloud.models.o11y_o11y_dashboard_view_postable import O11yO11yDashboardViewPostable
+    from hanzoai.cloud.models.o11y_o11y_dashboard_view_update_in import O11yO11yDashboardViewUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_dependency import O11yO11yDependency
+    from hanzoai.cloud.models.o11y_o11y_dependency_graph_in import O11yO11yDependencyGraphIn
+    from hanzoai.cloud.models.o11y_o11y_deployment_list_out import O11yO11yDeploymentListOut
+    from hanzoai.cloud.models.o11y_o11y_deprecated_user import O11yO11yDeprecatedUser
+    from hanzoai.cloud.models.o11y_o11y_deprecated_user_out import O11yO11yDeprecatedUserOut
+    from hanzoai.cloud.models.o11y_o11y_deprecated_user_update import O11yO11yDeprecatedUserUpdate
+    from hanzoai.cloud.models.o11y_o11y_deprecated_users_out import O11yO11yDeprecatedUsersOut
+    from hanzoai.cloud.models.o11y_o11y_discover_in import O11yO11yDiscoverIn
+    from hanzoai.cloud.models.o11y_o11y_discover_out import O11yO11yDiscoverOut
+    from hanzoai.cloud.models.o11y_o11y_disk import O11yO11yDisk
+    from hanzoai.cloud.models.o11y_o11y_domain_filter import O11yO11yDomainFilter
+    from hanzoai.cloud.models.o11y_o11y_domain_group_by import O11yO11yDomainGroupBy
+    from hanzoai.cloud.models.o11y_o11y_domains_answer import O11yO11yDomainsAnswer
+    from hanzoai.cloud.models.o11y_o11y_domains_data import O11yO11yDomainsData
+    from hanzoai.cloud.models.o11y_o11y_domains_in import O11yO11yDomainsIn
+    from hanzoai.cloud.models.o11y_o11y_domains_out import O11yO11yDomainsOut
+    from hanzoai.cloud.models.o11y_o11y_downtime_schedule_out import O11yO11yDowntimeScheduleOut
+    from hanzoai.cloud.models.o11y_o11y_downtime_schedules_out import O11yO11yDowntimeSchedulesOut
+    from hanzoai.cloud.models.o11y_o11y_downtime_update_in import O11yO11yDowntimeUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_draft_funnel_in import O11yO11yDraftFunnelIn
+    from hanzoai.cloud.models.o11y_o11y_email_password_session_in import O11yO11yEmailPasswordSessionIn
+    from hanzoai.cloud.models.o11y_o11y_error_detail import O11yO11yErrorDetail
+    from hanzoai.cloud.models.o11y_o11y_error_gettable_issue import O11yO11yErrorGettableIssue
+    from hanzoai.cloud.models.o11y_o11y_error_gettable_issue_out import O11yO11yErrorGettableIssueOut
+    from hanzoai.cloud.models.o11y_o11y_error_issue import O11yO11yErrorIssue
+    from hanzoai.cloud.models.o11y_o11y_error_issue_out import O11yO11yErrorIssueOut
+    from hanzoai.cloud.models.o11y_o11y_error_issues import O11yO11yErrorIssues
+    from hanzoai.cloud.models.o11y_o11y_error_issues_out import O11yO11yErrorIssuesOut
+    from hanzoai.cloud.models.o11y_o11y_error_item import O11yO11yErrorItem
+    from hanzoai.cloud.models.o11y_o11y_error_update_issue_in import O11yO11yErrorUpdateIssueIn
+    from hanzoai.cloud.models.o11y_o11y_error_with_span import O11yO11yErrorWithSpan
+    from hanzoai.cloud.models.o11y_o11y_errors_count_in import O11yO11yErrorsCountIn
+    from hanzoai.cloud.models.o11y_o11y_errors_list_in import O11yO11yErrorsListIn
+    from hanzoai.cloud.models.o11y_o11y_event import O11yO11yEvent
+    from hanzoai.cloud.models.o11y_o11y_event_in import O11yO11yEventIn
+    from hanzoai.cloud.models.o11y_o11y_event_user import O11yO11yEventUser
+    from hanzoai.cloud.models.o11y_o11y_events import O11yO11yEvents
+    from hanzoai.cloud.models.o11y_o11y_feature import O11yO11yFeature
+    from hanzoai.cloud.models.o11y_o11y_features_out import O11yO11yFeaturesOut
+    from hanzoai.cloud.models.o11y_o11y_field_catalog_out import O11yO11yFieldCatalogOut
+    from hanzoai.cloud.models.o11y_o11y_field_keys_out import O11yO11yFieldKeysOut
+    from hanzoai.cloud.models.o11y_o11y_field_setting import O11yO11yFieldSetting
+    from hanzoai.cloud.models.o11y_o11y_field_values_out import O11yO11yFieldValuesOut
+    from hanzoai.cloud.models.o11y_o11y_filter import O11yO11yFilter
+    from hanzoai.cloud.models.o11y_o11y_filter_item import O11yO11yFilterItem
+    from hanzoai.cloud.models.o11y_o11y_filter_key import O11yO11yFilterKey
+    from hanzoai.cloud.models.o11y_o11y_filter_set import O11yO11yFilterSet
+    from hanzoai.cloud.models.o11y_o11y_filter_suggestions import O11yO11yFilterSuggestions
+    from hanzoai.cloud.models.o11y_o11y_filter_suggestions_out import O11yO11yFilterSuggestionsOut
+    from hanzoai.cloud.models.o11y_o11y_forgot_password_in import O11yO11yForgotPasswordIn
+    from hanzoai.cloud.models.o11y_o11y_frame import O11yO11yFrame
+    from hanzoai.cloud.models.o11y_o11y_funnel_create_in import O11yO11yFunnelCreateIn
+    from hanzoai.cloud.models.o11y_o11y_funnel_delete_out import O11yO11yFunnelDeleteOut
+    from hanzoai.cloud.models.o11y_o11y_funnel_out import O11yO11yFunnelOut
+    from hanzoai.cloud.models.o11y_o11y_funnel_row import O11yO11yFunnelRow
+    from hanzoai.cloud.models.o11y_o11y_funnel_rows_out import O11yO11yFunnelRowsOut
+    from hanzoai.cloud.models.o11y_o11y_funnel_step_window_in import O11yO11yFunnelStepWindowIn
+    from hanzoai.cloud.models.o11y_o11y_funnel_steps_update_in import O11yO11yFunnelStepsUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_funnel_update_in import O11yO11yFunnelUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_funnel_window_in import O11yO11yFunnelWindowIn
+    from hanzoai.cloud.models.o11y_o11y_funnels_out import O11yO11yFunnelsOut
+    from hanzoai.cloud.models.o11y_o11y_gettable_host_out import O11yO11yGettableHostOut
+    from hanzoai.cloud.models.o11y_o11y_global_config import O11yO11yGlobalConfig
+    from hanzoai.cloud.models.o11y_o11y_global_config_out import O11yO11yGlobalConfigOut
+    from hanzoai.cloud.models.o11y_o11y_google_config import O11yO11yGoogleConfig
+    from hanzoai.cloud.models.o11y_o11y_health_out import O11yO11yHealthOut
+    from hanzoai.cloud.models.o11y_o11y_host_list_out import O11yO11yHostListOut
+    from hanzoai.cloud.models.o11y_o11y_ident_n import O11yO11yIdentN
+    from hanzoai.cloud.models.o11y_o11y_identifiable import O11yO11yIdentifiable
+    from hanzoai.cloud.models.o11y_o11y_identifiable_out import O11yO11yIdentifiableOut
+    from hanzoai.cloud.models.o11y_o11y_infra_attribute_keys_out import O11yO11yInfraAttributeKeysOut
+    from hanzoai.cloud.models.o11y_o11y_infra_attribute_values_out import O11yO11yInfraAttributeValuesOut
+    from hanzoai.cloud.models.o11y_o11y_infra_checks_out import O11yO11yInfraChecksOut
+    from hanzoai.cloud.models.o11y_o11y_infra_clusters_out import O11yO11yInfraClustersOut
+    from hanzoai.cloud.models.o11y_o11y_infra_daemon_sets_out import O11yO11yInfraDaemonSetsOut
+    from hanzoai.cloud.models.o11y_o11y_infra_deployments_out import O11yO11yInfraDeploymentsOut
+    from hanzoai.cloud.models.o11y_o11y_infra_hosts_out import O11yO11yInfraHostsOut
+    from hanzoai.cloud.models.o11y_o11y_infra_jobs_out import O11yO11yInfraJobsOut
+    from hanzoai.cloud.models.o11y_o11y_infra_namespaces_out import O11yO11yInfraNamespacesOut
+    from hanzoai.cloud.models.o11y_o11y_infra_nodes_out import O11yO11yInfraNodesOut
+    from hanzoai.cloud.models.o11y_o11y_infra_pods_out import O11yO11yInfraPodsOut
+    from hanzoai.cloud.models.o11y_o11y_infra_stateful_sets_out import O11yO11yInfraStatefulSetsOut
+    from hanzoai.cloud.models.o11y_o11y_infra_volumes_out import O11yO11yInfraVolumesOut
+    from hanzoai.cloud.models.o11y_o11y_ingestion_keys_out import O11yO11yIngestionKeysOut
+    from hanzoai.cloud.models.o11y_o11y_install_out import O11yO11yInstallOut
+    from hanzoai.cloud.models.o11y_o11y_integration_ack import O11yO11yIntegrationAck
+    from hanzoai.cloud.models.o11y_o11y_integration_out import O11yO11yIntegrationOut
+    from hanzoai.cloud.models.o11y_o11y_integrations_list_out import O11yO11yIntegrationsListOut
+    from hanzoai.cloud.models.o11y_o11y_invite import O11yO11yInvite
+    from hanzoai.cloud.models.o11y_o11y_invite_in import O11yO11yInviteIn
+    from hanzoai.cloud.models.o11y_o11y_invite_out import O11yO11yInviteOut
+    from hanzoai.cloud.models.o11y_o11y_job_list_out import O11yO11yJobListOut
+    from hanzoai.cloud.models.o11y_o11y_k8s_onboarding import O11yO11yK8sOnboarding
+    from hanzoai.cloud.models.o11y_o11y_llm_annotation import O11yO11yLLMAnnotation
+    from hanzoai.cloud.models.o11y_o11y_llm_annotation_out import O11yO11yLLMAnnotationOut
+    from hanzoai.cloud.models.o11y_o11y_llm_annotations_out import O11yO11yLLMAnnotationsOut
+    from hanzoai.cloud.models.o11y_o11y_llm_annotations_page import O11yO11yLLMAnnotationsPage
+    from hanzoai.cloud.models.o11y_o11y_llm_ingest_annotation import O11yO11yLLMIngestAnnotation
+    from hanzoai.cloud.models.o11y_o11y_llm_ingest_score import O11yO11yLLMIngestScore
+    from hanzoai.cloud.models.o11y_o11y_llm_observation import O11yO11yLLMObservation
+    from hanzoai.cloud.models.o11y_o11y_llm_observations_out import O11yO11yLLMObservationsOut
+    from hanzoai.cloud.models.o11y_o11y_llm_observations_page import O11yO11yLLMObservationsPage
+    from hanzoai.cloud.models.o11y_o11y_llm_pricing_cache_costs import O11yO11yLLMPricingCacheCosts
+    from hanzoai.cloud.models.o11y_o11y_llm_pricing_rule import O11yO11yLLMPricingRule
+    from hanzoai.cloud.models.o11y_o11y_llm_pricing_rule_out import O11yO11yLLMPricingRuleOut
+    from hanzoai.cloud.models.o11y_o11y_llm_pricing_rules_out import O11yO11yLLMPricingRulesOut
+    from hanzoai.cloud.models.o11y_o11y_llm_pricing_rules_page import O11yO11yLLMPricingRulesPage
+    from hanzoai.cloud.models.o11y_o11y_llm_rule_pricing import O11yO11yLLMRulePricing
+    from hanzoai.cloud.models.o11y_o11y_llm_score import O11yO11yLLMScore
+    from hanzoai.cloud.models.o11y_o11y_llm_score_out import O11yO11yLLMScoreOut
+    from hanzoai.cloud.models.o11y_o11y_llm_scores_out import O11yO11yLLMScoresOut
+    from hanzoai.cloud.models.o11y_o11y_llm_scores_page import O11yO11yLLMScoresPage
+    from hanzoai.cloud.models.o11y_o11y_llm_session import O11yO11yLLMSession
+    from hanzoai.cloud.models.o11y_o11y_llm_sessions_out import O11yO11yLLMSessionsOut
+    from hanzoai.cloud.models.o11y_o11y_llm_sessions_page import O11yO11yLLMSessionsPage
+    from hanzoai.cloud.models.o11y_o11y_llm_trace import O11yO11yLLMTrace
+    from hanzoai.cloud.models.o11y_o11y_llm_traces_out import O11yO11yLLMTracesOut
+    from hanzoai.cloud.models.o11y_o11y_llm_traces_page import O11yO11yLLMTracesPage
+    from hanzoai.cloud.models.o11y_o11y_llm_updatable_pricing_rule import O11yO11yLLMUpdatablePricingRule
+    from hanzoai.cloud.models.o11y_o11y_llm_updatable_pricing_rules import O11yO11yLLMUpdatablePricingRules
+    from hanzoai.cloud.models.o11y_o11y_llm_user import O11yO11yLLMUser
+    from hanzoai.cloud.models.o11y_o11y_llm_users_out import O11yO11yLLMUsersOut
+    from hanzoai.cloud.models.o11y_o11y_llm_users_page import O11yO11yLLMUsersPage
+    from hanzoai.cloud.models.o11y_o11y_license_active_out import O11yO11yLicenseActiveOut
+    from hanzoai.cloud.models.o11y_o11y_licenses_out import O11yO11yLicensesOut
+    from hanzoai.cloud.models.o11y_o11y_list_error import O11yO11yListError
+    from hanzoai.cloud.models.o11y_o11y_log_aggregate_bucket import O11yO11yLogAggregateBucket
+    from hanzoai.cloud.models.o11y_o11y_log_aggregate_out import O11yO11yLogAggregateOut
+    from hanzoai.cloud.models.o11y_o11y_log_config_version import O11yO11yLogConfigVersion
+    from hanzoai.cloud.models.o11y_o11y_log_filter import O11yO11yLogFilter
+    from hanzoai.cloud.models.o11y_o11y_log_filter_item import O11yO11yLogFilterItem
+    from hanzoai.cloud.models.o11y_o11y_log_filter_key import O11yO11yLogFilterKey
+    from hanzoai.cloud.models.o11y_o11y_log_parse_from import O11yO11yLogParseFrom
+    from hanzoai.cloud.models.o11y_o11y_log_pipeline import O11yO11yLogPipeline
+    from hanzoai.cloud.models.o11y_o11y_log_pipeline_create_in import O11yO11yLogPipelineCreateIn
+    from hanzoai.cloud.models.o11y_o11y_log_pipeline_operator import O11yO11yLogPipelineOperator
+    from hanzoai.cloud.models.o11y_o11y_log_pipeline_preview import O11yO11yLogPipelinePreview
+    from hanzoai.cloud.models.o11y_o11y_log_pipeline_preview_in import O11yO11yLogPipelinePreviewIn
+    from hanzoai.cloud.models.o11y_o11y_log_pipeline_preview_out import O11yO11yLogPipelinePreviewOut
+    from hanzoai.cloud.models.o11y_o11y_log_pipeline_route import O11yO11yLogPipelineRoute
+    from hanzoai.cloud.models.o11y_o11y_log_pipelines import O11yO11yLogPipelines
+    from hanzoai.cloud.models.o11y_o11y_log_pipelines_out import O11yO11yLogPipelinesOut
+    from hanzoai.cloud.models.o11y_o11y_log_postable_pipeline import O11yO11yLogPostablePipeline
+    from hanzoai.cloud.models.o11y_o11y_log_promote_index import O11yO11yLogPromoteIndex
+    from hanzoai.cloud.models.o11y_o11y_log_promote_out import O11yO11yLogPromoteOut
+    from hanzoai.cloud.models.o11y_o11y_log_promote_path import O11yO11yLogPromotePath
+    from hanzoai.cloud.models.o11y_o11y_log_promoted_out import O11yO11yLogPromotedOut
+    from hanzoai.cloud.models.o11y_o11y_log_record import O11yO11yLogRecord
+    from hanzoai.cloud.models.o11y_o11y_log_records_out import O11yO11yLogRecordsOut
+    from hanzoai.cloud.models.o11y_o11y_logs_out import O11yO11yLogsOut
+    from hanzoai.cloud.models.o11y_o11y_message import O11yO11yMessage
+    from hanzoai.cloud.models.o11y_o11y_metric_ack_out import O11yO11yMetricAckOut
+    from hanzoai.cloud.models.o11y_o11y_metric_alert import O11yO11yMetricAlert
+    from hanzoai.cloud.models.o11y_o11y_metric_alerts import O11yO11yMetricAlerts
+    from hanzoai.cloud.models.o11y_o11y_metric_alerts_out import O11yO11yMetricAlertsOut
+    from hanzoai.cloud.models.o11y_o11y_metric_attribute import O11yO11yMetricAttribute
+    from hanzoai.cloud.models.o11y_o11y_metric_attributes import O11yO11yMetricAttributes
+    from hanzoai.cloud.models.o11y_o11y_metric_attributes_out import O11yO11yMetricAttributesOut
+    from hanzoai.cloud.models.o11y_o11y_metric_dashboards import O11yO11yMetricDashboards
+    from hanzoai.cloud.models.o11y_o11y_metric_dashboards_out import O11yO11yMetricDashboardsOut
+    from hanzoai.cloud.models.o11y_o11y_metric_field import O11yO11yMetricField
+    from hanzoai.cloud.models.o11y_o11y_metric_filter import O11yO11yMetricFilter
+    from hanzoai.cloud.models.o11y_o11y_metric_highlights import O11yO11yMetricHighlights
+    from hanzoai.cloud.models.o11y_o11y_metric_highlights_out import O11yO11yMetricHighlightsOut
+    from hanzoai.cloud.models.o11y_o11y_metric_inspect_in import O11yO11yMetricInspectIn
+    from hanzoai.cloud.models.o11y_o11y_metric_inspect_out import O11yO11yMetricInspectOut
+    from hanzoai.cloud.models.o11y_o11y_metric_label import O11yO11yMetricLabel
+    from hanzoai.cloud.models.o11y_o11y_metric_list import O11yO11yMetricList
+    from hanzoai.cloud.models.o11y_o11y_metric_list_out import O11yO11yMetricListOut
+    from hanzoai.cloud.models.o11y_o11y_metric_metadata import O11yO11yMetricMetadata
+    from hanzoai.cloud.models.o11y_o11y_metric_metadata_out import O11yO11yMetricMetadataOut
+    from hanzoai.cloud.models.o11y_o11y_metric_metadata_save_in import O11yO11yMetricMetadataSaveIn
+    from hanzoai.cloud.models.o11y_o11y_metric_onboarding import O11yO11yMetricOnboarding
+    from hanzoai.cloud.models.o11y_o11y_metric_onboarding_out import O11yO11yMetricOnboardingOut
+    from hanzoai.cloud.models.o11y_o11y_metric_order import O11yO11yMetricOrder
+    from hanzoai.cloud.models.o11y_o11y_metric_panel import O11yO11yMetricPanel
+    from hanzoai.cloud.models.o11y_o11y_metric_point import O11yO11yMetricPoint
+    from hanzoai.cloud.models.o11y_o11y_metric_series import O11yO11yMetricSeries
+    from hanzoai.cloud.models.o11y_o11y_metric_series_set import O11yO11yMetricSeriesSet
+    from hanzoai.cloud.models.o11y_o11y_metric_stat import O11yO11yMetricStat
+    from hanzoai.cloud.models.o11y_o11y_metric_stats import O11yO11yMetricStats
+    from hanzoai.cloud.models.o11y_o11y_metric_stats_in import O11yO11yMetricStatsIn
+    from hanzoai.cloud.models.o11y_o11y_metric_stats_out import O11yO11yMetricStatsOut
+    from hanzoai.cloud.models.o11y_o11y_metric_summary import O11yO11yMetricSummary
+    from hanzoai.cloud.models.o11y_o11y_metric_treemap import O11yO11yMetricTreemap
+    from hanzoai.cloud.models.o11y_o11y_metric_treemap_in import O11yO11yMetricTreemapIn
+    from hanzoai.cloud.models.o11y_o11y_metric_treemap_out import O11yO11yMetricTreemapOut
+    from hanzoai.cloud.models.o11y_o11y_metrics_query_range_out import O11yO11yMetricsQueryRangeOut
+    from hanzoai.cloud.models.o11y_o11y_my_service_account_update_in import O11yO11yMyServiceAccountUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_namespace_list_out import O11yO11yNamespaceListOut
+    from hanzoai.cloud.models.o11y_o11y_next_prev_error_ids import O11yO11yNextPrevErrorIDs
+    from hanzoai.cloud.models.o11y_o11y_node_list_out import O11yO11yNodeListOut
+    from hanzoai.cloud.models.o11y_o11y_oidc_config import O11yO11yOIDCConfig
+    from hanzoai.cloud.models.o11y_o11y_object import O11yO11yObject
+    from hanzoai.cloud.models.o11y_o11y_object_group import O11yO11yObjectGroup
+    from hanzoai.cloud.models.o11y_o11y_occurrence import O11yO11yOccurrence
+    from hanzoai.cloud.models.o11y_o11y_occurrence_frame import O11yO11yOccurrenceFrame
+    from hanzoai.cloud.models.o11y_o11y_onboarding_out import O11yO11yOnboardingOut
+    from hanzoai.cloud.models.o11y_o11y_operation import O11yO11yOperation
+    from hanzoai.cloud.models.o11y_o11y_operations_in import O11yO11yOperationsIn
+    from hanzoai.cloud.models.o11y_o11y_operations_out import O11yO11yOperationsOut
+    from hanzoai.cloud.models.o11y_o11y_org_stats_out import O11yO11yOrgStatsOut
+    from hanzoai.cloud.models.o11y_o11y_organization import O11yO11yOrganization
+    from hanzoai.cloud.models.o11y_o11y_organization_out import O11yO11yOrganizationOut
+    from hanzoai.cloud.models.o11y_o11y_overall_state_transitions_out import O11yO11yOverallStateTransitionsOut
+    from hanzoai.cloud.models.o11y_o11y_password_auth_n import O11yO11yPasswordAuthN
+    from hanzoai.cloud.models.o11y_o11y_percentile_position import O11yO11yPercentilePosition
+    from hanzoai.cloud.models.o11y_o11y_percentiles import O11yO11yPercentiles
+    from hanzoai.cloud.models.o11y_o11y_pod_list_out import O11yO11yPodListOut
+    from hanzoai.cloud.models.o11y_o11y_pod_onboarding import O11yO11yPodOnboarding
+    from hanzoai.cloud.models.o11y_o11y_postable_auth_domain import O11yO11yPostableAuthDomain
+    from hanzoai.cloud.models.o11y_o11y_postable_user import O11yO11yPostableUser
+    from hanzoai.cloud.models.o11y_o11y_preference import O11yO11yPreference
+    from hanzoai.cloud.models.o11y_o11y_preference_out import O11yO11yPreferenceOut
+    from hanzoai.cloud.models.o11y_o11y_preferences_out import O11yO11yPreferencesOut
+    from hanzoai.cloud.models.o11y_o11y_process_list_out import O11yO11yProcessListOut
+    from hanzoai.cloud.models.o11y_o11y_prom_query_out import O11yO11yPromQueryOut
+    from hanzoai.cloud.models.o11y_o11y_prom_result import O11yO11yPromResult
+    from hanzoai.cloud.models.o11y_o11y_public_dashboard import O11yO11yPublicDashboard
+    from hanzoai.cloud.models.o11y_o11y_public_dashboard_data import O11yO11yPublicDashboardData
+    from hanzoai.cloud.models.o11y_o11y_public_dashboard_data_out import O11yO11yPublicDashboardDataOut
+    from hanzoai.cloud.models.o11y_o11y_public_dashboard_out import O11yO11yPublicDashboardOut
+    from hanzoai.cloud.models.o11y_o11y_public_dashboard_v1 import O11yO11yPublicDashboardV1
+    from hanzoai.cloud.models.o11y_o11y_public_dashboard_write_in import O11yO11yPublicDashboardWriteIn
+    from hanzoai.cloud.models.o11y_o11y_pvc_list_out import O11yO11yPvcListOut
+    from hanzoai.cloud.models.o11y_o11y_query_filter_analysis import O11yO11yQueryFilterAnalysis
+    from hanzoai.cloud.models.o11y_o11y_query_range import O11yO11yQueryRange
+    from hanzoai.cloud.models.o11y_o11y_query_range_data import O11yO11yQueryRangeData
+    from hanzoai.cloud.models.o11y_o11y_query_range_format_out import O11yO11yQueryRangeFormatOut
+    from hanzoai.cloud.models.o11y_o11y_query_range_out import O11yO11yQueryRangeOut
+    from hanzoai.cloud.models.o11y_o11y_query_range_preview_in import O11yO11yQueryRangePreviewIn
+    from hanzoai.cloud.models.o11y_o11y_query_range_preview_out import O11yO11yQueryRangePreviewOut
+    from hanzoai.cloud.models.o11y_o11y_query_stats import O11yO11yQueryStats
+    from hanzoai.cloud.models.o11y_o11y_query_warning import O11yO11yQueryWarning
+    from hanzoai.cloud.models.o11y_o11y_query_warning_note import O11yO11yQueryWarningNote
+    from hanzoai.cloud.models.o11y_o11y_queue_check import O11yO11yQueueCheck
+    from hanzoai.cloud.models.o11y_o11y_queue_checks_out import O11yO11yQueueChecksOut
+    from hanzoai.cloud.models.o11y_o11y_queue_filter_key import O11yO11yQueueFilterKey
+    from hanzoai.cloud.models.o11y_o11y_queue_filter_rule import O11yO11yQueueFilterRule
+    from hanzoai.cloud.models.o11y_o11y_queue_filter_set import O11yO11yQueueFilterSet
+    from hanzoai.cloud.models.o11y_o11y_queue_in import O11yO11yQueueIn
+    from hanzoai.cloud.models.o11y_o11y_queue_list_in import O11yO11yQueueListIn
+    from hanzoai.cloud.models.o11y_o11y_queue_row import O11yO11yQueueRow
+    from hanzoai.cloud.models.o11y_o11y_queue_rows_out import O11yO11yQueueRowsOut
+    from hanzoai.cloud.models.o11y_o11y_quick_filters_out import O11yO11yQuickFiltersOut
+    from hanzoai.cloud.models.o11y_o11y_reduction_rule import O11yO11yReductionRule
+    from hanzoai.cloud.models.o11y_o11y_reduction_rule_create_in import O11yO11yReductionRuleCreateIn
+    from hanzoai.cloud.models.o11y_o11y_reduction_rule_list_out import O11yO11yReductionRuleListOut
+    from hanzoai.cloud.models.o11y_o11y_reduction_rule_out import O11yO11yReductionRuleOut
+    from hanzoai.cloud.models.o11y_o11y_reduction_rule_preview import O11yO11yReductionRulePreview
+    from hanzoai.cloud.models.o11y_o11y_reduction_rule_preview_in import O11yO11yReductionRulePreviewIn
+    from hanzoai.cloud.models.o11y_o11y_reduction_rule_preview_out import O11yO11yReductionRulePreviewOut
+    from hanzoai.cloud.models.o11y_o11y_reduction_rule_save_in import O11yO11yReductionRuleSaveIn
+    from hanzoai.cloud.models.o11y_o11y_reduction_rules import O11yO11yReductionRules
+    from hanzoai.cloud.models.o11y_o11y_reduction_series_out import O11yO11yReductionSeriesOut
+    from hanzoai.cloud.models.o11y_o11y_reduction_series_result import O11yO11yReductionSeriesResult
+    from hanzoai.cloud.models.o11y_o11y_reduction_stats import O11yO11yReductionStats
+    from hanzoai.cloud.models.o11y_o11y_reduction_stats_out import O11yO11yReductionStatsOut
+    from hanzoai.cloud.models.o11y_o11y_register_in import O11yO11yRegisterIn
+    from hanzoai.cloud.models.o11y_o11y_register_out import O11yO11yRegisterOut
+    from hanzoai.cloud.models.o11y_o11y_reset_password_in import O11yO11yResetPasswordIn
+    from hanzoai.cloud.models.o11y_o11y_reset_token import O11yO11yResetToken
+    from hanzoai.cloud.models.o11y_o11y_reset_token_out import O11yO11yResetTokenOut
+    from hanzoai.cloud.models.o11y_o11y_reset_token_ref import O11yO11yResetTokenRef
+    from hanzoai.cloud.models.o11y_o11y_resource_ref import O11yO11yResourceRef
+    from hanzoai.cloud.models.o11y_o11y_retention_match import O11yO11yRetentionMatch
+    from hanzoai.cloud.models.o11y_o11y_retention_out import O11yO11yRetentionOut
+    from hanzoai.cloud.models.o11y_o11y_retention_rule import O11yO11yRetentionRule
+    from hanzoai.cloud.models.o11y_o11y_retention_set_in import O11yO11yRetentionSetIn
+    from hanzoai.cloud.models.o11y_o11y_retention_set_out import O11yO11yRetentionSetOut
+    from hanzoai.cloud.models.o11y_o11y_retry import O11yO11yRetry
+    from hanzoai.cloud.models.o11y_o11y_role import O11yO11yRole
+    from hanzoai.cloud.models.o11y_o11y_role_create_in import O11yO11yRoleCreateIn
+    from hanzoai.cloud.models.o11y_o11y_role_create_out import O11yO11yRoleCreateOut
+    from hanzoai.cloud.models.o11y_o11y_role_detail import O11yO11yRoleDetail
+    from hanzoai.cloud.models.o11y_o11y_role_id import O11yO11yRoleID
+    from hanzoai.cloud.models.o11y_o11y_role_mapping import O11yO11yRoleMapping
+    from hanzoai.cloud.models.o11y_o11y_role_out import O11yO11yRoleOut
+    from hanzoai.cloud.models.o11y_o11y_role_update_in import O11yO11yRoleUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_roles_out import O11yO11yRolesOut
+    from hanzoai.cloud.models.o11y_o11y_rotate_session_in import O11yO11yRotateSessionIn
+    from hanzoai.cloud.models.o11y_o11y_route_policies_out import O11yO11yRoutePoliciesOut
+    from hanzoai.cloud.models.o11y_o11y_route_policy_out import O11yO11yRoutePolicyOut
+    from hanzoai.cloud.models.o11y_o11y_route_policy_update_in import O11yO11yRoutePolicyUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_rule_history_contributors_out import O11yO11yRuleHistoryContributorsOut
+    from hanzoai.cloud.models.o11y_o11y_rule_history_filter_keys_out import O11yO11yRuleHistoryFilterKeysOut
+    from hanzoai.cloud.models.o11y_o11y_rule_history_filter_values_out import O11yO11yRuleHistoryFilterValuesOut
+    from hanzoai.cloud.models.o11y_o11y_rule_history_overall_status_out import O11yO11yRuleHistoryOverallStatusOut
+    from hanzoai.cloud.models.o11y_o11y_rule_history_query_in import O11yO11yRuleHistoryQueryIn
+    from hanzoai.cloud.models.o11y_o11y_rule_history_stats_out import O11yO11yRuleHistoryStatsOut
+    from hanzoai.cloud.models.o11y_o11y_rule_history_timeline_out import O11yO11yRuleHistoryTimelineOut
+    from hanzoai.cloud.models.o11y_o11y_rule_out import O11yO11yRuleOut
+    from hanzoai.cloud.models.o11y_o11y_rule_state_contributors_out import O11yO11yRuleStateContributorsOut
+    from hanzoai.cloud.models.o11y_o11y_rule_state_timeline_out import O11yO11yRuleStateTimelineOut
+    from hanzoai.cloud.models.o11y_o11y_rule_stats_out import O11yO11yRuleStatsOut
+    from hanzoai.cloud.models.o11y_o11y_rules_out import O11yO11yRulesOut
+    from hanzoai.cloud.models.o11y_o11y_saml_config import O11yO11ySAMLConfig
+    from hanzoai.cloud.models.o11y_o11y_saved_view_create_out import O11yO11ySavedViewCreateOut
+    from hanzoai.cloud.models.o11y_o11y_saved_view_delete_out import O11yO11ySavedViewDeleteOut
+    from hanzoai.cloud.models.o11y_o11y_saved_view_list_out import O11yO11ySavedViewListOut
+    from hanzoai.cloud.models.o11y_o11y_saved_view_out import O11yO11ySavedViewOut
+    from hanzoai.cloud.models.o11y_o11y_saved_view_update_in import O11yO11ySavedViewUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_sentry_event_out import O11yO11ySentryEventOut
+    from hanzoai.cloud.models.o11y_o11y_sentry_issue_events_out import O11yO11ySentryIssueEventsOut
+    from hanzoai.cloud.models.o11y_o11y_sentry_postable_project import O11yO11ySentryPostableProject
+    from hanzoai.cloud.models.o11y_o11y_sentry_project import O11yO11ySentryProject
+    from hanzoai.cloud.models.o11y_o11y_sentry_project_out import O11yO11ySentryProjectOut
+    from hanzoai.cloud.models.o11y_o11y_sentry_projects import O11yO11ySentryProjects
+    from hanzoai.cloud.models.o11y_o11y_sentry_projects_out import O11yO11ySentryProjectsOut
+    from hanzoai.cloud.models.o11y_o11y_sentry_update_issue_in import O11yO11ySentryUpdateIssueIn
+    from hanzoai.cloud.models.o11y_o11y_service import O11yO11yService
+    from hanzoai.cloud.models.o11y_o11y_service_account import O11yO11yServiceAccount
+    from hanzoai.cloud.models.o11y_o11y_service_account_create_in import O11yO11yServiceAccountCreateIn
+    from hanzoai.cloud.models.o11y_o11y_service_account_create_out import O11yO11yServiceAccountCreateOut
+    from hanzoai.cloud.models.o11y_o11y_service_account_detail import O11yO11yServiceAccountDetail
+    from hanzoai.cloud.models.o11y_o11y_service_account_out import O11yO11yServiceAccountOut
+    from hanzoai.cloud.models.o11y_o11y_service_account_role import O11yO11yServiceAccountRole
+    from hanzoai.cloud.models.o11y_o11y_service_account_role_grant_in import O11yO11yServiceAccountRoleGrantIn
+    from hanzoai.cloud.models.o11y_o11y_service_account_roles_out import O11yO11yServiceAccountRolesOut
+    from hanzoai.cloud.models.o11y_o11y_service_account_update_in import O11yO11yServiceAccountUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_service_accounts_out import O11yO11yServiceAccountsOut
+    from hanzoai.cloud.models.o11y_o11y_service_out import O11yO11yServiceOut
+    from hanzoai.cloud.models.o11y_o11y_service_tag import O11yO11yServiceTag
+    from hanzoai.cloud.models.o11y_o11y_service_warning import O11yO11yServiceWarning
+    from hanzoai.cloud.models.o11y_o11y_services_in import O11yO11yServicesIn
+    from hanzoai.cloud.models.o11y_o11y_services_metadata_out import O11yO11yServicesMetadataOut
+    from hanzoai.cloud.models.o11y_o11y_services_out import O11yO11yServicesOut
+    from hanzoai.cloud.models.o11y_o11y_session_context import O11yO11ySessionContext
+    from hanzoai.cloud.models.o11y_o11y_session_context_out import O11yO11ySessionContextOut
+    from hanzoai.cloud.models.o11y_o11y_session_org import O11yO11ySessionOrg
+    from hanzoai.cloud.models.o11y_o11y_set_role_in import O11yO11ySetRoleIn
+    from hanzoai.cloud.models.o11y_o11y_signal_filters import O11yO11ySignalFilters
+    from hanzoai.cloud.models.o11y_o11y_signal_filters_out import O11yO11ySignalFiltersOut
+    from hanzoai.cloud.models.o11y_o11y_span_mapper_create_in import O11yO11ySpanMapperCreateIn
+    from hanzoai.cloud.models.o11y_o11y_span_mapper_group_out import O11yO11ySpanMapperGroupOut
+    from hanzoai.cloud.models.o11y_o11y_span_mapper_group_update_in import O11yO11ySpanMapperGroupUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_span_mapper_groups_out import O11yO11ySpanMapperGroupsOut
+    from hanzoai.cloud.models.o11y_o11y_span_mapper_out import O11yO11ySpanMapperOut
+    from hanzoai.cloud.models.o11y_o11y_span_mapper_update_in import O11yO11ySpanMapperUpdateIn
+    from hanzoai.cloud.models.o11y_o11y_span_mappers_out import O11yO11ySpanMappersOut
+    from hanzoai.cloud.models.o11y_o11y_span_percentile import O11yO11ySpanPercentile
+    from hanzoai.cloud.models.o11y_o11y_span_percentile_in import O11yO11ySpanPercentileIn
+    from hanzoai.cloud.models.o11y_o11y_span_percentile_out import O11yO11ySpanPercentileOut
+    from hanzoai.cloud.models.o11y_o11y_stat import O11yO11yStat
+    from hanzoai.cloud.models.o11y_o11y_stateful_set_list_out import O11yO11yStatefulSetListOut
+    from hanzoai.cloud.models.o11y_o11y_stats import O11yO11yStats
+    from hanzoai.cloud.models.o11y_o11y_stats_out import O11yO11yStatsOut
+    from hanzoai.cloud.models.o11y_o11y_substitute_vars_out import O11yO11ySubstituteVarsOut
+    from hanzoai.cloud.models.o11y_o11y_table import O11yO11yTable
+    from hanzoai.cloud.models.o11y_o11y_tag_filter import O11yO11yTagFilter
+    from hanzoai.cloud.models.o11y_o11y_tag_query import O11yO11yTagQuery
+    from hanzoai.cloud.models.o11y_o11y_telemetry_field import O11yO11yTelemetryField
+    from hanzoai.cloud.models.o11y_o11y_test_notification_out import O11yO11yTestNotificationOut
+    from hanzoai.cloud.models.o11y_o11y_test_notification_result import O11yO11yTestNotificationResult
+    from hanzoai.cloud.models.o11y_o11y_test_rule_out import O11yO11yTestRuleOut
+    from hanzoai.cloud.models.o11y_o11y_toggle import O11yO11yToggle
+    from hanzoai.cloud.models.o11y_o11y_token import O11yO11yToken
+    from hanzoai.cloud.models.o11y_o11y_token_out import O11yO11yTokenOut
+    from hanzoai.cloud.models.o11y_o11y_top_level_ops_in import O11yO11yTopLevelOpsIn
+    from hanzoai.cloud.models.o11y_o11y_trace import O11yO11yTrace
+    from hanzoai.cloud.models.o11y_o11y_trace_aggregations_in import O11yO11yTraceAggregationsIn
+    from hanzoai.cloud.models.o11y_o11y_trace_aggregations_out import O11yO11yTraceAggregationsOut
+    from hanzoai.cloud.models.o11y_o11y_trace_detail import O11yO11yTraceDetail
+    from hanzoai.cloud.models.o11y_o11y_trace_flamegraph_in import O11yO11yTraceFlamegraphIn
+    from hanzoai.cloud.models.o11y_o11y_trace_flamegraph_out import O11yO11yTraceFlamegraphOut
+    from hanzoai.cloud.models.o11y_o11y_trace_out import O11yO11yTraceOut
+    from hanzoai.cloud.models.o11y_o11y_trace_span_window import O11yO11yTraceSpanWindow
+    from hanzoai.cloud.models.o11y_o11y_trace_waterfall_in import O11yO11yTraceWaterfallIn
+    from hanzoai.cloud.models.o11y_o11y_trace_waterfall_out import O11yO11yTraceWaterfallOut
+    from hanzoai.cloud.models.o11y_o11y_traces import O11yO11yTraces
+    from hanzoai.cloud.models.o11y_o11y_traces_out import O11yO11yTracesOut
+    from hanzoai.cloud.models.o11y_o11y_transaction import O11yO11yTransaction
+    from hanzoai.cloud.models.o11y_o11y_transaction_group import O11yO11yTransactionGroup
+    from hanzoai.cloud.models.o11y_o11y_transaction_result import O11yO11yTransactionResult
+    from hanzoai.cloud.models.o11y_o11y_treemap_entry import O11yO11yTreemapEntry
+    from hanzoai.cloud.models.o11y_o11y_updatable_auth_domain import O11yO11yUpdatableAuthDomain
+    from hanzoai.cloud.models.o11y_o11y_updatable_preference import O11yO11yUpdatablePreference
+    from hanzoai.cloud.models.o11y_o11y_updatable_quick_filters import O11yO11yUpdatableQuickFilters
+    from hanzoai.cloud.models.o11y_o11y_updatable_user import O11yO11yUpdatableUser
+    from hanzoai.cloud.models.o11y_o11y_update_account_in import O11yO11yUpdateAccountIn
+    from hanzoai.cloud.models.o11y_o11y_update_ingestion_key_in import O11yO11yUpdateIngestionKeyIn
+    from hanzoai.cloud.models.o11y_o11y_update_limit_in import O11yO11yUpdateLimitIn
+    from hanzoai.cloud.models.o11y_o11y_update_service_in import O11yO11yUpdateServiceIn
+    from hanzoai.cloud.models.o11y_o11y_usage_item import O11yO11yUsageItem
+    from hanzoai.cloud.models.o11y_o11y_user import O11yO11yUser
+    from hanzoai.cloud.models.o11y_o11y_user_role import O11yO11yUserRole
+    from hanzoai.cloud.models.o11y_o11y_user_update import O11yO11yUserUpdate
+    from hanzoai.cloud.models.o11y_o11y_user_with_roles import O11yO11yUserWithRoles
+    from hanzoai.cloud.models.o11y_o11y_user_with_roles_out import O11yO11yUserWithRolesOut
+    from hanzoai.cloud.models.o11y_o11y_users_out import O11yO11yUsersOut
+    from hanzoai.cloud.models.o11y_o11y_version_out import O11yO11yVersionOut
+    from hanzoai.cloud.models.o11y_o11y_widget_query_range import O11yO11yWidgetQueryRange
+    from hanzoai.cloud.models.o11y_o11y_widget_query_range_out import O11yO11yWidgetQueryRangeOut
+    from hanzoai.cloud.models.o11y_o_auth2 import O11yOAuth2
+    from hanzoai.cloud.models.o11y_old_aws_collection_strategy import O11yOldAWSCollectionStrategy
+    from hanzoai.cloud.models.o11y_old_aws_logs_strategy import O11yOldAWSLogsStrategy
+    from hanzoai.cloud.models.o11y_old_aws_logs_strategy_cloudwatch_logs_subscriptions_inner import O11yOldAWSLogsStrategyCloudwatchLogsSubscriptionsInner
+    from hanzoai.cloud.models.o11y_old_aws_metrics_strategy import O11yOldAWSMetricsStrategy
+    from hanzoai.cloud.models.o11y_old_aws_metrics_strategy_cloudwatch_metric_stream_filters_inner import O11yOldAWSMetricsStrategyCloudwatchMetricStreamFiltersInner
+    from hanzoai.cloud.models.o11y_ops_genie_config import O11yOpsGenieConfig
+    from hanzoai.cloud.models.o11y_ops_genie_config_responder import O11yOpsGenieConfigResponder
+    from hanzoai.cloud.models.o11y_order_by import O11yOrderBy
+    from hanzoai.cloud.models.o11y_order_by_key import O11yOrderByKey
+    from hanzoai.cloud.models.o11y_otel_span_ref import O11yOtelSpanRef
+    from hanzoai.cloud.models.o11y_pagerduty_config import O11yPagerdutyConfig
+    from hanzoai.cloud.models.o11y_pagerduty_image import O11yPagerdutyImage
+    from hanzoai.cloud.models.o11y_pagerduty_link import O11yPagerdutyLink
+    from hanzoai.cloud.models.o11y_pagination import O11yPagination
+    from hanzoai.cloud.models.o11y_pod_count_by_phase import O11yPodCountByPhase
+    from hanzoai.cloud.models.o11y_pod_counts_by_phase import O11yPodCountsByPhase
+    from hanzoai.cloud.models.o11y_pod_list_record import O11yPodListRecord
+    from hanzoai.cloud.models.o11y_pod_list_request import O11yPodListRequest
+    from hanzoai.cloud.models.o11y_pod_list_response import O11yPodListResponse
+    from hanzoai.cloud.models.o11y_pod_record import O11yPodRecord
+    from hanzoai.cloud.models.o11y_pods import O11yPods
+    from hanzoai.cloud.models.o11y_point import O11yPoint
+    from hanzoai.cloud.models.o11y_postable_account_config import O11yPostableAccountConfig
+    from hanzoai.cloud.models.o11y_postable_channel import O11yPostableChannel
+    from hanzoai.cloud.models.o11y_postable_clusters import O11yPostableClusters
+    from hanzoai.cloud.models.o11y_postable_daemon_sets import O11yPostableDaemonSets
+    from hanzoai.cloud.models.o11y_postable_deployments import O11yPostableDeployments
+    from hanzoai.cloud.models.o11y_postable_host import O11yPostableHost
+    from hanzoai.cloud.models.o11y_postable_hosts import O11yPostableHosts
+    from hanzoai.cloud.models.o11y_postable_ingestion_key import O11yPostableIngestionKey
+    from hanzoai.cloud.models.o11y_postable_jobs import O11yPostableJobs
+    from hanzoai.cloud.models.o11y_postable_namespaces import O11yPostableNamespaces
+    from hanzoai.cloud.models.o11y_postable_nodes import O11yPostableNodes
+    from hanzoai.cloud.models.o11y_postable_pipeline import O11yPostablePipeline
+    from hanzoai.cloud.models.o11y_postable_planned_maintenance import O11yPostablePlannedMaintenance
+    from hanzoai.cloud.models.o11y_postable_pods import O11yPostablePods
+    from hanzoai.cloud.models.o11y_postable_profile import O11yPostableProfile
+    from hanzoai.cloud.models.o11y_postable_route_policy import O11yPostableRoutePolicy
+    from hanzoai.cloud.models.o11y_postable_span_mapper_group import O11yPostableSpanMapperGroup
+    from hanzoai.cloud.models.o11y_postable_stateful_sets import O11yPostableStatefulSets
+    from hanzoai.cloud.models.o11y_postable_volumes import O11yPostableVolumes
+    from hanzoai.cloud.models.o11y_process_list_record import O11yProcessListRecord
+    from hanzoai.cloud.models.o11y_process_list_request import O11yProcessListRequest
+    from hanzoai.cloud.models.o11y_process_list_response import O11yProcessListResponse
+    from hanzoai.cloud.models.o11y_prom_query import O11yPromQuery
+    from hanzoai.cloud.models.o11y_provider_integration_config import O11yProviderIntegrationConfig
+    from hanzoai.cloud.models.o11y_pushover_config import O11yPushoverConfig
+    from hanzoai.cloud.models.o11y_query_envelope import O11yQueryEnvelope
+    from hanzoai.cloud.models.o11y_query_range_params_v3 import O11yQueryRangeParamsV3
+    from hanzoai.cloud.models.o11y_query_range_request import O11yQueryRangeRequest
+    from hanzoai.cloud.models.o11y_query_warn_data import O11yQueryWarnData
+    from hanzoai.cloud.models.o11y_query_warn_data_additional import O11yQueryWarnDataAdditional
+    from hanzoai.cloud.models.o11y_querybuildertypesv5_composite_query import O11yQuerybuildertypesv5CompositeQuery
+    from hanzoai.cloud.models.o11y_querybuildertypesv5_order_by import O11yQuerybuildertypesv5OrderBy
+    from hanzoai.cloud.models.o11y_receiver import O11yReceiver
+    from hanzoai.cloud.models.o11y_rele_state_item import O11yReleStateItem
+    from hanzoai.cloud.models.o11y_rocketchat_attachment_action import O11yRocketchatAttachmentAction
+    from hanzoai.cloud.models.o11y_rocketchat_attachment_field import O11yRocketchatAttachmentField
+    from hanzoai.cloud.models.o11y_rocketchat_config import O11yRocketchatConfig
+    from hanzoai.cloud.models.o11y_rule_state_history import O11yRuleStateHistory
+    from hanzoai.cloud.models.o11y_rule_state_history_contributor import O11yRuleStateHistoryContributor
+    from hanzoai.cloud.models.o11y_rule_state_timeline import O11yRuleStateTimeline
+    from hanzoai.cloud.models.o11y_sns_config import O11ySNSConfig
+    from hanzoai.cloud.models.o11y_saved_view import O11ySavedView
+    from hanzoai.cloud.models.o11y_series import O11ySeries
+    from hanzoai.cloud.models.o11y_service import O11yService
+    from hanzoai.cloud.models.o11y_service_assets import O11yServiceAssets
+    from hanzoai.cloud.models.o11y_service_config import O11yServiceConfig
+    from hanzoai.cloud.models.o11y_service_dashboard import O11yServiceDashboard
+    from hanzoai.cloud.models.o11y_service_metadata import O11yServiceMetadata
+    from hanzoai.cloud.models.o11y_service_up import O11yServiceUp
+    from hanzoai.cloud.models.o11y_sig_v4_config import O11ySigV4Config
+    from hanzoai.cloud.models.o11y_signal_connection_status import O11ySignalConnectionStatus
+    from hanzoai.cloud.models.o11y_slack_action import O11ySlackAction
+    from hanzoai.cloud.models.o11y_slack_config import O11ySlackConfig
+    from hanzoai.cloud.models.o11y_slack_confirmation_field import O11ySlackConfirmationField
+    from hanzoai.cloud.models.o11y_slack_field import O11ySlackField
+    from hanzoai.cloud.models.o11y_span_aggregation import O11ySpanAggregation
+    from hanzoai.cloud.models.o11y_span_aggregation_result import O11ySpanAggregationResult
+    from hanzoai.cloud.models.o11y_span_mapper import O11ySpanMapper
+    from hanzoai.cloud.models.o11y_span_mapper_config import O11ySpanMapperConfig
+    from hanzoai.cloud.models.o11y_span_mapper_group import O11ySpanMapperGroup
+    from hanzoai.cloud.models.o11y_span_mapper_group_condition import O11ySpanMapperGroupCondition
+    from hanzoai.cloud.models.o11y_span_mapper_source import O11ySpanMapperSource
+    from hanzoai.cloud.models.o11y_stateful_set_list_record import O11yStatefulSetListRecord
+    from hanzoai.cloud.models.o11y_stateful_set_list_request import O11yStatefulSetListRequest
+    from hanzoai.cloud.models.o11y_stateful_set_list_response import O11yStatefulSetListResponse
+    from hanzoai.cloud.models.o11y_stateful_set_record import O11yStatefulSetRecord
+    from hanzoai.cloud.models.o11y_stateful_sets import O11yStatefulSets
+    from hanzoai.cloud.models.o11y_stats import O11yStats
+    from hanzoai.cloud.models.o11y_status_component import O11yStatusComponent
+    from hanzoai.cloud.models.o11y_status_incident import O11yStatusIncident
+    from hanzoai.cloud.models.o11y_status_maintenance import O11yStatusMaintenance
+    from hanzoai.cloud.models.o11y_status_result import O11yStatusResult
+    from hanzoai.cloud.models.o11y_status_summary import O11yStatusSummary
+    from hanzoai.cloud.models.o11y_storable_funnel import O11yStorableFunnel
+    from hanzoai.cloud.models.o11y_storable_integration_dashboard import O11yStorableIntegrationDashboard
+    from hanzoai.cloud.models.o11y_supported_signals import O11ySupportedSignals
+    from hanzoai.cloud.models.o11y_tls_config import O11yTLSConfig
+    from hanzoai.cloud.models.o11y_telegram_config import O11yTelegramConfig
+    from hanzoai.cloud.models.o11y_telemetry_field_key import O11yTelemetryFieldKey
+    from hanzoai.cloud.models.o11y_telemetry_field_values import O11yTelemetryFieldValues
+    from hanzoai.cloud.models.o11y_threading_config import O11yThreadingConfig
+    from hanzoai.cloud.models.o11y_time_series import O11yTimeSeries
+    from hanzoai.cloud.models.o11y_trace_row import O11yTraceRow
+    from hanzoai.cloud.models.o11y_traces_out import O11yTracesOut
+    from hanzoai.cloud.models.o11y_uninstall_integration_request import O11yUninstallIntegrationRequest
+    from hanzoai.cloud.models.o11y_updatable_account_config import O11yUpdatableAccountConfig
+    from hanzoai.cloud.models.o11y_updatable_azure_account_config import O11yUpdatableAzureAccountConfig
+    from hanzoai.cloud.models.o11y_updatable_gcp_account_config import O11yUpdatableGCPAccountConfig
+    from hanzoai.cloud.models.o11y_update_item_in import O11yUpdateItemIn
+    from hanzoai.cloud.models.o11y_update_queue_in import O11yUpdateQueueIn
+    from hanzoai.cloud.models.o11y_usage_bucket import O11yUsageBucket
+    from hanzoai.cloud.models.o11y_user import O11yUser
+    from hanzoai.cloud.models.o11y_variable_item import O11yVariableItem
+    from hanzoai.cloud.models.o11y_victor_ops_config import O11yVictorOpsConfig
+    from hanzoai.cloud.models.o11y_volume_list_record import O11yVolumeListRecord
+    from hanzoai.cloud.models.o11y_volume_list_request import O11yVolumeListRequest
+    from hanzoai.cloud.models.o11y_volume_list_response import O11yVolumeListResponse
+    from hanzoai.cloud.models.o11y_volume_record import O11yVolumeRecord
+    from hanzoai.cloud.models.o11y_volumes import O11yVolumes
+    from hanzoai.cloud.models.o11y_waterfall_span import O11yWaterfallSpan
+    from hanzoai.cloud.models.o11y_webex_config import O11yWebexConfig
+    from hanzoai.cloud.models.o11y_webhook_config import O11yWebhookConfig
+    from hanzoai.cloud.models.o11y_wechat_config import O11yWechatConfig
+    from hanzoai.cloud.models.oauth_bundle_in import OauthBundleIn
+    from hanzoai.cloud.models.object_item import ObjectItem
+    from hanzoai.cloud.models.object_list import ObjectList
+    from hanzoai.cloud.models.obligation import Obligation
+    from hanzoai.cloud.models.offer import Offer
+    from hanzoai.cloud.models.onboard_req import OnboardReq
+    from hanzoai.cloud.models.onboard_resp import OnboardResp
+    from hanzoai.cloud.models.op import Op
+    from hanzoai.cloud.models.open_req import OpenReq
+    from hanzoai.cloud.models.opp_list import OppList
+    from hanzoai.cloud.models.opp_req import OppReq
+    from hanzoai.cloud.models.opportunity import Opportunity
+    from hanzoai.cloud.models.optin_view import OptinView
+    from hanzoai.cloud.models.oracle_view import OracleView
+    from hanzoai.cloud.models.oracles_out import OraclesOut
+    from hanzoai.cloud.models.order import Order
+    from hanzoai.cloud.models.org_earning_view import OrgEarningView
+    from hanzoai.cloud.models.org_optin_req import OrgOptinReq
+    from hanzoai.cloud.models.org_optin_view import OrgOptinView
+    from hanzoai.cloud.models.org_view import OrgView
+    from hanzoai.cloud.models.outcome import Outcome
+    from hanzoai.cloud.models.overview import Overview
+    from hanzoai.cloud.models.overview_view import OverviewView
+    from hanzoai.cloud.models.page import Page
+    from hanzoai.cloud.models.pages_build_config import PagesBuildConfig
+    from hanzoai.cloud.models.pages_d1_binding import PagesD1Binding
+    from hanzoai.cloud.models.pages_deploy import PagesDeploy
+    from hanzoai.cloud.models.pages_deployment_config import PagesDeploymentConfig
+    from hanzoai.cloud.models.pages_deployment_configs import PagesDeploymentConfigs
+    from hanzoai.cloud.models.pages_env_var import PagesEnvVar
+    from hanzoai.cloud.models.pages_kv_binding import PagesKVBinding
+    from hanzoai.cloud.models.pages_project_create import PagesProjectCreate
+    from hanzoai.cloud.models.pages_r2_binding import PagesR2Binding
+    from hanzoai.cloud.models.pairing import Pairing
+    from hanzoai.cloud.models.pairing_approved import PairingApproved
+    from hanzoai.cloud.models.pairing_queue import PairingQueue
+    from hanzoai.cloud.models.pairing_view import PairingView
+    from hanzoai.cloud.models.patch_application_in import PatchApplicationIn
+    from hanzoai.cloud.models.patch_flow_in import PatchFlowIn
+    from hanzoai.cloud.models.patch_in import PatchIn
+    from hanzoai.cloud.models.patch_session_in import PatchSessionIn
+    from hanzoai.cloud.models.patch_sync_in import PatchSyncIn
+    from hanzoai.cloud.models.patch_target_in import PatchTargetIn
+    from hanzoai.cloud.models.path_in import PathIn
+    from hanzoai.cloud.models.payment_config import PaymentConfig
+    from hanzoai.cloud.models.payment_in import PaymentIn
+    from hanzoai.cloud.models.payment_out import PaymentOut
+    from hanzoai.cloud.models.payment_record import PaymentRecord
+    from hanzoai.cloud.models.payout import Payout
+    from hanzoai.cloud.models.period_earning_view import PeriodEarningView
+    from hanzoai.cloud.models.pick_out import PickOut
+    from hanzoai.cloud.models.pipeline_board import PipelineBoard
+    from hanzoai.cloud.models.pipeline_req import PipelineReq
+    from hanzoai.cloud.models.pipeline_row import PipelineRow
+    from hanzoai.cloud.models.pipeline_view import PipelineView
+    from hanzoai.cloud.models.plan_entitlements import PlanEntitlements
+    from hanzoai.cloud.models.plan_health import PlanHealth
+    from hanzoai.cloud.models.plan_info import PlanInfo
+    from hanzoai.cloud.models.plan_list import PlanList
+    from hanzoai.cloud.models.plan_region_list import PlanRegionList
+    from hanzoai.cloud.models.plan_resolution import PlanResolution
+    from hanzoai.cloud.models.plan_schemas import PlanSchemas
+    from hanzoai.cloud.models.plan_tier_list import PlanTierList
+    from hanzoai.cloud.models.plan_tool_list import PlanToolList
+    from hanzoai.cloud.models.plan_vocab import PlanVocab
+    from hanzoai.cloud.models.plugin_deleted import PluginDeleted
+    from hanzoai.cloud.models.plugin_mount import PluginMount
+    from hanzoai.cloud.models.plugin_mount_list import PluginMountList
+    from hanzoai.cloud.models.pn_l import PnL
+    from hanzoai.cloud.models.pn_l_line import PnLLine
+    from hanzoai.cloud.models.point_view import PointView
+    from hanzoai.cloud.models.policy import Policy
+    from hanzoai.cloud.models.policy_list import PolicyList
+    from hanzoai.cloud.models.pool_create import PoolCreate
+    from hanzoai.cloud.models.pool_scale import PoolScale
+    from hanzoai.cloud.models.populated_flow import PopulatedFlow
+    from hanzoai.cloud.models.position import Position
+    from hanzoai.cloud.models.post_event_request import PostEventRequest
+    from hanzoai.cloud.models.post_index_indexes_by_uid_documents_delete_batch_request import PostIndexIndexesByUidDocumentsDeleteBatchRequest
+    from hanzoai.cloud.models.post_list import PostList
+    from hanzoai.cloud.models.prefs_view import PrefsView
+    from hanzoai.cloud.models.preset import Preset
+    from hanzoai.cloud.models.preset_accepted import PresetAccepted
+    from hanzoai.cloud.models.preset_list import PresetList
+    from hanzoai.cloud.models.presign_response import PresignResponse
+    from hanzoai.cloud.models.preview_req import PreviewReq
+    from hanzoai.cloud.models.preview_view import PreviewView
+    from hanzoai.cloud.models.price import Price
+    from hanzoai.cloud.models.pricing_health import PricingHealth
+    from hanzoai.cloud.models.pricing_model_list import PricingModelList
+    from hanzoai.cloud.models.pricing_plan_list import PricingPlanList
+    from hanzoai.cloud.models.pricing_preset_list import PricingPresetList
+    from hanzoai.cloud.models.pricing_provider_list import PricingProviderList
+    from hanzoai.cloud.models.pricing_region_list import PricingRegionList
+    from hanzoai.cloud.models.pricing_sync_out import PricingSyncOut
+    from hanzoai.cloud.models.pricing_tier_list import PricingTierList
+    from hanzoai.cloud.models.pricing_tool_list import PricingToolList
+    from hanzoai.cloud.models.principle import Principle
+    from hanzoai.cloud.models.product_event import ProductEvent
+    from hanzoai.cloud.models.product_row import ProductRow
+    from hanzoai.cloud.models.profile_metrics import ProfileMetrics
+    from hanzoai.cloud.models.profile_response import ProfileResponse
+    from hanzoai.cloud.models.program_application import ProgramApplication
+    from hanzoai.cloud.models.progress_view import ProgressView
+    from hanzoai.cloud.models.project_view import ProjectView
+    from hanzoai.cloud.models.projection_view import ProjectionView
+    from hanzoai.cloud.models.projects_bound_domains import ProjectsBoundDomains
+    from hanzoai.cloud.models.projects_build_site import ProjectsBuildSite
+    from hanzoai.cloud.models.projects_complete import ProjectsComplete
+    from hanzoai.cloud.models.projects_create import ProjectsCreate
+    from hanzoai.cloud.models.projects_create_repo import ProjectsCreateRepo
+    from hanzoai.cloud.models.projects_deploy_site import ProjectsDeploySite
+    from hanzoai.cloud.models.projects_deploy_start import ProjectsDeployStart
+    from hanzoai.cloud.models.projects_deployment import ProjectsDeployment
+    from hanzoai.cloud.models.projects_domain import ProjectsDomain
+    from hanzoai.cloud.models.projects_domains import ProjectsDomains
+    from hanzoai.cloud.models.projects_domains_bind import ProjectsDomainsBind
+    from hanzoai.cloud.models.projects_file import ProjectsFile
+    from hanzoai.cloud.models.projects_fork import ProjectsFork
+    from hanzoai.cloud.models.projects_project import ProjectsProject
+    from hanzoai.cloud.models.projects_publish import ProjectsPublish
+    from hanzoai.cloud.models.projects_release import ProjectsRelease
+    from hanzoai.cloud.models.projects_repo import ProjectsRepo
+    from hanzoai.cloud.models.projects_site import ProjectsSite
+    from hanzoai.cloud.models.projects_site_deploy import ProjectsSiteDeploy
+    from hanzoai.cloud.models.projects_update import ProjectsUpdate
+    from hanzoai.cloud.models.projects_update_repo import ProjectsUpdateRepo
+    from hanzoai.cloud.models.projects_upload_grant import ProjectsUploadGrant
+    from hanzoai.cloud.models.promo import Promo
+    from hanzoai.cloud.models.promo_list import PromoList
+    from hanzoai.cloud.models.promo_status import PromoStatus
+    from hanzoai.cloud.models.promote_req import PromoteReq
+    from hanzoai.cloud.models.prompt_detail import PromptDetail
+    from hanzoai.cloud.models.prompt_list import PromptList
+    from hanzoai.cloud.models.prompt_meta import PromptMeta
+    from hanzoai.cloud.models.prompt_req import PromptReq
+    from hanzoai.cloud.models.prop_spec import PropSpec
+    from hanzoai.cloud.models.provider_breakdown import ProviderBreakdown
+    from hanzoai.cloud.models.provider_info import ProviderInfo
+    from hanzoai.cloud.models.provider_row import ProviderRow
+    from hanzoai.cloud.models.provider_view import ProviderView
+    from hanzoai.cloud.models.provision_request import ProvisionRequest
+    from hanzoai.cloud.models.provision_result import ProvisionResult
+    from hanzoai.cloud.models.provisioned_resource import ProvisionedResource
+    from hanzoai.cloud.models.provisioned_summary import ProvisionedSummary
+    from hanzoai.cloud.models.publish_input import PublishInput
+    from hanzoai.cloud.models.publish_kit_in import PublishKitIn
+    from hanzoai.cloud.models.publish_req import PublishReq
+    from hanzoai.cloud.models.publish_result import PublishResult
+    from hanzoai.cloud.models.published_claim import PublishedClaim
+    from hanzoai.cloud.models.pull_list import PullList
+    from hanzoai.cloud.models.pull_view import PullView
+    from hanzoai.cloud.models.purge import Purge
+    from hanzoai.cloud.models.purge_in import PurgeIn
+    from hanzoai.cloud.models.purge_out import PurgeOut
+    from hanzoai.cloud.models.push import Push
+    from hanzoai.cloud.models.push_file import PushFile
+    from hanzoai.cloud.models.push_pusher import PushPusher
+    from hanzoai.cloud.models.push_repository import PushRepository
+    from hanzoai.cloud.models.push_req import PushReq
+    from hanzoai.cloud.models.push_resp import PushResp
+    from hanzoai.cloud.models.put_claims_in import PutClaimsIn
+    from hanzoai.cloud.models.put_claims_out import PutClaimsOut
+    from hanzoai.cloud.models.query import Query
+    from hanzoai.cloud.models.question import Question
+    from hanzoai.cloud.models.questions_response import QuestionsResponse
+    from hanzoai.cloud.models.quote import Quote
+    from hanzoai.cloud.models.quote_list import QuoteList
+    from hanzoai.cloud.models.raise_in import RaiseIn
+    from hanzoai.cloud.models.ran import Ran
+    from hanzoai.cloud.models.range import Range
+    from hanzoai.cloud.models.rate_card import RateCard
+    from hanzoai.cloud.models.reachability import Reachability
+    from hanzoai.cloud.models.read_out import ReadOut
+    from hanzoai.cloud.models.readiness import Readiness
+    from hanzoai.cloud.models.reading_req import ReadingReq
+    from hanzoai.cloud.models.reading_view import ReadingView
+    from hanzoai.cloud.models.readme_json import ReadmeJSON
+    from hanzoai.cloud.models.receipt import Receipt
+    from hanzoai.cloud.models.record import Record
+    from hanzoai.cloud.models.record_list import RecordList
+    from hanzoai.cloud.models.redeem_input import RedeemInput
+    from hanzoai.cloud.models.redeem_result import RedeemResult
+    from hanzoai.cloud.models.redemption import Redemption
+    from hanzoai.cloud.models.ref_json import RefJSON
+    from hanzoai.cloud.models.reference_answer import ReferenceAnswer
+    from hanzoai.cloud.models.reference_out import ReferenceOut
+    from hanzoai.cloud.models.reference_override import ReferenceOverride
+    from hanzoai.cloud.models.reference_override_in import ReferenceOverrideIn
+    from hanzoai.cloud.models.reference_receipt import ReferenceReceipt
+    from hanzoai.cloud.models.reference_set import ReferenceSet
+    from hanzoai.cloud.models.reference_sets_out import ReferenceSetsOut
+    from hanzoai.cloud.models.reference_source import ReferenceSource
+    from hanzoai.cloud.models.reference_taken import ReferenceTaken
+    from hanzoai.cloud.models.reference_version import ReferenceVersion
+    from hanzoai.cloud.models.refresh_out import RefreshOut
+    from hanzoai.cloud.models.refresh_reference_in import RefreshReferenceIn
+    from hanzoai.cloud.models.refresh_reference_out import RefreshReferenceOut
+    from hanzoai.cloud.models.refs_json import RefsJSON
+    from hanzoai.cloud.models.register_counts import RegisterCounts
+    from hanzoai.cloud.models.register_key_req import RegisterKeyReq
+    from hanzoai.cloud.models.register_page import RegisterPage
+    from hanzoai.cloud.models.register_req import RegisterReq
+    from hanzoai.cloud.models.register_result import RegisterResult
+    from hanzoai.cloud.models.registrant import Registrant
+    from hanzoai.cloud.models.registration import Registration
+    from hanzoai.cloud.models.registration_view import RegistrationView
+    from hanzoai.cloud.models.registry_image import RegistryImage
+    from hanzoai.cloud.models.registry_image_list import RegistryImageList
+    from hanzoai.cloud.models.registry_mint import RegistryMint
+    from hanzoai.cloud.models.registry_package import RegistryPackage
+    from hanzoai.cloud.models.registry_package_list import RegistryPackageList
+    from hanzoai.cloud.models.registry_project import RegistryProject
+    from hanzoai.cloud.models.registry_project_list import RegistryProjectList
+    from hanzoai.cloud.models.registry_status import RegistryStatus
+    from hanzoai.cloud.models.registry_tag_list import RegistryTagList
+    from hanzoai.cloud.models.registry_token import RegistryToken
+    from hanzoai.cloud.models.release_board import ReleaseBoard
+    from hanzoai.cloud.models.release_row import ReleaseRow
+    from hanzoai.cloud.models.remittance import Remittance
+    from hanzoai.cloud.models.renew_req import RenewReq
+    from hanzoai.cloud.models.renew_result import RenewResult
+    from hanzoai.cloud.models.replace_kit_in import ReplaceKitIn
+    from hanzoai.cloud.models.replay_body import ReplayBody
+    from hanzoai.cloud.models.repo_list import RepoList
+    from hanzoai.cloud.models.repo_tree import RepoTree
+    from hanzoai.cloud.models.repo_view import RepoView
+    from hanzoai.cloud.models.report import Report
+    from hanzoai.cloud.models.report_out import ReportOut
+    from hanzoai.cloud.models.report_req import ReportReq
+    from hanzoai.cloud.models.report_resp import ReportResp
+    from hanzoai.cloud.models.report_run_in import ReportRunIn
+    from hanzoai.cloud.models.request import Request
+    from hanzoai.cloud.models.resolve_reference_in import ResolveReferenceIn
+    from hanzoai.cloud.models.resolve_reference_out import ResolveReferenceOut
+    from hanzoai.cloud.models.resource_usage import ResourceUsage
+    from hanzoai.cloud.models.response import Response
+    from hanzoai.cloud.models.responsible import Responsible
+    from hanzoai.cloud.models.restart_ref import RestartRef
+    from hanzoai.cloud.models.restarted import Restarted
+    from hanzoai.cloud.models.review_queue import ReviewQueue
+    from hanzoai.cloud.models.review_request import ReviewRequest
+    from hanzoai.cloud.models.revoke_resp import RevokeResp
+    from hanzoai.cloud.models.revoked_key import RevokedKey
+    from hanzoai.cloud.models.risk_adopt_in import RiskAdoptIn
+    from hanzoai.cloud.models.risk_aggregates import RiskAggregates
+    from hanzoai.cloud.models.risk_appetite_in import RiskAppetiteIn
+    from hanzoai.cloud.models.risk_band import RiskBand
+    from hanzoai.cloud.models.risk_catalog import RiskCatalog
+    from hanzoai.cloud.models.risk_cause import RiskCause
+    from hanzoai.cloud.models.risk_dataset import RiskDataset
+    from hanzoai.cloud.models.risk_dataset_disposal import RiskDatasetDisposal
+    from hanzoai.cloud.models.risk_dataset_list import RiskDatasetList
+    from hanzoai.cloud.models.risk_dataset_row import RiskDatasetRow
+    from hanzoai.cloud.models.risk_dataset_rows import RiskDatasetRows
+    from hanzoai.cloud.models.risk_dataset_spec import RiskDatasetSpec
+    from hanzoai.cloud.models.risk_dataset_versions import RiskDatasetVersions
+    from hanzoai.cloud.models.risk_dispose_in import RiskDisposeIn
+    from hanzoai.cloud.models.risk_dispose_out import RiskDisposeOut
+    from hanzoai.cloud.models.risk_event import RiskEvent
+    from hanzoai.cloud.models.risk_hold_in import RiskHoldIn
+    from hanzoai.cloud.models.risk_hold_out import RiskHoldOut
+    from hanzoai.cloud.models.risk_label_coverage import RiskLabelCoverage
+    from hanzoai.cloud.models.risk_label_event import RiskLabelEvent
+    from hanzoai.cloud.models.risk_label_fact import RiskLabelFact
+    from hanzoai.cloud.models.risk_label_in import RiskLabelIn
+    from hanzoai.cloud.models.risk_label_out import RiskLabelOut
+    from hanzoai.cloud.models.risk_label_record import RiskLabelRecord
+    from hanzoai.cloud.models.risk_label_result import RiskLabelResult
+    from hanzoai.cloud.models.risk_label_vocabulary import RiskLabelVocabulary
+    from hanzoai.cloud.models.risk_labels_out import RiskLabelsOut
+    from hanzoai.cloud.models.risk_learn_in import RiskLearnIn
+    from hanzoai.cloud.models.risk_learn_out import RiskLearnOut
+    from hanzoai.cloud.models.risk_lineage import RiskLineage
+    from hanzoai.cloud.models.risk_model_feature import RiskModelFeature
+    from hanzoai.cloud.models.risk_model_state import RiskModelState
+    from hanzoai.cloud.models.risk_model_value import RiskModelValue
+    from hanzoai.cloud.models.risk_org_feature import RiskOrgFeature
+    from hanzoai.cloud.models.risk_policy_out import RiskPolicyOut
+    from hanzoai.cloud.models.risk_policy_version import RiskPolicyVersion
+    from hanzoai.cloud.models.risk_publish_out import RiskPublishOut
+    from hanzoai.cloud.models.risk_resolve_in import RiskResolveIn
+    from hanzoai.cloud.models.risk_resolve_out import RiskResolveOut
+    from hanzoai.cloud.models.risk_resolved import RiskResolved
+    from hanzoai.cloud.models.risk_score_in import RiskScoreIn
+    from hanzoai.cloud.models.risk_score_out import RiskScoreOut
+    from hanzoai.cloud.models.risk_search_in import RiskSearchIn
+    from hanzoai.cloud.models.risk_search_report import RiskSearchReport
+    from hanzoai.cloud.models.risk_search_run import RiskSearchRun
+    from hanzoai.cloud.models.risk_source_coverage import RiskSourceCoverage
+    from hanzoai.cloud.models.risk_split_counts import RiskSplitCounts
+    from hanzoai.cloud.models.risk_surface import RiskSurface
+    from hanzoai.cloud.models.risk_topology import RiskTopology
+    from hanzoai.cloud.models.risk_trial import RiskTrial
+    from hanzoai.cloud.models.risk_value import RiskValue
+    from hanzoai.cloud.models.role_assignment import RoleAssignment
+    from hanzoai.cloud.models.role_list import RoleList
+    from hanzoai.cloud.models.rollback_req import RollbackReq
+    from hanzoai.cloud.models.rollup import Rollup
+    from hanzoai.cloud.models.rollup_allotment import RollupAllotment
+    from hanzoai.cloud.models.rollup_balance import RollupBalance
+    from hanzoai.cloud.models.root import Root
+    from hanzoai.cloud.models.round_input import RoundInput
+    from hanzoai.cloud.models.round_out import RoundOut
+    from hanzoai.cloud.models.route import Route
+    from hanzoai.cloud.models.route_candidate import RouteCandidate
+    from hanzoai.cloud.models.route_create_in import RouteCreateIn
+    from hanzoai.cloud.models.route_plan import RoutePlan
+    from hanzoai.cloud.models.routed_run_out import RoutedRunOut
+    from hanzoai.cloud.models.routed_usage import RoutedUsage
+    from hanzoai.cloud.models.router_list import RouterList
+    from hanzoai.cloud.models.router_view import RouterView
+    from hanzoai.cloud.models.rpc_error import RpcError
+    from hanzoai.cloud.models.rpc_in import RpcIn
+    from hanzoai.cloud.models.rpc_out import RpcOut
+    from hanzoai.cloud.models.rule import Rule
+    from hanzoai.cloud.models.rule_list import RuleList
+    from hanzoai.cloud.models.rule_view import RuleView
+    from hanzoai.cloud.models.rules_out import RulesOut
+    from hanzoai.cloud.models.ruleset import Ruleset
+    from hanzoai.cloud.models.run_in import RunIn
+    from hanzoai.cloud.models.run_list import RunList
+    from hanzoai.cloud.models.run_page import RunPage
+    from hanzoai.cloud.models.run_point import RunPoint
+    from hanzoai.cloud.models.run_record import RunRecord
+    from hanzoai.cloud.models.run_req import RunReq
+    from hanzoai.cloud.models.run_request import RunRequest
+    from hanzoai.cloud.models.run_resp import RunResp
+    from hanzoai.cloud.models.run_summary import RunSummary
+    from hanzoai.cloud.models.run_view import RunView
+    from hanzoai.cloud.models.runner_build_req import RunnerBuildReq
+    from hanzoai.cloud.models.runner_build_resp import RunnerBuildResp
+    from hanzoai.cloud.models.runs import Runs
+    from hanzoai.cloud.models.s3_health import S3Health
+    from hanzoai.cloud.models.sms import SMS
+    from hanzoai.cloud.models.safe_in import SafeIn
+    from hanzoai.cloud.models.safe_out import SafeOut
+    from hanzoai.cloud.models.safe_proposal import SafeProposal
+    from hanzoai.cloud.models.safe_tx_in import SafeTxIn
+    from hanzoai.cloud.models.sample_accepted import SampleAccepted
+    from hanzoai.cloud.models.sample_ingest import SampleIngest
+    from hanzoai.cloud.models.sample_list import SampleList
+    from hanzoai.cloud.models.sample_req import SampleReq
+    from hanzoai.cloud.models.sample_view import SampleView
+    from hanzoai.cloud.models.sandbox import Sandbox
+    from hanzoai.cloud.models.sandbox_list import SandboxList
+    from hanzoai.cloud.models.sbom_health import SbomHealth
+    from hanzoai.cloud.models.sbom_ingest import SbomIngest
+    from hanzoai.cloud.models.sbom_ingested import SbomIngested
+    from hanzoai.cloud.models.scan import Scan
+    from hanzoai.cloud.models.scan_detail import ScanDetail
+    from hanzoai.cloud.models.scan_draft import ScanDraft
+    from hanzoai.cloud.models.scan_list import ScanList
+    from hanzoai.cloud.models.scan_view import ScanView
+    from hanzoai.cloud.models.schedule_input import ScheduleInput
+    from hanzoai.cloud.models.scope import Scope
+    from hanzoai.cloud.models.score_config_list import ScoreConfigList
+    from hanzoai.cloud.models.score_config_req import ScoreConfigReq
+    from hanzoai.cloud.models.score_config_view import ScoreConfigView
+    from hanzoai.cloud.models.score_list import ScoreList
+    from hanzoai.cloud.models.score_req import ScoreReq
+    from hanzoai.cloud.models.score_view import ScoreView
+    from hanzoai.cloud.models.screen_result import ScreenResult
+    from hanzoai.cloud.models.search_in import SearchIn
+    from hanzoai.cloud.models.search_out import SearchOut
+    from hanzoai.cloud.models.search_results import SearchResults
+    from hanzoai.cloud.models.secret_list import SecretList
+    from hanzoai.cloud.models.secret_meta import SecretMeta
+    from hanzoai.cloud.models.secret_view import SecretView
+    from hanzoai.cloud.models.section import Section
+    from hanzoai.cloud.models.section_write import SectionWrite
+    from hanzoai.cloud.models.self_rank import SelfRank
+    from hanzoai.cloud.models.seo_audit_in import SeoAuditIn
+    from hanzoai.cloud.models.seo_audit_out import SeoAuditOut
+    from hanzoai.cloud.models.seo_backlink_in import SeoBacklinkIn
+    from hanzoai.cloud.models.seo_backlink_out import SeoBacklinkOut
+    from hanzoai.cloud.models.seo_charge import SeoCharge
+    from hanzoai.cloud.models.seo_competitor_in import SeoCompetitorIn
+    from hanzoai.cloud.models.seo_competitor_out import SeoCompetitorOut
+    from hanzoai.cloud.models.seo_domain import SeoDomain
+    from hanzoai.cloud.models.seo_idea_in import SeoIdeaIn
+    from hanzoai.cloud.models.seo_idea_out import SeoIdeaOut
+    from hanzoai.cloud.models.seo_keyword_in import SeoKeywordIn
+    from hanzoai.cloud.models.seo_keyword_out import SeoKeywordOut
+    from hanzoai.cloud.models.seo_metric import SeoMetric
+    from hanzoai.cloud.models.seo_rank_in import SeoRankIn
+    from hanzoai.cloud.models.seo_rank_out import SeoRankOut
+    from hanzoai.cloud.models.seo_ranking import SeoRanking
+    from hanzoai.cloud.models.seo_rate_out import SeoRateOut
+    from hanzoai.cloud.models.sequence import Sequence
+    from hanzoai.cloud.models.sequence_list import SequenceList
+    from hanzoai.cloud.models.sequence_status import SequenceStatus
+    from hanzoai.cloud.models.sequence_view import SequenceView
+    from hanzoai.cloud.models.sequences import Sequences
+    from hanzoai.cloud.models.series_line import SeriesLine
+    from hanzoai.cloud.models.series_point import SeriesPoint
+    from hanzoai.cloud.models.session_detail import SessionDetail
+    from hanzoai.cloud.models.session_list import SessionList
+    from hanzoai.cloud.models.session_user import SessionUser
+    from hanzoai.cloud.models.session_view import SessionView
+    from hanzoai.cloud.models.set_env_req import SetEnvReq
+    from hanzoai.cloud.models.set_reference_in import SetReferenceIn
+    from hanzoai.cloud.models.set_reference_out import SetReferenceOut
+    from hanzoai.cloud.models.settings_req import SettingsReq
+    from hanzoai.cloud.models.settings_view import SettingsView
+    from hanzoai.cloud.models.share_policy import SharePolicy
+    from hanzoai.cloud.models.share_view import ShareView
+    from hanzoai.cloud.models.shares_out import SharesOut
+    from hanzoai.cloud.models.sign_in import SignIn
+    from hanzoai.cloud.models.sign_reply import SignReply
+    from hanzoai.cloud.models.sign_request import SignRequest
+    from hanzoai.cloud.models.signature import Signature
+    from hanzoai.cloud.models.signer import Signer
+    from hanzoai.cloud.models.skill import Skill
+    from hanzoai.cloud.models.skill_deleted import SkillDeleted
+    from hanzoai.cloud.models.skill_in import SkillIn
+    from hanzoai.cloud.models.skill_written import SkillWritten
+    from hanzoai.cloud.models.slot_view import SlotView
+    from hanzoai.cloud.models.social_account import SocialAccount
+    from hanzoai.cloud.models.social_account_body import SocialAccountBody
+    from hanzoai.cloud.models.social_account_write import SocialAccountWrite
+    from hanzoai.cloud.models.social_accounts import SocialAccounts
+    from hanzoai.cloud.models.social_post import SocialPost
+    from hanzoai.cloud.models.social_post_body import SocialPostBody
+    from hanzoai.cloud.models.social_post_write import SocialPostWrite
+    from hanzoai.cloud.models.social_posts import SocialPosts
+    from hanzoai.cloud.models.social_provider import SocialProvider
+    from hanzoai.cloud.models.social_providers import SocialProviders
+    from hanzoai.cloud.models.social_summary import SocialSummary
+    from hanzoai.cloud.models.source import Source
+    from hanzoai.cloud.models.source_failure import SourceFailure
+    from hanzoai.cloud.models.source_state import SourceState
+    from hanzoai.cloud.models.source_tool_list import SourceToolList
+    from hanzoai.cloud.models.sources import Sources
+    from hanzoai.cloud.models.span import Span
+    from hanzoai.cloud.models.span_body import SpanBody
+    from hanzoai.cloud.models.spec import Spec
+    from hanzoai.cloud.models.spend import Spend
+    from hanzoai.cloud.models.spend_point import SpendPoint
+    from hanzoai.cloud.models.stage_event import StageEvent
+    from hanzoai.cloud.models.starter_kit import StarterKit
+    from hanzoai.cloud.models.state import State
+    from hanzoai.cloud.models.state_graph import StateGraph
+    from hanzoai.cloud.models.stats_out import StatsOut
+    from hanzoai.cloud.models.stats_sessions import StatsSessions
+    from hanzoai.cloud.models.stats_user import StatsUser
+    from hanzoai.cloud.models.status_breakdown import StatusBreakdown
+    from hanzoai.cloud.models.status_counts import StatusCounts
+    from hanzoai.cloud.models.status_view import StatusView
+    from hanzoai.cloud.models.step import Step
+    from hanzoai.cloud.models.step_input import StepInput
+    from hanzoai.cloud.models.step_list import StepList
+    from hanzoai.cloud.models.step_settings import StepSettings
+    from hanzoai.cloud.models.step_view import StepView
+    from hanzoai.cloud.models.stop_in import StopIn
+    from hanzoai.cloud.models.stopped import Stopped
+    from hanzoai.cloud.models.storefront_result import StorefrontResult
+    from hanzoai.cloud.models.strategy import Strategy
+    from hanzoai.cloud.models.strategy_view import StrategyView
+    from hanzoai.cloud.models.stream import Stream
+    from hanzoai.cloud.models.streams import Streams
+    from hanzoai.cloud.models.structure_in import StructureIn
+    from hanzoai.cloud.models.subdomain_set_in import SubdomainSetIn
+    from hanzoai.cloud.models.subject import Subject
+    from hanzoai.cloud.models.subject_list import SubjectList
+    from hanzoai.cloud.models.subject_req import SubjectReq
+    from hanzoai.cloud.models.subject_summary import SubjectSummary
+    from hanzoai.cloud.models.submit_req import SubmitReq
+    from hanzoai.cloud.models.subprocessor_list import SubprocessorList
+    from hanzoai.cloud.models.subscribe_req import SubscribeReq
+    from hanzoai.cloud.models.subscription import Subscription
+    from hanzoai.cloud.models.subscription_list import SubscriptionList
+    from hanzoai.cloud.models.subscription_plan import SubscriptionPlan
+    from hanzoai.cloud.models.subscription_ref import SubscriptionRef
+    from hanzoai.cloud.models.subscription_view import SubscriptionView
+    from hanzoai.cloud.models.subscriptions import Subscriptions
+    from hanzoai.cloud.models.suggest_response import SuggestResponse
+    from hanzoai.cloud.models.suggestion import Suggestion
+    from hanzoai.cloud.models.suite import Suite
+    from hanzoai.cloud.models.summary import Summary
+    from hanzoai.cloud.models.summary_resp import SummaryResp
+    from hanzoai.cloud.models.summary_view import SummaryView
+    from hanzoai.cloud.models.suppression import Suppression
+    from hanzoai.cloud.models.suppression_list import SuppressionList
+    from hanzoai.cloud.models.symbol import Symbol
+    from hanzoai.cloud.models.sync_list import SyncList
+    from hanzoai.cloud.models.sync_queued import SyncQueued
+    from hanzoai.cloud.models.sync_req import SyncReq
+    from hanzoai.cloud.models.sync_tally import SyncTally
+    from hanzoai.cloud.models.sync_view import SyncView
+    from hanzoai.cloud.models.tls_config import TLSConfig
+    from hanzoai.cloud.models.tag_config import TagConfig
+    from hanzoai.cloud.models.target_deleted import TargetDeleted
+    from hanzoai.cloud.models.target_list import TargetList
+    from hanzoai.cloud.models.target_req import TargetReq
+    from hanzoai.cloud.models.target_view import TargetView
+    from hanzoai.cloud.models.tariff import Tariff
+    from hanzoai.cloud.models.tariff_in import TariffIn
+    from hanzoai.cloud.models.taxon import Taxon
+    from hanzoai.cloud.models.taxon_in import TaxonIn
+    from hanzoai.cloud.models.taxonomy import Taxonomy
+    from hanzoai.cloud.models.template_catalog import TemplateCatalog
+    from hanzoai.cloud.models.template_override import TemplateOverride
+    from hanzoai.cloud.models.template_reply import TemplateReply
+    from hanzoai.cloud.models.template_view import TemplateView
+    from hanzoai.cloud.models.test_result import TestResult
+    from hanzoai.cloud.models.ticket_grant import TicketGrant
+    from hanzoai.cloud.models.tier import Tier
+    from hanzoai.cloud.models.tier_balance import TierBalance
+    from hanzoai.cloud.models.tier_limits import TierLimits
+    from hanzoai.cloud.models.timeseries import Timeseries
+    from hanzoai.cloud.models.todo_project import TodoProject
+    from hanzoai.cloud.models.tool import Tool
+    from hanzoai.cloud.models.tool_call import ToolCall
+    from hanzoai.cloud.models.tool_list import ToolList
+    from hanzoai.cloud.models.tool_result import ToolResult
+    from hanzoai.cloud.models.top import Top
+    from hanzoai.cloud.models.top_models import TopModels
+    from hanzoai.cloud.models.top_products import TopProducts
+    from hanzoai.cloud.models.total_view import TotalView
+    from hanzoai.cloud.models.trace_list import TraceList
+    from hanzoai.cloud.models.trace_view import TraceView
+    from hanzoai.cloud.models.traffic_caller import TrafficCaller
+    from hanzoai.cloud.models.traffic_view import TrafficView
+    from hanzoai.cloud.models.trail_page import TrailPage
+    from hanzoai.cloud.models.transaction import Transaction
+    from hanzoai.cloud.models.transactions import Transactions
+    from hanzoai.cloud.models.transactions_out import TransactionsOut
+    from hanzoai.cloud.models.transfer_req import TransferReq
+    from hanzoai.cloud.models.transition_in import TransitionIn
+    from hanzoai.cloud.models.transition_result import TransitionResult
+    from hanzoai.cloud.models.treasury_report import TreasuryReport
+    from hanzoai.cloud.models.tree_entry import TreeEntry
+    from hanzoai.cloud.models.tree_entry_json import TreeEntryJSON
+    from hanzoai.cloud.models.tree_json import TreeJSON
+    from hanzoai.cloud.models.tree_node import TreeNode
+    from hanzoai.cloud.models.trial import Trial
+    from hanzoai.cloud.models.trial_balance import TrialBalance
+    from hanzoai.cloud.models.trial_balance_row import TrialBalanceRow
+    from hanzoai.cloud.models.trigger_list import TriggerList
+    from hanzoai.cloud.models.trigger_view import TriggerView
+    from hanzoai.cloud.models.trust_ask import TrustAsk
+    from hanzoai.cloud.models.trust_ask_view import TrustAskView
+    from hanzoai.cloud.models.trust_asked import TrustAsked
+    from hanzoai.cloud.models.trust_coverage import TrustCoverage
+    from hanzoai.cloud.models.trust_decision import TrustDecision
+    from hanzoai.cloud.models.trust_desk import TrustDesk
+    from hanzoai.cloud.models.trust_documents import TrustDocuments
+    from hanzoai.cloud.models.trust_edit import TrustEdit
+    from hanzoai.cloud.models.trust_grant_view import TrustGrantView
+    from hanzoai.cloud.models.trust_granted import TrustGranted
+    from hanzoai.cloud.models.trust_item import TrustItem
+    from hanzoai.cloud.models.trust_item_view import TrustItemView
+    from hanzoai.cloud.models.trust_page import TrustPage
+    from hanzoai.cloud.models.trust_publish import TrustPublish
+    from hanzoai.cloud.models.trust_refused import TrustRefused
+    from hanzoai.cloud.models.trust_settings import TrustSettings
+    from hanzoai.cloud.models.trust_tally import TrustTally
+    from hanzoai.cloud.models.txn import Txn
+    from hanzoai.cloud.models.utm import UTM
+    from hanzoai.cloud.models.unreconciled_out import UnreconciledOut
+    from hanzoai.cloud.models.unsubscribed import Unsubscribed
+    from hanzoai.cloud.models.update_agent_in import UpdateAgentIn
+    from hanzoai.cloud.models.update_campaign_in import UpdateCampaignIn
+    from hanzoai.cloud.models.update_endpoint_in import UpdateEndpointIn
+    from hanzoai.cloud.models.update_list import UpdateList
+    from hanzoai.cloud.models.upkeep import Upkeep
+    from hanzoai.cloud.models.upkeep_in import UpkeepIn
+    from hanzoai.cloud.models.upload_in import UploadIn
+    from hanzoai.cloud.models.upstream import Upstream
+    from hanzoai.cloud.models.usage import Usage
+    from hanzoai.cloud.models.usage_analytics_access import UsageAnalyticsAccess
+    from hanzoai.cloud.models.usage_analytics_grant import UsageAnalyticsGrant
+    from hanzoai.cloud.models.usage_analytics_view import UsageAnalyticsView
+    from hanzoai.cloud.models.usage_point import UsagePoint
+    from hanzoai.cloud.models.usage_repo import UsageRepo
+    from hanzoai.cloud.models.usage_scope import UsageScope
+    from hanzoai.cloud.models.usage_summary import UsageSummary
+    from hanzoai.cloud.models.usage_view import UsageView
+    from hanzoai.cloud.models.usage_window_view import UsageWindowView
+    from hanzoai.cloud.models.user_enablement_item import UserEnablementItem
+    from hanzoai.cloud.models.user_optin_req import UserOptinReq
+    from hanzoai.cloud.models.user_optin_view import UserOptinView
+    from hanzoai.cloud.models.validator_claim import ValidatorClaim
+    from hanzoai.cloud.models.validator_list import ValidatorList
+    from hanzoai.cloud.models.variant import Variant
+    from hanzoai.cloud.models.vendor_row import VendorRow
+    from hanzoai.cloud.models.vendors_out import VendorsOut
+    from hanzoai.cloud.models.verdict import Verdict
+    from hanzoai.cloud.models.verification_decision import VerificationDecision
+    from hanzoai.cloud.models.verification_req import VerificationReq
+    from hanzoai.cloud.models.verification_tally import VerificationTally
+    from hanzoai.cloud.models.verify_out import VerifyOut
+    from hanzoai.cloud.models.verify_request import VerifyRequest
+    from hanzoai.cloud.models.version_message import VersionMessage
+    from hanzoai.cloud.models.version_meta import VersionMeta
+    from hanzoai.cloud.models.version_page import VersionPage
+    from hanzoai.cloud.models.version_view import VersionView
+    from hanzoai.cloud.models.voucher import Voucher
+    from hanzoai.cloud.models.waiting import Waiting
+    from hanzoai.cloud.models.wallet import Wallet
+    from hanzoai.cloud.models.wallet_account import WalletAccount
+    from hanzoai.cloud.models.wallet_list import WalletList
+    from hanzoai.cloud.models.web_engine import WebEngine
+    from hanzoai.cloud.models.web_overview import WebOverview
+    from hanzoai.cloud.models.web_question import WebQuestion
+    from hanzoai.cloud.models.web_result import WebResult
+    from hanzoai.cloud.models.web_search_query import WebSearchQuery
+    from hanzoai.cloud.models.web_search_results import WebSearchResults
+    from hanzoai.cloud.models.window import Window
+    from hanzoai.cloud.models.wire import Wire
+    from hanzoai.cloud.models.wire_fact import WireFact
+    from hanzoai.cloud.models.wire_instructions import WireInstructions
+    from hanzoai.cloud.models.worker_list import WorkerList
+    from hanzoai.cloud.models.worker_script_put import WorkerScriptPut
+    from hanzoai.cloud.models.world_index import WorldIndex
+    from hanzoai.cloud.models.world_wire import WorldWire
+    from hanzoai.cloud.models.write_in import WriteIn
+    from hanzoai.cloud.models.written import Written
+    from hanzoai.cloud.models.wrote import Wrote
+    from hanzoai.cloud.models.zap_proc_req import ZapProcReq
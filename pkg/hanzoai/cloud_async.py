@@ -0,0 +1,535 @@
+"""Asyncio client for the generated `hanzoai.cloud` operations.
+
+`AsyncApiClient` is an `ApiClient` whose transport is `AsyncRESTClientObject`,
+and `AsyncApi` gives any generated `*Api` class awaitable methods under the
+same names::
+
+    async with AsyncApiClient(Configuration(access_token="sk-...")) as client:
+        ai = client.api(AiApi)
+        surface = await ai.ai_mcp_tools(names=True)
+        resp = await ai.ai_mcp_tools_with_http_info()
+
+The generated methods are not duplicated. An awaitable call runs the generated
+method against a recording client: argument validation, `_*_serialize` and
+`param_serialize` run exactly as in the sync client, `call_api` hands back the
+serialized request instead of sending it, and `response_deserialize` records
+the operation's `response_types_map`. The request is then awaited on the shared
+connection pool and decoded by the real `response_deserialize`.
+
+`rest.RESTClientObject` sits on a blocking `urllib3.PoolManager`, so asyncio
+callers had to push every operation onto a thread pool and were capped at the
+pool's size. `AsyncRESTClientObject` is its awaitable twin: one shared, bounded,
+keep-alive connection pool per client, and the same request-body rules as the
+sync layer so both put an operation on the wire the same way. Two backends sit
+behind it:
+
+* `aiohttp` (default) — an HTTP/1.1 keep-alive pool. It is what openapi-
+  generator's own asyncio library uses, and on a local server it carries
+  several times the request rate of httpx at the same connection count.
+* `httpx` — used when `http2=True` (multiplexed streams over few connections,
+  needs `h2`) or when an `httpx.AsyncBaseTransport` is supplied, e.g.
+  `hanzoai.AsyncZapTransport` or `httpx.MockTransport`.
+
+Both are optional (``pip install 'hanzoai[asyncio]'``) and imported on the
+first request. This module is hand-written and lives outside `hanzoai.cloud`,
+which is generated and replaced wholesale on every regeneration.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import ssl
+from typing import Any, Dict, Generic, Optional, Type, TypeVar
+
+from hanzoai.cloud.configuration import Configuration
+from hanzoai.cloud.exceptions import ApiException, ApiValueError
+from hanzoai.cloud_decode import CompiledApiClient
+
+# Keep-alive sockets idle longer than this are closed rather than reused.
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+# Concurrent streams admitted per HTTP/2 connection (servers commonly allow 100).
+HTTP2_STREAMS_PER_CONNECTION = 100
+
+ApiT = TypeVar("ApiT")
+
+
+class AsyncRESTResponse:
+    """`rest.RESTResponse`'s interface over an aiohttp or httpx response.
+
+    The body is already read when the response is preloaded, which is what lets
+    `ApiClient.response_deserialize` and `ApiException.from_response` take
+    either kind unchanged.
+    """
+
+    def __init__(self, resp, status: int, reason: Optional[str], headers) -> None:
+        self.response = resp
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data: Optional[bytes] = None
+
+    def read(self):
+        """Return the body; it must have been loaded with `aread` first."""
+        return self.data
+
+    async def aread(self) -> bytes:
+        if self.data is None:
+            if hasattr(self.response, "aread"):
+                self.data = await self.response.aread()
+            else:
+                self.data = await self.response.read()
+        return self.data
+
+    async def aclose(self) -> None:
+        if hasattr(self.response, "aclose"):
+            await self.response.aclose()
+        else:
+            self.response.release()
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+
+def _ssl_context(configuration) -> Any:
+    if not configuration.verify_ssl:
+        return False
+    context = ssl.create_default_context(
+        cafile=configuration.ssl_ca_cert,
+        cadata=configuration.ca_cert_data,
+    )
+    if configuration.cert_file:
+        context.load_cert_chain(configuration.cert_file, configuration.key_file)
+    if configuration.assert_hostname is False:
+        context.check_hostname = False
+    return context
+
+
+class AsyncRESTClientObject:
+    """Awaitable counterpart of `rest.RESTClientObject`.
+
+    :param configuration: the client's `Configuration`; TLS, proxy and pool
+        size are read from it exactly as the sync layer reads them.
+    :param http2: send over HTTP/2 (httpx + h2) instead of HTTP/1.1.
+    :param max_connections: bound on open connections; defaults to
+        `configuration.connection_pool_maxsize`.
+    :param keepalive_expiry: seconds an idle connection is kept for reuse.
+    :param transport: an `httpx.AsyncBaseTransport` to send through instead of
+        the network.
+    """
+
+    def __init__(
+        self,
+        configuration,
+        *,
+        http2: bool = False,
+        max_connections: Optional[int] = None,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        transport=None,
+    ) -> None:
+        if max_connections is None:
+            max_connections = configuration.connection_pool_maxsize
+        self.configuration = configuration
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.transport = transport
+        self.uses_httpx = http2 or transport is not None
+        # Built on first request: an aiohttp session must be created inside
+        # the event loop that uses it.
+        self._session: Any = None
+        # Requests beyond what the pool can carry wait here rather than in the
+        # backend's pool queue (httpcore rescans every waiter on each change).
+        streams = HTTP2_STREAMS_PER_CONNECTION if http2 else 1
+        self._slots = asyncio.Semaphore(max_connections * streams)
+
+    def _open(self) -> Any:
+        configuration = self.configuration
+        if self.uses_httpx:
+            try:
+                import httpx
+            except ImportError as exc:  # pragma: no cover - hanzoai[asyncio] not installed
+                raise ImportError(
+                    "HTTP/2 and custom transports require the optional 'httpx' package. "
+                    "Install it with: pip install 'hanzoai[asyncio]'"
+                ) from exc
+            transport = self.transport
+            if transport is None:
+                transport = httpx.AsyncHTTPTransport(
+                    verify=_ssl_context(configuration),
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        keepalive_expiry=self.keepalive_expiry,
+                    ),
+                    retries=configuration.retries if isinstance(configuration.retries, int) else 0,
+                    proxy=httpx.Proxy(configuration.proxy, headers=configuration.proxy_headers)
+                    if configuration.proxy
+                    else None,
+                )
+            # Timeouts are per request (`_request_timeout`), as in the sync layer.
+            return httpx.AsyncClient(transport=transport, timeout=None)
+
+        try:
+            import aiohttp
+        except ImportError as exc:  # pragma: no cover - hanzoai[asyncio] not installed
+            raise ImportError(
+                "The asyncio client requires the optional 'aiohttp' package. "
+                "Install it with: pip install 'hanzoai[asyncio]'"
+            ) from exc
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            keepalive_timeout=self.keepalive_expiry,
+            ssl=_ssl_context(configuration),
+        )
+        return aiohttp.ClientSession(connector=connector, trust_env=False)
+
+    async def close(self) -> None:
+        if self._session is None:
+            return
+        if self.uses_httpx:
+            await self._session.aclose()
+        else:
+            await self._session.close()
+        self._session = None
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+        _preload_content=True,
+    ) -> AsyncRESTResponse:
+        """Perform requests.
+
+        Same parameters as `rest.RESTClientObject.request`. With
+        `_preload_content=False` the body is left unread on the connection and
+        the caller must `aread()` or `aclose()` the returned response.
+        """
+        method = method.upper()
+        assert method in [
+            'GET',
+            'HEAD',
+            'DELETE',
+            'POST',
+            'PUT',
+            'PATCH',
+            'OPTIONS'
+        ]
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = dict(headers or {})
+        content = None
+        fields = None
+        files = None
+
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            content_type = headers.get('Content-Type')
+            if not content_type or re.search('json', content_type, re.IGNORECASE):
+                if body is not None:
+                    content = json.dumps(body)
+            elif content_type == 'application/x-www-form-urlencoded':
+                fields = list(post_params)
+            elif content_type == 'multipart/form-data':
+                # The backend writes the boundary into its own Content-Type.
+                del headers['Content-Type']
+                fields, files = [], []
+                for name, value in post_params:
+                    if isinstance(value, tuple):
+                        files.append((name, value))
+                    elif isinstance(value, dict):
+                        fields.append((name, json.dumps(value)))
+                    else:
+                        fields.append((name, value))
+            elif isinstance(body, (str, bytes)):
+                content = body
+            elif content_type.startswith('text/') and isinstance(body, bool):
+                content = "true" if body else "false"
+            else:
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        if self._session is None:
+            self._session = self._open()
+
+        async with self._slots:
+            if self.uses_httpx:
+                response = await self._send_httpx(
+                    method, url, headers, content, fields, files, _request_timeout
+                )
+            else:
+                response = await self._send_aiohttp(
+                    method, url, headers, content, fields, files, _request_timeout
+                )
+            if _preload_content:
+                try:
+                    await response.aread()
+                finally:
+                    await response.aclose()
+        return response
+
+    async def _send_aiohttp(self, method, url, headers, content, fields, files, _request_timeout):
+        import aiohttp
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+                timeout = aiohttp.ClientTimeout(
+                    connect=_request_timeout[0],
+                    sock_read=_request_timeout[1],
+                )
+
+        data: Any = content
+        if files:
+            form = aiohttp.FormData()
+            for name, value in fields or ():
+                form.add_field(name, value)
+            for name, (filename, filedata, mimetype) in files:
+                form.add_field(name, filedata, filename=filename, content_type=mimetype)
+            data = form
+        elif fields is not None:
+            data = aiohttp.FormData(fields)
+
+        args: dict = {"headers": headers, "data": data, "proxy": self.configuration.proxy}
+        if timeout is not None:
+            args["timeout"] = timeout
+        try:
+            r = await self._session.request(method, url, **args)
+        except aiohttp.ClientSSLError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+        return AsyncRESTResponse(r, r.status, r.reason, r.headers)
+
+    async def _send_httpx(self, method, url, headers, content, fields, files, _request_timeout):
+        import httpx
+
+        timeout: Any = httpx.USE_CLIENT_DEFAULT
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = httpx.Timeout(_request_timeout)
+            elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+                timeout = httpx.Timeout(None, connect=_request_timeout[0], read=_request_timeout[1])
+
+        args: dict = {"headers": headers, "timeout": timeout}
+        if content is not None:
+            args["content"] = content
+        if fields is not None:
+            data: dict = {}
+            for name, value in fields:
+                data.setdefault(name, []).append(value)
+            args["data"] = data
+        if files:
+            args["files"] = files
+        request = self._session.build_request(method, url, **args)
+        try:
+            r = await self._session.send(request, stream=True)
+        except httpx.ConnectError as e:
+            if isinstance(e.__context__, ssl.SSLError):
+                msg = "\n".join([type(e.__context__).__name__, str(e.__context__)])
+                raise ApiException(status=0, reason=msg)
+            raise
+        return AsyncRESTResponse(r, r.status_code, r.reason_phrase, r.headers)
+
+
+class _PreparedCall:
+    """A serialized operation, captured instead of sent."""
+
+    def __init__(self, request, _request_timeout) -> None:
+        self.request = request
+        self.request_timeout = _request_timeout
+        self.response_types_map: Optional[Dict[str, Any]] = None
+
+    def read(self):
+        return None
+
+    # The generated methods return `response_deserialize(...).data`, or
+    # `call_api(...).response` when not preloading; both resolving to the call
+    # itself lets every variant hand it back.
+    @property
+    def data(self) -> "_PreparedCall":
+        return self
+
+    @property
+    def response(self) -> "_PreparedCall":
+        return self
+
+
+class _RecordingClient:
+    """Stands in for the `ApiClient` a generated `*Api` calls into.
+
+    Everything but sending and decoding is the real client's.
+    """
+
+    def __init__(self, api_client: "AsyncApiClient") -> None:
+        self._api_client = api_client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._api_client, name)
+
+    def call_api(self, method, url, header_params=None, body=None, post_params=None, _request_timeout=None):
+        return _PreparedCall((method, url, header_params, body, post_params), _request_timeout)
+
+    def response_deserialize(self, response_data: _PreparedCall, response_types_map=None):
+        response_data.response_types_map = response_types_map or {}
+        return response_data
+
+
+class AsyncApiClient(CompiledApiClient):
+    """`hanzoai.cloud.ApiClient` over an asyncio connection pool.
+
+    Serialization, auth and (compiled) deserialization are inherited; only `call_api` is
+    awaitable. Close it with `await client.close()` or `async with`.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    :param http2: send over HTTP/2 (httpx + h2) instead of HTTP/1.1.
+    :param max_connections: bound on open connections; defaults to
+        `configuration.connection_pool_maxsize`.
+    :param keepalive_expiry: seconds an idle connection is kept for reuse.
+    :param transport: an `httpx.AsyncBaseTransport` to send through instead of
+        the network (e.g. `hanzoai.AsyncZapTransport`).
+    """
+
+    _default = None
+
+    def __init__(
+        self,
+        configuration=None,
+        header_name=None,
+        header_value=None,
+        cookie=None,
+        *,
+        http2: bool = False,
+        max_connections: Optional[int] = None,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        transport=None,
+    ) -> None:
+        super().__init__(configuration, header_name, header_value, cookie)
+        self.rest_client = AsyncRESTClientObject(
+            self.configuration,
+            http2=http2,
+            max_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+            transport=transport,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        await self.rest_client.close()
+
+    @classmethod
+    def get_default(cls):
+        """Return the shared default AsyncApiClient, creating it on first use."""
+        if cls._default is None:
+            cls._default = AsyncApiClient(Configuration.get_default())
+        return cls._default
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+        _preload_content=True,
+    ) -> AsyncRESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params dict: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :param _preload_content: read the whole body before returning.
+        :return: AsyncRESTResponse
+        """
+        return await self.rest_client.request(
+            method, url,
+            headers=header_params,
+            body=body, post_params=post_params,
+            _request_timeout=_request_timeout,
+            _preload_content=_preload_content,
+        )
+
+    def api(self, api_cls: Type[ApiT]) -> "AsyncApi[ApiT]":
+        """Awaitable view of a generated `*Api` class bound to this client."""
+        return AsyncApi(api_cls, self)
+
+
+class AsyncApi(Generic[ApiT]):
+    """Awaitable methods for a generated `*Api` class.
+
+    Every public method of `api_cls` is available under its own name and
+    returns a coroutine resolving to what the sync method returns: the model
+    for `op`, an `ApiResponse` for `op_with_http_info`, and an unread
+    `AsyncRESTResponse` for `op_without_preload_content` (`aread()` or
+    `aclose()` it).
+    """
+
+    def __init__(self, api_cls: Type[ApiT], api_client: Optional[AsyncApiClient] = None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        self.api_cls = api_cls
+        self.api_client = api_client
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or not callable(getattr(self.api_cls, name, None)):
+            raise AttributeError(f"{self.api_cls.__name__!r} has no operation {name!r}")
+
+        async def operation(*args: Any, **kwargs: Any) -> Any:
+            api = self.api_cls(_RecordingClient(self.api_client))  # type: ignore[call-arg]
+            prepared: _PreparedCall = getattr(api, name)(*args, **kwargs)
+            preload = prepared.response_types_map is not None
+            response = await self.api_client.call_api(
+                *prepared.request,
+                _request_timeout=prepared.request_timeout,
+                _preload_content=preload,
+            )
+            if not preload:
+                return response
+            api_response = self.api_client.response_deserialize(
+                response_data=response,
+                response_types_map=prepared.response_types_map,
+            )
+            return api_response if name.endswith("_with_http_info") else api_response.data
+
+        operation.__name__ = name
+        operation.__qualname__ = f"AsyncApi[{self.api_cls.__name__}].{name}"
+        operation.__doc__ = getattr(self.api_cls, name).__doc__
+        # `inspect.signature` reads the generated parameters through this.
+        operation.__wrapped__ = getattr(self.api_cls, name)  # type: ignore[attr-defined]
+        # `afetch_many` sizes its fan-out from the client's pool through this.
+        operation.api_client = self.api_client  # type: ignore[attr-defined]
+        # Bind it so the next lookup skips this closure's construction.
+        setattr(self, name, operation)
+        return operation
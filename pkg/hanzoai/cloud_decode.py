@@ -0,0 +1,232 @@
+"""Compiled deserialization for the generated `hanzoai.cloud` client.
+
+The generated `ApiClient.__deserialize` re-parses the `response_type` string,
+looks the class up and walks `issubclass` on every value it decodes, and the
+generated `from_dict` of every model rebuilds the payload dict key by key
+before pydantic validates it. `CompiledApiClient` is a drop-in `ApiClient` that
+does that work once per `response_type`:
+
+* the type string is compiled into a chain of decoders (list/dict/model/enum/
+  primitive) that only walks the data;
+* models whose `from_dict` is equivalent to `model_validate` are built in one
+  pydantic-core pass;
+* a 2xx JSON body whose every leaf is such a model is validated straight from
+  the response bytes through a cached `TypeAdapter` — no decode, no
+  `json.loads`, no intermediate dicts. Any `ValidationError` falls back to the
+  generated path.
+
+Use it wherever an `ApiClient` goes::
+
+    client = CompiledApiClient(Configuration(access_token="sk-..."))
+    issues = hanzoai.cloud.TrackerApi(client).get_issues()
+
+This module is hand-written and lives outside `hanzoai.cloud`, which is
+generated and replaced wholesale on every regeneration. It reaches the
+generated client's name-mangled helpers (`_ApiClient__deserialize_*`) by their
+mangled names; they are part of every openapi-generator Python client.
+"""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import functools
+import re
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, get_args
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+import hanzoai.cloud.models
+from hanzoai.cloud.api_client import ApiClient
+from hanzoai.cloud.api_response import ApiResponse
+
+JSON_CONTENT_TYPE = re.compile(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', re.IGNORECASE)
+CHARSET = re.compile(r"charset=([a-zA-Z\-\d]+)[\s;]?")
+
+_VALIDATES_DIRECTLY: Dict[type, bool] = {}
+
+
+def _validates_directly(model: type) -> bool:
+    """Whether `model.model_validate(d)` builds what `model.from_dict(d)` does.
+
+    The generated `from_dict` rebuilds the payload dict key by key and recurses
+    through `from_dict` of every nested model before pydantic validates it;
+    pydantic-core validates the nested payload itself, in one pass. The two
+    differ for oneOf/anyOf wrappers (`actual_instance`) and where `to_dict`
+    reads `model_fields_set` — `from_dict` marks every field as set, even
+    the ones the payload left out — so those, and any model nesting one, keep
+    the generated path.
+    """
+    known = _VALIDATES_DIRECTLY.get(model)
+    if known is not None:
+        return known
+    direct = (
+        "actual_instance" not in model.model_fields
+        and "model_fields_set" not in model.to_dict.__code__.co_names
+    )
+    # Provisional answer, so models that nest each other terminate.
+    _VALIDATES_DIRECTLY[model] = direct
+    if direct:
+        direct = all(
+            _validates_directly(nested)
+            for field in model.model_fields.values()
+            for nested in _nested_models(field.annotation)
+        )
+        _VALIDATES_DIRECTLY[model] = direct
+    return direct
+
+
+def _nested_models(annotation) -> List[type]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    return [m for arg in get_args(annotation) for m in _nested_models(arg)]
+
+
+class CompiledApiClient(ApiClient):
+    """`hanzoai.cloud.ApiClient` with compiled, cached deserialization plans.
+
+    Takes the same arguments as `ApiClient` and returns the same objects.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # response_type -> compiled decoder; see _decode_plan.
+        self._decode_plans: Dict[Any, Callable[[Any], Any]] = {}
+        self._json_adapters: Dict[str, Optional[TypeAdapter]] = {}
+
+    def response_deserialize(self, response_data, response_types_map=None) -> ApiResponse:
+        """Deserializes response into an object, from the body bytes when it can.
+
+        :param response_data: RESTResponse object to be deserialized.
+        :param response_types_map: dict of response types.
+        :return: ApiResponse
+        """
+        status = response_data.status
+        if response_data.data and isinstance(status, int) and 200 <= status <= 299:
+            types = response_types_map or {}
+            response_type = types.get(str(status)) or types.get(str(status)[0] + "XX")
+            content_type = response_data.getheader('content-type')
+            match = CHARSET.search(content_type) if content_type else None
+            if (
+                isinstance(response_type, str)
+                and response_type not in ("bytearray", "file")
+                and (content_type is None or JSON_CONTENT_TYPE.match(content_type))
+                and (match is None or match.group(1).lower() in ("utf-8", "utf8"))
+            ):
+                adapter = self._json_adapter(response_type)
+                if adapter is not None:
+                    try:
+                        return ApiResponse(
+                            status_code=status,
+                            data=adapter.validate_json(response_data.data),
+                            headers=response_data.getheaders(),
+                            raw_data=response_data.data,
+                        )
+                    except ValidationError:
+                        pass
+        return super().response_deserialize(response_data, response_types_map)
+
+    def _ApiClient__deserialize(self, data, klass):
+        """Replaces the generated per-value walk that `deserialize` calls."""
+        return self._decode_plan(klass)(data)
+
+    def _decode_plan(self, klass) -> Callable[[Any], Any]:
+        """Return the decoder for `klass`, compiling it on first use.
+
+        A `response_type` string is parsed once — `List[...]`/`Dict[...]`
+        peeled, the class name resolved against `hanzoai.cloud.models`, the
+        model/enum/primitive branch chosen — and the result is a chain of
+        closures that only walks the data.
+        """
+        plan = self._decode_plans.get(klass)
+        if plan is None:
+            plan = self._decode_plans[klass] = self._compile(klass)
+        return plan
+
+    def _compile(self, klass) -> Callable[[Any], Any]:
+        decode: Callable[[Any], Any]
+        if isinstance(klass, str):
+            if klass.startswith('List['):
+                m = re.match(r'List\[(.*)]', klass)
+                assert m is not None, "Malformed List type definition"
+                item = self._decode_plan(m.group(1))
+                return lambda data: None if data is None else [item(sub_data) for sub_data in data]
+
+            if klass.startswith('Dict['):
+                m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+                assert m is not None, "Malformed Dict type definition"
+                value = self._decode_plan(m.group(2))
+                return lambda data: None if data is None else {k: value(v) for k, v in data.items()}
+
+            # convert str to class
+            if klass in self.NATIVE_TYPES_MAPPING:
+                klass = self.NATIVE_TYPES_MAPPING[klass]
+            else:
+                klass = getattr(hanzoai.cloud.models, klass)
+
+        if klass in self.PRIMITIVE_TYPES:
+            decode = functools.partial(self._ApiClient__deserialize_primitive, klass=klass)
+        elif klass == object:
+            decode = self._ApiClient__deserialize_object
+        elif klass == datetime.date:
+            decode = self._ApiClient__deserialize_date
+        elif klass == datetime.datetime:
+            decode = self._ApiClient__deserialize_datetime
+        elif klass == decimal.Decimal:
+            decode = decimal.Decimal
+        elif issubclass(klass, Enum):
+            decode = functools.partial(self._ApiClient__deserialize_enum, klass=klass)
+        elif _validates_directly(klass):
+            decode = functools.partial(self._deserialize_model_direct, klass=klass)
+        else:
+            decode = functools.partial(self._ApiClient__deserialize_model, klass=klass)
+        return lambda data: None if data is None else decode(data)
+
+    def _json_adapter(self, response_type: str) -> Optional[TypeAdapter]:
+        """A TypeAdapter that validates the whole body from JSON bytes.
+
+        Only built when every leaf of `response_type` is a model that
+        `_validates_directly`: primitives keep the generated coercions
+        (pydantic's JSON mode will not turn a number into `str`).
+        """
+        if response_type not in self._json_adapters:
+            self._json_adapters[response_type] = self._compile_json_adapter(response_type)
+        return self._json_adapters[response_type]
+
+    def _compile_json_adapter(self, response_type: str) -> Optional[TypeAdapter]:
+        def resolve(klass: str):
+            if klass.startswith('List['):
+                m = re.match(r'List\[(.*)]', klass)
+                item = resolve(m.group(1)) if m else None
+                return None if item is None else List[item]
+            if klass.startswith('Dict['):
+                m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+                value = resolve(m.group(2)) if m else None
+                return None if value is None or m.group(1) != 'str' else Dict[str, value]
+            if klass in self.NATIVE_TYPES_MAPPING:
+                return None
+            model = getattr(hanzoai.cloud.models, klass, None)
+            if not (isinstance(model, type) and issubclass(model, BaseModel)):
+                return None
+            return model if _validates_directly(model) else None
+
+        target = resolve(response_type)
+        return None if target is None else TypeAdapter(target)
+
+    def _deserialize_model_direct(self, data, klass):
+        """Deserializes dict to model in one pydantic-core pass.
+
+        Falls back to `from_dict` for what it tolerates and pydantic does not,
+        e.g. `null` items inside a list of models.
+
+        :param data: dict, list.
+        :param klass: class literal whose `from_dict` `_validates_directly`.
+        :return: model object.
+        """
+        if isinstance(data, dict):
+            try:
+                return klass.model_validate(data)
+            except ValidationError:
+                pass
+        return klass.from_dict(data)
@@ -0,0 +1,346 @@
+"""Lazy pagination and bounded fan-out over the generated `hanzoai.cloud` operations.
+
+List endpoints answer one page at a time — a `*List` model (or a bare list)
+plus whatever tells the caller how to ask for the next one. `paginate` turns
+such an operation into an iterator of items and fetches page N+1 while page N is
+being consumed::
+
+    billing = hanzoai.cloud.BillingApi(client)
+    for transaction in paginate(billing.get_billing_transactions, currency="usd"):
+        ...
+
+How to advance is read off the operation's own parameters, in this order:
+
+* `offset` (+ `limit`)       — offset moves by the items received;
+* `page` (+ `per_page`, ...) — page number moves by one;
+* `cursor` / `after`         — the page's `next_cursor` / `cursor` / `next`,
+                               or the last item's `id` while `has_more` holds.
+
+An operation with none of them is a single page. An empty page ends the walk.
+Otherwise a page that reports a `total` ends it once that many items have been
+received, and a cursor page ends it when it carries no next cursor. Only a
+page with neither ends the walk by being shorter than the size asked for:
+servers may cap the page size below it.
+
+`fetch_many` is the other half of syncing a large tenant: the same operation
+over many independent keys ("get 5,000 projects by id") with bounded
+concurrency on the client's shared connection pool. `apaginate` and
+`afetch_many` are the asyncio forms, for `AsyncApi` operations.
+
+All four are exported from `hanzoai`; like `hanzoai.cloud_async`, this module
+is hand-written and kept out of the generated `hanzoai.cloud` tree.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    get_args,
+)
+
+from pydantic import BaseModel
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_CONCURRENCY = 16
+
+OFFSET_PARAMS = ("offset",)
+PAGE_PARAMS = ("page",)
+CURSOR_PARAMS = ("cursor", "after", "page_token")
+SIZE_PARAMS = ("limit", "per_page", "page_size")
+NEXT_CURSOR_FIELDS = ("next_cursor", "cursor", "next", "next_page_token")
+
+_ITEM_FIELDS: Dict[type, Optional[str]] = {}
+
+
+def _wants_str(annotation: Any) -> bool:
+    """Whether a generated parameter is declared as a string.
+
+    Several list operations take `limit`/`offset`/`page` as `StrictStr`, and
+    `validate_call` refuses an int for them.
+    """
+    if annotation is str:
+        return True
+    return any(_wants_str(arg) for arg in get_args(annotation))
+
+
+def _item_field(model: type) -> Optional[str]:
+    """The one list-valued field of a page model, e.g. `data` or `targets`."""
+    if model not in _ITEM_FIELDS:
+        lists = [
+            name for name, field in model.model_fields.items()
+            if _is_list(field.annotation)
+        ]
+        _ITEM_FIELDS[model] = lists[0] if len(lists) == 1 else None
+    return _ITEM_FIELDS[model]
+
+
+def _is_list(annotation: Any) -> bool:
+    if getattr(annotation, "__origin__", None) is list or annotation is list:
+        return True
+    return any(_is_list(arg) for arg in get_args(annotation))
+
+
+class _PageSpec:
+    """How one operation pages: which parameters move and when to stop."""
+
+    def __init__(
+        self,
+        operation: Callable[..., Any],
+        kwargs: Dict[str, Any],
+        items: Optional[str],
+        page_size: int,
+    ) -> None:
+        try:
+            params = inspect.signature(operation, eval_str=True).parameters
+        except NameError:
+            params = inspect.signature(operation).parameters
+        self.items = items
+        self.kwargs = dict(kwargs)
+        self.mode: Optional[str] = None
+        self.position: Optional[str] = None
+        for mode, names in (("offset", OFFSET_PARAMS), ("page", PAGE_PARAMS), ("cursor", CURSOR_PARAMS)):
+            found = next((name for name in names if name in params), None)
+            if found is not None:
+                self.mode, self.position = mode, found
+                break
+        self.size_param = next((name for name in SIZE_PARAMS if name in params), None)
+        self.page_size = int(self.kwargs.get(self.size_param, page_size)) if self.size_param else None
+        self.seen = 0
+        self._str_params = {
+            name for name in (self.position, self.size_param)
+            if name is not None and _wants_str(params[name].annotation)
+        }
+
+    def _arg(self, name: str, value: Any) -> Any:
+        return str(value) if name in self._str_params else value
+
+    def first(self) -> Dict[str, Any]:
+        kwargs = dict(self.kwargs)
+        if self.size_param is not None:
+            kwargs[self.size_param] = self._arg(self.size_param, self.page_size)
+        if self.mode == "offset":
+            kwargs.setdefault(self.position, self._arg(self.position, 0))
+        elif self.mode == "page":
+            kwargs.setdefault(self.position, self._arg(self.position, 1))
+        return kwargs
+
+    def items_of(self, page: Any) -> List[Any]:
+        if page is None:
+            return []
+        if isinstance(page, list):
+            return page
+        name = self.items
+        if name is None and isinstance(page, BaseModel):
+            name = _item_field(type(page))
+        if name is None:
+            raise ValueError(
+                f"cannot tell which field of {type(page).__name__} holds the items; pass items=<field name>"
+            )
+        return getattr(page, name) or []
+
+    def next(self, kwargs: Dict[str, Any], page: Any, items: List[Any]) -> Optional[Dict[str, Any]]:
+        """Arguments for the page after `page`, or None when it was the last."""
+        if self.mode is None or not items:
+            return None
+        self.seen += len(items)
+        kwargs = dict(kwargs)
+        if self.mode == "cursor":
+            has_more = getattr(page, "has_more", None)
+            if has_more is False:
+                return None
+            token = next((getattr(page, f, None) for f in NEXT_CURSOR_FIELDS if getattr(page, f, None)), None)
+            if token is None and has_more:
+                token = getattr(items[-1], "id", None)
+            if token is None or token == kwargs.get(self.position):
+                return None
+            kwargs[self.position] = self._arg(self.position, token)
+            return kwargs
+
+        total = getattr(page, "total", None)
+        if self.mode == "offset":
+            offset = int(kwargs[self.position]) + len(items)
+            received = offset
+            kwargs[self.position] = self._arg(self.position, offset)
+        else:
+            received = self.seen
+            kwargs[self.position] = self._arg(self.position, int(kwargs[self.position]) + 1)
+        if isinstance(total, int) and not isinstance(total, bool):
+            # A server may cap the page size; only the total says when it's done.
+            return kwargs if received < total else None
+        if self.page_size is not None and len(items) < self.page_size:
+            return None
+        return kwargs
+
+def paginate(
+    operation: Callable[..., Any],
+    /,
+    *args: Any,
+    items: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Yield every item of a paged list operation, one page request at a time.
+
+    :param operation: a bound generated operation, e.g. `billing.get_billing_transactions`.
+    :param args: positional arguments passed to every page request.
+    :param items: the page field holding the items; inferred when the page
+        model has exactly one list field or the response is a list.
+    :param page_size: items per page, sent as `limit`/`per_page` when the
+        operation takes one and the caller did not.
+    :param prefetch: request the next page while the current one is consumed.
+    :param kwargs: operation arguments passed to every page request.
+    """
+    spec = _PageSpec(operation, kwargs, items, page_size)
+    call_kwargs: Optional[Dict[str, Any]] = spec.first()
+    if not prefetch:
+        while call_kwargs is not None:
+            page = operation(*args, **call_kwargs)
+            page_items = spec.items_of(page)
+            call_kwargs = spec.next(call_kwargs, page, page_items)
+            yield from page_items
+        return
+
+    # Not a `with` block: leaving it waits for the prefetch in flight, so a
+    # caller that stops early (break, close, an exception) would block on a
+    # page it never reads.
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hanzoai-paginate")
+    pending: Optional[Future] = pool.submit(operation, *args, **call_kwargs)
+    try:
+        while pending is not None:
+            page = pending.result()
+            page_items = spec.items_of(page)
+            call_kwargs = spec.next(call_kwargs, page, page_items)
+            pending = pool.submit(operation, *args, **call_kwargs) if call_kwargs is not None else None
+            yield from page_items
+    finally:
+        if pending is not None:
+            pending.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(
+    operation: Callable[..., Awaitable[Any]],
+    /,
+    *args: Any,
+    items: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Async form of `paginate` for `AsyncApi` operations.
+
+    The next page's request is a task running while the caller consumes the
+    current page.
+    """
+    spec = _PageSpec(operation, kwargs, items, page_size)
+    call_kwargs: Optional[Dict[str, Any]] = spec.first()
+    pending: Optional[asyncio.Task] = asyncio.ensure_future(operation(*args, **call_kwargs))
+    try:
+        while pending is not None:
+            page = await pending
+            page_items = spec.items_of(page)
+            call_kwargs = spec.next(call_kwargs, page, page_items)
+            pending = None
+            if prefetch and call_kwargs is not None:
+                pending = asyncio.ensure_future(operation(*args, **call_kwargs))
+            for item in page_items:
+                yield item
+            if pending is None and call_kwargs is not None:
+                pending = asyncio.ensure_future(operation(*args, **call_kwargs))
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+def _default_concurrency(operation: Callable[..., Any]) -> int:
+    """The client's pool size: more calls in flight than connections only queue.
+
+    Reads the `api_client` of a bound generated operation or of an `AsyncApi`
+    operation; an `AsyncApiClient` reports its own `max_connections`.
+    """
+    api_client = getattr(operation, "api_client", None)
+    if api_client is None:
+        api_client = getattr(getattr(operation, "__self__", None), "api_client", None)
+    size = getattr(getattr(api_client, "rest_client", None), "max_connections", None)
+    if size is None:
+        size = getattr(getattr(api_client, "configuration", None), "connection_pool_maxsize", None)
+    return size or DEFAULT_CONCURRENCY
+
+
+def fetch_many(
+    operation: Callable[..., Any],
+    keys: Iterable[Any],
+    /,
+    *,
+    key: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    **kwargs: Any,
+) -> List[Any]:
+    """Call `operation` once per key, concurrently, and return results in key order.
+
+    :param operation: a bound generated operation, e.g. `projects_api.get_project`.
+    :param keys: one value per call, passed positionally or as `key=`.
+    :param key: parameter name the key is passed as; positional when omitted.
+    :param max_concurrency: calls in flight at once; defaults to the client's
+        `connection_pool_maxsize`, so the fan-out never outgrows the pool.
+    :param kwargs: arguments shared by every call.
+    :raises: the first failing call's exception; calls not yet started are
+        cancelled.
+    """
+    workers = max_concurrency or _default_concurrency(operation)
+
+    def call(value: Any) -> Any:
+        if key is None:
+            return operation(value, **kwargs)
+        return operation(**{key: value}, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hanzoai-fetch") as pool:
+        futures = [pool.submit(call, value) for value in keys]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+async def afetch_many(
+    operation: Callable[..., Awaitable[Any]],
+    keys: Iterable[Any],
+    /,
+    *,
+    key: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    **kwargs: Any,
+) -> List[Any]:
+    """Async form of `fetch_many` for `AsyncApi` operations.
+
+    `max_concurrency` defaults to the `AsyncApiClient`'s `max_connections`.
+    """
+    slots = asyncio.Semaphore(max_concurrency or _default_concurrency(operation))
+
+    async def call(value: Any) -> Any:
+        async with slots:
+            if key is None:
+                return await operation(value, **kwargs)
+            return await operation(**{key: value}, **kwargs)
+
+    tasks = [asyncio.ensure_future(call(value)) for value in keys]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
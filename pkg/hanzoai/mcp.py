@@ -11,9 +11,10 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, Awaitable
 
 import httpx
 
@@ -172,7 +173,7 @@ class JsonRpcRequest:
         return {"jsonrpc": "2.0", "method": self.method, "params": self.params, "id": self.id}
 
     def to_line(self) -> bytes:
-        return json.dumps(self.to_dict(), separators=(",", ":")).encode() + b"\n"
+        return _to_line(self.to_dict())
 
 
 @dataclass
@@ -201,51 +202,216 @@ _INIT_PARAMS: dict[str, Any] = {
     "clientInfo": {"name": "hanzoai-python", "version": "1.0.0"},
 }
 
+#: Seconds a request waits for its response unless the call says otherwise.
+DEFAULT_REQUEST_TIMEOUT = 30.0
+
+#: Longest line, in bytes, read from a server before the connection is dropped.
+DEFAULT_MAX_LINE = 10 * 1024 * 1024
+
+_READ_CHUNK = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+NotificationHandler = Callable[[dict[str, Any]], Awaitable[None] | None]
+
+
+def _to_line(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def _raise_for_rpc_error(message: dict[str, Any]) -> Any:
+    resp = JsonRpcResponse.from_dict(message)
+    if resp.error is not None:
+        raise MCPClientError(f"JSON-RPC error {resp.error.code}: {resp.error.message}")
+    return resp.result
+
 
 class MCPClient:
-    """MCP client that communicates with a server subprocess over stdio JSON-RPC."""
+    """MCP client that communicates with a server subprocess over stdio JSON-RPC.
+
+    A background task reads the server's stdout and routes each message as it
+    arrives: responses to the request waiting on their ``id``, notifications
+    to the handlers registered with :meth:`on_notification`. Any number of
+    requests may be in flight at once. A request that times out or whose
+    caller is cancelled is withdrawn with ``notifications/cancelled``. Once
+    the server closes its stdout, or sends a line longer than ``max_line``
+    bytes (the server is then terminated), waiting and later requests fail
+    with :class:`MCPClientError`.
+    """
 
     def __init__(
         self,
         server_command: list[str],
         env: dict[str, str] | None = None,
+        *,
+        timeout: float | None = DEFAULT_REQUEST_TIMEOUT,
+        max_line: int = DEFAULT_MAX_LINE,
     ) -> None:
         self.server_command = server_command
         self.env = env
+        self.timeout = timeout
+        self.max_line = max_line
         self._process: asyncio.subprocess.Process | None = None
         self._next_id: int = 1
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._handlers: dict[str, list[NotificationHandler]] = {}
+        self._handler_tasks: set[asyncio.Future[None]] = set()
+        self._reader: asyncio.Task[None] | None = None
+        # Why the reader stopped; nothing sent after that can be answered.
+        self._closed: str | None = None
         self.server_info: dict[str, Any] | None = None
         self.capabilities: dict[str, Any] | None = None
 
     def _require_connected(self) -> None:
         if self._process is None or self._process.stdin is None:
             raise MCPClientError("not connected - call connect() first")
+        if self._closed is not None:
+            raise MCPClientError(f"connection to server closed: {self._closed}")
+
+    def on_notification(self, method: str, handler: NotificationHandler) -> None:
+        """Call ``handler(params)`` for each server notification named ``method``.
 
-    async def _send(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        ``"*"`` matches every notification. Coroutine handlers are scheduled
+        as tasks so they never hold up the reader.
+        """
+        self._handlers.setdefault(method, []).append(handler)
+
+    async def _send(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Any:
+        """Send a request and wait for its response.
+
+        Args:
+            timeout: Seconds to wait; defaults to the client's ``timeout``.
+        """
         self._require_connected()
         req = JsonRpcRequest(method=method, params=params or {}, id=self._next_id)
         self._next_id += 1
 
         stdin = self._process.stdin
-        stdout = self._process.stdout
-        assert stdin is not None and stdout is not None
-
-        stdin.write(req.to_line())
-        await stdin.drain()
+        assert stdin is not None
+        if timeout is None:
+            timeout = self.timeout
 
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending[req.id] = future
         try:
-            raw = await asyncio.wait_for(stdout.readline(), timeout=30.0)
+            try:
+                stdin.write(req.to_line())
+                await stdin.drain()
+            except (BrokenPipeError, ConnectionResetError) as exc:
+                raise MCPClientError(f"connection to server closed: {exc}") from exc
+            message = await asyncio.wait_for(future, timeout)
         except asyncio.TimeoutError:
-            raise MCPClientError("server did not respond within 30 seconds") from None
-        if not raw:
-            raise MCPClientError("server closed stdout unexpectedly")
-        if len(raw) > 10_485_760:  # 10 MB guard
-            raise MCPClientError("server response exceeded 10 MB limit")
+            self._cancel(req, "timed out")
+            raise MCPClientError(f"server did not respond to {method} within {timeout} seconds") from None
+        except asyncio.CancelledError:
+            self._cancel(req, "cancelled")
+            raise
+        finally:
+            self._pending.pop(req.id, None)
+        return _raise_for_rpc_error(message)
+
+    def _cancel(self, req: JsonRpcRequest, reason: str) -> None:
+        """Tell the server to stop working on a request nobody awaits any more."""
+        if req.method == "initialize":
+            return  # the spec forbids cancelling initialize
+        self._write({
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": req.id, "reason": reason},
+        })
+
+    def _write(self, message: dict[str, Any]) -> None:
+        proc = self._process
+        if proc is not None and proc.stdin is not None and not proc.stdin.is_closing():
+            proc.stdin.write(_to_line(message))
 
-        resp = JsonRpcResponse.from_dict(json.loads(raw))
-        if resp.error is not None:
-            raise MCPClientError(f"JSON-RPC error {resp.error.code}: {resp.error.message}")
-        return resp.result
+    async def _read_loop(self, stdout: asyncio.StreamReader) -> None:
+        """Split stdout into lines as chunks arrive, up to ``max_line`` bytes each."""
+        buf = bytearray()
+        error: BaseException = MCPClientError("server closed stdout unexpectedly")
+        try:
+            while chunk := await stdout.read(_READ_CHUNK):
+                # Only the new chunk can hold the newline ending the buffered line.
+                start = len(buf)
+                buf += chunk
+                while (end := buf.find(b"\n", start)) != -1:
+                    line = bytes(buf[:end])
+                    del buf[: end + 1]
+                    start = 0
+                    if line.strip():
+                        self._dispatch(line)
+                if len(buf) > self.max_line:
+                    error = MCPClientError(f"server sent a line over the {self.max_line} byte limit")
+                    self._terminate()
+                    break
+        except Exception as exc:
+            error = MCPClientError(f"failed reading from server: {exc}")
+        self._closed = str(error)
+        self._fail(error)
+
+    def _terminate(self) -> None:
+        """Stop a server that can no longer be read; disconnect() reaps it."""
+        proc = self._process
+        if proc is None:
+            return
+        if proc.stdin is not None:
+            proc.stdin.close()
+        try:
+            proc.terminate()
+        except ProcessLookupError:
+            pass
+
+    def _dispatch(self, line: bytes) -> None:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            logger.warning("ignoring non-JSON line from MCP server: %.200r", line)
+            return
+        if not isinstance(message, dict):
+            return
+
+        method = message.get("method")
+        if method is None:
+            future = self._pending.get(message.get("id"))  # type: ignore[arg-type]
+            if future is not None and not future.done():
+                future.set_result(message)
+        elif "id" in message:
+            self._answer_server_request(message)
+        else:
+            params = message.get("params") or {}
+            for handler in (*self._handlers.get(method, ()), *self._handlers.get("*", ())):
+                self._run_handler(handler, method, params)
+
+    def _run_handler(self, handler: NotificationHandler, method: str, params: dict[str, Any]) -> None:
+        try:
+            result = handler(params)
+        except Exception:
+            logger.exception("MCP notification handler for %s failed", method)
+            return
+        if asyncio.iscoroutine(result):
+            task = asyncio.ensure_future(result)
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
+
+    def _answer_server_request(self, message: dict[str, Any]) -> None:
+        """Answer requests the server sends us: ``ping``, and nothing else."""
+        reply: dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+        if message["method"] == "ping":
+            reply["result"] = {}
+        else:
+            reply["error"] = {"code": -32601, "message": f"Method not found: {message['method']}"}
+        self._write(reply)
+
+    def _fail(self, error: BaseException) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
 
     async def connect(self) -> None:
         """Spawn the server process and perform the MCP initialize handshake."""
@@ -260,12 +426,15 @@ class MCPClient:
         except (FileNotFoundError, PermissionError, OSError) as exc:
             raise MCPClientError(f"failed to start server process: {exc}") from exc
 
+        assert self._process.stdout is not None
+        self._closed = None
+        self._reader = asyncio.ensure_future(self._read_loop(self._process.stdout))
         result = await self._send("initialize", _INIT_PARAMS)
         self.server_info = result.get("serverInfo")
         self.capabilities = result.get("capabilities")
 
     async def disconnect(self) -> None:
-        """Terminate the server process."""
+        """Terminate the server process, failing any requests still waiting."""
         proc = self._process
         if proc is None:
             return
@@ -275,9 +444,17 @@ class MCPClient:
         try:
             proc.terminate()
             await asyncio.wait_for(proc.wait(), timeout=5.0)
-        except (ProcessLookupError, asyncio.TimeoutError):
+        except ProcessLookupError:
+            await proc.wait()
+        except asyncio.TimeoutError:
             proc.kill()
             await proc.wait()
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        self._fail(MCPClientError("client disconnected"))
+        for task in list(self._handler_tasks):
+            task.cancel()
 
     async def list_tools(self) -> list[dict[str, Any]]:
         """Fetch all tools, following pagination cursors."""
@@ -295,13 +472,19 @@ class MCPClient:
                 break
         return tools
 
-    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Call a tool on the server."""
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Call a tool on the server; safe to call concurrently."""
         self._require_connected()
         params: dict[str, Any] = {"name": name}
         if arguments:
             params["arguments"] = arguments
-        return await self._send("tools/call", params)
+        return await self._send("tools/call", params, timeout=timeout)
 
     async def list_resources(self) -> list[dict[str, Any]]:
         """Fetch all resources."""
@@ -323,35 +506,79 @@ class MCPClient:
 
 
 class MCPHttpClient:
-    """MCP client that communicates with a server over HTTP POST (JSON-RPC)."""
+    """MCP client that communicates with a server over HTTP POST (JSON-RPC).
+
+    Requests share one keep-alive connection pool of up to ``max_connections``
+    connections, so concurrent calls run side by side without a handshake
+    each. The ``Mcp-Session-Id`` the server assigns at initialize is sent on
+    every later request.
+    """
 
     def __init__(
         self,
         url: str,
         headers: dict[str, str] | None = None,
-        timeout: float = 30.0,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        *,
+        max_connections: int = 10,
     ) -> None:
         self.url = url
         self._client = httpx.AsyncClient(
             headers=headers or {},
             timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
         )
         self._next_id: int = 1
+        self._background: set[asyncio.Future[None]] = set()
         self.server_info: dict[str, Any] | None = None
         self.capabilities: dict[str, Any] | None = None
 
-    async def _send(self, method: str, params: dict[str, Any] | None = None) -> Any:
+    async def _send(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> Any:
         req = JsonRpcRequest(method=method, params=params or {}, id=self._next_id)
         self._next_id += 1
 
-        resp = await self._client.post(self.url, json=req.to_dict())
+        extra: dict[str, Any] = {} if timeout is None else {"timeout": timeout}
+        try:
+            resp = await self._client.post(self.url, json=req.to_dict(), **extra)
+        except httpx.TimeoutException:
+            self._cancel(req, "timed out")
+            raise MCPClientError(f"server did not respond to {method} in time") from None
+        except asyncio.CancelledError:
+            self._cancel(req, "cancelled")
+            raise
         resp.raise_for_status()
-        body = resp.json()
+        if method == "initialize" and "mcp-session-id" in resp.headers:
+            self._client.headers["Mcp-Session-Id"] = resp.headers["mcp-session-id"]
+        return _raise_for_rpc_error(resp.json())
 
-        rpc_resp = JsonRpcResponse.from_dict(body)
-        if rpc_resp.error is not None:
-            raise MCPClientError(f"JSON-RPC error {rpc_resp.error.code}: {rpc_resp.error.message}")
-        return rpc_resp.result
+    def _cancel(self, req: JsonRpcRequest, reason: str) -> None:
+        """Post ``notifications/cancelled`` for a request in the background."""
+        if req.method == "initialize" or self._client.is_closed:
+            return
+        message = {
+            "jsonrpc": "2.0",
+            "method": "notifications/cancelled",
+            "params": {"requestId": req.id, "reason": reason},
+        }
+
+        async def post() -> None:
+            try:
+                await self._client.post(self.url, json=message)
+            except httpx.HTTPError:
+                pass
+
+        task = asyncio.ensure_future(post())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
 
     async def connect(self) -> None:
         """Perform the MCP initialize handshake over HTTP."""
@@ -361,6 +588,8 @@ class MCPHttpClient:
 
     async def disconnect(self) -> None:
         """Close the HTTP client."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
         await self._client.aclose()
 
     async def list_tools(self) -> list[dict[str, Any]]:
@@ -377,11 +606,17 @@ class MCPHttpClient:
                 break
         return tools
 
-    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def call_tool(
+        self,
+        name: str,
+        arguments: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
         params: dict[str, Any] = {"name": name}
         if arguments:
             params["arguments"] = arguments
-        return await self._send("tools/call", params)
+        return await self._send("tools/call", params, timeout=timeout)
 
     async def list_resources(self) -> list[dict[str, Any]]:
         result = await self._send("resources/list")
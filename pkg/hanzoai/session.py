@@ -113,6 +113,25 @@ class ConversationMessage:
     role: MessageRole
     blocks: list[ContentBlock]
     usage: TokenUsage | None = None
+    _tokens: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def estimated_tokens(self) -> int:
+        """Estimated tokens in this message: len(text)/4 + 1 per block.
+
+        Computed on first use and cached, so blocks are expected not to change
+        once the message is part of a session.
+        """
+        if self._tokens is None:
+            total = 0
+            for block in self.blocks:
+                if isinstance(block, TextBlock):
+                    total += len(block.text) // 4 + 1
+                elif isinstance(block, ToolUseBlock):
+                    total += len(block.input) // 4 + 1
+                elif isinstance(block, ToolResultBlock):
+                    total += len(block.output) // 4 + 1
+            self._tokens = total
+        return self._tokens
 
     # -- Factory methods --
 
@@ -161,6 +180,37 @@ class ConversationMessage:
 class Session:
     version: int = 1
     messages: list[ConversationMessage] = field(default_factory=list)
+    # Running token estimate over messages[:_counted]; _tail is messages[_counted - 1]
+    # as last seen, which tells an append from any other change to the list.
+    _tokens: int = field(default=0, init=False, repr=False, compare=False)
+    _counted: int = field(default=0, init=False, repr=False, compare=False)
+    _tail: ConversationMessage | None = field(default=None, init=False, repr=False, compare=False)
+
+    def append(self, message: ConversationMessage) -> None:
+        """Add a message, counting its tokens into the running estimate."""
+        self.estimated_tokens()
+        self.messages.append(message)
+        self._tokens += message.estimated_tokens()
+        self._counted += 1
+        self._tail = message
+
+    def estimated_tokens(self) -> int:
+        """Running token estimate for the session.
+
+        Messages appended since the last call (through :meth:`append` or
+        directly on ``messages``) are counted once each. The list is rescanned
+        when it was truncated, reassigned or had its last counted message
+        replaced; swapping out an earlier message in place is not noticed.
+        """
+        msgs = self.messages
+        n = self._counted
+        if n > len(msgs) or (n and msgs[n - 1] is not self._tail):
+            self._tokens = n = 0
+        if n < len(msgs):
+            self._tokens += sum(m.estimated_tokens() for m in msgs[n:])
+            self._counted = len(msgs)
+            self._tail = msgs[-1]
+        return self._tokens
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -209,19 +259,19 @@ _FILE_EXTENSIONS = frozenset({
 
 _PENDING_KEYWORDS = frozenset({"todo", "next", "pending", "follow up", "remaining"})
 
+# Tuples for the summary scan: ``str.endswith`` tests every extension in one C
+# call, and a fixed keyword order keeps the pending item stable across runs.
+_FILE_EXTENSION_SUFFIXES = tuple(sorted(_FILE_EXTENSIONS))
+_PENDING_KEYWORD_ORDER = tuple(sorted(_PENDING_KEYWORDS))
+
 
 def estimate_session_tokens(session: Session) -> int:
-    """Estimate token count: len(text)/4 + 1 per block."""
-    total = 0
-    for msg in session.messages:
-        for block in msg.blocks:
-            if isinstance(block, TextBlock):
-                total += len(block.text) // 4 + 1
-            elif isinstance(block, ToolUseBlock):
-                total += len(block.input) // 4 + 1
-            elif isinstance(block, ToolResultBlock):
-                total += len(block.output) // 4 + 1
-    return total
+    """Estimate token count: len(text)/4 + 1 per block.
+
+    Reads the session's running estimate, so it costs O(1) per call for a
+    session that only grows.
+    """
+    return session.estimated_tokens()
 
 
 def should_compact(session: Session, config: CompactionConfig) -> bool:
@@ -267,10 +317,10 @@ def compact_session(session: Session, config: CompactionConfig) -> CompactionRes
         blocks=[TextBlock(text=continuation_text)],
     )
 
-    compacted = Session(
-        version=session.version,
-        messages=[system_msg] + kept,
-    )
+    compacted = Session(version=session.version)
+    compacted.append(system_msg)
+    for msg in kept:
+        compacted.append(msg)
 
     return CompactionResult(
         summary=summary,
@@ -311,7 +361,7 @@ def _build_summary(messages: list[ConversationMessage]) -> str:
                 last_text = block.text
 
                 text_lower = block.text.lower()
-                for kw in _PENDING_KEYWORDS:
+                for kw in _PENDING_KEYWORD_ORDER:
                     if kw in text_lower:
                         for line in block.text.splitlines():
                             if kw in line.lower():
@@ -319,11 +369,12 @@ def _build_summary(messages: list[ConversationMessage]) -> str:
                                 break
                         break
 
-                for token in block.text.split():
-                    if "/" in token and _has_interesting_extension(token):
-                        cleaned = token.strip("(),;:\"'`")
-                        if "/" in cleaned:
-                            file_candidates.add(cleaned)
+                if "/" in block.text:
+                    for token in block.text.split():
+                        if "/" in token and token.endswith(_FILE_EXTENSION_SUFFIXES):
+                            cleaned = token.strip("(),;:\"'`")
+                            if "/" in cleaned:
+                                file_candidates.add(cleaned)
 
                 truncated = block.text[:80] + "..." if len(block.text) > 80 else block.text
                 block_parts.append(truncated.replace("\n", " "))
@@ -365,14 +416,6 @@ def _build_summary(messages: list[ConversationMessage]) -> str:
     return "\n".join(lines)
 
 
-def _has_interesting_extension(token: str) -> bool:
-    """Check if a token looks like a file path with a known extension."""
-    for ext in _FILE_EXTENSIONS:
-        if token.endswith(ext):
-            return True
-    return False
-
-
 def format_compact_summary(summary: str) -> str:
     """Strip analysis tags, extract summary content, collapse blank lines.
 
@@ -41,6 +41,26 @@ Request/response mapping
   or ``x-api-key``) is forwarded as ``Bearer <key>``.
 * **Body** — the request body bytes are forwarded unchanged; the reply bytes become the
   response body with ``content-type: application/json``.
+* **Timeout** — the request's httpx read timeout becomes the ZAP call's timeout; a
+  call that outlives it raises :class:`httpx.ReadTimeout`.
+
+Concurrent requests share one ZAP connection: ``CloudClient`` tags each call with a
+correlation id and matches replies as they arrive, so calls from many threads (or
+tasks) are in flight together rather than queued behind one another.
+
+Connection pool
+---------------
+Each transport sends through a :class:`ZapPool`: ``connections_per_endpoint``
+connections to every endpoint (``endpoint`` may list several, comma-separated), each
+call going to the live connection with the fewest calls outstanding. A dropped
+connection is re-dialled in the background — handshake included — with exponential
+backoff, so one broken socket fails only the calls that were on it; while every
+connection is backing off, callers wait up to ``acquire_timeout`` seconds for the
+next retry rather than failing at once. Every
+``health_interval`` seconds dead connections are re-dialled and, when a
+``health_method`` is given, idle ones are pinged with it and replaced if they do not
+answer. :attr:`ZapPool.metrics` reports connections, in-flight calls, callers queued
+for a connection and reconnects.
 
 Only unary (non-streaming) JSON calls are translated; streaming responses are out of
 scope for this transport and should use the default HTTPS client.
@@ -51,8 +71,10 @@ from __future__ import annotations
 import os
 import json
 import asyncio
+import logging
 import threading
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Awaitable, Sequence
+from dataclasses import dataclass
 
 import httpx
 
@@ -60,6 +82,8 @@ if TYPE_CHECKING:
     from hanzo_zap import CloudClient
 
 __all__ = [
+    "ZapPool",
+    "ZapPoolMetrics",
     "ZapTransport",
     "AsyncZapTransport",
     "zap_http_client",
@@ -67,8 +91,16 @@ __all__ = [
     "method_from_path",
 ]
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_NODE_ID = "python-sdk"
 ZAP_ENDPOINT_ENV = "HANZO_ZAP_ENDPOINT"
+DEFAULT_HEALTH_INTERVAL = 15.0
+DEFAULT_HEALTH_TIMEOUT = 5.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_ACQUIRE_TIMEOUT = 10.0
+#: Reconnect backoff after consecutive failed dials: 0.1s, 0.2s, ... capped at 5s.
+RECONNECT_BACKOFF = (0.1, 5.0)
 
 
 def _load_cloud_client() -> type[CloudClient]:
@@ -114,6 +146,12 @@ def method_from_path(path: str) -> str:
     return trimmed.replace("/", ".")
 
 
+def _timeout_from_request(request: httpx.Request) -> float | None:
+    """The read timeout httpx attached to the request, used as the ZAP call timeout."""
+    timeout = request.extensions.get("timeout") or {}
+    return timeout.get("read")
+
+
 def _build_response(request: httpx.Request, status: int, body: bytes, error: str) -> httpx.Response:
     if not body and error:
         body = json.dumps({"error": {"message": error, "type": "zap_error"}}).encode("utf-8")
@@ -125,12 +163,294 @@ def _build_response(request: httpx.Request, status: int, body: bytes, error: str
     )
 
 
+def _endpoint_list(endpoint: str | Sequence[str] | None) -> list[str | None]:
+    """``"a:1,b:2"`` or ``["a:1", "b:2"]`` -> endpoints; ``None`` -> hanzo-zap's default."""
+    if endpoint is None:
+        return [None]
+    if isinstance(endpoint, str):
+        endpoint = endpoint.split(",")
+    endpoints = [e.strip() for e in endpoint if e.strip()]
+    return list(endpoints) or [None]
+
+
+@dataclass(frozen=True)
+class ZapPoolMetrics:
+    """A point-in-time view of a :class:`ZapPool`."""
+
+    connections: int
+    """Connections the pool keeps: endpoints x ``connections_per_endpoint``."""
+    connected: int
+    """Of those, how many are currently live."""
+    in_flight: int
+    """Calls sent and awaiting their response."""
+    queue_depth: int
+    """Callers waiting for a usable connection."""
+    reconnects: int
+    """Connections re-established after being lost."""
+    failed_health_checks: int
+    """Health pings that timed out or found the connection gone."""
+
+
+class _PooledConnection:
+    """One pool slot: an endpoint and the (re)connectable client behind it."""
+
+    __slots__ = ("endpoint", "client", "in_flight", "dialing", "failures", "retry_at", "error", "ever_connected")
+
+    def __init__(self, endpoint: str | None) -> None:
+        self.endpoint = endpoint
+        self.client: CloudClient | None = None
+        self.in_flight = 0
+        self.dialing: asyncio.Task[None] | None = None
+        self.failures = 0
+        self.retry_at = 0.0
+        self.error: BaseException | None = None
+        self.ever_connected = False
+
+    @property
+    def live(self) -> bool:
+        return self.client is not None and not self.client.closed
+
+
+class ZapPool:
+    """Health-checked pool of :class:`hanzo_zap.CloudClient` connections.
+
+    Has the ``call`` / ``close`` shape of a single ``CloudClient``, so a transport
+    sends through either. Connections are dialled on first use, all from the event
+    loop that first calls :meth:`call`.
+
+    :param endpoint: ``"host:port"``, several comma-separated, or a sequence of
+        them. ``None`` uses hanzo-zap's default endpoint.
+    :param connections_per_endpoint: connections kept to each endpoint.
+    :param max_in_flight_per_connection: cap on calls outstanding on one
+        connection; callers beyond it queue (``None`` = unbounded, since each
+        connection multiplexes).
+    :param health_interval: seconds between health sweeps; ``0`` disables them.
+    :param health_method: ZAP method pinged on idle connections each sweep. Any
+        reply counts as healthy; ``None`` only re-dials dead connections.
+    :param acquire_timeout: seconds a call waits for a connection while every one
+        is backing off after failed dials; it fails once the next retry is further
+        away than that. ``0`` fails at once.
+    :param connect: ``async (endpoint) -> CloudClient`` dialer, replacing
+        ``CloudClient.connect`` (chiefly for tests).
+    """
+
+    def __init__(
+        self,
+        endpoint: str | Sequence[str] | None = None,
+        *,
+        connections_per_endpoint: int = 1,
+        max_in_flight_per_connection: int | None = None,
+        use_tls: bool | None = None,
+        node_id: str = DEFAULT_NODE_ID,
+        health_interval: float = DEFAULT_HEALTH_INTERVAL,
+        health_method: str | None = None,
+        health_timeout: float = DEFAULT_HEALTH_TIMEOUT,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+        connect: Callable[[str | None], Awaitable[CloudClient]] | None = None,
+    ) -> None:
+        if connections_per_endpoint < 1:
+            raise ValueError("connections_per_endpoint must be at least 1")
+        self._connections = [
+            _PooledConnection(e)
+            for e in _endpoint_list(endpoint)
+            for _ in range(connections_per_endpoint)
+        ]
+        self._max_in_flight = max_in_flight_per_connection
+        self._use_tls = use_tls
+        self._node_id = node_id
+        self._health_interval = health_interval
+        self._health_method = health_method
+        self._health_timeout = health_timeout
+        self._connect_timeout = connect_timeout
+        self._acquire_timeout = acquire_timeout
+        self._connect = connect or self._dial
+        self._waiters: list[asyncio.Future[None]] = []
+        self._health_task: asyncio.Task[None] | None = None
+        self._closed = False
+        self._reconnects = 0
+        self._failed_health_checks = 0
+
+    @property
+    def metrics(self) -> ZapPoolMetrics:
+        return ZapPoolMetrics(
+            connections=len(self._connections),
+            connected=sum(c.live for c in self._connections),
+            in_flight=sum(c.in_flight for c in self._connections),
+            queue_depth=len(self._waiters),
+            reconnects=self._reconnects,
+            failed_health_checks=self._failed_health_checks,
+        )
+
+    async def call(
+        self, method: str, auth: str, body: bytes, *, timeout: float | None = None
+    ) -> tuple[int, bytes, str]:
+        """Send one call on the least-loaded live connection.
+
+        Raises :class:`ConnectionError` when no connection can be made, or when the
+        connection carrying the call drops before it is answered — a call that may
+        have reached the server is never re-sent.
+        """
+        conn = await self._acquire()
+        client = conn.client
+        assert client is not None
+        try:
+            return await client.call(method, auth, body, timeout=timeout)
+        except ConnectionError:
+            self._redial(conn)
+            raise
+        finally:
+            conn.in_flight -= 1
+            self._wake(1)
+
+    async def close(self) -> None:
+        """Close every connection and stop health checks; waiting callers fail."""
+        self._closed = True
+        tasks = [c.dialing for c in self._connections if c.dialing is not None]
+        if self._health_task is not None:
+            tasks.append(self._health_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._wake()
+        for conn in self._connections:
+            if conn.client is not None:
+                await conn.client.close()
+                conn.client = None
+
+    # -- acquiring a connection -------------------------------------------------
+
+    async def _acquire(self) -> _PooledConnection:
+        loop = asyncio.get_running_loop()
+        if self._health_task is None and self._health_interval > 0 and not self._closed:
+            self._health_task = loop.create_task(self._health_loop())
+        deadline = loop.time() + self._acquire_timeout
+        while True:
+            if self._closed:
+                raise ConnectionError("ZAP pool is closed")
+            conn = self._least_loaded()
+            if conn is not None:
+                conn.in_flight += 1
+                return conn
+            for dead in self._connections:
+                if not dead.live:
+                    self._redial(dead)
+            delay: float | None = None
+            if not any(c.live or c.dialing is not None for c in self._connections):
+                # Every connection is backing off: wait for the first retry.
+                retry_at = min(c.retry_at for c in self._connections)
+                if retry_at > deadline:
+                    error = next((c.error for c in self._connections if c.error is not None), None)
+                    raise ConnectionError("no ZAP connection available") from error
+                delay = max(0.0, retry_at - loop.time())
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait((waiter,), timeout=delay)
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _least_loaded(self) -> _PooledConnection | None:
+        best: _PooledConnection | None = None
+        for conn in self._connections:
+            if not conn.live:
+                continue
+            if self._max_in_flight is not None and conn.in_flight >= self._max_in_flight:
+                continue
+            if best is None or conn.in_flight < best.in_flight:
+                best = conn
+        return best
+
+    def _wake(self, n: int | None = None) -> None:
+        """Let ``n`` (default: all) queued callers look for a connection again."""
+        woken = self._waiters if n is None else self._waiters[:n]
+        for waiter in woken:
+            if not waiter.done():
+                waiter.set_result(None)
+        del self._waiters[: len(woken)]
+
+    # -- (re)connecting ---------------------------------------------------------
+
+    async def _dial(self, endpoint: str | None) -> CloudClient:
+        cloud_client = _load_cloud_client()
+        return await cloud_client.connect(endpoint, use_tls=self._use_tls, node_id=self._node_id)
+
+    def _redial(self, conn: _PooledConnection) -> None:
+        """Start reconnecting ``conn`` unless it is live, already dialling or backing off."""
+        if self._closed or conn.live or conn.dialing is not None:
+            return
+        loop = asyncio.get_running_loop()
+        if loop.time() < conn.retry_at:
+            return
+        conn.dialing = loop.create_task(self._reconnect(conn))
+
+    async def _reconnect(self, conn: _PooledConnection) -> None:
+        old, conn.client = conn.client, None
+        try:
+            if old is not None:
+                await old.close()
+            # A fresh CloudClient.connect replays the handshake on the new socket.
+            client = await asyncio.wait_for(self._connect(conn.endpoint), self._connect_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            conn.error = exc
+            conn.failures += 1
+            low, high = RECONNECT_BACKOFF
+            conn.retry_at = asyncio.get_running_loop().time() + min(high, low * 2 ** (conn.failures - 1))
+        else:
+            conn.client = client
+            conn.error = None
+            conn.failures = 0
+            if conn.ever_connected:
+                self._reconnects += 1
+            conn.ever_connected = True
+        finally:
+            conn.dialing = None
+            self._wake()
+
+    # -- health checks ----------------------------------------------------------
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._health_interval)
+            results = await asyncio.gather(
+                *(self._check(conn) for conn in self._connections), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning("ZAP health check failed: %r", result)
+
+    async def _check(self, conn: _PooledConnection) -> None:
+        if not conn.live:
+            self._redial(conn)
+            return
+        if self._health_method is None or conn.in_flight:
+            return
+        client = conn.client
+        assert client is not None
+        try:
+            await client.call(self._health_method, "", b"", timeout=self._health_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Whatever went wrong, the connection is not answering as it should.
+            if not isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+                logger.warning("ZAP health ping to %s failed: %r", conn.endpoint, exc)
+            self._failed_health_checks += 1
+            if conn.client is client:
+                await client.close()
+                self._redial(conn)
+
 class _LoopThread:
     """A dedicated asyncio event loop running on a daemon thread.
 
     Lets the synchronous transport drive the async :class:`CloudClient` from any
     thread — including one that already has its own running loop — via
-    :func:`asyncio.run_coroutine_threadsafe`.
+    :func:`asyncio.run_coroutine_threadsafe`. Only the calling thread blocks: calls
+    submitted from many threads run concurrently on the loop and are multiplexed
+    over the client's one connection.
     """
 
     def __init__(self) -> None:
@@ -154,49 +474,54 @@ class ZapTransport(httpx.BaseTransport):
 
     Pass the resulting client to :class:`~hanzoai.Hanzo` via ``http_client`` (see
     :func:`zap_http_client` for the one-liner). A pre-built ``client`` may be injected
-    (chiefly for tests); otherwise a :class:`hanzo_zap.CloudClient` is connected lazily
-    on first request.
+    (chiefly for tests); otherwise requests go through a :class:`ZapPool` whose
+    connections are made lazily on first request.
     """
 
     def __init__(
         self,
-        endpoint: str | None = None,
+        endpoint: str | Sequence[str] | None = None,
         *,
-        client: CloudClient | None = None,
+        client: CloudClient | ZapPool | None = None,
         use_tls: bool | None = None,
         node_id: str = DEFAULT_NODE_ID,
+        connections_per_endpoint: int = 1,
+        health_interval: float = DEFAULT_HEALTH_INTERVAL,
+        health_method: str | None = None,
     ) -> None:
-        self._endpoint = endpoint or os.environ.get(ZAP_ENDPOINT_ENV)
-        self._use_tls = use_tls
-        self._node_id = node_id
-        self._client = client
         self._owns_client = client is None
+        if client is None:
+            client = ZapPool(
+                endpoint or os.environ.get(ZAP_ENDPOINT_ENV),
+                connections_per_endpoint=connections_per_endpoint,
+                use_tls=use_tls,
+                node_id=node_id,
+                health_interval=health_interval,
+                health_method=health_method,
+            )
+        self._client = client
         self._loop = _LoopThread()
-        self._lock = threading.Lock()
-
-    def _ensure_client(self) -> CloudClient:
-        if self._client is None:
-            with self._lock:
-                if self._client is None:
-                    cloud_client = _load_cloud_client()
-                    self._client = self._loop.run(
-                        cloud_client.connect(
-                            self._endpoint, use_tls=self._use_tls, node_id=self._node_id
-                        )
-                    )
-        return self._client
+
+    @property
+    def pool(self) -> ZapPool | None:
+        """The connection pool requests go through, unless a client was injected."""
+        return self._client if isinstance(self._client, ZapPool) else None
 
     def handle_request(self, request: httpx.Request) -> httpx.Response:
-        client = self._ensure_client()
         method = method_from_path(request.url.path)
         auth = _auth_from_request(request)
         body = request.read()
-        status, resp_body, error = self._loop.run(client.call(method, auth, body))
+        try:
+            status, resp_body, error = self._loop.run(
+                self._client.call(method, auth, body, timeout=_timeout_from_request(request))
+            )
+        except asyncio.TimeoutError as exc:
+            raise httpx.ReadTimeout(f"ZAP call {method!r} timed out", request=request) from exc
         return _build_response(request, status, resp_body, error)
 
     def close(self) -> None:
         try:
-            if self._client is not None and self._owns_client:
+            if self._owns_client:
                 self._loop.run(self._client.close())
         finally:
             self._loop.close()
@@ -206,52 +531,60 @@ class AsyncZapTransport(httpx.AsyncBaseTransport):
     """Asynchronous httpx transport that routes requests over ZAP.
 
     Pass the resulting client to :class:`~hanzoai.AsyncHanzo` via ``http_client`` (see
-    :func:`async_zap_http_client`).
+    :func:`async_zap_http_client`). Takes the same arguments as :class:`ZapTransport`.
     """
 
     def __init__(
         self,
-        endpoint: str | None = None,
+        endpoint: str | Sequence[str] | None = None,
         *,
-        client: CloudClient | None = None,
+        client: CloudClient | ZapPool | None = None,
         use_tls: bool | None = None,
         node_id: str = DEFAULT_NODE_ID,
+        connections_per_endpoint: int = 1,
+        health_interval: float = DEFAULT_HEALTH_INTERVAL,
+        health_method: str | None = None,
     ) -> None:
-        self._endpoint = endpoint or os.environ.get(ZAP_ENDPOINT_ENV)
-        self._use_tls = use_tls
-        self._node_id = node_id
-        self._client = client
         self._owns_client = client is None
-        self._lock = asyncio.Lock()
-
-    async def _ensure_client(self) -> CloudClient:
-        if self._client is None:
-            async with self._lock:
-                if self._client is None:
-                    cloud_client = _load_cloud_client()
-                    self._client = await cloud_client.connect(
-                        self._endpoint, use_tls=self._use_tls, node_id=self._node_id
-                    )
-        return self._client
+        if client is None:
+            client = ZapPool(
+                endpoint or os.environ.get(ZAP_ENDPOINT_ENV),
+                connections_per_endpoint=connections_per_endpoint,
+                use_tls=use_tls,
+                node_id=node_id,
+                health_interval=health_interval,
+                health_method=health_method,
+            )
+        self._client = client
+
+    @property
+    def pool(self) -> ZapPool | None:
+        """The connection pool requests go through, unless a client was injected."""
+        return self._client if isinstance(self._client, ZapPool) else None
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
-        client = await self._ensure_client()
         method = method_from_path(request.url.path)
         auth = _auth_from_request(request)
         body = await request.aread()
-        status, resp_body, error = await client.call(method, auth, body)
+        try:
+            status, resp_body, error = await self._client.call(
+                method, auth, body, timeout=_timeout_from_request(request)
+            )
+        except asyncio.TimeoutError as exc:
+            raise httpx.ReadTimeout(f"ZAP call {method!r} timed out", request=request) from exc
         return _build_response(request, status, resp_body, error)
 
     async def aclose(self) -> None:
-        if self._client is not None and self._owns_client:
+        if self._owns_client:
             await self._client.close()
 
 
 def zap_http_client(
-    endpoint: str | None = None,
+    endpoint: str | Sequence[str] | None = None,
     *,
     use_tls: bool | None = None,
     node_id: str = DEFAULT_NODE_ID,
+    connections_per_endpoint: int = 1,
     **httpx_kwargs: Any,
 ) -> httpx.Client:
     """Build an :class:`httpx.Client` whose transport speaks ZAP.
@@ -261,20 +594,26 @@ def zap_http_client(
         hanzoai.Hanzo(api_key="sk-...", http_client=hanzoai.zap_http_client("api.hanzo.ai:3692"))
 
     ``endpoint`` defaults to the ``HANZO_ZAP_ENDPOINT`` env var, then to
-    ``hanzo_zap``'s own default (``localhost:3692``). Extra keyword arguments are
-    forwarded to :class:`httpx.Client`.
+    ``hanzo_zap``'s own default (``localhost:3692``); several may be given,
+    comma-separated, with ``connections_per_endpoint`` connections to each. Extra
+    keyword arguments are forwarded to :class:`httpx.Client`.
     """
-    transport = ZapTransport(endpoint, use_tls=use_tls, node_id=node_id)
+    transport = ZapTransport(
+        endpoint, use_tls=use_tls, node_id=node_id, connections_per_endpoint=connections_per_endpoint
+    )
     return httpx.Client(transport=transport, **httpx_kwargs)
 
 
 def async_zap_http_client(
-    endpoint: str | None = None,
+    endpoint: str | Sequence[str] | None = None,
     *,
     use_tls: bool | None = None,
     node_id: str = DEFAULT_NODE_ID,
+    connections_per_endpoint: int = 1,
     **httpx_kwargs: Any,
 ) -> httpx.AsyncClient:
     """Async counterpart of :func:`zap_http_client` for :class:`~hanzoai.AsyncHanzo`."""
-    transport = AsyncZapTransport(endpoint, use_tls=use_tls, node_id=node_id)
+    transport = AsyncZapTransport(
+        endpoint, use_tls=use_tls, node_id=node_id, connections_per_endpoint=connections_per_endpoint
+    )
     return httpx.AsyncClient(transport=transport, **httpx_kwargs)
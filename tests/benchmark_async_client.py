@@ -0,0 +1,111 @@
+"""Throughput benchmark: `AsyncApiClient` vs the threaded sync `ApiClient`.
+
+Both clients call the same generated operation (`AiApi.ai_mcp_tools`) against
+a local keep-alive HTTP/1.1 server that answers every request with a small JSON
+body, so what is measured is client overhead, not the network.
+
+* sync  — `ApiClient` driven from a `ThreadPoolExecutor` (`--threads` workers),
+          which is how asyncio services called the client before.
+* async — one `AsyncApiClient`, `--requests` coroutines gathered at once.
+
+    python tests/benchmark_async_client.py [--requests 1000] [--threads 64]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "pkg"))
+
+import hanzoai.cloud  # noqa: E402
+from hanzoai import AsyncApiClient  # noqa: E402
+from hanzoai.cloud import ApiClient, Configuration  # noqa: E402
+
+BODY = b'{"tools": 3, "names": ["a", "b", "c"]}'
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+    b"Content-Length: " + str(len(BODY)).encode() + b"\r\n\r\n" + BODY
+)
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def start_server() -> tuple[str, asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    address: list[str] = []
+
+    async def serve() -> None:
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0, backlog=4096)
+        host, port = server.sockets[0].getsockname()[:2]
+        address.append(f"http://{host}:{port}")
+        ready.set()
+        async with server:
+            await server.serve_forever()
+
+    threading.Thread(target=loop.run_until_complete, args=(serve(),), daemon=True).start()
+    ready.wait()
+    return address[0], loop
+
+
+def bench_sync(host: str, requests: int, threads: int) -> float:
+    cfg = Configuration(host=host)
+    cfg.connection_pool_maxsize = threads
+    api = hanzoai.cloud.AiApi(ApiClient(cfg))
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda _: api.ai_mcp_tools(), range(threads)))  # warm the pool
+        t0 = time.perf_counter()
+        list(pool.map(lambda _: api.ai_mcp_tools(), range(requests)))
+        return time.perf_counter() - t0
+
+
+async def bench_async(host: str, requests: int, connections: int) -> float:
+    async with AsyncApiClient(Configuration(host=host), max_connections=connections) as client:
+        ai = client.api(hanzoai.cloud.AiApi)
+        await asyncio.gather(*(ai.ai_mcp_tools() for _ in range(connections)))
+        t0 = time.perf_counter()
+        await asyncio.gather(*(ai.ai_mcp_tools() for _ in range(requests)))
+        return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--connections", type=int, default=64)
+    args = parser.parse_args()
+
+    host, _ = start_server()
+    print(f"{args.requests} concurrent requests against {host}")
+    print(f"{'client':<34}{'seconds':>10}{'req/s':>12}")
+    t = bench_sync(host, args.requests, args.threads)
+    print(f"{f'sync ApiClient, {args.threads} threads':<34}{t:>10.3f}{args.requests / t:>12.0f}")
+    t = asyncio.run(bench_async(host, args.requests, args.connections))
+    label = f"AsyncApiClient, {args.connections} connections"
+    print(f"{label:<34}{t:>10.3f}{args.requests / t:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
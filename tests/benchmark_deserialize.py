@@ -0,0 +1,97 @@
+"""Micro-benchmark for `CompiledApiClient.response_deserialize` on large list payloads.
+
+Decodes a 10k-item `List[IssueView]` body three ways:
+
+* legacy   — what `__deserialize` did per call: decode the bytes, `json.loads`,
+             regex the type string, look the class up, `from_dict` per item.
+* plan     — `CompiledApiClient.deserialize` on the text, walking the compiled plan.
+* bytes    — `CompiledApiClient.response_deserialize`, validating straight from the
+             body bytes through the cached TypeAdapter.
+
+    python tests/benchmark_deserialize.py [--items 10000] [--runs 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "pkg"))
+
+import hanzoai.cloud.models  # noqa: E402
+from hanzoai.cloud import Configuration  # noqa: E402
+from hanzoai.cloud.rest import RESTResponse  # noqa: E402
+from hanzoai.cloud_decode import CompiledApiClient  # noqa: E402
+
+
+class _Resp:
+    def __init__(self, body: bytes) -> None:
+        self.status = 200
+        self.reason = "OK"
+        self.data = body
+        self.headers = {"content-type": "application/json; charset=utf-8"}
+
+
+def legacy(body: bytes, response_type: str):
+    data = json.loads(body.decode("utf-8"))
+    m = re.match(r"List\[(.*)]", response_type)
+    assert m is not None
+    klass = getattr(hanzoai.cloud.models, m.group(1))
+    return [klass.from_dict(item) for item in data]
+
+
+def best_of(runs: int, fn) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    item = {
+        "assignee": "zeekay",
+        "createdAt": 1700000000,
+        "description": "A body of markdown " * 4,
+        "labels": ["bug", "p1"],
+        "projectKey": "cli",
+        "status": "todo",
+        "priority": "high",
+        "title": "Fix the thing",
+    }
+    body = json.dumps([dict(item, number=i) for i in range(args.items)]).encode()
+    response_type = "List[IssueView]"
+    client = CompiledApiClient(Configuration(host="https://api.hanzo.ai"))
+
+    def via_bytes():
+        resp = RESTResponse(_Resp(body))
+        resp.read()
+        return client.response_deserialize(resp, {"200": response_type}).data
+
+    def via_plan():
+        return client.deserialize(body.decode("utf-8"), response_type, "application/json")
+
+    assert via_bytes() == via_plan() == legacy(body, response_type)
+
+    print(f"{args.items} x IssueView, {len(body) / 1e6:.1f} MB, best of {args.runs}")
+    base = None
+    for label, fn in (("legacy from_dict", lambda: legacy(body, response_type)),
+                      ("compiled plan", via_plan),
+                      ("validate_json bytes", via_bytes)):
+        t = best_of(args.runs, fn)
+        base = base or t
+        print(f"{label:<22}{t * 1000:>10.1f} ms{base / t:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
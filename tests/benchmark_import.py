@@ -0,0 +1,76 @@
+"""Cold-start benchmark for `import hanzoai`.
+
+Measures wall time and peak RSS of a fresh interpreter that imports the
+package, against one that then resolves every name in `hanzoai.cloud.__all__`
+— the cost every `import hanzoai` paid when the generated namespace imported
+all of its API and model modules eagerly.
+
+    python tests/benchmark_import.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PKG = Path(__file__).resolve().parent.parent / "pkg"
+
+LAZY = "import hanzoai"
+# Resolves every name, which is exactly what the eager namespace did on import.
+EAGER = """
+import hanzoai, hanzoai.cloud as c
+for n in c.__all__:
+    try:
+        getattr(c, n)
+    except (AttributeError, ImportError):
+        pass
+"""
+
+PROBE = """
+import resource, sys, time
+t0 = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - t0
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+mods = sum(1 for m in sys.modules if m.startswith("hanzoai.cloud."))
+print(elapsed, rss_kb, mods)
+"""
+
+
+def measure(body: str, runs: int) -> tuple[float, float, int]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(PKG), os.environ.get("PYTHONPATH")])))
+    times, rss, mods = [], [], 0
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(body=body)],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(out[0]))
+        rss.append(int(out[1]) / 1024)
+        mods = int(out[2])
+    return statistics.median(times), statistics.median(rss), mods
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # One throwaway run so both cases read warm bytecode caches.
+    measure(EAGER, 1)
+
+    print(f"{'case':<28}{'time (ms)':>12}{'peak RSS (MB)':>16}{'cloud modules':>16}")
+    for label, body in (("import hanzoai (lazy)", LAZY), ("full surface (eager)", EAGER)):
+        t, rss, mods = measure(body, args.runs)
+        print(f"{label:<28}{t * 1000:>12.1f}{rss:>16.1f}{mods:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Per-turn session bookkeeping cost at 1k/10k/100k messages.
+
+A turn is what an agent loop does after each exchange: append the user and
+assistant messages, then ask ``should_compact``. Two ways of answering it:
+
+* rescan  — what ``estimate_session_tokens`` did: walk every block of every
+            message on each call;
+* running — ``Session``'s running estimate, which counts only new messages.
+
+Also times the file-path and pending-work scan a compaction summary makes
+over the whole session: the old loop, which split every text and tried each
+extension per token, against the current one, which splits only texts with a
+"/" and tests all extensions with one tuple ``endswith``.
+
+    python tests/benchmark_session.py [--sizes 1000 10000 100000] [--turns 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "pkg"))
+
+from hanzoai.session import (  # noqa: E402
+    _FILE_EXTENSIONS,
+    _PENDING_KEYWORDS,
+    _PENDING_KEYWORD_ORDER,
+    _FILE_EXTENSION_SUFFIXES,
+    Session,
+    TextBlock,
+    ToolUseBlock,
+    CompactionConfig,
+    ToolResultBlock,
+    ConversationMessage,
+    should_compact,
+)
+
+PROSE = "The assistant walks through how the function works and what it returns. " * 4
+TEXT = PROSE + "Looking at src/hanzoai/session.py next, then the remaining cases."
+CONFIG = CompactionConfig(max_estimated_tokens=10**12)  # measure the check, never compact
+
+
+def rescan(session: Session) -> int:
+    total = 0
+    for msg in session.messages:
+        for block in msg.blocks:
+            if isinstance(block, TextBlock):
+                total += len(block.text) // 4 + 1
+            elif isinstance(block, ToolUseBlock):
+                total += len(block.input) // 4 + 1
+            elif isinstance(block, ToolResultBlock):
+                total += len(block.output) // 4 + 1
+    return total
+
+
+def legacy_scan(messages: list[ConversationMessage]) -> int:
+    found = 0
+    for msg in messages:
+        for block in msg.blocks:
+            if isinstance(block, TextBlock):
+                text_lower = block.text.lower()
+                for kw in _PENDING_KEYWORDS:
+                    if kw in text_lower:
+                        for line in block.text.splitlines():
+                            if kw in line.lower():
+                                found += 1
+                                break
+                        break
+                for token in block.text.split():
+                    if "/" in token and any(token.endswith(ext) for ext in _FILE_EXTENSIONS):
+                        found += 1
+    return found
+
+
+def scan(messages: list[ConversationMessage]) -> int:
+    found = 0
+    for msg in messages:
+        for block in msg.blocks:
+            if isinstance(block, TextBlock):
+                text_lower = block.text.lower()
+                for kw in _PENDING_KEYWORD_ORDER:
+                    if kw in text_lower:
+                        for line in block.text.splitlines():
+                            if kw in line.lower():
+                                found += 1
+                                break
+                        break
+                if "/" in block.text:
+                    for token in block.text.split():
+                        if "/" in token and token.endswith(_FILE_EXTENSION_SUFFIXES):
+                            found += 1
+    return found
+
+
+def turn(i: int) -> tuple[ConversationMessage, ConversationMessage]:
+    return (
+        ConversationMessage.user_text(f"{i}: {TEXT}"),
+        ConversationMessage.assistant([TextBlock(PROSE), ToolUseBlock(f"t{i}", "read", '{"path": "a.py"}')]),
+    )
+
+
+def per_turn(size: int, turns: int, running: bool) -> float:
+    session = Session()
+    for i in range(size // 2):
+        for msg in turn(i):
+            session.append(msg)
+    should_compact(session, CONFIG)
+
+    t0 = time.perf_counter()
+    for i in range(turns):
+        for msg in turn(i):
+            session.messages.append(msg)
+        if running:
+            should_compact(session, CONFIG)
+        else:
+            len(session.messages) > CONFIG.preserve_recent_messages and rescan(session) >= CONFIG.max_estimated_tokens
+    return (time.perf_counter() - t0) / turns
+
+
+def scan_times(size: int) -> tuple[float, float]:
+    messages = [msg for i in range(size // 2) for msg in turn(i)]
+    t0 = time.perf_counter()
+    legacy = legacy_scan(messages)
+    legacy_time = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    assert scan(messages) == legacy
+    return legacy_time, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'messages':>9}{'rescan/turn':>14}{'running/turn':>15}{'old scan':>12}{'new scan':>12}")
+    for size in args.sizes:
+        turns = max(5, min(args.turns, 2_000_000 // size))
+        slow = per_turn(size, turns, running=False)
+        fast = per_turn(size, args.turns, running=True)
+        legacy, new = scan_times(size)
+        print(
+            f"{size:>9}{slow * 1e6:>11.0f} us{fast * 1e6:>12.1f} us"
+            f"{legacy * 1e3:>9.0f} ms{new * 1e3:>9.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
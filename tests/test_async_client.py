@@ -0,0 +1,131 @@
+"""Tests for the asyncio client (`hanzoai.AsyncApiClient`).
+
+The generated operations are driven through `AsyncApi` against an
+`httpx.MockTransport`, so no network: what is asserted is that an awaited call
+builds the same request the sync client would and decodes the reply with the
+same `response_types_map`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import hanzoai.cloud
+from hanzoai import AsyncApi, AsyncApiClient
+from hanzoai.cloud import ApiResponse, Configuration
+from hanzoai.cloud.exceptions import NotFoundException
+
+
+def _client(handler) -> AsyncApiClient:
+    cfg = Configuration(host="https://api.hanzo.ai", access_token="sk-test")
+    return AsyncApiClient(cfg, transport=httpx.MockTransport(handler))
+
+
+async def test_operation_is_awaitable_and_decodes_the_model():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"tools": 3, "names": ["a", "b", "c"]})
+
+    async with _client(handler) as client:
+        surface = await client.api(hanzoai.cloud.AiApi).ai_mcp_tools(names=True)
+
+    assert isinstance(surface, hanzoai.cloud.AiMCPSurface)
+    assert surface.tools == 3 and surface.names == ["a", "b", "c"]
+    (request,) = seen
+    assert request.method == "GET"
+    assert request.url == "https://api.hanzo.ai/v1/ai/mcp/tools?names=true"
+    assert request.headers["Authorization"] == "Bearer sk-test"
+
+
+async def test_with_http_info_and_without_preload_content():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"tools": 1}, headers={"x-trace": "t1"})
+
+    async with _client(handler) as client:
+        ai = AsyncApi(hanzoai.cloud.AiApi, client)
+        info = await ai.ai_mcp_tools_with_http_info()
+        raw = await ai.ai_mcp_tools_without_preload_content()
+        body = await raw.aread()
+
+    assert isinstance(info, ApiResponse)
+    assert info.status_code == 200 and info.data.tools == 1
+    assert info.headers["x-trace"] == "t1"
+    assert json.loads(body) == {"tools": 1}
+
+
+async def test_error_status_raises_the_sync_exception_types():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"error": "nope"})
+
+    async with _client(handler) as client:
+        with pytest.raises(NotFoundException) as exc:
+            await client.api(hanzoai.cloud.AiApi).ai_mcp_tools()
+    assert exc.value.status == 404
+
+
+async def test_arguments_are_validated_like_the_sync_method():
+    async with _client(lambda request: httpx.Response(200, json={})) as client:
+        with pytest.raises(Exception, match="validation error"):
+            await client.api(hanzoai.cloud.AiApi).ai_mcp_tools(names="not-a-bool")
+
+
+async def test_concurrent_calls_share_one_client():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"tools": 0})
+
+    async with _client(handler) as client:
+        ai = client.api(hanzoai.cloud.AiApi)
+        results = await asyncio.gather(*(ai.ai_mcp_tools() for _ in range(50)))
+
+    assert len(results) == 50
+    assert peak > 1
+
+
+async def test_default_backend_over_a_real_socket():
+    """The aiohttp keep-alive pool, end to end against a local server."""
+    pytest.importorskip("aiohttp")
+    body = b'{"tools": 2}'
+    requests = 0
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        nonlocal requests
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                requests += 1
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    try:
+        cfg = Configuration(host=f"http://{host}:{port}")
+        async with AsyncApiClient(cfg, max_connections=4) as client:
+            ai = client.api(hanzoai.cloud.AiApi)
+            results = await asyncio.gather(*(ai.ai_mcp_tools_with_http_info() for _ in range(20)))
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert requests == 20
+    assert all(r.status_code == 200 and r.data.tools == 2 for r in results)
+    assert results[0].headers["Content-Type"] == "application/json"
@@ -0,0 +1,105 @@
+"""Tests for `CompiledApiClient`'s compiled deserialization plans.
+
+Each `response_type` is compiled once into a decoder, and bodies whose every
+leaf is a plain model are validated straight from the JSON bytes. What these
+pin is that the fast paths build exactly what the generated `from_dict` builds.
+"""
+
+from __future__ import annotations
+
+import json
+
+import hanzoai.cloud
+from hanzoai.cloud import ApiClient, Configuration
+from hanzoai.cloud.rest import RESTResponse
+from hanzoai.cloud_decode import CompiledApiClient, _validates_directly
+
+
+class _Resp:
+    def __init__(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.status = status
+        self.reason = "OK"
+        self.data = body
+        self.headers = {"content-type": content_type}
+
+
+def _deserialize(client: ApiClient, payload, response_type: str, status: int = 200):
+    resp = RESTResponse(_Resp(status, json.dumps(payload).encode()))
+    resp.read()
+    return client.response_deserialize(resp, {str(status): response_type}).data
+
+
+ISSUE = {
+    "assignee": "zeekay",
+    "createdAt": 1700000000,
+    "labels": ["bug"],
+    "number": 7,
+    "projectKey": "cli",
+    "status": "todo",
+    "title": "Fix it",
+}
+
+
+def test_list_of_models_matches_from_dict():
+    client = CompiledApiClient(Configuration(host="https://api.hanzo.ai"))
+    payload = [dict(ISSUE, number=i) for i in range(50)]
+
+    got = _deserialize(client, payload, "List[IssueView]")
+
+    expected = [hanzoai.cloud.IssueView.from_dict(item) for item in payload]
+    assert got == expected
+    assert got[3].project_key == "cli" and got[3].number == 3
+
+
+def test_nested_and_dict_types_match_from_dict():
+    client = CompiledApiClient(Configuration(host="https://api.hanzo.ai"))
+    payload = {"apps": [{"name": "a"}, {"name": "b"}], "tools": 2}
+
+    got = _deserialize(client, payload, "AiMCPSurface")
+    assert got == hanzoai.cloud.AiMCPSurface.from_dict(payload)
+
+    by_key = _deserialize(client, {"x": ISSUE, "y": None}, "Dict[str, IssueView]")
+    assert by_key == {"x": hanzoai.cloud.IssueView.from_dict(ISSUE), "y": None}
+
+
+def test_primitives_keep_their_coercions():
+    client = CompiledApiClient(Configuration(host="https://api.hanzo.ai"))
+    assert _deserialize(client, [1, 2], "List[str]") == ["1", "2"]
+    assert _deserialize(client, {"a": 1}, "object") == {"a": 1}
+    assert _deserialize(client, None, "IssueView") is None
+
+
+def test_plans_are_compiled_once():
+    client = CompiledApiClient(Configuration(host="https://api.hanzo.ai"))
+    _deserialize(client, [ISSUE], "List[IssueView]")
+    adapter = client._json_adapters["List[IssueView]"]
+    _deserialize(client, [ISSUE], "List[IssueView]")
+    assert adapter is not None and client._json_adapters["List[IssueView]"] is adapter
+
+    # The text path (`deserialize`) walks a compiled decoder instead.
+    client.deserialize(json.dumps([ISSUE]), "List[IssueView]", "application/json")
+    plan = client._decode_plans["List[IssueView]"]
+    client.deserialize(json.dumps([ISSUE]), "List[IssueView]", "application/json")
+    assert client._decode_plans["List[IssueView]"] is plan
+    assert "IssueView" in client._decode_plans
+
+
+def test_models_that_read_fields_set_keep_the_generated_path():
+    """`from_dict` marks every field set; `to_dict` of these models reads that."""
+    assert _validates_directly(hanzoai.cloud.IssueView)
+    wrappers = [
+        name for name in ("PostEventRequest", "PostIndexIndexesByUidDocumentsDeleteBatchRequest")
+        if hasattr(hanzoai.cloud.models, name)
+    ]
+    for name in wrappers:
+        assert not _validates_directly(getattr(hanzoai.cloud.models, name))
+
+
+def test_generated_client_decodes_the_same():
+    """The generated `ApiClient` is untouched; the subclass only changes how."""
+    payload = [dict(ISSUE, number=i) for i in range(5)]
+    plain = ApiClient(Configuration(host="https://api.hanzo.ai"))
+    compiled = CompiledApiClient(Configuration(host="https://api.hanzo.ai"))
+    for response_type in ("List[IssueView]", "List[object]"):
+        assert _deserialize(plain, payload, response_type) == _deserialize(compiled, payload, response_type)
+    assert not hasattr(plain, "_decode_plans")
@@ -0,0 +1,224 @@
+"""Tests for the JSON-RPC MCP clients in `hanzoai.mcp`.
+
+`MCPClient` is run against a real stdio subprocess (the script below) that
+answers concurrently and out of order, sends notifications, pings the client,
+and records the requests it was told to cancel. `MCPHttpClient` is run against
+an `httpx.MockTransport`.
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import asyncio
+import textwrap
+
+import httpx
+import pytest
+
+from hanzoai.mcp import MCPClient, MCPClientError, MCPHttpClient
+
+SERVER = textwrap.dedent(
+    """
+    import asyncio, json, os, sys
+
+    tasks, cancelled, pinged = {}, [], []
+
+    def send(message):
+        sys.stdout.write(json.dumps(message) + "\\n")
+        sys.stdout.flush()
+
+    async def handle(msg):
+        params = msg.get("params") or {}
+        if msg["method"] == "initialize":
+            result = {"serverInfo": {"name": "stand-in"}, "capabilities": {"tools": {}}}
+        else:
+            name, args = params["name"], params.get("arguments") or {}
+            if name == "sleep":
+                await asyncio.sleep(args["ms"] / 1000)
+                result = {"slept": args["ms"]}
+            elif name == "big":
+                result = {"text": "x" * args["size"]}
+            elif name == "progress":
+                for i in range(3):
+                    send({"jsonrpc": "2.0", "method": "notifications/progress", "params": {"n": i}})
+                result = {}
+            elif name == "ping_client":
+                send({"jsonrpc": "2.0", "id": "srv-1", "method": "ping"})
+                while not pinged:
+                    await asyncio.sleep(0.005)
+                result = {"pong": pinged[0]}
+            elif name == "close_stdout":
+                os.close(1)
+                return
+            elif name == "cancelled":
+                result = {"ids": cancelled}
+            else:
+                send({"jsonrpc": "2.0", "id": msg["id"], "error": {"code": -32602, "message": "unknown tool"}})
+                return
+        send({"jsonrpc": "2.0", "id": msg["id"], "result": result})
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=1 << 24)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        while line := await reader.readline():
+            msg = json.loads(line)
+            if "method" not in msg:
+                pinged.append(msg)
+            elif msg["method"] == "notifications/cancelled":
+                request_id = msg["params"]["requestId"]
+                cancelled.append(request_id)
+                if request_id in tasks:
+                    tasks.pop(request_id).cancel()
+            else:
+                tasks[msg["id"]] = asyncio.ensure_future(handle(msg))
+
+    asyncio.run(main())
+    """
+)
+
+
+@pytest.fixture
+async def client():
+    async with MCPClient([sys.executable, "-c", SERVER]) as c:
+        yield c
+
+
+async def test_initialize(client: MCPClient) -> None:
+    assert client.server_info == {"name": "stand-in"}
+    assert client.capabilities == {"tools": {}}
+
+
+async def test_concurrent_calls_complete_out_of_order(client: MCPClient) -> None:
+    finished: list[int] = []
+
+    async def call(ms: int) -> dict:
+        result = await client.call_tool("sleep", {"ms": ms})
+        finished.append(ms)
+        return result
+
+    results = await asyncio.gather(call(150), call(75), call(1))
+    assert [r["slept"] for r in results] == [150, 75, 1]
+    assert finished == [1, 75, 150]
+
+
+async def test_notifications_reach_handlers(client: MCPClient) -> None:
+    seen: list[int] = []
+    everything: list[dict] = []
+    client.on_notification("notifications/progress", lambda params: seen.append(params["n"]))
+
+    async def record(params: dict) -> None:
+        everything.append(params)
+
+    client.on_notification("*", record)
+    assert await client.call_tool("progress") == {}
+    await asyncio.sleep(0)
+    assert seen == [0, 1, 2]
+    assert len(everything) == 3
+
+
+async def test_server_requests_are_answered(client: MCPClient) -> None:
+    result = await client.call_tool("ping_client")
+    assert result["pong"] == {"jsonrpc": "2.0", "id": "srv-1", "result": {}}
+
+
+async def test_timeout_cancels_the_request(client: MCPClient) -> None:
+    with pytest.raises(MCPClientError, match="within 0.05 seconds"):
+        await client.call_tool("sleep", {"ms": 5000}, timeout=0.05)
+    # The server was told, and the connection still works.
+    assert (await client.call_tool("cancelled"))["ids"] == [2]
+
+
+async def test_task_cancellation_cancels_the_request(client: MCPClient) -> None:
+    call = asyncio.ensure_future(client.call_tool("sleep", {"ms": 5000}))
+    await asyncio.sleep(0.05)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    assert (await client.call_tool("cancelled"))["ids"] == [2]
+
+
+async def test_large_response_spanning_many_reads(client: MCPClient) -> None:
+    size = 8 * 1024 * 1024
+    result = await client.call_tool("big", {"size": size}, timeout=30)
+    assert len(result["text"]) == size
+
+
+async def test_overlong_line_fails_pending_calls_and_closes() -> None:
+    client = MCPClient([sys.executable, "-c", SERVER], max_line=1024 * 1024)
+    await client.connect()
+    try:
+        call = asyncio.ensure_future(client.call_tool("sleep", {"ms": 5000}))
+        await asyncio.sleep(0.05)
+        with pytest.raises(MCPClientError, match="byte limit"):
+            await client.call_tool("big", {"size": 4 * 1024 * 1024})
+        with pytest.raises(MCPClientError, match="byte limit"):
+            await call
+        assert await asyncio.wait_for(client._process.wait(), 5) is not None
+        with pytest.raises(MCPClientError, match="connection to server closed"):
+            await client.call_tool("cancelled")
+    finally:
+        await client.disconnect()
+
+
+async def test_rpc_error(client: MCPClient) -> None:
+    with pytest.raises(MCPClientError, match="unknown tool"):
+        await client.call_tool("nope")
+
+
+async def test_disconnect_fails_pending_calls() -> None:
+    client = MCPClient([sys.executable, "-c", SERVER])
+    await client.connect()
+    call = asyncio.ensure_future(client.call_tool("sleep", {"ms": 5000}))
+    await asyncio.sleep(0.05)
+    await client.disconnect()
+    with pytest.raises(MCPClientError):
+        await call
+
+
+async def test_server_eof_fails_pending_and_later_calls() -> None:
+    client = MCPClient([sys.executable, "-c", SERVER], timeout=None)
+    await client.connect()
+    try:
+        call = asyncio.ensure_future(client.call_tool("sleep", {"ms": 5000}))
+        await asyncio.sleep(0.05)
+        with pytest.raises(MCPClientError, match="closed stdout"):
+            await client.call_tool("close_stdout")
+        with pytest.raises(MCPClientError, match="closed stdout"):
+            await call
+        # The process is still running, but nothing can answer any more.
+        with pytest.raises(MCPClientError, match="connection to server closed"):
+            await asyncio.wait_for(client.call_tool("cancelled"), 5)
+    finally:
+        await client.disconnect()
+
+
+async def test_http_client_concurrency_and_session() -> None:
+    seen_sessions: list[str | None] = []
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        msg = json.loads(request.content)
+        seen_sessions.append(request.headers.get("mcp-session-id"))
+        if msg["method"] == "initialize":
+            return httpx.Response(
+                200,
+                json={"jsonrpc": "2.0", "id": msg["id"], "result": {"serverInfo": {"name": "http"}}},
+                headers={"Mcp-Session-Id": "s-1"},
+            )
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": msg["id"], "result": msg["params"]})
+
+    client = MCPHttpClient("https://mcp.example/rpc")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        results = await asyncio.gather(*(client.call_tool("t", {"n": i}) for i in range(5)))
+
+    assert [r["arguments"]["n"] for r in results] == list(range(5))
+    assert peak == 5
+    assert seen_sessions == [None] + ["s-1"] * 5
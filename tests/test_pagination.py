@@ -0,0 +1,195 @@
+"""Tests for `hanzoai.cloud_pagination`.
+
+Paging is read off each operation's own parameters, so the fakes below are
+plain functions with the parameter shapes the generated operations use, and the
+async path runs a real generated operation over an `httpx.MockTransport`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import List, Optional
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+import hanzoai.cloud
+from hanzoai import AsyncApiClient
+from hanzoai.cloud import Configuration
+from hanzoai import afetch_many, apaginate, fetch_many, paginate
+from hanzoai.cloud_pagination import _default_concurrency
+
+
+class Item(BaseModel):
+    id: str
+
+
+class ItemList(BaseModel):
+    data: Optional[List[Item]] = None
+    total: Optional[int] = None
+
+
+class CursorPage(BaseModel):
+    cursor: Optional[str] = None
+    items: Optional[List[Item]] = None
+
+
+ROWS = [Item(id=str(i)) for i in range(25)]
+
+
+def test_offset_paging_with_string_parameters():
+    calls = []
+
+    def list_items(limit: Optional[str] = None, offset: Optional[str] = None) -> ItemList:
+        calls.append((limit, offset))
+        start, size = int(offset), int(limit)
+        return ItemList(data=ROWS[start:start + size], total=len(ROWS))
+
+    got = [item.id for item in paginate(list_items, page_size=10)]
+
+    assert got == [row.id for row in ROWS]
+    # 25 rows: the short third page ends the walk with no empty fourth request.
+    assert calls == [("10", "0"), ("10", "10"), ("10", "20")]
+
+
+def test_server_capped_page_size_follows_the_total():
+    calls = []
+
+    def list_items(limit: Optional[int] = None, offset: Optional[int] = None) -> ItemList:
+        calls.append(offset)
+        # Asked for 50, the server sends at most 10.
+        return ItemList(data=ROWS[offset:offset + min(limit, 10)], total=len(ROWS))
+
+    def list_pages(page: Optional[int] = None, per_page: Optional[int] = None) -> ItemList:
+        return ItemList(data=ROWS[(page - 1) * 10:page * 10], total=len(ROWS))
+
+    assert [item.id for item in paginate(list_items, page_size=50)] == [row.id for row in ROWS]
+    assert calls == [0, 10, 20]
+    assert [item.id for item in paginate(list_pages, page_size=50)] == [row.id for row in ROWS]
+
+
+def test_page_number_paging_and_bare_list_responses():
+    def list_items(page: Optional[int] = None, per_page: Optional[int] = None) -> List[Item]:
+        return ROWS[(page - 1) * per_page:page * per_page]
+
+    assert len(list(paginate(list_items, page_size=10))) == 25
+
+
+def test_cursor_paging_follows_the_returned_cursor():
+    def list_items(cursor: Optional[str] = None, limit: Optional[int] = None) -> CursorPage:
+        start = int(cursor or 0)
+        end = start + limit
+        return CursorPage(items=ROWS[start:end], cursor=str(end) if end < len(ROWS) else None)
+
+    assert [item.id for item in paginate(list_items, page_size=7)] == [row.id for row in ROWS]
+
+
+def test_next_page_is_requested_while_the_current_one_is_consumed():
+    requested = threading.Event()
+    calls = []
+
+    def list_items(limit: Optional[int] = None, offset: Optional[int] = None) -> ItemList:
+        calls.append(offset)
+        if offset:
+            requested.set()
+        return ItemList(data=ROWS[offset:offset + limit])
+
+    items = paginate(list_items, page_size=10)
+    next(items)
+    assert requested.wait(2), "page 2 was not prefetched"
+    items.close()
+
+
+def test_stopping_early_does_not_wait_for_the_prefetch():
+    started, release = threading.Event(), threading.Event()
+
+    def list_items(limit: Optional[int] = None, offset: Optional[int] = None) -> ItemList:
+        if offset:
+            started.set()
+            release.wait(5)
+        return ItemList(data=ROWS[offset:offset + limit])
+
+    for _ in paginate(list_items, page_size=10):
+        assert started.wait(2)
+        start = time.monotonic()
+        break
+    elapsed = time.monotonic() - start
+    release.set()
+    assert elapsed < 1, "leaving the loop blocked on the page 2 request"
+
+
+def test_ambiguous_page_models_need_items():
+    class TwoLists(BaseModel):
+        a: Optional[List[Item]] = None
+        b: Optional[List[Item]] = None
+
+    def list_items(offset: Optional[int] = None) -> TwoLists:
+        return TwoLists(a=ROWS[:1], b=[])
+
+    with pytest.raises(ValueError, match="items="):
+        list(paginate(list_items))
+    assert len(list(paginate(list_items, items="b"))) == 0
+
+
+def test_fetch_many_keeps_key_order_and_bounds_concurrency():
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def get_item(id: str) -> Item:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.005)
+        with lock:
+            in_flight -= 1
+        return Item(id=id)
+
+    keys = [str(i) for i in range(100)]
+    got = fetch_many(get_item, keys, key="id", max_concurrency=4)
+
+    assert [item.id for item in got] == keys
+    assert 1 < peak <= 4
+
+
+def _billing_client(pages: list) -> AsyncApiClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        pages.append(dict(request.url.params))
+        offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+        rows = [{"id": str(i)} for i in range(offset, min(offset + limit, 12))]
+        return httpx.Response(200, json={"transactions": rows, "count": len(rows)})
+
+    cfg = Configuration(host="https://api.hanzo.ai")
+    return AsyncApiClient(cfg, transport=httpx.MockTransport(handler))
+
+
+async def test_apaginate_over_a_generated_operation():
+    pages: list = []
+    async with _billing_client(pages) as client:
+        billing = client.api(hanzoai.cloud.BillingApi)
+        got = [t async for t in apaginate(billing.get_billing_transactions, currency="usd", page_size=5)]
+
+    assert len(got) == 12
+    assert [p["offset"] for p in pages] == ["0", "5", "10"]
+    assert all(p["currency"] == "usd" for p in pages)
+
+
+async def test_afetch_many_returns_results_in_key_order():
+    async def get_item(id: str) -> Item:
+        return Item(id=id)
+
+    keys = [str(i) for i in range(50)]
+    got = await afetch_many(get_item, keys, key="id", max_concurrency=8)
+    assert [item.id for item in got] == keys
+
+
+async def test_fan_out_defaults_to_the_client_pool_size():
+    cfg = Configuration(host="https://api.hanzo.ai")
+    cfg.connection_pool_maxsize = 6
+    assert _default_concurrency(hanzoai.cloud.BillingApi(hanzoai.cloud.ApiClient(cfg)).get_billing_transactions) == 6
+
+    async with AsyncApiClient(cfg, max_connections=3, transport=httpx.MockTransport(lambda r: httpx.Response(200))) as client:
+        billing = client.api(hanzoai.cloud.BillingApi)
+        assert _default_concurrency(billing.get_billing_transactions) == 3
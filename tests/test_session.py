@@ -0,0 +1,90 @@
+"""Tests for the running token estimate and compaction summary in `hanzoai.session`."""
+
+from __future__ import annotations
+
+from hanzoai.session import (
+    Session,
+    TextBlock,
+    ToolUseBlock,
+    CompactionConfig,
+    ToolResultBlock,
+    ConversationMessage,
+    should_compact,
+    compact_session,
+    estimate_session_tokens,
+)
+
+
+def _rescan(session: Session) -> int:
+    total = 0
+    for msg in session.messages:
+        for block in msg.blocks:
+            if isinstance(block, TextBlock):
+                total += len(block.text) // 4 + 1
+            elif isinstance(block, ToolUseBlock):
+                total += len(block.input) // 4 + 1
+            elif isinstance(block, ToolResultBlock):
+                total += len(block.output) // 4 + 1
+    return total
+
+
+def _session(n: int) -> Session:
+    session = Session()
+    for i in range(n):
+        session.append(ConversationMessage.user_text("word " * i))
+    return session
+
+
+def test_estimate_tracks_appends() -> None:
+    session = _session(20)
+    assert estimate_session_tokens(session) == _rescan(session)
+
+    session.append(ConversationMessage.assistant([ToolUseBlock("t1", "grep", '{"q": "x"}')]))
+    session.messages.append(ConversationMessage.tool_result("t1", "grep", "match " * 50))
+    assert estimate_session_tokens(session) == _rescan(session)
+
+
+def test_estimate_survives_other_list_changes() -> None:
+    session = _session(20)
+    estimate_session_tokens(session)
+
+    del session.messages[-3:]
+    assert estimate_session_tokens(session) == _rescan(session)
+    session.messages[-1] = ConversationMessage.user_text("replaced " * 40)
+    assert estimate_session_tokens(session) == _rescan(session)
+    session.messages = session.messages[:5]
+    assert estimate_session_tokens(session) == _rescan(session)
+    session.messages.clear()
+    assert estimate_session_tokens(session) == 0
+
+
+def test_messages_cache_their_estimate() -> None:
+    msg = ConversationMessage.user_text("x" * 400)
+    assert msg.estimated_tokens() == 101
+    assert msg == ConversationMessage.user_text("x" * 400)  # the cache is not compared
+    assert "_tokens" not in msg.to_dict()
+
+
+def test_compaction_carries_the_estimate() -> None:
+    session = _session(200)
+    config = CompactionConfig(preserve_recent_messages=4, max_estimated_tokens=1000)
+    assert should_compact(session, config)
+
+    result = compact_session(session, config)
+    compacted = result.compacted_session
+    assert result.removed_message_count == 196
+    assert compacted.messages[1:] == session.messages[-4:]
+    assert estimate_session_tokens(compacted) == _rescan(compacted)
+
+
+def test_summary_extracts_files_and_pending_work() -> None:
+    text = (
+        "Edited src/app.py and `lib/util.rs not notes.txt, a/b.pyc or (c/d.py)\n"
+        "TODO: wire up docs/index.md\n"
+        "then the rest"
+    )
+    session = Session(messages=[ConversationMessage.user_text(text) for _ in range(6)])
+    summary = compact_session(session, CompactionConfig(max_estimated_tokens=1)).summary
+
+    assert "- Key files referenced: docs/index.md, lib/util.rs, src/app.py." in summary
+    assert "  - TODO: wire up docs/index.md" in summary
@@ -151,3 +151,42 @@ def test_admin_plugin_operator_surface():
         "admin_reload_plugin",
     ):
         assert callable(getattr(AdminApi, op, None)), f"AdminApi.{op} missing"
+
+
+def test_generated_namespace_is_lazy():
+    """`import hanzoai` must not import the generated API and model modules.
+
+    The namespace imported every one of them eagerly — thousands of modules and
+    seconds of startup before the first request. The generator templates in
+    codegen/python make each package `__init__` resolve them on first access,
+    including through `getattr(hanzoai.cloud.models, name)`, which is how
+    `ApiClient` turns a `response_type` string into a class.
+    """
+    import subprocess
+    import sys
+
+    probe = (
+        "import sys, hanzoai\n"
+        "print(sum(m.startswith(('hanzoai.cloud.api.', 'hanzoai.cloud.models.')) for m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True, text=True)
+    assert out.stdout.strip() == "0"
+
+    model = getattr(hanzoai.cloud.models, "AccList")
+    assert model.__module__ == "hanzoai.cloud.models.acc_list"
+    assert hanzoai.cloud.AccList is model
+    assert "AccList" in dir(hanzoai.cloud.models)
+    assert hanzoai.cloud.api.AiApi is hanzoai.cloud.AiApi
+
+
+def test_lazy_packages_keep_a_full_all():
+    """`from hanzoai.cloud.models import *` exports every model, as it did eagerly."""
+    for package in (hanzoai.cloud, hanzoai.cloud.api, hanzoai.cloud.models):
+        lazy = set(package._LAZY_IMPORTS)
+        assert lazy <= set(package.__all__), package.__name__
+        assert lazy <= set(dir(package)), package.__name__
+
+    namespace: dict = {}
+    exec("from hanzoai.cloud.models import *", namespace)
+    assert set(hanzoai.cloud.models.__all__) <= set(namespace)
+    assert len(hanzoai.cloud.models.__all__) > 2000
@@ -0,0 +1,274 @@
+"""Tests for `hanzoai.zap.ZapPool` against local ZAP cloud stand-ins.
+
+Each stand-in is a real socket server speaking the hanzo-zap cloud framing
+(handshake, then req_id-tagged MsgType 100 frames), so the pool is exercised
+through real `hanzo_zap.CloudClient` connections: selection, reconnect with a
+fresh handshake, health pings and the metrics they move.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import asyncio
+
+import httpx
+import pytest
+
+pytest.importorskip("hanzo_zap")
+
+from hanzo_zap import CloudClient  # noqa: E402
+from hanzo_zap.wire import (  # noqa: E402
+    REQ_FLAG_RESP,
+    Message,
+    read_frame,
+    write_frame,
+    build_handshake,
+    parse_cloud_request,
+    build_cloud_response,
+)
+
+from hanzoai.zap import ZapPool, async_zap_http_client  # noqa: E402
+
+
+class CloudStandIn:
+    """Echo server: ``sleep.<ms>`` answers after a delay, ``hang`` never answers."""
+
+    def __init__(self) -> None:
+        self.handshakes = 0
+        self.requests_by_connection: list[int] = []
+        self._writers: list[asyncio.StreamWriter] = []
+        self._server: asyncio.Server | None = None
+        self.endpoint = ""
+
+    async def __aenter__(self) -> "CloudStandIn":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.endpoint = "127.0.0.1:%d" % self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.drop_connections()
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop_connections(self) -> None:
+        for writer in self._writers:
+            writer.transport.abort()
+        self._writers.clear()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.append(writer)
+        index = len(self.requests_by_connection)
+        self.requests_by_connection.append(0)
+        try:
+            Message.parse(await read_frame(reader))
+            self.handshakes += 1
+            await write_frame(writer, build_handshake("stand-in"))
+            while True:
+                data = await read_frame(reader)
+                self.requests_by_connection[index] += 1
+                req_id = struct.unpack_from("<I", data, 0)[0]
+                asyncio.ensure_future(self._answer(writer, req_id, data[8:]))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    async def _answer(self, writer: asyncio.StreamWriter, req_id: int, msg: bytes) -> None:
+        method, _, body = parse_cloud_request(Message.parse(msg))
+        if method == "hang":
+            return
+        if method.startswith("sleep."):
+            await asyncio.sleep(int(method.split(".")[1]) / 1000)
+        frame = struct.pack("<II", req_id, REQ_FLAG_RESP) + build_cloud_response(200, body, "")
+        if not writer.is_closing():
+            await write_frame(writer, frame)
+
+
+async def test_calls_spread_over_the_least_loaded_connections() -> None:
+    async with CloudStandIn() as server:
+        pool = ZapPool(server.endpoint, connections_per_endpoint=4, health_interval=0)
+        try:
+            # The first call dials every slot and goes out on whichever is up first.
+            await pool.call("warm", "", b"")
+            while pool.metrics.connected < 4:
+                await asyncio.sleep(0.005)
+            calls = [asyncio.ensure_future(pool.call("sleep.50", "", b"%d" % i)) for i in range(40)]
+            await asyncio.sleep(0.01)
+            assert pool.metrics.in_flight == 40
+            results = await asyncio.gather(*calls)
+        finally:
+            await pool.close()
+
+    assert [body for _, body, _ in results] == [b"%d" % i for i in range(40)]
+    assert pool.metrics.in_flight == 0
+    per_connection = server.requests_by_connection
+    assert len(per_connection) == 4
+    assert max(per_connection) - min(per_connection) <= 3
+
+
+async def test_endpoints_share_the_load() -> None:
+    async with CloudStandIn() as a, CloudStandIn() as b:
+        pool = ZapPool([a.endpoint, b.endpoint], health_interval=0)
+        try:
+            for _ in range(3):
+                await asyncio.gather(*(pool.call("sleep.10", "", b"") for _ in range(10)))
+            assert pool.metrics.connections == 2 and pool.metrics.connected == 2
+        finally:
+            await pool.close()
+
+    assert sum(a.requests_by_connection) > 0 and sum(b.requests_by_connection) > 0
+
+
+async def test_reconnects_and_replays_the_handshake() -> None:
+    async with CloudStandIn() as server:
+        pool = ZapPool(server.endpoint, health_interval=0)
+        try:
+            await pool.call("models", "", b"")
+            pending = asyncio.ensure_future(pool.call("hang", "", b""))
+            await asyncio.sleep(0.02)
+            server.drop_connections()
+
+            with pytest.raises(ConnectionError):
+                await pending
+            status, body, _ = await pool.call("models", "", b"again")
+        finally:
+            await pool.close()
+
+    assert (status, body) == (200, b"again")
+    assert server.handshakes == 2
+    assert pool.metrics.reconnects == 1
+
+
+async def test_health_check_replaces_an_unresponsive_connection() -> None:
+    async with CloudStandIn() as server:
+        pool = ZapPool(server.endpoint, health_interval=0.05, health_method="hang", health_timeout=0.02)
+        try:
+            await pool.call("models", "", b"")
+            for _ in range(100):
+                if pool.metrics.reconnects:
+                    break
+                await asyncio.sleep(0.01)
+            metrics = pool.metrics
+            assert metrics.failed_health_checks >= 1
+            assert metrics.reconnects >= 1
+            assert (await pool.call("models", "", b"ok"))[1] == b"ok"
+        finally:
+            await pool.close()
+
+
+async def test_health_sweep_redials_a_dead_connection_without_traffic() -> None:
+    async with CloudStandIn() as server:
+        pool = ZapPool(server.endpoint, health_interval=0.05)
+        try:
+            await pool.call("models", "", b"")
+            server.drop_connections()
+            for _ in range(100):
+                if pool.metrics.reconnects:
+                    break
+                await asyncio.sleep(0.01)
+            assert pool.metrics.connected == 1
+            assert server.handshakes == 2
+        finally:
+            await pool.close()
+
+
+async def test_callers_queue_behind_the_per_connection_cap() -> None:
+    async with CloudStandIn() as server:
+        pool = ZapPool(server.endpoint, max_in_flight_per_connection=1, health_interval=0)
+        try:
+            calls = [asyncio.ensure_future(pool.call("sleep.30", "", b"")) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            assert pool.metrics.in_flight == 1
+            assert pool.metrics.queue_depth == 2
+            await asyncio.gather(*calls)
+            assert pool.metrics.queue_depth == 0
+        finally:
+            await pool.close()
+
+
+async def test_unreachable_endpoint_fails_fast() -> None:
+    async with CloudStandIn() as server:
+        endpoint = server.endpoint
+    pool = ZapPool(endpoint, health_interval=0, acquire_timeout=0)
+    try:
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(pool.call("models", "", b""), 5)
+        # Backing off: the next caller fails without another dial.
+        with pytest.raises(ConnectionError):
+            await pool.call("models", "", b"")
+    finally:
+        await pool.close()
+
+
+async def test_callers_wait_out_a_brief_outage() -> None:
+    async with CloudStandIn() as server:
+        dials = 0
+
+        async def connect(endpoint: str | None) -> CloudClient:
+            nonlocal dials
+            dials += 1
+            if dials <= 2:
+                raise ConnectionRefusedError("node restarting")
+            return await CloudClient.connect(endpoint)
+
+        pool = ZapPool(server.endpoint, health_interval=0, connect=connect)
+        try:
+            # Two failed dials back off 0.1 s then 0.2 s; the call rides them out.
+            results = await asyncio.gather(*(pool.call("models", "", b"%d" % i) for i in range(3)))
+        finally:
+            await pool.close()
+
+    assert [body for _, body, _ in results] == [b"0", b"1", b"2"]
+    assert dials == 3
+
+
+async def test_outage_longer_than_the_acquire_timeout_fails() -> None:
+    async def connect(endpoint: str | None) -> CloudClient:
+        raise ConnectionRefusedError("down")
+
+    pool = ZapPool("127.0.0.1:1", health_interval=0, acquire_timeout=0.25, connect=connect)
+    try:
+        with pytest.raises(ConnectionError) as info:
+            await asyncio.wait_for(pool.call("models", "", b""), 5)
+        assert isinstance(info.value.__cause__, ConnectionRefusedError)
+    finally:
+        await pool.close()
+
+
+async def test_health_loop_survives_an_unexpected_error() -> None:
+    async with CloudStandIn() as server:
+        pool = ZapPool(server.endpoint, health_interval=0.02, health_method="models")
+        try:
+            await pool.call("models", "", b"")
+            client = pool._connections[0].client
+            assert client is not None
+
+            async def broken(*args: object, **kwargs: object) -> object:
+                raise RuntimeError("protocol error")
+
+            client.call = broken  # type: ignore[method-assign]
+            for _ in range(100):
+                if pool.metrics.reconnects:
+                    break
+                await asyncio.sleep(0.01)
+            assert pool.metrics.failed_health_checks >= 1
+            assert pool.metrics.reconnects >= 1
+            assert pool._health_task is not None and not pool._health_task.done()
+            assert (await pool.call("models", "", b"ok"))[1] == b"ok"
+        finally:
+            await pool.close()
+
+
+async def test_async_http_client_through_the_pool() -> None:
+    async with CloudStandIn() as server:
+        async with async_zap_http_client(server.endpoint, connections_per_endpoint=2) as client:
+            responses = await asyncio.gather(
+                *(client.post("https://api.hanzo.ai/v1/echo", json={"n": i}) for i in range(10))
+            )
+            pool = client._transport.pool  # type: ignore[attr-defined]
+            assert pool is not None and pool.metrics.connections == 2
+
+    assert [r.json() for r in responses] == [{"n": i} for i in range(10)]
+    assert all(r.status_code == 200 for r in responses)
+    assert isinstance(responses[0], httpx.Response)
+    assert json.loads(responses[3].content) == {"n": 3}
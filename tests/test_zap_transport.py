@@ -21,8 +21,11 @@ what the package actually exports.
 from __future__ import annotations
 
 import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
+import pytest
 
 import hanzoai
 from hanzoai import ZapTransport, AsyncZapTransport, zap_http_client
@@ -51,6 +54,7 @@ ZAP_ADDITIVE_NAMES = {
     "async_zap_http_client",
     "ZapTransport",
     "AsyncZapTransport",
+    "ZapPool",
 }
 
 
@@ -62,10 +66,14 @@ class MockCloudClient:
         self.body = body
         self.error = error
         self.calls: list[tuple[str, str, bytes]] = []
+        self.timeouts: list[float | None] = []
         self.closed = False
 
-    async def call(self, method: str, auth: str, body: bytes) -> tuple[int, bytes, str]:
+    async def call(
+        self, method: str, auth: str, body: bytes, *, timeout: float | None = None
+    ) -> tuple[int, bytes, str]:
         self.calls.append((method, auth, body))
+        self.timeouts.append(timeout)
         return (self.status, self.body, self.error)
 
     async def close(self) -> None:
@@ -202,6 +210,51 @@ async def test_async_transport_translates_request() -> None:
     assert json.loads(body) == payload
 
 
+class SlowCloudClient(MockCloudClient):
+    """Holds each call open so overlapping calls can be counted."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    async def call(
+        self, method: str, auth: str, body: bytes, *, timeout: float | None = None
+    ) -> tuple[int, bytes, str]:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.wait_for(asyncio.sleep(self.delay), timeout)
+        finally:
+            self.in_flight -= 1
+        return await super().call(method, auth, body, timeout=timeout)
+
+
+def test_sync_transport_does_not_serialize_threads() -> None:
+    """Calls from several threads overlap on the transport's one loop."""
+    mock = SlowCloudClient(delay=0.05)
+    with httpx.Client(transport=ZapTransport(client=mock)) as http_client:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(lambda _: http_client.get("https://api.hanzo.ai/v1/models"), range(8)))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert mock.peak > 1
+
+
+def test_request_timeout_becomes_the_call_timeout() -> None:
+    mock = SlowCloudClient(delay=1.0)
+    with httpx.Client(transport=ZapTransport(client=mock), timeout=0.05) as http_client:
+        with pytest.raises(httpx.ReadTimeout):
+            http_client.get("https://api.hanzo.ai/v1/models")
+    assert mock.in_flight == 0
+
+    fast = MockCloudClient()
+    with httpx.Client(transport=ZapTransport(client=fast), timeout=7.0) as http_client:
+        http_client.get("https://api.hanzo.ai/v1/models")
+    assert fast.timeouts == [7.0]
+
+
 def test_zap_http_client_returns_httpx_client() -> None:
     client = zap_http_client("localhost:3692")
     try: